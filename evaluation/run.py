@@ -14,6 +14,8 @@ Usage:
     ./venv/bin/python evaluation/run.py --skip-dalston     # Skip Dalston transcription
     ./venv/bin/python evaluation/run.py --metrics-only     # Recompute metrics from outputs
     ./venv/bin/python evaluation/run.py --report-only      # Regenerate report only
+    ./venv/bin/python evaluation/run.py --resume --segmented-parity 4
+                                                           # Serial vs pipelined segmented cleaning
 """
 
 import argparse
@@ -289,6 +291,119 @@ def step_metrics(ep, ctx: EvalContext, ep_state: EpisodeState, output_dir: Path)
         return StepState(status="failed", error=str(e), timing_s=time.time() - start)
 
 
+def step_segmented_parity(ep, ctx: EvalContext, dalston_output: str, output_dir: Path, concurrency: int) -> dict:
+    """Clean one transcript with the serial and the pipelined segmented cleaner.
+
+    Not a tracked step: it re-runs both modes every time and writes
+    ``ep_NN_segmented_parity.json``. Agreement is the share of segments
+    whose cleaned text and kind are identical between the two modes.
+    """
+    from thestill.core.segmented_transcript_cleaner import SegmentedTranscriptCleaner
+    from thestill.core.transcript_segmenter import TranscriptSegmenter
+    from thestill.models.transcript import Transcript
+
+    with open(dalston_output) as f:
+        raw_data = json.load(f)
+    podcast_facts = ctx.facts_manager.load_podcast_facts(ep.podcast_slug)
+    episode_facts = ctx.facts_manager.load_episode_facts(ep.podcast_slug, ep.episode_slug)
+    if not episode_facts:
+        return {"episode_index": ep.index, "episode_label": ep.label, "status": "skipped", "error": "No episode facts"}
+
+    language = (raw_data.get("language") or "en")[:2]
+    annotated = TranscriptSegmenter().repair(Transcript.model_validate(raw_data))
+
+    runs = {}
+    outputs = {}
+    for mode, batch_concurrency in (("serial", 1), ("pipelined", concurrency)):
+        cleaner = SegmentedTranscriptCleaner(ctx.provider, batch_concurrency=batch_concurrency)
+        outputs[mode] = cleaner.clean(
+            annotated=annotated.model_copy(deep=True),
+            podcast_facts=podcast_facts,
+            episode_facts=episode_facts,
+            language=language,
+        )
+        stats = cleaner.last_clean_stats
+        runs[mode] = {
+            "batch_concurrency": stats.batch_concurrency,
+            "segments": stats.segments,
+            "batches": stats.batches,
+            "patches_emitted": stats.patches_emitted,
+            "prohibited_batches": stats.prohibited_batches,
+            "coverage": stats.coverage,
+            "wall_seconds": stats.wall_seconds,
+        }
+
+    pairs = list(zip(outputs["serial"].segments, outputs["pipelined"].segments))
+    agreeing = sum(1 for a, b in pairs if a.text == b.text and a.kind == b.kind)
+    result = {
+        "episode_index": ep.index,
+        "episode_label": ep.label,
+        "status": "done",
+        "serial": runs["serial"],
+        "pipelined": runs["pipelined"],
+        "patch_count_delta": runs["pipelined"]["patches_emitted"] - runs["serial"]["patches_emitted"],
+        "coverage_delta": runs["pipelined"]["coverage"] - runs["serial"]["coverage"],
+        "segment_agreement": agreeing / len(pairs) if pairs else None,
+        "speedup": (
+            runs["serial"]["wall_seconds"] / runs["pipelined"]["wall_seconds"]
+            if runs["pipelined"]["wall_seconds"]
+            else None
+        ),
+    }
+    with open(output_dir / f"ep_{ep.index:02d}_segmented_parity.json", "w") as f:
+        json.dump(result, f, indent=2)
+    return result
+
+
+def run_segmented_parity(
+    episodes, state: dict[int, EpisodeState], ctx: EvalContext, output_dir: Path, concurrency: int
+) -> dict:
+    """Serial-vs-pipelined parity for every episode with a Dalston transcript."""
+    results = []
+    for ep in episodes:
+        ep_state = state.get(ep.index)
+        if ep_state is None or ep_state.dalston_transcribe.status != "done":
+            continue
+        print(f"  Segmented parity: episode {ep.index} ({ep.label})...")
+        try:
+            results.append(
+                step_segmented_parity(ep, ctx, ep_state.dalston_transcribe.output_path, output_dir, concurrency)
+            )
+        except Exception as e:
+            logger.error("Segmented parity failed", episode=ep.label, error=str(e), exc_info=True)
+            results.append({"episode_index": ep.index, "episode_label": ep.label, "status": "failed", "error": str(e)})
+
+    done = [r for r in results if r["status"] == "done"]
+    summary = {
+        "generated_at": datetime.now(timezone.utc).isoformat(),
+        "batch_concurrency": concurrency,
+        "episodes": results,
+    }
+    if done:
+        for key in ("coverage_delta", "patch_count_delta", "segment_agreement", "speedup"):
+            values = [r[key] for r in done if r.get(key) is not None]
+            if values:
+                summary[key] = {
+                    "mean": sum(values) / len(values),
+                    "min": min(values),
+                    "max": max(values),
+                    "n": len(values),
+                }
+    with open(output_dir / "segmented_parity.json", "w") as f:
+        json.dump(summary, f, indent=2)
+
+    print(f"\n{'#':>3} {'Episode':<35} {'Cov ser':>8} {'Cov par':>8} {'Patches':>9} {'Agree':>7} {'Speedup':>8}")
+    print("-" * 84)
+    for r in done:
+        print(
+            f"{r['episode_index']:>3} {r['episode_label'][:35]:<35} "
+            f"{r['serial']['coverage']:>8.3f} {r['pipelined']['coverage']:>8.3f} "
+            f"{r['patch_count_delta']:>+9d} {r['segment_agreement'] or 0:>7.1%} {r['speedup'] or 0:>7.1f}x"
+        )
+    print()
+    return summary
+
+
 # ---------------------------------------------------------------------------
 # Helpers
 # ---------------------------------------------------------------------------
@@ -517,6 +632,10 @@ def run_evaluation(args):
     ctx = EvalContext()
     print(f"Using LLM provider: {ctx.provider.get_model_display_name()}")
 
+    if args.segmented_parity:
+        run_segmented_parity(episodes, state, ctx, OUTPUT_DIR, args.segmented_parity)
+        return
+
     total_episodes = len(episodes)
     for i, ep in enumerate(episodes):
         print(f"\n{'='*80}")
@@ -624,6 +743,12 @@ def main():
     parser.add_argument("--skip-dalston", action="store_true", help="Skip Dalston transcription")
     parser.add_argument("--metrics-only", action="store_true", help="Only (re)compute metrics from existing outputs")
     parser.add_argument("--report-only", action="store_true", help="Only regenerate report from existing metrics")
+    parser.add_argument(
+        "--segmented-parity",
+        type=int,
+        metavar="N",
+        help="Compare serial segmented cleaning against N pipelined batches (needs --resume state)",
+    )
 
     args = parser.parse_args()
     run_evaluation(args)
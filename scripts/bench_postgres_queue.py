@@ -0,0 +1,186 @@
+#!/usr/bin/env python3
+# Copyright 2025-2026 Thestill
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+
+"""Postgres connection churn and enqueue-to-claim latency, before and after.
+
+Two measurements against a local Postgres:
+
+1. **Per-call overhead and churn**: ``claim_batch`` on an empty stage (what
+   every idle stage poller does each tick). Timed once with
+   ``POSTGRES_POOL_ENABLED=false`` (a connection per call) and once with the
+   pool on. Connections opened are read from ``pg_stat_database.sessions``
+   (Postgres 14+).
+2. **Enqueue-to-claim latency**: a task is inserted through a separate
+   connection, standing in for another process, so the in-process wakeup
+   never fires. A poller thread claims it. "poll" sleeps ``--poll-interval``
+   between empty claims, the old behaviour. "notify" waits on the queue's
+   LISTEN relay (``listen_for_wakeups``).
+
+Point it at a scratch database. The schema is ensured, and one bench
+podcast and episode are upserted. Only the bench tasks are claimed and
+deleted.
+
+Usage:
+    ./venv/bin/python scripts/bench_postgres_queue.py --dsn postgresql://postgres@127.0.0.1:5432/thestill_bench
+    ./venv/bin/python scripts/bench_postgres_queue.py --dsn ... --iterations 500 --enqueues 50
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import random
+import statistics
+import sys
+import threading
+import time
+import uuid
+from pathlib import Path
+from typing import List
+
+PROJECT_ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+import psycopg  # noqa: E402
+
+from thestill.core.postgres_queue_manager import PostgresQueueManager  # noqa: E402
+from thestill.core.queue_manager import TaskStage  # noqa: E402
+from thestill.repositories.postgres_schema import ensure_schema  # noqa: E402
+from thestill.utils.postgres_ext import close_pools  # noqa: E402
+
+PODCAST_ID = "00000000-0000-0000-0000-00000000be01"
+EPISODE_ID = "00000000-0000-0000-0000-00000000be02"
+STAGE = TaskStage.CLEAN
+
+
+def _seed(dsn: str) -> None:
+    ensure_schema(dsn)
+    with psycopg.connect(dsn) as conn:
+        conn.execute(
+            "INSERT INTO podcasts (id, rss_url, title) VALUES (%s, %s, %s) ON CONFLICT DO NOTHING",
+            (PODCAST_ID, "https://example.com/bench.xml", "Queue Bench"),
+        )
+        conn.execute(
+            """
+            INSERT INTO episodes (id, podcast_id, external_id, title, audio_url, duration)
+            VALUES (%s, %s, 'bench', 'Queue Bench', 'https://example.com/bench.mp3', '60')
+            ON CONFLICT DO NOTHING
+            """,
+            (EPISODE_ID, PODCAST_ID),
+        )
+        conn.execute("DELETE FROM tasks WHERE episode_id = %s", (EPISODE_ID,))
+
+
+def _report(label: str, samples: List[float], unit: str = "ms") -> float:
+    scale = 1e3 if unit == "ms" else 1e6
+    values = sorted(s * scale for s in samples)
+    p50 = statistics.median(values)
+    p95 = statistics.quantiles(values, n=20, method="inclusive")[18]
+    print(f"{label:<10} p50={p50:9.2f}{unit}  p95={p95:9.2f}{unit}  mean={statistics.fmean(values):9.2f}{unit}")
+    return p50
+
+
+def _sessions(dsn: str) -> int:
+    with psycopg.connect(dsn) as conn:
+        return conn.execute("SELECT sessions FROM pg_stat_database WHERE datname = current_database()").fetchone()[0]
+
+
+def _bench_churn(dsn: str, pooled: bool, iterations: int) -> None:
+    os.environ["POSTGRES_POOL_ENABLED"] = "true" if pooled else "false"
+    close_pools()
+    qm = PostgresQueueManager(dsn)
+    samples: List[float] = []
+    before = _sessions(dsn)
+    for _ in range(iterations):
+        start = time.perf_counter()
+        qm.claim_batch(STAGE, 1, exclude_episode_ids=[EPISODE_ID])
+        samples.append(time.perf_counter() - start)
+    # Minus the probe connection _sessions itself opened.
+    opened = _sessions(dsn) - before - 1
+    _report("pooled" if pooled else "connect", samples)
+    print(f"{'':<10} connections opened: {opened} for {iterations} calls")
+
+
+def _bench_claim_latency(dsn: str, mode: str, enqueues: int, poll_interval: float) -> List[float]:
+    os.environ["POSTGRES_POOL_ENABLED"] = "true"
+    qm = PostgresQueueManager(dsn)
+    woken = threading.Event()
+    unsubscribe = qm.wakeup.subscribe(lambda stage: woken.set())
+    stop_listening = qm.listen_for_wakeups() if mode == "notify" else None
+    time.sleep(0.5)  # let the relay's LISTEN land
+
+    claimed = {}
+    done = threading.Event()
+
+    def poller() -> None:
+        while not done.is_set():
+            for task in qm.claim_batch(STAGE, 1):
+                claimed[task.id] = time.perf_counter()
+            if mode == "notify":
+                woken.wait(timeout=15.0)
+                woken.clear()
+            else:
+                time.sleep(poll_interval)
+
+    thread = threading.Thread(target=poller, daemon=True)
+    thread.start()
+    latencies: List[float] = []
+    try:
+        with psycopg.connect(dsn, autocommit=True) as other_process:
+            for _ in range(enqueues):
+                time.sleep(random.uniform(0, poll_interval))
+                task_id = str(uuid.uuid4())
+                sent = time.perf_counter()
+                other_process.execute(
+                    "INSERT INTO tasks (id, episode_id, stage, status, created_at, updated_at) "
+                    "VALUES (%s, %s, %s, 'pending', now(), now())",
+                    (task_id, EPISODE_ID, STAGE.value),
+                )
+                while task_id not in claimed:
+                    time.sleep(0.0005)
+                latencies.append(claimed[task_id] - sent)
+                other_process.execute("DELETE FROM tasks WHERE id = %s", (task_id,))
+    finally:
+        done.set()
+        woken.set()
+        thread.join(timeout=poll_interval + 2)
+        unsubscribe()
+        if stop_listening is not None:
+            stop_listening()
+    return latencies
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument(
+        "--dsn", default=os.getenv("TEST_DATABASE_URL"), help="Scratch database (default: $TEST_DATABASE_URL)"
+    )
+    parser.add_argument("--iterations", type=int, default=300, help="Empty claims per churn run")
+    parser.add_argument("--enqueues", type=int, default=30, help="Tasks per latency run")
+    parser.add_argument("--poll-interval", type=float, default=2.0, help="TaskWorker.DEFAULT_POLL_INTERVAL")
+    args = parser.parse_args()
+    if not args.dsn:
+        parser.error("--dsn (or TEST_DATABASE_URL) is required")
+
+    _seed(args.dsn)
+    print(f"iterations={args.iterations} enqueues={args.enqueues} poll_interval={args.poll_interval}s")
+    print("\nempty claim_batch per call")
+    _bench_churn(args.dsn, pooled=False, iterations=args.iterations)
+    _bench_churn(args.dsn, pooled=True, iterations=args.iterations)
+
+    print("\nenqueue (other process) -> claimed")
+    before = _report("poll", _bench_claim_latency(args.dsn, "poll", args.enqueues, args.poll_interval))
+    after = _report("notify", _bench_claim_latency(args.dsn, "notify", args.enqueues, args.poll_interval))
+    print(f"speedup    {before / after:.0f}x enqueue-to-claim (p50)")
+    close_pools()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
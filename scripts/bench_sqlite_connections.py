@@ -0,0 +1,99 @@
+#!/usr/bin/env python3
+# Copyright 2025-2026 Thestill
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+
+"""Per-call overhead of ``sqlite_ext.connect`` vs the pooled connections.
+
+Every SQLite repository method opens its connection through
+``_get_connection``. This measures what that costs per call for the
+per-call path (:func:`connect` — open, PRAGMAs, optional sqlite-vec load,
+close) against the pooled path (:func:`pooled_connect` — reuse of a
+prepared per-thread connection), each wrapped around a trivial primary-key
+read so the numbers reflect a realistic repository call.
+
+Runs against a throwaway database by default; pass ``--db`` to point it at
+a real one (read-only queries only).
+
+Usage:
+    ./venv/bin/python scripts/bench_sqlite_connections.py
+    ./venv/bin/python scripts/bench_sqlite_connections.py --iterations 5000 --load-vec soft
+"""
+
+from __future__ import annotations
+
+import argparse
+import statistics
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Callable, List
+
+PROJECT_ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from thestill.utils.sqlite_ext import connect, get_connection_pool, pooled_connect  # noqa: E402
+
+
+def _seed(db_path: Path) -> None:
+    with connect(db_path) as conn:
+        conn.execute("CREATE TABLE IF NOT EXISTS bench (id INTEGER PRIMARY KEY, v TEXT)")
+        conn.executemany("INSERT OR IGNORE INTO bench VALUES (?, ?)", [(i, f"row-{i}") for i in range(1000)])
+
+
+def _time_calls(fn: Callable[[int], None], iterations: int) -> List[float]:
+    samples: List[float] = []
+    fn(0)  # warm-up (first pooled call opens the connection)
+    for i in range(iterations):
+        start = time.perf_counter()
+        fn(i)
+        samples.append(time.perf_counter() - start)
+    return samples
+
+
+def _report(label: str, samples: List[float]) -> float:
+    us = sorted(s * 1e6 for s in samples)
+    p50 = statistics.median(us)
+    p95 = statistics.quantiles(us, n=20, method="inclusive")[18]
+    print(f"{label:<10} p50={p50:8.1f}us  p95={p95:8.1f}us  mean={statistics.fmean(us):8.1f}us")
+    return p50
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--db", type=Path, help="Existing database to read from (default: temp DB)")
+    parser.add_argument("--iterations", type=int, default=2000)
+    parser.add_argument("--load-vec", choices=["none", "soft", "require"], default="soft")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        db_path = args.db or Path(tmp) / "bench.db"
+        if args.db is None:
+            _seed(db_path)
+            query = "SELECT v FROM bench WHERE id = ?"
+        else:
+            query = "SELECT ? FROM sqlite_master LIMIT 1"
+
+        def per_call(i: int) -> None:
+            with connect(db_path, load_vec=args.load_vec) as conn:
+                conn.execute(query, (i % 1000,)).fetchone()
+
+        def pooled(i: int) -> None:
+            with pooled_connect(db_path, load_vec=args.load_vec) as conn:
+                conn.execute(query, (i % 1000,)).fetchone()
+
+        print(f"db={db_path} iterations={args.iterations} load_vec={args.load_vec}")
+        before = _report("connect", _time_calls(per_call, args.iterations))
+        after = _report("pooled", _time_calls(pooled, args.iterations))
+        print(f"speedup    {before / after:.1f}x per call (p50)")
+        get_connection_pool().close_all()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
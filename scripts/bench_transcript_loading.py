@@ -0,0 +1,139 @@
+#!/usr/bin/env python3
+# Copyright 2025-2026 Thestill
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+
+"""Parse time and peak RSS of ``Transcript.model_validate_json`` vs the streaming reader.
+
+Builds a synthetic raw transcript (three hours by default, ~160 words a
+minute, one segment per sentence) and loads it once per mode, each in a
+fresh interpreter so ``ru_maxrss`` is not polluted by the previous run:
+
+- ``pydantic``: ``Transcript.model_validate_json(path.read_text())``
+- ``stream-skip``: ``load_segments(path)`` (words skipped)
+- ``stream-arrays``: ``load_segments(path, words="arrays")``
+
+Pass ``--file`` to measure a real transcript JSON instead.
+
+Usage:
+    ./venv/bin/python scripts/bench_transcript_loading.py
+    ./venv/bin/python scripts/bench_transcript_loading.py --hours 1 --file data/raw_transcripts/x.json
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import random
+import resource
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+MODES = ("pydantic", "stream-skip", "stream-arrays")
+_VOCAB = "the a podcast episode really think market model people because about would going know".split()
+
+
+def _synthesise(path: Path, hours: float) -> None:
+    rng = random.Random(0)
+    segments = []
+    t = 0.0
+    total_words = int(hours * 60 * 160)
+    seg_id = 0
+    while total_words > 0:
+        n = min(total_words, rng.randint(8, 30))
+        total_words -= n
+        words = []
+        start = t
+        for _ in range(n):
+            dur = rng.uniform(0.15, 0.6)
+            words.append(
+                {"word": " " + rng.choice(_VOCAB), "start": round(t, 3), "end": round(t + dur, 3), "probability": 0.97}
+            )
+            t += dur
+        segments.append(
+            {
+                "id": seg_id,
+                "start": round(start, 3),
+                "end": round(t, 3),
+                "text": "".join(w["word"] for w in words).strip(),
+                "speaker": f"SPEAKER_0{seg_id % 3}",
+                "words": words,
+                "confidence": None,
+            }
+        )
+        seg_id += 1
+        t += 0.4
+    doc = {
+        "audio_file": "bench.wav",
+        "language": "en",
+        "text": " ".join(s["text"] for s in segments),
+        "segments": segments,
+        "processing_time": 1.0,
+        "model_used": "bench",
+        "timestamp": 0.0,
+    }
+    path.write_text(json.dumps(doc, indent=2), encoding="utf-8")
+
+
+def _run_child(mode: str, path: Path) -> None:
+    """Load ``path`` once with ``mode``; print elapsed seconds and peak RSS (KiB) as JSON."""
+    from thestill.core.transcript_stream import load_segments
+    from thestill.models.transcript import Transcript
+
+    baseline = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    start = time.perf_counter()
+    if mode == "pydantic":
+        n = len(Transcript.model_validate_json(path.read_text(encoding="utf-8")).segments)
+    elif mode == "stream-skip":
+        n = len(load_segments(path).segments)
+    else:
+        n = len(load_segments(path, words="arrays").segments)
+    elapsed = time.perf_counter() - start
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    print(json.dumps({"segments": n, "seconds": elapsed, "peak_kib": peak, "delta_kib": peak - baseline}))
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--hours", type=float, default=3.0, help="Synthetic episode length (default: 3)")
+    parser.add_argument("--file", type=Path, help="Existing transcript JSON to load instead")
+    parser.add_argument("--child", choices=MODES, help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.child:
+        _run_child(args.child, args.file)
+        return 0
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = args.file
+        if path is None:
+            path = Path(tmp) / "bench_transcript.json"
+            _synthesise(path, args.hours)
+        print(f"file={path} size={path.stat().st_size / 1e6:.1f} MB")
+        for mode in MODES:
+            out = subprocess.run(
+                [sys.executable, __file__, "--child", mode, "--file", str(path)],
+                check=True,
+                capture_output=True,
+                text=True,
+            )
+            r = json.loads(out.stdout.strip().splitlines()[-1])
+            print(
+                f"{mode:<14} segments={r['segments']:<6} parse={r['seconds']:6.2f}s  "
+                f"peak_rss={r['peak_kib'] / 1024:7.1f} MiB  (+{r['delta_kib'] / 1024:.1f} MiB over import)"
+            )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
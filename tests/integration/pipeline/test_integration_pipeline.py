@@ -250,7 +250,7 @@ class TestPipelineDownload:
 
         # Mock HTTP download
         mock_response = Mock()
-        mock_response.headers = {"content-length": "1024"}
+        mock_response.headers = {"content-length": str(len(_FAKE_MP3_BYTES))}
         mock_response.iter_content = Mock(return_value=[_FAKE_MP3_BYTES])
         mock_response.raise_for_status = Mock()
         mock_download_get.return_value = mock_response
@@ -308,7 +308,7 @@ class TestPipelineDownsample:
         mock_parse_rss.return_value = sample_rss_feed
 
         mock_response = Mock()
-        mock_response.headers = {"content-length": "1024"}
+        mock_response.headers = {"content-length": str(len(_FAKE_MP3_BYTES))}
         mock_response.iter_content = Mock(return_value=[_FAKE_MP3_BYTES])
         mock_response.raise_for_status = Mock()
         mock_download_get.return_value = mock_response
@@ -431,7 +431,7 @@ class TestFullPipelineIntegration:
         mock_parse_rss.return_value = sample_rss_feed
 
         mock_response = Mock()
-        mock_response.headers = {"content-length": "1024"}
+        mock_response.headers = {"content-length": str(len(_FAKE_MP3_BYTES))}
         mock_response.iter_content = Mock(return_value=[_FAKE_MP3_BYTES])
         mock_response.raise_for_status = Mock()
         mock_download_get.return_value = mock_response
@@ -73,7 +73,7 @@ PUB_3 = datetime(2026, 6, 15, 8, 0, 0, tzinfo=timezone.utc)
 
 _ENTITY_TABLES = (
     "entities, entity_mentions, entity_cooccurrences, entity_enrichment, "
-    "mention_overrides, resolution_blacklist, episodes, podcasts"
+    "mention_overrides, resolution_blacklist, entity_resolution_cache, episode_entities, episodes, podcasts"
 )
 
 
@@ -543,6 +543,84 @@ def test_rebuild_cooccurrences_scoped_and_empty(repo):
     assert summary["cooccurring"][0]["episode_count"] == 2
 
 
+def _pair_counts(repo, entity_id: str) -> dict:
+    summary = repo.get_entity_summary(entity_id)
+    return {row["entity"].id: row["episode_count"] for row in summary["cooccurring"]}
+
+
+def test_update_cooccurrences_matches_full_rebuild(repo):
+    _seed_resolved_corpus(repo)
+    # Incremental from an empty projection; EP_3 (single entity) adds nothing.
+    assert repo.update_cooccurrences([EP_1, EP_2, EP_3]) == 2  # +1 twice on the same pair
+    incremental = _pair_counts(repo, "person:elon-musk")
+    repo.rebuild_cooccurrences()
+    assert incremental == _pair_counts(repo, "person:elon-musk") == {"company:spacex": 2}
+    # Already in sync → no deltas.
+    assert repo.update_cooccurrences([EP_1, EP_2, EP_3]) == 0
+
+
+def test_update_cooccurrences_applies_add_and_remove_deltas(repo):
+    _seed_resolved_corpus(repo)
+    repo.update_cooccurrences([EP_1, EP_2, EP_3])
+
+    # EP_3 gains SpaceX → pair count 3.
+    repo.insert_mentions(
+        [_resolved_mention("company:spacex", episode_id=EP_3, surface="SpaceX", label="company", segment_id=2)]
+    )
+    repo.update_cooccurrences([EP_3])
+    assert _pair_counts(repo, "company:spacex") == {"person:elon-musk": 3}
+
+    # EP_1 and EP_2 are wiped (reindex) → 1; EP_3 wiped too → row deleted.
+    repo.delete_mentions_for_episode(EP_1)
+    repo.delete_mentions_for_episode(EP_2)
+    repo.update_cooccurrences([EP_1, EP_2])
+    assert _pair_counts(repo, "company:spacex") == {"person:elon-musk": 1}
+    repo.delete_mentions_for_episode(EP_3)
+    repo.update_cooccurrences([EP_3])
+    assert _pair_counts(repo, "company:spacex") == {}
+
+
+def _delete_episode(repo, episode_id: str) -> None:
+    if isinstance(repo, SqliteEntityRepository):
+        from thestill.utils.sqlite_ext import pooled_writer
+
+        with pooled_writer(repo.db_path, load_vec="soft") as conn:
+            conn.execute("DELETE FROM episodes WHERE id = ?", (episode_id,))
+            conn.commit()
+        return
+    import psycopg
+
+    with psycopg.connect(PG_DSN) as conn:
+        conn.execute("DELETE FROM episodes WHERE id = %s", (episode_id,))
+
+
+def test_deleting_an_episode_releases_its_pairs(repo):
+    _seed_resolved_corpus(repo)
+    repo.update_cooccurrences([EP_1, EP_2, EP_3])
+
+    _delete_episode(repo, EP_1)
+    assert _pair_counts(repo, "company:spacex") == {"person:elon-musk": 1}
+    _delete_episode(repo, EP_2)
+    assert _pair_counts(repo, "company:spacex") == {}
+
+    # The projection went with the episodes; the survivors are still in sync.
+    assert repo.update_cooccurrences([EP_3]) == 0
+    repo.rebuild_cooccurrences()
+    assert _pair_counts(repo, "company:spacex") == {}
+
+
+def test_repoint_mentions_moves_pairs_to_the_keeper(repo):
+    _seed_resolved_corpus(repo)
+    repo.update_cooccurrences([EP_1, EP_2, EP_3])
+    repo.upsert_entity(_entity(id="person:musk", name="Musk", qid="Q317521", aliases=[]))
+
+    repo.repoint_mentions(from_entity_id="person:elon-musk", to_entity_id="person:musk")
+    repo.delete_entity("person:elon-musk")
+
+    assert _pair_counts(repo, "person:musk") == {"company:spacex": 2}
+    assert repo.update_cooccurrences([EP_1, EP_2, EP_3]) == 0  # projection already in sync
+
+
 # ---------------------------------------------------------------------------
 # Entity summary / roles / anchors / top speakers
 # ---------------------------------------------------------------------------
@@ -742,6 +820,50 @@ def test_blacklist_add_check_list_idempotent(repo):
     assert len(repo.list_blacklist(limit=1)) == 1
 
 
+# ---------------------------------------------------------------------------
+# Surface-form resolution cache
+# ---------------------------------------------------------------------------
+def _observation(qid: str = "Q317521", **overrides) -> dict:
+    base = dict(
+        surface_key="elon musk",
+        surface_label="person",
+        wikidata_qid=qid,
+        canonical_name="Elon Musk",
+        entity_type="person",
+        description=None,
+        wikidata_instance_of=["Q5"],
+    )
+    base.update(overrides)
+    return base
+
+
+def test_surface_resolution_cache_counts_and_conflicts(repo):
+    key = ("elon musk", "person")
+    assert repo.lookup_surface_resolutions([key]) == {}
+
+    repo.record_surface_resolutions([_observation(), _observation()])
+    repo.record_surface_resolutions([_observation(description="CEO")])
+    row = repo.lookup_surface_resolutions([key, ("nobody", "")])[key]
+    assert row["observations"] == 3
+    assert row["conflicting"] is False
+    assert row["description"] == "CEO"
+    assert row["wikidata_instance_of"] == ["Q5"]
+
+    # A different QID poisons the row for good; the first answer is kept.
+    repo.record_surface_resolutions([_observation(qid="Q999", canonical_name="Someone Else")])
+    repo.record_surface_resolutions([_observation()])
+    row = repo.lookup_surface_resolutions([key])[key]
+    assert row["conflicting"] is True
+    assert row["wikidata_qid"] == "Q317521"
+    assert row["canonical_name"] == "Elon Musk"
+
+
+def test_blacklisting_drops_cached_resolution(repo):
+    repo.record_surface_resolutions([_observation(surface_key="prof g", qid="Q999")])
+    repo.add_blacklist_entry(surface_form="Prof  G", wrong_qid="Q999")
+    assert repo.lookup_surface_resolutions([("prof g", "person")]) == {}
+
+
 # ---------------------------------------------------------------------------
 # Enrichment (spec #45)
 # ---------------------------------------------------------------------------
@@ -0,0 +1,70 @@
+# Copyright 2025-2026 Thestill
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Postgres progress bus against a REAL Postgres: upsert + LISTEN/NOTIFY
+between two stores standing in for the web and worker processes."""
+
+from __future__ import annotations
+
+import asyncio
+import os
+import uuid
+
+import pytest
+
+PG_DSN = os.getenv("TEST_DATABASE_URL", "")
+
+
+def _pg_ok(dsn: str) -> bool:
+    if not dsn:
+        return False
+    try:
+        import psycopg
+
+        with psycopg.connect(dsn, connect_timeout=3) as conn:
+            conn.execute("SELECT 1")
+        return True
+    except Exception:
+        return False
+
+
+pytestmark = pytest.mark.skipif(not _pg_ok(PG_DSN), reason="Postgres not reachable — set TEST_DATABASE_URL")
+
+
+def test_notify_reaches_other_store_and_latest_survives():
+    from thestill.core.progress_bus import PostgresProgressBus
+    from thestill.core.progress_store import ProgressStore, TaskProgress
+    from thestill.repositories.postgres_schema import ensure_schema
+
+    ensure_schema(PG_DSN)
+    task_id = str(uuid.uuid4())
+    worker = ProgressStore(PostgresProgressBus(PG_DSN))
+
+    async def scenario():
+        web = ProgressStore(PostgresProgressBus(PG_DSN))
+        web.set_event_loop(asyncio.get_running_loop())
+        queue = web.subscribe(task_id)
+        try:
+            await asyncio.sleep(0.5)  # let the listener issue LISTEN
+            worker.update(task_id, TaskProgress(stage="transcribing", progress_pct=30))
+            return await asyncio.wait_for(queue.get(), 5), web.get(task_id)
+        finally:
+            web.close()
+
+    received, current = asyncio.run(scenario())
+    assert received.progress_pct == 30
+    assert current.stage == "transcribing"
+
+    worker.cleanup(task_id)
+    assert PostgresProgressBus(PG_DSN).latest(task_id) is None
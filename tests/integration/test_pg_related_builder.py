@@ -217,6 +217,7 @@ def test_build_backfills_centroids_and_ranks_similar_pairs(seeded):
 
 
 def test_build_persists_idf(seeded):
+    from thestill.search.related_engine import term_bucket
     from thestill.utils.postgres_ext import connect
 
     _build()
@@ -224,8 +225,9 @@ def test_build_persists_idf(seeded):
         rows = conn.execute("SELECT term, idf FROM related_idf").fetchall()
     terms = {r["term"] for r in rows}
     assert terms, "related_idf must be persisted by the full build"
-    # min_df=2 keeps only cross-document terms; both topic vocabularies qualify.
-    assert "biceps" in terms and "valuation" in terms
+    # Hashed model: rows are keyed by bucket. min_df=2 keeps only
+    # cross-document terms; both topic vocabularies qualify.
+    assert f"#{term_bucket('biceps')}" in terms and f"#{term_bucket('valuation')}" in terms
     assert all(r["idf"] > 0 for r in rows)
 
 
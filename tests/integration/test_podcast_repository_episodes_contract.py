@@ -41,6 +41,7 @@ from types import SimpleNamespace
 import pytest
 
 from thestill.models.podcast import AlternateEnclosure, Episode, EpisodeState, Podcast, TranscriptLink
+from thestill.repositories.episode_listing import InvalidCursorError, encode_episode_cursor
 from thestill.repositories.sqlite_podcast_repository import SqlitePodcastRepository
 
 PG_DSN = os.getenv("TEST_DATABASE_URL", "")
@@ -626,6 +627,79 @@ def test_get_all_episodes_filters_and_pagination(h):
     assert podcast.title == f"Podcast {uid}b"
 
 
+def _walk_cursor_pages(repo, podcast_id, sort_by, sort_order, limit=2):
+    ids, cursor = [], None
+    while True:
+        page, _ = repo.get_all_episodes(
+            limit=limit, podcast_id=podcast_id, sort_by=sort_by, sort_order=sort_order, cursor=cursor
+        )
+        ids.extend(e.id for _, e in page)
+        if len(page) < limit:
+            return ids
+        cursor = encode_episode_cursor(page[-1][1].id, sort_by, sort_order)
+
+
+@pytest.mark.parametrize(
+    "sort_by,sort_order",
+    [("pub_date", "desc"), ("pub_date", "asc"), ("title", "asc"), ("title", "desc"), ("updated_at", "desc")],
+)
+def test_get_all_episodes_cursor_pages_match_offset_order(h, sort_by, sort_order):
+    uid = _nonce()
+    pid = _mk_parent(h, uid)
+    tie = datetime(2026, 6, 3, 12, 0, tzinfo=timezone.utc)
+    h.repo.save_episodes(
+        [
+            _mk_episode(pid, uid, 1, title=f"B {uid}"),
+            _mk_episode(pid, uid, 2, title=f"A {uid}", pub_date=tie),
+            _mk_episode(pid, uid, 3, title=f"A {uid}", pub_date=tie),
+            _mk_episode(pid, uid, 4, title=f"C {uid}", pub_date=None),
+            _mk_episode(pid, uid, 5, title=f"D {uid}", pub_date=None),
+        ]
+    )
+
+    full, total = h.repo.get_all_episodes(limit=50, podcast_id=pid, sort_by=sort_by, sort_order=sort_order)
+    assert total == 5
+    expected = [e.id for _, e in full]
+    assert _walk_cursor_pages(h.repo, pid, sort_by, sort_order) == expected
+    # Offset pages agree with the same total order (id tiebreak).
+    offset_ids = []
+    for offset in range(0, 5, 2):
+        page, _ = h.repo.get_all_episodes(
+            limit=2, offset=offset, podcast_id=pid, sort_by=sort_by, sort_order=sort_order
+        )
+        offset_ids.extend(e.id for _, e in page)
+    assert offset_ids == expected
+    if sort_by == "pub_date":
+        # Undated episodes sit at the end of newest-first, the start of oldest-first.
+        undated = {e.id for _, e in full if e.pub_date is None}
+        assert set(expected[-2:] if sort_order == "desc" else expected[:2]) == undated
+
+
+def test_get_all_episodes_rejects_bad_cursors(h):
+    uid = _nonce()
+    pid = _mk_parent(h, uid)
+    ep = _mk_episode(pid, uid)
+    h.repo.save_episode(ep)
+
+    with pytest.raises(InvalidCursorError):
+        h.repo.get_all_episodes(podcast_id=pid, cursor="not-a-cursor")
+    with pytest.raises(InvalidCursorError):
+        h.repo.get_all_episodes(podcast_id=pid, cursor=encode_episode_cursor(ep.id, "title", "asc"))
+    with pytest.raises(InvalidCursorError):
+        h.repo.get_all_episodes(podcast_id=pid, cursor=encode_episode_cursor(MISSING_ID, "pub_date", "desc"))
+
+
+def test_get_all_episodes_total_tracks_writes(h):
+    uid = _nonce()
+    pid = _mk_parent(h, uid)
+    h.repo.save_episode(_mk_episode(pid, uid, 1))
+    assert h.repo.get_all_episodes(podcast_id=pid)[1] == 1
+    assert h.repo.get_all_episodes(podcast_id=pid)[1] == 1  # served from the count cache
+
+    h.repo.save_episode(_mk_episode(pid, uid, 2))
+    assert h.repo.get_all_episodes(podcast_id=pid)[1] == 2
+
+
 # ---------------------------------------------------------------------------
 # Episode lookups (id / slug / external id)
 # ---------------------------------------------------------------------------
@@ -37,6 +37,7 @@ from datetime import datetime, timedelta, timezone
 
 import pytest
 
+from thestill.core.refresh_cadence import RefreshCadenceSettings
 from thestill.core.refresh_failure import RefreshFailure, RefreshFailureKind, RefreshPolicySettings
 from thestill.models.podcast import Episode, FailureType, Podcast
 from thestill.repositories.postgres_podcast_repository_podcasts import PodcastsMixin
@@ -44,6 +45,7 @@ from thestill.repositories.sqlite_podcast_repository import SYNTHETIC_AUDIO_IMPO
 
 # Spec #60 — shared policy settings + failure builders for the refresh tests.
 _SETTINGS = RefreshPolicySettings(min_interval_seconds=600, max_interval_seconds=86400, default_interval_seconds=3600)
+_NO_JITTER = RefreshCadenceSettings(jitter_percent=0)
 
 
 def _gone_410() -> RefreshFailure:
@@ -479,15 +481,16 @@ def test_refresh_scheduling_bookkeeping(repo):
     assert p.id in repo.get_due_podcasts(now=base + timedelta(seconds=3600))
     assert p.id not in repo.get_due_podcasts(now=base - timedelta(seconds=1))
 
-    # AIMD: no new episodes → interval * 1.5 (3600 → 5400).
+    # AIMD (no publish history yet): no new episodes → interval * 1.5
+    # (3600 → 5400). Jitter off so the due time is exact.
     next_iso = repo.record_refresh_success(
-        p.id, found_new=False, min_interval=600, max_interval=86400, default_interval=3600, now=base
+        p.id, found_new=False, min_interval=600, max_interval=86400, default_interval=3600, now=base, cadence=_NO_JITTER
     )
     assert datetime.fromisoformat(next_iso) == base + timedelta(seconds=5400)
 
     # New episodes → interval // 2 (5400 → 2700).
     next_iso = repo.record_refresh_success(
-        p.id, found_new=True, min_interval=600, max_interval=86400, default_interval=3600, now=base
+        p.id, found_new=True, min_interval=600, max_interval=86400, default_interval=3600, now=base, cadence=_NO_JITTER
     )
     assert datetime.fromisoformat(next_iso) == base + timedelta(seconds=2700)
     assert p.id in repo.get_due_podcasts(now=base + timedelta(seconds=2700))
@@ -751,6 +754,62 @@ def test_get_refresh_health_counts(repo):
     assert counts["parked_total"] >= 1
 
 
+def test_record_refresh_success_adapts_to_publish_rhythm(repo):
+    """Daily releases → 4 polls per day; quiet refreshes past one gap back
+    off; a 304 keeps the feed's <ttl> hint, a 200 replaces it."""
+    base = datetime(2026, 7, 10, 12, 0, 0, tzinfo=timezone.utc)
+    p = _mk_podcast()
+    p.episodes = [_mk_episode(pub_date=base - timedelta(days=d)) for d in range(5)]
+    repo.save(p)
+    _seed_user_and_follow(repo, p.id)
+    repo.seed_unscheduled_feeds(3600, now=base)
+
+    def record(found_new=False, **kwargs):
+        return repo.record_refresh_success(
+            p.id,
+            found_new=found_new,
+            min_interval=600,
+            max_interval=86400,
+            default_interval=3600,
+            now=base,
+            cadence=_NO_JITTER,
+            **kwargs,
+        )
+
+    def state():
+        return _exec(
+            repo,
+            "SELECT refresh_interval_seconds, refresh_unchanged_streak, refresh_hint_seconds "
+            "FROM podcasts WHERE id = ?",
+            (p.id,),
+            fetch=True,
+        )[0]
+
+    assert datetime.fromisoformat(record(found_new=True)) == base + timedelta(hours=6)
+    for _ in range(4):  # one publish gap of quiet polls: still on rhythm
+        record()
+    assert state()["refresh_interval_seconds"] == 6 * 3600
+    record()  # overdue → ×1.5
+    assert state() == {
+        "refresh_interval_seconds": 9 * 3600,
+        "refresh_unchanged_streak": 5,
+        "refresh_hint_seconds": None,
+    }
+
+    # <ttl>12h</ttl> floors the interval; a 304 has no body and keeps it.
+    record(found_new=True, feed_hint_seconds=12 * 3600)
+    assert state()["refresh_interval_seconds"] == 12 * 3600
+    record(not_modified=True)
+    assert state()["refresh_hint_seconds"] == 12 * 3600
+    record(found_new=True, feed_hint_seconds=None)
+    assert state()["refresh_hint_seconds"] is None
+    assert state()["refresh_interval_seconds"] == 6 * 3600
+
+    counts = repo.get_refresh_health_counts(now=base, baseline_interval_seconds=3600)
+    # This feed alone: 24 polls/day at the baseline, 4 at its cadence.
+    assert counts["fetches_avoided_per_day"] >= 20
+
+
 def test_get_due_podcasts_excludes_inactive(repo):
     base = datetime(2026, 7, 1, tzinfo=timezone.utc)
     done = _mk_podcast(is_complete=True)
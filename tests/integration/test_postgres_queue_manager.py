@@ -627,3 +627,56 @@ class TestConcurrencySmoke:
         assert set(all_claims) == task_ids
         # And every row ended up processing.
         assert qm.get_queue_stats()["processing"] == n_tasks
+
+
+# ---------------------------------------------------------------------------
+# connection pool + cross-process wakeups
+# ---------------------------------------------------------------------------
+class TestPoolAndWakeups:
+    def test_connections_are_reused_from_the_pool(self, qm):
+        from thestill.utils.postgres_ext import get_pool
+
+        pool = get_pool(PG_DSN)
+        pool.wait()
+        opened = pool.get_stats().get("connections_num", 0)
+        for _ in range(20):
+            qm.get_pending_count()
+        assert pool.get_stats().get("connections_num", 0) == opened
+
+    def test_pooled_block_rolls_back_on_error(self, qm):
+        from thestill.utils.postgres_ext import connect
+
+        with pytest.raises(RuntimeError):
+            with connect(PG_DSN) as conn:
+                conn.execute("DELETE FROM tasks")
+                raise RuntimeError("boom")
+        qm.add_task(episode_id=EPISODE_ID, stage=TaskStage.CLEAN)
+        with connect(PG_DSN) as conn:
+            assert conn.execute("SELECT COUNT(*) AS n FROM tasks").fetchone()["n"] == 1
+
+    def test_enqueue_from_another_connection_wakes_the_stage(self, qm):
+        import threading
+
+        woken: list = []
+        seen = threading.Event()
+
+        def listener(stage):
+            woken.append(stage)
+            if stage is TaskStage.SUMMARIZE:
+                seen.set()
+
+        unsubscribe = qm.wakeup.subscribe(listener)
+        stop_listening = qm.listen_for_wakeups()
+        try:
+            deadline = time.monotonic() + 5
+            while None not in woken and time.monotonic() < deadline:  # relay's post-LISTEN wake
+                time.sleep(0.01)
+            # Another process's INSERT: the in-process notify never runs.
+            _exec(
+                "INSERT INTO tasks (id, episode_id, stage, status) VALUES (%s, %s, 'summarize', 'pending')",
+                (str(uuid.uuid4()), EPISODE_ID),
+            )
+            assert seen.wait(5)
+        finally:
+            stop_listening()
+            unsubscribe()
@@ -292,3 +292,63 @@ def test_unknown_episode_returns_404(client, app_state):
     not a 500 from trying to read sidecars off a missing row."""
     response = client.get("/api/podcasts/nope/episodes/nope/transcript/words")
     assert response.status_code == 404
+
+
+def test_first_request_writes_the_word_index_and_later_ones_serve_it(client, app_state, tmp_path):
+    """Episodes cleaned before the index existed get one built lazily; after
+    that the transcript JSON is no longer read at all."""
+    podcast_slug, episode_slug = _seed_episode(
+        app_state=app_state,
+        tmp_path=tmp_path,
+        raw_transcript=_build_raw_transcript(),
+        annotated_transcript=_build_annotated_transcript(episode_id="22222222-2222-2222-2222-222222222222"),
+    )
+    url = f"/api/podcasts/{podcast_slug}/episodes/{episode_slug}/transcript/words"
+    first = client.get(url)
+    assert first.status_code == 200
+
+    index_path = app_state.path_manager.clean_transcripts_dir() / "test-episode_annotated.words.idx"
+    assert index_path.exists()
+    (app_state.path_manager.raw_transcripts_dir() / "test-episode_transcript.json").write_text("{corrupt")
+
+    second = client.get(url)
+    assert second.status_code == 200
+    assert second.json()["segments"] == first.json()["segments"]
+    assert second.headers["etag"] == first.headers["etag"]
+
+
+def test_matching_if_none_match_returns_304(client, app_state, tmp_path):
+    podcast_slug, episode_slug = _seed_episode(
+        app_state=app_state,
+        tmp_path=tmp_path,
+        raw_transcript=_build_raw_transcript(),
+        annotated_transcript=_build_annotated_transcript(episode_id="22222222-2222-2222-2222-222222222222"),
+    )
+    url = f"/api/podcasts/{podcast_slug}/episodes/{episode_slug}/transcript/words"
+    etag = client.get(url).headers["etag"]
+
+    response = client.get(url, headers={"If-None-Match": etag})
+    assert response.status_code == 304
+    assert response.content == b""
+
+
+def test_offset_change_changes_the_etag(client, app_state, tmp_path):
+    """The offset lives on the DB row, not in the index, so it must still
+    invalidate the client's copy."""
+    annotated = _build_annotated_transcript(episode_id="22222222-2222-2222-2222-222222222222")
+    podcast_slug, episode_slug = _seed_episode(
+        app_state=app_state, tmp_path=tmp_path, raw_transcript=_build_raw_transcript(), annotated_transcript=annotated
+    )
+    url = f"/api/podcasts/{podcast_slug}/episodes/{episode_slug}/transcript/words"
+    etag = client.get(url).headers["etag"]
+
+    _seed_episode(
+        app_state=app_state,
+        tmp_path=tmp_path,
+        raw_transcript=_build_raw_transcript(),
+        annotated_transcript=annotated,
+        playback_offset=3.0,
+    )
+    response = client.get(url, headers={"If-None-Match": etag})
+    assert response.status_code == 200
+    assert response.json()["playback_time_offset_seconds"] == 3.0
@@ -45,6 +45,15 @@ class _StubEnricher:
             wikipedia_status=EnrichmentStatus.OK,
         )
 
+    def enrich_many(self, entities, *, max_workers=1):
+        out = []
+        for entity in entities:
+            try:
+                out.append((entity, self.enrich(entity), None))
+            except Exception as exc:  # noqa: BLE001 — mirrors EntityEnricher.enrich_many
+                out.append((entity, None, exc))
+        return out
+
 
 @pytest.fixture
 def cli_env(tmp_path, monkeypatch):
@@ -19,6 +19,7 @@ import requests
 # fake MP3 body is accepted, and pad to satisfy the minimum-size check.
 _MP3_HEADER = b"ID3\x04\x00\x00\x00\x00\x00\x00"
 _MP3_PAD = b"\x00" * 64
+_MP3_LENGTH = str(len(_MP3_HEADER + _MP3_PAD))
 
 from thestill.core.audio_downloader import AudioDownloader, DownloadError
 from thestill.models.podcast import Episode, Podcast
@@ -96,7 +97,7 @@ class TestDownloadEpisode:
         # Setup mock response
         mock_response = Mock()
         mock_response.status_code = 200
-        mock_response.headers = {"content-length": "1024"}
+        mock_response.headers = {"content-length": _MP3_LENGTH}
         mock_response.iter_content = Mock(return_value=[_MP3_HEADER, _MP3_PAD])
         mock_response.raise_for_status = Mock()
         mock_get.return_value = mock_response
@@ -203,7 +204,7 @@ class TestDownloadEpisode:
         """Should succeed if retry attempt succeeds."""
         # Setup mock to fail first time, succeed second time
         mock_response = Mock()
-        mock_response.headers = {"content-length": "100"}
+        mock_response.headers = {"content-length": _MP3_LENGTH}
         mock_response.iter_content = Mock(return_value=[_MP3_HEADER, _MP3_PAD])
         mock_response.raise_for_status = Mock()
 
@@ -228,7 +229,7 @@ class TestDownloadEpisode:
         """Should succeed if final retry attempt succeeds."""
         # Setup mock to fail twice, succeed on third attempt
         mock_response = Mock()
-        mock_response.headers = {"content-length": "100"}
+        mock_response.headers = {"content-length": _MP3_LENGTH}
         mock_response.iter_content = Mock(return_value=[_MP3_HEADER + _MP3_PAD])
         mock_response.raise_for_status = Mock()
 
@@ -304,7 +305,7 @@ class TestDownloadEpisode:
 
             # Setup mock
             mock_response = Mock()
-            mock_response.headers = {"content-length": "100"}
+            mock_response.headers = {"content-length": _MP3_LENGTH}
             mock_response.iter_content = Mock(return_value=[_MP3_HEADER + _MP3_PAD])
             mock_response.raise_for_status = Mock()
             mock_get.return_value = mock_response
@@ -554,7 +555,7 @@ class TestEdgeCases:
 
         # Setup mock
         mock_response = Mock()
-        mock_response.headers = {"content-length": "100"}
+        mock_response.headers = {"content-length": _MP3_LENGTH}
         mock_response.iter_content = Mock(return_value=[_MP3_HEADER + _MP3_PAD])
         mock_response.raise_for_status = Mock()
         mock_get.return_value = mock_response
@@ -591,7 +592,7 @@ class TestEdgeCases:
 
         # Setup mock
         mock_response = Mock()
-        mock_response.headers = {"content-length": "100"}
+        mock_response.headers = {"content-length": _MP3_LENGTH}
         mock_response.iter_content = Mock(return_value=[_MP3_HEADER + _MP3_PAD])
         mock_response.raise_for_status = Mock()
         mock_get.return_value = mock_response
@@ -0,0 +1,310 @@
+# Copyright 2025-2026 Thestill
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Resumable / range-based downloads in AudioDownloader.
+
+``requests.get`` is replaced by a tiny in-memory server that honours
+``Range`` / ``If-Range`` and can drop the connection part-way through a body,
+so the manifest + resume path is exercised end to end without the network.
+"""
+
+import json
+import os
+import threading
+import time
+from pathlib import Path
+from typing import Dict, List, Optional
+from unittest.mock import Mock
+
+import pytest
+import requests
+
+from thestill.core.audio_downloader import AudioDownloader, DownloadError
+
+URL = "https://cdn.example.com/show/episode.mp3"
+PAYLOAD = b"ID3\x04\x00\x00\x00\x00\x00\x00" + bytes(range(256)) * 40  # ~10 KB
+
+
+class FakeRangeServer:
+    """Callable stand-in for ``requests.get`` serving one static body."""
+
+    def __init__(self, body: bytes, *, etag: str = '"v1"', accept_ranges: bool = True) -> None:
+        self.body = body
+        self.etag = etag
+        self.accept_ranges = accept_ranges
+        # Number of body bytes to deliver before raising, per request index.
+        self.drop_after: Dict[int, int] = {}
+        # Number of body bytes after which the body ends cleanly (short of
+        # the advertised length), per request index.
+        self.end_after: Dict[int, int] = {}
+        self.requests: List[Dict[str, str]] = []
+        self._lock = threading.Lock()
+
+    def __call__(self, url, headers=None, **kwargs):
+        headers = dict(headers or {})
+        with self._lock:
+            index = len(self.requests)
+            self.requests.append(headers)
+        status, data, response_headers = (
+            200,
+            self.body,
+            {
+                "content-length": str(len(self.body)),
+                "etag": self.etag,
+            },
+        )
+        if self.accept_ranges:
+            response_headers["accept-ranges"] = "bytes"
+        range_header = headers.get("Range")
+        if range_header and self.accept_ranges and headers.get("If-Range", self.etag) == self.etag:
+            first, last = range_header.split("=", 1)[1].split("-")
+            first, last = int(first), int(last)
+            data = self.body[first : last + 1]
+            status = 206
+            response_headers["content-length"] = str(len(data))
+            response_headers["content-range"] = f"bytes {first}-{last}/{len(self.body)}"
+        if index in self.end_after:
+            data = data[: self.end_after[index]]
+        return self._response(status, data, response_headers, self.drop_after.get(index))
+
+    @staticmethod
+    def _response(status: int, data: bytes, headers: Dict[str, str], drop_after: Optional[int]):
+        def iter_content(chunk_size=8192):
+            sent = 0
+            for offset in range(0, len(data), 1000):
+                chunk = data[offset : offset + 1000]
+                if drop_after is not None and sent + len(chunk) > drop_after:
+                    yield chunk[: drop_after - sent]
+                    raise requests.exceptions.ConnectionError("connection reset by peer")
+                sent += len(chunk)
+                yield chunk
+
+        response = Mock()
+        response.status_code = status
+        response.headers = headers
+        response.iter_content = iter_content
+        response.raise_for_status = Mock()
+        return response
+
+
+@pytest.fixture(autouse=True)
+def _public_dns(monkeypatch):
+    # The SSRF guard resolves every hop; pin it to a public address so the
+    # tests do not depend on DNS in the sandbox.
+    monkeypatch.setattr("thestill.utils.url_guard._resolve", lambda host: ("93.184.216.34",))
+
+
+@pytest.fixture(autouse=True)
+def _no_retry_sleep(monkeypatch):
+    monkeypatch.setattr(AudioDownloader._download_with_retry.retry, "sleep", lambda seconds: None)
+
+
+@pytest.fixture
+def server(monkeypatch):
+    fake = FakeRangeServer(PAYLOAD)
+    monkeypatch.setattr("thestill.core.audio_downloader.requests.get", fake)
+    return fake
+
+
+def _paths(tmp_path: Path):
+    local = tmp_path / "audio" / "show" / "episode.mp3"
+    local.parent.mkdir(parents=True)
+    part = tmp_path / "partial" / "show" / "episode.mp3.part"
+    return local, part, part.with_name(part.name + ".json")
+
+
+class TestResume:
+    def test_dropped_connection_resumes_with_range(self, tmp_path, server):
+        server.drop_after = {0: 4000}
+        local, part, manifest = _paths(tmp_path)
+        downloader = AudioDownloader(str(tmp_path / "audio"), partial_dir=str(tmp_path / "partial"))
+
+        downloader._download_with_retry(URL, local)
+
+        assert local.read_bytes() == PAYLOAD
+        assert len(server.requests) == 2
+        assert server.requests[1]["Range"] == f"bytes=4000-{len(PAYLOAD) - 1}"
+        assert server.requests[1]["If-Range"] == '"v1"'
+        assert not part.exists() and not manifest.exists()
+
+    def test_partial_survives_exhausted_retries_for_next_attempt(self, tmp_path, server):
+        server.drop_after = {0: 3000, 1: 1000, 2: 1000}
+        local, part, manifest = _paths(tmp_path)
+        downloader = AudioDownloader(str(tmp_path / "audio"), partial_dir=str(tmp_path / "partial"))
+
+        with pytest.raises(requests.exceptions.ConnectionError):
+            downloader._download_with_retry(URL, local)
+
+        assert not local.exists()
+        assert json.loads(manifest.read_text())["segments"][0]["written"] == 5000
+
+        # A later task retry (fresh downloader, same partial_dir) only
+        # fetches the missing tail.
+        AudioDownloader(str(tmp_path / "audio"), partial_dir=str(tmp_path / "partial"))._download_with_retry(URL, local)
+        assert local.read_bytes() == PAYLOAD
+        assert server.requests[-1]["Range"] == f"bytes=5000-{len(PAYLOAD) - 1}"
+
+    def test_changed_resource_restarts_from_zero(self, tmp_path, server):
+        server.drop_after = {0: 3000, 1: 0, 2: 0}
+        local, part, manifest = _paths(tmp_path)
+        downloader = AudioDownloader(str(tmp_path / "audio"), partial_dir=str(tmp_path / "partial"))
+        with pytest.raises(requests.exceptions.ConnectionError):
+            downloader._download_with_retry(URL, local)
+
+        # New enclosure behind the same URL: If-Range no longer matches, the
+        # server answers 200 and the stale bytes must not be stitched in.
+        server.etag = '"v2"'
+        server.body = b"ID3" + bytes(reversed(PAYLOAD[3:]))
+        server.drop_after = {}
+        downloader._download_with_retry(URL, local)
+
+        assert local.read_bytes() == server.body
+
+    def test_non_ranged_server_discards_partial(self, tmp_path, server):
+        server.accept_ranges = False
+        server.drop_after = {0: 3000, 1: 3000, 2: 3000}
+        local, part, manifest = _paths(tmp_path)
+        downloader = AudioDownloader(str(tmp_path / "audio"), partial_dir=str(tmp_path / "partial"))
+
+        with pytest.raises(requests.exceptions.ConnectionError):
+            downloader._download_with_retry(URL, local)
+
+        assert not part.exists() and not manifest.exists()
+        assert all("Range" not in headers for headers in server.requests)
+
+    def test_short_body_is_resumed_not_promoted(self, tmp_path, server):
+        server.end_after = {0: 4000}
+        local, part, manifest = _paths(tmp_path)
+        downloader = AudioDownloader(str(tmp_path / "audio"), partial_dir=str(tmp_path / "partial"))
+
+        downloader._download_with_retry(URL, local)
+
+        assert local.read_bytes() == PAYLOAD
+        assert server.requests[1]["Range"] == f"bytes=4000-{len(PAYLOAD) - 1}"
+
+    def test_short_body_without_ranges_is_not_promoted(self, tmp_path, server):
+        server.accept_ranges = False
+        server.end_after = {0: 4000, 1: 4000, 2: 4000}
+        local, part, manifest = _paths(tmp_path)
+        downloader = AudioDownloader(str(tmp_path / "audio"), partial_dir=str(tmp_path / "partial"))
+
+        with pytest.raises(requests.exceptions.ChunkedEncodingError):
+            downloader._download_with_retry(URL, local)
+
+        assert not local.exists() and not part.exists()
+
+    def test_abandoned_partials_are_swept(self, tmp_path):
+        old = tmp_path / "partial" / "gone" / "episode.mp3.part"
+        old.parent.mkdir(parents=True)
+        old.write_bytes(b"stale")
+        old.with_name(old.name + ".json").write_text("{}")
+        stale = time.time() - AudioDownloader._PARTIAL_MAX_AGE_SECONDS - 60
+        for path in old.parent.iterdir():
+            os.utime(path, (stale, stale))
+        fresh = tmp_path / "partial" / "show" / "episode.mp3.part"
+        fresh.parent.mkdir(parents=True)
+        fresh.write_bytes(b"resumable")
+
+        AudioDownloader(str(tmp_path / "audio"), partial_dir=str(tmp_path / "partial"))
+
+        assert not old.parent.exists()
+        assert fresh.read_bytes() == b"resumable"
+
+    def test_foreign_manifest_is_ignored(self, tmp_path, server):
+        local, part, manifest = _paths(tmp_path)
+        part.parent.mkdir(parents=True)
+        part.write_bytes(b"junk")
+        manifest.write_text(json.dumps({"url": "https://other.example.com/x.mp3"}))
+        downloader = AudioDownloader(str(tmp_path / "audio"), partial_dir=str(tmp_path / "partial"))
+
+        downloader._download_with_retry(URL, local)
+
+        assert local.read_bytes() == PAYLOAD
+        assert "Range" not in server.requests[0]
+
+
+class TestParallelRanges:
+    def test_large_file_is_split_and_stitched(self, tmp_path, server):
+        local, part, manifest = _paths(tmp_path)
+        downloader = AudioDownloader(
+            str(tmp_path / "audio"),
+            parallel_ranges=4,
+            parallel_min_bytes=1024,
+            partial_dir=str(tmp_path / "partial"),
+        )
+
+        downloader._download_with_retry(URL, local)
+
+        assert local.read_bytes() == PAYLOAD
+        ranges = sorted(headers["Range"] for headers in server.requests if "Range" in headers)
+        assert len(ranges) == 3  # first range rides on the initial GET
+
+    def test_failed_range_is_resumed(self, tmp_path, server):
+        server.drop_after = {2: 500}
+        local, part, manifest = _paths(tmp_path)
+        downloader = AudioDownloader(
+            str(tmp_path / "audio"),
+            parallel_ranges=3,
+            parallel_min_bytes=1024,
+            partial_dir=str(tmp_path / "partial"),
+        )
+
+        downloader._download_with_retry(URL, local)
+
+        assert local.read_bytes() == PAYLOAD
+
+    def test_small_file_uses_single_stream(self, tmp_path, server):
+        local, _, _ = _paths(tmp_path)
+        downloader = AudioDownloader(str(tmp_path / "audio"), parallel_ranges=4, partial_dir=str(tmp_path / "p"))
+
+        downloader._download_with_retry(URL, local)
+
+        assert len(server.requests) == 1
+
+
+class TestGuardsStillApply:
+    def test_cap_enforced_on_advertised_length(self, tmp_path, server):
+        local, part, manifest = _paths(tmp_path)
+        downloader = AudioDownloader(str(tmp_path / "audio"), max_bytes=1000, partial_dir=str(tmp_path / "partial"))
+
+        with pytest.raises(DownloadError, match="cap"):
+            downloader._download_with_retry(URL, local)
+        assert not local.exists() and not part.exists() and not manifest.exists()
+
+    def test_integrity_check_rejects_html(self, tmp_path, monkeypatch):
+        fake = FakeRangeServer(b"<html>" + b"x" * 200)
+        monkeypatch.setattr("thestill.core.audio_downloader.requests.get", fake)
+        local, _, _ = _paths(tmp_path)
+        downloader = AudioDownloader(str(tmp_path / "audio"), partial_dir=str(tmp_path / "partial"))
+
+        with pytest.raises(DownloadError, match="integrity"):
+            downloader._download_with_retry(URL, local)
+        assert not local.exists()
+
+    def test_range_requests_go_through_ssrf_guard(self, tmp_path, server, monkeypatch):
+        server.drop_after = {0: 3000}
+        local, _, _ = _paths(tmp_path)
+        resolved: List[str] = []
+
+        def resolve(host):
+            resolved.append(host)
+            return ("93.184.216.34",) if len(resolved) == 1 else ("169.254.169.254",)
+
+        monkeypatch.setattr("thestill.utils.url_guard._resolve", resolve)
+        downloader = AudioDownloader(str(tmp_path / "audio"), partial_dir=str(tmp_path / "partial"))
+
+        # The resume hop now resolves to the metadata service and is refused.
+        with pytest.raises(DownloadError, match="unsafe URL"):
+            downloader._download_with_retry(URL, local)
+        assert len(server.requests) == 1
@@ -0,0 +1,145 @@
+# Copyright 2025-2026 Thestill
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Unit tests for the streaming ffmpeg downsample in AudioPreprocessor.
+
+A tiny shell script stands in for ffmpeg on PATH so the real subprocess /
+``wait4`` plumbing is exercised without needing the binary in CI.
+"""
+
+import os
+import stat
+import sys
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from thestill.core.audio_preprocessor import AudioPreprocessor
+
+pytestmark = pytest.mark.skipif(sys.platform == "win32", reason="fake ffmpeg is a POSIX shell script")
+
+# Writes a fixed payload to the last argv entry (the output path) and records
+# its argv, mimicking a successful conversion.
+_FAKE_FFMPEG_OK = """#!/bin/sh
+for last; do :; done
+printf '%s\\n' "$@" > "$(dirname "$last")/argv.txt"
+printf 'RIFFfakewav' > "$last"
+"""
+
+# Writes a partial file then fails, like a decode error mid-stream.
+_FAKE_FFMPEG_FAIL = """#!/bin/sh
+for last; do :; done
+printf 'partial' > "$last"
+echo "Invalid data found when processing input" >&2
+exit 1
+"""
+
+
+def _install_fake_ffmpeg(bin_dir: Path, body: str) -> None:
+    bin_dir.mkdir(parents=True, exist_ok=True)
+    for name in ("ffmpeg", "ffprobe"):
+        script = bin_dir / name
+        script.write_text(body)
+        script.chmod(script.stat().st_mode | stat.S_IEXEC)
+
+
+@pytest.fixture
+def input_audio(tmp_path):
+    path = tmp_path / "in" / "episode.mp3"
+    path.parent.mkdir()
+    path.write_bytes(b"ID3" + b"\x00" * 1024)
+    return path
+
+
+@pytest.fixture
+def fake_ffmpeg(tmp_path, monkeypatch):
+    def install(body: str) -> None:
+        bin_dir = tmp_path / "bin"
+        _install_fake_ffmpeg(bin_dir, body)
+        monkeypatch.setenv("PATH", str(bin_dir) + os.pathsep + os.environ.get("PATH", ""))
+
+    return install
+
+
+class TestStreamingDownsample:
+    def test_writes_wav_and_records_stats(self, tmp_path, input_audio, fake_ffmpeg):
+        fake_ffmpeg(_FAKE_FFMPEG_OK)
+        out_dir = tmp_path / "out"
+        preprocessor = AudioPreprocessor()
+
+        result = preprocessor.downsample_audio(str(input_audio), str(out_dir))
+
+        assert result == str(out_dir / "episode.wav")
+        assert Path(result).read_bytes() == b"RIFFfakewav"
+        assert not (out_dir / "episode.wav.part").exists()
+
+        stats = preprocessor.last_downsample_stats
+        assert stats is not None
+        assert stats.skipped is False
+        assert stats.input_bytes == input_audio.stat().st_size
+        assert stats.output_bytes == len(b"RIFFfakewav")
+        assert stats.wall_seconds >= 0
+        if hasattr(os, "wait4"):
+            assert stats.peak_rss_bytes and stats.peak_rss_bytes > 0
+
+    def test_command_targets_16k_mono_s16(self, tmp_path, input_audio, fake_ffmpeg):
+        fake_ffmpeg(_FAKE_FFMPEG_OK)
+        out_dir = tmp_path / "out"
+
+        AudioPreprocessor().downsample_audio(str(input_audio), str(out_dir))
+
+        argv = (out_dir / "argv.txt").read_text().split("\n")
+        assert argv[argv.index("-ar") + 1] == "16000"
+        assert argv[argv.index("-ac") + 1] == "1"
+        assert argv[argv.index("-sample_fmt") + 1] == "s16"
+        assert argv[argv.index("-i") + 1] == str(input_audio)
+
+    def test_skips_existing_output_without_running_ffmpeg(self, tmp_path, input_audio):
+        out_dir = tmp_path / "out"
+        out_dir.mkdir()
+        existing = out_dir / "episode.wav"
+        existing.write_bytes(b"already")
+        preprocessor = AudioPreprocessor()
+
+        with patch("thestill.core.audio_preprocessor.subprocess.Popen") as popen:
+            result = preprocessor.downsample_audio(str(input_audio), str(out_dir))
+
+        assert result == str(existing)
+        popen.assert_not_called()
+        assert preprocessor.last_downsample_stats.skipped is True
+
+    def test_ffmpeg_failure_raises_and_leaves_no_partial_output(self, tmp_path, input_audio, fake_ffmpeg):
+        fake_ffmpeg(_FAKE_FFMPEG_FAIL)
+        out_dir = tmp_path / "out"
+
+        with pytest.raises(RuntimeError, match="Invalid data found"):
+            AudioPreprocessor().downsample_audio(str(input_audio), str(out_dir))
+
+        # Neither the final WAV (would satisfy skip-if-exists next time) nor
+        # the temp file may survive a failed conversion.
+        assert not (out_dir / "episode.wav").exists()
+        assert not (out_dir / "episode.wav.part").exists()
+
+    def test_missing_input_raises_file_not_found(self, tmp_path):
+        with pytest.raises(FileNotFoundError):
+            AudioPreprocessor().downsample_audio(str(tmp_path / "missing.mp3"), str(tmp_path / "out"))
+
+    def test_missing_ffmpeg_raises_file_not_found(self, tmp_path, input_audio):
+        with (
+            patch("thestill.core.audio_preprocessor.ensure_ffmpeg_on_path"),
+            patch("thestill.core.audio_preprocessor.shutil.which", return_value=None),
+        ):
+            with pytest.raises(FileNotFoundError, match="ffmpeg"):
+                AudioPreprocessor().downsample_audio(str(input_audio), str(tmp_path / "out"))
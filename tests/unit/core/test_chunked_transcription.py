@@ -0,0 +1,333 @@
+# Copyright 2025-2026 Thestill
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Silence-chunked parallel transcription: planning, stitching, fallback.
+
+Synthetic 16 kHz WAVs (noise bursts separated by silent gaps) drive the
+planner; a thread pool and a fake per-worker transcriber stand in for the
+spawn process pool so no model is needed.
+"""
+
+import threading
+import wave
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+from thestill.core import chunked_transcription
+from thestill.core.chunked_transcription import (
+    AudioChunk,
+    plan_chunks,
+    stitch_chunks,
+    transcribe_in_chunks,
+    write_chunk_wavs,
+)
+from thestill.models.transcript import Segment, Transcript, Word
+
+RATE = 16000
+
+
+def _write_wav(path: Path, pieces) -> Path:
+    """``pieces`` is a list of (seconds, loud) spans."""
+    rng = np.random.default_rng(7)
+    samples = []
+    for seconds, loud in pieces:
+        n = int(seconds * RATE)
+        samples.append((rng.normal(0, 6000, n) if loud else rng.normal(0, 20, n)).astype("<i2"))
+    with wave.open(str(path), "wb") as wav:
+        wav.setnchannels(1)
+        wav.setsampwidth(2)
+        wav.setframerate(RATE)
+        wav.writeframes(np.concatenate(samples).tobytes())
+    return path
+
+
+def _transcript(segments, model="base") -> Transcript:
+    return Transcript(
+        audio_file="chunk.wav",
+        language="en",
+        text=" ".join(s.text for s in segments),
+        segments=segments,
+        processing_time=1.0,
+        model_used=model,
+        timestamp=0.0,
+    )
+
+
+def _segment(i, words) -> Segment:
+    return Segment(
+        id=i,
+        start=words[0][1],
+        end=words[-1][1] + 0.3,
+        text=" ".join(w for w, _ in words),
+        words=[Word(word=w, start=t, end=t + 0.3) for w, t in words],
+    )
+
+
+class TestPlanChunks:
+    def test_cuts_land_in_pauses_without_overlap(self, tmp_path):
+        # Pauses at 55-56s and 115-116s; target 60s.
+        wav = _write_wav(tmp_path / "a.wav", [(55, True), (1, False), (59, True), (1, False), (64, True)])
+
+        chunks = plan_chunks(str(wav), 60)
+
+        assert len(chunks) == 3
+        assert 55 <= chunks[1].own_start <= 56
+        assert 115 <= chunks[2].own_start <= 116
+        assert all(c.start == c.own_start and c.end == c.own_end for c in chunks)
+        assert chunks[-1].end == pytest.approx(180, abs=0.01)
+
+    def test_no_pause_means_hard_cut_with_overlap(self, tmp_path):
+        wav = _write_wav(tmp_path / "b.wav", [(130, True)])
+
+        first, second = plan_chunks(str(wav), 65, overlap_seconds=1.0)
+
+        assert first.own_end == second.own_start
+        assert first.end == pytest.approx(first.own_end + 1.0)
+        assert second.start == pytest.approx(second.own_start - 1.0)
+
+    def test_short_audio_is_one_chunk(self, tmp_path):
+        wav = _write_wav(tmp_path / "c.wav", [(20, True)])
+        assert plan_chunks(str(wav), 60) == [AudioChunk(0, 0.0, 20.0, 0.0, 20.0)]
+
+    def test_chunk_wavs_have_the_planned_length(self, tmp_path):
+        wav = _write_wav(tmp_path / "d.wav", [(10, True)])
+        chunks = [AudioChunk(0, 0.0, 4.0, 0.0, 4.0), AudioChunk(1, 3.5, 10.0, 4.0, 10.0)]
+
+        paths = write_chunk_wavs(str(wav), chunks, tmp_path)
+
+        with wave.open(paths[1], "rb") as out:
+            assert out.getnframes() == int(6.5 * RATE)
+
+
+class TestStitch:
+    def test_offsets_ownership_and_overlap_dedup(self):
+        left = AudioChunk(0, 0.0, 61.0, 0.0, 60.0)
+        right = AudioChunk(1, 59.0, 120.0, 60.0, 120.0)
+        # Left hears "big" past its cut (60s), which the right chunk owns.
+        left_t = _transcript([_segment(0, [("hello", 1.0), ("there", 58.0), ("world", 59.8), ("big", 60.3)])])
+        # Right re-hears "world" in the overlap (59 + 0.5 = 59.5s, not owned), then again
+        # just after the cut (59 + 1.1 = 60.1s) — a boundary duplicate of the left's word.
+        right_t = _transcript([_segment(0, [("world", 0.5), ("World", 1.1), ("big", 1.3), ("again", 3.0)])])
+
+        merged = stitch_chunks(
+            [(right, right_t), (left, left_t)], audio_file="ep.wav", language="en", processing_time=2
+        )
+
+        words = [(w.word, round(w.start, 1)) for s in merged.segments for w in s.words]
+        assert words == [("hello", 1.0), ("there", 58.0), ("world", 59.8), ("big", 60.3), ("again", 62.0)]
+        assert [s.id for s in merged.segments] == [0, 1]
+        assert merged.text == "hello there world big again"
+        assert merged.provider_metadata == {"chunks": 2}
+
+    def test_segments_without_words_use_segment_start(self):
+        left = AudioChunk(0, 0.0, 30.0, 0.0, 30.0)
+        right = AudioChunk(1, 30.0, 60.0, 30.0, 60.0)
+        bare = Segment(id=0, start=2.0, end=5.0, text="no words")
+
+        merged = stitch_chunks(
+            [(left, _transcript([bare])), (right, _transcript([bare]))],
+            audio_file="ep.wav",
+            language="en",
+            processing_time=1,
+        )
+
+        assert [s.start for s in merged.segments] == [2.0, 32.0]
+
+
+class _FakeChunkTranscriber:
+    def __init__(self, fail_on=None):
+        self.fail_on = fail_on
+
+    def transcribe_audio(self, path, output_path=None, *, options):
+        with wave.open(path, "rb") as wav:
+            seconds = wav.getnframes() / RATE
+        if self.fail_on and self.fail_on in path:
+            return None
+        name = Path(path).stem
+        return _transcript([_segment(0, [(name, 0.1), ("end", seconds - 0.5)])])
+
+
+class TestTranscribeInChunks:
+    @pytest.fixture
+    def long_wav(self, tmp_path):
+        return _write_wav(tmp_path / "ep.wav", [(70, True), (1, False), (70, True), (1, False), (70, True)])
+
+    def test_parallel_chunks_are_stitched_in_order(self, long_wav, monkeypatch):
+        monkeypatch.setattr(chunked_transcription, "_build_worker_transcriber", lambda spec: _FakeChunkTranscriber())
+        monkeypatch.setattr(chunked_transcription, "_worker_transcriber", None)
+        updates = []
+
+        with ThreadPoolExecutor(max_workers=3) as pool:
+            transcript = transcribe_in_chunks(
+                str(long_wav),
+                provider="whisper",
+                model_name="base",
+                device="cpu",
+                workers=3,
+                chunk_seconds=300,
+                language="en",
+                progress_callback=updates.append,
+                executor=pool,
+            )
+
+        assert transcript is not None
+        assert [w.word for s in transcript.segments for w in s.words][::2] == ["chunk_0000", "chunk_0001", "chunk_0002"]
+        starts = [s.start for s in transcript.segments]
+        assert starts == sorted(starts)
+        assert [u.progress_pct for u in updates][-1] == 95
+
+    def test_failed_chunk_falls_back_to_none(self, long_wav, monkeypatch):
+        monkeypatch.setattr(
+            chunked_transcription, "_build_worker_transcriber", lambda spec: _FakeChunkTranscriber("chunk_0001")
+        )
+        monkeypatch.setattr(chunked_transcription, "_worker_transcriber", None)
+
+        with ThreadPoolExecutor(max_workers=2) as pool:
+            result = transcribe_in_chunks(
+                str(long_wav),
+                provider="whisper",
+                model_name="base",
+                device="cpu",
+                workers=3,
+                chunk_seconds=300,
+                language="en",
+                executor=pool,
+            )
+
+        assert result is None
+
+    def test_overlapping_episodes_share_one_executor(self, long_wav, tmp_path, monkeypatch):
+        short_wav = _write_wav(tmp_path / "short.wav", [(70, True), (1, False), (70, True)])
+        created = []
+
+        def thread_pool(max_workers, **_kwargs):
+            created.append(ThreadPoolExecutor(max_workers=max_workers))
+            return created[-1]
+
+        monkeypatch.setattr(chunked_transcription, "ProcessPoolExecutor", thread_pool)
+        monkeypatch.setattr(chunked_transcription, "_executors", {})
+        monkeypatch.setattr(chunked_transcription, "_executor_users", {})
+        monkeypatch.setattr(chunked_transcription, "_worker_transcriber", None)
+        both_running = threading.Barrier(2)
+
+        class _OverlappingTranscriber(_FakeChunkTranscriber):
+            def transcribe_audio(self, path, output_path=None, *, options):
+                if Path(path).stem == "chunk_0000":
+                    both_running.wait(5)  # each episode's first chunk waits for the other's
+                return super().transcribe_audio(path, output_path, options=options)
+
+        monkeypatch.setattr(chunked_transcription, "_build_worker_transcriber", lambda spec: _OverlappingTranscriber())
+        results = {}
+
+        def episode(wav):
+            results[wav.name] = transcribe_in_chunks(
+                str(wav),
+                provider="whisper",
+                model_name="base",
+                device="cpu",
+                workers=4,
+                chunk_seconds=300,
+                language="en",
+            )
+
+        threads = [threading.Thread(target=episode, args=(wav,)) for wav in (long_wav, short_wav)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join(10)
+
+        try:
+            assert len(plan_chunks(str(long_wav), 60)) != len(plan_chunks(str(short_wav), 60))
+            assert results["ep.wav"] is not None and results["short.wav"] is not None
+            assert len(created) == 1
+            assert chunked_transcription._executor_users == {}
+            assert created[0].submit(int, 7).result() == 7  # still up for the next episode
+        finally:
+            created[0].shutdown()
+
+    def test_non_wav_input_is_skipped(self, tmp_path):
+        mp3 = tmp_path / "ep.mp3"
+        mp3.write_bytes(b"ID3" + b"\x00" * 100)
+        result = transcribe_in_chunks(
+            str(mp3), provider="whisper", model_name="base", device="cpu", workers=4, chunk_seconds=300, language="en"
+        )
+        assert result is None
+
+
+class TestTranscriberIntegration:
+    def test_whisper_uses_chunks_on_cpu_and_falls_back_when_declined(self, monkeypatch, tmp_path):
+        import sys
+        from types import ModuleType
+
+        from thestill.core.model_pool import ModelPool
+        from thestill.core.whisper_transcriber import WhisperTranscriber
+        from thestill.models.transcription import TranscribeOptions
+
+        loads = []
+
+        class _Model:
+            def transcribe(self, path, **_kwargs):
+                return {"text": "single", "segments": [], "language": "en"}
+
+        fake_whisper = ModuleType("whisper")
+        fake_whisper.load_model = lambda name, device: loads.append(name) or _Model()
+        monkeypatch.setitem(sys.modules, "whisper", fake_whisper)
+        monkeypatch.setattr(WhisperTranscriber, "_get_audio_duration_minutes", lambda self, path: 1.0)
+        calls = []
+        chunked = _transcript([_segment(0, [("chunked", 0.1)])])
+        results = iter([chunked, None])
+        monkeypatch.setattr(
+            chunked_transcription, "transcribe_in_chunks", lambda path, **kw: calls.append(kw) or next(results)
+        )
+        audio = tmp_path / "a.wav"
+        audio.write_bytes(b"RIFF")
+        transcriber = WhisperTranscriber("base", "cpu", model_pool=ModelPool(), chunk_workers=4, chunk_seconds=120)
+        options = TranscribeOptions(language="en")
+
+        assert transcriber.transcribe_audio(str(audio), options=options) is chunked
+        assert loads == []  # parent process never loads the model on the chunked path
+        assert transcriber.transcribe_audio(str(audio), options=options).text == "single"
+        assert loads == ["base"]
+        assert calls[0]["workers"] == 4 and calls[0]["chunk_seconds"] == 120
+
+    def test_chunked_path_reports_progress_to_the_transcribers_callback(self, monkeypatch, tmp_path):
+        from contextlib import contextmanager
+
+        from thestill.core.model_pool import ModelPool
+        from thestill.core.progress import TranscriptionStage
+        from thestill.core.whisper_transcriber import WhisperTranscriber
+        from thestill.models.transcription import TranscribeOptions
+
+        @contextmanager
+        def thread_pool(workers, threads):
+            with ThreadPoolExecutor(max_workers=workers) as pool:
+                yield pool
+
+        monkeypatch.setattr(chunked_transcription, "_lease_executor", thread_pool)
+        monkeypatch.setattr(chunked_transcription, "_build_worker_transcriber", lambda spec: _FakeChunkTranscriber())
+        monkeypatch.setattr(chunked_transcription, "_worker_transcriber", None)
+        audio = _write_wav(tmp_path / "ep.wav", [(70, True), (1, False), (70, True), (1, False), (70, True)])
+        updates = []
+        transcriber = WhisperTranscriber(
+            "base", "cpu", model_pool=ModelPool(), chunk_workers=3, progress_callback=updates.append
+        )
+
+        transcript = transcriber.transcribe_audio(str(audio), options=TranscribeOptions(language="en"))
+
+        assert transcript is not None
+        assert updates and all(u.stage == TranscriptionStage.TRANSCRIBING for u in updates)
+        assert updates[-1].progress_pct == 95
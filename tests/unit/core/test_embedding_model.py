@@ -15,10 +15,23 @@ import pytest
 
 np = pytest.importorskip("numpy", reason="numpy required for embedding tests")
 
-from thestill.core.embedding_model import EmbeddingModel
+from thestill.core.embedding_model import (
+    EmbeddingModel,
+    QueryEmbeddingCache,
+    get_query_embedding_cache,
+    normalise_query,
+)
 from thestill.search.base import DEFAULT_EMBEDDING_MODEL
 
 
+@pytest.fixture(autouse=True)
+def _fresh_query_cache():
+    """The default query cache is process-wide; keep tests independent."""
+    get_query_embedding_cache().clear()
+    yield
+    get_query_embedding_cache().clear()
+
+
 @pytest.fixture
 def stub_sentence_transformers(monkeypatch):
     """Inject a fake ``sentence_transformers`` module that returns
@@ -72,3 +85,73 @@ class TestEmbeddingModel:
         blobs = model.encode_batch(["a", "b", "c"])
         assert len(blobs) == 3
         assert all(len(b) == 384 * 4 for b in blobs)
+
+    def test_packing_is_little_endian_float32(self, stub_sentence_transformers):
+        _, inst = stub_sentence_transformers
+        vec = np.linspace(-1, 1, 384, dtype=np.float64)
+        inst.encode.return_value = np.array([vec])
+        model = EmbeddingModel(DEFAULT_EMBEDDING_MODEL)
+        blob = model.encode_one("hello")
+        np.testing.assert_array_equal(np.frombuffer(blob, dtype="<f4"), vec.astype("<f4"))
+
+    def test_wrong_dim_rejected(self, stub_sentence_transformers):
+        _, inst = stub_sentence_transformers
+        inst.encode.return_value = np.zeros((2, 12), dtype=np.float32)
+        model = EmbeddingModel(DEFAULT_EMBEDDING_MODEL)
+        with pytest.raises(ValueError, match="dim"):
+            model.encode_batch(["a", "b"])
+
+
+class TestQueryEmbeddingCache:
+    def test_repeat_query_skips_forward_pass(self, stub_sentence_transformers):
+        _, inst = stub_sentence_transformers
+        model = EmbeddingModel(DEFAULT_EMBEDDING_MODEL)
+        first = model.encode_one("elon musk")
+        second = model.encode_one("  elon   musk ")
+        assert first == second
+        assert inst.encode.call_count == 1
+        inst.encode.assert_called_once_with(["elon musk"], normalize_embeddings=True)
+        assert model.query_cache.stats.hits == 1
+
+    def test_shared_across_wrapper_instances(self, stub_sentence_transformers):
+        _, inst = stub_sentence_transformers
+        EmbeddingModel(DEFAULT_EMBEDDING_MODEL).encode_one("tesla")
+        EmbeddingModel(DEFAULT_EMBEDDING_MODEL).encode_one("tesla")
+        assert inst.encode.call_count == 1
+
+    def test_case_is_part_of_the_key(self):
+        assert normalise_query("Tesla") != normalise_query("tesla")
+
+    def test_lru_eviction(self):
+        cache = QueryEmbeddingCache(max_entries=2)
+        cache.put("m", "a", b"a")
+        cache.put("m", "b", b"b")
+        assert cache.get("m", "a") == b"a"  # refresh "a"
+        cache.put("m", "c", b"c")
+        assert cache.get("m", "b") is None
+        assert cache.get("m", "a") == b"a"
+        assert cache.stats.evictions == 1
+
+    def test_ttl_expiry(self):
+        now = [0.0]
+        cache = QueryEmbeddingCache(ttl_seconds=10, clock=lambda: now[0])
+        cache.put("m", "q", b"v")
+        now[0] = 9.9
+        assert cache.get("m", "q") == b"v"
+        now[0] = 10.0
+        assert cache.get("m", "q") is None
+        assert cache.stats.expirations == 1
+
+    def test_keyed_by_model(self):
+        cache = QueryEmbeddingCache()
+        cache.put("model-a", "q", b"a")
+        assert cache.get("model-b", "q") is None
+
+    def test_batch_encode_is_not_cached(self, stub_sentence_transformers):
+        _, inst = stub_sentence_transformers
+        inst.encode.return_value = np.zeros((1, 384), dtype=np.float32)
+        model = EmbeddingModel(DEFAULT_EMBEDDING_MODEL)
+        model.encode_batch(["a"])
+        model.encode_batch(["a"])
+        assert inst.encode.call_count == 2
+        assert len(model.query_cache) == 0
@@ -226,3 +226,24 @@ class TestImageFallback:
         e = _enricher(wd, wp).enrich(_person_record())
         assert e.image_url == "https://upload.wikimedia.org/X.jpg"
         assert e.image_attribution == "Wikipedia"
+
+
+class TestEnrichMany:
+    def test_matches_enrich_and_isolates_unexpected_errors(self):
+        labels = {"Q131524": "entrepreneur", "Q478214": "Tesla, Inc."}
+        wp = StubWikipedia(summary=WikipediaSummary(extract="Lead."))
+        no_qid = EntityRecord(id="person:nobody", type=EntityType.PERSON, canonical_name="Nobody")
+        batch = [_person_record(), no_qid]
+
+        outcomes = _enricher(StubWikidata(facts=_person_wd(), labels=labels), wp).enrich_many(batch, max_workers=3)
+        single = _enricher(StubWikidata(facts=_person_wd(), labels=labels), wp).enrich(_person_record())
+
+        assert [entity.id for entity, _, _ in outcomes] == [e.id for e in batch]
+        (_, person, person_err), (_, nobody, _) = outcomes
+        assert person_err is None
+        assert person.facts == single.facts and person.affiliations == single.affiliations
+        assert nobody.wikidata_status == EnrichmentStatus.EMPTY
+
+        broken = _enricher(StubWikidata(facts_exc=RuntimeError("bad payload")), wp).enrich_many(batch)
+        assert isinstance(broken[0][2], RuntimeError) and broken[0][1] is None
+        assert broken[1][2] is None
@@ -18,12 +18,15 @@ from __future__ import annotations
 from types import SimpleNamespace
 from typing import List
 
+import pytest
+
 from thestill.core.entity_resolver import (
     EntityResolver,
     _build_entity_id,
     _char_overlap,
     _is_plausible_alias,
     _pick_best_span,
+    surface_cache_key,
 )
 from thestill.models.entities import EntityMention, EntityType, ResolutionStatus
 
@@ -342,3 +345,146 @@ class TestP31Gating:
 
     def test_empty_string(self):
         assert _char_overlap("", "anything") == 0
+
+
+class _CountingReFinED(StubReFinED):
+    """Stub exposing ReFinED's ``process_text_batch`` and recording calls."""
+
+    def __init__(self, predictions=None, *, batch_fails: bool = False):
+        super().__init__(predictions)
+        self.batch_fails = batch_fails
+        self.batches: List[List[str]] = []
+        self.single_calls: List[str] = []
+
+    def process_text_batch(self, texts):
+        self.batches.append(list(texts))
+        if self.batch_fails:
+            raise RuntimeError("synthetic batch failure")
+        return [StubReFinED.process_text(self, text) for text in texts]
+
+    def process_text(self, text):
+        self.single_calls.append(text)
+        return super().process_text(text)
+
+
+class _DictSurfaceCache:
+    """In-memory stand-in for the repository's resolution-cache methods."""
+
+    def __init__(self, rows=None):
+        self.rows = dict(rows or {})
+        self.recorded: list[dict] = []
+
+    def lookup_surface_resolutions(self, keys):
+        return {key: self.rows[key] for key in keys if key in self.rows}
+
+    def record_surface_resolutions(self, observations):
+        self.recorded.extend(observations)
+
+
+def _cached_row(qid="Q317521", name="Elon Musk", entity_type="person", observations=3, conflicting=False):
+    return {
+        "wikidata_qid": qid,
+        "canonical_name": name,
+        "entity_type": entity_type,
+        "description": None,
+        "wikidata_instance_of": ["Q5"],
+        "observations": observations,
+        "conflicting": conflicting,
+    }
+
+
+class TestBatchedResolution:
+    def test_identical_pairs_share_one_inference(self):
+        model = _CountingReFinED()
+        excerpt = "Elon Musk and OpenAI again."
+        mentions = [
+            _mention(1, "Elon Musk", label="person", excerpt=excerpt),
+            _mention(2, "OpenAI", label="company", excerpt=excerpt),
+            _mention(3, "Elon Musk", label="person", excerpt=excerpt),
+        ]
+        results = EntityResolver(preloaded_model=model).resolve(mentions)
+
+        # One unique excerpt → one model pass, three results in order.
+        assert model.single_calls == [excerpt]
+        assert [r.mention_id for r in results] == [1, 2, 3]
+        assert [r.entity.wikidata_qid for r in results] == ["Q317521", "Q21708200", "Q317521"]
+
+    def test_unique_excerpts_are_batched(self):
+        model = _CountingReFinED()
+        mentions = [_mention(i, "Elon Musk", label="person", excerpt=f"Elon Musk, take {i}.") for i in range(5)]
+        results = EntityResolver(preloaded_model=model, batch_size=2).resolve(mentions)
+
+        assert [len(batch) for batch in model.batches] == [2, 2]
+        assert model.single_calls == ["Elon Musk, take 4."]  # trailing batch of one
+        assert all(r.status == "resolved" for r in results)
+
+    def test_failed_batch_falls_back_to_per_text(self):
+        model = _CountingReFinED(batch_fails=True)
+        mentions = [_mention(1, "Elon Musk", excerpt="Elon Musk here."), _mention(2, "OpenAI", excerpt="OpenAI there.")]
+        results = EntityResolver(preloaded_model=model).resolve(mentions)
+
+        assert len(model.batches) == 1
+        assert sorted(model.single_calls) == ["Elon Musk here.", "OpenAI there."]
+        assert [r.status for r in results] == ["resolved", "resolved"]
+
+    def test_p31_fetched_once_per_qid(self):
+        client = _StubP31Client({"Q317521": ["Q5"]})
+        resolver = EntityResolver(preloaded_model=StubReFinED(), wikidata_client=client)
+        resolver.resolve([_mention(i, "Elon Musk", label="person", excerpt=f"Elon Musk #{i}") for i in range(3)])
+        assert client.calls == ["Q317521"]
+
+    def test_rejects_non_positive_batch_size(self):
+        with pytest.raises(ValueError):
+            EntityResolver(preloaded_model=StubReFinED(), batch_size=0)
+
+
+class TestSurfaceCache:
+    def test_trusted_hit_skips_the_model(self):
+        model = _CountingReFinED()
+        cache = _DictSurfaceCache({("elon musk", "person"): _cached_row()})
+        mention = _mention(1, "Elon  Musk", label="person", excerpt="no model should see this")
+
+        results = EntityResolver(preloaded_model=model).resolve([mention], surface_cache=cache)
+
+        assert model.single_calls == [] and model.batches == []
+        assert results[0].status == "resolved"
+        assert results[0].entity.id == "person:elon-musk"
+        assert results[0].entity.wikidata_instance_of == ["Q5"]
+        assert cache.recorded == []
+
+    def test_untrusted_rows_fall_through_to_the_model(self):
+        model = _CountingReFinED()
+        cache = _DictSurfaceCache(
+            {
+                ("elon musk", "person"): _cached_row(observations=1),
+                ("openai", "company"): _cached_row(qid="Q1", name="Other", conflicting=True),
+            }
+        )
+        mentions = [_mention(1, "Elon Musk", label="person"), _mention(2, "OpenAI", label="company")]
+
+        results = EntityResolver(preloaded_model=model).resolve(mentions, surface_cache=cache)
+
+        assert len(model.single_calls) + sum(len(b) for b in model.batches) == 2
+        assert [r.entity.wikidata_qid for r in results] == ["Q317521", "Q21708200"]
+        assert {o["surface_key"] for o in cache.recorded} == {"elon musk", "openai"}
+
+    def test_blacklisted_cached_qid_goes_back_through_the_model(self):
+        model = _CountingReFinED({"Elon Musk": ("Q42", "Someone", "PER")})
+        cache = _DictSurfaceCache({("elon musk", "person"): _cached_row()})
+
+        results = EntityResolver(preloaded_model=model).resolve(
+            [_mention(1, "Elon Musk", label="person")],
+            surface_cache=cache,
+            is_blacklisted=lambda surface, qid: qid == "Q317521",
+        )
+
+        assert results[0].entity.wikidata_qid == "Q42"
+
+    def test_unresolvable_outcomes_are_not_recorded(self):
+        cache = _DictSurfaceCache()
+        _resolver().resolve([_mention(1, "GibberishCorp", label="company")], surface_cache=cache)
+        assert cache.recorded == []
+
+    def test_cache_key_folds_case_whitespace_and_label(self):
+        assert surface_cache_key(_mention(1, " Elon\tMUSK ", label="Person")) == ("elon musk", "person")
+        assert surface_cache_key(_mention(1, "Mercury")) == ("mercury", "")
@@ -0,0 +1,268 @@
+# Copyright 2025-2026 Thestill
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Single-pass feed scan: parity with the multi-parse extractors and early stop.
+
+The ``tests/fixtures/feeds/*.expected.json`` snapshots were recorded from the
+ElementTree + full-feedparser extractors the scan replaced. Each fixture must
+still produce the same metadata, per-episode maps and episodes, whether the
+whole feed is parsed or only the new-episode window.
+"""
+
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, HTTPServer
+from pathlib import Path
+
+import feedparser
+import pytest
+
+from thestill.core.feed_scanner import scan_feed
+from thestill.core.media_source import RSSMediaSource
+from thestill.utils.path_manager import PathManager
+
+FEEDS_DIR = Path(__file__).parents[2] / "fixtures" / "feeds"
+FEED_NAMES = sorted(p.stem for p in FEEDS_DIR.glob("*.xml"))
+FEED_URL = "https://feeds.example.com/x.xml"
+EPISODE_EXCLUDE = {"id", "created_at", "updated_at"}
+
+
+def _load(name: str):
+    content = (FEEDS_DIR / f"{name}.xml").read_text(encoding="utf-8")
+    expected = json.loads((FEEDS_DIR / f"{name}.expected.json").read_text(encoding="utf-8"))
+    return content, expected
+
+
+def _episodes(source: RSSMediaSource, content: str, known: set) -> list:
+    scan = source.scan_feed(content, known)
+    parsed = source.parse_rss(scan.content, FEED_URL)
+    episodes = source.fetch_episodes(FEED_URL, [], parsed_feed=parsed, known_external_ids=known)
+    return [ep.model_dump(mode="json", exclude=EPISODE_EXCLUDE) for ep in episodes]
+
+
+def _rss(items: str, channel_tail: str = "") -> str:
+    return f"""<?xml version="1.0" encoding="UTF-8"?>
+<rss version="2.0" xmlns:itunes="http://www.itunes.com/dtds/podcast-1.0.dtd">
+<channel>
+  <title>Scan Feed</title>
+  {items}
+  {channel_tail}
+</channel>
+</rss>"""
+
+
+def _item(n: int, day: int) -> str:
+    return f"""<item>
+    <title>Episode {n}</title>
+    <guid>ep-{n}</guid>
+    <pubDate>{day:02d} Jan 2026 10:00:00 +0000</pubDate>
+    <enclosure url="https://example.com/{n}.mp3" type="audio/mpeg"/>
+  </item>"""
+
+
+@pytest.fixture
+def source():
+    return RSSMediaSource()
+
+
+@pytest.fixture(autouse=True)
+def _default_run(monkeypatch):
+    monkeypatch.delenv("RSS_EARLY_STOP_KNOWN_RUN", raising=False)
+    monkeypatch.delenv("RSS_DEBUG_DUMP_ENABLED", raising=False)
+
+
+class TestSnapshotParity:
+    @pytest.mark.parametrize("name", FEED_NAMES)
+    def test_metadata(self, source, name):
+        content, expected = _load(name)
+        scan = source.scan_feed(content)
+        parsed = source.parse_rss(scan.content, FEED_URL)
+        metadata = source.extract_metadata(FEED_URL, rss_content=content, parsed_feed=parsed, scan=scan)
+        assert json.loads(json.dumps(metadata)) == expected["metadata"]
+
+    @pytest.mark.parametrize("name", FEED_NAMES)
+    def test_episode_maps(self, source, name):
+        content, expected = _load(name)
+        scan = source.scan_feed(content)
+        assert {
+            guid: [link.model_dump(mode="json") for link in links] for guid, links in scan.transcript_links.items()
+        } == expected["transcript_links"]
+        assert {
+            guid: [alt.model_dump(mode="json") for alt in alts] for guid, alts in scan.alternate_enclosures.items()
+        } == expected["alternate_enclosures"]
+        assert scan.images == expected["images"]
+        assert {guid: list(pair) for guid, pair in scan.audio_urls.items()} == expected["audio_urls"]
+
+    @pytest.mark.parametrize("name", FEED_NAMES)
+    def test_public_extractors_match(self, source, name):
+        content, expected = _load(name)
+        links = source.extract_transcript_links(content)
+        alts = source.extract_alternate_enclosures(content)
+        assert {g: [x.model_dump(mode="json") for x in v] for g, v in links.items()} == expected["transcript_links"]
+        assert {g: [x.model_dump(mode="json") for x in v] for g, v in alts.items()} == expected["alternate_enclosures"]
+
+    @pytest.mark.parametrize("name", FEED_NAMES)
+    def test_episodes_full_feed(self, source, name):
+        content, expected = _load(name)
+        assert _episodes(source, content, set()) == expected["episodes"]
+
+    @pytest.mark.parametrize("name", FEED_NAMES)
+    @pytest.mark.parametrize("new_count", [0, 1, 2])
+    def test_episodes_window(self, source, name, new_count):
+        """Known GUIDs past the newest ``new_count`` items: same new episodes, fewer parsed."""
+        content, expected = _load(name)
+        # ``images`` is keyed by every identifiable item, in feed order.
+        known = set(list(scan_feed(content).images)[new_count:])
+        want = [ep for ep in expected["episodes"] if ep["external_id"] not in known]
+        assert _episodes(source, content, known) == want
+
+
+class TestEarlyStop:
+    def test_stops_at_run_of_known_guids(self):
+        content = _rss("".join(_item(n, 20 - n) for n in range(1, 9)))
+        scan = scan_feed(content, {f"ep-{n}" for n in range(3, 9)})
+
+        assert scan.stopped_early
+        assert scan.items_total == 8
+        assert scan.items_in_window == 2
+        entries = feedparser.parse(scan.content).entries
+        assert [e.guid for e in entries] == ["ep-1", "ep-2"]
+        # The whole-feed maps still cover the known episodes.
+        assert set(scan.audio_urls) == {f"ep-{n}" for n in range(1, 9)}
+
+    def test_oldest_first_feed_never_cut(self):
+        content = _rss("".join(_item(n, n) for n in range(1, 9)))
+        scan = scan_feed(content, {f"ep-{n}" for n in range(1, 8)})
+
+        assert not scan.stopped_early
+        assert scan.content == content
+
+    def test_undated_items_never_cut(self):
+        content = _rss(
+            "".join(_item(n, 20 - n).replace("<pubDate>", "<x>").replace("</pubDate>", "</x>") for n in range(1, 6))
+        )
+        scan = scan_feed(content, {f"ep-{n}" for n in range(1, 6)})
+
+        assert not scan.stopped_early
+
+    def test_short_run_does_not_cut(self):
+        content = _rss("".join(_item(n, 20 - n) for n in range(1, 6)))
+        scan = scan_feed(content, {"ep-2", "ep-3"})
+
+        assert not scan.stopped_early
+        assert scan.items_in_window == 5
+
+    def test_trailing_channel_tags_survive_the_cut(self):
+        tail = "<language>fr</language><itunes:author>Someone</itunes:author>"
+        content = _rss("".join(_item(n, 20 - n) for n in range(1, 7)), channel_tail=tail)
+        scan = scan_feed(content, {f"ep-{n}" for n in range(2, 7)})
+
+        assert scan.stopped_early
+        parsed = feedparser.parse(scan.content)
+        assert not parsed.bozo
+        assert parsed.feed.language == "fr"
+        assert parsed.feed.author == "Someone"
+
+    def test_channel_tag_inside_cut_stretch_blocks_cut(self):
+        items = [_item(n, 20 - n) for n in range(1, 7)]
+        items.insert(3, "<language>fr</language>")
+        content = _rss("".join(items))
+        scan = scan_feed(content, {f"ep-{n}" for n in range(2, 7)})
+
+        assert not scan.stopped_early
+
+    def test_env_zero_disables_cut(self, source, monkeypatch):
+        monkeypatch.setenv("RSS_EARLY_STOP_KNOWN_RUN", "0")
+        content = _rss("".join(_item(n, 20 - n) for n in range(1, 9)))
+        scan = source.scan_feed(content, {f"ep-{n}" for n in range(2, 9)})
+
+        assert not scan.stopped_early
+        assert scan.items_in_window == 8
+
+
+class TestMalformed:
+    @pytest.mark.parametrize(
+        "content",
+        [
+            "",
+            "<rss><channel><item></channel>",
+            "not xml at all",
+            '<?xml version="1.0"?><!DOCTYPE rss [<!ENTITY a "b">]><rss><channel>&a;</channel></rss>',
+        ],
+    )
+    def test_returns_none(self, content):
+        assert scan_feed(content) is None
+
+    def test_bare_body_scans_without_channel(self):
+        scan = scan_feed("<rss>podcast1 content</rss>")
+
+        assert scan is not None
+        assert scan.items_total == 0
+        assert scan.content == "<rss>podcast1 content</rss>"
+
+
+class _ServeFeed(BaseHTTPRequestHandler):
+    body = _rss(_item(1, 1)).encode("utf-8")
+
+    def do_GET(self):  # noqa: N802 — BaseHTTPRequestHandler API
+        self.send_response(200)
+        self.send_header("Content-Type", "application/rss+xml")
+        self.send_header("Content-Length", str(len(self.body)))
+        self.end_headers()
+        self.wfile.write(self.body)
+
+    def log_message(self, *args):  # silence test output
+        pass
+
+
+@pytest.fixture
+def feed_server(monkeypatch):
+    monkeypatch.setenv("URL_GUARD_ALLOWLIST", "localhost")
+    server = HTTPServer(("127.0.0.1", 0), _ServeFeed)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://localhost:{server.server_address[1]}/feed.xml"
+    server.shutdown()
+    thread.join(timeout=5)
+
+
+class TestDebugDump:
+    def test_off_by_default(self, tmp_path, feed_server):
+        path_manager = PathManager(str(tmp_path))
+        result = RSSMediaSource(path_manager).fetch_rss_content(feed_server, "scan-feed")
+
+        assert result.content is not None
+        assert not path_manager.debug_feed_file("scan-feed").exists()
+
+    def test_opt_in(self, tmp_path, feed_server, monkeypatch):
+        monkeypatch.setenv("RSS_DEBUG_DUMP_ENABLED", "true")
+        path_manager = PathManager(str(tmp_path))
+        result = RSSMediaSource(path_manager).fetch_rss_content(feed_server, "scan-feed")
+
+        assert path_manager.debug_feed_file("scan-feed").read_text(encoding="utf-8") == result.content
+
+
+class TestRefreshHint:
+    def test_ttl_and_syndication_tags(self):
+        tail = "<ttl>90</ttl><sy:updatePeriod>daily</sy:updatePeriod><sy:updateFrequency>12</sy:updateFrequency>"
+        content = _rss(_item(1, 1), channel_tail=tail).replace(
+            "<rss ", '<rss xmlns:sy="http://purl.org/rss/1.0/modules/syndication/" '
+        )
+
+        assert scan_feed(content).refresh_hint_seconds == 2 * 3600
+
+    def test_item_ttl_ignored(self):
+        content = _rss(_item(1, 1).replace("</item>", "<ttl>60</ttl></item>"))
+
+        assert scan_feed(content).refresh_hint_seconds is None
@@ -5,7 +5,7 @@ for the entities mentioned in the batch's episodes. These tests pin the
 handler's orchestration contract with a stubbed enricher (no network):
 
 - coalesces sibling episodes and unions their scoped enrichment selections
-- enriches each candidate and persists via ``upsert_enrichment``
+- enriches the candidates as one batch and persists via ``upsert_enrichment``
 - caps the burst at ``enrichment_max_per_task`` (overflow → scheduled sweep)
 - a single entity's failure must not abort the batch (spec #42 FM-1)
 - entities without a QID are skipped defensively
@@ -63,6 +63,15 @@ class _StubEnricher:
             raise RuntimeError("wikidata down")
         return _enrichment(entity.id)
 
+    def enrich_many(self, entities, *, max_workers=1):
+        out = []
+        for entity in entities:
+            try:
+                out.append((entity, self.enrich(entity), None))
+            except Exception as exc:  # noqa: BLE001 — mirrors EntityEnricher.enrich_many
+                out.append((entity, None, exc))
+        return out
+
 
 def _build_state(
     *,
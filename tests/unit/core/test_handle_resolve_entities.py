@@ -116,6 +116,8 @@ def _build_state(pending: List[EntityMention]):
     # would otherwise hand back a truthy stub.
     state.entity_repository.lookup_override.return_value = None
     state.entity_repository.is_blacklisted.return_value = False
+    # Empty surface-form cache — every mention goes through the model.
+    state.entity_repository.lookup_surface_resolutions.return_value = {}
     # Spec §1.13.5 — coref pass runs after resolution. Default empty
     # so the happy-path test isn't perturbed by a stubbed coref result.
     state.entity_repository.list_resolved_persons_for_episode.return_value = []
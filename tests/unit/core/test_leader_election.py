@@ -0,0 +1,123 @@
+# Copyright 2025-2026 Thestill
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Scheduler lease election and stage-scoped standalone workers.
+
+Two electors over one ``SqliteLeaseStore`` file stand in for two worker
+processes: exactly one may lead, and the other takes over once the leader
+releases the lease or lets it lapse.
+"""
+
+from __future__ import annotations
+
+import time
+from unittest.mock import MagicMock
+
+import pytest
+
+from thestill.core.leader_election import LeaderElector, SqliteLeaseStore
+from thestill.core.queue_manager import TaskStage
+from thestill.core.task_worker import TaskWorker
+from thestill.web.background import parse_stage_jobs, parse_stages
+
+
+@pytest.fixture
+def store(tmp_path) -> SqliteLeaseStore:
+    return SqliteLeaseStore(tmp_path / "leases.db")
+
+
+def _elector(store: SqliteLeaseStore, holder: str, events: list, ttl_sec: float = 30.0) -> LeaderElector:
+    return LeaderElector(
+        store,
+        "schedulers",
+        on_elected=lambda: events.append((holder, "elected")),
+        on_demoted=lambda: events.append((holder, "demoted")),
+        ttl_sec=ttl_sec,
+        holder=holder,
+    )
+
+
+def test_lease_is_exclusive_until_released(store):
+    assert store.try_acquire("schedulers", "a", 30)
+    assert store.try_acquire("schedulers", "a", 30)  # renewal
+    assert not store.try_acquire("schedulers", "b", 30)
+    assert store.current_holder("schedulers") == "a"
+
+    store.release("schedulers", "b")  # not the holder: no-op
+    assert store.current_holder("schedulers") == "a"
+    store.release("schedulers", "a")
+    assert store.current_holder("schedulers") is None
+    assert store.try_acquire("schedulers", "b", 30)
+
+
+def test_expired_lease_can_be_taken_over(store):
+    assert store.try_acquire("schedulers", "a", 0.05)
+    time.sleep(0.1)
+    assert store.current_holder("schedulers") is None
+    assert store.try_acquire("schedulers", "b", 30)
+    assert not store.try_acquire("schedulers", "a", 30)
+
+
+def test_only_one_elector_leads_and_the_other_takes_over_on_stop(store):
+    events: list = []
+    a, b = _elector(store, "a", events), _elector(store, "b", events)
+
+    assert a.poll() and not b.poll()
+    assert a.is_leader and not b.is_leader
+
+    a.stop()
+    assert b.poll()
+    assert events == [("a", "elected"), ("a", "demoted"), ("b", "elected")]
+
+
+def test_elector_steps_down_when_the_lease_is_lost(store):
+    events: list = []
+    a = _elector(store, "a", events, ttl_sec=1.0)
+    assert a.poll()
+    # Simulate a long pause: the lease lapsed and another process took it.
+    store.release("schedulers", "a")
+    assert store.try_acquire("schedulers", "b", 30)
+
+    assert not a.poll()
+    assert events == [("a", "elected"), ("a", "demoted")]
+    a.stop()
+    assert store.current_holder("schedulers") == "b"
+
+
+def test_parse_stages_accepts_either_spelling():
+    assert parse_stages("transcribe, extract_entities") == [TaskStage.TRANSCRIBE, TaskStage.EXTRACT_ENTITIES]
+    assert parse_stages("") == list(TaskStage)
+    with pytest.raises(ValueError, match="transcode"):
+        parse_stages("transcode")
+
+
+def test_parse_stage_jobs_overrides_configured_capacity():
+    base = {TaskStage.TRANSCRIBE: 1, TaskStage.CLEAN: 1}
+    jobs = parse_stage_jobs(["transcribe=3"], base)
+    assert jobs == {TaskStage.TRANSCRIBE: 3, TaskStage.CLEAN: 1}
+    with pytest.raises(ValueError):
+        parse_stage_jobs(["clean=0"], base)
+
+
+def test_worker_claims_and_sizes_only_its_stages():
+    worker = TaskWorker(
+        queue_manager=MagicMock(),
+        task_handlers={},
+        repository=MagicMock(),
+        parallel_jobs_per_stage={TaskStage.TRANSCRIBE: 2, TaskStage.CLEAN: 5},
+        stages=[TaskStage.CLEAN, TaskStage.TRANSCRIBE],
+    )
+    assert worker.stages == (TaskStage.TRANSCRIBE, TaskStage.CLEAN)
+    assert worker.executor_max_workers() == 7 + 4 + worker.abandoned_thread_budget
+    assert worker.get_status()["stages_served"] == ["transcribe", "clean"]
@@ -0,0 +1,217 @@
+# Copyright 2025-2026 Thestill
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Content-addressed LLM response cache: keys, storage rules, eviction."""
+
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+import pytest
+from pydantic import BaseModel
+
+from thestill.core.llm_cache import (
+    CachedLLMProvider,
+    LLMResponseCache,
+    cache_key,
+    llm_cache_variant,
+    wrap_with_response_cache,
+)
+from thestill.core.llm_provider import LLMProvider
+
+
+class _Summary(BaseModel):
+    title: str
+    points: list[str]
+
+
+class _CountingProvider(LLMProvider):
+    def __init__(self, replies=None):
+        self.replies = list(replies or [])
+        self.calls = 0
+
+    def _next(self):
+        self.calls += 1
+        reply = self.replies.pop(0) if self.replies else f"reply-{self.calls}"
+        if isinstance(reply, Exception):
+            raise reply
+        return reply
+
+    def chat_completion(self, messages, temperature=None, max_tokens=None, response_format=None):
+        return self._next()
+
+    def generate_structured(self, messages, response_model, temperature=None, max_tokens=None):
+        self.calls += 1
+        return response_model(title=f"t{self.calls}", points=["a", "b"])
+
+    def supports_temperature(self):
+        return True
+
+    def health_check(self):
+        return True
+
+    def get_model_name(self):
+        return "fake-1"
+
+    def get_model_display_name(self):
+        return "Fake"
+
+    def supports_structured_output(self):
+        return True
+
+
+MESSAGES = [{"role": "system", "content": "Be brief."}, {"role": "user", "content": "Summarise."}]
+
+
+@pytest.fixture
+def cache(tmp_path):
+    return LLMResponseCache(tmp_path / "llm_cache.db")
+
+
+def _cached(cache, replies=None):
+    inner = _CountingProvider(replies)
+    return inner, CachedLLMProvider(inner, cache, "fake:fake-1:")
+
+
+class TestHits:
+    def test_identical_request_is_served_from_cache(self, cache):
+        inner, provider = _cached(cache)
+
+        first = provider.chat_completion(MESSAGES, temperature=0)
+        second = provider.chat_completion(MESSAGES, temperature=0)
+
+        assert first == second == "reply-1"
+        assert inner.calls == 1
+        assert (cache.stats()["hits"], cache.stats()["misses"]) == (1, 1)
+
+    def test_cache_survives_a_new_process_handle(self, cache, tmp_path):
+        _, provider = _cached(cache)
+        provider.chat_completion(MESSAGES)
+
+        inner, reopened = _cached(LLMResponseCache(tmp_path / "llm_cache.db"))
+        assert reopened.chat_completion(MESSAGES) == "reply-1"
+        assert inner.calls == 0
+
+    def test_structured_result_round_trips_and_entry_points_share(self, cache):
+        inner, provider = _cached(cache)
+
+        first = provider.generate_structured(MESSAGES, _Summary, temperature=0)
+        second = provider.generate_structured_cached(MESSAGES, _Summary, cache_system_message=True, temperature=0)
+
+        assert second == first and isinstance(second, _Summary)
+        assert inner.calls == 1
+
+
+class TestKey:
+    def test_every_answer_changing_field_is_in_the_key(self):
+        base = cache_key("openai:gpt:", "chat", MESSAGES, temperature=0)
+        assert cache_key("openai:gpt:", "chat", MESSAGES, temperature=0) == base
+        assert cache_key("openai:gpt:high", "chat", MESSAGES, temperature=0) != base
+        assert cache_key("openai:gpt:", "chat", MESSAGES, temperature=0.7) != base
+        assert cache_key("openai:gpt:", "chat", MESSAGES, temperature=0, max_tokens=100) != base
+        assert cache_key("openai:gpt:", "chat", MESSAGES[1:], temperature=0) != base
+        assert cache_key("openai:gpt:", "structured", MESSAGES, response_model=_Summary, temperature=0) != base
+
+    def test_variants_keep_deliberate_repeats_apart(self, cache):
+        inner, provider = _cached(cache)
+
+        with llm_cache_variant("sample-0"):
+            a = provider.chat_completion(MESSAGES)
+        with llm_cache_variant("sample-1"):
+            b = provider.chat_completion(MESSAGES)
+        with llm_cache_variant("sample-0"):
+            replay = provider.chat_completion(MESSAGES)
+
+        assert (a, b, replay) == ("reply-1", "reply-2", "reply-1")
+        assert inner.calls == 2
+
+
+class TestWhatIsStored:
+    def test_failures_are_not_cached(self, cache):
+        inner, provider = _cached(cache, [RuntimeError("503"), "ok"])
+
+        with pytest.raises(RuntimeError):
+            provider.chat_completion(MESSAGES)
+        assert provider.chat_completion(MESSAGES) == "ok"
+        assert inner.calls == 2
+
+    def test_json_mode_text_is_cached_only_when_it_parses(self, cache):
+        inner, provider = _cached(cache, ["{not json", '{"ok": true}'])
+        fmt = {"type": "json_object"}
+
+        assert provider.chat_completion(MESSAGES, response_format=fmt) == "{not json"
+        assert provider.chat_completion(MESSAGES, response_format=fmt) == '{"ok": true}'
+        assert provider.chat_completion(MESSAGES, response_format=fmt) == '{"ok": true}'
+        assert inner.calls == 2
+
+    def test_entry_that_no_longer_validates_is_refetched(self, cache):
+        inner, provider = _cached(cache)
+        key = cache_key("fake:fake-1:", "structured", MESSAGES, response_model=_Summary)
+        cache.put(key, provider="fake", model="fake-1", kind="structured", response='{"title": 1}')
+
+        assert provider.generate_structured(MESSAGES, _Summary).title == "t1"
+        assert inner.calls == 1
+
+
+def test_lru_entries_are_evicted_past_the_size_bound(tmp_path):
+    cache = LLMResponseCache(tmp_path / "c.db", max_bytes=1000)
+    for i in range(4):
+        cache.put(f"k{i}", provider="p", model="m", kind="chat", response="x" * 300)
+        if i == 1:
+            cache.get("k0")  # k0 is now more recent than k1
+
+    stats = cache.stats()
+    assert stats["size_bytes"] <= 900
+    assert cache.get("k0") is not None
+    assert cache.get("k1") is None
+    assert stats["evictions"] >= 1
+
+
+def test_running_total_tracks_replacements_and_discards(tmp_path, monkeypatch):
+    cache = LLMResponseCache(tmp_path / "c.db", max_bytes=1000)
+    cache.put("k0", provider="p", model="m", kind="chat", response="x" * 300)
+    cache.put("k0", provider="p", model="m", kind="chat", response="x" * 200)
+    cache.put("k1", provider="p", model="m", kind="chat", response="x" * 300)
+    cache.discard("k1")
+    assert cache._size_bytes == cache.stats()["size_bytes"] == 200
+
+    evictions = []
+    monkeypatch.setattr(cache, "_evict", lambda conn: evictions.append(conn) or 0)
+    for i in range(2, 4):
+        cache.put(f"k{i}", provider="p", model="m", kind="chat", response="x" * 300)
+    assert evictions == []  # 800 bytes: under the bound, no table scan
+    cache.put("k4", provider="p", model="m", kind="chat", response="x" * 300)
+    assert len(evictions) == 1
+
+
+class TestWrapping:
+    def test_disabled_returns_the_provider_untouched(self, tmp_path):
+        inner = _CountingProvider()
+        assert wrap_with_response_cache(inner, SimpleNamespace(llm_cache_enabled=False)) is inner
+        assert wrap_with_response_cache(inner, MagicMock()) is inner  # mocks never opt in
+
+    def test_enabled_wraps_with_provider_identity(self, tmp_path):
+        config = SimpleNamespace(
+            llm_cache_enabled=True,
+            llm_cache_path=str(tmp_path / "c.db"),
+            llm_cache_max_mb=1,
+            llm_provider="openai",
+            openai_model="gpt-5.2",
+            openai_reasoning_effort="high",
+        )
+
+        wrapped = wrap_with_response_cache(_CountingProvider(), config)
+
+        assert isinstance(wrapped, CachedLLMProvider)
+        assert wrapped.identity == "openai:fake-1:high"
+        assert wrapped.get_model_display_name() == "Fake"
@@ -0,0 +1,298 @@
+# Copyright 2025-2026 Thestill
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Shared LLM client pool: reuse, admission gating and header feedback.
+
+Providers are fakes built by an injected factory; the header hook is
+exercised against a real ``httpx.Client`` on a ``MockTransport`` so no
+SDK or network is involved.
+"""
+
+import threading
+import time
+from datetime import datetime, timedelta, timezone
+from types import SimpleNamespace
+
+import httpx
+import pytest
+from pydantic import BaseModel
+
+from thestill.core.llm_pool import (
+    LLMAdmissionTimeout,
+    LLMClientPool,
+    ProviderLimiter,
+    RateLimitedProvider,
+    TokenBucket,
+    _attach_header_hook,
+    parse_rate_limit_headers,
+)
+from thestill.core.llm_provider import LLMProvider, ModelLimits
+
+
+class _Answer(BaseModel):
+    text: str
+
+
+class _FakeProvider(LLMProvider):
+    def __init__(self, model="fake-model", delay=0.0):
+        self.model = model
+        self.delay = delay
+        self.calls = []
+        self.active = 0
+        self.peak = 0
+        self._lock = threading.Lock()
+
+    def _work(self, name, **kwargs):
+        with self._lock:
+            self.active += 1
+            self.peak = max(self.peak, self.active)
+        time.sleep(self.delay)
+        with self._lock:
+            self.active -= 1
+            self.calls.append((name, kwargs))
+
+    def chat_completion(self, messages, temperature=None, max_tokens=None, response_format=None):
+        self._work("chat", temperature=temperature)
+        return "x" * 400
+
+    def generate_structured(self, messages, response_model, temperature=None, max_tokens=None):
+        self._work("structured")
+        return response_model(text="ok")
+
+    def generate_structured_cached(
+        self, messages, response_model, *, cache_system_message=False, temperature=None, max_tokens=None
+    ):
+        self._work("cached", cache_system_message=cache_system_message)
+        return response_model(text="ok")
+
+    def supports_temperature(self):
+        return True
+
+    def health_check(self):
+        return True
+
+    def get_model_name(self):
+        return self.model
+
+    def get_model_display_name(self):
+        return self.model.upper()
+
+    def supports_structured_output(self):
+        return True
+
+
+def _limits(tpm=1_000_000, rpm=10_000):
+    return ModelLimits(tpm=tpm, rpm=rpm, tpd=10**9, context_window=100_000)
+
+
+MESSAGES = [{"role": "user", "content": "y" * 400}]  # ~100 tokens
+
+
+class TestPool:
+    def test_same_settings_share_one_provider(self):
+        built = []
+        pool = LLMClientPool(factory=lambda provider_type, **kw: built.append(kw) or _FakeProvider(kw["model"]))
+
+        first = pool.get("OpenAI", model="a", api_key="k")
+        second = pool.get("openai", api_key="k", model="a")
+        other = pool.get("openai", model="b", api_key="k")
+
+        assert first is second
+        assert other is not first
+        assert len(built) == 2
+        assert pool.stats()["reused"] == 1
+        assert set(pool.stats()["providers"]) == {"openai:a", "openai:b"}
+
+    def test_construction_failure_is_not_cached(self):
+        attempts = []
+
+        def factory(provider_type, **kw):
+            attempts.append(1)
+            if len(attempts) == 1:
+                raise ValueError("OpenAI API key is required")
+            return _FakeProvider()
+
+        pool = LLMClientPool(factory=factory)
+        with pytest.raises(ValueError):
+            pool.get("openai", model="a")
+        assert pool.get("openai", model="a").get_model_name() == "fake-model"
+
+    def test_slow_construction_does_not_block_other_settings(self):
+        release = threading.Event()
+
+        def factory(provider_type, **kw):
+            if kw["model"] == "slow":
+                release.wait(5)
+            return _FakeProvider(kw["model"])
+
+        pool = LLMClientPool(factory=factory)
+        slow = threading.Thread(target=pool.get, args=("ollama",), kwargs={"model": "slow"})
+        slow.start()
+        try:
+            assert pool.get("openai", model="fast").get_model_name() == "fast"
+        finally:
+            release.set()
+            slow.join(5)
+        assert pool.stats()["clients"] == 2
+
+    def test_racing_constructions_register_one_provider(self):
+        barrier = threading.Barrier(2)
+
+        def factory(provider_type, **kw):
+            barrier.wait(5)
+            return _FakeProvider(kw["model"])
+
+        pool = LLMClientPool(factory=factory)
+        results = []
+        threads = [threading.Thread(target=lambda: results.append(pool.get("openai", model="a"))) for _ in range(2)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join(5)
+
+        assert results[0] is results[1]
+        assert (pool.stats()["created"], pool.stats()["reused"]) == (1, 1)
+
+    def test_providers_on_one_model_share_a_limiter(self):
+        pool = LLMClientPool(factory=lambda provider_type, **kw: _FakeProvider("m"))
+        a = pool.get("anthropic", api_key="one")
+        b = pool.get("anthropic", api_key="two")
+        assert a is not b and a.limiter is b.limiter
+
+
+class TestAdmission:
+    def test_concurrency_cap_queues_callers(self):
+        inner = _FakeProvider(delay=0.05)
+        provider = RateLimitedProvider(inner, ProviderLimiter("fake", _limits(), max_concurrency=2))
+
+        threads = [threading.Thread(target=provider.chat_completion, args=(MESSAGES,)) for _ in range(6)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        stats = provider.limiter.stats()
+        assert inner.peak == 2
+        assert stats["admitted"] == 6
+        assert stats["in_flight"] == 0 and stats["queued"] == 0
+        assert stats["wait_seconds_max"] > 0
+
+    def test_token_budget_blocks_until_timeout(self):
+        # 60 TPM at 0.9 headroom = 54-token bucket refilling ~1 token/s.
+        limiter = ProviderLimiter("fake", _limits(tpm=60), admission_timeout=0.05)
+        limiter.acquire(54)
+        limiter.release(0)
+
+        with pytest.raises(LLMAdmissionTimeout):
+            limiter.acquire(54)
+        assert limiter.stats()["timeouts"] == 1
+
+    def test_output_tokens_are_debited_after_the_call(self):
+        limiter = ProviderLimiter("fake", _limits(tpm=10_000))
+        provider = RateLimitedProvider(_FakeProvider(), limiter)
+
+        provider.chat_completion(MESSAGES)
+
+        # ~101 prompt + ~101 output tokens out of a 9000-token bucket.
+        assert 8_700 < limiter._tokens.level < 8_850
+
+    def test_request_methods_delegate_with_their_arguments(self):
+        inner = _FakeProvider()
+        provider = RateLimitedProvider(inner, ProviderLimiter("fake"))
+
+        result = provider.generate_structured_cached(MESSAGES, _Answer, cache_system_message=True)
+
+        assert result == _Answer(text="ok")
+        assert inner.calls == [("cached", {"cache_system_message": True})]
+        assert provider.get_model_display_name() == "FAKE-MODEL"
+        assert provider.model == "fake-model"  # attribute passthrough
+        assert provider.limiter.stats()["admitted"] == 1
+
+    def test_failed_call_releases_its_slot(self):
+        inner = _FakeProvider()
+        inner.chat_completion = lambda *a, **kw: (_ for _ in ()).throw(RuntimeError("boom"))
+        provider = RateLimitedProvider(inner, ProviderLimiter("fake", max_concurrency=1))
+
+        with pytest.raises(RuntimeError):
+            provider.chat_completion(MESSAGES)
+        assert provider.limiter.stats()["in_flight"] == 0
+
+
+class TestHeaderFeedback:
+    def test_parses_openai_and_anthropic_headers(self):
+        reset_at = (datetime.now(timezone.utc) + timedelta(seconds=30)).isoformat().replace("+00:00", "Z")
+        parsed = parse_rate_limit_headers(
+            {
+                "x-ratelimit-limit-tokens": "30000",
+                "x-ratelimit-reset-tokens": "1m30.5s",
+                "x-ratelimit-reset-requests": "250ms",
+                "anthropic-ratelimit-requests-remaining": "0",
+                "anthropic-ratelimit-requests-reset": reset_at,
+                "retry-after": "7",
+                "content-type": "application/json",
+            }
+        )
+
+        assert parsed["tokens"] == {"limit": 30000.0, "reset": 90.5}
+        assert parsed["requests"]["reset"] == pytest.approx(30, abs=2)
+        assert parsed["requests"]["remaining"] == 0
+        assert parsed["retry_after"] == {"seconds": 7.0}
+
+    def test_429_pauses_admission_for_every_caller(self):
+        limiter = ProviderLimiter("fake", admission_timeout=0.05)
+
+        limiter.observe_response(429, {"retry-after": "2"})
+
+        assert limiter.stats()["throttled"] == 1
+        assert limiter.stats()["paused_seconds"] > 1
+        with pytest.raises(LLMAdmissionTimeout):
+            limiter.acquire(1)
+
+    def test_published_limits_replace_the_table(self):
+        limiter = ProviderLimiter("fake", _limits(tpm=400_000))
+
+        limiter.observe_response(
+            200, {"anthropic-ratelimit-tokens-limit": "50000", "anthropic-ratelimit-tokens-remaining": "100"}
+        )
+
+        assert limiter.stats()["tpm_limit"] == 45_000
+        assert limiter._tokens.level <= 100
+
+    def test_hook_sees_sdk_http_responses(self):
+        def handler(request):
+            return httpx.Response(
+                429, headers={"retry-after": "3", "x-ratelimit-remaining-requests": "0"}, json={"error": "slow down"}
+            )
+
+        http_client = httpx.Client(transport=httpx.MockTransport(handler))
+        provider = SimpleNamespace(client=SimpleNamespace(_client=http_client))
+        limiter = ProviderLimiter("fake")
+
+        assert _attach_header_hook(provider, limiter) is True
+        http_client.get("https://api.example.test/v1/messages")
+
+        assert limiter.stats()["throttled"] == 1
+        assert limiter.stats()["paused_seconds"] > 2
+
+    def test_sdk_without_http_hook_is_left_alone(self):
+        assert _attach_header_hook(SimpleNamespace(client=object()), ProviderLimiter("fake")) is False
+
+
+def test_token_bucket_waits_in_proportion_to_the_shortfall():
+    bucket = TokenBucket(600)  # 10 tokens/s
+    now = time.monotonic()
+    bucket.take(600, now)
+
+    assert bucket.wait_for(50, now) == pytest.approx(5.0, rel=0.01)
+    assert bucket.wait_for(10_000, now) == pytest.approx(60.0, rel=0.01)  # capped at a full bucket
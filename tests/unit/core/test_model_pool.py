@@ -0,0 +1,224 @@
+# Copyright 2025-2026 Thestill
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Resident model pool: reuse, single-flight loads, limits and sharing.
+
+Models are plain objects (or fakes exposing ``parameters()``), so nothing
+here needs torch; one test drives ``WhisperTranscriber`` against a stub
+``whisper`` module to check two transcriber instances share one load.
+"""
+
+import sys
+import threading
+import time
+from types import ModuleType, SimpleNamespace
+
+import pytest
+
+from thestill.core.model_pool import ModelKey, ModelPool, estimate_model_bytes
+from thestill.models.transcription import TranscribeOptions
+
+KEY_A = ModelKey("whisper", "base", "cpu")
+KEY_B = ModelKey("whisper", "small", "cpu")
+KEY_C = ModelKey("parakeet", "tdt", "cpu")
+
+
+class _Tensor:
+    def __init__(self, n: int) -> None:
+        self.n = n
+
+    def numel(self) -> int:
+        return self.n
+
+    def element_size(self) -> int:
+        return 4
+
+
+class _FakeModule:
+    def __init__(self, mb: int) -> None:
+        self._params = [_Tensor(mb * 1024 * 1024 // 4)]
+
+    def parameters(self):
+        return iter(self._params)
+
+    def buffers(self):
+        return iter([])
+
+
+class _CountingLoader:
+    def __init__(self, make=object, delay: float = 0.0) -> None:
+        self.calls = 0
+        self.make = make
+        self.delay = delay
+
+    def __call__(self):
+        self.calls += 1
+        if self.delay:
+            time.sleep(self.delay)
+        return self.make()
+
+
+class TestResidency:
+    def test_second_lease_reuses_loaded_model(self):
+        pool = ModelPool()
+        loader = _CountingLoader()
+
+        with pool.lease(KEY_A, loader) as first:
+            pass
+        with pool.lease(KEY_A, loader) as second:
+            pass
+
+        assert first is second
+        assert loader.calls == 1
+        assert (pool.hits, pool.misses) == (1, 1)
+
+    def test_concurrent_leases_load_once(self):
+        pool = ModelPool()
+        loader = _CountingLoader(delay=0.05)
+        seen = []
+
+        def slot():
+            with pool.lease(KEY_A, loader) as model:
+                seen.append(model)
+
+        threads = [threading.Thread(target=slot) for _ in range(4)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        assert loader.calls == 1
+        assert len({id(m) for m in seen}) == 1
+
+    def test_same_model_is_used_by_one_slot_at_a_time(self):
+        pool = ModelPool()
+        active, peak = [0], [0]
+        lock = threading.Lock()
+
+        def slot():
+            with pool.lease(KEY_A, object):
+                with lock:
+                    active[0] += 1
+                    peak[0] = max(peak[0], active[0])
+                time.sleep(0.02)
+                with lock:
+                    active[0] -= 1
+
+        threads = [threading.Thread(target=slot) for _ in range(3)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        assert peak[0] == 1
+
+    def test_failed_load_is_not_cached(self):
+        pool = ModelPool()
+
+        def broken():
+            raise RuntimeError("corrupt checkpoint")
+
+        with pytest.raises(RuntimeError):
+            with pool.lease(KEY_A, broken):
+                pass
+        loader = _CountingLoader()
+        with pool.lease(KEY_A, loader):
+            pass
+
+        assert loader.calls == 1
+        assert [r["model"] for r in pool.stats()["resident"]] == ["base"]
+
+    def test_zero_max_models_reloads_every_lease(self):
+        pool = ModelPool(max_models=0)
+        loader = _CountingLoader()
+
+        for _ in range(2):
+            with pool.lease(KEY_A, loader):
+                pass
+
+        assert loader.calls == 2
+        assert pool.stats()["resident"] == []
+
+
+class TestLimits:
+    def test_lru_idle_model_is_evicted_past_max_models(self):
+        pool = ModelPool(max_models=2)
+        for key in (KEY_A, KEY_B):
+            pool.warm(key, object)
+        pool.warm(KEY_A, object)  # touch A; B is now least recently used
+
+        pool.warm(KEY_C, object)
+
+        assert {r["model"] for r in pool.stats()["resident"]} == {"base", "tdt"}
+        assert pool.evictions == 1
+
+    def test_byte_budget_evicts_by_estimated_size(self):
+        pool = ModelPool(max_models=10, max_bytes=150 * 1024 * 1024)
+        pool.warm(KEY_A, lambda: _FakeModule(100))
+        pool.warm(KEY_B, lambda: _FakeModule(100))
+
+        stats = pool.stats()
+        assert [r["model"] for r in stats["resident"]] == ["small"]
+        assert stats["resident"][0]["size_mb"] == 100.0
+
+    def test_in_use_model_is_never_evicted(self):
+        pool = ModelPool(max_models=1)
+        with pool.lease(KEY_A, object) as held:
+            pool.warm(KEY_B, object)  # over budget, but A is busy and B is newest
+            assert pool.stats()["resident"][0]["model"] == "base"
+            assert held is not None
+        assert {r["model"] for r in pool.stats()["resident"]} == {"base", "small"}
+
+    def test_idle_ttl_evicts_on_next_lease(self, monkeypatch):
+        now = [1000.0]
+        monkeypatch.setattr("thestill.core.model_pool.time.monotonic", lambda: now[0])
+        pool = ModelPool(idle_ttl_seconds=60)
+        pool.warm(KEY_A, object)
+
+        now[0] += 61
+        pool.warm(KEY_B, object)
+
+        assert [r["model"] for r in pool.stats()["resident"]] == ["small"]
+
+
+def test_estimate_model_bytes_handles_tuples_and_wrappers():
+    assert estimate_model_bytes(_FakeModule(2)) == 2 * 1024 * 1024
+    assert estimate_model_bytes((_FakeModule(1), {"language": "en"})) == 1024 * 1024
+    assert estimate_model_bytes(SimpleNamespace(model=_FakeModule(3))) == 3 * 1024 * 1024
+    assert estimate_model_bytes(object()) == 0
+
+
+def test_whisper_transcribers_share_one_resident_model(monkeypatch, tmp_path):
+    from thestill.core.whisper_transcriber import WhisperTranscriber
+
+    loads = []
+
+    class _Model:
+        def transcribe(self, path, **_kwargs):
+            return {"text": "hi", "segments": [], "language": "en"}
+
+    fake_whisper = ModuleType("whisper")
+    fake_whisper.load_model = lambda name, device: loads.append((name, device)) or _Model()
+    monkeypatch.setitem(sys.modules, "whisper", fake_whisper)
+    monkeypatch.setattr(WhisperTranscriber, "_get_audio_duration_minutes", lambda self, path: 1.0)
+
+    pool = ModelPool()
+    audio = tmp_path / "a.wav"
+    audio.write_bytes(b"RIFF")
+    for _ in range(2):
+        transcriber = WhisperTranscriber("base", "cpu", model_pool=pool)
+        assert transcriber.transcribe_audio(str(audio), options=TranscribeOptions(language="en")) is not None
+
+    assert loads == [("base", "cpu")]
+    assert pool.stats()["hits"] == 1
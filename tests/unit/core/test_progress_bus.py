@@ -0,0 +1,165 @@
+# Copyright 2025-2026 Thestill
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""ProgressStore publish throttle and the SQLite progress bus.
+
+Two stores over one ``SqliteProgressBus`` file stand in for the web and
+worker processes: the worker store publishes, the web store's SSE queues
+must receive it.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import threading
+import time
+
+import pytest
+
+from thestill.core.progress_bus import InMemoryProgressBus, SqliteProgressBus, progress_bus_from_config
+from thestill.core.progress_store import ProgressStore, TaskProgress
+from thestill.utils.config import Config
+
+
+def _drain(queue: asyncio.Queue) -> list:
+    items = []
+    while not queue.empty():
+        items.append(queue.get_nowait())
+    return items
+
+
+def test_throttle_coalesces_and_flushes_the_newest_update():
+    async def scenario():
+        store = ProgressStore(min_interval_sec=0.1)
+        store.set_event_loop(asyncio.get_running_loop())
+        queue = store.subscribe("t1")
+        for pct in range(1, 21):
+            store.update("t1", TaskProgress(stage="transcribing", progress_pct=pct))
+        await asyncio.sleep(0.01)
+        first = [p.progress_pct for p in _drain(queue)]
+        await asyncio.sleep(0.2)
+        flushed = [p.progress_pct for p in _drain(queue)]
+        return first, flushed
+
+    first, flushed = asyncio.run(scenario())
+    assert first == [1]
+    assert flushed == [20]
+
+
+def test_stage_changes_and_terminal_updates_bypass_the_throttle():
+    store = ProgressStore(min_interval_sec=60)
+    store.update("t1", TaskProgress(stage="transcribing", progress_pct=10))
+    store.update("t1", TaskProgress(stage="transcribing", progress_pct=20))
+    assert store.get("t1").progress_pct == 10
+    store.update("t1", TaskProgress(stage="diarizing", progress_pct=70))
+    assert store.get("t1").stage == "diarizing"
+    store.update("t1", TaskProgress(stage="completed", progress_pct=100))
+    assert store.get("t1").stage == "completed"
+    store.cleanup("t1")
+    assert store.get("t1") is None
+
+
+def test_sqlite_bus_carries_progress_between_stores(tmp_path):
+    db = tmp_path / "task_progress.db"
+    worker = ProgressStore(SqliteProgressBus(db))
+
+    async def scenario():
+        web = ProgressStore(SqliteProgressBus(db, poll_interval_sec=0.02))
+        web.set_event_loop(asyncio.get_running_loop())
+        queues = [web.subscribe("t1"), web.subscribe("t1")]
+        try:
+            worker.update("t1", TaskProgress(stage="transcribing", progress_pct=40))
+            worker.update("t1", TaskProgress(stage="completed", progress_pct=100))
+            got = [[(await asyncio.wait_for(q.get(), 2)).stage for _ in range(2)] for q in queues]
+            return got, web.get("t1")
+        finally:
+            web.close()
+
+    got, current = asyncio.run(scenario())
+    # One listener, fanned out to both SSE queues.
+    assert got == [["transcribing", "completed"], ["transcribing", "completed"]]
+    # The web process reads remote progress from the bus.
+    assert current.progress_pct == 100
+
+    worker.cleanup("t1")
+    assert ProgressStore(SqliteProgressBus(db)).get("t1") is None
+
+
+def test_sqlite_bus_does_not_echo_a_stores_own_updates(tmp_path):
+    async def scenario():
+        store = ProgressStore(SqliteProgressBus(tmp_path / "p.db", poll_interval_sec=0.02))
+        store.set_event_loop(asyncio.get_running_loop())
+        queue = store.subscribe("t1")
+        try:
+            store.update("t1", TaskProgress(stage="transcribing", progress_pct=5))
+            await asyncio.sleep(0.15)
+            return _drain(queue)
+        finally:
+            store.close()
+
+    assert [p.progress_pct for p in asyncio.run(scenario())] == [5]
+
+
+def test_sqlite_bus_keeps_polling_after_a_delivery_fails(tmp_path):
+    db = tmp_path / "p.db"
+    publisher = SqliteProgressBus(db)
+    listener = SqliteProgressBus(db, poll_interval_sec=0.02)
+    delivered = []
+    second = threading.Event()
+
+    def deliver(task_id, progress):
+        if task_id == "bad":
+            raise RuntimeError("subscriber blew up")
+        delivered.append((task_id, progress.progress_pct))
+        second.set()
+
+    listener.start(deliver, origin="web")
+    try:
+        publisher.publish("bad", TaskProgress(progress_pct=1), origin="worker")
+        time.sleep(0.1)
+        publisher.publish("good", TaskProgress(progress_pct=2), origin="worker")
+        assert second.wait(2)
+    finally:
+        listener.stop()
+
+    assert delivered == [("good", 2)]
+
+
+def test_subscribe_seeds_the_queue_from_the_bus(tmp_path):
+    bus = SqliteProgressBus(tmp_path / "p.db")
+    bus.publish("t1", TaskProgress(stage="aligning", progress_pct=55), origin="worker")
+
+    async def scenario():
+        return ProgressStore(SqliteProgressBus(tmp_path / "p.db")).subscribe("t1").get_nowait()
+
+    assert asyncio.run(scenario()).stage == "aligning"
+
+
+@pytest.mark.parametrize(
+    ("kwargs", "expected"),
+    [({}, InMemoryProgressBus), ({"progress_bus": "database"}, SqliteProgressBus)],
+)
+def test_progress_bus_from_config(tmp_path, kwargs, expected):
+    config = Config(storage_path=tmp_path, **kwargs)
+    bus = progress_bus_from_config(config)
+    assert isinstance(bus, expected)
+    if isinstance(bus, SqliteProgressBus):
+        assert bus.db_path == tmp_path / "task_progress.db"
+
+
+def test_sqlite_bus_prunes_expired_events(tmp_path):
+    bus = SqliteProgressBus(tmp_path / "p.db", retention_sec=0)
+    for i in range(100):
+        bus.publish(f"t{i}", TaskProgress(progress_pct=i), origin="o")
+    assert bus.latest("t0") is None
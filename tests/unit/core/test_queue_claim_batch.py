@@ -0,0 +1,231 @@
+# Copyright 2025-2026 Thestill
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Batch claiming and push-based wakeups for the SQLite queue.
+
+``claim_batch`` replaces the worker's one-transaction-per-slot polling: an
+idle queue must not take the writer lock at all, a busy one claims up to N
+rows in one transaction, and a batch never holds two tasks for one target.
+``QueueWakeup`` lets an enqueue wake the matching stage poller immediately
+instead of after a full ``poll_interval``.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+from unittest.mock import MagicMock
+
+import pytest
+
+from thestill.core.queue_manager import QueueManager, QueueWakeup, TaskStage, TaskStatus, get_queue_wakeup
+from thestill.core.task_worker import TaskWorker
+from thestill.models.podcast import Episode, Podcast
+from thestill.repositories.sqlite_podcast_repository import SqlitePodcastRepository
+
+EPISODE_IDS = [f"00000000-0000-0000-0000-0000000000e{i}" for i in range(1, 5)]
+
+
+@pytest.fixture
+def db_path(tmp_path: Path) -> str:
+    path = str(tmp_path / "claim.db")
+    repo = SqlitePodcastRepository(db_path=path)
+    repo.save(
+        Podcast(
+            id="00000000-0000-0000-0000-000000000001",
+            rss_url="https://example.com/feed.xml",
+            title="Claim Batch Podcast",
+            description="",
+            episodes=[
+                Episode(
+                    id=episode_id,
+                    external_id=f"ep-{i}",
+                    title=f"Episode {i}",
+                    description="",
+                    pub_date=datetime(2026, 1, i + 1, tzinfo=timezone.utc),
+                    audio_url=f"https://example.com/ep{i}.mp3",
+                    duration=60,
+                )
+                for i, episode_id in enumerate(EPISODE_IDS)
+            ],
+        )
+    )
+    return path
+
+
+class TestClaimBatch:
+    def test_claims_up_to_n_in_priority_order(self, db_path):
+        qm = QueueManager(db_path)
+        low = qm.add_task(EPISODE_IDS[0], TaskStage.CLEAN, priority=0)
+        high = qm.add_task(EPISODE_IDS[1], TaskStage.CLEAN, priority=10)
+        qm.add_task(EPISODE_IDS[2], TaskStage.CLEAN, priority=0)
+
+        claimed = qm.claim_batch(TaskStage.CLEAN, 2)
+
+        assert [t.id for t in claimed] == [high.id, low.id]
+        assert all(t.status == TaskStatus.PROCESSING and t.started_at is not None for t in claimed)
+        assert qm.get_task(high.id).status == TaskStatus.PROCESSING
+        assert len(qm.claim_batch(TaskStage.CLEAN, 5)) == 1
+
+    def test_one_task_per_episode_per_batch(self, db_path):
+        qm = QueueManager(db_path)
+        first = qm.add_task(EPISODE_IDS[0], TaskStage.CLEAN)
+        dup = qm.add_task(EPISODE_IDS[0], TaskStage.CLEAN)
+        other = qm.add_task(EPISODE_IDS[1], TaskStage.CLEAN)
+
+        claimed = qm.claim_batch(TaskStage.CLEAN, 3)
+
+        assert {t.id for t in claimed} == {first.id, other.id}
+        assert qm.get_task(dup.id).status == TaskStatus.PENDING
+
+    def test_respects_stage_and_exclusions(self, db_path):
+        qm = QueueManager(db_path)
+        qm.add_task(EPISODE_IDS[0], TaskStage.CLEAN)
+        kept = qm.add_task(EPISODE_IDS[1], TaskStage.CLEAN)
+        qm.add_task(EPISODE_IDS[2], TaskStage.SUMMARIZE)
+
+        claimed = qm.claim_batch(TaskStage.CLEAN, 5, exclude_episode_ids={EPISODE_IDS[0]})
+
+        assert [t.id for t in claimed] == [kept.id]
+
+    def test_empty_queue_never_takes_the_writer_lock(self, db_path, monkeypatch):
+        qm = QueueManager(db_path)
+        statements: list[str] = []
+        real_get_connection = QueueManager._get_connection
+
+        def tracing_get_connection(self):
+            cm = real_get_connection(self)
+
+            class _Wrapped:
+                def __enter__(self_inner):
+                    self_inner.conn = cm.__enter__()
+                    self_inner.conn.set_trace_callback(statements.append)
+                    return self_inner.conn
+
+                def __exit__(self_inner, *exc):
+                    # Pooled connections outlive this call; don't leak the tracer.
+                    self_inner.conn.set_trace_callback(None)
+                    return cm.__exit__(*exc)
+
+            return _Wrapped()
+
+        monkeypatch.setattr(QueueManager, "_get_connection", tracing_get_connection)
+
+        assert qm.claim_batch(TaskStage.CLEAN, 4) == []
+        assert not any("BEGIN IMMEDIATE" in sql for sql in statements)
+
+    def test_non_positive_n_claims_nothing(self, db_path):
+        qm = QueueManager(db_path)
+        task = qm.add_task(EPISODE_IDS[0], TaskStage.CLEAN)
+        assert qm.claim_batch(TaskStage.CLEAN, 0) == []
+        assert qm.get_task(task.id).status == TaskStatus.PENDING
+
+
+class TestQueueWakeup:
+    def test_add_task_notifies_with_stage(self, db_path):
+        qm = QueueManager(db_path)
+        seen: list = []
+        unsubscribe = qm.wakeup.subscribe(seen.append)
+        try:
+            qm.add_task(EPISODE_IDS[0], TaskStage.DOWNSAMPLE)
+        finally:
+            unsubscribe()
+        qm.add_task(EPISODE_IDS[1], TaskStage.CLEAN)
+
+        assert seen == [TaskStage.DOWNSAMPLE]
+
+    def test_managers_on_one_database_share_the_wakeup(self, db_path):
+        assert QueueManager(db_path).wakeup is QueueManager(db_path).wakeup
+        assert get_queue_wakeup("a") is not get_queue_wakeup("b")
+
+    def test_raising_listener_does_not_fail_notify(self):
+        wakeup = QueueWakeup()
+        seen: list = []
+        wakeup.subscribe(MagicMock(side_effect=RuntimeError("boom")))
+        wakeup.subscribe(seen.append)
+        wakeup.notify(TaskStage.CLEAN)
+        assert seen == [TaskStage.CLEAN]
+
+    def test_worker_listens_for_cross_process_wakeups_when_the_queue_can(self, db_path):
+        qm = QueueManager(db_path)
+        stop_listening = MagicMock()
+        qm.listen_for_wakeups = MagicMock(return_value=stop_listening)
+        worker = TaskWorker(queue_manager=qm, task_handlers={}, poll_interval=2.0, repository=MagicMock())
+
+        unsubscribe = worker._subscribe_queue_wakeup()
+        assert worker._idle_poll_interval == TaskWorker.LISTENING_POLL_INTERVAL
+        unsubscribe()
+        stop_listening.assert_called_once_with()
+        assert worker._idle_poll_interval == 2.0
+
+    def test_enqueue_wakes_idle_poller_before_poll_interval(self, db_path):
+        """A task enqueued while the worker idles is dispatched well inside
+        the (deliberately huge) poll interval."""
+        qm = QueueManager(db_path)
+        handled: list[str] = []
+        worker = TaskWorker(
+            queue_manager=qm,
+            task_handlers={TaskStage.CLEAN: lambda task, _progress=None: handled.append(task.id)},
+            poll_interval=30.0,
+            repository=MagicMock(),
+        )
+        worker.start()
+        try:
+            deadline = time.monotonic() + 5
+            while not worker._wakeup_events and time.monotonic() < deadline:
+                time.sleep(0.02)
+            time.sleep(0.2)  # let every poller reach its idle wait
+            task = qm.add_task(EPISODE_IDS[0], TaskStage.CLEAN)
+            while task.id not in handled and time.monotonic() < deadline:
+                time.sleep(0.02)
+        finally:
+            worker.stop(timeout=5)
+
+        assert handled == [task.id]
+
+
+class TestPollLoopBatching:
+    def test_unfilled_reservations_release_the_probe(self):
+        """A half-open probe reserved for a batch the queue could not fill
+        must be released, or the stage wedges."""
+        qm = MagicMock()
+        qm.claim_batch.return_value = []
+        worker = TaskWorker(
+            queue_manager=qm,
+            task_handlers={TaskStage.CLEAN: MagicMock()},
+            repository=MagicMock(),
+            poll_interval=0,
+            circuit_breaker_enabled=True,
+            circuit_failure_threshold=1,
+            circuit_cooldown_seconds=0.0,
+        )
+        worker._breaker.record_failure(TaskStage.CLEAN)
+
+        def stop_after_one(*_args, **_kwargs):
+            worker._running = False
+            return []
+
+        qm.claim_batch.side_effect = stop_after_one
+
+        async def run():
+            worker._running = True
+            await worker._stage_poll_loop(TaskStage.CLEAN, asyncio.Semaphore(1))
+
+        asyncio.run(run())
+
+        qm.claim_batch.assert_called_once()
+        assert qm.claim_batch.call_args.args[:2] == (TaskStage.CLEAN, 1)
+        assert worker._breaker.allow_dispatch(TaskStage.CLEAN) is True
@@ -0,0 +1,137 @@
+# Copyright 2025-2026 Thestill
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Adaptive refresh cadence: publish rhythm, backoff, feed hints, jitter."""
+
+import random
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from thestill.core.refresh_cadence import (
+    RefreshCadenceSettings,
+    feed_hint_seconds,
+    plan_refresh,
+    publish_gap_seconds,
+)
+
+NOW = datetime(2026, 7, 10, 12, 0, 0, tzinfo=timezone.utc)
+HOUR = 3600
+DAY = 86400
+NO_JITTER = RefreshCadenceSettings(jitter_percent=0)
+
+
+def _daily(count=5, newest=NOW):
+    return [newest - timedelta(days=d) for d in range(count)]
+
+
+def _plan(**kwargs):
+    args = dict(
+        current_interval=HOUR,
+        found_new=False,
+        prior_unchanged_streak=0,
+        pub_dates=_daily(),
+        hint_seconds=None,
+        min_interval=600,
+        max_interval=DAY,
+        settings=NO_JITTER,
+        now=NOW,
+    )
+    args.update(kwargs)
+    return plan_refresh(**args)
+
+
+class TestFeedHint:
+    def test_ttl_is_minutes(self):
+        assert feed_hint_seconds("60", None, None) == HOUR
+
+    def test_update_period_divided_by_frequency(self):
+        assert feed_hint_seconds(None, "daily", "4") == 6 * HOUR
+        assert feed_hint_seconds(None, " Weekly ", None) == 7 * DAY
+
+    def test_longest_hint_wins(self):
+        assert feed_hint_seconds("30", "daily", "2") == 12 * HOUR
+
+    @pytest.mark.parametrize(
+        "ttl,period,frequency",
+        [(None, None, None), ("soon", None, None), ("0", "fortnightly", None), ("-5", None, "3")],
+    )
+    def test_malformed_ignored(self, ttl, period, frequency):
+        assert feed_hint_seconds(ttl, period, frequency) is None
+
+    def test_malformed_frequency_defaults_to_one(self):
+        assert feed_hint_seconds(None, "hourly", "often") == HOUR
+
+
+class TestPublishGap:
+    def test_median_of_recent_gaps(self):
+        dates = [NOW, NOW - timedelta(days=1), NOW - timedelta(days=3), NOW - timedelta(days=4)]
+        assert publish_gap_seconds(dates) == DAY
+
+    def test_batch_release_gaps_skipped(self):
+        batch = [NOW - timedelta(minutes=m) for m in range(5)]
+        assert publish_gap_seconds(batch) is None
+        assert publish_gap_seconds(batch + [NOW - timedelta(days=7), NOW - timedelta(days=14)]) == pytest.approx(
+            7 * DAY, abs=300
+        )
+
+    def test_only_newest_history_counts(self):
+        old = [NOW - timedelta(days=400 + 30 * n) for n in range(20)]
+        assert publish_gap_seconds(_daily(11) + old) == DAY
+
+    def test_too_little_history(self):
+        assert publish_gap_seconds([]) is None
+        assert publish_gap_seconds(_daily(2)) is None
+
+
+class TestPlanRefresh:
+    def test_polls_per_publish_gap(self):
+        plan = _plan(found_new=True, prior_unchanged_streak=7)
+        assert plan.interval_seconds == 6 * HOUR
+        assert plan.unchanged_streak == 0
+        assert plan.next_refresh_at == NOW + timedelta(hours=6)
+
+    def test_backoff_once_streak_outlasts_gap(self):
+        assert _plan(prior_unchanged_streak=3).interval_seconds == 6 * HOUR
+        assert _plan(prior_unchanged_streak=4).interval_seconds == 9 * HOUR
+        assert _plan(prior_unchanged_streak=5).interval_seconds == int(13.5 * HOUR)
+        assert _plan(prior_unchanged_streak=500).interval_seconds == DAY
+
+    def test_dormant_feed_polled_at_max(self):
+        plan = _plan(found_new=True, pub_dates=_daily(newest=NOW - timedelta(days=11)))
+        assert plan.interval_seconds == DAY
+
+    def test_hint_is_a_floor(self):
+        assert _plan(found_new=True, hint_seconds=12 * HOUR).interval_seconds == 12 * HOUR
+        assert _plan(found_new=True, hint_seconds=HOUR).interval_seconds == 6 * HOUR
+
+    def test_clamped_to_operator_bounds(self):
+        hourly = [NOW - timedelta(hours=h) for h in range(5)]
+        assert _plan(found_new=True, pub_dates=hourly).interval_seconds == 900
+        assert _plan(found_new=True, pub_dates=hourly, min_interval=1800).interval_seconds == 1800
+        assert _plan(found_new=True, hint_seconds=7 * DAY).interval_seconds == DAY
+
+    def test_aimd_without_history(self):
+        assert _plan(found_new=True, pub_dates=[]).interval_seconds == HOUR // 2
+        assert _plan(found_new=False, pub_dates=[]).interval_seconds == int(1.5 * HOUR)
+
+    def test_jitter_spreads_due_time_not_interval(self):
+        settings = RefreshCadenceSettings(jitter_percent=10)
+        rng = random.Random(7)
+        plans = [_plan(found_new=True, settings=settings, rng=rng) for _ in range(50)]
+        delays = {(p.next_refresh_at - NOW).total_seconds() for p in plans}
+
+        assert {p.interval_seconds for p in plans} == {6 * HOUR}
+        assert len(delays) > 1
+        assert all(0.9 * 6 * HOUR <= d <= 1.1 * 6 * HOUR for d in delays)
@@ -26,6 +26,7 @@ from __future__ import annotations
 import sqlite3
 from datetime import datetime, timedelta, timezone
 from pathlib import Path
+from types import SimpleNamespace
 
 import pytest
 
@@ -173,3 +174,72 @@ class TestRecoverInterruptedTasks:
         nxt = qm.get_next_task(stage=TaskStage.DOWNLOAD)
         assert nxt is not None
         assert nxt.status == TaskStatus.PROCESSING  # get_next_task claims it
+
+
+def _set_processing(qm: QueueManager, stage: TaskStage, started_at: datetime) -> None:
+    con = sqlite3.connect(qm.db_path)
+    con.execute(
+        "UPDATE tasks SET status='processing', started_at=? WHERE stage=?",
+        (started_at.isoformat(), stage.value),
+    )
+    con.commit()
+    con.close()
+
+
+class TestRecoverOnlyOrphansBesidePeers:
+    """Two ``BackgroundServices`` over one database stand in for two workers."""
+
+    def _services(self, qm: QueueManager):
+        from unittest.mock import MagicMock
+
+        from thestill.web.background import BackgroundServices
+
+        config = SimpleNamespace(database_url="", database_path=qm.db_path, transcription_provider="whisper")
+        task_worker = MagicMock(stages=(TaskStage.DOWNLOAD, TaskStage.EXTRACT_ENTITIES), stale_timeout_minutes=30)
+        app_state = SimpleNamespace(
+            config=config,
+            queue_manager=qm,
+            task_worker=task_worker,
+            refresh_scheduler=None,
+            briefing_scheduler=None,
+        )
+        return BackgroundServices(app_state, run_schedulers=False)
+
+    def test_second_worker_leaves_peer_tasks_running(self, qm):
+        qm.add_task(episode_id=EPISODE_ID, stage=TaskStage.DOWNLOAD)
+        qm.add_task(episode_id=EPISODE_ID, stage=TaskStage.EXTRACT_ENTITIES)
+        now = datetime.now(timezone.utc)
+
+        first = self._services(qm)
+        first._start_worker()
+        # The first worker claims both tasks.
+        _set_processing(qm, TaskStage.DOWNLOAD, now)
+        _set_processing(qm, TaskStage.EXTRACT_ENTITIES, now)
+
+        second = self._services(qm)
+        second._start_worker()
+        try:
+            assert _status_by_stage(qm) == {"download": "processing", "extract-entities": "processing"}
+
+            # A task stuck past the stale timeout is an orphan even beside peers.
+            _set_processing(qm, TaskStage.DOWNLOAD, now - timedelta(hours=2))
+            assert qm.recover_interrupted_tasks(started_before=now - timedelta(minutes=30)) == 1
+            assert _status_by_stage(qm)["download"] == "pending"
+        finally:
+            second.stop()
+            first.stop()
+
+    def test_lone_restart_recovers_everything(self, qm):
+        qm.add_task(episode_id=EPISODE_ID, stage=TaskStage.DOWNLOAD)
+        qm.add_task(episode_id=EPISODE_ID, stage=TaskStage.EXTRACT_ENTITIES)
+        crashed = self._services(qm)
+        crashed._start_worker()
+        _mark_all_processing(qm)
+        crashed.stop()  # releases its presence lease, as a clean stop would
+
+        restarted = self._services(qm)
+        restarted._start_worker()
+        try:
+            assert _status_by_stage(qm) == {"download": "pending", "extract-entities": "failed"}
+        finally:
+            restarted.stop()
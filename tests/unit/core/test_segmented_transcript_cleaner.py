@@ -20,6 +20,8 @@ a real LLM happens in integration tests, not here.
 """
 
 import json
+import threading
+import time
 from typing import Any, Dict, List, Optional, Type
 
 import pytest
@@ -34,6 +36,7 @@ from thestill.core.segmented_transcript_cleaner import (
 )
 from thestill.models.annotated_transcript import AnnotatedSegment, AnnotatedTranscript, WordSpan
 from thestill.models.facts import EpisodeFacts, PodcastFacts
+from thestill.utils.exceptions import ProhibitedContentError
 
 
 class FakeProvider(MockLLMProvider):
@@ -381,6 +384,125 @@ class TestConstructorValidation:
         with pytest.raises(ValueError, match="batch_char_budget"):
             SegmentedTranscriptCleaner(FakeProvider(), batch_char_budget=0)
 
+    def test_zero_batch_concurrency_raises(self) -> None:
+        with pytest.raises(ValueError, match="batch_concurrency"):
+            SegmentedTranscriptCleaner(FakeProvider(), batch_concurrency=0)
+
+
+class TestPipelinedBatches:
+    """``batch_concurrency > 1`` pipelines batches with raw previous context."""
+
+    @staticmethod
+    def _segments(count: int) -> List[AnnotatedSegment]:
+        return [
+            _segment(seg_id=i, start=float(i), end=float(i + 1), text=f"raw {i:02d} " + "x" * 44) for i in range(count)
+        ]
+
+    def test_output_matches_serial_mode(self) -> None:
+        outputs = []
+        for concurrency in (1, 4):
+            cleaner = SegmentedTranscriptCleaner(FakeProvider(), batch_char_budget=50, batch_concurrency=concurrency)
+            result = cleaner.clean(
+                _annotated(self._segments(9)), podcast_facts=None, episode_facts=_facts(), language="en"
+            )
+            outputs.append([(s.id, s.text, s.kind, s.source_segment_ids) for s in result.segments])
+
+        assert outputs[0] == outputs[1]
+        assert [text for _, text, _, _ in outputs[1]] == [f"id={i}" for i in range(9)]
+
+    def test_previous_context_comes_from_raw_source(self) -> None:
+        provider = FakeProvider()
+        cleaner = SegmentedTranscriptCleaner(provider, batch_char_budget=50, k_prev=2, batch_concurrency=3)
+
+        cleaner.clean(_annotated(self._segments(5)), podcast_facts=None, episode_facts=_facts(), language="en")
+
+        by_target = {call["target_ids"][0]: call["payload"] for call in provider.calls}
+        assert set(by_target[3].keys()) == {"previous_raw", "target", "next_raw"}
+        assert [seg["text"][:6] for seg in by_target[3]["previous_raw"]] == ["raw 01", "raw 02"]
+        # Speaker mapping is applied to the raw context as well.
+        assert by_target[3]["previous_raw"][0]["speaker"] == "Alice"
+        assert by_target[0]["previous_raw"] == []
+
+    def test_system_prompt_describes_raw_previous_context(self) -> None:
+        provider = FakeProvider()
+        cleaner = SegmentedTranscriptCleaner(provider, batch_concurrency=2)
+
+        cleaner.clean(_annotated([_segment(seg_id=0)]), podcast_facts=None, episode_facts=_facts(), language="en")
+
+        system_prompt = next(m["content"] for m in provider.calls[0]["messages"] if m["role"] == "system")
+        assert "'previous_raw'" in system_prompt
+        assert "'previous_cleaned'" not in system_prompt
+
+    def test_in_flight_calls_are_bounded(self) -> None:
+        provider = FakeProvider(model_name="bounded-test-model")
+        lock = threading.Lock()
+        in_flight = {"now": 0, "peak": 0}
+        original = provider.patch_factory
+
+        def slow_factory(target_ids):
+            with lock:
+                in_flight["now"] += 1
+                in_flight["peak"] = max(in_flight["peak"], in_flight["now"])
+            time.sleep(0.02)
+            with lock:
+                in_flight["now"] -= 1
+            return original(target_ids)
+
+        provider.patch_factory = slow_factory
+        cleaner = SegmentedTranscriptCleaner(provider, batch_char_budget=50, batch_concurrency=3)
+
+        cleaner.clean(_annotated(self._segments(12)), podcast_facts=None, episode_facts=_facts(), language="en")
+
+        assert len(provider.calls) == 12
+        assert 1 < in_flight["peak"] <= 3
+
+    def test_prohibited_batch_falls_back_to_source(self) -> None:
+        provider = FakeProvider()
+        original = provider.patch_factory
+
+        def factory(target_ids):
+            if 2 in target_ids:
+                raise ProhibitedContentError("refused", provider="gemini", finish_reason="PROHIBITED_CONTENT")
+            return original(target_ids)
+
+        provider.patch_factory = factory
+        cleaner = SegmentedTranscriptCleaner(provider, batch_char_budget=50, batch_concurrency=4)
+
+        result = cleaner.clean(_annotated(self._segments(5)), podcast_facts=None, episode_facts=_facts(), language="en")
+
+        assert [s.text[:6] for s in result.segments] == ["id=0", "id=1", "raw 02", "id=3", "id=4"]
+        assert [s.id for s in result.segments] == [0, 1, 2, 3, 4]
+        stats = cleaner.last_clean_stats
+        assert stats.batches == 5
+        assert stats.prohibited_batches == 1
+        assert stats.patches_emitted == 4
+
+    def test_other_errors_propagate(self) -> None:
+        provider = FakeProvider()
+
+        def factory(target_ids):
+            raise RuntimeError("provider exploded")
+
+        provider.patch_factory = factory
+        cleaner = SegmentedTranscriptCleaner(provider, batch_char_budget=50, batch_concurrency=2)
+
+        with pytest.raises(RuntimeError, match="provider exploded"):
+            cleaner.clean(_annotated(self._segments(4)), podcast_facts=None, episode_facts=_facts(), language="en")
+
+    def test_stats_record_coverage(self) -> None:
+        provider = FakeProvider()
+        provider.patch_factory = lambda target_ids: [  # noqa: E731
+            CleanupPatch(id=i, cleaned_text="fixed") for i in target_ids if i % 2 == 0
+        ]
+        cleaner = SegmentedTranscriptCleaner(provider, batch_char_budget=50, batch_concurrency=2)
+
+        cleaner.clean(_annotated(self._segments(4)), podcast_facts=None, episode_facts=_facts(), language="en")
+
+        stats = cleaner.last_clean_stats
+        assert (stats.segments, stats.batches, stats.patches_emitted) == (4, 4, 2)
+        assert stats.coverage == 0.5
+        assert stats.batch_concurrency == 2
+
 
 class TestBlendedMarkdownRenderContract:
     """Running the cleaner and rendering must produce legacy-compatible output."""
@@ -127,7 +127,7 @@ class TestProbeReleaseOnPollError:
     def test_poll_error_mid_probe_releases_reservation(self):
         """2026-07-27 incident: Postgres shut down seconds before the transcribe
         breaker's cooldown elapsed. The poller's ``allow_dispatch`` promoted the
-        breaker to HALF_OPEN and reserved the probe, then ``get_next_task``
+        breaker to HALF_OPEN and reserved the probe, then ``claim_batch``
         raised — skipping both the empty-queue ``cancel_dispatch`` and the
         dispatch path — so ``probe_in_flight`` stayed set and the stage
         dispatched nothing until a process restart. A poll error while the
@@ -139,11 +139,11 @@ class TestProbeReleaseOnPollError:
         breaker.record_failure(STAGE.value)  # threshold=1 → OPEN
         assert breaker.state(STAGE.value) == CircuitState.OPEN
 
-        def db_down_mid_probe(**_kwargs):
+        def db_down_mid_probe(*_args, **_kwargs):
             worker._running = False  # let the loop exit after this iteration
             raise RuntimeError("connection refused")
 
-        worker.queue_manager.get_next_task.side_effect = db_down_mid_probe
+        worker.queue_manager.claim_batch.side_effect = db_down_mid_probe
 
         async def run():
             worker._running = True
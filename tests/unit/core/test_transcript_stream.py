@@ -0,0 +1,151 @@
+# Copyright 2025-2026 Thestill
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Streaming transcript reader: parity with the Pydantic models, chunk edges, errors."""
+
+import io
+import math
+
+import pytest
+
+from thestill.core.transcript_stream import (
+    TranscriptStreamError,
+    TranscriptStreamReader,
+    iter_segments,
+    load_segments,
+)
+from thestill.models.annotated_transcript import AnnotatedSegment, AnnotatedTranscript, WordSpan
+from thestill.models.transcript import Segment, Transcript, Word
+
+
+def _raw_transcript(n_segments=40) -> Transcript:
+    segments = []
+    for i in range(n_segments):
+        words = [
+            Word(word=f'w{i}.{j} "quoted" [b]{{c}}\\', start=i + j / 10, end=i + j / 10 + 0.05, probability=0.9)
+            for j in range(6)
+        ]
+        words.append(Word(word="uh"))  # no timestamps
+        segments.append(
+            Segment(id=i, start=float(i), end=i + 0.9, text=f"Segment {i} ]}} é", speaker="SPEAKER_00", words=words)
+        )
+    return Transcript(
+        audio_file="a.wav",
+        language="en",
+        text="full text with {braces} and [brackets]",
+        segments=segments,
+        processing_time=1.5,
+        model_used="whisper",
+        timestamp=1700000000.0,
+    )
+
+
+def _annotated() -> AnnotatedTranscript:
+    return AnnotatedTranscript(
+        episode_id="ep-1",
+        playback_time_offset_seconds=2.5,
+        segments=[
+            AnnotatedSegment(
+                id=0,
+                start=0.0,
+                end=4.0,
+                speaker="SPEAKER_00",
+                text="Welcome back.",
+                source_segment_ids=[0, 1],
+                source_word_span=WordSpan(start_segment_id=0, start_word_index=0, end_segment_id=1, end_word_index=2),
+            ),
+            AnnotatedSegment(id=1, start=4.0, end=30.0, text="Ad read.", kind="ad_break", sponsor="Acme"),
+        ],
+    )
+
+
+@pytest.mark.parametrize("chunk_size", [1024, 4096, 1 << 20])
+def test_raw_segments_match_the_model_at_any_chunk_size(chunk_size):
+    model = _raw_transcript()
+    payload = model.model_dump_json(indent=2)
+
+    reader = TranscriptStreamReader(io.StringIO(payload), chunk_size=chunk_size, words="arrays")
+    views = list(reader)
+
+    assert [(v.id, v.start, v.end, v.text, v.speaker) for v in views] == [
+        (s.id, s.start, s.end, s.text, s.speaker) for s in model.segments
+    ]
+    words = views[3].words
+    assert words.words == [w.word for w in model.segments[3].words]
+    assert list(words.starts[:6]) == [w.start for w in model.segments[3].words[:6]]
+    assert math.isnan(words.starts[6]) and math.isnan(words.ends[6])
+    assert views[0].extra == {"confidence": None}
+    assert reader.header["text"] == model.text
+    assert reader.header["timestamp"] == model.timestamp
+
+
+def test_words_are_skipped_by_default():
+    views = list(iter_segments(_raw_transcript().model_dump_json()))
+    assert all(v.words is None for v in views)
+    assert views[-1].text == _raw_transcript().segments[-1].text
+
+
+def test_annotated_sidecar_from_a_path(tmp_path):
+    path = tmp_path / "ep_cleaned.json"
+    path.write_text(_annotated().model_dump_json(indent=2), encoding="utf-8")
+
+    loaded = load_segments(path)
+
+    assert [(s.id, s.kind, s.text) for s in loaded.segments] == [
+        (0, "content", "Welcome back."),
+        (1, "ad_break", "Ad read."),
+    ]
+    assert loaded.segments[1].extra["sponsor"] == "Acme"
+    assert loaded.segments[0].extra["source_word_span"]["end_word_index"] == 2
+    assert loaded.header["episode_id"] == "ep-1"
+    assert loaded.header["playback_time_offset_seconds"] == 2.5
+
+
+def test_sidecar_without_kind_matches_the_model():
+    # Writers may omit ``kind``; the model reads it as "content", and so must the stream.
+    payload = _annotated().model_dump_json(exclude_defaults=True)
+    assert '"kind": "content"' not in payload and '"kind":"content"' not in payload
+
+    model = AnnotatedTranscript.model_validate_json(payload)
+    loaded = load_segments(payload, default_kind="content")
+
+    assert [s.kind for s in loaded.segments] == [s.kind for s in model.segments] == ["content", "ad_break"]
+    assert load_segments(payload).segments[0].kind is None
+
+
+def test_empty_and_null_segments():
+    assert load_segments('{"segments": [], "language": "en"}').header == {"language": "en"}
+    assert load_segments('{"segments": null}').segments == []
+    seg = load_segments('{"segments": [{"id": 0, "start": 0, "end": 1, "words": []}]}', words="arrays").segments[0]
+    assert len(seg.words) == 0
+
+
+@pytest.mark.parametrize(
+    "payload",
+    [
+        "[]",
+        '{"segments": [{"id": 0, "start": 0, "end": 1}',  # truncated
+        '{"segments": [{"id": 0, "start": 0, "end": 1, "words": [{"word": "a"}',  # truncated inside skipped words
+        '{"segments": [{"start": 0, "end": 1}]}',  # no id
+        '{"segments": []} trailing',
+    ],
+)
+def test_malformed_input_raises(payload):
+    with pytest.raises(TranscriptStreamError):
+        load_segments(payload)
+
+
+def test_word_mode_is_validated():
+    with pytest.raises(ValueError):
+        TranscriptStreamReader("{}", words="full")  # type: ignore[arg-type]
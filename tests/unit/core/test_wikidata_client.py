@@ -86,19 +86,19 @@ class TestFetchP31:
         resp = MagicMock()
         resp.status_code = 200
         resp.json.return_value = _wikidata_response("Q317521", ["Q5"])
-        with patch("thestill.core.wikidata_client.requests.get", return_value=resp):
+        with patch("thestill.core.wikimedia_http.requests.Session.get", return_value=resp):
             assert client.fetch_p31("Q317521") == ["Q5"]
 
     def test_empty_qid_short_circuits_without_request(self):
         client = WikidataClient()
-        with patch("thestill.core.wikidata_client.requests.get") as get:
+        with patch("thestill.core.wikimedia_http.requests.Session.get") as get:
             assert client.fetch_p31("") == []
         assert get.call_count == 0
 
     def test_network_error_returns_empty_list(self):
         client = WikidataClient()
         with patch(
-            "thestill.core.wikidata_client.requests.get",
+            "thestill.core.wikimedia_http.requests.Session.get",
             side_effect=requests.ConnectionError("network down"),
         ):
             assert client.fetch_p31("Q317521") == []
@@ -107,7 +107,7 @@ class TestFetchP31:
         client = WikidataClient()
         resp = MagicMock()
         resp.status_code = 503
-        with patch("thestill.core.wikidata_client.requests.get", return_value=resp):
+        with patch("thestill.core.wikimedia_http.requests.Session.get", return_value=resp):
             assert client.fetch_p31("Q317521") == []
 
     def test_invalid_json_returns_empty_list(self):
@@ -115,7 +115,7 @@ class TestFetchP31:
         resp = MagicMock()
         resp.status_code = 200
         resp.json.side_effect = ValueError("not json")
-        with patch("thestill.core.wikidata_client.requests.get", return_value=resp):
+        with patch("thestill.core.wikimedia_http.requests.Session.get", return_value=resp):
             assert client.fetch_p31("Q317521") == []
 
     def test_cached_qid_only_hits_network_once(self):
@@ -123,7 +123,7 @@ class TestFetchP31:
         resp = MagicMock()
         resp.status_code = 200
         resp.json.return_value = _wikidata_response("Q5", ["Q15632617"])
-        with patch("thestill.core.wikidata_client.requests.get", return_value=resp) as get:
+        with patch("thestill.core.wikimedia_http.requests.Session.get", return_value=resp) as get:
             client.fetch_p31("Q5")
             client.fetch_p31("Q5")
             client.fetch_p31("Q5")
@@ -179,13 +179,13 @@ class TestFetchFacts:
         client = WikidataClient()
         resp = MagicMock(status_code=200)
         resp.json.return_value = _facts_payload("Q317521")
-        with patch("thestill.core.wikidata_client.requests.get", return_value=resp):
+        with patch("thestill.core.wikimedia_http.requests.Session.get", return_value=resp):
             wd = client.fetch_facts("Q317521")
         assert wd is not None and wd.first_string("P18") == "Musk.jpg"
 
     def test_empty_qid_short_circuits(self):
         client = WikidataClient()
-        with patch("thestill.core.wikidata_client.requests.get") as get:
+        with patch("thestill.core.wikimedia_http.requests.Session.get") as get:
             assert client.fetch_facts("") is None
         assert get.call_count == 0
 
@@ -193,7 +193,7 @@ class TestFetchFacts:
         # Spec #42 FM-1: transient failure must NOT collapse to "no data".
         client = WikidataClient()
         with patch(
-            "thestill.core.wikidata_client.requests.get",
+            "thestill.core.wikimedia_http.requests.Session.get",
             side_effect=requests.ConnectionError("down"),
         ):
             with pytest.raises(EnrichmentUnavailable):
@@ -202,7 +202,7 @@ class TestFetchFacts:
     def test_non_200_raises_unavailable(self):
         client = WikidataClient()
         resp = MagicMock(status_code=503)
-        with patch("thestill.core.wikidata_client.requests.get", return_value=resp):
+        with patch("thestill.core.wikimedia_http.requests.Session.get", return_value=resp):
             with pytest.raises(EnrichmentUnavailable):
                 client.fetch_facts("Q317521")
 
@@ -213,7 +213,7 @@ class TestFetchFacts:
         ok = MagicMock(status_code=200)
         ok.json.return_value = _facts_payload("Q5")
         with patch(
-            "thestill.core.wikidata_client.requests.get",
+            "thestill.core.wikimedia_http.requests.Session.get",
             side_effect=[requests.ConnectionError("down"), ok],
         ):
             with pytest.raises(EnrichmentUnavailable):
@@ -232,28 +232,28 @@ class TestFetchLabels:
     def test_resolves_labels(self):
         client = WikidataClient()
         resp = self._labels_response({"Q131524": "entrepreneur", "Q5": "human"})
-        with patch("thestill.core.wikidata_client.requests.get", return_value=resp):
+        with patch("thestill.core.wikimedia_http.requests.Session.get", return_value=resp):
             labels = client.fetch_labels(["Q131524", "Q5"])
         assert labels == {"Q131524": "entrepreneur", "Q5": "human"}
 
     def test_cached_labels_skip_second_request(self):
         client = WikidataClient()
         resp = self._labels_response({"Q5": "human"})
-        with patch("thestill.core.wikidata_client.requests.get", return_value=resp) as get:
+        with patch("thestill.core.wikimedia_http.requests.Session.get", return_value=resp) as get:
             client.fetch_labels(["Q5"])
             client.fetch_labels(["Q5"])
         assert get.call_count == 1
 
     def test_empty_input_makes_no_request(self):
         client = WikidataClient()
-        with patch("thestill.core.wikidata_client.requests.get") as get:
+        with patch("thestill.core.wikimedia_http.requests.Session.get") as get:
             assert client.fetch_labels([]) == {}
         assert get.call_count == 0
 
     def test_network_error_raises_unavailable(self):
         client = WikidataClient()
         with patch(
-            "thestill.core.wikidata_client.requests.get",
+            "thestill.core.wikimedia_http.requests.Session.get",
             side_effect=requests.ConnectionError("down"),
         ):
             with pytest.raises(EnrichmentUnavailable):
@@ -0,0 +1,214 @@
+# Copyright 2025-2026 Thestill
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Pooled, disk-cached Wikimedia transport against a REAL local HTTP server.
+
+Conditional requests and the pooled session only show up on the wire, so
+the clients are pointed at a stub ``Special:EntityData`` / ``wbgetentities``
+/ ``page/summary`` server that counts requests and honours ``If-None-Match``.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+
+import pytest
+
+from thestill.core import wikidata_client, wikipedia_client
+from thestill.core.entity_enricher import EntityEnricher
+from thestill.core.wikidata_client import WikidataClient
+from thestill.core.wikimedia_http import HttpResponseCache, WikimediaHttp
+from thestill.core.wikipedia_client import WikipediaClient
+from thestill.models.enrichment import EnrichmentStatus, EnrichmentUnavailable
+from thestill.models.entities import EntityRecord, EntityType
+
+
+def _entity_payload(qid: str, refs: list[str]) -> dict:
+    claims = {"P31": [{"mainsnak": {"datavalue": {"type": "wikibase-entityid", "value": {"id": "Q5"}}}}]}
+    claims["P106"] = [{"mainsnak": {"datavalue": {"type": "wikibase-entityid", "value": {"id": r}}}} for r in refs]
+    return {
+        "entities": {
+            qid: {
+                "labels": {"en": {"value": qid}},
+                "descriptions": {"en": {"value": f"about {qid}"}},
+                "sitelinks": {"enwiki": {"title": f"Page {qid}"}},
+                "claims": claims,
+            }
+        }
+    }
+
+
+class _Stub(BaseHTTPRequestHandler):
+    entities: dict = {}
+    labels: dict = {}
+    requests: list = []
+    fail_with: int | None = None
+
+    def do_GET(self):  # noqa: N802 — BaseHTTPRequestHandler API
+        url = urlparse(self.path)
+        type(self).requests.append((url.path, dict(self.headers)))
+        if type(self).fail_with:
+            return self._send(type(self).fail_with, b"")
+        if url.path.startswith("/entity/"):
+            qid = url.path.rsplit("/", 1)[1].removesuffix(".json")
+            if qid not in self.entities:
+                return self._send(404, b"")
+            etag = f'"{qid}-v1"'
+            if self.headers.get("If-None-Match") == etag:
+                return self._send(304, b"", etag=etag)
+            return self._send(200, json.dumps(_entity_payload(qid, self.entities[qid])).encode(), etag=etag)
+        if url.path == "/api":
+            ids = parse_qs(url.query)["ids"][0].split("|")
+            body = {"entities": {q: {"labels": {"en": {"value": self.labels[q]}}} for q in ids if q in self.labels}}
+            return self._send(200, json.dumps(body).encode())
+        if url.path.startswith("/summary/"):
+            title = url.path.rsplit("/", 1)[1]
+            if title == "Missing":
+                return self._send(404, b"")
+            body = {"extract": f"{title} lead", "content_urls": {"desktop": {"page": f"https://wiki/{title}"}}}
+            return self._send(200, json.dumps(body).encode())
+        return self._send(404, b"")
+
+    def _send(self, status: int, body: bytes, *, etag: str | None = None) -> None:
+        self.send_response(status)
+        if etag:
+            self.send_header("ETag", etag)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):  # silence test output
+        pass
+
+
+@pytest.fixture
+def stub_server(monkeypatch):
+    _Stub.entities = {"Q1": ["Q100"], "Q2": ["Q100", "Q200"]}
+    _Stub.labels = {"Q100": "engineer", "Q200": "author"}
+    _Stub.requests = []
+    _Stub.fail_with = None
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _Stub)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    base = f"http://127.0.0.1:{server.server_address[1]}"
+    monkeypatch.setattr(wikidata_client, "WIKIDATA_ENTITY_URL", base + "/entity/{qid}.json")
+    monkeypatch.setattr(wikidata_client, "WIKIDATA_API_URL", base + "/api")
+    monkeypatch.setattr(wikipedia_client, "WIKIPEDIA_SUMMARY_URL", base + "/summary/{title}")
+    yield _Stub
+    server.shutdown()
+    thread.join(timeout=5)
+
+
+def _paths(stub) -> list[str]:
+    return [path for path, _ in stub.requests]
+
+
+def test_disk_cache_survives_clients_and_serves_p31_from_facts(stub_server, tmp_path):
+    db = tmp_path / "wm.db"
+    first = WikidataClient(http=WikimediaHttp(cache=HttpResponseCache(db)))
+    assert first.fetch_facts("Q1").description == "about Q1"
+
+    # A fresh process (new client + transport) reading the same file: the
+    # resolver's P31 lookup is answered from the enrichment fetch.
+    second = WikidataClient(http=WikimediaHttp(cache=HttpResponseCache(db)))
+    assert second.fetch_p31("Q1") == ["Q5"]
+    assert _paths(stub_server) == ["/entity/Q1.json"]
+
+
+def test_stale_entry_revalidates_with_etag(stub_server, tmp_path):
+    http = WikimediaHttp(cache=HttpResponseCache(tmp_path / "wm.db", ttl_sec=0))
+    WikidataClient(http=http).fetch_facts("Q1")
+    assert WikidataClient(http=http).fetch_facts("Q1").description == "about Q1"
+
+    (_, first_headers), (_, second_headers) = stub_server.requests
+    assert "If-None-Match" not in first_headers
+    assert second_headers["If-None-Match"] == '"Q1-v1"'
+    assert http.stats["revalidated"] == 1
+
+
+def test_outage_serves_stale_but_never_invents_data(stub_server, tmp_path):
+    http = WikimediaHttp(cache=HttpResponseCache(tmp_path / "wm.db", ttl_sec=0))
+    WikidataClient(http=http).fetch_facts("Q1")
+    stub_server.fail_with = 503
+
+    assert WikidataClient(http=http).fetch_facts("Q1").qid == "Q1"
+    assert http.stats["stale_served"] == 1
+    with pytest.raises(EnrichmentUnavailable):
+        WikidataClient(http=http).fetch_facts("Q2")
+
+
+def test_wikipedia_miss_is_cached(stub_server, tmp_path):
+    http = WikimediaHttp(cache=HttpResponseCache(tmp_path / "wm.db"))
+    assert WikipediaClient(http=http).fetch_summary("Missing") is None
+    assert WikipediaClient(http=http).fetch_summary("Missing") is None
+    assert _paths(stub_server) == ["/summary/Missing"]
+
+
+def test_cache_keeps_a_running_size_and_evicts_only_when_over(tmp_path, monkeypatch):
+    cache = HttpResponseCache(tmp_path / "wm.db", max_bytes=1000)
+    cache.put("a", 200, "x" * 5000, etag=None, last_modified=None)
+    cache.put("a", 200, "y", etag=None, last_modified=None)  # replaced, not added
+    small = cache._size_bytes
+    assert small == HttpResponseCache(tmp_path / "wm.db")._size_bytes  # re-summed at open
+
+    evictions = []
+    real_evict = cache._evict
+    monkeypatch.setattr(cache, "_evict", lambda conn: evictions.append(1) or real_evict(conn))
+    cache.put("b", 200, "z", etag=None, last_modified=None)
+    assert evictions == []  # under the bound: no table scan
+    for key in ("c", "d", "e"):
+        cache.put(key, 200, os.urandom(300).hex(), etag=None, last_modified=None)
+
+    assert evictions
+    assert cache._size_bytes <= 1000
+    assert cache.get("a") is None and cache.get("e") is not None
+
+
+def test_min_interval_spaces_network_requests_only(stub_server, tmp_path):
+    http = WikimediaHttp(cache=HttpResponseCache(tmp_path / "wm.db"), min_interval_sec=0.05)
+    client = WikidataClient(http=http)
+    start = time.monotonic()
+    client.fetch_facts("Q1")
+    client.fetch_facts("Q2")
+    assert time.monotonic() - start >= 0.05
+    WikidataClient(http=http).fetch_p31("Q1")  # cache hit: no request, no wait
+    assert len(stub_server.requests) == 2
+
+
+def test_enrich_many_batches_labels_across_entities(stub_server, tmp_path):
+    http = WikimediaHttp(cache=HttpResponseCache(tmp_path / "wm.db"), pool_size=4)
+    enricher = EntityEnricher(
+        wikidata_client=WikidataClient(http=http),
+        wikipedia_client=WikipediaClient(http=http),
+        find_entity_by_qid=lambda qid: None,
+    )
+    people = [
+        EntityRecord(id=f"person:{q.lower()}", type=EntityType.PERSON, canonical_name=q, wikidata_qid=q)
+        for q in ("Q1", "Q2", "Q404")
+    ]
+
+    outcomes = enricher.enrich_many(people, max_workers=4)
+
+    assert [entity.id for entity, _, _ in outcomes] == [p.id for p in people]
+    assert all(error is None for _, _, error in outcomes)
+    q1, q2, missing = (enrichment for _, enrichment, _ in outcomes)
+    assert [f.value for f in q2.facts if f.label == "Occupation"] == ["engineer, author"]
+    assert q1.wikipedia_extract == "Page_Q1 lead"
+    assert missing.wikidata_status == EnrichmentStatus.FAILED
+    assert _paths(stub_server).count("/api") == 1
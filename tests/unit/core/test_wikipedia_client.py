@@ -50,40 +50,40 @@ class TestFetchSummary:
         client = WikipediaClient()
         resp = MagicMock(status_code=200)
         resp.json.return_value = _summary_payload()
-        with patch("thestill.core.wikipedia_client.requests.get", return_value=resp):
+        with patch("thestill.core.wikimedia_http.requests.Session.get", return_value=resp):
             summary = client.fetch_summary("Elon Musk")
         assert summary is not None and summary.url.endswith("/Elon_Musk")
 
     def test_empty_title_short_circuits(self):
         client = WikipediaClient()
-        with patch("thestill.core.wikipedia_client.requests.get") as get:
+        with patch("thestill.core.wikimedia_http.requests.Session.get") as get:
             assert client.fetch_summary("") is None
         assert get.call_count == 0
 
     def test_404_is_a_miss_not_a_failure(self):
         client = WikipediaClient()
         resp = MagicMock(status_code=404)
-        with patch("thestill.core.wikipedia_client.requests.get", return_value=resp):
+        with patch("thestill.core.wikimedia_http.requests.Session.get", return_value=resp):
             assert client.fetch_summary("No Such Page") is None
 
     def test_disambiguation_is_a_miss(self):
         client = WikipediaClient()
         resp = MagicMock(status_code=200)
         resp.json.return_value = {"type": "disambiguation", "extract": "May refer to..."}
-        with patch("thestill.core.wikipedia_client.requests.get", return_value=resp):
+        with patch("thestill.core.wikimedia_http.requests.Session.get", return_value=resp):
             assert client.fetch_summary("Mercury") is None
 
     def test_non_200_raises_unavailable(self):
         client = WikipediaClient()
         resp = MagicMock(status_code=503)
-        with patch("thestill.core.wikipedia_client.requests.get", return_value=resp):
+        with patch("thestill.core.wikimedia_http.requests.Session.get", return_value=resp):
             with pytest.raises(EnrichmentUnavailable):
                 client.fetch_summary("Elon Musk")
 
     def test_network_error_raises_unavailable(self):
         client = WikipediaClient()
         with patch(
-            "thestill.core.wikipedia_client.requests.get",
+            "thestill.core.wikimedia_http.requests.Session.get",
             side_effect=requests.ConnectionError("down"),
         ):
             with pytest.raises(EnrichmentUnavailable):
@@ -93,7 +93,7 @@ class TestFetchSummary:
         client = WikipediaClient()
         resp = MagicMock(status_code=200)
         resp.json.return_value = _summary_payload()
-        with patch("thestill.core.wikipedia_client.requests.get", return_value=resp) as get:
+        with patch("thestill.core.wikimedia_http.requests.Session.get", return_value=resp) as get:
             client.fetch_summary("Elon Musk")
             client.fetch_summary("Elon Musk")
         assert get.call_count == 1
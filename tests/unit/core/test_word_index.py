@@ -0,0 +1,129 @@
+# Copyright 2025-2026 Thestill
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Columnar word-timestamp index: build, serialise, payload shape."""
+
+from pathlib import Path
+
+import pytest
+
+from thestill.core.word_index import (
+    WordIndex,
+    WordIndexFormatError,
+    build_word_index,
+    word_index_path,
+    write_word_index,
+)
+from thestill.models.annotated_transcript import AnnotatedSegment, AnnotatedTranscript, WordSpan
+from thestill.models.transcript import Segment, Transcript, Word
+
+
+def _raw() -> Transcript:
+    return Transcript(
+        audio_file="a.wav",
+        language="en",
+        text="",
+        segments=[
+            Segment(
+                id=0,
+                start=0.0,
+                end=1.5,
+                text="Hello world.",
+                words=[Word(word="Hello", start=0.0, end=0.5), Word(word="world.", start=0.6, end=1.5)],
+            ),
+            Segment(
+                id=1,
+                start=2.0,
+                end=3.8,
+                text="Um, world.",
+                words=[Word(word="Um,"), Word(word="world.", start=3.0, end=3.8)],
+            ),
+        ],
+        processing_time=0.1,
+        model_used="test",
+        timestamp=0.0,
+    )
+
+
+def _annotated(*spans) -> AnnotatedTranscript:
+    segments = [
+        AnnotatedSegment(id=i, start=0.0, end=1.0, text="x", source_segment_ids=[0], source_word_span=span)
+        for i, span in enumerate(spans)
+    ]
+    return AnnotatedTranscript(episode_id="ep", segments=segments)
+
+
+def test_spans_are_resolved_across_raw_segments():
+    index = build_word_index(
+        _annotated(WordSpan(start_segment_id=0, start_word_index=1, end_segment_id=1, end_word_index=1), None),
+        _raw(),
+    )
+
+    # The untimed "Um," is dropped; the span-less segment is omitted.
+    assert index.segments_payload() == [
+        {
+            "segment_id": 0,
+            "words": [{"w": "world.", "s": 0.6, "e": 1.5}, {"w": "world.", "s": 3.0, "e": 3.8}],
+        }
+    ]
+    assert index.strings == ["world."]  # repeated words share one string-table entry
+
+
+def test_round_trip_preserves_words_and_etag():
+    index = build_word_index(
+        _annotated(
+            WordSpan(start_segment_id=0, start_word_index=0, end_segment_id=0, end_word_index=1),
+            WordSpan(start_segment_id=1, start_word_index=0, end_segment_id=1, end_word_index=1),
+        ),
+        _raw(),
+    )
+
+    loaded = WordIndex.from_bytes(index.to_bytes())
+
+    assert loaded.etag == index.etag
+    assert loaded.segments_payload() == index.segments_payload()
+    assert [s["segment_id"] for s in loaded.segments_payload()] == [0, 1]
+
+
+def test_etag_tracks_content():
+    a = WordIndex.build([(0, [("Hello", 0.0, 0.5)])])
+    assert WordIndex.build([(0, [("Hello", 0.0, 0.5)])]).etag == a.etag
+    assert WordIndex.build([(0, [("Hello", 0.0, 0.6)])]).etag != a.etag
+    assert WordIndex.build([(1, [("Hello", 0.0, 0.5)])]).etag != a.etag
+
+
+def test_no_timed_words_is_an_empty_index():
+    index = WordIndex.build([(0, []), (1, [])])
+    assert not index
+    assert not WordIndex.from_bytes(index.to_bytes())
+
+
+def test_corrupted_span_fails_loudly():
+    with pytest.raises(KeyError):
+        build_word_index(
+            _annotated(WordSpan(start_segment_id=9, start_word_index=0, end_segment_id=9, end_word_index=0)), _raw()
+        )
+
+
+def test_unreadable_bytes_raise_format_error(tmp_path):
+    index = WordIndex.build([(0, [("ünïcode", 1.25, 2.5)])])
+    path = word_index_path(Path(tmp_path) / "ep_cleaned.json")
+    write_word_index(path, index)
+
+    assert path.name == "ep_cleaned.words.idx"
+    assert WordIndex.from_bytes(path.read_bytes()).strings == ["ünïcode"]
+    with pytest.raises(WordIndexFormatError):
+        WordIndex.from_bytes(path.read_bytes()[:-3])
+    with pytest.raises(WordIndexFormatError):
+        WordIndex.from_bytes(b"JSON" + path.read_bytes()[4:])
@@ -86,7 +86,7 @@ class TestExecutorSizing:
 
             loop.set_default_executor = spy  # type: ignore[method-assign]
             worker._running = True
-            worker.queue_manager.get_next_task.return_value = None
+            worker.queue_manager.claim_batch.return_value = []
             # ``_run_loop`` is the sync wrapper that owns its own event loop;
             # the sizing lives in the async body.
             task = asyncio.create_task(worker._async_worker_loop())
@@ -0,0 +1,191 @@
+# Copyright 2025-2026 Thestill
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Episode-listing cursors, the count cache, and the SQLite fast paths.
+
+Cross-backend ordering/paging behaviour lives in the episodes contract
+suite; this file covers the backend-neutral helpers and the SQLite-only
+pieces (trigram title index, write-generation triggers).
+"""
+
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from thestill.models.podcast import Episode, Podcast
+from thestill.repositories.episode_listing import (
+    EpisodeCountCache,
+    InvalidCursorError,
+    decode_episode_cursor,
+    encode_episode_cursor,
+)
+from thestill.repositories.sqlite_podcast_repository import _TITLE_FTS_MATCH, SqlitePodcastRepository
+
+
+class TestCursor:
+    def test_round_trip(self):
+        cursor = encode_episode_cursor("ep-1", "title", "ASC")
+        assert "=" not in cursor
+        assert decode_episode_cursor(cursor, "title", "asc") == "ep-1"
+
+    def test_unknown_sort_key_normalizes_to_pub_date(self):
+        cursor = encode_episode_cursor("ep-1", "bogus", "desc")
+        assert decode_episode_cursor(cursor, "pub_date", "desc") == "ep-1"
+
+    @pytest.mark.parametrize("sort_by,sort_order", [("title", "desc"), ("pub_date", "asc"), ("updated_at", "desc")])
+    def test_sort_mismatch_is_rejected(self, sort_by, sort_order):
+        cursor = encode_episode_cursor("ep-1", "pub_date", "desc")
+        with pytest.raises(InvalidCursorError):
+            decode_episode_cursor(cursor, sort_by, sort_order)
+
+    @pytest.mark.parametrize("cursor", ["", "!!!", "bm90IGpzb24", "WzEsInB1Yl9kYXRlIiwiZGVzYyJd"])
+    def test_malformed_is_rejected(self, cursor):
+        with pytest.raises(InvalidCursorError):
+            decode_episode_cursor(cursor, "pub_date", "desc")
+
+
+class TestEpisodeCountCache:
+    def test_hit_until_generation_moves(self):
+        cache = EpisodeCountCache()
+        cache.put("k", 1, 42)
+        assert cache.get("k", 1) == 42
+        assert cache.get("k", 2) is None
+        assert cache.get("k", 1) is None  # stale entry was dropped
+        assert (cache.hits, cache.misses) == (1, 2)
+
+    def test_ttl_expires_entries(self, monkeypatch):
+        now = [1000.0]
+        monkeypatch.setattr("thestill.repositories.episode_listing.time.monotonic", lambda: now[0])
+        cache = EpisodeCountCache(ttl_seconds=30)
+        cache.put("k", 1, 42)
+        now[0] += 29
+        assert cache.get("k", 1) == 42
+        now[0] += 2
+        assert cache.get("k", 1) is None
+
+    def test_lru_eviction(self):
+        cache = EpisodeCountCache(max_entries=2)
+        cache.put("a", 0, 1)
+        cache.put("b", 0, 2)
+        cache.get("a", 0)
+        cache.put("c", 0, 3)
+        assert cache.get("b", 0) is None
+        assert cache.get("a", 0) == 1 and cache.get("c", 0) == 3
+
+
+@pytest.fixture
+def repo(tmp_path):
+    repo = SqlitePodcastRepository(str(tmp_path / "test.db"))
+    repo.save(
+        Podcast(
+            title="Show",
+            description="d",
+            rss_url="https://example.com/show.rss",
+            slug="show",
+            episodes=[
+                Episode(
+                    title=title,
+                    description="d",
+                    audio_url=f"https://example.com/{n}.mp3",
+                    external_id=f"ep-{n}",
+                    slug=f"ep-{n}",
+                    pub_date=datetime(2026, 1, 1, tzinfo=timezone.utc) + timedelta(days=n),
+                )
+                for n, title in enumerate(["Morning Brief", "Evening Wrap", "morning MARKET", "Übermorgen"])
+            ],
+        )
+    )
+    return repo
+
+
+class TestSqliteListing:
+    def test_search_uses_trigram_index_with_like_semantics(self, repo):
+        with repo._get_connection() as conn:
+            plan = " ".join(
+                row["detail"]
+                for row in conn.execute(
+                    f"EXPLAIN QUERY PLAN SELECT e.id FROM episodes e WHERE e.id IN ({_TITLE_FTS_MATCH}) "
+                    "AND e.title LIKE ?",
+                    ("%morn%", "%morn%"),
+                )
+            )
+        # The LIKE is pushed into the FTS5 table (``f``) and episodes are probed by id, not scanned.
+        assert "SCAN f VIRTUAL TABLE" in plan and "SCAN e" not in plan
+
+        results, total = repo.get_all_episodes(search="MORNING")
+        assert total == 2
+        assert {e.title for _, e in results} == {"Morning Brief", "morning MARKET"}
+        # Short needles (below the trigram length) still match.
+        assert repo.get_all_episodes(search="Wr")[1] == 1
+
+    def test_search_index_follows_title_updates(self, repo):
+        with repo._get_connection() as conn:
+            conn.execute("UPDATE episodes SET title = 'Night Shift' WHERE external_id = 'ep-0'")
+            conn.commit()
+        assert repo.get_all_episodes(search="night")[1] == 1
+        assert repo.get_all_episodes(search="morning")[1] == 1
+
+    def test_search_index_survives_rowid_renumbering(self, repo):
+        # VACUUM may renumber the implicit rowid of a TEXT-keyed table; the
+        # index is keyed on its own INTEGER PRIMARY KEY, so it stays aligned.
+        with repo._get_connection() as conn:
+            conn.execute("DELETE FROM episodes WHERE external_id IN ('ep-0', 'ep-1')")
+            conn.commit()
+            conn.execute("VACUUM")
+        assert {e.title for _, e in repo.get_all_episodes(search="morn")[0]} == {"morning MARKET"}
+        assert repo.get_all_episodes(search="evening")[1] == 0
+
+    def test_legacy_rowid_index_is_rebuilt(self, repo):
+        with repo._get_connection() as conn:
+            conn.executescript(
+                """
+                DROP TRIGGER trg_episodes_title_fts_insert;
+                DROP TRIGGER trg_episodes_title_fts_delete;
+                DROP TRIGGER trg_episodes_title_fts_update;
+                DROP TABLE episodes_title_fts_keys;
+                DROP TABLE episodes_title_fts;
+                CREATE VIRTUAL TABLE episodes_title_fts USING fts5(
+                    title, content='episodes', content_rowid='rowid', tokenize='trigram'
+                );
+                """
+            )
+
+        reopened = SqlitePodcastRepository(str(repo.db_path))
+
+        assert reopened._title_fts
+        assert reopened.get_all_episodes(search="morning")[1] == 2
+
+    def test_old_sqlite_falls_back_to_like(self, repo, monkeypatch):
+        monkeypatch.setattr("thestill.repositories.sqlite_podcast_repository.sqlite3.sqlite_version_info", (3, 31, 1))
+
+        reopened = SqlitePodcastRepository(str(repo.db_path))
+
+        assert not reopened._title_fts
+        with reopened._get_connection() as conn:
+            assert conn.execute("SELECT name FROM sqlite_master WHERE name LIKE 'episodes_title_fts%'").fetchall() == []
+        assert {e.title for _, e in reopened.get_all_episodes(search="MORNING")[0]} == {
+            "Morning Brief",
+            "morning MARKET",
+        }
+
+    def test_count_is_cached_and_invalidated_by_writes(self, repo):
+        cache = repo._episode_count_cache
+        assert repo.get_all_episodes()[1] == 4
+        assert repo.get_all_episodes(limit=1, offset=2)[1] == 4
+        assert cache.hits == 1
+
+        with repo._get_connection() as conn:
+            conn.execute("DELETE FROM episodes WHERE external_id = 'ep-3'")
+            conn.commit()
+        assert repo.get_all_episodes()[1] == 3
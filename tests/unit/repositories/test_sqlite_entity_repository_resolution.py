@@ -20,8 +20,10 @@ from pathlib import Path
 import pytest
 
 from thestill.models.entities import EntityMention, EntityRecord, EntityType, MentionRole, ResolutionStatus
+from thestill.repositories.entity_repository import episode_pair_deltas
 from thestill.repositories.sqlite_entity_repository import SqliteEntityRepository
 from thestill.repositories.sqlite_podcast_repository import SqlitePodcastRepository
+from thestill.utils.sqlite_ext import pooled_writer
 
 
 @pytest.fixture
@@ -501,3 +503,50 @@ class TestFindMistypedEntities:
 
         out = repo.find_mistyped_entities(min_mentions=3, min_majority_ratio=0.6)
         assert out == []
+
+
+class TestEpisodePairDeltas:
+    def test_added_removed_and_bumped_pairs(self):
+        previous = {"a": "t1", "b": "t1", "c": "t1"}
+        current = {"a": "t2", "b": "t1", "d": "t2"}
+
+        deltas = {
+            (d.entity_a_id, d.entity_b_id): (d.delta, d.last_seen_at) for d in episode_pair_deltas(previous, current)
+        }
+
+        assert deltas == {
+            ("a", "c"): (-1, None),
+            ("b", "c"): (-1, None),
+            ("a", "d"): (1, "t2"),
+            ("b", "d"): (1, "t1"),
+            ("a", "b"): (0, "t2"),  # kept; a's last_seen moved forward
+        }
+
+    def test_unchanged_set_has_no_deltas(self):
+        assert episode_pair_deltas({"a": "t", "b": "t"}, {"a": "t", "b": "t"}) == []
+
+
+class TestIncrementalCooccurrences:
+    def test_update_touches_only_the_episode(self, seeded):
+        tmp_db, ep1, ep2 = seeded
+        repo = TestCooccurrenceRebuild()._seed_two_resolved_pair(tmp_db, ep1, ep2)
+        repo.update_cooccurrences([ep1, ep2])
+
+        # Add a mention so the episode has a delta to apply.
+        repo.insert_mentions([_mention(ep2, 3, "Tesla")])
+        for m in repo.list_pending_mentions(episode_id=ep2):
+            repo.resolve_mention(mention_id=m.id, entity_id="company:tesla", status="resolved")
+
+        statements: list[str] = []
+        with pooled_writer(tmp_db, load_vec="soft") as writer:
+            writer.set_trace_callback(statements.append)
+        try:
+            assert repo.update_cooccurrences([ep2]) == 2  # +(openai, tesla), +(tesla, musk)
+        finally:
+            with pooled_writer(tmp_db, load_vec="soft") as writer:
+                writer.set_trace_callback(None)
+
+        # Both reads are keyed on the episode; no corpus-wide self-join.
+        reads = [s for s in statements if s.lstrip().upper().startswith("SELECT")]
+        assert reads and all(ep2 in s for s in reads)
+        assert not any("JOIN" in s.upper() for s in statements)
@@ -157,6 +157,24 @@ def test_list_podcast_rows_counts(seeded):
     assert rows[0]["episodes_processed"] == 2
 
 
+def test_list_podcast_summaries_matches_fallback(seeded):
+    sql = seeded.list_podcast_summaries()
+    assert _normalize(sql) == _normalize(PodcastRepository.list_podcast_summaries(seeded))
+    assert [row["index"] for row in sql] == [1, 2, 3]
+    assert [row["id"] for row in sql] == [str(p.id) for p in seeded.get_all()]
+
+
+def test_podcast_index_lookups_match_fallback(seeded):
+    for podcast in seeded.get_all():
+        index = seeded.get_podcast_index(podcast.id)
+        assert index == PodcastRepository.get_podcast_index(seeded, podcast.id)
+        assert seeded.get_podcast_id_at_index(index) == str(podcast.id)
+    for index in (0, 4, -1):
+        assert seeded.get_podcast_id_at_index(index) is None
+        assert PodcastRepository.get_podcast_id_at_index(seeded, index) is None
+    assert seeded.get_podcast_index("missing") is None
+
+
 def test_get_podcast_row_by_slug_matches_fallback(seeded):
     sql = seeded.get_podcast_row_by_slug("beta-cast")
     fb = PodcastRepository.get_podcast_row_by_slug(seeded, "beta-cast")
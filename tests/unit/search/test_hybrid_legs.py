@@ -0,0 +1,81 @@
+"""Concurrent hybrid-search leg execution (``search.hybrid``).
+
+The legs are plain callables here so overlap and error propagation can be
+asserted without a database or an embedding model.
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+
+import pytest
+
+from thestill.search.hybrid import SearchTimings, capture_search_timings, record_search_timings, run_hybrid_legs
+
+
+class TestRunHybridLegs:
+    def test_lexical_overlaps_embedding(self):
+        def embed():
+            time.sleep(0.2)
+            return b"vec"
+
+        def lexical():
+            time.sleep(0.2)
+            return ["lex"]
+
+        started = time.perf_counter()
+        lex_rows, sem_rows = run_hybrid_legs(
+            embed=embed, lexical=lexical, semantic=lambda v: [v.decode()], backend="test"
+        )
+        elapsed = time.perf_counter() - started
+
+        assert lex_rows == ["lex"]
+        assert sem_rows == ["vec"]
+        # Sequential would be >= 0.4s.
+        assert elapsed < 0.35
+
+    def test_semantic_receives_embedding_and_runs_on_caller_thread(self):
+        seen = {}
+
+        def semantic(vec):
+            seen["vec"] = vec
+            seen["thread"] = threading.current_thread()
+            return []
+
+        run_hybrid_legs(embed=lambda: b"abc", lexical=None, semantic=semantic, backend="test")
+        assert seen == {"vec": b"abc", "thread": threading.current_thread()}
+
+    def test_missing_lexical_leg_yields_empty_rows_and_no_timing(self):
+        with capture_search_timings() as timings:
+            lex_rows, _ = run_hybrid_legs(embed=lambda: b"", lexical=None, semantic=lambda v: [], backend="test")
+        assert lex_rows == []
+        assert "lexical_ms" not in timings.as_dict()
+        assert {"embed_ms", "semantic_ms", "total_ms"} <= set(timings.as_dict())
+
+    def test_embedding_error_propagates(self):
+        def embed():
+            raise ModuleNotFoundError("No module named 'sentence_transformers'")
+
+        with pytest.raises(ModuleNotFoundError, match="sentence_transformers"):
+            run_hybrid_legs(embed=embed, lexical=lambda: [], semantic=lambda v: [], backend="test")
+
+    def test_lexical_error_propagates(self):
+        def lexical():
+            raise RuntimeError("fts exploded")
+
+        with pytest.raises(RuntimeError, match="fts exploded"):
+            run_hybrid_legs(embed=lambda: b"", lexical=lexical, semantic=lambda v: [], backend="test")
+
+
+class TestTimingsCapture:
+    def test_record_without_capture_is_noop(self):
+        record_search_timings(SearchTimings(total_ms=1.0))  # must not raise
+
+    def test_capture_is_scoped(self):
+        with capture_search_timings() as outer:
+            record_search_timings(SearchTimings(lexical_ms=1.0))
+            with capture_search_timings() as inner:
+                record_search_timings(SearchTimings(semantic_ms=2.0))
+        assert outer.as_dict() == {"lexical_ms": 1.0}
+        assert inner.as_dict() == {"semantic_ms": 2.0}
@@ -0,0 +1,162 @@
+"""Spec #46 — the shared related-episodes engine (``search.related_engine``).
+
+Exercised on in-memory matrices and a tiny text corpus: the hashed TF-IDF
+must agree with the ``TfidfVectorizer`` it replaces, the persisted model
+must round-trip, and blocked / capped / pooled scoring must agree with a
+single-block pass.
+"""
+
+from __future__ import annotations
+
+import pytest
+
+np = pytest.importorskip("numpy", reason="numpy required")
+pytest.importorskip("sklearn", reason="scikit-learn required for TF-IDF")
+
+from scipy import sparse  # noqa: E402
+
+from thestill.search import related_engine  # noqa: E402
+from thestill.search.related_engine import (  # noqa: E402
+    BlendParams,
+    HashedIdf,
+    _batch_stats,
+    build_related,
+    score_corpus,
+    term_bucket,
+)
+
+_DOCS = {
+    "fit-a": "biceps hypertrophy training with lunge cardio and deadlift progressions",
+    "fit-b": "cardio conditioning biceps deadlift hypertrophy and lunge variations weekly",
+    "fit-c": "deadlift form hypertrophy blocks lunge patterns cardio finisher biceps pump",
+    "biz-a": "startup valuation roadmap gtm strategy and quarterly revenue planning",
+    "biz-b": "gtm roadmap revenue valuation pricing strategy for startup founders",
+    "biz-c": "revenue planning valuation gtm motions roadmap reviews startup metrics",
+}
+
+
+def _fit(docs):
+    return HashedIdf.from_stats([_batch_stats(docs)])
+
+
+def _centroids(eids, dim=8, seed=0):
+    rng = np.random.default_rng(seed)
+    out = {}
+    for i, eid in enumerate(eids):
+        base = np.zeros(dim, dtype=np.float32)
+        base[0 if eid.startswith("fit") else 1] = 1.0
+        v = base + 0.1 * rng.standard_normal(dim).astype(np.float32)
+        out[eid] = (v / np.linalg.norm(v)).astype(np.float32)
+    return out
+
+
+_PARAMS = BlendParams(top_n=3, tfidf_floor=0.1, w_tfidf=0.55, w_vector=0.30, w_entity=0.15, candidate_cap=2000)
+
+
+def test_hashed_tfidf_matches_tfidf_vectorizer():
+    from sklearn.feature_extraction.text import TfidfVectorizer
+
+    docs = list(_DOCS.values())
+    reference = TfidfVectorizer(stop_words="english", ngram_range=(1, 2), sublinear_tf=True, min_df=2)
+    expected = reference.fit_transform(docs)
+    model, n_docs = _fit(docs)
+    got = model.transform(docs)
+
+    assert n_docs == len(docs)
+    assert len(model.buckets) == len(reference.vocabulary_)
+    np.testing.assert_allclose((got @ got.T).toarray(), (expected @ expected.T).toarray(), atol=1e-5)
+
+
+def test_model_round_trips_through_rows():
+    model, _ = _fit(list(_DOCS.values()))
+    rows = model.to_rows()
+    assert all(term.startswith("#") for term, _ in rows)
+    assert f"#{term_bucket('valuation')}" in dict(rows)
+
+    restored = HashedIdf.from_rows(reversed(rows))
+    np.testing.assert_array_equal(restored.buckets, model.buckets)
+    np.testing.assert_allclose(restored.idf, model.idf)
+
+
+def test_vocabulary_rows_and_empty_table_count_as_unbuilt():
+    assert HashedIdf.from_rows([]) is None
+    assert HashedIdf.from_rows([("biceps", 1.7), ("valuation", 1.7)]) is None
+
+
+def test_top_terms_are_the_documents_weighted_terms():
+    model, _ = _fit(list(_DOCS.values()))
+    doc = _DOCS["biz-a"]
+    terms = model.top_terms(doc, model.transform([doc]), 5)
+
+    assert 0 < len(terms) <= 5
+    assert set(terms) <= {
+        "startup",
+        "valuation",
+        "roadmap",
+        "gtm",
+        "strategy",
+        "revenue",
+        "planning",
+        "revenue planning",
+    }
+    assert model.top_terms("", None, 5) == []
+
+
+def _corpus_matrices():
+    eids = list(_DOCS)
+    model, _ = _fit(list(_DOCS.values()))
+    cents = _centroids(eids)
+    entities = sparse.csr_matrix(np.array([[1, 0], [1, 0], [0, 0], [0, 1], [0, 1], [0, 0]], dtype=np.float32))
+    return eids, np.stack([cents[e] for e in eids]), model.transform(list(_DOCS.values())), entities
+
+
+def test_blocking_and_cap_do_not_change_small_corpus_rails():
+    eids, cents, tfidf, entities = _corpus_matrices()
+    whole = list(score_corpus(cents, tfidf, entities, _PARAMS, block_size=len(eids)))
+    blocked = list(score_corpus(cents, tfidf, entities, _PARAMS, block_size=2))
+    assert blocked == whole
+
+    # Topic gating: every fitness rail is fitness-only, every business rail business-only.
+    for src, rail in whole:
+        assert rail, eids[src]
+        assert {eids[j][:3] for j, _ in rail} == {eids[src][:3]}
+        assert src not in {j for j, _ in rail}
+
+    # A cap of 2 per leg still surfaces the same-topic pair first.
+    capped = dict(score_corpus(cents, tfidf, entities, BlendParams(3, 0.1, 0.55, 0.30, 0.15, candidate_cap=2)))
+    for src, rail in whole:
+        assert capped[src][0][0] in {j for j, _ in rail}
+
+
+def test_floor_gates_everything_out():
+    eids, cents, tfidf, entities = _corpus_matrices()
+    strict = BlendParams(3, 1.01, 0.55, 0.30, 0.15, 2000)
+    assert all(rail == [] for _, rail in score_corpus(cents, tfidf, entities, strict))
+
+
+def test_build_related_in_process_and_pooled_agree(monkeypatch):
+    eids = list(_DOCS)
+    cents = _centroids(eids)
+    entity_sets = {"fit-a": frozenset({"person:arnold"}), "fit-b": frozenset({"person:arnold"})}
+
+    def stream():
+        # An episode without a centroid is skipped.
+        yield from [*_DOCS.items(), ("orphan", "biceps valuation")]
+
+    inline = build_related(cents, stream, entity_sets, _PARAMS, workers=1)
+    monkeypatch.setattr(related_engine, "POOL_MIN_EPISODES", 0)
+    pooled = build_related(cents, stream, entity_sets, _PARAMS, workers=2)
+
+    assert inline.eids == eids
+    assert pooled.eids == inline.eids
+    assert pooled.rails == inline.rails
+    assert {rel for rel, _ in inline.rails["fit-a"]} == {"fit-b", "fit-c"}
+    assert inline.episodes_with_related == len(eids)
+    assert len(inline.rows()) == sum(len(r) for r in inline.rails.values())
+
+
+def test_build_related_needs_two_documents():
+    cents = _centroids(["fit-a"])
+    build = build_related(cents, lambda: iter([("fit-a", _DOCS["fit-a"])]), {}, _PARAMS, workers=1)
+    assert build.idf is None
+    assert build.rows() == []
@@ -25,6 +25,7 @@ from thestill.models.entities import EntityRecord, EntityType, MatchType
 from thestill.repositories.sqlite_entity_repository import SqliteEntityRepository
 from thestill.repositories.sqlite_podcast_repository import SqlitePodcastRepository
 from thestill.search.base import DEFAULT_EMBEDDING_MODEL, SearchFilters, SearchMode, embedding_dim_for
+from thestill.search.hybrid import capture_search_timings
 from thestill.search.sqlite_vec_client import SqliteVecBackend
 from thestill.utils.sqlite_ext import maybe_load_vec_extension
 
@@ -229,6 +230,24 @@ class TestHybridMode:
         assert 0 in seg_ids
         assert 2 in seg_ids
 
+    def test_records_per_leg_timings(self, tmp_path):
+        db_path, fixtures = _seed_db(tmp_path)
+        e1 = fixtures["episodes"]["e1"]["id"]
+        _populate_chunks(db_path, e1, [(0, 1.0, 5.0, "agentic engineering rocks", "Host")])
+        backend = SqliteVecBackend(db_path=db_path, embedding_model=_StubEmbeddingModel())
+        with capture_search_timings() as timings:
+            backend.search("agentic", mode=SearchMode.HYBRID, limit=3, filters=None)
+        assert set(timings.as_dict()) == {"embed_ms", "lexical_ms", "semantic_ms", "total_ms"}
+
+    def test_lexical_mode_reports_only_lexical_leg(self, tmp_path):
+        db_path, fixtures = _seed_db(tmp_path)
+        e1 = fixtures["episodes"]["e1"]["id"]
+        _populate_chunks(db_path, e1, [(0, 1.0, 5.0, "agentic engineering rocks", "Host")])
+        backend = SqliteVecBackend(db_path=db_path, embedding_model=_StubEmbeddingModel())
+        with capture_search_timings() as timings:
+            backend.search("agentic", mode=SearchMode.LEXICAL, limit=3, filters=None)
+        assert set(timings.as_dict()) == {"lexical_ms", "total_ms"}
+
 
 class TestFilters:
     def test_podcast_id_filter(self, tmp_path):
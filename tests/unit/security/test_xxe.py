@@ -16,32 +16,43 @@
 
 import pytest
 
-from thestill.core import media_source
+from thestill.core import feed_scanner, media_source
 
 
 class TestMediaSourceXmlParser:
-    """media_source.ET must be the defusedxml parser, not stdlib."""
-
-    def test_et_is_defusedxml(self):
-        module_name = getattr(media_source.ET, "__name__", "")
-        # defusedxml.ElementTree exposes the same API as xml.etree.ElementTree
-        # but without external-entity support.
-        assert "defusedxml" in module_name, (
-            f"Expected defusedxml.ElementTree in media_source, got {module_name!r}. "
-            "Plain stdlib ElementTree is vulnerable to XXE / billion-laughs attacks."
-        )
+    """The raw-XML feed scan must refuse entity declarations, like defusedxml."""
+
+    MALICIOUS = (
+        '<?xml version="1.0"?>'
+        '<!DOCTYPE root [ <!ENTITY xxe SYSTEM "file:///etc/passwd"> ]>'
+        "<root><title>&xxe;</title></root>"
+    )
 
     def test_external_entity_rejected(self):
         """A feed referencing an external entity must raise, not silently resolve it."""
-        malicious = (
-            '<?xml version="1.0"?>'
-            '<!DOCTYPE root [ <!ENTITY xxe SYSTEM "file:///etc/passwd"> ]>'
-            "<root><title>&xxe;</title></root>"
-        )
         with pytest.raises(Exception) as exc_info:
-            media_source.ET.fromstring(malicious)
+            feed_scanner._walk(self.MALICIOUS)
         # defusedxml raises EntitiesForbidden / DTDForbidden / etc. — any of
         # the defusedxml.* family is acceptable. The important guarantee is
         # that the payload is *not* silently expanded into file contents.
         exc_name = type(exc_info.value).__module__ + "." + type(exc_info.value).__name__
         assert "defusedxml" in exc_name.lower() or "forbidden" in exc_name.lower(), exc_name
+
+    def test_entity_expansion_rejected(self):
+        """Billion-laughs style internal entities are refused before expansion."""
+        bomb = (
+            '<?xml version="1.0"?>'
+            '<!DOCTYPE rss [ <!ENTITY lol "lol"> <!ENTITY lol2 "&lol;&lol;&lol;&lol;"> ]>'
+            "<rss><channel><title>&lol2;</title></channel></rss>"
+        )
+        with pytest.raises(Exception) as exc_info:
+            feed_scanner._walk(bomb)
+        assert "forbidden" in type(exc_info.value).__name__.lower()
+
+    def test_media_source_extractors_fail_closed(self):
+        """The public extractors degrade to empty results on a hostile feed."""
+        source = media_source.RSSMediaSource()
+        assert source.scan_feed(self.MALICIOUS) is None
+        assert source.extract_transcript_links(self.MALICIOUS) == {}
+        assert source.extract_alternate_enclosures(self.MALICIOUS) == {}
+        assert source._extract_new_feed_url(self.MALICIOUS) is None
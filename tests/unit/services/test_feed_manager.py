@@ -383,6 +383,7 @@ class TestGetNewEpisodes:
         result.error = None
         result.content = rss
         result.parsed_feed = feedparser.parse(rss)
+        result.scan = source.scan_feed(rss, {"alt-known"})
         result.status_code = 200
         result.etag = None
         result.last_modified = None
@@ -105,9 +105,32 @@ def podcast_service(temp_storage, mock_repository, mock_path_manager, mock_feed_
     service = PodcastService(temp_storage, mock_repository, mock_path_manager, file_storage=file_storage)
     # Replace feed_manager with mock
     service.feed_manager = mock_feed_manager
+    _wire_listing_order(mock_repository, mock_feed_manager)
     return service
 
 
+def _wire_listing_order(repo, feed_manager):
+    """Serve the repository's listing-order lookups from whatever list the
+    test hands ``feed_manager.list_podcasts`` (read at call time)."""
+
+    def listed():
+        return feed_manager.list_podcasts.return_value
+
+    def index_of(podcast_id):
+        return next((i for i, p in enumerate(listed(), start=1) if str(p.id) == str(podcast_id)), None)
+
+    def id_at(index):
+        podcasts = listed()
+        return str(podcasts[index - 1].id) if 1 <= index <= len(podcasts) else None
+
+    repo.list_podcast_summaries.side_effect = lambda: [
+        dict(PodcastRepository._podcast_row_from_model(p), index=i) for i, p in enumerate(listed(), start=1)
+    ]
+    repo.get_podcast_index.side_effect = index_of
+    repo.get_podcast_id_at_index.side_effect = id_at
+    repo.get.side_effect = lambda pid: next((p for p in listed() if str(p.id) == str(pid)), None)
+
+
 class TestPodcastServiceInitialization:
     """Test PodcastService initialization."""
 
@@ -127,7 +150,6 @@ class TestPodcastServiceInitialization:
         assert service.path_manager is mock_path_manager
 
 
-
 def _wire_repo_lookups(podcast_service, sample_podcasts):
     """Point the mock repository's indexed lookups at the fixtures.
 
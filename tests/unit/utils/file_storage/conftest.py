@@ -9,8 +9,9 @@
 """Shared fixtures for the FileStorage contract suite.
 
 The ``storage`` fixture is parametrized over both backends so every test
-in ``test_contract.py`` runs once against ``LocalFileStorage`` and once
-against ``S3FileStorage`` (backed by moto's in-process S3 mock). If a new
+in ``test_contract.py`` runs against ``LocalFileStorage``, ``S3FileStorage``
+(backed by moto's in-process S3 mock) and ``S3FileStorage`` behind a
+``LocalFileCache``. If a new
 contract test passes on local but fails on S3 (or vice versa), the backend
 contract is what's drifting — the test won't silently pass on one side.
 """
@@ -24,13 +25,14 @@ import pytest
 from moto import mock_aws
 
 from thestill.utils.file_storage import FileStorage, LocalFileStorage
+from thestill.utils.file_storage.local_cache import LocalFileCache
 from thestill.utils.file_storage.s3 import S3FileStorage
 
 _TEST_BUCKET = "thestill-test-bucket"
 _TEST_REGION = "us-east-1"
 
 
-@pytest.fixture(params=["local", "s3"])
+@pytest.fixture(params=["local", "s3", "s3_cached"])
 def storage(request, tmp_path) -> Iterator[FileStorage]:
     """Yield each backend in turn.
 
@@ -45,7 +47,8 @@ def storage(request, tmp_path) -> Iterator[FileStorage]:
         with mock_aws():
             client = boto3.client("s3", region_name=_TEST_REGION)
             client.create_bucket(Bucket=_TEST_BUCKET)
-            yield S3FileStorage(bucket=_TEST_BUCKET, region=_TEST_REGION)
+            cache = LocalFileCache(tmp_path / "cache") if request.param == "s3_cached" else None
+            yield S3FileStorage(bucket=_TEST_BUCKET, region=_TEST_REGION, cache=cache)
 
 
 @pytest.fixture
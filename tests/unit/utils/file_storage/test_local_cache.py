@@ -0,0 +1,274 @@
+# Copyright 2025-2026 Thestill
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+
+"""Read-through disk cache in front of S3FileStorage.
+
+Covers:
+- Repeat reads hit the cache (one download), ETag changes miss
+- Write-through on ``write_bytes`` / ``upload_file``; a failed HEAD after an upload only skips it
+- Handles are private: unlinking one (or rewriting a ``download_file`` target) leaves the entry intact
+- LRU eviction past ``max_bytes``, lock files included
+- Concurrent misses: one fill, the rest wait
+- Failed fills leave nothing behind; an object rewritten mid-download is not cached
+- Factory wiring from config
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+from typing import Iterator
+
+import boto3
+import pytest
+from moto import mock_aws
+
+from thestill.utils.file_storage import StorageError, make_storage
+from thestill.utils.file_storage.local_cache import LocalFileCache, file_cache_stats, get_local_file_cache
+from thestill.utils.file_storage.s3 import S3FileStorage
+
+from .test_factory import _fake_config
+
+_BUCKET = "thestill-test-bucket"
+_REGION = "us-east-1"
+
+
+@pytest.fixture
+def cache(tmp_path) -> LocalFileCache:
+    return LocalFileCache(tmp_path / "cache")
+
+
+@pytest.fixture
+def storage(cache) -> Iterator[S3FileStorage]:
+    with mock_aws():
+        boto3.client("s3", region_name=_REGION).create_bucket(Bucket=_BUCKET)
+        yield S3FileStorage(bucket=_BUCKET, region=_REGION, cache=cache)
+
+
+def _count_downloads(storage: S3FileStorage, monkeypatch) -> list:
+    calls = []
+    real = storage._download
+
+    def counting(key, path, dest):
+        calls.append(key)
+        real(key, path, dest)
+
+    monkeypatch.setattr(storage, "_download", counting)
+    return calls
+
+
+def _put_raw(key: str, body: bytes) -> None:
+    """Write behind the storage's back (another process, no write-through)."""
+    boto3.client("s3", region_name=_REGION).put_object(Bucket=_BUCKET, Key=key, Body=body)
+
+
+class TestReadThrough:
+    def test_repeat_reads_download_once(self, storage, cache, monkeypatch):
+        _put_raw("audio/ep.mp3", b"audio-bytes")
+        downloads = _count_downloads(storage, monkeypatch)
+
+        with storage.local_copy("audio/ep.mp3") as first:
+            assert first.read_bytes() == b"audio-bytes"
+            assert first.suffix == ".mp3"
+        with storage.local_copy("audio/ep.mp3") as second:
+            assert second.read_bytes() == b"audio-bytes"
+        assert storage.read_bytes("audio/ep.mp3") == b"audio-bytes"
+
+        assert downloads == ["audio/ep.mp3"]
+        stats = cache.stats()
+        assert (stats["hits"], stats["misses"], stats["fills"]) == (2, 1, 1)
+        assert stats["size_bytes"] == len(b"audio-bytes")
+
+    def test_new_etag_misses(self, storage, cache):
+        _put_raw("t.json", b"v1")
+        assert storage.read_text("t.json") == "v1"
+        _put_raw("t.json", b"v2")
+
+        assert storage.read_text("t.json") == "v2"
+        assert cache.stats()["misses"] == 2
+
+    def test_unlinking_handle_keeps_entry(self, storage, cache):
+        _put_raw("x.wav", b"wave")
+        handle = storage.get_local_path("x.wav")
+        handle.unlink()
+
+        assert storage.read_bytes("x.wav") == b"wave"
+        assert cache.stats()["hits"] == 1
+
+    def test_download_file_served_from_cache(self, storage, cache, tmp_path):
+        _put_raw("x.wav", b"wave")
+        storage.read_bytes("x.wav")
+
+        storage.download_file("x.wav", tmp_path / "out.wav")
+
+        assert (tmp_path / "out.wav").read_bytes() == b"wave"
+        assert cache.stats()["hits"] == 1
+        (tmp_path / "out.wav").write_bytes(b"rewritten locally")  # a copy, not a link to the entry
+        assert storage.read_bytes("x.wav") == b"wave"
+
+    def test_missing_object_raises_filenotfound(self, storage, cache):
+        with pytest.raises(FileNotFoundError):
+            storage.get_local_path("nope.mp3")
+        assert cache.stats()["fills"] == 0
+
+
+class TestWriteThrough:
+    def test_write_bytes_seeds_cache(self, storage, cache, monkeypatch):
+        downloads = _count_downloads(storage, monkeypatch)
+        storage.write_bytes("t.json", b"{}")
+
+        assert storage.read_bytes("t.json") == b"{}"
+        assert downloads == []
+        assert cache.stats()["write_throughs"] == 1
+
+    def test_upload_file_seeds_cache(self, storage, cache, monkeypatch, tmp_path):
+        src = tmp_path / "up.mp3"
+        src.write_bytes(b"uploaded")
+        downloads = _count_downloads(storage, monkeypatch)
+        storage.upload_file(src, "audio/up.mp3")
+        src.write_bytes(b"rewritten locally")  # the entry is a copy, not a link
+
+        with storage.local_copy("audio/up.mp3") as p:
+            assert p.read_bytes() == b"uploaded"
+        assert downloads == []
+
+    def test_failed_head_after_upload_skips_write_through(self, storage, cache, monkeypatch, tmp_path):
+        src = tmp_path / "up.mp3"
+        src.write_bytes(b"uploaded")
+
+        def failing_head(path):
+            raise StorageError("head timed out")
+
+        monkeypatch.setattr(storage, "_head", failing_head)
+        storage.upload_file(src, "audio/up.mp3")  # the upload itself succeeded
+        monkeypatch.undo()
+
+        assert cache.stats()["write_throughs"] == 0
+        assert storage.read_bytes("audio/up.mp3") == b"uploaded"
+
+
+class TestEviction:
+    def test_least_recently_used_evicted(self, tmp_path):
+        with mock_aws():
+            boto3.client("s3", region_name=_REGION).create_bucket(Bucket=_BUCKET)
+            cache = LocalFileCache(tmp_path / "cache", max_bytes=250)
+            storage = S3FileStorage(bucket=_BUCKET, region=_REGION, cache=cache)
+            for name in ("a", "b", "c"):
+                _put_raw(name, name.encode() * 100)
+
+            storage.read_bytes("a")
+            time.sleep(0.01)
+            storage.read_bytes("b")
+            time.sleep(0.01)
+            storage.read_bytes("a")  # a is now more recent than b
+            time.sleep(0.01)
+            storage.read_bytes("c")  # 300 bytes > 250: evict down to 225
+
+            stats = cache.stats()
+            assert stats["evictions"] == 1
+            assert stats["size_bytes"] == 200
+            storage.read_bytes("a")
+            storage.read_bytes("c")
+            assert cache.stats()["hits"] == stats["hits"] + 2
+            storage.read_bytes("b")
+            assert cache.stats()["misses"] == stats["misses"] + 1
+
+    def test_eviction_removes_lock_files(self, tmp_path):
+        cache = LocalFileCache(tmp_path / "cache", max_bytes=250)
+        for name in ("a", "b", "c"):
+            cache.store_bytes(f"bucket/{name}", "etag", "", name.encode() * 100)
+            time.sleep(0.01)
+
+        entries = {p.name for p in (cache.root / "objects").glob("*/*")}
+        locks = {p.name for p in (cache.root / "locks").glob("*.lock")}
+        assert len(entries) == 2
+        assert locks <= {f"{name}.lock" for name in entries}
+
+
+class TestConcurrentFill:
+    def test_one_fill_others_wait(self, cache):
+        fills = []
+        started = threading.Event()
+
+        def slow_fill(dest):
+            fills.append(dest)
+            started.set()
+            time.sleep(0.2)
+            dest.write_bytes(b"payload")
+
+        results = []
+
+        def reader():
+            handle = cache.fetch("bucket/key", '"etag"', ".mp3", slow_fill)
+            results.append(handle.read_bytes())
+            handle.unlink()
+
+        threads = [threading.Thread(target=reader) for _ in range(6)]
+        threads[0].start()
+        started.wait(5)
+        for t in threads[1:]:
+            t.start()
+        for t in threads:
+            t.join(10)
+
+        assert len(fills) == 1
+        assert results == [b"payload"] * 6
+        stats = cache.stats()
+        assert (stats["misses"], stats["hits"], stats["waits"]) == (1, 5, 5)
+
+    def test_failed_fill_leaves_no_entry(self, cache):
+        def broken(dest):
+            dest.write_bytes(b"partial")
+            raise StorageError("network")
+
+        with pytest.raises(StorageError):
+            cache.fetch("bucket/key", "etag", "", broken)
+        handle = cache.fetch("bucket/key", "etag", "", lambda dest: dest.write_bytes(b"ok"))
+
+        assert handle.read_bytes() == b"ok"
+        assert cache.stats()["fills"] == 1
+        assert list((cache.root / "tmp").glob("fill_*")) == []
+
+    def test_object_rewritten_mid_download_not_cached(self, storage, cache, monkeypatch):
+        _put_raw("t.json", b"v1")
+        real = storage._download
+
+        def racing(key, path, dest):
+            real(key, path, dest)
+            _put_raw(key, b"v2")
+
+        monkeypatch.setattr(storage, "_download", racing)
+        with pytest.raises(StorageError, match="changed during download"):
+            storage.read_bytes("t.json")
+        monkeypatch.undo()
+
+        assert storage.read_bytes("t.json") == b"v2"
+        assert cache.stats()["fills"] == 1
+
+
+class TestFactoryWiring:
+    @mock_aws
+    def test_cache_enabled_from_config(self, tmp_path):
+        config = _fake_config(
+            storage_backend="s3",
+            s3_bucket=_BUCKET,
+            s3_cache_enabled=True,
+            s3_cache_path=str(tmp_path / "s3_cache"),
+            s3_cache_max_mb=1,
+        )
+        storage = make_storage(config)
+
+        assert storage.cache is get_local_file_cache(tmp_path / "s3_cache", 1024 * 1024)
+        assert storage.cache.max_bytes == 1024 * 1024
+        assert file_cache_stats()
+
+    @mock_aws
+    def test_cache_off_by_default(self):
+        storage = make_storage(_fake_config(storage_backend="s3", s3_bucket=_BUCKET))
+
+        assert storage.cache is None
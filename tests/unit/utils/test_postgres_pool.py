@@ -0,0 +1,134 @@
+# Copyright 2025-2026 Thestill
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Unit tests for the process-wide Postgres pools in ``utils.postgres_ext``.
+
+``psycopg_pool.ConnectionPool`` is replaced by a recorder, so these run
+without a server; ``tests/integration/test_postgres_queue_manager.py``
+covers real checkouts.
+"""
+
+from unittest.mock import MagicMock
+
+import psycopg_pool
+import pytest
+
+from thestill.utils import postgres_ext
+
+
+class _RecordingPool:
+    check_connection = staticmethod(lambda conn: None)
+
+    def __init__(self, conninfo, **kwargs):
+        self.conninfo = conninfo
+        self.kwargs = kwargs
+        self.min_size = kwargs["min_size"]
+        self.max_size = kwargs["max_size"]
+        self.resized = None
+        self.closed = False
+
+    def resize(self, min_size, max_size):
+        self.resized = (min_size, max_size)
+        self.max_size = max_size
+
+    def connection(self):
+        return f"checkout:{self.conninfo}"
+
+    def close(self):
+        self.closed = True
+
+
+@pytest.fixture(autouse=True)
+def recording_pool(monkeypatch):
+    monkeypatch.setattr(psycopg_pool, "ConnectionPool", _RecordingPool)
+    postgres_ext.close_pools()
+    yield
+    postgres_ext.close_pools()
+
+
+def test_one_pool_per_dsn_and_vector_flag():
+    a = postgres_ext.get_pool("postgresql://a")
+    assert postgres_ext.get_pool("postgresql://a") is a
+    assert postgres_ext.get_pool("postgresql://a", vector=True) is not a
+    assert postgres_ext.get_pool("postgresql://b") is not a
+    assert postgres_ext.connect("postgresql://a") == "checkout:postgresql://a"
+
+
+def test_pool_settings_come_from_the_environment(monkeypatch):
+    monkeypatch.setenv("POSTGRES_POOL_MAX_SIZE", "4")
+    monkeypatch.setenv("POSTGRES_POOL_MAX_LIFETIME_SECONDS", "600")
+    monkeypatch.setenv("POSTGRES_STATEMENT_TIMEOUT_MS", "1500")
+    pool = postgres_ext.get_pool("postgresql://a")
+    assert pool.kwargs["max_size"] == 4
+    assert pool.kwargs["max_lifetime"] == 600
+    assert pool.kwargs["check"] is _RecordingPool.check_connection
+    assert pool.kwargs["kwargs"]["options"] == "-c statement_timeout=1500"
+    assert pool.kwargs["configure"] is None
+    assert postgres_ext.get_pool("postgresql://a", vector=True).kwargs["configure"] is not None
+
+
+def test_zero_statement_timeout_leaves_the_server_default(monkeypatch):
+    monkeypatch.setenv("POSTGRES_STATEMENT_TIMEOUT_MS", "0")
+    assert "options" not in postgres_ext.get_pool("postgresql://a").kwargs["kwargs"]
+
+
+def test_statement_timeout_is_off_by_default(monkeypatch):
+    monkeypatch.delenv("POSTGRES_STATEMENT_TIMEOUT_MS", raising=False)
+    assert "options" not in postgres_ext.get_pool("postgresql://a").kwargs["kwargs"]
+
+
+def test_pool_grows_to_cover_reserved_threads(monkeypatch):
+    monkeypatch.delenv("POSTGRES_POOL_MAX_SIZE", raising=False)
+    monkeypatch.setattr(postgres_ext, "_RESERVED", 0)
+    pool = postgres_ext.get_pool("postgresql://a")
+    assert pool.kwargs["max_size"] == 10
+
+    postgres_ext.reserve_connections(40)  # web threadpool
+    postgres_ext.reserve_connections(12)  # worker executor
+
+    assert pool.resized == (1, 52)
+    assert postgres_ext.get_pool("postgresql://b").kwargs["max_size"] == 52
+
+
+def test_explicit_max_size_caps_reservations(monkeypatch):
+    monkeypatch.setenv("POSTGRES_POOL_MAX_SIZE", "8")
+    monkeypatch.setattr(postgres_ext, "_RESERVED", 0)
+    pool = postgres_ext.get_pool("postgresql://a")
+    postgres_ext.reserve_connections(40)
+    assert pool.kwargs["max_size"] == 8
+    assert pool.resized is None
+
+
+def test_disabled_pool_opens_a_connection_per_call(monkeypatch):
+    monkeypatch.setenv("POSTGRES_POOL_ENABLED", "false")
+    opened = MagicMock(return_value="conn")
+    monkeypatch.setattr(postgres_ext.psycopg, "connect", opened)
+    assert postgres_ext.connect("postgresql://a") == "conn"
+    assert opened.call_args.args == ("postgresql://a",)
+    assert postgres_ext._POOLS == {}
+
+
+def test_forked_child_does_not_reuse_parent_pools(monkeypatch):
+    parent = postgres_ext.get_pool("postgresql://a")
+    monkeypatch.setattr(postgres_ext, "_POOLS_PID", -1)
+    child = postgres_ext.get_pool("postgresql://a")
+    assert child is not parent
+    assert not parent.closed
+
+
+def test_close_pools_closes_and_forgets():
+    pool = postgres_ext.get_pool("postgresql://a")
+    postgres_ext.close_pools()
+    assert pool.closed
+    assert postgres_ext.get_pool("postgresql://a") is not pool
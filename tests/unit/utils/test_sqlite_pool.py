@@ -0,0 +1,166 @@
+# Copyright 2025-2026 Thestill
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Unit tests for the pooled SQLite connections in ``utils.sqlite_ext``."""
+
+import sqlite3
+import threading
+from pathlib import Path
+
+import pytest
+
+from thestill.utils.sqlite_ext import BUSY_TIMEOUT_MS, SqliteConnectionPool
+
+
+@pytest.fixture
+def pool() -> SqliteConnectionPool:
+    p = SqliteConnectionPool(max_per_thread=2)
+    yield p
+    p.close_all()
+
+
+@pytest.fixture
+def db(tmp_path: Path) -> Path:
+    path = tmp_path / "pool.db"
+    with sqlite3.connect(path) as conn:
+        conn.execute("CREATE TABLE t (v INTEGER)")
+    return path
+
+
+class TestThreadConnections:
+    def test_reuses_one_prepared_connection_per_thread(self, pool, db):
+        with pool.connection(db) as first:
+            pass
+        with pool.connection(db) as second:
+            assert second.execute("PRAGMA busy_timeout").fetchone()[0] == BUSY_TIMEOUT_MS
+            assert second.execute("PRAGMA foreign_keys").fetchone()[0] == 1
+        assert first is second
+        assert (pool.stats.opened, pool.stats.reused) == (1, 1)
+
+    def test_threads_get_distinct_connections(self, pool, db):
+        seen = []
+
+        def grab():
+            with pool.connection(db) as conn:
+                seen.append(id(conn))
+
+        threads = [threading.Thread(target=grab) for _ in range(2)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        with pool.connection(db) as conn:
+            seen.append(id(conn))
+        assert len(set(seen)) == 3
+
+    def test_commits_on_success_and_rolls_back_on_error(self, pool, db):
+        with pool.connection(db) as conn:
+            conn.execute("INSERT INTO t VALUES (1)")
+        with pytest.raises(RuntimeError):
+            with pool.connection(db) as conn:
+                conn.execute("INSERT INTO t VALUES (2)")
+                raise RuntimeError("boom")
+        with sqlite3.connect(db) as raw:
+            assert [r[0] for r in raw.execute("SELECT v FROM t")] == [1]
+
+    def test_nested_use_gets_a_separate_connection(self, pool, db):
+        """A nested scope must not share — and commit — the outer transaction."""
+        with pool.connection(db) as outer:
+            outer.execute("BEGIN")
+            outer.execute("INSERT INTO t VALUES (1)")
+            with pool.connection(db) as inner:
+                assert inner is not outer
+                assert inner.execute("SELECT COUNT(*) FROM t").fetchone()[0] == 0
+            assert outer.in_transaction
+        assert pool.stats.overflow == 1
+
+    def test_row_factory_is_part_of_the_key(self, pool, db):
+        with pool.connection(db, row_factory=True) as rows:
+            assert rows.row_factory is sqlite3.Row
+        with pool.connection(db, row_factory=False) as tuples:
+            assert tuples.row_factory is None
+        assert rows is not tuples
+
+    def test_recreated_database_file_gets_a_fresh_connection(self, pool, db):
+        with pool.connection(db) as conn:
+            conn.execute("INSERT INTO t VALUES (1)")
+        for suffix in ("", "-wal", "-shm"):
+            Path(f"{db}{suffix}").unlink(missing_ok=True)
+        with sqlite3.connect(db) as raw:
+            raw.execute("CREATE TABLE other (v INTEGER)")
+        with pool.connection(db) as conn:
+            names = {r[0] for r in conn.execute("SELECT name FROM sqlite_master")}
+        assert names == {"other"}
+        assert pool.stats.opened == 2
+
+    def test_closed_connection_is_replaced(self, pool, db):
+        with pool.connection(db) as conn:
+            pass
+        conn.close()
+        with pool.connection(db) as fresh:
+            assert fresh.execute("SELECT 1").fetchone()[0] == 1
+        assert fresh is not conn
+
+    def test_evicts_least_recently_used_beyond_cap(self, pool, tmp_path):
+        paths = [tmp_path / f"db{i}.db" for i in range(3)]
+        for path in paths:
+            with pool.connection(path):
+                pass
+        assert pool.stats.evicted == 1
+
+    def test_memory_databases_are_never_pooled(self, pool):
+        with pool.connection(":memory:") as conn:
+            conn.execute("CREATE TABLE m (v INTEGER)")
+        with pool.connection(":memory:") as conn:
+            assert conn.execute("SELECT COUNT(*) FROM sqlite_master").fetchone()[0] == 0
+        assert pool.stats.opened == 0
+
+
+class TestWriter:
+    def test_single_shared_writer_serialises_threads(self, pool, db):
+        inside = threading.Event()
+        release = threading.Event()
+        order = []
+
+        def hold():
+            with pool.writer(db) as conn:
+                order.append(("a", id(conn)))
+                inside.set()
+                release.wait(5)
+
+        def wait_turn():
+            with pool.writer(db) as conn:
+                order.append(("b", id(conn)))
+
+        a = threading.Thread(target=hold)
+        a.start()
+        inside.wait(5)
+        b = threading.Thread(target=wait_turn)
+        b.start()
+        b.join(0.2)
+        assert b.is_alive(), "second writer must wait for the first"
+        release.set()
+        a.join(5)
+        b.join(5)
+
+        assert [name for name, _ in order] == ["a", "b"]
+        assert order[0][1] == order[1][1]
+        assert pool.stats.writer_waits == 1
+
+    def test_writer_begin_immediate_commits(self, pool, db):
+        with pool.writer(db) as conn:
+            conn.execute("BEGIN IMMEDIATE")
+            conn.execute("INSERT INTO t VALUES (7)")
+        with pool.connection(db) as conn:
+            assert conn.execute("SELECT v FROM t").fetchone()[0] == 7
@@ -0,0 +1,77 @@
+# Copyright 2025-2026 Thestill
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Keyset (``cursor``) paging on GET /api/episodes against a real SQLite repo."""
+
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from thestill.models.podcast import Episode, Podcast
+from thestill.repositories.sqlite_podcast_repository import SqlitePodcastRepository
+from thestill.web.routes import api_episodes
+
+from .auth_harness import PLAIN_USER, auth_client
+
+
+@pytest.fixture
+def client(tmp_path):
+    repo = SqlitePodcastRepository(str(tmp_path / "test.db"))
+    repo.save(
+        Podcast(
+            title="Show",
+            description="d",
+            rss_url="https://example.com/show.rss",
+            slug="show",
+            episodes=[
+                Episode(
+                    title=f"Episode {n}",
+                    description="d",
+                    audio_url=f"https://example.com/{n}.mp3",
+                    external_id=f"ep-{n}",
+                    slug=f"ep-{n}",
+                    pub_date=datetime(2026, 1, 1, tzinfo=timezone.utc) + timedelta(days=n),
+                )
+                for n in range(5)
+            ],
+        )
+    )
+    client, state = auth_client([(api_episodes.router, "/api/episodes")], multi_user=False, current_user=PLAIN_USER)
+    state.repository = repo
+    return client
+
+
+def test_cursor_walks_every_episode_once(client):
+    first = client.get("/api/episodes", params={"limit": 2}).json()
+    assert first["total"] == 5 and first["next_offset"] == 2
+    seen = [ep["title"] for ep in first["episodes"]]
+
+    cursor = first["next_cursor"]
+    while cursor:
+        page = client.get("/api/episodes", params={"limit": 2, "cursor": cursor}).json()
+        assert page["next_offset"] is None
+        seen.extend(ep["title"] for ep in page["episodes"])
+        cursor = page["next_cursor"]
+
+    assert seen == [f"Episode {n}" for n in range(4, -1, -1)]
+
+
+def test_last_offset_page_has_no_cursor(client):
+    body = client.get("/api/episodes", params={"limit": 2, "offset": 4}).json()
+    assert body["has_more"] is False and body["next_cursor"] is None
+
+
+@pytest.mark.parametrize("params", [{"cursor": "garbage"}, {"cursor": "WyJ4IiwidGl0bGUiLCJhc2MiXQ"}])
+def test_bad_cursor_is_400(client, params):
+    assert client.get("/api/episodes", params=params).status_code == 400
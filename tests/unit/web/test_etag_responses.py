@@ -93,3 +93,23 @@ def test_changed_payload_changes_etag_and_misses_revalidation():
     assert resp.status_code == 200
     assert resp.headers["etag"] != etag_a
     assert resp.json()["content"] == "changed"
+
+
+def test_stored_etag_skips_the_payload_build_on_revalidation():
+    from thestill.web.responses import stored_etag_json_response
+
+    builds = []
+    stored = FastAPI()
+
+    @stored.get("/stored")
+    def stored_resource(request: Request):
+        return stored_etag_json_response(request, "abc123", lambda: builds.append(1) or {"words": []})
+
+    stored_client = TestClient(stored)
+    first = stored_client.get("/stored")
+    assert first.headers["etag"] == 'W/"abc123"'
+    assert first.json()["words"] == []
+
+    again = stored_client.get("/stored", headers={"If-None-Match": first.headers["etag"]})
+    assert again.status_code == 304
+    assert builds == [1]
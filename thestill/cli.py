@@ -206,6 +206,8 @@ def main(ctx, config, quiet):
         audio_downloader = AudioDownloader(
             str(path_manager.original_audio_dir()),
             max_bytes=config_obj.max_audio_bytes,
+            parallel_ranges=config_obj.download_parallel_ranges,
+            parallel_min_bytes=config_obj.download_parallel_min_bytes,
         )
         audio_preprocessor = AudioPreprocessor(console=console)
         external_transcript_downloader = ExternalTranscriptDownloader(repository, path_manager, file_storage)
@@ -796,7 +798,7 @@ def clean_transcript(ctx, dry_run, max_episodes, force, stream):
         click.echo(f"❌ Failed to initialize LLM provider: {e}", err=True)
         ctx.exit(1)
 
-    cleaning_processor = TranscriptCleaningProcessor(llm_provider)
+    cleaning_processor = TranscriptCleaningProcessor(llm_provider, batch_concurrency=config.clean_batch_concurrency)
 
     # Find transcripts to clean
     click.echo("🔍 Looking for transcripts to clean...")
@@ -1361,6 +1363,8 @@ def status(ctx):
     click.echo(f"  Parked/quarantined:      {stats.refresh_parked_total}")
     for reason, count in sorted(stats.refresh_parked_by_reason.items()):
         click.echo(f"    - {reason}: {count}")
+    click.echo(f"  Scheduled fetches/day:   {stats.refresh_fetches_per_day:,.0f}")
+    click.echo(f"  Fetches avoided/day:     {stats.refresh_fetches_avoided_per_day:,.0f}")
 
     # Show pending Google Cloud transcription operations (if using Google provider)
     if config.transcription_provider.lower() == "google":
@@ -2912,8 +2916,11 @@ def _get_or_create_cli_resolver(ctx):
     if ctx.obj.entity_resolver is None:
         from .core.entity_resolver import EntityResolver
         from .core.wikidata_client import WikidataClient
+        from .core.wikimedia_http import wikimedia_http_from_config
 
-        ctx.obj.entity_resolver = EntityResolver(wikidata_client=WikidataClient())
+        ctx.obj.entity_resolver = EntityResolver(
+            wikidata_client=WikidataClient(http=wikimedia_http_from_config(ctx.obj.config))
+        )
     return ctx.obj.entity_resolver
 
 
@@ -2985,8 +2992,8 @@ def resolve_entities(ctx, episode_id, podcast_id, max_episodes, dry_run):
                 total_resolved += 1
             else:
                 total_unresolvable += 1
-        # Inline scoped maintenance — same as the handler.
-        repo.rebuild_cooccurrences(episode_ids=[eid])
+        # Inline incremental maintenance — same as the handler.
+        repo.update_cooccurrences([eid])
         # Mirror the handler: keep the per-episode status consistent
         # with the resolved state. Extraction set this to 'complete'
         # already — leaving it untouched matches the spec's
@@ -3001,21 +3008,22 @@ def resolve_entities(ctx, episode_id, podcast_id, max_episodes, dry_run):
 
 
 @main.command("rebuild-cooccurrences")
-@click.option("--podcast-id", help="Rebuild only pairs touching this podcast's episodes")
-@click.option("--episode-id", help="Rebuild only pairs touching this single episode")
-@click.option("--full", is_flag=True, help="Wipe and rebuild the entire entity_cooccurrences table")
+@click.option("--podcast-id", help="Update only this podcast's episodes")
+@click.option("--episode-id", help="Update only this single episode")
+@click.option("--full", is_flag=True, help="Repair: wipe and rebuild entity_cooccurrences from all mentions")
 @click.pass_context
 @require_config
 @log_command
 def rebuild_cooccurrences(ctx, podcast_id, episode_id, full):
-    """Materialise ``entity_cooccurrences`` from resolved mentions.
+    """Bring ``entity_cooccurrences`` up to date with resolved mentions.
 
     Default scope is "every episode with at least one resolved
-    mention" — equivalent to ``--full`` but slightly cheaper because
-    the per-pair self-join runs once. ``--full`` blows away the table
-    first (use after a Phase change that affects how entities are
-    resolved). ``--episode-id``/``--podcast-id`` scope the rebuild
-    to pairs touching specific episodes.
+    mention"; ``--episode-id``/``--podcast-id`` narrow it. Scoped runs
+    apply the same incremental per-episode deltas as the pipeline
+    stage, so they are cheap and no-ops for episodes already in sync.
+    ``--full`` is the repair: it wipes the pair table and the
+    ``episode_entities`` projection and recounts everything (use after
+    deleting episodes or if counts look wrong).
     """
     repo = ctx.obj.entity_repository
     if full:
@@ -3045,7 +3053,11 @@ def rebuild_cooccurrences(ctx, podcast_id, episode_id, full):
             episode_ids = [
                 r[0]
                 for r in conn.execute(
-                    "SELECT DISTINCT episode_id FROM entity_mentions " "WHERE resolution_status = 'resolved'"
+                    # Plus episodes whose projection is non-empty, so an
+                    # episode that lost all its resolved mentions is
+                    # decremented too.
+                    "SELECT DISTINCT episode_id FROM entity_mentions WHERE resolution_status = 'resolved' "
+                    "UNION SELECT episode_id FROM episode_entities"
                 ).fetchall()
             ]
 
@@ -3053,8 +3065,8 @@ def rebuild_cooccurrences(ctx, podcast_id, episode_id, full):
         click.echo("No resolved mentions to scope the rebuild from.")
         return
 
-    rows = repo.rebuild_cooccurrences(episode_ids=episode_ids)
-    click.echo(f"✓ {rows} co-occurrence pair(s) materialised across {len(episode_ids)} episode(s)")
+    adjusted = repo.update_cooccurrences(episode_ids)
+    click.echo(f"✓ {adjusted} co-occurrence pair(s) adjusted across {len(episode_ids)} episode(s)")
 
 
 @main.command("backfill-entity-types")
@@ -3087,6 +3099,7 @@ def backfill_entity_types(ctx, episode_id, podcast_id, limit, dry_run):
     from .core.entity_resolver import _build_entity_id
     from .core.entity_type_rules import classify_entity_type
     from .core.wikidata_client import WikidataClient
+    from .core.wikimedia_http import wikimedia_http_from_config
     from .models.entities import EntityRecord
 
     repo = ctx.obj.entity_repository
@@ -3120,7 +3133,7 @@ def backfill_entity_types(ctx, episode_id, podcast_id, limit, dry_run):
         return
 
     click.echo(f"Backfilling P31 for {len(entity_ids)} entit(y/ies)…")
-    client = WikidataClient()
+    client = WikidataClient(http=wikimedia_http_from_config(ctx.obj.config))
     reclassified = 0
     cached = 0
     for entity_id in entity_ids:
@@ -3223,6 +3236,7 @@ def enrich_entities(ctx, entity_id, episode_id, podcast_id, max_entities, force,
     """
     from .core.entity_enricher import ENRICHMENT_SCHEMA_VERSION, EntityEnricher
     from .core.wikidata_client import WikidataClient
+    from .core.wikimedia_http import wikimedia_http_from_config
     from .core.wikipedia_client import WikipediaClient
     from .models.enrichment import EnrichmentStatus
 
@@ -3259,11 +3273,10 @@ def enrich_entities(ctx, entity_id, episode_id, podcast_id, max_entities, force,
         return
 
     click.echo(f"Enriching {len(entity_ids)} entit(y/ies) from Wikidata + Wikipedia…")
-    wikidata = WikidataClient(user_agent=config.enrichment_user_agent)
-    wikipedia = WikipediaClient(user_agent=config.enrichment_user_agent)
+    http = wikimedia_http_from_config(config, min_interval_sec=config.enrichment_request_delay_sec)
     enricher = EntityEnricher(
-        wikidata_client=wikidata,
-        wikipedia_client=wikipedia,
+        wikidata_client=WikidataClient(user_agent=config.enrichment_user_agent, http=http),
+        wikipedia_client=WikipediaClient(user_agent=config.enrichment_user_agent, http=http),
         find_entity_by_qid=repo.find_entity_by_qid,
         language=config.enrichment_wikipedia_lang,
     )
@@ -3272,33 +3285,35 @@ def enrich_entities(ctx, entity_id, episode_id, podcast_id, max_entities, force,
     empty = 0
     failed = 0
     errored = 0
-    for eid in entity_ids:
-        entity = repo.get_entity(eid)
-        if entity is None or not entity.wikidata_qid:
-            continue
-        try:
-            enrichment = enricher.enrich(entity)
-            _upsert_enrichment_with_retry(repo, enrichment)
-        except Exception as exc:  # noqa: BLE001
-            # Spec #42 FM-1: a single entity's error (a transient SQLite
-            # write lock under a live server, an unexpected payload) must
-            # NOT abort a multi-thousand-entity batch. Skip + count + carry
-            # on; the entity stays un-enriched so the next run retries it.
-            errored += 1
-            click.echo(f"  ✗ {eid}  ({exc})", err=True)
-            continue
-        if EnrichmentStatus.FAILED in (enrichment.wikidata_status, enrichment.wikipedia_status):
-            failed += 1
-            marker = "⚠"
-        elif enrichment.has_content():
-            enriched += 1
-            marker = "✓"
-        else:
-            empty += 1
-            marker = "·"
-        click.echo(f"  {marker} {entity.id}")
-        if config.enrichment_request_delay_sec > 0:
-            time.sleep(config.enrichment_request_delay_sec)
+    # Enrich in slices so progress prints as it goes and a long sweep holds
+    # at most one slice of payloads; labels are batched per slice.
+    slice_size = max(1, config.enrichment_concurrency) * 25
+    for start in range(0, len(entity_ids), slice_size):
+        entities = [repo.get_entity(eid) for eid in entity_ids[start : start + slice_size]]
+        entities = [e for e in entities if e is not None and e.wikidata_qid]
+        for entity, enrichment, error in enricher.enrich_many(entities, max_workers=config.enrichment_concurrency):
+            try:
+                if error is not None:
+                    raise error
+                _upsert_enrichment_with_retry(repo, enrichment)
+            except Exception as exc:  # noqa: BLE001
+                # Spec #42 FM-1: a single entity's error (a transient SQLite
+                # write lock under a live server, an unexpected payload) must
+                # NOT abort a multi-thousand-entity batch. Skip + count + carry
+                # on; the entity stays un-enriched so the next run retries it.
+                errored += 1
+                click.echo(f"  ✗ {entity.id}  ({exc})", err=True)
+                continue
+            if EnrichmentStatus.FAILED in (enrichment.wikidata_status, enrichment.wikipedia_status):
+                failed += 1
+                marker = "⚠"
+            elif enrichment.has_content():
+                enriched += 1
+                marker = "✓"
+            else:
+                empty += 1
+                marker = "·"
+            click.echo(f"  {marker} {entity.id}")
 
     click.echo(
         f"\n🎉 enrich-entities: {enriched} enriched, {empty} with no data, "
@@ -4456,7 +4471,7 @@ def reindex(ctx, status, max_episodes, dry_run):
 def chunks_backfill(ctx, podcast_id, max_episodes, force, dry_run):
     """Embed and index every episode that has a cleaned-transcript JSON sidecar."""
     from .core.chunk_writer import ChunkWriter
-    from .models.annotated_transcript import AnnotatedTranscript
+    from .core.transcript_stream import load_segments
 
     podcast_repo = ctx.obj.repository
     path_manager = ctx.obj.path_manager
@@ -4495,8 +4510,7 @@ def chunks_backfill(ctx, podcast_id, max_episodes, force, dry_run):
         if not sidecar.exists():
             click.echo(f"  ! sidecar missing for {e.id} ({sidecar})")
             continue
-        transcript = AnnotatedTranscript.model_validate_json(sidecar.read_text(encoding="utf-8"))
-        inserted = writer.write_episode(e.id, transcript, force=force)
+        inserted = writer.write_episode(e.id, load_segments(sidecar, default_kind="content"), force=force)
         if inserted:
             inserted_total += inserted
             click.echo(f"  ✓ {p.title} :: {e.title} ({inserted} chunks)")
@@ -4542,16 +4556,23 @@ def related_group():
     type=float,
     help="Min TF-IDF cosine for a candidate to be eligible (default from related_builder).",
 )
+@click.option(
+    "--workers",
+    default=None,
+    type=click.IntRange(min=1),
+    help="Scoring worker processes (default: one per core, up to 8; small corpora score in-process).",
+)
 @click.pass_context
 @require_config
 @log_command
-def related_build(ctx, top_n, tfidf_floor):
+def related_build(ctx, top_n, tfidf_floor, workers):
     """Recompute the episode_related table for the whole corpus.
 
     Blends TF-IDF topical similarity, dense vector similarity, and
     entity overlap (see ``search.related_builder``). Corpus-global, so
     run it after ``chunks backfill`` / ``reindex`` whenever the index
-    changes. Cheap — no embedding model load; reuses stored vectors.
+    changes. Cheap — no embedding model load; reuses stored vectors and
+    scores the corpus in matrix blocks across ``--workers`` processes.
     """
     from .repositories.factory import uses_postgres
     from .search.related_builder import DEFAULT_TFIDF_FLOOR
@@ -4572,6 +4593,7 @@ def related_build(ctx, top_n, tfidf_floor):
         embedding_model_name=ctx.obj.embedding_model.model_name,
         top_n=top_n,
         tfidf_floor=floor,
+        workers=workers,
     )
     click.echo(
         f"✓ related build complete: {result['pairs']} pairs across "
@@ -4746,10 +4768,17 @@ def _grade_one(repo, question: dict, limit: int) -> dict:
 @click.option("--port", "-p", default=8000, type=int, help="Port to bind to (default: 8000)")
 @click.option("--reload", is_flag=True, help="Enable auto-reload for development")
 @click.option("--workers", "-w", default=1, type=int, help="Number of worker processes (default: 1)")
+@click.option(
+    "--role",
+    type=click.Choice(["all", "web"]),
+    default="all",
+    show_default=True,
+    help="'web' serves HTTP only; run 'thestill worker' processes to process tasks",
+)
 @click.pass_context
 @require_config
 @log_command
-def server(ctx, host, port, reload, workers):
+def server(ctx, host, port, reload, workers, role):
     """Start the web server for webhooks and API.
 
     The web server provides:
@@ -4763,6 +4792,7 @@ def server(ctx, host, port, reload, workers):
         thestill server --port 8080          # Custom port
         thestill server --host 0.0.0.0       # Bind to all interfaces
         thestill server --reload             # Auto-reload for development
+        thestill server --role web           # HTTP only, tasks run in 'thestill worker'
     """
     try:
         import uvicorn
@@ -4781,6 +4811,8 @@ def server(ctx, host, port, reload, workers):
     click.echo(f"   Storage: {config.storage_path}")
     click.echo(f"   Database: {config.database_path}")
 
+    click.echo(f"   Role: {role}")
+
     if reload:
         click.echo("   Mode: Development (auto-reload enabled)")
     else:
@@ -4793,7 +4825,7 @@ def server(ctx, host, port, reload, workers):
     click.echo("")
 
     # Create app with existing config to share services
-    app = create_app(config)
+    app = create_app(config, role=role)
 
     # Run uvicorn. ``timeout_graceful_shutdown`` caps the connection-drain
     # wait on SIGTERM/SIGINT: the default (None) waits for in-flight requests
@@ -4813,5 +4845,83 @@ def server(ctx, host, port, reload, workers):
     )
 
 
+@main.command()
+@click.option(
+    "--stages",
+    default="",
+    help="Comma-separated stages to process, e.g. 'transcribe' or 'clean,summarize' (default: all)",
+)
+@click.option(
+    "--jobs",
+    "-j",
+    multiple=True,
+    metavar="STAGE=N",
+    help="Concurrent tasks for a stage, overriding <STAGE>_PARALLEL_JOBS (repeatable)",
+)
+@click.option(
+    "--schedulers/--no-schedulers",
+    default=True,
+    help="Contend for the scheduler lease (refresh/briefing schedulers run in one process only)",
+)
+@click.option(
+    "--recover/--no-recover",
+    default=True,
+    help="Reset this worker's interrupted tasks to pending on startup",
+)
+@click.pass_context
+@require_config
+@log_command
+def worker(ctx, stages, jobs, schedulers, recover):
+    """Process queued tasks without serving HTTP.
+
+    Run any number of workers against the same database to scale task
+    processing horizontally, with `thestill server --role web` serving the
+    API. Each worker claims only the stages it is given, so transcription
+    can live on GPU hosts and the LLM stages elsewhere.
+
+    Startup recovery resets the worker's interrupted in-progress tasks.
+    While other workers are alive (each holds a presence lease) it only
+    touches tasks older than the stale timeout, so starting another worker
+    never resets tasks a peer is running.
+
+    Examples:
+        thestill worker                                  # All stages
+        thestill worker --stages transcribe -j transcribe=2
+        thestill worker --stages clean,summarize --no-schedulers
+    """
+    import signal
+    import threading
+
+    from .web.app import build_app_state
+    from .web.background import BackgroundServices, parse_stage_jobs, parse_stages
+
+    config = ctx.obj.config
+    try:
+        worker_stages = parse_stages(stages)
+        stage_jobs = parse_stage_jobs(jobs, config.get_parallel_jobs_per_stage())
+    except ValueError as e:
+        raise click.BadParameter(str(e))
+
+    click.echo("⚙️  Starting thestill worker...")
+    click.echo(f"   Stages: {', '.join(f'{s.value}={stage_jobs[s]}' for s in worker_stages)}")
+    click.echo(f"   Schedulers: {'lease candidate' if schedulers else 'off'}")
+    click.echo(f"   Database: {config.database_path}")
+
+    app_state = build_app_state(config, worker_stages=worker_stages, parallel_jobs_per_stage=stage_jobs)
+    background = BackgroundServices(app_state, run_schedulers=schedulers, recover=recover)
+
+    stop = threading.Event()
+    for signum in (signal.SIGINT, signal.SIGTERM):
+        signal.signal(signum, lambda *_: stop.set())
+
+    background.start()
+    try:
+        stop.wait()
+    finally:
+        click.echo("\n🛑 Stopping worker (waiting for in-flight tasks)...")
+        background.stop()
+        app_state.progress_store.close()
+
+
 if __name__ == "__main__":
     main()
@@ -13,9 +13,15 @@
 # limitations under the License.
 
 import hashlib
+import json
 import os
+import re
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import asdict, dataclass, field
 from pathlib import Path
-from typing import Optional
+from typing import Dict, List, Optional
 from urllib.parse import urlparse
 
 import requests
@@ -36,6 +42,61 @@ class DownloadError(Exception):
     pass
 
 
+class _RangeNotHonoured(Exception):
+    """A resume request came back as something other than the bytes we asked for."""
+
+
+# ``Content-Range: bytes <first>-<last>/<total>``
+_CONTENT_RANGE_RE = re.compile(r"^\s*bytes\s+(\d+)-(\d+)/(\d+)\s*$", re.IGNORECASE)
+
+
+@dataclass
+class _Segment:
+    """One contiguous byte range of the target file. ``end`` is exclusive;
+    ``None`` means "until the body ends" (server sent no content-length)."""
+
+    start: int
+    end: Optional[int]
+    written: int = 0
+
+    @property
+    def done(self) -> bool:
+        return self.end is not None and self.start + self.written >= self.end
+
+
+@dataclass
+class _PartialManifest:
+    """Sidecar (``<file>.part.json``) describing an in-progress download.
+
+    ``etag`` / ``last_modified`` are sent back as ``If-Range`` on resume so a
+    changed enclosure restarts cleanly. Only ``resumable`` downloads (server
+    advertised ``Accept-Ranges: bytes`` and a length) are ever persisted.
+    """
+
+    url: str
+    total_bytes: Optional[int]
+    etag: Optional[str]
+    last_modified: Optional[str]
+    resumable: bool
+    segments: List[_Segment] = field(default_factory=list)
+    updated_at: float = field(default_factory=time.time)
+
+    def written_bytes(self) -> int:
+        return sum(segment.written for segment in self.segments)
+
+    def save(self, path: Path) -> None:
+        self.updated_at = time.time()
+        tmp = path.with_name(path.name + ".tmp")
+        tmp.write_text(json.dumps(asdict(self)), encoding="utf-8")
+        os.replace(tmp, path)
+
+    @classmethod
+    def load(cls, path: Path) -> "_PartialManifest":
+        data = json.loads(path.read_text(encoding="utf-8"))
+        segments = [_Segment(**segment) for segment in data.pop("segments")]
+        return cls(segments=segments, **data)
+
+
 class AudioDownloader:
     """
     Downloads podcast audio files from RSS feeds and YouTube.
@@ -52,6 +113,11 @@ class AudioDownloader:
     # Matches Config.max_audio_bytes so CLI / web / MCP see the same ceiling.
     _DEFAULT_MAX_BYTES = 2 * 1024 * 1024 * 1024  # 2 GiB
 
+    # Resumable / ranged downloads
+    _MANIFEST_FLUSH_BYTES = 4 * 1024 * 1024  # Persist progress at least every 4 MiB per range
+    _PARTIAL_MAX_AGE_SECONDS = 7 * 24 * 60 * 60  # Older partials are discarded, not resumed
+    _DEFAULT_PARALLEL_MIN_BYTES = 64 * 1024 * 1024  # Below this, one stream is as fast
+
     # Retry configuration
     _MAX_RETRY_ATTEMPTS = 3  # Maximum number of download retry attempts
     _RETRY_WAIT_MIN_SECONDS = 1  # Minimum wait time between retries
@@ -67,6 +133,9 @@ class AudioDownloader:
         storage_path: str = "./data/original_audio",
         *,
         max_bytes: Optional[int] = None,
+        parallel_ranges: int = 1,
+        parallel_min_bytes: Optional[int] = None,
+        partial_dir: Optional[str] = None,
     ) -> None:
         """
         Initialize audio downloader.
@@ -77,11 +146,26 @@ class AudioDownloader:
                 thread ``Config.max_audio_bytes`` through; if omitted we
                 use ``_DEFAULT_MAX_BYTES`` so bare instantiation in tests
                 still enforces the cap.
+            parallel_ranges: Number of concurrent ``Range`` requests used for
+                large files on servers that support them. 1 (default) keeps
+                a single stream.
+            parallel_min_bytes: Only split downloads at least this large.
+            partial_dir: Directory for ``.part`` files and their manifests.
+                Defaults to next to the final file; the worker points it at
+                a persistent location because it downloads into a tempdir
+                that would otherwise take the partial with it.
         """
         self.storage_path: Path = Path(storage_path)
         self.storage_path.mkdir(parents=True, exist_ok=True)
         self.media_source_factory: MediaSourceFactory = MediaSourceFactory(storage_path)
         self.max_bytes = int(max_bytes) if max_bytes is not None else self._DEFAULT_MAX_BYTES
+        self.parallel_ranges = max(1, int(parallel_ranges))
+        self.parallel_min_bytes = (
+            int(parallel_min_bytes) if parallel_min_bytes is not None else self._DEFAULT_PARALLEL_MIN_BYTES
+        )
+        self.partial_dir: Optional[Path] = Path(partial_dir) if partial_dir is not None else None
+        if self.partial_dir is not None:
+            self._sweep_abandoned_partials()
 
     def download_episode(
         self,
@@ -169,6 +253,16 @@ class AudioDownloader:
         Uses exponential backoff: waits 1s, 2s, 4s between attempts.
         Retries up to 3 times for transient network errors.
 
+        Bytes land in a ``.part`` file next to a JSON sidecar manifest (see
+        ``_PartialManifest``). When the server advertises ``Accept-Ranges:
+        bytes`` and a content length, a network error keeps both so the next
+        attempt — a tenacity retry or a later task retry — resumes with HTTP
+        ``Range`` requests instead of starting from zero. Large ranged files
+        are optionally split across ``parallel_ranges`` concurrent range
+        requests. The final file only appears at ``local_path`` once complete
+        and through the integrity check, so the ``exists()`` short-circuit in
+        ``download_episode`` never sees a partial.
+
         Args:
             url: Source URL to download from
             local_path: Destination file path
@@ -177,18 +271,77 @@ class AudioDownloader:
             requests.exceptions.RequestException: If download fails after all retries
             DownloadError: If the URL targets a private/loopback/cloud-metadata address.
         """
-        # Block SSRF targets and re-validate any 3xx
-        # redirect so a public URL cannot 302 into a private one.
+        part_path = self._partial_path(local_path)
+        manifest_path = part_path.with_name(part_path.name + ".json")
+        part_path.parent.mkdir(parents=True, exist_ok=True)
+
+        manifest = self._load_manifest(manifest_path, part_path, url)
+        try:
+            if manifest is not None:
+                try:
+                    logger.info(
+                        "download_resuming",
+                        url=url,
+                        resume_from_bytes=manifest.written_bytes(),
+                        total_bytes=manifest.total_bytes,
+                    )
+                    self._fetch_segments(url, part_path, manifest_path, manifest)
+                except _RangeNotHonoured as exc:
+                    # Resource changed (If-Range mismatch) or the server
+                    # stopped honouring ranges: the bytes on disk are no
+                    # longer trustworthy, start over within this attempt.
+                    logger.info("download_resume_restarted", url=url, reason=str(exc))
+                    self._discard_partial(part_path, manifest_path)
+                    manifest = None
+            if manifest is None:
+                manifest = self._start_download(url, part_path, manifest_path)
+        except requests.exceptions.RequestException:
+            # Network failure: keep resumable partials for the retry, drop
+            # the rest (nothing to resume from without ranges). Only
+            # resumable downloads ever write a manifest.
+            if not manifest_path.exists():
+                self._discard_partial(part_path, manifest_path)
+            raise
+        except Exception:
+            # Leave no half-written file behind if we bail on cap/IO error;
+            # callers re-queue downloads and a partial .mp3 is worse than
+            # nothing (ffprobe would happily "parse" it).
+            self._discard_partial(part_path, manifest_path)
+            raise
+
+        os.replace(part_path, local_path)
+        manifest_path.unlink(missing_ok=True)
+
+        # Magic-byte integrity check. Rejects zip bombs,
+        # HTML error pages, and polyglot payloads before ffmpeg gets a chance.
+        try:
+            codec = assert_audio_file(local_path)
+            logger.debug("audio_codec_detected", codec=codec, path=str(local_path))
+        except InvalidAudioFile as exc:
+            local_path.unlink(missing_ok=True)
+            raise DownloadError(f"Downloaded file failed integrity check: {exc}") from exc
+
+    def _guarded_get(self, url: str, extra_headers: Optional[Dict[str, str]] = None) -> requests.Response:
+        """Streaming GET through the SSRF guard (every redirect hop re-validated)."""
+        headers = {"User-Agent": "Thestill/1.0"}
+        if extra_headers:
+            headers.update(extra_headers)
         try:
-            response = guarded_redirect_fetch(
+            return guarded_redirect_fetch(
                 url,
                 requests.get,
                 stream=True,
-                headers={"User-Agent": "Thestill/1.0"},
+                headers=headers,
                 timeout=self._DEFAULT_TIMEOUT_SECONDS,
             )
         except UnsafeURLError as exc:
             raise DownloadError(f"Refusing to download from unsafe URL: {exc}") from exc
+
+    def _start_download(self, url: str, part_path: Path, manifest_path: Path) -> "_PartialManifest":
+        """Fetch ``url`` from byte zero into ``part_path``; returns the finished manifest."""
+        # Block SSRF targets and re-validate any 3xx
+        # redirect so a public URL cannot 302 into a private one.
+        response = self._guarded_get(url)
         response.raise_for_status()
 
         # Pre-check content-length, then enforce a
@@ -196,42 +349,239 @@ class AudioDownloader:
         # defeat the limit.
         try:
             advertised = int(response.headers.get("content-length", 0))
-        except ValueError:
+        except (TypeError, ValueError):
             advertised = 0
         if advertised and advertised > self.max_bytes:
             raise DownloadError(
                 f"Refusing download: server advertised {advertised} bytes, " f"cap is {self.max_bytes} bytes"
             )
 
-        downloaded = 0
+        accept_ranges = str(response.headers.get("accept-ranges") or "").lower()
+        manifest = _PartialManifest(
+            url=url,
+            total_bytes=advertised or None,
+            etag=response.headers.get("etag"),
+            last_modified=response.headers.get("last-modified"),
+            resumable=accept_ranges == "bytes" and bool(advertised),
+            segments=[],
+        )
+
+        parallel = manifest.resumable and self.parallel_ranges > 1 and advertised >= max(self.parallel_min_bytes, 1)
+        if parallel:
+            span = -(-advertised // self.parallel_ranges)  # ceil division
+            manifest.segments = [
+                _Segment(start=offset, end=min(offset + span, advertised)) for offset in range(0, advertised, span)
+            ]
+            logger.info(
+                "download_parallel_ranges",
+                url=url,
+                total_bytes=advertised,
+                ranges=len(manifest.segments),
+            )
+        else:
+            manifest.segments = [_Segment(start=0, end=advertised or None)]
+
+        # Preallocate so every range writer can seek to its own offset.
+        with open(part_path, "wb") as f:
+            if parallel:
+                f.truncate(advertised)
+        if manifest.resumable:
+            manifest.save(manifest_path)
+
+        lock = threading.Lock()
+        # The first range rides on the response we already hold; it stops
+        # reading at the segment boundary when the body is larger.
+        self._write_segment(response, part_path, manifest_path, manifest, manifest.segments[0], lock)
+        if parallel:
+            self._fetch_segments(url, part_path, manifest_path, manifest, lock=lock)
+        elif advertised and not manifest.segments[0].done:
+            # Same as a short range: a body that stops before the advertised
+            # length is a dropped connection, not a finished file.
+            raise requests.exceptions.ChunkedEncodingError(
+                f"body ended after {manifest.written_bytes()} of {advertised} bytes"
+            )
+        return manifest
+
+    def _fetch_segments(
+        self,
+        url: str,
+        part_path: Path,
+        manifest_path: Path,
+        manifest: "_PartialManifest",
+        lock: Optional[threading.Lock] = None,
+    ) -> None:
+        """Complete every unfinished segment with ``Range`` requests (concurrently if several)."""
+        lock = lock or threading.Lock()
+        pending = [segment for segment in manifest.segments if not segment.done]
+        if not pending:
+            return
+
+        def fetch(segment: _Segment) -> None:
+            self._fetch_range(url, part_path, manifest_path, manifest, segment, lock)
+
+        if len(pending) == 1 or self.parallel_ranges <= 1:
+            for segment in pending:
+                fetch(segment)
+            return
+
+        with ThreadPoolExecutor(
+            max_workers=min(self.parallel_ranges, len(pending)), thread_name_prefix="audio-range"
+        ) as pool:
+            futures = [pool.submit(fetch, segment) for segment in pending]
+            # Surface the first failure only after every range has stopped, so
+            # the manifest saved on the way out reflects all of their progress.
+            errors = [future.exception() for future in futures]
+        for error in errors:
+            if error is not None:
+                raise error
+
+    def _fetch_range(
+        self,
+        url: str,
+        part_path: Path,
+        manifest_path: Path,
+        manifest: "_PartialManifest",
+        segment: "_Segment",
+        lock: threading.Lock,
+    ) -> None:
+        """Fetch the missing tail of one segment and write it in place."""
+        first = segment.start + segment.written
+        last = manifest.total_bytes - 1 if segment.end is None else segment.end - 1
+        headers = {"Range": f"bytes={first}-{last}"}
+        # If-Range turns a changed resource into a plain 200 with the new
+        # body instead of silently stitching two versions together.
+        validator = manifest.etag or manifest.last_modified
+        if validator:
+            headers["If-Range"] = validator
+
+        response = self._guarded_get(url, headers)
+        if response.status_code == 416:
+            raise _RangeNotHonoured(f"range {first}-{last} not satisfiable")
+        response.raise_for_status()
+        if response.status_code != 206:
+            response.close()
+            raise _RangeNotHonoured(f"expected 206 for range {first}-{last}, got {response.status_code}")
+        content_range = str(response.headers.get("content-range") or "")
+        match = _CONTENT_RANGE_RE.match(content_range)
+        if not match or int(match.group(1)) != first or int(match.group(3)) != manifest.total_bytes:
+            response.close()
+            raise _RangeNotHonoured(f"unexpected Content-Range {content_range!r} for bytes {first}-{last}")
+
+        self._write_segment(response, part_path, manifest_path, manifest, segment, lock)
+        if not segment.done:
+            # The body ended early without an exception from urllib3; treat
+            # it as a dropped connection so tenacity retries (and resumes).
+            raise requests.exceptions.ChunkedEncodingError(
+                f"range {first}-{last} ended after {segment.start + segment.written - first} bytes"
+            )
+
+    def _write_segment(
+        self,
+        response: requests.Response,
+        part_path: Path,
+        manifest_path: Path,
+        manifest: "_PartialManifest",
+        segment: "_Segment",
+        lock: threading.Lock,
+    ) -> None:
+        """Stream ``response`` into ``part_path`` at the segment's current offset.
+
+        Progress is flushed to disk before it is recorded in the manifest, so
+        a crash can only make the manifest under-report (re-fetching a few
+        bytes), never claim bytes that were not written.
+        """
+        unsaved = 0
         try:
-            with open(local_path, "wb") as f:
+            with open(part_path, "r+b") as f:
+                f.seek(segment.start + segment.written)
                 for chunk in response.iter_content(chunk_size=self._CHUNK_SIZE_BYTES):
-                    if chunk:
-                        f.write(chunk)
-                        downloaded += len(chunk)
-                        if downloaded > self.max_bytes:
-                            raise DownloadError(
-                                f"Refusing download: stream exceeded cap " f"({self.max_bytes} bytes) while reading"
-                            )
-        except Exception:
-            # Leave no half-written file behind if we bail on cap/IO error;
-            # callers re-queue downloads and a partial .mp3 is worse than
-            # nothing (ffprobe would happily "parse" it).
+                    if not chunk:
+                        continue
+                    if segment.end is not None:
+                        remaining = segment.end - (segment.start + segment.written)
+                        if remaining <= 0:
+                            break
+                        chunk = chunk[:remaining]
+                    f.write(chunk)
+                    with lock:
+                        segment.written += len(chunk)
+                        downloaded = manifest.written_bytes()
+                    if downloaded > self.max_bytes:
+                        raise DownloadError(
+                            f"Refusing download: stream exceeded cap " f"({self.max_bytes} bytes) while reading"
+                        )
+                    unsaved += len(chunk)
+                    if manifest.resumable and unsaved >= self._MANIFEST_FLUSH_BYTES:
+                        f.flush()
+                        with lock:
+                            manifest.save(manifest_path)
+                        unsaved = 0
+        finally:
+            response.close()
+            if manifest.resumable:
+                with lock:
+                    manifest.save(manifest_path)
+
+    def _partial_path(self, local_path: Path) -> Path:
+        """Where the in-progress bytes for ``local_path`` live."""
+        if self.partial_dir is None:
+            return local_path.with_name(local_path.name + ".part")
+        try:
+            relative = local_path.relative_to(self.storage_path)
+        except ValueError:
+            relative = Path(local_path.name)
+        return self.partial_dir / relative.parent / (relative.name + ".part")
+
+    def _load_manifest(self, manifest_path: Path, part_path: Path, url: str) -> Optional["_PartialManifest"]:
+        """Return a resumable manifest for ``url``, discarding anything stale or foreign."""
+        if not manifest_path.exists() or not part_path.exists():
+            self._discard_partial(part_path, manifest_path)
+            return None
+        try:
+            manifest = _PartialManifest.load(manifest_path)
+        except (OSError, ValueError, KeyError, TypeError) as exc:
+            logger.warning("download_manifest_unreadable", path=str(manifest_path), error=str(exc))
+            self._discard_partial(part_path, manifest_path)
+            return None
+        too_old = time.time() - manifest.updated_at > self._PARTIAL_MAX_AGE_SECONDS
+        if manifest.url != url or not manifest.resumable or too_old:
+            self._discard_partial(part_path, manifest_path)
+            return None
+        return manifest
+
+    def _sweep_abandoned_partials(self) -> None:
+        """Delete partials nobody will resume: episodes that were never retried.
+
+        ``_load_manifest`` only discards a stale partial when the same
+        episode is downloaded again, so without this the directory keeps
+        every abandoned ``.part`` forever.
+        """
+        cutoff = time.time() - self._PARTIAL_MAX_AGE_SECONDS
+        removed = 0
+        try:
+            paths = sorted(self.partial_dir.rglob("*"), reverse=True)  # children before their directory
+        except OSError:
+            return
+        for path in paths:
+            try:
+                if path.is_dir():
+                    if not any(path.iterdir()):
+                        path.rmdir()
+                elif path.stat().st_mtime < cutoff:
+                    path.unlink()
+                    removed += 1
+            except OSError:
+                continue
+        if removed:
+            logger.info("download_partials_swept", files_count=removed, partial_dir=str(self.partial_dir))
+
+    @staticmethod
+    def _discard_partial(part_path: Path, manifest_path: Path) -> None:
+        for path in (part_path, manifest_path):
             try:
-                local_path.unlink(missing_ok=True)
+                path.unlink(missing_ok=True)
             except Exception:  # pragma: no cover — best-effort cleanup
                 pass
-            raise
-
-        # Magic-byte integrity check. Rejects zip bombs,
-        # HTML error pages, and polyglot payloads before ffmpeg gets a chance.
-        try:
-            codec = assert_audio_file(local_path)
-            logger.debug("audio_codec_detected", codec=codec, path=str(local_path))
-        except InvalidAudioFile as exc:
-            local_path.unlink(missing_ok=True)
-            raise DownloadError(f"Downloaded file failed integrity check: {exc}") from exc
 
     def delete_audio_file(self, episode: Episode) -> bool:
         """
@@ -272,8 +622,6 @@ class AudioDownloader:
         Returns:
             Number of files that were deleted (or would be deleted in dry-run mode)
         """
-        import time
-
         cutoff_time = time.time() - (days * 24 * 60 * 60)
 
         removed_count = 0
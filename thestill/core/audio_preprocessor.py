@@ -17,15 +17,53 @@ Audio preprocessing module for optimizing audio files before transcription.
 
 This module detects high-quality audio files and downsamples them to optimal
 settings for Whisper/Parakeet transcription models (16kHz, 16-bit, mono).
+
+``downsample_audio`` (the DOWNSAMPLE pipeline stage) streams the input
+through a single ffmpeg process instead of decoding it with pydub: pydub's
+``AudioSegment.from_file`` materialises the whole episode as raw PCM (a
+3-hour 48kHz stereo episode is >2 GB before the channel/rate copies), which
+is what OOM'd workers once DOWNSAMPLE ran more than two jobs in parallel.
+ffmpeg decodes, resamples and writes in fixed-size frames, so memory stays
+flat regardless of episode length. Each run records wall time and the ffmpeg
+child's peak RSS (``DownsampleStats``) so the stage can be sized by bytes.
 """
 
 import os
+import shutil
+import subprocess
+import sys
+import time
+from dataclasses import asdict, dataclass
 from pathlib import Path
-from typing import Optional, Tuple
+from typing import List, Optional, Tuple
 
 from pydub import AudioSegment
+from structlog import get_logger
 
 from thestill.utils.console import ConsoleOutput
+from thestill.utils.ffmpeg_path import ensure_ffmpeg_on_path
+
+logger = get_logger(__name__)
+
+# How much of ffmpeg's stderr to keep in the raised error. ``-loglevel error``
+# keeps it short already; the tail is where the actual failure reason is.
+_FFMPEG_STDERR_TAIL_CHARS = 2000
+
+
+@dataclass
+class DownsampleStats:
+    """Resource usage of one ``downsample_audio`` call.
+
+    ``peak_rss_bytes`` is the ffmpeg child's max resident set size as reported
+    by ``wait4``; it is ``None`` on platforms without ``os.wait4`` and for
+    skipped (already-downsampled) runs.
+    """
+
+    input_bytes: int
+    output_bytes: int
+    wall_seconds: float
+    peak_rss_bytes: Optional[int] = None
+    skipped: bool = False
 
 
 class AudioPreprocessor:
@@ -46,6 +84,8 @@ class AudioPreprocessor:
         """
         self.logger = logger
         self.console = console or ConsoleOutput()
+        # Stats of the most recent downsample_audio() call (None until one ran).
+        self.last_downsample_stats: Optional[DownsampleStats] = None
 
     def _log(self, message: str):
         """Log a message using logger if available, otherwise console"""
@@ -256,18 +296,94 @@ class AudioPreprocessor:
             self._log(f"Error deleting downsampled audio file {downsampled_audio_path}: {e}")
             return False
 
+    def _build_downsample_command(self, ffmpeg: str, audio_path: str, output_path: str) -> List[str]:
+        """ffmpeg argv that decodes ``audio_path`` and writes 16kHz/s16/mono WAV."""
+        return [
+            ffmpeg,
+            "-nostdin",
+            "-hide_banner",
+            "-loglevel",
+            "error",
+            "-y",
+            "-i",
+            audio_path,
+            "-vn",  # Drop cover art / video streams
+            "-ac",
+            str(self.TARGET_CHANNELS),
+            "-ar",
+            str(self.TARGET_SAMPLE_RATE),
+            "-sample_fmt",
+            "s16",  # 16-bit signed integer
+            "-c:a",
+            "pcm_s16le",
+            "-f",
+            "wav",  # Explicit: the temp output name has no .wav suffix
+            output_path,
+        ]
+
+    @staticmethod
+    def _run_ffmpeg(command: List[str]) -> Tuple[int, str, Optional[int]]:
+        """
+        Run ffmpeg to completion and return (returncode, stderr, peak_rss_bytes).
+
+        The child is reaped with ``os.wait4`` rather than ``Popen.wait`` so its
+        rusage (and therefore its own peak RSS, not the worker's) comes back
+        with the exit status. stdout is discarded; stderr is drained before
+        reaping so a chatty failure cannot block on a full pipe.
+        """
+        proc = subprocess.Popen(
+            command,
+            stdin=subprocess.DEVNULL,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.PIPE,
+        )
+        try:
+            stderr = proc.stderr.read() if proc.stderr else b""
+        finally:
+            if proc.stderr:
+                proc.stderr.close()
+
+        peak_rss_bytes: Optional[int] = None
+        if hasattr(os, "wait4"):
+            try:
+                _, status, rusage = os.wait4(proc.pid, 0)
+            except ChildProcessError:
+                returncode = proc.wait()
+            else:
+                returncode = os.waitstatus_to_exitcode(status)
+                proc.returncode = returncode
+                # ru_maxrss is bytes on macOS, kilobytes everywhere else.
+                scale = 1 if sys.platform == "darwin" else 1024
+                peak_rss_bytes = rusage.ru_maxrss * scale
+        else:
+            returncode = proc.wait()
+
+        return returncode, stderr.decode("utf-8", errors="replace"), peak_rss_bytes
+
     def downsample_audio(self, audio_path: str, output_dir: str) -> Optional[str]:
         """
         Downsample audio to 16kHz, 16-bit, mono WAV for optimal transcription and diarization.
         This method does NOT perform any audio enhancement (no silence removal, no normalization).
 
+        The conversion is streamed through ffmpeg into ``<stem>.wav.part`` and
+        renamed into place on success, so memory use is constant in episode
+        length and a crashed run never leaves a truncated WAV that the
+        skip-if-exists check would later accept. Resource usage is stored on
+        ``self.last_downsample_stats`` and logged as ``audio_downsample_completed``.
+
         Args:
             audio_path: Path to the original audio file (any format)
             output_dir: Directory where the downsampled WAV file should be saved
 
         Returns:
             Path to the downsampled WAV file, or None if downsampling failed
+
+        Raises:
+            FileNotFoundError: If the input file or the ffmpeg binary is missing
+            RuntimeError: If ffmpeg exits non-zero (message carries its stderr)
         """
+        self.last_downsample_stats = None
+        tmp_path: Optional[Path] = None
         try:
             output_path_obj = Path(output_dir)
             output_path_obj.mkdir(parents=True, exist_ok=True)
@@ -280,49 +396,53 @@ class AudioPreprocessor:
             # Check if already downsampled
             if output_path.exists():
                 self._log(f"Downsampled audio already exists: {output_filename}")
+                self.last_downsample_stats = DownsampleStats(
+                    input_bytes=input_path.stat().st_size if input_path.exists() else 0,
+                    output_bytes=output_path.stat().st_size,
+                    wall_seconds=0.0,
+                    skipped=True,
+                )
                 return str(output_path)
 
-            self._log(f"Downsampling audio: {input_path.name}")
+            if not input_path.exists():
+                raise FileNotFoundError(f"Audio file not found: {audio_path}")
 
-            # Load audio (pydub handles all formats via ffmpeg)
-            audio = AudioSegment.from_file(audio_path)
+            ensure_ffmpeg_on_path()
+            ffmpeg = shutil.which("ffmpeg")
+            if not ffmpeg:
+                raise FileNotFoundError("ffmpeg not found on PATH")
 
-            # Get original properties for logging
-            original_rate = audio.frame_rate
-            original_channels = audio.channels
-            original_width = audio.sample_width
+            self._log(f"Downsampling audio: {input_path.name}")
 
-            # Convert to target settings
-            # 1. Convert to mono if needed
-            if audio.channels > 1:
-                audio = audio.set_channels(self.TARGET_CHANNELS)
+            input_bytes = input_path.stat().st_size
+            tmp_path = output_path_obj / f"{output_filename}.part"
+            started = time.monotonic()
+            returncode, stderr, peak_rss_bytes = self._run_ffmpeg(
+                self._build_downsample_command(ffmpeg, str(input_path), str(tmp_path))
+            )
+            wall_seconds = time.monotonic() - started
 
-            # 2. Downsample to 16kHz if needed
-            if audio.frame_rate != self.TARGET_SAMPLE_RATE:
-                audio = audio.set_frame_rate(self.TARGET_SAMPLE_RATE)
+            if returncode != 0 or not tmp_path.exists():
+                detail = stderr.strip()[-_FFMPEG_STDERR_TAIL_CHARS:] or "no output"
+                raise RuntimeError(f"ffmpeg exited with status {returncode}: {detail}")
 
-            # 3. Set to 16-bit if needed
-            if audio.sample_width != self.TARGET_SAMPLE_WIDTH:
-                audio = audio.set_sample_width(self.TARGET_SAMPLE_WIDTH)
+            os.replace(tmp_path, output_path)
+            tmp_path = None
 
-            # Export as WAV
-            audio.export(
-                str(output_path),
-                format="wav",
-                parameters=[
-                    "-ar",
-                    str(self.TARGET_SAMPLE_RATE),
-                    "-ac",
-                    str(self.TARGET_CHANNELS),
-                    "-sample_fmt",
-                    "s16",  # 16-bit signed integer
-                ],
+            stats = DownsampleStats(
+                input_bytes=input_bytes,
+                output_bytes=output_path.stat().st_size,
+                wall_seconds=round(wall_seconds, 3),
+                peak_rss_bytes=peak_rss_bytes,
             )
+            self.last_downsample_stats = stats
+            logger.info("audio_downsample_completed", input_file=input_path.name, **asdict(stats))
 
             # Report results
             self._log(f"Downsampling complete!")
-            self._log(f"  Original: {original_rate}Hz, {original_width * 8}-bit, {original_channels} channel(s)")
             self._log(f"  Output: {self.TARGET_SAMPLE_RATE}Hz, {self.TARGET_SAMPLE_WIDTH * 8}-bit, mono")
+            peak_mb = f"{peak_rss_bytes / (1024 * 1024):.1f} MB" if peak_rss_bytes is not None else "n/a"
+            self._log(f"  Took {wall_seconds:.1f}s, ffmpeg peak RSS {peak_mb}")
             self._log(f"  Saved to: {output_filename}")
 
             return str(output_path)
@@ -330,3 +450,10 @@ class AudioPreprocessor:
         except Exception as e:
             self._log(f"Error downsampling audio: {e}")
             raise
+        finally:
+            # Never leave a partial WAV behind for the next attempt to trip over.
+            if tmp_path is not None and tmp_path.exists():
+                try:
+                    tmp_path.unlink()
+                except OSError:
+                    pass
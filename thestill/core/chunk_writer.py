@@ -30,14 +30,15 @@ from __future__ import annotations
 import sqlite3
 from contextlib import contextmanager
 from pathlib import Path
-from typing import Optional
+from typing import Optional, Union
 
 from structlog import get_logger
 
 from ..models.annotated_transcript import AnnotatedTranscript
-from ..utils.sqlite_ext import connect
+from ..utils.sqlite_ext import pooled_connect
 from ..utils.text_sanitizer import sanitize_text
 from .embedding_model import EmbeddingModel, centroid_blob
+from .transcript_stream import StreamedTranscript
 
 logger = get_logger(__name__)
 
@@ -61,15 +62,15 @@ class ChunkWriter:
         ``SqliteVecNotInstalledError`` if it's missing — chunk writes are
         impossible without it, so a hard error is the right surface (vs. the
         soft-load used by repos that only need it for cascade triggers).
-        See ``thestill.utils.sqlite_ext.connect``.
+        See ``thestill.utils.sqlite_ext.pooled_connect``.
         """
-        with connect(self.db_path, load_vec="require") as conn:
+        with pooled_connect(self.db_path, load_vec="require") as conn:
             yield conn
 
     def write_episode(
         self,
         episode_id: str,
-        transcript: AnnotatedTranscript,
+        transcript: Union[AnnotatedTranscript, StreamedTranscript],
         *,
         force: bool = False,
     ) -> int:
@@ -83,6 +84,10 @@ class ChunkWriter:
         parallel reindex workers don't serialize on the SQLite writer
         lock during the embedding compute (which dominates wall time).
         Only the DELETE+INSERT phase opens a write connection.
+
+        Only segment ``id``, timing, ``speaker``, ``text`` and ``kind`` are
+        read, so callers loading from disk pass the lighter
+        ``transcript_stream.load_segments`` result instead of the model.
         """
         content_segs = [s for s in transcript.segments if s.kind == "content" and s.text.strip()]
         if not content_segs:
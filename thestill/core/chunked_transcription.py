@@ -0,0 +1,496 @@
+# Copyright 2025-2026 Thestill
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Silence-chunked, multi-process transcription for local CPU engines.
+
+``WhisperTranscriber`` and ``ParakeetTranscriber`` hand a whole file to one
+``model.transcribe`` call, which runs single-stream: a 2-hour episode keeps
+one core's worth of the model busy however many cores the host has. This
+module is the local counterpart of ``GoogleCloudTranscriber``'s chunked
+path:
+
+1. ``plan_chunks`` reads the downsampled 16 kHz mono WAV once, computes a
+   30 ms frame energy envelope, and places each cut in the longest quiet run
+   near the target boundary. When a window has no pause (music beds,
+   crosstalk) it cuts at the quietest frame and lets the neighbouring chunks
+   overlap by ``overlap_seconds`` so the straddling words are heard whole.
+2. Chunks are written as WAV slices and transcribed on a persistent
+   ``ProcessPoolExecutor`` (spawn). Each worker process builds its
+   transcriber once and keeps the model resident in its own ``ModelPool``,
+   so the load cost is paid per worker, not per chunk or per episode.
+3. ``stitch_chunks`` shifts each chunk's timestamps by its start, keeps
+   only words inside the chunk's own span (cut to cut), and drops
+   same-text words within ``duplicate_window_sec`` of each other across a
+   boundary, the same rule ``Transcript.merge`` uses. Unlike ``merge``, it
+   keeps the engine's segment structure rather than regrouping by speaker.
+
+Each worker process holds its own copy of the model: memory is
+``workers x model size``. Torch intra-op threads are split across workers
+to avoid oversubscribing the cores.
+"""
+
+from __future__ import annotations
+
+import math
+import multiprocessing
+import os
+import tempfile
+import threading
+import time
+import wave
+from concurrent.futures import Executor, ProcessPoolExecutor, as_completed
+from contextlib import contextmanager, nullcontext
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Callable, Dict, Iterator, List, NamedTuple, Optional, Tuple
+
+from structlog import get_logger
+
+from thestill.models.transcript import Segment, Transcript, Word
+from thestill.models.transcription import TranscribeOptions
+
+from .progress import ProgressUpdate, TranscriptionStage
+
+logger = get_logger(__name__)
+
+FRAME_SECONDS = 0.03
+DEFAULT_OVERLAP_SECONDS = 1.0
+DUPLICATE_WINDOW_SEC = 0.5
+# Shortest quiet run that counts as a pause worth cutting in.
+MIN_PAUSE_SECONDS = 0.2
+# Never cut into chunks shorter than this, whatever the worker count.
+MIN_CHUNK_SECONDS = 60.0
+
+
+@dataclass(frozen=True)
+class AudioChunk:
+    """One slice of the source WAV.
+
+    ``start``/``end`` are what gets transcribed (including any overlap);
+    ``own_start``/``own_end`` are the cut points — the words this chunk is
+    authoritative for when stitching.
+    """
+
+    index: int
+    start: float
+    end: float
+    own_start: float
+    own_end: float
+
+
+class WorkerSpec(NamedTuple):
+    """What a chunk worker process builds: provider, weights, torch threads."""
+
+    provider: str
+    model_name: str
+    device: str
+    threads: int
+
+
+# ---------------------------------------------------------------------------
+# Chunk planning
+# ---------------------------------------------------------------------------
+
+
+def _frame_energy_db(wav_path: str) -> Tuple[List[float], float]:
+    """Per-frame RMS level in dBFS, plus the file duration in seconds.
+
+    Streams the file in blocks, so a 2-hour WAV never sits in memory whole.
+    Raises ``ValueError`` for anything but 16-bit PCM.
+    """
+    import numpy as np  # pylint: disable=import-outside-toplevel
+
+    with wave.open(wav_path, "rb") as wav:
+        if wav.getsampwidth() != 2:
+            raise ValueError(f"expected 16-bit PCM, got {wav.getsampwidth() * 8}-bit")
+        rate, channels, total = wav.getframerate(), wav.getnchannels(), wav.getnframes()
+        frame = max(1, int(rate * FRAME_SECONDS))
+        levels: List[float] = []
+        carry = np.zeros(0, dtype=np.float32)
+        while True:
+            raw = wav.readframes(frame * 2000)
+            if not raw:
+                break
+            samples = np.frombuffer(raw, dtype="<i2").astype(np.float32)
+            if channels > 1:
+                samples = samples.reshape(-1, channels).mean(axis=1)
+            samples = np.concatenate([carry, samples])
+            usable = len(samples) - len(samples) % frame
+            carry = samples[usable:]
+            if usable:
+                blocks = samples[:usable].reshape(-1, frame) / 32768.0
+                rms = np.sqrt(np.mean(blocks * blocks, axis=1))
+                levels.extend((20.0 * np.log10(np.maximum(rms, 1e-6))).tolist())
+    return levels, total / float(rate)
+
+
+def _pick_cut(levels: List[float], lo: int, hi: int, threshold: float, min_run: int) -> Tuple[int, bool]:
+    """Frame index to cut at within ``[lo, hi)`` and whether it is a pause.
+
+    Prefers the centre of the longest run of frames under ``threshold``;
+    otherwise the quietest frame (a hard cut that needs overlap).
+    """
+    best_start, best_len, run_start = -1, 0, None
+    for i in range(lo, hi + 1):
+        quiet = i < hi and levels[i] < threshold
+        if quiet and run_start is None:
+            run_start = i
+        elif not quiet and run_start is not None:
+            if i - run_start > best_len:
+                best_start, best_len = run_start, i - run_start
+            run_start = None
+    if best_len >= min_run:
+        return best_start + best_len // 2, True
+    window = levels[lo:hi]
+    return lo + min(range(len(window)), key=window.__getitem__), False
+
+
+def plan_chunks(
+    wav_path: str,
+    target_seconds: float,
+    *,
+    overlap_seconds: float = DEFAULT_OVERLAP_SECONDS,
+) -> List[AudioChunk]:
+    """Split ``wav_path`` into ~``target_seconds`` chunks cut at pauses.
+
+    Each cut is searched for within ±25% of its nominal position. The quiet
+    threshold adapts to the recording: 6 dB above its 15th-percentile
+    frame level (at most 15 dB under the median), so both studio silence
+    and a noisy room register pauses.
+    """
+    levels, duration = _frame_energy_db(wav_path)
+    if duration <= target_seconds * 1.5 or not levels:
+        return [AudioChunk(0, 0.0, duration, 0.0, duration)]
+
+    ordered = sorted(levels)
+    # Capped below the median so a recording with few pauses (where the
+    # 15th percentile is itself speech) does not read as all-quiet.
+    threshold = min(ordered[int(len(ordered) * 0.15)] + 6.0, ordered[len(ordered) // 2] - 15.0)
+    count = max(2, round(duration / target_seconds))
+    step = duration / count
+    search = int(step * 0.25 / FRAME_SECONDS)
+    min_run = max(1, int(MIN_PAUSE_SECONDS / FRAME_SECONDS))
+
+    cuts: List[Tuple[float, bool]] = []
+    for k in range(1, count):
+        nominal = int(k * step / FRAME_SECONDS)
+        lo = max(0, nominal - search)
+        hi = min(len(levels), nominal + search)
+        frame, is_pause = _pick_cut(levels, lo, hi, threshold, min_run)
+        cuts.append((frame * FRAME_SECONDS, is_pause))
+
+    chunks: List[AudioChunk] = []
+    bounds = [(0.0, True)] + cuts + [(duration, True)]
+    for i in range(len(bounds) - 1):
+        own_start, start_is_pause = bounds[i]
+        own_end, end_is_pause = bounds[i + 1]
+        start = own_start if start_is_pause else max(0.0, own_start - overlap_seconds)
+        end = own_end if end_is_pause else min(duration, own_end + overlap_seconds)
+        chunks.append(AudioChunk(i, start, end, own_start, own_end))
+    return chunks
+
+
+def write_chunk_wavs(wav_path: str, chunks: List[AudioChunk], out_dir: Path) -> List[str]:
+    """Write each chunk's ``[start, end)`` slice as its own WAV file."""
+    paths: List[str] = []
+    with wave.open(wav_path, "rb") as src:
+        rate = src.getframerate()
+        for chunk in chunks:
+            first = int(chunk.start * rate)
+            last = min(src.getnframes(), int(math.ceil(chunk.end * rate)))
+            src.setpos(first)
+            path = out_dir / f"chunk_{chunk.index:04d}.wav"
+            with wave.open(str(path), "wb") as dst:
+                dst.setnchannels(src.getnchannels())
+                dst.setsampwidth(src.getsampwidth())
+                dst.setframerate(rate)
+                remaining = last - first
+                while remaining > 0:
+                    block = src.readframes(min(remaining, rate * 30))
+                    if not block:
+                        break
+                    dst.writeframes(block)
+                    remaining -= len(block) // (src.getsampwidth() * src.getnchannels())
+            paths.append(str(path))
+    return paths
+
+
+# ---------------------------------------------------------------------------
+# Stitching
+# ---------------------------------------------------------------------------
+
+
+def _owned_segments(transcript: Transcript, chunk: AudioChunk, is_last: bool) -> List[Segment]:
+    """Shift to file time and keep only what falls in the chunk's own span."""
+    shifted = transcript.adjust_timestamps(chunk.start)
+
+    def owned(t: float) -> bool:
+        return chunk.own_start <= t and (t < chunk.own_end or is_last)
+
+    kept: List[Segment] = []
+    for segment in shifted.segments:
+        if not segment.words:
+            if owned(segment.start):
+                kept.append(segment)
+            continue
+        words = [w for w in segment.words if owned(w.start if w.start is not None else segment.start)]
+        if not words:
+            continue
+        if len(words) == len(segment.words):
+            kept.append(segment)
+            continue
+        kept.append(
+            segment.model_copy(
+                update={
+                    "start": words[0].start if words[0].start is not None else segment.start,
+                    "end": words[-1].end if words[-1].end is not None else segment.end,
+                    "text": " ".join(w.word for w in words),
+                    "words": words,
+                }
+            )
+        )
+    return kept
+
+
+def _drop_boundary_duplicates(previous: List[Segment], segments: List[Segment], window: float) -> List[Segment]:
+    """Drop leading words that repeat the previous chunk's tail (``merge`` rule)."""
+    recent: List[Word] = [w for seg in previous[-3:] for w in seg.words][-10:]
+    if not recent:
+        return segments
+    result: List[Segment] = []
+    for index, segment in enumerate(segments):
+        words = [
+            w
+            for w in segment.words
+            if not (
+                w.start is not None
+                and any(
+                    r.start is not None and abs(w.start - r.start) < window and w.word.lower() == r.word.lower()
+                    for r in recent
+                )
+            )
+        ]
+        if len(words) == len(segment.words):
+            result.extend(segments[index:])
+            break
+        if words:
+            result.append(
+                segment.model_copy(
+                    update={
+                        "start": words[0].start if words[0].start is not None else segment.start,
+                        "text": " ".join(w.word for w in words),
+                        "words": words,
+                    }
+                )
+            )
+    return result
+
+
+def stitch_chunks(
+    parts: List[Tuple[AudioChunk, Transcript]],
+    *,
+    audio_file: str,
+    language: str,
+    processing_time: float,
+    duplicate_window_sec: float = DUPLICATE_WINDOW_SEC,
+) -> Transcript:
+    """Join per-chunk transcripts into one file-level transcript."""
+    parts = sorted(parts, key=lambda p: p[0].index)
+    segments: List[Segment] = []
+    for position, (chunk, transcript) in enumerate(parts):
+        owned = _owned_segments(transcript, chunk, is_last=position == len(parts) - 1)
+        segments.extend(_drop_boundary_duplicates(segments, owned, duplicate_window_sec))
+    segments = [segment.model_copy(update={"id": i}) for i, segment in enumerate(segments)]
+    first = parts[0][1]
+    return Transcript(
+        audio_file=audio_file,
+        language=language or first.language,
+        text=" ".join(segment.text for segment in segments),
+        segments=segments,
+        processing_time=processing_time,
+        model_used=first.model_used,
+        timestamp=time.time(),
+        provider_metadata={"chunks": len(parts)},
+    )
+
+
+# ---------------------------------------------------------------------------
+# Worker processes
+# ---------------------------------------------------------------------------
+
+_worker_transcriber = None
+_worker_spec: Optional[WorkerSpec] = None
+
+
+def _build_worker_transcriber(spec: WorkerSpec):
+    from ..utils.console import ConsoleOutput  # pylint: disable=import-outside-toplevel
+    from .model_pool import get_model_pool  # pylint: disable=import-outside-toplevel
+
+    console = ConsoleOutput(quiet=True)
+    if spec.provider == "parakeet":
+        from .parakeet_transcriber import ParakeetTranscriber  # pylint: disable=import-outside-toplevel
+
+        return ParakeetTranscriber(
+            spec.device, console=console, model_name=spec.model_name, model_pool=get_model_pool()
+        )
+    from .whisper_transcriber import WhisperTranscriber  # pylint: disable=import-outside-toplevel
+
+    return WhisperTranscriber(spec.model_name, spec.device, console=console, model_pool=get_model_pool())
+
+
+def _init_worker(threads: int) -> None:
+    try:
+        import torch  # pylint: disable=import-outside-toplevel
+
+        torch.set_num_threads(threads)
+    except ImportError:  # pragma: no cover - local-transcription extra missing
+        pass
+
+
+def _transcribe_chunk(spec: WorkerSpec, chunk_path: str, language: str) -> Optional[Transcript]:
+    """Runs in a worker process: transcribe one chunk single-stream."""
+    global _worker_transcriber, _worker_spec
+    if _worker_transcriber is None or _worker_spec != spec:
+        _worker_transcriber = _build_worker_transcriber(spec)
+        _worker_spec = spec
+    return _worker_transcriber.transcribe_audio(chunk_path, options=TranscribeOptions(language=language))
+
+
+_executors: Dict[Tuple[int, int], ProcessPoolExecutor] = {}
+# Episodes currently submitting to each executor, current or retired.
+_executor_users: Dict[ProcessPoolExecutor, int] = {}
+_executors_lock = threading.Lock()
+
+
+@contextmanager
+def _lease_executor(workers: int, threads: int) -> Iterator[ProcessPoolExecutor]:
+    """Persistent spawn pool, so worker processes (and their models) survive
+    across episodes.
+
+    Keyed on the configured ``workers``/``threads`` only: an episode with
+    fewer chunks than workers simply occupies fewer slots (spawn pools start
+    processes on demand). When the settings change, the old pool is retired
+    and shut down once the last episode still running on it is done.
+    """
+    key = (workers, threads)
+    with _executors_lock:
+        executor = _executors.get(key)
+        if executor is None:
+            for stale in _executors.values():
+                if not _executor_users.get(stale):
+                    stale.shutdown(wait=False)
+            _executors.clear()
+            executor = ProcessPoolExecutor(
+                max_workers=workers,
+                mp_context=multiprocessing.get_context("spawn"),
+                initializer=_init_worker,
+                initargs=(threads,),
+            )
+            _executors[key] = executor
+        _executor_users[executor] = _executor_users.get(executor, 0) + 1
+    try:
+        yield executor
+    finally:
+        with _executors_lock:
+            _executor_users[executor] -= 1
+            if not _executor_users[executor]:
+                del _executor_users[executor]
+                if _executors.get(key) is not executor:
+                    executor.shutdown(wait=False)
+
+
+def shutdown_chunk_workers() -> None:
+    """Stop the worker processes (and free their models)."""
+    with _executors_lock:
+        for executor in {*_executors.values(), *_executor_users}:
+            executor.shutdown(wait=True, cancel_futures=True)
+        _executors.clear()
+        _executor_users.clear()
+
+
+def transcribe_in_chunks(
+    wav_path: str,
+    *,
+    provider: str,
+    model_name: str,
+    device: str,
+    workers: int,
+    chunk_seconds: float,
+    language: str,
+    progress_callback: Optional[Callable[[ProgressUpdate], None]] = None,
+    executor: Optional[Executor] = None,
+) -> Optional[Transcript]:
+    """Transcribe ``wav_path`` as parallel chunks; ``None`` means "don't".
+
+    Returns ``None`` — so the caller runs its normal single-stream path —
+    when the file is short enough for one chunk, is not 16-bit PCM WAV, or
+    any chunk fails. A partial transcript is never returned.
+    """
+    target = max(MIN_CHUNK_SECONDS, min(float(chunk_seconds), _duration_seconds(wav_path) / max(1, workers)))
+    try:
+        chunks = plan_chunks(wav_path, target)
+    except (ValueError, wave.Error, EOFError) as exc:
+        logger.info("chunked_transcription_skipped", reason=str(exc), audio=Path(wav_path).name)
+        return None
+    if len(chunks) < 2:
+        return None
+
+    threads = max(1, (os.cpu_count() or 1) // max(1, workers))
+    spec = WorkerSpec(provider, model_name, device, threads)
+    started = time.time()
+    logger.info(
+        "chunked_transcription_started",
+        audio=Path(wav_path).name,
+        chunks=len(chunks),
+        workers=workers,
+        pauses=sum(1 for c in chunks[1:] if c.start == c.own_start),
+    )
+
+    lease = nullcontext(executor) if executor is not None else _lease_executor(max(1, workers), threads)
+    with lease as pool, tempfile.TemporaryDirectory(prefix="thestill-chunks-") as tmp:
+        paths = write_chunk_wavs(wav_path, chunks, Path(tmp))
+        futures = {pool.submit(_transcribe_chunk, spec, path, language): chunk for path, chunk in zip(paths, chunks)}
+        parts: List[Tuple[AudioChunk, Transcript]] = []
+        try:
+            for future in as_completed(futures):
+                transcript = future.result()
+                if transcript is None:
+                    raise RuntimeError(f"chunk {futures[future].index} returned no transcript")
+                parts.append((futures[future], transcript))
+                if progress_callback is not None:
+                    progress_callback(
+                        ProgressUpdate(
+                            stage=TranscriptionStage.TRANSCRIBING,
+                            progress_pct=min(95, int(100 * len(parts) / len(chunks))),
+                            message=f"Transcribed chunk {len(parts)}/{len(chunks)}",
+                        )
+                    )
+        except Exception as exc:
+            for pending in futures:
+                pending.cancel()
+            logger.warning("chunked_transcription_failed", audio=Path(wav_path).name, error=str(exc))
+            return None
+
+    elapsed = time.time() - started
+    transcript = stitch_chunks(parts, audio_file=wav_path, language=language, processing_time=elapsed)
+    logger.info("chunked_transcription_completed", chunks=len(chunks), seconds=round(elapsed, 1))
+    return transcript
+
+
+def _duration_seconds(wav_path: str) -> float:
+    try:
+        with wave.open(wav_path, "rb") as wav:
+            return wav.getnframes() / float(wav.getframerate())
+    except (wave.Error, EOFError, OSError):
+        return 0.0
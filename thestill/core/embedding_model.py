@@ -25,14 +25,25 @@ disk + ~250 MB resident. Two callers share the warm instance:
 Embeddings are L2-normalised and packed as little-endian float32
 bytes. The packed shape matches sqlite-vec's ``vec0`` BLOB format —
 the bytes go straight into the ``chunks.embedding`` column and from
-there into ``chunks_vec`` via the ``chunks_ai`` trigger.
+there into ``chunks_vec`` via the ``chunks_ai`` trigger. Packing goes
+through ``ndarray.astype('<f4').tobytes()`` — one buffer copy, no
+per-float boxing as ``struct.pack(*vec)`` did.
+
+Query embeddings are memoised in a process-wide ``QueryEmbeddingCache``
+keyed by ``(model, normalised query)``: the web search box and the MCP
+``search`` tools send the same few hundred queries over and over, and
+both search backends share it because they call ``encode_one`` on the
+same wrapper.
 """
 
 from __future__ import annotations
 
-import struct
+import re
 import threading
-from typing import List, Optional, Sequence
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Callable, List, Optional, Sequence, Tuple
 
 from structlog import get_logger
 
@@ -63,6 +74,99 @@ def centroid_blob(embeddings: Sequence[bytes], dim: int) -> Optional[bytes]:
     return (mean / norm).astype(np.float32).tobytes()
 
 
+_WHITESPACE_RE = re.compile(r"\s+")
+
+
+def normalise_query(text: str) -> str:
+    """Canonical form of a query for embedding + cache lookup.
+
+    Only collapses whitespace runs and trims: the tokenizer ignores them
+    anyway, so the vector is unchanged. Case and punctuation are left
+    alone because cased models would embed them differently.
+    """
+    return _WHITESPACE_RE.sub(" ", text).strip()
+
+
+@dataclass
+class QueryCacheStats:
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+    expirations: int = 0
+
+
+class QueryEmbeddingCache:
+    """Thread-safe bounded LRU of packed query embeddings with a TTL.
+
+    The TTL only guards against a model being swapped in place under the
+    same name; entries are otherwise immutable ``bytes`` and safe to hand
+    to every caller.
+    """
+
+    DEFAULT_MAX_ENTRIES = 1024
+    DEFAULT_TTL_SECONDS = 3600.0
+
+    def __init__(
+        self,
+        *,
+        max_entries: int = DEFAULT_MAX_ENTRIES,
+        ttl_seconds: float = DEFAULT_TTL_SECONDS,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self._max_entries = max(0, max_entries)
+        self._ttl_seconds = ttl_seconds
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._entries: "OrderedDict[Tuple[str, str], Tuple[float, bytes]]" = OrderedDict()
+        self.stats = QueryCacheStats()
+
+    def get(self, model_name: str, query: str) -> Optional[bytes]:
+        key = (model_name, query)
+        now = self._clock()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.stats.misses += 1
+                return None
+            stored_at, blob = entry
+            if self._ttl_seconds > 0 and now - stored_at >= self._ttl_seconds:
+                del self._entries[key]
+                self.stats.expirations += 1
+                self.stats.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.stats.hits += 1
+            return blob
+
+    def put(self, model_name: str, query: str, blob: bytes) -> None:
+        if self._max_entries == 0:
+            return
+        key = (model_name, query)
+        with self._lock:
+            self._entries[key] = (self._clock(), blob)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self._max_entries:
+                self._entries.popitem(last=False)
+                self.stats.evictions += 1
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self.stats = QueryCacheStats()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._entries)
+
+
+_QUERY_CACHE = QueryEmbeddingCache()
+
+
+def get_query_embedding_cache() -> QueryEmbeddingCache:
+    """The process-wide cache every ``EmbeddingModel`` uses by default."""
+    return _QUERY_CACHE
+
+
 class EmbeddingModel:
     """Lazy sentence-transformers wrapper.
 
@@ -73,11 +177,17 @@ class EmbeddingModel:
     request without double-loading or corrupting the model.
     """
 
-    def __init__(self, model_name: str = DEFAULT_EMBEDDING_MODEL):
+    def __init__(
+        self,
+        model_name: str = DEFAULT_EMBEDDING_MODEL,
+        *,
+        query_cache: Optional[QueryEmbeddingCache] = None,
+    ):
         self.model_name = model_name
         self.dim = embedding_dim_for(model_name)
         self._model: Optional[object] = None
         self._load_lock = threading.Lock()
+        self.query_cache = query_cache if query_cache is not None else get_query_embedding_cache()
 
     def _get_model(self):
         # Double-checked locking: the hot path (model already loaded)
@@ -104,16 +214,37 @@ class EmbeddingModel:
         """
         self._get_model()
 
+    def _pack(self, vecs) -> "np.ndarray":
+        """Coerce model output to a C-contiguous little-endian float32 matrix."""
+        import numpy as np
+
+        arr = np.ascontiguousarray(vecs, dtype="<f4")
+        if arr.shape[-1] != self.dim:
+            raise ValueError(f"{self.model_name} returned dim {arr.shape[-1]}, expected {self.dim}")
+        return arr
+
     def encode_one(self, text: str) -> bytes:
-        """Embed one string, return packed float32 little-endian bytes."""
+        """Embed one query string, return packed float32 little-endian bytes.
+
+        Served from ``query_cache`` when the normalised query was embedded
+        recently; the model is not loaded on a cache hit.
+        """
+        query = normalise_query(text)
+        cached = self.query_cache.get(self.model_name, query)
+        if cached is not None:
+            return cached
         model = self._get_model()
-        vec = model.encode([text], normalize_embeddings=True)[0]
-        return struct.pack(f"<{self.dim}f", *vec)
+        blob = self._pack(model.encode([query], normalize_embeddings=True))[0].tobytes()
+        self.query_cache.put(self.model_name, query, blob)
+        return blob
 
     def encode_batch(self, texts: List[str], *, batch_size: int = 64) -> List[bytes]:
-        """Embed many strings, return one packed-bytes blob per input."""
+        """Embed many strings, return one packed-bytes blob per input.
+
+        Not cached: reindex embeds each chunk once.
+        """
         if not texts:
             return []
         model = self._get_model()
-        vecs = model.encode(texts, normalize_embeddings=True, batch_size=batch_size)
-        return [struct.pack(f"<{self.dim}f", *v) for v in vecs]
+        arr = self._pack(model.encode(texts, normalize_embeddings=True, batch_size=batch_size))
+        return [row.tobytes() for row in arr]
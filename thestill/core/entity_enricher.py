@@ -24,13 +24,20 @@ Per-source failures are recorded, not raised: a transient Wikidata/
 Wikipedia outage marks that source ``FAILED`` with a ``retry_after`` and
 leaves the rest of the record intact — never cached as "no data"
 (spec #42 FM-1).
+
+``enrich_many`` is the batch form used by the ENRICH_ENTITIES stage and
+the ``enrich-entities`` sweep. It runs the per-entity fetches (Wikidata
+facts, then Wikipedia summaries) on a bounded thread pool and resolves
+every referenced QID for the whole batch in one set of ``wbgetentities``
+requests, rather than a label lookup per entity.
 """
 
 from __future__ import annotations
 
 import re
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta, timezone
-from typing import Callable, List, Optional
+from typing import Callable, Dict, Iterable, List, Optional, Sequence, Tuple, TypeVar
 from urllib.parse import quote
 
 from structlog import get_logger
@@ -42,6 +49,12 @@ from .wikipedia_client import WikipediaClient, WikipediaSummary
 
 logger = get_logger(__name__)
 
+_T = TypeVar("_T")
+_R = TypeVar("_R")
+
+# (entity, enrichment, error): exactly one of the last two is set.
+EnrichOutcome = Tuple[EntityRecord, Optional[EntityEnrichment], Optional[Exception]]
+
 # Bump when the fetch/parse logic changes so ``entity_ids_needing_enrichment``
 # treats older rows as stale and refreshes them.
 ENRICHMENT_SCHEMA_VERSION = 1
@@ -96,30 +109,89 @@ class EntityEnricher:
     def enrich(self, entity: EntityRecord) -> EntityEnrichment:
         """Fetch + assemble enrichment for ``entity`` (does not persist)."""
         now = datetime.now(timezone.utc)
+        enrichment = self._new_enrichment(entity, now)
+        if not entity.wikidata_qid:
+            return enrichment
+
+        wd = self._fetch_wikidata(entity, enrichment, now)
+        if wd is not None:
+            labels = self._fetch_labels(wd.referenced_qids(), entity_id=entity.id)
+            self._apply_wikidata(entity, enrichment, wd, labels)
+        self._enrich_from_wikipedia(wd, enrichment, now)
+        return enrichment
+
+    def enrich_many(self, entities: Sequence[EntityRecord], *, max_workers: int = 1) -> List[EnrichOutcome]:
+        """Enrich ``entities`` as one batch (does not persist).
+
+        Same per-entity result as :meth:`enrich`, in input order. Fetches
+        run on up to ``max_workers`` threads; referenced-QID labels are
+        resolved once for the whole batch. An unexpected exception for one
+        entity is returned as its ``error`` rather than raised, so the
+        caller can count it and carry on (spec #42 FM-1).
+        """
+        now = datetime.now(timezone.utc)
+        records = [self._new_enrichment(entity, now) for entity in entities]
+        errors: Dict[int, Exception] = {}
+        fetchable = [i for i, entity in enumerate(entities) if entity.wikidata_qid]
+
+        with ThreadPoolExecutor(max_workers=max(1, max_workers), thread_name_prefix="enrich") as pool:
+            facts: Dict[int, Optional[WikidataEntity]] = {}
+            for i, result in zip(
+                fetchable, _map_settled(pool, lambda i: self._fetch_wikidata(entities[i], records[i], now), fetchable)
+            ):
+                if isinstance(result, Exception):
+                    errors[i] = result
+                else:
+                    facts[i] = result
+
+            referenced = [qid for wd in facts.values() if wd is not None for qid in wd.referenced_qids()]
+            labels = self._fetch_labels(referenced, entity_id=None) if referenced else {}
+            for i, wd in facts.items():
+                if wd is None:
+                    continue
+                try:
+                    self._apply_wikidata(entities[i], records[i], wd, labels)
+                except Exception as exc:  # noqa: BLE001 — surfaced per entity
+                    errors[i] = exc
+
+            pending = [i for i in facts if i not in errors]
+            for i, result in zip(
+                pending,
+                _map_settled(pool, lambda i: self._enrich_from_wikipedia(facts[i], records[i], now), pending),
+            ):
+                if isinstance(result, Exception):
+                    errors[i] = result
+
+        return [
+            (entity, None, errors[i]) if i in errors else (entity, records[i], None)
+            for i, entity in enumerate(entities)
+        ]
+
+    def _new_enrichment(self, entity: EntityRecord, now: datetime) -> EntityEnrichment:
         enrichment = EntityEnrichment(
             entity_id=entity.id,
             schema_version=ENRICHMENT_SCHEMA_VERSION,
             created_at=now,
             updated_at=now,
         )
-
         if not entity.wikidata_qid:
             # Defensive — callers gate on a QID. Nothing external to fetch.
             enrichment.wikidata_status = EnrichmentStatus.EMPTY
             enrichment.wikipedia_status = EnrichmentStatus.EMPTY
-            return enrichment
-
-        wd = self._enrich_from_wikidata(entity, enrichment, now)
-        self._enrich_from_wikipedia(wd, enrichment, now)
         return enrichment
 
     # ------------------------------------------------------------------
     # Wikidata
     # ------------------------------------------------------------------
 
-    def _enrich_from_wikidata(
+    def _fetch_wikidata(
         self, entity: EntityRecord, enrichment: EntityEnrichment, now: datetime
     ) -> Optional[WikidataEntity]:
+        """Fetch the QID's facts and record the Wikidata status.
+
+        Returns the parsed entity for :meth:`_apply_wikidata`, or ``None``
+        when the source failed or had nothing.
+        """
         qid = entity.wikidata_qid
         try:
             wd = self._wikidata.fetch_facts(qid, language=self._language)
@@ -134,16 +206,22 @@ class EntityEnricher:
             enrichment.wikidata_status = EnrichmentStatus.EMPTY
             return None
 
-        enrichment.headline = wd.description
-        self._apply_image(entity, enrichment, wd)
+        return wd
 
+    def _fetch_labels(self, qids: Iterable[str], *, entity_id: Optional[str]) -> Dict[str, str]:
         # Resolve referenced QIDs to readable labels (best-effort: a label
         # outage degrades to "skip referenced facts", not a failed entity).
         try:
-            labels = self._wikidata.fetch_labels(wd.referenced_qids(), language=self._language)
+            return self._wikidata.fetch_labels(qids, language=self._language)
         except EnrichmentUnavailable as exc:
-            logger.warning("entity_enrich_labels_failed", entity_id=entity.id, qid=qid, error=str(exc))
-            labels = {}
+            logger.warning("entity_enrich_labels_failed", entity_id=entity_id, error=str(exc))
+            return {}
+
+    def _apply_wikidata(
+        self, entity: EntityRecord, enrichment: EntityEnrichment, wd: WikidataEntity, labels: Dict[str, str]
+    ) -> None:
+        enrichment.headline = wd.description
+        self._apply_image(entity, enrichment, wd)
 
         if entity.type == EntityType.COMPANY:
             self._company_facts(wd, labels, enrichment)
@@ -151,7 +229,6 @@ class EntityEnricher:
             self._person_facts(wd, labels, enrichment)
 
         enrichment.wikidata_status = EnrichmentStatus.OK
-        return wd
 
     def _apply_image(self, entity: EntityRecord, enrichment: EntityEnrichment, wd: WikidataEntity) -> None:
         # Companies prefer the logo (P154) then a photo; people the reverse.
@@ -256,6 +333,16 @@ class EntityEnricher:
                 enrichment.image_attribution = "Wikipedia"
 
 
+def _map_settled(pool: ThreadPoolExecutor, fn: Callable[[_T], _R], items: List[_T]) -> List[object]:
+    """``pool.map`` that returns each item's exception instead of raising it."""
+    futures = [pool.submit(fn, item) for item in items]
+    out: List[object] = []
+    for future in futures:
+        exc = future.exception()
+        out.append(exc if exc is not None else future.result())
+    return out
+
+
 # ----------------------------------------------------------------------
 # Fact-building helpers
 # ----------------------------------------------------------------------
@@ -33,12 +33,20 @@ Why ReFinED rather than a vector lookup or LLM:
 Same lazy-load + threading.Lock + ``preloaded_model`` test seam
 pattern as ``EntityExtractor`` — the resolver is held at
 process scope on ``AppState.entity_resolver``.
+
+Throughput: a call deduplicates its mentions twice before touching the
+model — identical ``(surface_form, quote_excerpt)`` pairs share one
+decision, and identical excerpts share one forward pass — then feeds the
+unique excerpts through ReFinED in batches of ``batch_size``. An optional
+persistent surface-form cache (``entity_resolution_cache``) lets recurring
+hosts and guests skip inference entirely once their surface form has
+consistently grounded to one QID; see ``_SurfaceResolutionCache``.
 """
 
 from __future__ import annotations
 
-from dataclasses import dataclass
-from typing import TYPE_CHECKING, Iterable, List, Optional, Protocol
+from dataclasses import dataclass, replace
+from typing import TYPE_CHECKING, Dict, Iterable, List, Optional, Protocol, Tuple
 
 from structlog import get_logger
 
@@ -62,6 +70,24 @@ class _P31Lookup(Protocol):
     def fetch_p31(self, qid: str) -> List[str]: ...
 
 
+# ``(surface_key, surface_label)`` — see ``surface_cache_key``.
+SurfaceKey = Tuple[str, str]
+
+
+class _SurfaceResolutionCache(Protocol):
+    """Structural type for the persistent surface-form → QID cache.
+
+    Implemented by ``EntityRepository`` (``entity_resolution_cache``
+    table). The resolver only reads and appends observations; the trust
+    rule (``cache_min_observations``, no conflicting QID) lives here in
+    the resolver so both backends behave identically.
+    """
+
+    def lookup_surface_resolutions(self, keys: Iterable[SurfaceKey]) -> Dict[SurfaceKey, dict]: ...
+
+    def record_surface_resolutions(self, observations: List[dict]) -> None: ...
+
+
 logger = get_logger(__name__)
 
 
@@ -84,6 +110,19 @@ DEFAULT_ENTITY_SET = "wikipedia"
 # preserving named-entity hits, which typically score 0.7+.
 DEFAULT_MIN_QID_CONFIDENCE = 0.5
 
+# Unique excerpts per ReFinED forward pass. Excerpts are ≤~400 chars, so
+# 32 keeps a CPU batch well under a second of padding waste while still
+# amortising the per-call tokenizer/model overhead.
+DEFAULT_BATCH_SIZE = 32
+
+# A cached surface form is only trusted once it has grounded to the same
+# QID in this many distinct excerpts with no disagreement. One sighting
+# is not enough — context matters ("Apple" the company vs the fruit) and
+# a single early hit would otherwise be frozen in forever. Any
+# disagreement marks the row ``conflicting`` and the surface always goes
+# through the model from then on.
+DEFAULT_CACHE_MIN_OBSERVATIONS = 3
+
 
 # Map ReFinED's ``coarse_type`` (used as a fallback when the GLiNER
 # ``surface_label`` was not persisted on the mention) to our typed
@@ -150,6 +189,8 @@ class EntityResolver:
         min_qid_confidence: float = DEFAULT_MIN_QID_CONFIDENCE,
         preloaded_model: Optional["Refined"] = None,
         wikidata_client: Optional[_P31Lookup] = None,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+        cache_min_observations: int = DEFAULT_CACHE_MIN_OBSERVATIONS,
     ):
         """``preloaded_model`` is a test seam — pass a stub or
         pre-warmed real model and ``_load_model`` becomes a no-op.
@@ -160,10 +201,18 @@ class EntityResolver:
         ``entity_type_rules.classify_entity_type``. ``None`` disables
         the check (current behavior — kept as default to keep the test
         fixtures network-free).
+
+        ``batch_size`` caps unique excerpts per ReFinED call;
+        ``cache_min_observations`` is the consistency bar a surface form
+        must clear before ``surface_cache`` hits skip the model.
         """
+        if batch_size < 1:
+            raise ValueError(f"batch_size must be >= 1, got {batch_size}")
         self.model_name = model
         self.entity_set = entity_set
         self.min_qid_confidence = min_qid_confidence
+        self.batch_size = batch_size
+        self.cache_min_observations = cache_min_observations
         self._model: Optional["Refined"] = preloaded_model
         self._wikidata_client = wikidata_client
 
@@ -176,43 +225,92 @@ class EntityResolver:
         mentions: List[EntityMention],
         *,
         is_blacklisted=None,
+        surface_cache: Optional[_SurfaceResolutionCache] = None,
     ) -> List[ResolutionResult]:
         """Resolve a list of pending mentions in one pass.
 
-        Each mention is resolved independently against its
-        ``quote_excerpt``. Mentions sharing a ``surface_form`` are NOT
-        deduplicated here — context matters (e.g. "Apple" the company
-        vs "apple" the fruit) and the per-mention `excerpt` gives
-        ReFinED the disambiguation hint it needs.
+        Each mention is resolved against its own ``quote_excerpt``.
+        Mentions sharing a ``surface_form`` are NOT collapsed on the
+        surface alone — context matters (e.g. "Apple" the company vs
+        "apple" the fruit) and the per-mention excerpt gives ReFinED
+        the disambiguation hint it needs. Only mentions with the same
+        surface *and* the same excerpt share a decision, and only
+        identical excerpts share a model pass.
 
         ``is_blacklisted`` (spec §1.13.7) is an optional callable
         ``(surface_form, qid) -> bool`` consulted for every QID candidate
-        before we accept it. The resolver itself doesn't read SQLite —
-        the handler injects the lookup so the resolver stays a pure
-        model wrapper.
+        before we accept it — cached ones included. The resolver itself
+        doesn't read SQLite — the handler injects the lookup (and the
+        optional ``surface_cache``) so the resolver stays a pure model
+        wrapper.
+
+        Results come back in input order, one per mention.
         """
         if not mentions:
             return []
-        self._load_model()
-        results: List[ResolutionResult] = []
-        for mention in mentions:
+        results: Dict[int, ResolutionResult] = {}
+
+        cached = self._lookup_cached(mentions, surface_cache)
+        pending: List[Tuple[int, EntityMention]] = []
+        for index, mention in enumerate(mentions):
+            entry = cached.get(surface_cache_key(mention))
+            if entry is not None and not (
+                is_blacklisted is not None and is_blacklisted(mention.surface_form, entry["wikidata_qid"])
+            ):
+                results[index] = self._result_from_cache(mention, entry)
+            else:
+                pending.append((index, mention))
+
+        # Identical (surface, excerpt) pairs resolve identically; run one
+        # representative per pair and fan its result back out.
+        pairs: Dict[Tuple[str, str], List[Tuple[int, EntityMention]]] = {}
+        for index, mention in pending:
+            pairs.setdefault((mention.surface_form, mention.quote_excerpt), []).append((index, mention))
+
+        observations: List[dict] = []
+        if pairs:
+            self._load_model()
+            spans_by_text = self._process_texts(list(dict.fromkeys(text for _, text in pairs)))
+            p31_memo: Dict[str, List[str]] = {}
+            for (_, text), group in pairs.items():
+                representative = group[0][1]
+                try:
+                    spans = spans_by_text[text]
+                    if isinstance(spans, Exception):
+                        raise spans
+                    result = self._result_from_spans(
+                        representative, spans, is_blacklisted=is_blacklisted, p31_memo=p31_memo
+                    )
+                except Exception:
+                    logger.exception(
+                        "refined_resolve_failed",
+                        mention_id=representative.id,
+                        surface_form=representative.surface_form,
+                    )
+                    result = self._unresolvable_result(representative)
+                for index, mention in group:
+                    results[index] = replace(result, mention_id=mention.id)
+                if result.status == "resolved":
+                    observations.append(_cache_observation(representative, result.entity))
+
+        if surface_cache is not None and observations:
             try:
-                result = self._resolve_one(mention, is_blacklisted=is_blacklisted)
+                surface_cache.record_surface_resolutions(observations)
             except Exception:
-                logger.exception(
-                    "refined_resolve_failed",
-                    mention_id=mention.id,
-                    surface_form=mention.surface_form,
-                )
-                result = self._unresolvable_result(mention)
-            results.append(result)
+                # The cache is an accelerator; a write failure must not
+                # fail the resolve stage.
+                logger.exception("entity_resolution_cache_write_failed", observations=len(observations))
+
+        ordered = [results[index] for index in range(len(mentions))]
         logger.info(
             "entity_resolution_complete",
             mentions=len(mentions),
-            resolved=sum(1 for r in results if r.status == "resolved"),
-            unresolvable=sum(1 for r in results if r.status == "unresolvable"),
+            resolved=sum(1 for r in ordered if r.status == "resolved"),
+            unresolvable=sum(1 for r in ordered if r.status == "unresolvable"),
+            cache_hits=len(mentions) - len(pending),
+            unique_pairs=len(pairs),
         )
-        return results
+        return ordered
 
     # ------------------------------------------------------------------
     # Internals
@@ -249,16 +347,53 @@ class EntityResolver:
         )
         logger.info("refined_model_loaded")
 
-    def _resolve_one(self, mention: EntityMention, *, is_blacklisted=None) -> ResolutionResult:
-        """Run ReFinED over the mention's excerpt and pick the
-        prediction whose surface span best matches ``surface_form``.
+    def _process_texts(self, texts: List[str]) -> Dict[str, object]:
+        """Run ReFinED over ``texts`` in batches of ``batch_size``.
+
+        Returns ``{text: spans}``; a text whose inference failed maps to
+        the exception instead, so one bad excerpt only fails the mentions
+        that share it. Uses ``process_text_batch`` when the installed
+        ReFinED has it and falls back to per-text ``process_text`` for a
+        batch that raises (or on builds without the batch API).
+
+        The excerpts are small (≤2× ``QUOTE_EXCERPT_WINDOW`` chars =
+        ~400 chars). We don't pass ReFinED the full segment text — the
+        excerpt already contains ±200 chars of disambiguation context.
+        """
+        spans_by_text: Dict[str, object] = {}
+        process_batch = getattr(self._model, "process_text_batch", None)
+        for offset in range(0, len(texts), self.batch_size):
+            batch = texts[offset : offset + self.batch_size]
+            if callable(process_batch) and len(batch) > 1:
+                try:
+                    batch_spans = process_batch(batch)
+                    if len(batch_spans) == len(batch):
+                        spans_by_text.update(zip(batch, batch_spans))
+                        continue
+                    logger.warning("refined_batch_size_mismatch", expected=len(batch), got=len(batch_spans))
+                except Exception:
+                    logger.warning("refined_batch_failed_falling_back", batch_size=len(batch), exc_info=True)
+            for text in batch:
+                try:
+                    spans_by_text[text] = self._model.process_text(text)
+                except Exception as exc:
+                    spans_by_text[text] = exc
+        return spans_by_text
+
+    def _result_from_spans(
+        self,
+        mention: EntityMention,
+        spans,
+        *,
+        is_blacklisted=None,
+        p31_memo: Optional[Dict[str, List[str]]] = None,
+    ) -> ResolutionResult:
+        """Pick the ReFinED prediction whose surface span best matches
+        ``surface_form`` and turn it into a ``ResolutionResult``.
 
-        The excerpt is small (≤2× ``QUOTE_EXCERPT_WINDOW`` chars =
-        ~400 chars) so the per-mention call is cheap. We don't pass
-        ReFinED the full segment text — the excerpt already contains
-        ±200 chars of disambiguation context.
+        ``p31_memo`` dedupes ``fetch_p31`` calls across pairs that
+        ground to the same QID within one ``resolve`` call.
         """
-        spans = self._model.process_text(mention.quote_excerpt)
         match = _pick_best_span(spans, mention.surface_form)
         if match is None or match.predicted_entity is None:
             return self._unresolvable_result(mention)
@@ -305,7 +440,12 @@ class EntityResolver:
         # type — same behavior as before this commit.
         p31_qids: List[str] = []
         if self._wikidata_client is not None and wikidata_qid:
-            p31_qids = self._wikidata_client.fetch_p31(wikidata_qid)
+            if p31_memo is not None and wikidata_qid in p31_memo:
+                p31_qids = p31_memo[wikidata_qid]
+            else:
+                p31_qids = self._wikidata_client.fetch_p31(wikidata_qid)
+                if p31_memo is not None:
+                    p31_memo[wikidata_qid] = p31_qids
             classified = classify_entity_type(p31_qids, fallback_type)
             if classified is not None and classified != fallback_type:
                 logger.info(
@@ -335,6 +475,55 @@ class EntityResolver:
             method=ResolutionMethod.DIRECT,
         )
 
+    def _lookup_cached(
+        self,
+        mentions: List[EntityMention],
+        surface_cache: Optional[_SurfaceResolutionCache],
+    ) -> Dict[SurfaceKey, dict]:
+        """Trusted cache rows for ``mentions``' surface keys.
+
+        A row is trusted when it has ``cache_min_observations``
+        consistent sightings and has never seen a conflicting QID.
+        Lookup failures degrade to "no cache" — inference still works.
+        """
+        if surface_cache is None:
+            return {}
+        keys = list(dict.fromkeys(surface_cache_key(m) for m in mentions))
+        try:
+            rows = surface_cache.lookup_surface_resolutions(keys)
+        except Exception:
+            logger.exception("entity_resolution_cache_read_failed", keys=len(keys))
+            return {}
+        return {
+            key: row
+            for key, row in rows.items()
+            if not row.get("conflicting") and int(row.get("observations") or 0) >= self.cache_min_observations
+        }
+
+    def _result_from_cache(self, mention: EntityMention, entry: dict) -> ResolutionResult:
+        """Rebuild the ``ResolutionResult`` a model pass would produce.
+
+        The cached ``entity_type`` is the post-P31 bucket, so the hit
+        needs neither ReFinED nor Wikidata. ``method`` stays ``direct``:
+        the answer is ReFinED's, just remembered.
+        """
+        canonical_name = entry["canonical_name"]
+        entity_type = EntityType(entry["entity_type"])
+        return ResolutionResult(
+            mention_id=mention.id,  # type: ignore[arg-type]
+            entity=EntityRecord(
+                id=_build_entity_id(entity_type, canonical_name, entry["wikidata_qid"]),
+                type=entity_type,
+                canonical_name=canonical_name,
+                wikidata_qid=entry["wikidata_qid"],
+                aliases=[mention.surface_form] if _is_plausible_alias(mention.surface_form, canonical_name) else [],
+                description=entry.get("description"),
+                wikidata_instance_of=list(entry.get("wikidata_instance_of") or []),
+            ),
+            status="resolved",
+            method=ResolutionMethod.DIRECT,
+        )
+
     def _unresolvable_result(self, mention: EntityMention) -> ResolutionResult:
         """Build the local-slug fallback entity.
 
@@ -377,6 +566,31 @@ class EntityResolver:
         return EntityType.TOPIC
 
 
+def surface_cache_key(mention: EntityMention) -> SurfaceKey:
+    """``(surface_key, surface_label)`` for the resolution cache.
+
+    Whitespace-collapsed, case-folded surface form plus the lowercased
+    GLiNER label — "Mercury" the person and "Mercury" the topic are
+    cached separately. Computed here rather than with SQL ``LOWER()``
+    because SQLite's ``LOWER`` only folds ASCII.
+    """
+    return (" ".join(mention.surface_form.split()).casefold(), (mention.surface_label or "").lower())
+
+
+def _cache_observation(mention: EntityMention, entity: EntityRecord) -> dict:
+    """One ``record_surface_resolutions`` row for a model-resolved pair."""
+    surface_key, surface_label = surface_cache_key(mention)
+    return {
+        "surface_key": surface_key,
+        "surface_label": surface_label,
+        "wikidata_qid": entity.wikidata_qid,
+        "canonical_name": entity.canonical_name,
+        "entity_type": entity.type.value,
+        "description": entity.description,
+        "wikidata_instance_of": list(entity.wikidata_instance_of),
+    }
+
+
 def _extract_confidence(span) -> Optional[float]:
     """Pull a single confidence number out of a ReFinED Span.
 
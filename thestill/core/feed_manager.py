@@ -24,13 +24,14 @@ from urllib.parse import urlparse
 import feedparser
 from structlog import get_logger
 
-from ..models.podcast import AlternateEnclosure, Episode, Podcast
+from ..models.podcast import AlternateEnclosure, Episode, Podcast, TranscriptLink
 from ..repositories.podcast_repository import PodcastRepository
 from ..utils.datetime_utils import ensure_utc, now_utc, parse_struct_time_utc
 from ..utils.duration import parse_duration
 from ..utils.path_manager import PathManager
 from ..utils.timing import log_phase_timing
 from ..utils.url_guard import UnsafeURLError, guarded_get
+from .feed_scanner import FeedScan
 from .media_source import MediaSourceFactory, RSSMediaSource
 from .refresh_failure import RefreshAttemptResult, RefreshFailure, RefreshFailureKind, classify_fetch_exception
 
@@ -313,12 +314,15 @@ class PodcastFeedManager:
         image_rows: List[Tuple[str, str, Optional[str]]] = []
         audio_rows: List[Tuple[str, str, str, Optional[str]]] = []
         alt_enclosure_rows: List[Tuple[str, str, AlternateEnclosure]] = []
+        transcript_links: Dict[str, List[TranscriptLink]] = {}
+        refresh_hint_seconds: Optional[int] = None
         try:
             rss_url_str = str(podcast.rss_url)
             source = self.media_source_factory.detect_source(rss_url_str)
 
             parsed_feed: Optional[Any] = None
             rss_content: Optional[str] = None
+            scan: Optional[FeedScan] = None
 
             if isinstance(source, RSSMediaSource):
                 # Parse-once + conditional GET: one fetch, echo stored
@@ -327,6 +331,9 @@ class PodcastFeedManager:
                 fetch_kwargs_rss = {
                     "etag": podcast.etag,
                     "last_modified": podcast.last_modified,
+                    # Stored GUIDs let the scan stop feedparser at the
+                    # already-tracked part of the feed.
+                    "known_external_ids": known_external_ids,
                 }
                 if self.max_workers > 1 and host:
                     with self._host_semaphore(host):
@@ -392,6 +399,9 @@ class PodcastFeedManager:
 
                 rss_content = result.content
                 parsed_feed = result.parsed_feed
+                scan = result.scan
+                if scan is not None:
+                    refresh_hint_seconds = scan.refresh_hint_seconds
 
                 if result.etag:
                     podcast.etag = result.etag
@@ -403,12 +413,15 @@ class PodcastFeedManager:
                         rss_url_str,
                         rss_content=rss_content,
                         parsed_feed=parsed_feed,
+                        scan=scan,
                     )
                     if metadata:
                         self._apply_rss_metadata(podcast, metadata)
 
                     # Re-sync existing episodes' artwork from the feed. Reuses
-                    # the already-parsed feed (no extra fetch); the batch
+                    # the scan's whole-feed map (``parsed_feed`` only holds the
+                    # new-episode window), falling back to the parsed feed when
+                    # the scan failed; no extra fetch. The batch
                     # writer's guarded UPDATE only writes rows that drifted, so
                     # this is near-free when nothing changed. Bound to
                     # already-tracked episodes — brand-new ones are inserted with
@@ -417,7 +430,10 @@ class PodcastFeedManager:
                     # GUIDs on large feeds.
                     known = known_external_ids or set()
                     if known:
-                        feed_images = source.extract_episode_images(parsed_feed)
+                        if scan is not None:
+                            feed_images = scan.images
+                        else:
+                            feed_images = source.extract_episode_images(parsed_feed)
                         image_rows = [
                             (podcast.id, external_id, url)
                             for external_id, url in feed_images.items()
@@ -430,7 +446,10 @@ class PodcastFeedManager:
                         # The batch writer's guarded UPDATE only touches rows
                         # that drifted AND still need their audio, so this is
                         # near-free when nothing changed.
-                        feed_audio_urls = source.extract_episode_audio_urls(parsed_feed)
+                        if scan is not None:
+                            feed_audio_urls = scan.audio_urls
+                        else:
+                            feed_audio_urls = source.extract_episode_audio_urls(parsed_feed)
                         audio_rows = [
                             (podcast.id, external_id, url, mime_type)
                             for external_id, (url, mime_type) in feed_audio_urls.items()
@@ -445,8 +464,11 @@ class PodcastFeedManager:
                     # INSERT..SELECT resolves them). Untracked GUIDs resolve
                     # to no episode row and no-op — the tag is rare enough
                     # that the extra executemany rows don't matter.
-                    if rss_content:
-                        alt_by_guid = source.extract_alternate_enclosures(rss_content)
+                    if scan is not None:
+                        alt_by_guid = scan.alternate_enclosures
+                    else:
+                        alt_by_guid = source.extract_alternate_enclosures(rss_content) if rss_content else {}
+                    if alt_by_guid:
                         alt_enclosure_rows = [
                             (podcast.id, external_id, alt)
                             for external_id, entries in alt_by_guid.items()
@@ -518,6 +540,14 @@ class PodcastFeedManager:
                 for episode in episodes:
                     episode.podcast_id = podcast.id
 
+                # <podcast:transcript> links for the new episodes. The scan
+                # already collected them for the new-episode window; only a
+                # failed scan (feedparser recovered the feed) re-reads the body.
+                if scan is not None:
+                    transcript_links = scan.transcript_links
+                elif rss_content and isinstance(source, RSSMediaSource):
+                    transcript_links = source.extract_transcript_links(rss_content)
+
         except Exception as e:
             # Spec #60: classify structurally — a requests-level exception
             # escaping here (e.g. the YouTube source re-raising a network
@@ -552,6 +582,8 @@ class PodcastFeedManager:
             image_rows=image_rows,
             audio_rows=audio_rows,
             alt_enclosure_rows=alt_enclosure_rows,
+            transcript_links=transcript_links,
+            refresh_hint_seconds=refresh_hint_seconds,
             source=source,
             failure=failure,
         )
@@ -662,13 +694,12 @@ class PodcastFeedManager:
         episode_image_updates: List[Tuple[str, str, Optional[str]]] = []
         episode_audio_updates: List[Tuple[str, str, str, Optional[str]]] = []
         episode_alternate_enclosures: List[Tuple[str, str, AlternateEnclosure]] = []
-        transcript_link_work: List[Tuple[Podcast, List[Episode], "RSSMediaSource"]] = []
+        transcript_link_work: List[Tuple[Podcast, List[Episode], Dict[str, List[TranscriptLink]]]] = []
 
         def _record_outcome(result: RefreshAttemptResult) -> None:
             nonlocal podcasts_with_errors, conditional_get_hits
             podcast = result.podcast
             eps = result.new_episodes
-            source = result.source
             if result.failure is not None:
                 # FM-2: never certify a checkpoint on a failed refresh. The
                 # podcast's etag / last_modified / last_processed were already
@@ -705,8 +736,8 @@ class PodcastFeedManager:
             if eps:
                 new_episodes.append((podcast, eps))
                 new_episode_rows.extend(eps)
-                if isinstance(source, RSSMediaSource):
-                    transcript_link_work.append((podcast, eps, source))
+                if result.transcript_links:
+                    transcript_link_work.append((podcast, eps, result.transcript_links))
 
         use_pool = self.max_workers > 1 and total_podcasts > 1
         if use_pool:
@@ -790,12 +821,12 @@ class PodcastFeedManager:
                     episode_alternate_enclosures,
                 )
 
-        # Transcript links rely on the debug RSS file that was written
-        # during the fetch; do them after the main batch so a failure
-        # here never rolls back the refresh state. Non-critical work.
-        for podcast_tl, eps_tl, src_tl in transcript_link_work:
+        # Transcript links need the episode rows the batch just wrote; do
+        # them after it so a failure here never rolls back the refresh
+        # state. Non-critical work.
+        for podcast_tl, eps_tl, links_tl in transcript_link_work:
             try:
-                self._save_transcript_links_for_episodes(podcast_tl, eps_tl, src_tl)
+                self._save_transcript_links_for_episodes(podcast_tl, eps_tl, links_tl)
             except Exception as e:
                 logger.warning(
                     "Transcript-link extraction failed; refresh otherwise succeeded",
@@ -933,31 +964,21 @@ class PodcastFeedManager:
         self,
         podcast: Podcast,
         episodes: List[Episode],
-        source: RSSMediaSource,
+        transcript_links_by_guid: Dict[str, List[TranscriptLink]],
     ) -> None:
         """
-        Extract and save transcript links for newly discovered episodes.
+        Save transcript links for newly discovered episodes.
 
-        Reads the debug RSS file (saved during fetch_episodes) and extracts
-        <podcast:transcript> tags for each episode. Saves links to database
-        for later download.
+        The <podcast:transcript> tags were collected by the refresh's feed
+        scan (``RefreshAttemptResult.transcript_links``). Saves links to
+        database for later download.
 
         Args:
             podcast: The podcast these episodes belong to
             episodes: List of newly discovered episodes
-            source: The RSSMediaSource that fetched the episodes
+            transcript_links_by_guid: Episode GUID -> transcript links from the feed
         """
         try:
-            # Read the debug RSS file (saved during fetch_episodes)
-            debug_file = self.path_manager.debug_feed_file(podcast.slug)
-            if not debug_file.exists():
-                logger.debug("No debug RSS file found, skipping transcript link extraction", podcast_slug=podcast.slug)
-                return
-
-            rss_content = debug_file.read_text(encoding="utf-8")
-
-            # Extract transcript links from RSS
-            transcript_links_by_guid = source.extract_transcript_links(rss_content)
             if not transcript_links_by_guid:
                 return
 
@@ -0,0 +1,501 @@
+# Copyright 2025-2026 Thestill
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Single-pass streaming scan of an RSS body.
+
+A refresh used to parse every feed body five times: feedparser for the
+episodes, then one ElementTree parse each for the channel categories,
+``itunes:new-feed-url``, ``<podcast:transcript>`` links and
+``<podcast:alternateEnclosure>`` entries. On back-catalogue feeds (thousands
+of items, several MB) that dominated refresh CPU.
+
+:func:`scan_feed` walks the body once with expat and collects everything
+the raw-XML extractors produced, plus the per-GUID artwork and enclosure
+maps the refresh path re-syncs stored episodes from. It also finds the
+*new-episode window*: on a newest-first feed, the items before the first
+run of already-stored GUIDs. When the window ends early, ``content`` is the
+body with the stored tail of ``<item>`` elements cut out, so feedparser —
+by far the most expensive step — only parses the items that can become new
+episodes. Item fields keep their feedparser semantics (dates, HTML
+sanitising, entity handling); only the stored back catalogue is skipped.
+
+The cut is taken only when it is provably safe:
+
+- ``stop_after_known`` stored GUIDs in a row, with non-increasing
+  ``pubDate``\\ s — an oldest-first feed, or one without parseable dates,
+  never stops early;
+- every ``<item>`` is a direct child of ``<channel>``, and no other channel
+  tag sits among the items that are cut, so no channel metadata is lost
+  (tags after the last item are kept).
+
+Security: entity declarations and external references are refused, as
+:mod:`defusedxml` does for the ElementTree parses this replaces. Any parse
+failure returns ``None`` and callers fall back to the full body.
+"""
+
+from __future__ import annotations
+
+import email.utils
+from typing import AbstractSet, Any, Dict, List, NamedTuple, Optional, Tuple
+from xml.parsers import expat
+
+from defusedxml import DefusedXmlException, EntitiesForbidden, ExternalReferenceForbidden
+from structlog import get_logger
+
+from ..models.podcast import AlternateEnclosure, TranscriptLink
+from .refresh_cadence import feed_hint_seconds
+
+logger = get_logger(__name__)
+
+ITUNES_NS = "http://www.itunes.com/dtds/podcast-1.0.dtd"
+PODCAST_NS = "https://podcastindex.org/namespace/1.0"
+ATOM_NS = "http://www.w3.org/2005/Atom"
+SY_NS = "http://purl.org/rss/1.0/modules/syndication/"
+
+# expat reports namespaced names as "<uri> <local>"; plain RSS 2.0 tags have
+# no namespace and come through bare.
+_ITUNES_CATEGORY = f"{ITUNES_NS} category"
+_ITUNES_NEW_FEED_URL = f"{ITUNES_NS} new-feed-url"
+_ITUNES_IMAGE = f"{ITUNES_NS} image"
+_TRANSCRIPT = f"{PODCAST_NS} transcript"
+_ALT_ENCLOSURE = f"{PODCAST_NS} alternateEnclosure"
+_ALT_SOURCE = f"{PODCAST_NS} source"
+_ATOM_LINK = f"{ATOM_NS} link"
+# Channel-level polling hints, captured by their text.
+_HINT_TAGS = {
+    "ttl": "ttl",
+    f"{SY_NS} updatePeriod": "update_period",
+    f"{SY_NS} updateFrequency": "update_frequency",
+}
+
+# Default run of stored GUIDs that ends the new-episode window (see
+# ``get_rss_early_stop_known_run``).
+DEFAULT_STOP_AFTER_KNOWN = 3
+
+
+class FeedScan(NamedTuple):
+    """What one streaming pass over a feed body found.
+
+    ``content`` is what feedparser should parse: the original body, or the
+    body cut down to the new-episode window when ``stopped_early``. Every
+    map is keyed by the item GUID (``<guid>``, else ``<id>``, stripped —
+    the ``external_id`` stored episodes carry); items with neither are not
+    keyed. ``transcript_links`` only covers the window, since links are
+    saved for newly discovered episodes; the other maps cover the whole
+    feed. ``refresh_hint_seconds`` is the poll interval the channel's
+    ``<ttl>`` / ``sy:updatePeriod`` ask for (see :mod:`refresh_cadence`).
+    """
+
+    content: str
+    items_total: int
+    items_in_window: int
+    stopped_early: bool
+    categories: List[Tuple[str, Optional[str]]]
+    new_feed_url: Optional[str]
+    transcript_links: Dict[str, List[TranscriptLink]]
+    alternate_enclosures: Dict[str, List[AlternateEnclosure]]
+    images: Dict[str, Optional[str]]
+    audio_urls: Dict[str, Tuple[str, Optional[str]]]
+    refresh_hint_seconds: Optional[int] = None
+
+
+class _Item:
+    __slots__ = (
+        "start",
+        "end_tag",
+        "direct_child",
+        "guid",
+        "id",
+        "pub_date",
+        "image",
+        "media",
+        "transcripts",
+        "alternates",
+    )
+
+    def __init__(self, start: int, direct_child: bool) -> None:
+        self.start = start
+        self.end_tag = start
+        self.direct_child = direct_child
+        self.guid: Optional[str] = None
+        self.id: Optional[str] = None
+        self.pub_date: Optional[str] = None
+        self.image: Optional[str] = None
+        # (href, lowercased type) for <enclosure> and atom enclosure links, in
+        # document order — the candidates feedparser would expose as links.
+        self.media: List[Tuple[str, str]] = []
+        self.transcripts: List[Dict[str, str]] = []
+        self.alternates: List[Tuple[Dict[str, str], List[str]]] = []
+
+    @property
+    def key(self) -> Optional[str]:
+        # The first <guid>'s text, else the first <id>'s, stripped: feedparser
+        # trims element text before it becomes ``external_id``, so a
+        # pretty-printed ``<guid>\n  id\n</guid>`` must still match.
+        if self.guid and self.guid.strip():
+            return self.guid.strip()
+        if self.id and self.id.strip():
+            return self.id.strip()
+        return None
+
+
+class _Walker:
+    """expat handlers: a stack of open element names plus the item being read."""
+
+    def __init__(self) -> None:
+        self.stack: List[str] = []
+        self.channel_seen = False
+        self.in_channel = False
+        self.items: List[_Item] = []
+        self.item: Optional[_Item] = None
+        self.item_depth = 0
+        self.categories: List[Tuple[str, Optional[str]]] = []
+        self.category_open: Optional[int] = None  # index into categories
+        self.category_nested = False
+        self.new_feed_url: Optional[str] = None
+        self.new_feed_url_seen = False
+        self.hints: Dict[str, str] = {}
+        self.alternate: Optional[Tuple[Dict[str, str], List[str]]] = None
+        # For every channel-level tag that is not an <item>: how many items
+        # had closed before it. Cutting items out must not drop one of these.
+        self.channel_tags_after: List[int] = []
+        # Direct text of the element being captured (ElementTree's ``.text``:
+        # character data before its first child).
+        self.text_target: Optional[str] = None
+        self.text: List[str] = []
+
+    def start(self, name: str, attrs: Dict[str, str], offset: int) -> None:
+        self._freeze_text()
+        depth = len(self.stack)
+        self.stack.append(name)
+        parent = self.stack[-2] if depth else None
+
+        if depth == 1 and name == "channel" and not self.channel_seen:
+            self.channel_seen = self.in_channel = True
+            return
+
+        item = self.item
+        if item is None:
+            if name == "item" and depth >= 1:
+                self.item = _Item(offset, direct_child=self.in_channel and depth == 2)
+                self.item_depth = depth
+                return
+            if self.in_channel and depth == 2:
+                self.channel_tags_after.append(len(self.items))
+                if name == _ITUNES_CATEGORY:
+                    self.categories.append((attrs.get("text", ""), None))
+                    self.category_open = len(self.categories) - 1
+                    self.category_nested = False
+                elif name == _ITUNES_NEW_FEED_URL and not self.new_feed_url_seen:
+                    self.new_feed_url_seen = True
+                    self._capture("new_feed_url")
+                elif name in _HINT_TAGS and _HINT_TAGS[name] not in self.hints:
+                    self.hints[_HINT_TAGS[name]] = ""
+                    self._capture(_HINT_TAGS[name])
+            elif (
+                depth == 3 and name == _ITUNES_CATEGORY and self.category_open is not None and not self.category_nested
+            ):
+                text, _ = self.categories[self.category_open]
+                self.categories[self.category_open] = (text, attrs.get("text", ""))
+                self.category_nested = True
+            return
+
+        if depth == self.item_depth + 1:
+            if name == "guid" and item.guid is None:
+                item.guid = ""
+                self._capture("guid")
+            elif name == "id" and item.id is None:
+                item.id = ""
+                self._capture("id")
+            elif name == "pubDate" and item.pub_date is None:
+                item.pub_date = ""
+                self._capture("pubDate")
+            elif name == _ITUNES_IMAGE:
+                href = attrs.get("href") or attrs.get("url")
+                if href:
+                    item.image = href
+            elif name == "enclosure":
+                lowered = {k.lower(): v for k, v in attrs.items()}
+                href = lowered.get("url") or lowered.get("href")
+                if href:
+                    item.media.append((href, lowered.get("type", "").lower()))
+            elif name == _ATOM_LINK and attrs.get("rel", "").lower() == "enclosure":
+                if attrs.get("href"):
+                    item.media.append((attrs["href"], attrs.get("type", "").lower()))
+            elif name == _TRANSCRIPT:
+                item.transcripts.append(attrs)
+            elif name == _ALT_ENCLOSURE:
+                self.alternate = (attrs, [])
+                item.alternates.append(self.alternate)
+        elif depth == self.item_depth + 2 and name == _ALT_SOURCE and parent == _ALT_ENCLOSURE:
+            if self.alternate is not None and attrs.get("uri"):
+                self.alternate[1].append(attrs["uri"])
+
+    def end(self, name: str, offset: int) -> None:
+        self.stack.pop()
+        depth = len(self.stack)
+        if self.text_target is not None and depth == (self.item_depth + 1 if self.item else 2):
+            self._finish_text()
+
+        if self.item is not None:
+            if depth == self.item_depth:
+                self.item.end_tag = offset
+                self.items.append(self.item)
+                self.item = None
+            elif name == _ALT_ENCLOSURE and depth == self.item_depth + 1:
+                self.alternate = None
+            return
+        if depth == 2 and name == _ITUNES_CATEGORY:
+            self.category_open = None
+        elif depth == 1 and name == "channel":
+            self.in_channel = False
+
+    def characters(self, data: str) -> None:
+        if self.text_target is not None:
+            self.text.append(data)
+
+    def _capture(self, target: str) -> None:
+        self.text_target = target
+        self.text = []
+
+    def _freeze_text(self) -> None:
+        # A child element ends the captured ``.text``.
+        if self.text_target is not None:
+            self._finish_text()
+
+    def _finish_text(self) -> None:
+        value = "".join(self.text)
+        target, self.text_target, self.text = self.text_target, None, []
+        if target == "new_feed_url":
+            self.new_feed_url = value.strip() or None
+        elif target in self.hints:
+            self.hints[target] = value
+        elif self.item is not None:
+            if target == "guid":
+                self.item.guid = value
+            elif target == "id":
+                self.item.id = value
+            elif target == "pubDate":
+                self.item.pub_date = value
+
+
+def _forbid_entity_decl(name, is_parameter_entity, value, base, sysid, pubid, notation_name):
+    raise EntitiesForbidden(name, value, base, sysid, pubid, notation_name)
+
+
+def _forbid_unparsed_entity_decl(name, base, sysid, pubid, notation_name):
+    raise EntitiesForbidden(name, None, base, sysid, pubid, notation_name)
+
+
+def _forbid_external_ref(context, base, sysid, pubid):
+    raise ExternalReferenceForbidden(context, base, sysid, pubid)
+
+
+def _walk(rss_content: str) -> _Walker:
+    walker = _Walker()
+    parser = expat.ParserCreate(namespace_separator=" ")
+    parser.buffer_text = True
+    parser.EntityDeclHandler = _forbid_entity_decl
+    parser.UnparsedEntityDeclHandler = _forbid_unparsed_entity_decl
+    parser.ExternalEntityRefHandler = _forbid_external_ref
+    parser.StartElementHandler = lambda name, attrs: walker.start(name, attrs, parser.CurrentByteIndex)
+    parser.EndElementHandler = lambda name: walker.end(name, parser.CurrentByteIndex)
+    parser.CharacterDataHandler = walker.characters
+    # A str is fed to expat as UTF-8 whatever the XML declaration says, so
+    # CurrentByteIndex is an offset into ``rss_content.encode("utf-8")``.
+    parser.Parse(rss_content, True)
+    return walker
+
+
+def _timestamp(pub_date: Optional[str]) -> Optional[float]:
+    if not pub_date:
+        return None
+    parsed = email.utils.parsedate_tz(pub_date.strip())
+    if parsed is None:
+        return None
+    try:
+        return float(email.utils.mktime_tz(parsed))
+    except (OverflowError, ValueError):
+        return None
+
+
+def _window_end(items: List[_Item], known_guids: AbstractSet[str], stop_after_known: int) -> Optional[int]:
+    """Index of the first item of the first qualifying run of stored GUIDs."""
+    run_start, run_length, previous = 0, 0, None
+    for index, item in enumerate(items):
+        key = item.key
+        stamp = _timestamp(item.pub_date)
+        if key is None or key not in known_guids or stamp is None:
+            run_length, previous = 0, None
+            continue
+        if run_length and previous is not None and stamp > previous:
+            # Dates went up: not a newest-first stretch. Restart the run here.
+            run_length = 0
+        if run_length == 0:
+            run_start = index
+        run_length += 1
+        previous = stamp
+        if run_length >= stop_after_known:
+            return run_start
+    return None
+
+
+def _transcript_links(item: _Item) -> List[TranscriptLink]:
+    links: List[TranscriptLink] = []
+    for attrs in item.transcripts:
+        url, mime_type = attrs.get("url"), attrs.get("type")
+        if not url or not mime_type:
+            continue
+        try:
+            links.append(
+                TranscriptLink(
+                    url=url,  # type: ignore[arg-type]  # Pydantic validates to HttpUrl
+                    mime_type=mime_type,
+                    language=attrs.get("language"),
+                    rel=attrs.get("rel"),
+                )
+            )
+        except Exception as e:
+            logger.debug(f"Failed to create TranscriptLink for {url}: {e}")
+    return links
+
+
+def _alternate_enclosures(item: _Item) -> List[AlternateEnclosure]:
+    entries: List[AlternateEnclosure] = []
+    for attrs, sources in item.alternates:
+        mime_type = attrs.get("type")
+        if not mime_type:
+            continue
+
+        length_attr = attrs.get("length")
+        bitrate_attr = attrs.get("bitrate")
+        try:
+            bitrate = float(bitrate_attr) if bitrate_attr else None
+        except ValueError:
+            bitrate = None
+        height_attr = attrs.get("height")
+
+        shared: Dict[str, Any] = dict(
+            mime_type=mime_type,
+            length=int(length_attr) if length_attr and length_attr.isdigit() else None,
+            bitrate=bitrate,
+            height=int(height_attr) if height_attr and height_attr.isdigit() else None,
+            title=attrs.get("title"),
+            rel=attrs.get("rel"),
+            language=attrs.get("lang"),
+            is_default=(attrs.get("default") or "").strip().lower() == "true",
+        )
+        for uri in sources:
+            try:
+                entries.append(AlternateEnclosure(source_uri=uri, **shared))
+            except Exception as e:
+                logger.debug(f"Failed to create AlternateEnclosure for {uri}: {e}")
+    return entries
+
+
+def _audio_url(item: _Item) -> Optional[Tuple[str, str]]:
+    # Same preference as ``RSSMediaSource._extract_enclosure_info``: the
+    # first audio candidate, else the first video one.
+    video: Optional[Tuple[str, str]] = None
+    for href, mime_type in item.media:
+        if mime_type.startswith("audio/"):
+            return href, mime_type
+        if video is None and mime_type.startswith("video/"):
+            video = (href, mime_type)
+    return video
+
+
+def scan_feed(
+    rss_content: str,
+    known_guids: Optional[AbstractSet[str]] = None,
+    stop_after_known: int = DEFAULT_STOP_AFTER_KNOWN,
+) -> Optional[FeedScan]:
+    """Walk ``rss_content`` once; see the module docstring.
+
+    Args:
+        rss_content: Raw feed body.
+        known_guids: ``external_id``\\ s already stored for the podcast. Empty
+            or ``None`` scans the whole feed into the window.
+        stop_after_known: Run of stored GUIDs that ends the window; ``0``
+            never ends it early.
+
+    Returns:
+        A :class:`FeedScan`, or ``None`` if the body is not well-formed XML
+        (or declares entities) — callers fall back to the full body.
+    """
+    try:
+        walker = _walk(rss_content)
+    except (expat.ExpatError, DefusedXmlException, ValueError) as e:
+        logger.warning("feed_scan_failed", error=str(e))
+        return None
+
+    items = walker.items
+    cut: Optional[int] = None
+    if known_guids and stop_after_known > 0:
+        cut = _window_end(items, known_guids, stop_after_known)
+        # The cut drops everything from items[cut] to the end of the last
+        # item, so no channel tag may sit in that stretch.
+        if cut is not None and (
+            any(cut < closed < len(items) for closed in walker.channel_tags_after)
+            or not all(item.direct_child for item in items)
+        ):
+            cut = None
+
+    content = rss_content
+    if cut is not None:
+        raw = rss_content.encode("utf-8")
+        tail_start = raw.find(b">", items[-1].end_tag) + 1
+        content = (raw[: items[cut].start] + raw[tail_start:]).decode("utf-8")
+
+    window = items if cut is None else items[:cut]
+    transcript_links: Dict[str, List[TranscriptLink]] = {}
+    for item in window:
+        key = item.key
+        if key is not None and item.transcripts:
+            links = _transcript_links(item)
+            if links:
+                transcript_links[key] = links
+
+    alternate_enclosures: Dict[str, List[AlternateEnclosure]] = {}
+    images: Dict[str, Optional[str]] = {}
+    audio_urls: Dict[str, Tuple[str, Optional[str]]] = {}
+    for item in items:
+        key = item.key
+        if key is None:
+            continue
+        images[key] = item.image
+        audio = _audio_url(item)
+        if audio is not None:
+            audio_urls[key] = audio
+        if item.alternates:
+            entries = _alternate_enclosures(item)
+            if entries:
+                alternate_enclosures[key] = entries
+
+    return FeedScan(
+        content=content,
+        items_total=len(items),
+        items_in_window=len(window),
+        stopped_early=cut is not None,
+        categories=walker.categories[:2],
+        new_feed_url=walker.new_feed_url,
+        refresh_hint_seconds=feed_hint_seconds(
+            walker.hints.get("ttl"), walker.hints.get("update_period"), walker.hints.get("update_frequency")
+        ),
+        transcript_links=transcript_links,
+        alternate_enclosures=alternate_enclosures,
+        images=images,
+        audio_urls=audio_urls,
+    )
@@ -0,0 +1,278 @@
+# Copyright 2025-2026 Thestill
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Lease-based leader election across processes.
+
+The refresh and briefing schedulers must run in exactly one process even
+when several ``thestill worker`` / ``thestill server`` processes share a
+database. Each candidate runs a :class:`LeaderElector`, which keeps trying
+to take (or renew) a named row in ``leader_leases``:
+
+- the upsert only succeeds while the row is free, expired, or already ours,
+  so at most one holder exists per lease name;
+- the holder renews every ``ttl / 3`` seconds; a crashed holder's lease
+  lapses after ``ttl`` and another candidate takes over on its next try;
+- a holder that fails to renew (database unreachable, lease stolen after a
+  long pause) steps down immediately rather than risk two leaders.
+
+Task-processing processes also hold a private ``worker:<holder>`` lease as
+a heartbeat. Startup recovery uses it to tell a lone restart (reset every
+interrupted task) from a peer joining live workers (reset only stale ones).
+
+``SqliteLeaseStore`` keeps the table in the podcast database (single host,
+wall clock); ``PostgresLeaseStore`` uses the server clock so candidates on
+different hosts agree on expiry. The Postgres table is owned by
+``repositories/postgres_schema.py``.
+"""
+
+from __future__ import annotations
+
+import os
+import socket
+import threading
+import time
+import uuid
+from abc import ABC, abstractmethod
+from pathlib import Path
+from typing import TYPE_CHECKING, Callable, List, Optional, Union
+
+from structlog import get_logger
+
+from ..utils.sqlite_ext import connect
+
+if TYPE_CHECKING:
+    from ..utils.config import Config
+
+logger = get_logger(__name__)
+
+SCHEDULER_LEASE = "schedulers"
+# Per-process presence leases: ``worker:<holder>``, one per task worker.
+WORKER_LEASE_PREFIX = "worker:"
+
+_SQLITE_SCHEMA = """
+CREATE TABLE IF NOT EXISTS leader_leases (
+    name TEXT PRIMARY KEY,
+    holder TEXT NOT NULL,
+    expires_at REAL NOT NULL
+)
+"""
+
+
+def default_holder_id() -> str:
+    """Identify this process in ``leader_leases`` (host, pid, random suffix)."""
+    return f"{socket.gethostname()}:{os.getpid()}:{uuid.uuid4().hex[:8]}"
+
+
+class LeaseStore(ABC):
+    """Atomic take-or-renew of named leases."""
+
+    @abstractmethod
+    def try_acquire(self, name: str, holder: str, ttl_sec: float) -> bool:
+        """Take or renew ``name`` for ``holder``; False if someone else holds it."""
+
+    @abstractmethod
+    def release(self, name: str, holder: str) -> None:
+        """Give ``name`` up early so another candidate need not wait for expiry."""
+
+    @abstractmethod
+    def current_holder(self, name: str) -> Optional[str]:
+        """Holder of an unexpired lease, or ``None``."""
+
+    @abstractmethod
+    def live_holders(self, prefix: str) -> List[str]:
+        """Holders of every unexpired lease whose name starts with ``prefix``."""
+
+
+class SqliteLeaseStore(LeaseStore):
+    """``leader_leases`` table in a SQLite database file."""
+
+    def __init__(self, db_path: Union[str, Path]):
+        self.db_path = Path(db_path)
+        with connect(self.db_path) as conn:
+            conn.execute(_SQLITE_SCHEMA)
+
+    def try_acquire(self, name: str, holder: str, ttl_sec: float) -> bool:
+        now = time.time()
+        with connect(self.db_path) as conn:
+            cursor = conn.execute(
+                """
+                INSERT INTO leader_leases (name, holder, expires_at) VALUES (?, ?, ?)
+                ON CONFLICT(name) DO UPDATE SET holder = excluded.holder, expires_at = excluded.expires_at
+                WHERE leader_leases.holder = excluded.holder OR leader_leases.expires_at < ?
+                """,
+                (name, holder, now + ttl_sec, now),
+            )
+            return cursor.rowcount == 1
+
+    def release(self, name: str, holder: str) -> None:
+        with connect(self.db_path) as conn:
+            conn.execute("DELETE FROM leader_leases WHERE name = ? AND holder = ?", (name, holder))
+
+    def current_holder(self, name: str) -> Optional[str]:
+        with connect(self.db_path) as conn:
+            row = conn.execute(
+                "SELECT holder FROM leader_leases WHERE name = ? AND expires_at >= ?", (name, time.time())
+            ).fetchone()
+        return row["holder"] if row else None
+
+    def live_holders(self, prefix: str) -> List[str]:
+        with connect(self.db_path) as conn:
+            rows = conn.execute(
+                "SELECT holder FROM leader_leases WHERE substr(name, 1, ?) = ? AND expires_at >= ?",
+                (len(prefix), prefix, time.time()),
+            ).fetchall()
+        return [row["holder"] for row in rows]
+
+
+class PostgresLeaseStore(LeaseStore):
+    """``leader_leases`` table in Postgres, expiry on the server clock."""
+
+    def __init__(self, dsn: str):
+        self.dsn = dsn
+
+    def try_acquire(self, name: str, holder: str, ttl_sec: float) -> bool:
+        from ..utils.postgres_ext import connect as pg_connect
+
+        with pg_connect(self.dsn) as conn:
+            cursor = conn.execute(
+                """
+                INSERT INTO leader_leases (name, holder, expires_at)
+                VALUES (%s, %s, now() + make_interval(secs => %s))
+                ON CONFLICT (name) DO UPDATE SET holder = EXCLUDED.holder, expires_at = EXCLUDED.expires_at
+                WHERE leader_leases.holder = EXCLUDED.holder OR leader_leases.expires_at < now()
+                """,
+                (name, holder, ttl_sec),
+            )
+            return cursor.rowcount == 1
+
+    def release(self, name: str, holder: str) -> None:
+        from ..utils.postgres_ext import connect as pg_connect
+
+        with pg_connect(self.dsn) as conn:
+            conn.execute("DELETE FROM leader_leases WHERE name = %s AND holder = %s", (name, holder))
+
+    def current_holder(self, name: str) -> Optional[str]:
+        from ..utils.postgres_ext import connect as pg_connect
+
+        with pg_connect(self.dsn) as conn:
+            row = conn.execute(
+                "SELECT holder FROM leader_leases WHERE name = %s AND expires_at >= now()", (name,)
+            ).fetchone()
+        return row["holder"] if row else None
+
+    def live_holders(self, prefix: str) -> List[str]:
+        from ..utils.postgres_ext import connect as pg_connect
+
+        with pg_connect(self.dsn) as conn:
+            rows = conn.execute(
+                "SELECT holder FROM leader_leases WHERE left(name, %s) = %s AND expires_at >= now()",
+                (len(prefix), prefix),
+            ).fetchall()
+        return [row["holder"] for row in rows]
+
+
+def lease_store_from_config(config: "Config") -> LeaseStore:
+    """Lease table on the configured repository backend."""
+    from ..repositories.factory import uses_postgres
+
+    if uses_postgres(config):
+        return PostgresLeaseStore(config.database_url)
+    return SqliteLeaseStore(config.database_path)
+
+
+class LeaderElector:
+    """Hold lease ``name`` while running; call back on gaining or losing it.
+
+    ``on_elected`` / ``on_demoted`` run on the elector thread (and
+    ``on_demoted`` once more from :meth:`stop` if still leading); they
+    should start/stop background work and return promptly.
+    """
+
+    def __init__(
+        self,
+        store: LeaseStore,
+        name: str,
+        *,
+        on_elected: Callable[[], None],
+        on_demoted: Callable[[], None],
+        ttl_sec: float = 30.0,
+        holder: Optional[str] = None,
+    ):
+        self.store = store
+        self.name = name
+        self.on_elected = on_elected
+        self.on_demoted = on_demoted
+        self.ttl_sec = max(1.0, ttl_sec)
+        self.holder = holder or default_holder_id()
+        self._leader = False
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def is_leader(self) -> bool:
+        return self._leader
+
+    def start(self) -> None:
+        if self._thread is not None and self._thread.is_alive():
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run_loop, name=f"leader-{self.name}", daemon=True)
+        self._thread.start()
+        logger.info("leader_election_started", lease=self.name, holder=self.holder, ttl_seconds=self.ttl_sec)
+
+    def stop(self, timeout: float = 10.0) -> None:
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout=timeout)
+            self._thread = None
+        if self._set_leader(False):
+            try:
+                self.store.release(self.name, self.holder)
+            except Exception as e:
+                logger.warning("leader_lease_release_failed", lease=self.name, error=str(e))
+
+    def poll(self) -> bool:
+        """One take-or-renew attempt; returns whether this process now leads."""
+        try:
+            held = self.store.try_acquire(self.name, self.holder, self.ttl_sec)
+        except Exception as e:
+            logger.warning("leader_lease_renew_failed", lease=self.name, error=str(e))
+            held = False
+        if held and not self._leader:
+            logger.info("leader_elected", lease=self.name, holder=self.holder)
+            self._set_leader(True)
+        elif not held and self._leader:
+            logger.warning("leader_demoted", lease=self.name, holder=self.holder)
+            self._set_leader(False)
+        return held
+
+    def _set_leader(self, leader: bool) -> bool:
+        """Flip leadership and run the matching callback; True if it changed."""
+        with self._lock:
+            if self._leader == leader:
+                return False
+            self._leader = leader
+            callback = self.on_elected if leader else self.on_demoted
+            try:
+                callback()
+            except Exception:
+                logger.exception("leader_callback_failed", lease=self.name, elected=leader)
+            return True
+
+    def _run_loop(self) -> None:
+        while not self._stop.is_set():
+            self.poll()
+            self._stop.wait(self.ttl_sec / 3)
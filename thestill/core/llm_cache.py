@@ -0,0 +1,408 @@
+# Copyright 2025-2026 Thestill
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Content-addressed cache of LLM responses (opt-in, ``LLM_CACHE_ENABLED``).
+
+Re-running CLEAN or SUMMARIZE after a crash or a ``--force``, or sweeping
+an eval rubric over the same episodes, re-sends byte-identical requests:
+the segmented cleaner's batches, facts extraction, summary chunks, judge
+calls. ``CachedLLMProvider`` answers those from a local SQLite file.
+
+- **Key.** SHA-256 over the provider identity (type, model, reasoning /
+  thinking setting), the call kind, the messages, the response model's
+  JSON schema, ``temperature``, ``max_tokens``, ``response_format`` and
+  the active :func:`llm_cache_variant`. Anything that can change the
+  answer is in the key; the ``cache_system_message`` hint is not.
+- **What is stored.** Only successful results: text for
+  ``chat_completion`` (JSON-mode text only when it parses) and the
+  validated model's JSON for ``generate_structured*``. Exceptions are
+  never cached, so a failed call is retried for real next time.
+- **Variants.** Callers that deliberately repeat a request — the eval
+  runner's samples and its retry after an invalid report — tag each
+  repetition with ``llm_cache_variant(...)`` so they stay distinct, and a
+  re-run replays the same sequence.
+- **Bounded.** Entries carry their size and last-use time; past
+  ``max_bytes`` the least recently used are deleted down to 90%.
+
+The file is independent of the podcast database (``LLM_CACHE_PATH``,
+default ``<STORAGE_PATH>/llm_cache.db``) and safe to delete at any time.
+"""
+
+from __future__ import annotations
+
+import contextvars
+import hashlib
+import json
+import threading
+import time
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterator, List, Optional, Type, Union
+
+from pydantic import BaseModel, ValidationError
+from structlog import get_logger
+
+from ..utils.sqlite_ext import connect
+from .llm_provider import DelegatingProvider, LLMProvider, T
+
+logger = get_logger(__name__)
+
+# Bump to orphan every existing entry (e.g. when the key layout changes).
+CACHE_KEY_VERSION = 1
+# Eviction trims to this share of ``max_bytes`` so it does not run per put.
+_EVICT_TO = 0.9
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS llm_responses (
+    key TEXT PRIMARY KEY,
+    provider TEXT NOT NULL,
+    model TEXT NOT NULL,
+    kind TEXT NOT NULL,
+    response TEXT NOT NULL,
+    size_bytes INTEGER NOT NULL,
+    created_at REAL NOT NULL,
+    last_used_at REAL NOT NULL,
+    hits INTEGER NOT NULL DEFAULT 0
+);
+CREATE INDEX IF NOT EXISTS idx_llm_responses_last_used ON llm_responses(last_used_at);
+"""
+
+_variant: contextvars.ContextVar[str] = contextvars.ContextVar("llm_cache_variant", default="")
+
+
+@contextmanager
+def llm_cache_variant(tag: str) -> Iterator[None]:
+    """Make identical requests inside the block cache separately under ``tag``."""
+    token = _variant.set(tag)
+    try:
+        yield
+    finally:
+        _variant.reset(token)
+
+
+def cache_key(
+    identity: str,
+    kind: str,
+    messages: List[Dict[str, Any]],
+    *,
+    response_model: Optional[Type[BaseModel]] = None,
+    temperature: Optional[float] = None,
+    max_tokens: Optional[int] = None,
+    response_format: Optional[Dict[str, str]] = None,
+) -> str:
+    """Hex digest naming one request. See the module docstring for the fields."""
+    payload = {
+        "v": CACHE_KEY_VERSION,
+        "identity": identity,
+        "kind": kind,
+        "messages": messages,
+        "schema": response_model.model_json_schema() if response_model is not None else None,
+        "temperature": temperature,
+        "max_tokens": max_tokens,
+        "response_format": response_format,
+        "variant": _variant.get(),
+    }
+    canonical = json.dumps(payload, sort_keys=True, separators=(",", ":"), ensure_ascii=False, default=str)
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+
+class LLMResponseCache:
+    """SQLite store of responses by key, bounded to ``max_bytes``."""
+
+    def __init__(self, db_path: Union[str, Path], max_bytes: int = 512 * 1024 * 1024) -> None:
+        self.db_path = Path(db_path)
+        self.max_bytes = max(0, max_bytes)
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        with connect(self.db_path) as conn:
+            conn.executescript(_SCHEMA)
+            size = conn.execute("SELECT COALESCE(SUM(size_bytes), 0) FROM llm_responses").fetchone()[0]
+        self._lock = threading.Lock()
+        # Running total so ``put`` only rescans the table when it may be over.
+        self._size_bytes = size
+        self.hits = 0
+        self.misses = 0
+        self.writes = 0
+        self.evictions = 0
+
+    def get(self, key: str) -> Optional[str]:
+        with connect(self.db_path) as conn:
+            row = conn.execute("SELECT response FROM llm_responses WHERE key = ?", (key,)).fetchone()
+            if row is not None:
+                conn.execute(
+                    "UPDATE llm_responses SET last_used_at = ?, hits = hits + 1 WHERE key = ?",
+                    (time.time(), key),
+                )
+        with self._lock:
+            if row is None:
+                self.misses += 1
+                return None
+            self.hits += 1
+        return row["response"]
+
+    def put(self, key: str, *, provider: str, model: str, kind: str, response: str) -> None:
+        size = len(response.encode("utf-8"))
+        now = time.time()
+        with connect(self.db_path) as conn:
+            replaced = self._entry_size(conn, key)
+            conn.execute(
+                "INSERT OR REPLACE INTO llm_responses "
+                "(key, provider, model, kind, response, size_bytes, created_at, last_used_at, hits) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?, 0)",
+                (key, provider, model, kind, response, size, now, now),
+            )
+            with self._lock:
+                self._size_bytes += size - replaced
+                over = self.max_bytes and self._size_bytes > self.max_bytes
+            evicted = self._evict(conn) if over else 0
+        with self._lock:
+            self.writes += 1
+            self.evictions += evicted
+
+    def discard(self, key: str) -> None:
+        """Forget one entry (e.g. a response the caller found unusable)."""
+        with connect(self.db_path) as conn:
+            size = self._entry_size(conn, key)
+            conn.execute("DELETE FROM llm_responses WHERE key = ?", (key,))
+        with self._lock:
+            self._size_bytes -= size
+
+    def stats(self) -> Dict[str, Any]:
+        with connect(self.db_path) as conn:
+            entries, size = conn.execute("SELECT COUNT(*), COALESCE(SUM(size_bytes), 0) FROM llm_responses").fetchone()
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "path": str(self.db_path),
+                "entries": entries,
+                "size_bytes": size,
+                "max_bytes": self.max_bytes,
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_ratio": round(self.hits / lookups, 3) if lookups else None,
+                "writes": self.writes,
+                "evictions": self.evictions,
+            }
+
+    @staticmethod
+    def _entry_size(conn, key: str) -> int:
+        row = conn.execute("SELECT size_bytes FROM llm_responses WHERE key = ?", (key,)).fetchone()
+        return row["size_bytes"] if row is not None else 0
+
+    def _evict(self, conn) -> int:
+        """Delete least recently used entries until the cache is under 90%.
+
+        Re-sums the table rather than trusting the running total: other
+        processes sharing the file write and evict too.
+        """
+        total = conn.execute("SELECT COALESCE(SUM(size_bytes), 0) FROM llm_responses").fetchone()[0]
+        if total <= self.max_bytes:
+            with self._lock:
+                self._size_bytes = total
+            return 0
+        target = int(self.max_bytes * _EVICT_TO)
+        evicted = 0
+        rows = conn.execute("SELECT key, size_bytes FROM llm_responses ORDER BY last_used_at ASC").fetchall()
+        doomed = []
+        for row in rows:
+            if total <= target:
+                break
+            doomed.append((row["key"],))
+            total -= row["size_bytes"]
+            evicted += 1
+        conn.executemany("DELETE FROM llm_responses WHERE key = ?", doomed)
+        with self._lock:
+            self._size_bytes = total
+        logger.info("llm_cache_evicted", entries=evicted, size_bytes=total, max_bytes=self.max_bytes)
+        return evicted
+
+
+class CachedLLMProvider(DelegatingProvider):
+    """Serves repeat requests from an ``LLMResponseCache``; see the module docstring."""
+
+    def __init__(self, inner: LLMProvider, cache: LLMResponseCache, identity: str) -> None:
+        super().__init__(inner)
+        self.cache = cache
+        self.identity = identity
+
+    def chat_completion(
+        self,
+        messages: List[Dict[str, str]],
+        temperature: Optional[float] = None,
+        max_tokens: Optional[int] = None,
+        response_format: Optional[Dict[str, str]] = None,
+    ) -> str:
+        key = cache_key(
+            self.identity,
+            "chat",
+            messages,
+            temperature=temperature,
+            max_tokens=max_tokens,
+            response_format=response_format,
+        )
+        cached = self._lookup(key)
+        if cached is not None:
+            return cached
+        text = super().chat_completion(
+            messages, temperature=temperature, max_tokens=max_tokens, response_format=response_format
+        )
+        if text and (not _wants_json(response_format) or _parses_as_json(text)):
+            self._store(key, "chat", text)
+        return text
+
+    def generate_structured(
+        self,
+        messages: List[Dict[str, str]],
+        response_model: Type[T],
+        temperature: Optional[float] = None,
+        max_tokens: Optional[int] = None,
+    ) -> T:
+        return self._structured(
+            "structured",
+            lambda: super(CachedLLMProvider, self).generate_structured(
+                messages, response_model, temperature=temperature, max_tokens=max_tokens
+            ),
+            messages,
+            response_model,
+            temperature,
+            max_tokens,
+        )
+
+    def generate_structured_cached(
+        self,
+        messages: List[Dict[str, str]],
+        response_model: Type[T],
+        *,
+        cache_system_message: bool = False,
+        temperature: Optional[float] = None,
+        max_tokens: Optional[int] = None,
+    ) -> T:
+        # Same kind as generate_structured: the caching hint does not
+        # change the answer, so both entry points share entries.
+        return self._structured(
+            "structured",
+            lambda: super(CachedLLMProvider, self).generate_structured_cached(
+                messages,
+                response_model,
+                cache_system_message=cache_system_message,
+                temperature=temperature,
+                max_tokens=max_tokens,
+            ),
+            messages,
+            response_model,
+            temperature,
+            max_tokens,
+        )
+
+    def _structured(
+        self,
+        kind: str,
+        call: Callable[[], T],
+        messages: List[Dict[str, str]],
+        response_model: Type[T],
+        temperature: Optional[float],
+        max_tokens: Optional[int],
+    ) -> T:
+        key = cache_key(
+            self.identity,
+            kind,
+            messages,
+            response_model=response_model,
+            temperature=temperature,
+            max_tokens=max_tokens,
+        )
+        cached = self._lookup(key)
+        if cached is not None:
+            try:
+                return response_model.model_validate_json(cached)
+            except ValidationError:
+                self.cache.discard(key)
+        result = call()
+        if isinstance(result, BaseModel):
+            self._store(key, kind, result.model_dump_json())
+        return result
+
+    def _lookup(self, key: str) -> Optional[str]:
+        try:
+            return self.cache.get(key)
+        except Exception as exc:  # a broken cache must never fail the call
+            logger.warning("llm_cache_read_failed", error=str(exc))
+            return None
+
+    def _store(self, key: str, kind: str, response: str) -> None:
+        try:
+            self.cache.put(key, provider=self.identity, model=self.get_model_name(), kind=kind, response=response)
+        except Exception as exc:
+            logger.warning("llm_cache_write_failed", error=str(exc))
+
+
+def _wants_json(response_format: Optional[Dict[str, str]]) -> bool:
+    return bool(response_format) and response_format.get("type") == "json_object"
+
+
+def _parses_as_json(text: str) -> bool:
+    try:
+        json.loads(text)
+    except ValueError:
+        return False
+    return True
+
+
+def provider_identity(config, provider_type: Optional[str] = None, model: Optional[str] = None) -> str:
+    """Cache identity for a configured provider: type, model and the
+    reasoning / thinking knob that changes its output."""
+    provider_type = (provider_type or config.llm_provider).lower()
+    model = model or getattr(config, f"{provider_type}_model", "")
+    knob = {
+        "openai": getattr(config, "openai_reasoning_effort", None),
+        "gemini": getattr(config, "gemini_thinking_level", None),
+    }.get(provider_type)
+    return f"{provider_type}:{model}:{knob or ''}"
+
+
+_caches: Dict[str, LLMResponseCache] = {}
+_caches_lock = threading.Lock()
+
+
+def get_llm_response_cache(db_path: Union[str, Path], max_bytes: int) -> LLMResponseCache:
+    """The process-wide cache for ``db_path`` (opened on first use)."""
+    key = str(Path(db_path).resolve())
+    with _caches_lock:
+        cache = _caches.get(key)
+        if cache is None:
+            cache = LLMResponseCache(db_path, max_bytes=max_bytes)
+            _caches[key] = cache
+        else:
+            cache.max_bytes = max(0, max_bytes)
+        return cache
+
+
+def wrap_with_response_cache(provider: LLMProvider, config, *, provider_type: Optional[str] = None) -> LLMProvider:
+    """``provider`` behind the response cache when ``config`` enables it."""
+    if getattr(config, "llm_cache_enabled", False) is not True:
+        return provider
+    cache = get_llm_response_cache(config.llm_cache_path, config.llm_cache_max_mb * 1024 * 1024)
+    identity = provider_identity(config, provider_type=provider_type, model=provider.get_model_name())
+    return CachedLLMProvider(provider, cache, identity)
+
+
+def llm_cache_stats() -> Dict[str, Any]:
+    """Stats of every cache opened in this process, ``{}`` if none."""
+    with _caches_lock:
+        caches = list(_caches.values())
+    if not caches:
+        return {}
+    try:
+        return caches[0].stats() if len(caches) == 1 else {"caches": [c.stats() for c in caches]}
+    except Exception as exc:  # status endpoints must not fail on a locked / deleted file
+        return {"error": str(exc)}
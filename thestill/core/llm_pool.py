@@ -0,0 +1,566 @@
+# Copyright 2025-2026 Thestill
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Process-wide pool of LLM providers with rate-limited admission.
+
+``handle_clean`` and ``handle_summarize`` used to call
+``create_llm_provider_from_config`` per task: a new SDK client and HTTP
+connection pool per episode, and nothing coordinating request or token
+rate across concurrent CLEAN, SUMMARIZE, facts and narration calls. Each
+caller found out about the shared per-key limit by hitting a 429 and
+sleeping through its own retry budget.
+
+- **One provider per configuration.** ``LLMClientPool.get`` builds a
+  provider on first use and hands the same instance to every later caller
+  with the same settings, so SDK clients and their connections are reused.
+- **Admission per provider/model.** Every ``chat_completion`` /
+  ``generate_structured`` / ``generate_structured_cached`` call passes a
+  ``ProviderLimiter`` first: a concurrency cap plus requests-per-minute and
+  tokens-per-minute ``TokenBucket`` s sized from ``MODEL_CONFIGS``. A call
+  is admitted with its estimated prompt tokens and debited its output
+  afterwards; a caller that does not fit queues on a condition variable
+  instead of sending a request that would be rejected.
+- **Corrected by the provider.** For OpenAI and Anthropic an httpx response
+  hook feeds ``x-ratelimit-*`` / ``anthropic-ratelimit-*`` headers back in:
+  published limits replace the table's, ``remaining`` clamps the bucket,
+  and a 429's ``retry-after`` (or an exhausted window's reset) pauses
+  admission for everyone on that model, not just the caller that hit it.
+
+Token counts are estimated at four characters per token; the buckets run
+at ``LIMIT_HEADROOM`` of the published limits to absorb the error.
+"""
+
+from __future__ import annotations
+
+import re
+import threading
+import time
+from datetime import datetime, timezone
+from typing import Any, Callable, Dict, List, Mapping, Optional, Tuple, Type
+
+from pydantic import BaseModel
+from structlog import get_logger
+
+from .llm_provider import (
+    MODEL_CONFIGS,
+    DelegatingProvider,
+    LLMProvider,
+    ModelLimits,
+    T,
+    create_llm_provider,
+    create_llm_provider_from_config,
+    provider_kwargs_from_config,
+)
+
+logger = get_logger(__name__)
+
+# Share of the published per-minute limits the buckets hand out, leaving
+# room for estimate error and for other clients using the same API key.
+LIMIT_HEADROOM = 0.9
+CHARS_PER_TOKEN = 4
+# Pause applied on a 429 that carries no retry-after / reset hint.
+DEFAULT_THROTTLE_PAUSE_SECONDS = 5.0
+# Waits shorter than this are normal bucket pacing and not logged.
+_LOG_WAIT_SECONDS = 1.0
+
+
+class LLMAdmissionTimeout(TimeoutError):
+    """A call queued longer than the admission timeout for rate-limit room."""
+
+
+class TokenBucket:
+    """Per-minute budget refilled continuously up to ``capacity``.
+
+    ``level`` may go negative: output tokens are debited after the call,
+    and the debt delays the next admission. Not thread-safe on its own —
+    ``ProviderLimiter`` guards its buckets with its condition's lock.
+    """
+
+    def __init__(self, per_minute: float) -> None:
+        self.capacity = max(1.0, float(per_minute))
+        self.level = self.capacity
+        self._updated = time.monotonic()
+
+    def refill(self, now: float) -> None:
+        elapsed = max(0.0, now - self._updated)
+        self.level = min(self.capacity, self.level + elapsed * self.capacity / 60.0)
+        self._updated = now
+
+    def wait_for(self, amount: float, now: float) -> float:
+        """Seconds until ``amount`` fits (requests larger than the bucket
+        wait for a full bucket rather than forever)."""
+        self.refill(now)
+        need = min(amount, self.capacity) - self.level
+        return 0.0 if need <= 0 else need * 60.0 / self.capacity
+
+    def take(self, amount: float, now: float) -> None:
+        self.refill(now)
+        self.level -= amount
+
+    def clamp(self, remaining: float, now: float) -> None:
+        """Never believe we have more budget than the provider says is left."""
+        self.refill(now)
+        self.level = min(self.level, float(remaining))
+
+    def set_limit(self, per_minute: float) -> None:
+        self.capacity = max(1.0, float(per_minute))
+        self.level = min(self.level, self.capacity)
+
+
+# Response header → (bucket, field). OpenAI and Anthropic publish the same
+# three facts per window under different names.
+_RATE_LIMIT_HEADERS: Dict[str, Tuple[str, str]] = {
+    "x-ratelimit-limit-requests": ("requests", "limit"),
+    "x-ratelimit-remaining-requests": ("requests", "remaining"),
+    "x-ratelimit-reset-requests": ("requests", "reset"),
+    "x-ratelimit-limit-tokens": ("tokens", "limit"),
+    "x-ratelimit-remaining-tokens": ("tokens", "remaining"),
+    "x-ratelimit-reset-tokens": ("tokens", "reset"),
+    "anthropic-ratelimit-requests-limit": ("requests", "limit"),
+    "anthropic-ratelimit-requests-remaining": ("requests", "remaining"),
+    "anthropic-ratelimit-requests-reset": ("requests", "reset"),
+    "anthropic-ratelimit-tokens-limit": ("tokens", "limit"),
+    "anthropic-ratelimit-tokens-remaining": ("tokens", "remaining"),
+    "anthropic-ratelimit-tokens-reset": ("tokens", "reset"),
+}
+
+_DURATION_PART = re.compile(r"(\d+(?:\.\d+)?)(ms|h|m|s)")
+_DURATION_UNITS = {"ms": 0.001, "s": 1.0, "m": 60.0, "h": 3600.0}
+
+
+def _parse_reset(value: str) -> Optional[float]:
+    """Seconds until a window resets: OpenAI durations (``"6m0s"``,
+    ``"250ms"``) or Anthropic RFC 3339 timestamps."""
+    value = value.strip()
+    if "T" in value:
+        try:
+            reset_at = datetime.fromisoformat(value.replace("Z", "+00:00"))
+        except ValueError:
+            return None
+        if reset_at.tzinfo is None:
+            reset_at = reset_at.replace(tzinfo=timezone.utc)
+        return max(0.0, (reset_at - datetime.now(timezone.utc)).total_seconds())
+    parts = _DURATION_PART.findall(value)
+    if not parts:
+        try:
+            return max(0.0, float(value))
+        except ValueError:
+            return None
+    return sum(float(number) * _DURATION_UNITS[unit] for number, unit in parts)
+
+
+def parse_rate_limit_headers(headers: Mapping[str, str]) -> Dict[str, Dict[str, float]]:
+    """``{"requests"|"tokens": {"limit"|"remaining"|"reset": value}}`` plus
+    ``{"retry_after": {"seconds": s}}`` when present. Unparseable values
+    are skipped."""
+    parsed: Dict[str, Dict[str, float]] = {}
+    for name, value in headers.items():
+        lowered = name.lower()
+        if lowered == "retry-after":
+            seconds = _parse_reset(value)
+            if seconds is not None:
+                parsed.setdefault("retry_after", {})["seconds"] = seconds
+            continue
+        target = _RATE_LIMIT_HEADERS.get(lowered)
+        if target is None:
+            continue
+        kind, field = target
+        if field == "reset":
+            number = _parse_reset(value)
+        else:
+            try:
+                number = float(value)
+            except ValueError:
+                number = None
+        if number is not None:
+            parsed.setdefault(kind, {})[field] = number
+    return parsed
+
+
+def model_limits(model: str) -> Optional[ModelLimits]:
+    """``MODEL_CONFIGS`` entry for ``model``, tolerating a date suffix."""
+    if model in MODEL_CONFIGS:
+        return MODEL_CONFIGS[model]
+    return MODEL_CONFIGS.get(model.rsplit("-", 1)[0])
+
+
+def estimate_tokens(messages: List[Dict[str, Any]]) -> int:
+    """Rough prompt size: characters / ``CHARS_PER_TOKEN``."""
+    chars = sum(len(str(message.get("content") or "")) for message in messages)
+    return chars // CHARS_PER_TOKEN + 1
+
+
+def _output_tokens(result: Any) -> int:
+    if isinstance(result, BaseModel):
+        text = result.model_dump_json()
+    elif result is None:
+        return 0
+    else:
+        text = str(result)
+    return len(text) // CHARS_PER_TOKEN + 1
+
+
+class ProviderLimiter:
+    """Admission gate for one provider/model. See the module docstring."""
+
+    def __init__(
+        self,
+        name: str,
+        limits: Optional[ModelLimits] = None,
+        *,
+        max_concurrency: int = 8,
+        admission_timeout: float = 900.0,
+    ) -> None:
+        self.name = name
+        self.max_concurrency = max(0, max_concurrency)
+        self.admission_timeout = admission_timeout
+        self._requests = TokenBucket(limits.rpm * LIMIT_HEADROOM) if limits else None
+        self._tokens = TokenBucket(limits.tpm * LIMIT_HEADROOM) if limits else None
+        self._paused_until = 0.0
+        self._cond = threading.Condition()
+        self._in_flight = 0
+        self._queued = 0
+        self.admitted = 0
+        self.throttled = 0
+        self.timeouts = 0
+        self.wait_seconds_total = 0.0
+        self.wait_seconds_max = 0.0
+
+    def acquire(self, estimated_tokens: int) -> float:
+        """Block until the call fits; return the seconds spent queued.
+
+        Raises:
+            LLMAdmissionTimeout: When no room opened within ``admission_timeout``.
+        """
+        started = time.monotonic()
+        deadline = started + self.admission_timeout
+        with self._cond:
+            self._queued += 1
+            try:
+                while True:
+                    now = time.monotonic()
+                    wait = self._wait_locked(estimated_tokens, now)
+                    if wait == 0.0:
+                        break
+                    remaining = deadline - now
+                    if remaining <= 0:
+                        self.timeouts += 1
+                        raise LLMAdmissionTimeout(
+                            f"{self.name}: no rate-limit room after {self.admission_timeout:.0f}s "
+                            f"({self._in_flight} in flight, {self._queued} queued)"
+                        )
+                    self._cond.wait(remaining if wait is None else min(wait, remaining))
+            finally:
+                self._queued -= 1
+            if self._requests is not None:
+                self._requests.take(1, now)
+            if self._tokens is not None:
+                self._tokens.take(estimated_tokens, now)
+            self._in_flight += 1
+            self.admitted += 1
+            waited = now - started
+            self.wait_seconds_total += waited
+            self.wait_seconds_max = max(self.wait_seconds_max, waited)
+        if waited >= _LOG_WAIT_SECONDS:
+            logger.info("llm_admission_waited", provider=self.name, wait_seconds=round(waited, 1))
+        return waited
+
+    def release(self, output_tokens: int = 0) -> None:
+        """End an admitted call, debiting the tokens it produced."""
+        with self._cond:
+            self._in_flight -= 1
+            if self._tokens is not None and output_tokens:
+                self._tokens.take(output_tokens, time.monotonic())
+            self._cond.notify_all()
+
+    def observe_response(self, status_code: int, headers: Mapping[str, str]) -> None:
+        """Fold one HTTP response's rate-limit headers into the buckets."""
+        parsed = parse_rate_limit_headers(headers)
+        throttled = status_code == 429
+        if not parsed and not throttled:
+            return
+        with self._cond:
+            now = time.monotonic()
+            pause = 0.0
+            for kind in ("requests", "tokens"):
+                fields = parsed.get(kind)
+                if not fields:
+                    continue
+                bucket = self._requests if kind == "requests" else self._tokens
+                if "limit" in fields and fields["limit"] > 0:
+                    if bucket is None:
+                        bucket = TokenBucket(fields["limit"] * LIMIT_HEADROOM)
+                        if kind == "requests":
+                            self._requests = bucket
+                        else:
+                            self._tokens = bucket
+                    else:
+                        bucket.set_limit(fields["limit"] * LIMIT_HEADROOM)
+                if bucket is not None and "remaining" in fields:
+                    bucket.clamp(fields["remaining"], now)
+                if fields.get("remaining") == 0 and "reset" in fields:
+                    pause = max(pause, fields["reset"])
+            if throttled:
+                self.throttled += 1
+                pause = max(pause, parsed.get("retry_after", {}).get("seconds", DEFAULT_THROTTLE_PAUSE_SECONDS))
+            if pause > 0:
+                self._paused_until = max(self._paused_until, now + pause)
+            self._cond.notify_all()
+        if throttled:
+            logger.warning("llm_rate_limited", provider=self.name, pause_seconds=round(pause, 1))
+
+    def stats(self) -> Dict[str, Any]:
+        with self._cond:
+            now = time.monotonic()
+            return {
+                "in_flight": self._in_flight,
+                "max_concurrency": self.max_concurrency,
+                "queued": self._queued,
+                "admitted": self.admitted,
+                "throttled": self.throttled,
+                "timeouts": self.timeouts,
+                "wait_seconds_total": round(self.wait_seconds_total, 2),
+                "wait_seconds_max": round(self.wait_seconds_max, 2),
+                "paused_seconds": round(max(0.0, self._paused_until - now), 1),
+                "rpm_limit": int(self._requests.capacity) if self._requests else None,
+                "tpm_limit": int(self._tokens.capacity) if self._tokens else None,
+            }
+
+    def _wait_locked(self, estimated_tokens: int, now: float) -> Optional[float]:
+        """0.0 when admissible now, ``None`` when only a release can help,
+        else the seconds until the buckets / pause would allow it."""
+        if self.max_concurrency and self._in_flight >= self.max_concurrency:
+            return None
+        wait = max(0.0, self._paused_until - now)
+        if self._requests is not None:
+            wait = max(wait, self._requests.wait_for(1, now))
+        if self._tokens is not None:
+            wait = max(wait, self._tokens.wait_for(estimated_tokens, now))
+        return wait
+
+
+class RateLimitedProvider(DelegatingProvider):
+    """An ``LLMProvider`` whose request methods pass a ``ProviderLimiter``.
+
+    Metadata methods and anything else (``model``, ``client``, streaming)
+    are delegated to the wrapped provider unchanged.
+    """
+
+    def __init__(self, inner: LLMProvider, limiter: ProviderLimiter) -> None:
+        super().__init__(inner)
+        self.limiter = limiter
+
+    def _call(self, fn: Callable[..., Any], messages: List[Dict[str, str]], *args: Any, **kwargs: Any) -> Any:
+        self.limiter.acquire(estimate_tokens(messages))
+        result = None
+        try:
+            result = fn(messages, *args, **kwargs)
+            return result
+        finally:
+            self.limiter.release(_output_tokens(result))
+
+    def chat_completion(
+        self,
+        messages: List[Dict[str, str]],
+        temperature: Optional[float] = None,
+        max_tokens: Optional[int] = None,
+        response_format: Optional[Dict[str, str]] = None,
+    ) -> str:
+        return self._call(
+            super().chat_completion,
+            messages,
+            temperature=temperature,
+            max_tokens=max_tokens,
+            response_format=response_format,
+        )
+
+    def chat_completion_with_continuation(self, messages: List[Dict[str, str]], *args: Any, **kwargs: Any) -> str:
+        return self._call(self._inner.chat_completion_with_continuation, messages, *args, **kwargs)
+
+    def generate_structured(
+        self,
+        messages: List[Dict[str, str]],
+        response_model: Type[T],
+        temperature: Optional[float] = None,
+        max_tokens: Optional[int] = None,
+    ) -> T:
+        return self._call(
+            super().generate_structured,
+            messages,
+            response_model=response_model,
+            temperature=temperature,
+            max_tokens=max_tokens,
+        )
+
+    def generate_structured_cached(
+        self,
+        messages: List[Dict[str, str]],
+        response_model: Type[T],
+        *,
+        cache_system_message: bool = False,
+        temperature: Optional[float] = None,
+        max_tokens: Optional[int] = None,
+    ) -> T:
+        return self._call(
+            super().generate_structured_cached,
+            messages,
+            response_model=response_model,
+            cache_system_message=cache_system_message,
+            temperature=temperature,
+            max_tokens=max_tokens,
+        )
+
+
+def _attach_header_hook(provider: LLMProvider, limiter: ProviderLimiter) -> bool:
+    """Feed every HTTP response of the provider's SDK client to ``limiter``.
+
+    The OpenAI and Anthropic SDKs keep an ``httpx.Client`` on ``_client``;
+    its ``event_hooks`` see 429s too, including the SDK's own retries.
+    Other SDKs have no such hook and rely on ``MODEL_CONFIGS`` alone.
+    """
+    http_client = getattr(getattr(provider, "client", None), "_client", None)
+    hooks = getattr(http_client, "event_hooks", None)
+    if not isinstance(hooks, dict) or not isinstance(hooks.get("response"), list):
+        return False
+
+    def observe(response: Any) -> None:
+        try:
+            limiter.observe_response(response.status_code, response.headers)
+        except Exception:  # pragma: no cover - never break the request path
+            logger.debug("llm_rate_limit_header_parse_failed", provider=limiter.name, exc_info=True)
+
+    hooks["response"].append(observe)
+    return True
+
+
+class LLMClientPool:
+    """Registry of shared, rate-limited providers. See the module docstring."""
+
+    def __init__(
+        self,
+        *,
+        max_concurrency: int = 8,
+        admission_timeout: float = 900.0,
+        factory: Callable[..., LLMProvider] = create_llm_provider,
+    ) -> None:
+        self.max_concurrency = max_concurrency
+        self.admission_timeout = admission_timeout
+        self._factory = factory
+        self._providers: Dict[Tuple[str, Tuple[Tuple[str, Any], ...]], RateLimitedProvider] = {}
+        self._limiters: Dict[Tuple[str, str], ProviderLimiter] = {}
+        self._lock = threading.Lock()
+        self.created = 0
+        self.reused = 0
+
+    def get(self, provider_type: str, **provider_kwargs: Any) -> RateLimitedProvider:
+        """The shared provider for these settings, built on first use.
+
+        The provider is built outside the lock (it may probe a server), so
+        other settings are not held up; if two callers race on the same
+        settings the first to register wins and the other's copy is dropped.
+        Construction errors (missing API key, Ollama down) propagate and
+        nothing is cached, so the next call tries again.
+        """
+        provider_type = provider_type.lower()
+        key = (provider_type, tuple(sorted(provider_kwargs.items())))
+        with self._lock:
+            shared = self._providers.get(key)
+            if shared is not None:
+                self.reused += 1
+                return shared
+        provider = self._factory(provider_type=provider_type, **provider_kwargs)
+        with self._lock:
+            shared = self._providers.get(key)
+            if shared is not None:
+                self.reused += 1
+                return shared
+            limiter = self._limiter_for(provider_type, provider.get_model_name())
+            hooked = _attach_header_hook(provider, limiter)
+            shared = RateLimitedProvider(provider, limiter)
+            self._providers[key] = shared
+            self.created += 1
+        logger.info("llm_client_pooled", provider=limiter.name, header_feedback=hooked)
+        return shared
+
+    def limiter_for(self, provider_type: str, model: str) -> ProviderLimiter:
+        """The limiter shared by every pooled provider on this model."""
+        with self._lock:
+            return self._limiter_for(provider_type, model)
+
+    def _limiter_for(self, provider_type: str, model: str) -> ProviderLimiter:
+        key = (provider_type, model)
+        limiter = self._limiters.get(key)
+        if limiter is None:
+            limiter = ProviderLimiter(
+                f"{provider_type}:{model}",
+                model_limits(model),
+                max_concurrency=self.max_concurrency,
+                admission_timeout=self.admission_timeout,
+            )
+            self._limiters[key] = limiter
+        return limiter
+
+    def stats(self) -> Dict[str, Any]:
+        """Client reuse counters plus one row per provider/model limiter."""
+        with self._lock:
+            limiters = list(self._limiters.values())
+            clients, created, reused = len(self._providers), self.created, self.reused
+        return {
+            "clients": clients,
+            "created": created,
+            "reused": reused,
+            "providers": {limiter.name: limiter.stats() for limiter in limiters},
+        }
+
+
+_pool: Optional[LLMClientPool] = None
+_pool_lock = threading.Lock()
+
+
+def get_llm_client_pool() -> LLMClientPool:
+    """The process-wide pool, sized from ``LLM_*`` on first use."""
+    global _pool
+    if _pool is None:
+        with _pool_lock:
+            if _pool is None:
+                from ..utils.config import get_llm_admission_timeout_seconds, get_llm_max_concurrency
+
+                _pool = LLMClientPool(
+                    max_concurrency=get_llm_max_concurrency(),
+                    admission_timeout=float(get_llm_admission_timeout_seconds()),
+                )
+    return _pool
+
+
+def get_shared_llm_provider(config) -> LLMProvider:
+    """Pooled, rate-limited provider for ``config`` (see ``LLM_CLIENT_POOL``).
+
+    Drop-in for ``create_llm_provider_from_config`` in long-lived
+    processes; with the pool disabled it is exactly that. The response
+    cache (``LLM_CACHE_ENABLED``) sits in front of the limiter, so hits
+    never queue for admission.
+    """
+    from ..utils.config import is_llm_client_pool_enabled
+
+    if not is_llm_client_pool_enabled():
+        return create_llm_provider_from_config(config)
+    from .llm_cache import wrap_with_response_cache
+
+    shared = get_llm_client_pool().get(config.llm_provider, **provider_kwargs_from_config(config))
+    return wrap_with_response_cache(shared, config)
+
+
+def llm_pool_stats() -> Dict[str, Any]:
+    """Stats of the process-wide pool, ``{}`` if nothing has used it yet."""
+    return _pool.stats() if _pool is not None else {}
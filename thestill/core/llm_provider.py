@@ -2958,6 +2958,87 @@ class MistralProvider(LLMProvider):
             raise
 
 
+class DelegatingProvider(LLMProvider):
+    """Base for wrappers that add behaviour around another provider.
+
+    Every ``LLMProvider`` method forwards to ``inner``; anything else
+    (``model``, ``client``, streaming helpers) is reached through
+    ``__getattr__``. Subclasses override only the calls they intercept.
+    """
+
+    def __init__(self, inner: LLMProvider) -> None:
+        self._inner = inner
+
+    @property
+    def inner(self) -> LLMProvider:
+        return self._inner
+
+    def __getattr__(self, name: str) -> Any:
+        if name == "_inner":  # not yet set (copy / unpickle)
+            raise AttributeError(name)
+        return getattr(self._inner, name)
+
+    def chat_completion(
+        self,
+        messages: List[Dict[str, str]],
+        temperature: Optional[float] = None,
+        max_tokens: Optional[int] = None,
+        response_format: Optional[Dict[str, str]] = None,
+    ) -> str:
+        return self._inner.chat_completion(
+            messages, temperature=temperature, max_tokens=max_tokens, response_format=response_format
+        )
+
+    def generate_structured(
+        self,
+        messages: List[Dict[str, str]],
+        response_model: Type[T],
+        temperature: Optional[float] = None,
+        max_tokens: Optional[int] = None,
+    ) -> T:
+        return self._inner.generate_structured(
+            messages, response_model=response_model, temperature=temperature, max_tokens=max_tokens
+        )
+
+    def generate_structured_cached(
+        self,
+        messages: List[Dict[str, str]],
+        response_model: Type[T],
+        *,
+        cache_system_message: bool = False,
+        temperature: Optional[float] = None,
+        max_tokens: Optional[int] = None,
+    ) -> T:
+        return self._inner.generate_structured_cached(
+            messages,
+            response_model=response_model,
+            cache_system_message=cache_system_message,
+            temperature=temperature,
+            max_tokens=max_tokens,
+        )
+
+    def supports_temperature(self) -> bool:
+        return self._inner.supports_temperature()
+
+    def health_check(self) -> bool:
+        return self._inner.health_check()
+
+    def get_model_name(self) -> str:
+        return self._inner.get_model_name()
+
+    def get_model_display_name(self) -> str:
+        return self._inner.get_model_display_name()
+
+    def supports_structured_output(self) -> bool:
+        return self._inner.supports_structured_output()
+
+    def get_max_output_tokens(self) -> int:
+        return self._inner.get_max_output_tokens()
+
+    def supports_prompt_caching(self) -> bool:
+        return self._inner.supports_prompt_caching()
+
+
 def create_llm_provider(
     provider_type: str,
     openai_api_key: str = "",
@@ -3072,6 +3153,10 @@ def create_llm_provider_from_config(config) -> LLMProvider:
         config: Configuration object with LLM settings (e.g., from load_config())
 
     Returns:
-        LLMProvider instance configured according to config settings
+        LLMProvider instance configured according to config settings,
+        wrapped in the response cache when ``llm_cache_enabled`` is set
     """
-    return create_llm_provider(provider_type=config.llm_provider, **provider_kwargs_from_config(config))
+    provider = create_llm_provider(provider_type=config.llm_provider, **provider_kwargs_from_config(config))
+    from .llm_cache import wrap_with_response_cache
+
+    return wrap_with_response_cache(provider, config)
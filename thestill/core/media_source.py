@@ -32,9 +32,8 @@ import urllib.request
 from abc import ABC, abstractmethod
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import TYPE_CHECKING, Any, Dict, List, NamedTuple, Optional, Tuple
+from typing import TYPE_CHECKING, AbstractSet, Any, Dict, List, NamedTuple, Optional, Tuple
 
-import defusedxml.ElementTree as ET  # Hardened against XXE / billion-laughs attacks in untrusted RSS feeds.
 import feedparser
 import requests
 from pydantic import ValidationError
@@ -50,6 +49,7 @@ from ..utils.podcast_categories import validate_category
 from ..utils.timing import log_phase_timing
 from ..utils.url_guard import UnsafeURLError, _GuardedHTTPAdapter, validate_public_url
 from ..utils.url_patterns import APPLE_PODCAST_ID_RE, extract_apple_podcast_id, looks_like_rss
+from .feed_scanner import FeedScan, scan_feed
 from .refresh_failure import RefreshFailureKind, classify_fetch_exception
 from .youtube_downloader import YouTubeDownloader
 
@@ -91,6 +91,11 @@ class FetchAndParseResult(NamedTuple):
     304 hit, both ``content`` and ``parsed_feed`` are ``None``. Spec #60:
     ``kind``/``retry_after`` mirror :class:`FetchRSSResult`; a parse
     (bozo) failure sets ``kind=INVALID_CONTENT`` instead of ``error=None``.
+
+    ``scan`` is the single streaming pass over ``content`` (see
+    :mod:`feed_scanner`); ``parsed_feed`` covers only its new-episode
+    window. ``None`` when the body could not be scanned, in which case
+    ``parsed_feed`` covers the whole feed.
     """
 
     content: Optional[str]
@@ -102,6 +107,7 @@ class FetchAndParseResult(NamedTuple):
     error: Optional[str]
     kind: Optional[RefreshFailureKind] = None
     retry_after: Optional[datetime] = None
+    scan: Optional[FeedScan] = None
 
 
 class MediaSource(ABC):
@@ -191,8 +197,9 @@ class RSSMediaSource(MediaSource):
     Handles:
     - Standard RSS podcast feeds
     - Apple Podcasts URLs (resolved to RSS via iTunes API)
-    - Feedparser-based episode extraction
-    - Saving raw RSS content for debugging (optional)
+    - Feedparser-based episode extraction over the new-episode window
+      found by one streaming scan (:mod:`feed_scanner`)
+    - Saving raw RSS content for debugging (opt-in, ``RSS_DEBUG_DUMP_ENABLED``)
     """
 
     # Default timeout: (connect, read) in seconds.
@@ -206,7 +213,8 @@ class RSSMediaSource(MediaSource):
 
         Args:
             path_manager: Optional path manager for saving debug RSS files.
-                         If provided, raw RSS content will be saved during fetch_episodes.
+                         If provided and ``RSS_DEBUG_DUMP_ENABLED`` is set, raw
+                         RSS content is saved on every fetch.
             pool_maxsize: Max concurrent HTTP connections per host for the shared session.
         """
         self.path_manager = path_manager
@@ -267,6 +275,7 @@ class RSSMediaSource(MediaSource):
         url: str,
         rss_content: Optional[str] = None,
         parsed_feed: Optional[Any] = None,
+        scan: Optional[FeedScan] = None,
     ) -> Optional[Dict[str, Any]]:
         """
         Extract podcast metadata from RSS feed or Apple Podcasts URL.
@@ -281,6 +290,8 @@ class RSSMediaSource(MediaSource):
             url: RSS feed URL or Apple Podcasts URL
             rss_content: Optional pre-fetched RSS body. Skips HTTP fetch if set.
             parsed_feed: Optional pre-parsed feedparser result. Skips parse if set.
+            scan: Optional streaming scan of ``rss_content`` (categories and
+                ``itunes:new-feed-url`` come from it). Scanned here if omitted.
 
         Returns:
             Dictionary with 'title', 'description', 'rss_url', 'image_url', 'language',
@@ -338,8 +349,11 @@ class RSSMediaSource(MediaSource):
                 language = feed_language.split("-")[0].lower()[:2]
                 logger.debug(f"Extracted language from RSS: {feed_language} -> {language}")
 
-            # Extract categories from raw XML (feedparser doesn't handle nested categories well)
-            categories = self._extract_categories(rss_content)
+            # Categories and itunes:new-feed-url come from the raw XML scan
+            # (feedparser doesn't handle nested categories well)
+            if scan is None:
+                scan = self.scan_feed(rss_content)
+            categories = self._categories_from_scan(scan)
 
             # THES-143: Extract author (itunes:author)
             author = None
@@ -370,7 +384,7 @@ class RSSMediaSource(MediaSource):
             copyright_text = feed.get("rights") or feed.get("copyright")
 
             # THES-145: Detect feed migration (itunes:new-feed-url)
-            new_feed_url = self._extract_new_feed_url(rss_content)
+            new_feed_url = scan.new_feed_url if scan is not None else None
             if new_feed_url:
                 logger.warning(f"Feed migration detected! New URL: {new_feed_url}")
 
@@ -432,26 +446,28 @@ class RSSMediaSource(MediaSource):
         Returns:
             List of new Episode objects from the feed
         """
+        if known_external_ids is not None:
+            seen_ids = known_external_ids
+            known_count = len(known_external_ids)
+        else:
+            seen_ids = {ep.external_id for ep in existing_episodes}
+            known_count = len(existing_episodes)
+
         if parsed_feed is None:
-            # Fetch raw RSS content and optionally save for debugging
+            # Fetch raw RSS content (optionally saved for debugging)
             fetch_result = self.fetch_rss_content(url, podcast_slug)
             rss_content = fetch_result.content
             if rss_content is None:
                 logger.warning("Failed to fetch RSS feed", url=url)
                 return []
 
-            parsed_feed = self.parse_rss(rss_content, url)
+            # Only the new-episode window reaches feedparser.
+            scan = self.scan_feed(rss_content, seen_ids, url=url)
+            parsed_feed = self.parse_rss(scan.content if scan is not None else rss_content, url)
             if parsed_feed is None:
                 logger.warning("Invalid RSS feed during episode fetch", url=url)
                 return []
 
-        if known_external_ids is not None:
-            seen_ids = known_external_ids
-            known_count = len(known_external_ids)
-        else:
-            seen_ids = {ep.external_id for ep in existing_episodes}
-            known_count = len(existing_episodes)
-
         # episode_date from _parse_date is always tz-aware UTC, but older
         # rows persisted a tz-naive last_processed. Coerce to UTC so the
         # ``episode_date > last_processed`` compare below never raises
@@ -595,7 +611,7 @@ class RSSMediaSource(MediaSource):
 
         Args:
             url: RSS feed URL.
-            podcast_slug: Optional slug for debug file write.
+            podcast_slug: Optional slug for the opt-in debug file write.
             etag: Previously stored ``ETag`` header, echoed as
                 ``If-None-Match``.
             last_modified: Previously stored ``Last-Modified`` header,
@@ -658,7 +674,10 @@ class RSSMediaSource(MediaSource):
                 )
 
         if self.path_manager and podcast_slug:
-            self._save_debug_rss(podcast_slug, rss_content)
+            from ..utils.config import is_rss_debug_dump_enabled
+
+            if is_rss_debug_dump_enabled():
+                self._save_debug_rss(podcast_slug, rss_content)
 
         return FetchRSSResult(
             content=rss_content,
@@ -669,6 +688,37 @@ class RSSMediaSource(MediaSource):
             error=None,
         )
 
+    def scan_feed(
+        self,
+        rss_content: str,
+        known_external_ids: Optional[AbstractSet[str]] = None,
+        url: str = "",
+    ) -> Optional[FeedScan]:
+        """
+        One streaming pass over ``rss_content``. Emits a timed `scan` phase event.
+
+        With ``known_external_ids``, the scan's ``content`` ends the item
+        list at the first run of ``RSS_EARLY_STOP_KNOWN_RUN`` stored GUIDs
+        (see :mod:`feed_scanner`), so the feedparser pass that follows only
+        sees items that can still become new episodes.
+
+        Args:
+            rss_content: Raw RSS XML as string.
+            known_external_ids: GUIDs already stored for the podcast.
+            url: Optional feed URL, attached to the timing event for correlation.
+
+        Returns:
+            The :class:`FeedScan`, or None if the XML is malformed.
+        """
+        from ..utils.config import get_rss_early_stop_known_run
+
+        with log_phase_timing("scan", url=url, bytes=len(rss_content)) as scan_ctx:
+            scan = scan_feed(rss_content, known_external_ids, get_rss_early_stop_known_run())
+            if scan is not None:
+                scan_ctx["items"] = scan.items_total
+                scan_ctx["items_in_window"] = scan.items_in_window
+        return scan
+
     def parse_rss(self, rss_content: str, url: str = "") -> Optional[Any]:
         """
         Parse RSS content with feedparser. Emits a timed `parse` phase event.
@@ -694,6 +744,7 @@ class RSSMediaSource(MediaSource):
         podcast_slug: Optional[str] = None,
         etag: Optional[str] = None,
         last_modified: Optional[str] = None,
+        known_external_ids: Optional[AbstractSet[str]] = None,
     ) -> "FetchAndParseResult":
         """
         One-shot fetch + parse with conditional-GET support.
@@ -710,9 +761,11 @@ class RSSMediaSource(MediaSource):
             etag: Previously stored ``ETag`` header (conditional GET input).
             last_modified: Previously stored ``Last-Modified`` header
                 (conditional GET input).
+            known_external_ids: GUIDs already stored for the podcast. Only
+                the items ahead of them are handed to feedparser.
 
         Returns:
-            ``FetchAndParseResult`` — body, parsed feed, cache headers, and
+            ``FetchAndParseResult`` — body, scan, parsed feed, cache headers, and
             ``not_modified`` flag. On 304, ``content`` and ``parsed_feed``
             are both ``None`` and ``not_modified`` is ``True``. On error,
             all fields except ``error`` are ``None``/``False``.
@@ -730,7 +783,8 @@ class RSSMediaSource(MediaSource):
                 kind=fetch.kind,
                 retry_after=fetch.retry_after,
             )
-        parsed_feed = self.parse_rss(fetch.content, url)
+        scan = self.scan_feed(fetch.content, known_external_ids, url=url)
+        parsed_feed = self.parse_rss(scan.content if scan is not None else fetch.content, url)
         if parsed_feed is None:
             # Spec #60: a bozo/malformed feed is a real failure, not a silent
             # ``error=None`` success — it previously fell through to "zero new
@@ -753,6 +807,7 @@ class RSSMediaSource(MediaSource):
             last_modified=fetch.last_modified,
             not_modified=False,
             error=None,
+            scan=scan,
         )
 
     def _save_debug_rss(self, podcast_slug: str, content: str) -> None:
@@ -782,8 +837,20 @@ class RSSMediaSource(MediaSource):
         """
         Extract and validate podcast categories from raw RSS content.
 
-        Parses itunes:category tags from the channel element. Podcasts can have
-        up to two categories (primary and secondary), each with an optional subcategory.
+        Args:
+            rss_content: Raw RSS XML content
+
+        Returns:
+            See :meth:`_categories_from_scan`.
+        """
+        return self._categories_from_scan(self.scan_feed(rss_content))
+
+    def _categories_from_scan(self, scan: Optional[FeedScan]) -> Dict[str, Optional[str]]:
+        """
+        Validate the channel's itunes:category tags found by a feed scan.
+
+        Podcasts can have up to two categories (primary and secondary), each
+        with an optional subcategory.
 
         RSS structure:
         ```xml
@@ -796,7 +863,7 @@ class RSSMediaSource(MediaSource):
         ```
 
         Args:
-            rss_content: Raw RSS XML content
+            scan: Streaming scan of the feed, or None if it failed to parse.
 
         Returns:
             Dict with keys: primary_category, primary_subcategory,
@@ -809,75 +876,25 @@ class RSSMediaSource(MediaSource):
             "secondary_category": None,
             "secondary_subcategory": None,
         }
-
-        try:
-            root = ET.fromstring(rss_content)
-        except ET.ParseError as e:
-            logger.warning(f"Failed to parse RSS XML for category extraction: {e}")
-            return result
-
-        # Define iTunes namespace
-        ns = {"itunes": "http://www.itunes.com/dtds/podcast-1.0.dtd"}
-
-        # Find channel element
-        channel = root.find("channel")
-        if channel is None:
-            return result
-
-        # Find all top-level itunes:category tags in channel
-        # (not nested ones - those are subcategories)
-        categories = channel.findall("itunes:category", ns)
-        if not categories:
+        if scan is None:
             return result
 
-        # Process primary category (first itunes:category)
-        if len(categories) >= 1:
-            primary = categories[0]
-            primary_cat = primary.get("text", "")
-
+        # First itunes:category is primary, the second secondary; only the
+        # first nested tag of each counts as its subcategory.
+        for rank, (category, subcategory) in zip(("primary", "secondary"), scan.categories):
             # Decode HTML entities (e.g., "&amp;" -> "&")
-            if primary_cat:
-                primary_cat = self._decode_html_entities(primary_cat)
-
-            # Look for nested subcategory
-            primary_sub = None
-            nested = primary.find("itunes:category", ns)
-            if nested is not None:
-                primary_sub = nested.get("text", "")
-                if primary_sub:
-                    primary_sub = self._decode_html_entities(primary_sub)
-
-            # Validate against Apple taxonomy
-            validated = validate_category(primary_cat, primary_sub)
-            result["primary_category"] = validated.category
-            result["primary_subcategory"] = validated.subcategory
-
-            if validated.category:
-                logger.debug(f"Extracted primary category: {validated.category} / {validated.subcategory}")
-
-        # Process secondary category (second itunes:category)
-        if len(categories) >= 2:
-            secondary = categories[1]
-            secondary_cat = secondary.get("text", "")
-
-            if secondary_cat:
-                secondary_cat = self._decode_html_entities(secondary_cat)
-
-            # Look for nested subcategory
-            secondary_sub = None
-            nested = secondary.find("itunes:category", ns)
-            if nested is not None:
-                secondary_sub = nested.get("text", "")
-                if secondary_sub:
-                    secondary_sub = self._decode_html_entities(secondary_sub)
+            if category:
+                category = self._decode_html_entities(category)
+            if subcategory:
+                subcategory = self._decode_html_entities(subcategory)
 
             # Validate against Apple taxonomy
-            validated = validate_category(secondary_cat, secondary_sub)
-            result["secondary_category"] = validated.category
-            result["secondary_subcategory"] = validated.subcategory
+            validated = validate_category(category, subcategory)
+            result[f"{rank}_category"] = validated.category
+            result[f"{rank}_subcategory"] = validated.subcategory
 
             if validated.category:
-                logger.debug(f"Extracted secondary category: {validated.category} / {validated.subcategory}")
+                logger.debug(f"Extracted {rank} category: {validated.category} / {validated.subcategory}")
 
         return result
 
@@ -933,21 +950,8 @@ class RSSMediaSource(MediaSource):
         Returns:
             New feed URL if found, None otherwise
         """
-        try:
-            root = ET.fromstring(rss_content)
-        except ET.ParseError:
-            return None
-
-        ns = {"itunes": "http://www.itunes.com/dtds/podcast-1.0.dtd"}
-        channel = root.find("channel")
-        if channel is None:
-            return None
-
-        new_feed_url = channel.find("itunes:new-feed-url", ns)
-        if new_feed_url is not None and new_feed_url.text:
-            return new_feed_url.text.strip()
-
-        return None
+        scan = self.scan_feed(rss_content)
+        return scan.new_feed_url if scan is not None else None
 
     def _extract_rss_from_apple_url(self, url: str) -> Optional[str]:
         """
@@ -1248,31 +1252,14 @@ class RSSMediaSource(MediaSource):
                 continue
         return audio_urls
 
-    def _resolve_item_guid(self, item: Any) -> Optional[str]:
-        """Resolve an <item>'s GUID the way feedparser keys entries.
-
-        <guid> text first, atom-style <id> as fallback — shared by every
-        raw-XML extractor so their keys line up with stored episodes'
-        ``external_id``. The text is stripped: feedparser trims element
-        text before it becomes ``external_id``, so a pretty-printed
-        ``<guid>\\n  id\\n</guid>`` would otherwise never match and the
-        keyed rows (alternate enclosures, transcript links) would silently
-        drop.
-        """
-        guid_elem = item.find("guid")
-        if guid_elem is not None and guid_elem.text and guid_elem.text.strip():
-            return guid_elem.text.strip()
-        id_elem = item.find("id")
-        if id_elem is not None and id_elem.text and id_elem.text.strip():
-            return id_elem.text.strip()
-        return None
-
     def extract_transcript_links(self, rss_content: str) -> Dict[str, List[TranscriptLink]]:
         """
         Extract podcast:transcript links from raw RSS content.
 
-        Feedparser only returns the last transcript tag per entry, so we need to
-        parse the raw XML to get all transcript formats (SRT, VTT, JSON, etc.).
+        Feedparser only returns the last transcript tag per entry, so the raw
+        XML is scanned to get all transcript formats (SRT, VTT, JSON, etc.).
+        The refresh path reads them off the scan it already made
+        (``FetchAndParseResult.scan``); this is the standalone entry point.
 
         Args:
             rss_content: Raw RSS XML content
@@ -1280,64 +1267,19 @@ class RSSMediaSource(MediaSource):
         Returns:
             Dict mapping episode GUID -> list of TranscriptLink objects
         """
-        result: Dict[str, List[TranscriptLink]] = {}
-
-        try:
-            root = ET.fromstring(rss_content)
-        except ET.ParseError as e:
-            logger.warning(f"Failed to parse RSS XML for transcript extraction: {e}")
-            return result
-
-        # Define podcast namespace
-        ns = {"podcast": "https://podcastindex.org/namespace/1.0"}
-
-        # Find all items
-        for item in root.findall(".//item"):
-            episode_guid = self._resolve_item_guid(item)
-            if episode_guid is None:
-                # Skip items without identifiable GUID
-                continue
-
-            # Find all podcast:transcript tags for this item
-            transcripts = item.findall("podcast:transcript", ns)
-            if not transcripts:
-                continue
-
-            links: List[TranscriptLink] = []
-            for t in transcripts:
-                url = t.get("url")
-                mime_type = t.get("type")
-
-                if not url or not mime_type:
-                    continue
-
-                try:
-                    link = TranscriptLink(
-                        url=url,  # type: ignore[arg-type]  # Pydantic validates to HttpUrl
-                        mime_type=mime_type,
-                        language=t.get("language"),
-                        rel=t.get("rel"),
-                    )
-                    links.append(link)
-                except Exception as e:
-                    logger.debug(f"Failed to create TranscriptLink for {url}: {e}")
-                    continue
-
-            if links:
-                result[episode_guid] = links
-                logger.debug(f"Found {len(links)} transcript links for episode {episode_guid[:50]}...")
-
-        if result:
-            logger.info(f"Extracted transcript links for {len(result)} episodes")
-
-        return result
+        scan = self.scan_feed(rss_content)
+        if scan is None:
+            return {}
+        if scan.transcript_links:
+            logger.info(f"Extracted transcript links for {len(scan.transcript_links)} episodes")
+        return scan.transcript_links
 
     def extract_alternate_enclosures(self, rss_content: str) -> Dict[str, List[AlternateEnclosure]]:
         """
         Extract <podcast:alternateEnclosure> entries from raw RSS content (spec #62).
 
         Feedparser doesn't expose Podcasting 2.0 namespace tags reliably, so the
-        raw XML is parsed — same approach as :meth:`extract_transcript_links`.
+        raw XML is scanned — same approach as :meth:`extract_transcript_links`.
         Each ``<podcast:alternateEnclosure>`` element may carry multiple
         ``<podcast:source uri="…">`` children; one ``AlternateEnclosure`` is
         emitted per source URI, sharing the parent's metadata (mime type,
@@ -1349,73 +1291,12 @@ class RSSMediaSource(MediaSource):
         Returns:
             Dict mapping episode GUID -> list of AlternateEnclosure objects.
         """
-        result: Dict[str, List[AlternateEnclosure]] = {}
-
-        try:
-            root = ET.fromstring(rss_content)
-        except ET.ParseError as e:
-            logger.warning(f"Failed to parse RSS XML for alternate-enclosure extraction: {e}")
-            return result
-
-        ns = {"podcast": "https://podcastindex.org/namespace/1.0"}
-
-        for item in root.findall(".//item"):
-            episode_guid = self._resolve_item_guid(item)
-            if episode_guid is None:
-                continue
-
-            alt_elems = item.findall("podcast:alternateEnclosure", ns)
-            if not alt_elems:
-                continue
-
-            entries: List[AlternateEnclosure] = []
-            for alt in alt_elems:
-                mime_type = alt.get("type")
-                if not mime_type:
-                    continue
-
-                length_attr = alt.get("length")
-                length = int(length_attr) if length_attr and length_attr.isdigit() else None
-
-                bitrate_attr = alt.get("bitrate")
-                try:
-                    bitrate = float(bitrate_attr) if bitrate_attr else None
-                except ValueError:
-                    bitrate = None
-
-                height_attr = alt.get("height")
-                height = int(height_attr) if height_attr and height_attr.isdigit() else None
-
-                is_default = (alt.get("default") or "").strip().lower() == "true"
-
-                shared = dict(
-                    mime_type=mime_type,
-                    length=length,
-                    bitrate=bitrate,
-                    height=height,
-                    title=alt.get("title"),
-                    rel=alt.get("rel"),
-                    language=alt.get("lang"),
-                    is_default=is_default,
-                )
-
-                for src in alt.findall("podcast:source", ns):
-                    uri = src.get("uri")
-                    if not uri:
-                        continue
-                    try:
-                        entries.append(AlternateEnclosure(source_uri=uri, **shared))
-                    except Exception as e:
-                        logger.debug(f"Failed to create AlternateEnclosure for {uri}: {e}")
-                        continue
-
-            if entries:
-                result[episode_guid] = entries
-
-        if result:
-            logger.info(f"Extracted alternate-enclosure entries for {len(result)} episodes")
-
-        return result
+        scan = self.scan_feed(rss_content)
+        if scan is None:
+            return {}
+        if scan.alternate_enclosures:
+            logger.info(f"Extracted alternate-enclosure entries for {len(scan.alternate_enclosures)} episodes")
+        return scan.alternate_enclosures
 
 
 class YouTubeMediaSource(MediaSource):
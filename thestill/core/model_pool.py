@@ -0,0 +1,322 @@
+# Copyright 2025-2026 Thestill
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Process-wide pool of resident local-transcription models.
+
+``handle_transcribe`` builds a fresh transcriber per task, and each local
+transcriber used to load its weights (Whisper, WhisperX + alignment +
+pyannote, Parakeet/NeMo) inside that instance — multi-GB of I/O and
+deserialisation per episode, which dominates TRANSCRIBE wall time on CPU
+boxes. The transcribers now *lease* their models from this pool instead:
+
+- **Keyed by** ``ModelKey(provider, model, device)``; the first lease loads
+  (single-flight — concurrent slots wait for one load), later leases reuse.
+- **Shared safely.** A lease holds the model's use-lock, so two TRANSCRIBE
+  slots on the same model take turns; none of the wrapped pipelines (Whisper's
+  kv-cache hooks, NeMo's decoding config, pyannote) is documented as
+  re-entrant. Slots on *different* models (ASR vs. alignment vs. diarization)
+  still overlap.
+- **Bounded.** ``max_models`` and ``max_bytes`` (estimated from parameter
+  tensors) are enforced by evicting the least-recently-used idle model; a
+  model idle longer than ``idle_ttl_seconds`` is dropped on the next lease.
+  In-use models are never evicted — a pool over budget logs and carries on
+  rather than blocking a task.
+- **Warmable.** ``warm()`` loads without using, so the web worker can pay
+  the load cost at start-up (``MODEL_POOL_WARMUP``).
+
+``max_models=0`` disables residency: every lease loads and the model is
+dropped as soon as it is released (the old per-task behaviour).
+"""
+
+from __future__ import annotations
+
+import gc
+import sys
+import threading
+import time
+from collections import OrderedDict
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, Iterator, NamedTuple, Optional
+
+from structlog import get_logger
+
+logger = get_logger(__name__)
+
+
+class ModelKey(NamedTuple):
+    """Identity of a resident model: who loads it, which weights, where."""
+
+    provider: str
+    model: str
+    device: str
+
+
+class _Entry:
+    __slots__ = ("key", "model", "size_bytes", "last_used", "in_use", "load_lock", "use_lock")
+
+    def __init__(self, key: ModelKey) -> None:
+        self.key = key
+        self.model: Any = None
+        self.size_bytes = 0
+        self.last_used = time.monotonic()
+        self.in_use = 0
+        self.load_lock = threading.Lock()
+        self.use_lock = threading.Lock()
+
+
+def estimate_model_bytes(model: Any, _depth: int = 0) -> int:
+    """Best-effort resident size of a loaded model, 0 when unknown.
+
+    Sums ``parameters()`` / ``buffers()`` tensors for torch modules, and
+    looks one level into tuples (``load_align_model`` returns
+    ``(model, metadata)``) and wrappers exposing ``.model``. CTranslate2
+    models (faster-whisper) expose neither, so only ``max_models`` bounds them.
+    """
+    if _depth > 1:
+        return 0
+    if isinstance(model, (tuple, list)):
+        return sum(estimate_model_bytes(item, _depth + 1) for item in model)
+    total = 0
+    for attr in ("parameters", "buffers"):
+        tensors = getattr(model, attr, None)
+        if not callable(tensors):
+            continue
+        try:
+            total += sum(t.numel() * t.element_size() for t in tensors())
+        except Exception:  # pragma: no cover - exotic module types
+            return 0
+    inner = getattr(model, "model", None)
+    if total == 0 and inner is not None and inner is not model:
+        return estimate_model_bytes(inner, _depth + 1)
+    return total
+
+
+def _release_memory() -> None:
+    """Give evicted weights back: collect, then drop cached CUDA blocks."""
+    gc.collect()
+    torch = sys.modules.get("torch")  # never import torch just to evict
+    if torch is not None:
+        try:
+            if torch.cuda.is_available():
+                torch.cuda.empty_cache()
+        except Exception:  # pragma: no cover - best effort
+            pass
+
+
+class ModelPool:
+    """Thread-safe LRU registry of loaded models. See the module docstring."""
+
+    def __init__(self, max_models: int = 4, max_bytes: int = 0, idle_ttl_seconds: float = 1800.0) -> None:
+        self.max_models = max(0, max_models)
+        self.max_bytes = max(0, max_bytes)
+        self.idle_ttl_seconds = idle_ttl_seconds
+        self._entries: "OrderedDict[ModelKey, _Entry]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.load_seconds = 0.0
+
+    @contextmanager
+    def lease(self, key: ModelKey, loader: Callable[[], Any]) -> Iterator[Any]:
+        """Yield the model for ``key``, loading it with ``loader`` on a miss.
+
+        The model's use-lock is held for the duration of the ``with`` block.
+        Loader exceptions propagate; nothing is cached for a failed load.
+        """
+        self.evict_idle()
+        entry = self._checkout(key)
+        try:
+            self._ensure_loaded(entry, loader)
+            with entry.use_lock:
+                yield entry.model
+        finally:
+            self._checkin(entry)
+
+    def warm(self, key: ModelKey, loader: Callable[[], Any]) -> None:
+        """Load ``key`` into the pool now so the first task skips the load."""
+        with self.lease(key, loader):
+            pass
+
+    def evict_idle(self) -> int:
+        """Drop models unused for longer than ``idle_ttl_seconds``."""
+        if not self.idle_ttl_seconds or self.idle_ttl_seconds <= 0:
+            return 0
+        cutoff = time.monotonic() - self.idle_ttl_seconds
+        with self._lock:
+            stale = [e for e in self._entries.values() if e.in_use == 0 and e.last_used < cutoff]
+            for entry in stale:
+                self._evict_locked(entry, reason="idle")
+        if stale:
+            _release_memory()
+        return len(stale)
+
+    def clear(self) -> None:
+        """Evict every idle model (in-use models stay until released)."""
+        with self._lock:
+            for entry in [e for e in self._entries.values() if e.in_use == 0]:
+                self._evict_locked(entry, reason="clear")
+        _release_memory()
+
+    def stats(self) -> Dict[str, Any]:
+        """Counters plus one row per resident model, for status endpoints."""
+        now = time.monotonic()
+        with self._lock:
+            resident = [
+                {
+                    "provider": e.key.provider,
+                    "model": e.key.model,
+                    "device": e.key.device,
+                    "size_mb": round(e.size_bytes / (1024 * 1024), 1),
+                    "in_use": e.in_use,
+                    "idle_seconds": 0.0 if e.in_use else round(now - e.last_used, 1),
+                }
+                for e in self._entries.values()
+                if e.model is not None
+            ]
+            return {
+                "resident": resident,
+                "resident_bytes": sum(e.size_bytes for e in self._entries.values()),
+                "max_models": self.max_models,
+                "max_bytes": self.max_bytes,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "load_seconds": round(self.load_seconds, 2),
+            }
+
+    # ------------------------------------------------------------------
+    # Internals
+    # ------------------------------------------------------------------
+
+    def _checkout(self, key: ModelKey) -> _Entry:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                entry = _Entry(key)
+                self._entries[key] = entry
+            self._entries.move_to_end(key)
+            entry.in_use += 1
+            return entry
+
+    def _checkin(self, entry: _Entry) -> None:
+        with self._lock:
+            entry.in_use -= 1
+            entry.last_used = time.monotonic()
+            # Failed loads leave nothing behind; residency off drops on release.
+            drop = entry.in_use == 0 and (entry.model is None or self.max_models == 0)
+            if drop:
+                self._evict_locked(entry, reason="released")
+        if drop and self.max_models == 0:
+            _release_memory()
+
+    def _ensure_loaded(self, entry: _Entry, loader: Callable[[], Any]) -> None:
+        with entry.load_lock:
+            if entry.model is not None:
+                with self._lock:
+                    self.hits += 1
+                return
+            started = time.perf_counter()
+            model = loader()
+            elapsed = time.perf_counter() - started
+            size = estimate_model_bytes(model)
+            with self._lock:
+                entry.model = model
+                entry.size_bytes = size
+                self.misses += 1
+                self.load_seconds += elapsed
+            logger.info(
+                "model_pool_loaded",
+                provider=entry.key.provider,
+                model=entry.key.model,
+                device=entry.key.device,
+                size_mb=round(size / (1024 * 1024), 1),
+                load_seconds=round(elapsed, 2),
+            )
+        self._enforce_limits(keep=entry)
+
+    def _enforce_limits(self, keep: _Entry) -> None:
+        evicted = False
+        with self._lock:
+            while self._over_budget_locked():
+                victim = next(
+                    (e for e in self._entries.values() if e is not keep and e.in_use == 0 and e.model is not None),
+                    None,
+                )
+                if victim is None:
+                    logger.warning(
+                        "model_pool_over_budget",
+                        resident=len(self._loaded_locked()),
+                        resident_bytes=sum(e.size_bytes for e in self._entries.values()),
+                        max_models=self.max_models,
+                        max_bytes=self.max_bytes,
+                    )
+                    break
+                self._evict_locked(victim, reason="lru")
+                evicted = True
+        if evicted:
+            _release_memory()
+
+    def _loaded_locked(self) -> list:
+        return [e for e in self._entries.values() if e.model is not None]
+
+    def _over_budget_locked(self) -> bool:
+        loaded = self._loaded_locked()
+        if self.max_models and len(loaded) > self.max_models:
+            return True
+        return bool(self.max_bytes) and sum(e.size_bytes for e in loaded) > self.max_bytes
+
+    def _evict_locked(self, entry: _Entry, reason: str) -> None:
+        if self._entries.get(entry.key) is entry:
+            del self._entries[entry.key]
+        if entry.model is not None:
+            self.evictions += 1
+            logger.info(
+                "model_pool_evicted",
+                provider=entry.key.provider,
+                model=entry.key.model,
+                device=entry.key.device,
+                reason=reason,
+            )
+        entry.model = None
+        entry.size_bytes = 0
+
+
+_pool: Optional[ModelPool] = None
+_pool_lock = threading.Lock()
+
+
+def get_model_pool() -> ModelPool:
+    """The process-wide pool, sized from ``MODEL_POOL_*`` on first use."""
+    global _pool
+    if _pool is None:
+        with _pool_lock:
+            if _pool is None:
+                from ..utils.config import (
+                    get_model_pool_idle_seconds,
+                    get_model_pool_max_memory_mb,
+                    get_model_pool_max_models,
+                )
+
+                _pool = ModelPool(
+                    max_models=get_model_pool_max_models(),
+                    max_bytes=get_model_pool_max_memory_mb() * 1024 * 1024,
+                    idle_ttl_seconds=float(get_model_pool_idle_seconds()),
+                )
+    return _pool
+
+
+def model_pool_stats() -> Dict[str, Any]:
+    """Stats of the process-wide pool, ``{}`` if nothing has used it yet."""
+    return _pool.stats() if _pool is not None else {}
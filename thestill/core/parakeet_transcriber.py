@@ -23,6 +23,7 @@ a single ``(start=0, end=0)`` stub segment — see spec #18.
 """
 
 import time
+from contextlib import nullcontext
 from pathlib import Path
 from typing import Iterable, List, Optional
 
@@ -30,6 +31,8 @@ from thestill.models.transcript import Segment, Transcript, Word
 from thestill.models.transcription import TranscribeOptions
 from thestill.utils.console import ConsoleOutput
 
+from .model_pool import ModelKey, ModelPool
+from .progress import ProgressCallback
 from .transcriber import Transcriber
 
 
@@ -52,16 +55,46 @@ class ParakeetTranscriber(Transcriber):
         device: str = "auto",
         console: Optional[ConsoleOutput] = None,
         model_name: Optional[str] = None,
+        model_pool: Optional[ModelPool] = None,
+        chunk_workers: int = 1,
+        chunk_seconds: int = 300,
+        progress_callback: Optional[ProgressCallback] = None,
     ):
         self.model_name = model_name or self.DEFAULT_MODEL_NAME
         self.device = self._resolve_device(device)
         self.console = console or ConsoleOutput()
         self._model = None
+        # CPU only: >1 splits long WAVs at pauses across worker processes
+        # (see core/chunked_transcription.py).
+        self.chunk_workers = chunk_workers
+        self.chunk_seconds = chunk_seconds
+        # Receives per-chunk updates on the chunked path.
+        self.progress_callback = progress_callback
+        # When set, the NeMo model is leased from this process-wide pool and
+        # stays resident across instances.
+        self.model_pool = model_pool
 
     def load_model(self) -> None:
         if self._model is not None:
             return
+        self._model = self._load_parakeet_model()
 
+    def warm_up(self) -> None:
+        """Load the model into the pool ahead of the first transcription."""
+        if self.model_pool is not None:
+            self.model_pool.warm(self._pool_key(), self._load_parakeet_model)
+
+    def _pool_key(self) -> ModelKey:
+        return ModelKey("parakeet", self.model_name, self.device)
+
+    def _lease_model(self):
+        """Context manager yielding the model — pooled when a pool is set."""
+        if self.model_pool is not None:
+            return self.model_pool.lease(self._pool_key(), self._load_parakeet_model)
+        self.load_model()
+        return nullcontext(self._model)
+
+    def _load_parakeet_model(self):
         try:
             import nemo.collections.asr as nemo_asr  # pylint: disable=import-outside-toplevel
         except ImportError as exc:
@@ -76,8 +109,8 @@ class ParakeetTranscriber(Transcriber):
             model = nemo_asr.models.ASRModel.from_pretrained(model_name=self.model_name)
             model = model.to(self.device)
             model.eval()
-            self._model = model
             self.console.success("Model loaded successfully")
+            return model
         except Exception as exc:
             self.console.error(f"Error loading Parakeet model: {exc}")
             raise
@@ -95,21 +128,24 @@ class ParakeetTranscriber(Transcriber):
         # tag for downstream consumers (cleaning, summarisation) and
         # leave actual decoding to the model.
         try:
-            self.load_model()
-
-            self.console.info(f"Starting transcription of: {Path(audio_path).name}")
-            start_time = time.time()
-
-            audio_duration = self._get_audio_duration_minutes(audio_path)
-            self.console.info(f"Audio duration: {audio_duration:.1f} minutes")
-
-            # NeMo accepts paths directly and handles long-form audio
-            # internally for the v3 model (24-min context). The toolkit
-            # decodes audio itself, so we don't pre-load via librosa.
-            results = self._model.transcribe(
-                [audio_path],
-                timestamps=True,
-            )
+            chunked = self._transcribe_silence_chunked("parakeet", audio_path, output_path, options)
+            if chunked is not None:
+                return chunked
+
+            with self._lease_model() as model:
+                self.console.info(f"Starting transcription of: {Path(audio_path).name}")
+                start_time = time.time()
+
+                audio_duration = self._get_audio_duration_minutes(audio_path)
+                self.console.info(f"Audio duration: {audio_duration:.1f} minutes")
+
+                # NeMo accepts paths directly and handles long-form audio
+                # internally for the v3 model (24-min context). The toolkit
+                # decodes audio itself, so we don't pre-load via librosa.
+                results = model.transcribe(
+                    [audio_path],
+                    timestamps=True,
+                )
             if not results:
                 self.console.error("Parakeet returned no hypotheses")
                 return None
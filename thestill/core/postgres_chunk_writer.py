@@ -29,6 +29,8 @@ rows first. Same sanitization defense (FM-7) and same centroid materialisation
 
 from __future__ import annotations
 
+from typing import Union
+
 import numpy as np
 from structlog import get_logger
 
@@ -37,6 +39,7 @@ from ..utils.postgres_ext import connect
 from ..utils.text_sanitizer import sanitize_text
 from .chunk_writer import _segment_text
 from .embedding_model import EmbeddingModel, centroid_blob
+from .transcript_stream import StreamedTranscript
 
 logger = get_logger(__name__)
 
@@ -51,7 +54,7 @@ class PostgresChunkWriter:
     def write_episode(
         self,
         episode_id: str,
-        transcript: AnnotatedTranscript,
+        transcript: Union[AnnotatedTranscript, StreamedTranscript],
         *,
         force: bool = False,
     ) -> int:
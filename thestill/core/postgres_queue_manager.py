@@ -23,9 +23,9 @@ deliberately NOT duplicated here.
 
 Dialect/concurrency differences from the SQLite version:
 
-- **The claim** (:meth:`get_next_task`) is the canonical single-statement
-  Postgres job-queue pattern: a CTE ``SELECT ... FOR UPDATE SKIP LOCKED``
-  feeding an ``UPDATE ... RETURNING``. MVCC + row locks replace SQLite's
+- **The claim** (:meth:`claim_batch`) is the canonical Postgres job-queue
+  pattern: a ``SELECT ... FOR UPDATE SKIP LOCKED`` feeding an
+  ``UPDATE ... RETURNING`` in one transaction. MVCC + row locks replace SQLite's
   ``BEGIN IMMEDIATE`` select-then-conditional-update dance, and concurrent
   workers skip each other's in-flight claims instead of serialising.
 - **No lock-retry machinery**: there is no ``database is locked`` in Postgres;
@@ -43,13 +43,19 @@ Dialect/concurrency differences from the SQLite version:
 - ``add_feed_task``'s uniqueness guard uses a transaction-scoped advisory
   lock keyed on (podcast, stage) — the per-key equivalent of SQLite's
   ``BEGIN IMMEDIATE`` writer serialisation.
+- **Cross-process wakeups**: a trigger NOTIFYs each stage that gains a
+  ``pending`` row, and :meth:`PostgresQueueManager.listen_for_wakeups`
+  relays those into the in-process ``QueueWakeup``, so a worker claims work
+  enqueued by another process (web, scheduler, another worker) immediately
+  instead of on its next poll.
 """
 
 from __future__ import annotations
 
+import threading
 import uuid
-from datetime import timedelta
-from typing import Any, Dict, List, Optional, Sequence
+from datetime import datetime, timedelta
+from typing import Any, Callable, Dict, List, Optional, Sequence
 
 from psycopg.types.json import Jsonb
 from structlog import get_logger
@@ -60,10 +66,12 @@ from ..utils.postgres_ext import as_str, connect
 from .queue_manager import (
     _IDEMPOTENT_STAGES,
     ErrorType,
+    QueueWakeup,
     Task,
     TaskStage,
     TaskStatus,
     calculate_backoff,
+    get_queue_wakeup,
     is_feed_scoped_stage,
     stages_at_or_before,
     starting_stage_for,
@@ -71,6 +79,70 @@ from .queue_manager import (
 
 logger = get_logger(__name__)
 
+# ``claim_batch`` over-fetches candidates by this factor so that skipping
+# duplicate targets (several pending rows for one episode) still fills the
+# batch in the common case without a second round-trip.
+_CLAIM_OVERFETCH = 4
+
+# NOTIFY channel fed by ``trg_tasks_notify_pending`` (postgres_schema.py);
+# the payload is the stage value.
+QUEUE_CHANNEL = "thestill_task_queue"
+
+
+class _QueueNotifyRelay:
+    """One ``LISTEN`` connection per database per process.
+
+    Relays each NOTIFY into the database's :class:`QueueWakeup`. Reference
+    counted so every worker in the process shares the one listener. After
+    a (re)connect it wakes every stage once, covering anything enqueued
+    while it was not listening.
+    """
+
+    def __init__(self, dsn: str, wakeup: QueueWakeup, reconnect_delay_sec: float = 2.0):
+        self.dsn = dsn
+        self.wakeup = wakeup
+        self.reconnect_delay_sec = reconnect_delay_sec
+        self.users = 0
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self) -> None:
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, daemon=True, name="QueueNotifyRelay")
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout=5)
+            self._thread = None
+
+    def _run(self) -> None:
+        import psycopg
+
+        while not self._stop.is_set():
+            try:
+                # A dedicated session: LISTEN must outlive any pooled checkout.
+                with psycopg.connect(self.dsn, autocommit=True) as conn:
+                    conn.execute(f"LISTEN {QUEUE_CHANNEL}")
+                    logger.info("queue_notify_listening", channel=QUEUE_CHANNEL)
+                    self.wakeup.notify()
+                    while not self._stop.is_set():
+                        # The timeout bounds how long stop() waits on an idle channel.
+                        for notify in conn.notifies(timeout=1.0):
+                            try:
+                                stage: Optional[TaskStage] = TaskStage(notify.payload)
+                            except ValueError:
+                                stage = None
+                            self.wakeup.notify(stage)
+            except Exception as e:
+                logger.warning("queue_notify_listen_failed", error=str(e))
+                self._stop.wait(self.reconnect_delay_sec)
+
+
+_RELAYS: Dict[str, _QueueNotifyRelay] = {}
+_RELAYS_LOCK = threading.Lock()
+
 
 class PostgresQueueManager:
     """
@@ -93,8 +165,40 @@ class PostgresQueueManager:
                 table must already exist (``postgres_schema.ensure_schema``).
         """
         self.dsn = dsn
+        self.wakeup = get_queue_wakeup(dsn)
         logger.info("PostgresQueueManager initialized")
 
+    def listen_for_wakeups(self) -> Callable[[], None]:
+        """Feed NOTIFYs from every process into :attr:`wakeup`.
+
+        Starts (or joins) this process's ``LISTEN`` relay for the database
+        and returns the callable that leaves it; the relay stops with its
+        last user. The worker's stage pollers then hear about tasks other
+        processes enqueue within milliseconds, keeping the poll interval as
+        a fallback for ``retry_scheduled`` backoffs that simply elapse.
+        """
+        with _RELAYS_LOCK:
+            relay = _RELAYS.get(self.dsn)
+            if relay is None:
+                relay = _RELAYS[self.dsn] = _QueueNotifyRelay(self.dsn, self.wakeup)
+                relay.start()
+            relay.users += 1
+
+        left = threading.Event()
+
+        def _leave() -> None:
+            if left.is_set():
+                return
+            left.set()
+            with _RELAYS_LOCK:
+                relay.users -= 1
+                if relay.users > 0 or _RELAYS.get(self.dsn) is not relay:
+                    return
+                del _RELAYS[self.dsn]
+            relay.stop()
+
+        return _leave
+
     def _row_to_task(self, row: dict) -> Task:
         """Convert a dict row to a Task object.
 
@@ -178,6 +282,7 @@ class PostgresQueueManager:
                 ),
             )
 
+        self.wakeup.notify(stage)
         logger.info(f"Task queued: {task_id} - {stage.value} for episode {episode_id}")
 
         return Task(
@@ -389,6 +494,7 @@ class PostgresQueueManager:
         if not created:
             logger.debug("feed_task_coalesced", podcast_id=podcast_id, stage=stage.value)
             return None
+        self.wakeup.notify(stage)
 
         logger.info(f"Feed task queued: {task_id} - {stage.value} for podcast {podcast_id}")
         return Task(
@@ -430,12 +536,7 @@ class PostgresQueueManager:
         - Tasks with status='pending'
         - Tasks with status='retry_scheduled' where next_retry_at <= now
 
-        The claim is a single statement — the canonical Postgres job-queue
-        pattern: a CTE selects the winning row ``FOR UPDATE SKIP LOCKED`` (so
-        concurrent workers skip each other's in-flight claims instead of
-        blocking or double-claiming), and the outer UPDATE transitions it to
-        ``processing`` and returns it. MVCC makes SQLite's ``BEGIN IMMEDIATE``
-        + defensive conditional-UPDATE dance unnecessary.
+        Single-row convenience wrapper over :meth:`claim_batch`.
 
         Args:
             stage: Optionally filter to a specific stage
@@ -446,6 +547,50 @@ class PostgresQueueManager:
         Returns:
             Task if one is available, None otherwise
         """
+        claimed = self.claim_batch(
+            stage,
+            1,
+            exclude_episode_ids=exclude_episode_ids,
+            exclude_podcast_ids=exclude_podcast_ids,
+        )
+        return claimed[0] if claimed else None
+
+    def claim_batch(
+        self,
+        stage: Optional[TaskStage],
+        n: int,
+        exclude_episode_ids: Optional[set[str]] = None,
+        exclude_podcast_ids: Optional[set[str]] = None,
+    ) -> List[Task]:
+        """
+        Claim up to ``n`` runnable tasks in one transaction.
+
+        The canonical Postgres job-queue pattern: candidates are selected
+        ``FOR UPDATE SKIP LOCKED`` (so concurrent workers skip each other's
+        in-flight claims instead of blocking or double-claiming), and the
+        chosen rows are transitioned to ``processing`` with ``RETURNING``.
+        MVCC makes SQLite's ``BEGIN IMMEDIATE`` + defensive conditional-UPDATE
+        dance unnecessary.
+
+        At most one task per target (episode, or podcast for feed-scoped
+        stages) is claimed per batch, matching the SQLite implementation.
+        ``DISTINCT ON`` cannot be combined with ``FOR UPDATE``, so the
+        candidate set is over-fetched and de-duplicated client-side; the
+        locks on candidates that were not chosen are released at commit.
+
+        Args:
+            stage: Optionally filter to a specific stage (``None`` = any)
+            n: Maximum number of tasks to claim; ``n <= 0`` claims nothing
+            exclude_episode_ids: Episode IDs to skip (already being processed)
+            exclude_podcast_ids: Podcast IDs to skip — the per-podcast mutex for
+                feed-scoped (REFRESH_FEED) tasks (spec #48)
+
+        Returns:
+            The claimed tasks (status ``processing``), highest priority first.
+        """
+        if n <= 0:
+            return []
+
         conditions = ["(status = 'pending' OR (status = 'retry_scheduled' AND next_retry_at <= now()))"]
         params: list = []
 
@@ -469,29 +614,45 @@ class PostgresQueueManager:
         where = " AND ".join(conditions)
 
         with connect(self.dsn) as conn:
-            row = conn.execute(
+            candidates = conn.execute(
                 f"""
-                WITH cte AS (
-                    SELECT id FROM tasks
-                     WHERE {where}
-                     ORDER BY priority DESC, created_at ASC
-                     LIMIT 1
-                     FOR UPDATE SKIP LOCKED
-                )
-                UPDATE tasks t
-                   SET status = 'processing', started_at = now(), updated_at = now()
-                  FROM cte WHERE t.id = cte.id
-                RETURNING t.*
+                SELECT id, episode_id, podcast_id FROM tasks
+                 WHERE {where}
+                 ORDER BY priority DESC, created_at ASC
+                 LIMIT %s
+                 FOR UPDATE SKIP LOCKED
                 """,
-                params,
-            ).fetchone()
+                [*params, n * _CLAIM_OVERFETCH],
+            ).fetchall()
+            if not candidates:
+                return []
+
+            chosen: List[str] = []
+            seen_targets: set[str] = set()
+            for cand in candidates:
+                target = as_str(cand["episode_id"]) or f"podcast:{as_str(cand['podcast_id'])}"
+                if target in seen_targets:
+                    continue
+                seen_targets.add(target)
+                chosen.append(as_str(cand["id"]))
+                if len(chosen) >= n:
+                    break
 
-        if not row:
-            return None
+            rows = conn.execute(
+                """
+                UPDATE tasks
+                   SET status = 'processing', started_at = now(), updated_at = now()
+                 WHERE id = ANY(%s::uuid[])
+                RETURNING *
+                """,
+                (chosen,),
+            ).fetchall()
 
-        task = self._row_to_task(row)
-        logger.info(f"Task claimed: {task.id} - {task.stage.value} (retry #{task.retry_count})")
-        return task
+        order = {task_id: i for i, task_id in enumerate(chosen)}
+        claimed = sorted((self._row_to_task(row) for row in rows), key=lambda t: order[t.id])
+        for task in claimed:
+            logger.info(f"Task claimed: {task.id} - {task.stage.value} (retry #{task.retry_count})")
+        return claimed
 
     def complete_task(self, task_id: str, claim_started_at: Optional[str] = None) -> bool:
         """
@@ -816,7 +977,11 @@ class PostgresQueueManager:
 
             return reset
 
-    def recover_interrupted_tasks(self, excluded_stages: Optional[List[TaskStage]] = None) -> int:
+    def recover_interrupted_tasks(
+        self,
+        excluded_stages: Optional[List[TaskStage]] = None,
+        started_before: Optional[datetime] = None,
+    ) -> int:
         """
         Recover tasks left in 'processing' status by a server restart or crash.
 
@@ -837,9 +1002,14 @@ class PostgresQueueManager:
           transcribe whose remote job may still be running); excluding a stage
           overrides its idempotent auto-resume.
 
+        With ``started_before`` only tasks claimed before that instant count
+        as interrupted. A worker starting next to live peers passes the stale
+        cutoff so it never resets (or fails) tasks a peer is still running.
+
         Args:
             excluded_stages: Stages to NOT recover at all — left in
                 ``processing`` (cloud tasks that may still be running remotely).
+            started_before: Only recover tasks whose ``started_at`` is older.
 
         Returns:
             Total interrupted tasks recovered (resumed + failed).
@@ -853,6 +1023,7 @@ class PostgresQueueManager:
         # Stages we must NOT mark failed: the ones we just resumed + the
         # explicitly excluded. Everything else still in 'processing' is failed.
         skip_fail_values = resume_values + [s.value for s in excluded]
+        # A NULL cutoff matches every row, so one statement serves both modes.
 
         with connect(self.dsn) as conn:
             resumed = 0
@@ -862,8 +1033,9 @@ class PostgresQueueManager:
                     UPDATE tasks
                     SET status = 'pending', started_at = NULL, updated_at = %s
                     WHERE status = 'processing' AND stage = ANY(%s)
+                    AND (%s::timestamptz IS NULL OR started_at < %s)
                     """,
-                    (now, resume_values),
+                    (now, resume_values, started_before, started_before),
                 )
                 resumed = cursor.rowcount
 
@@ -880,8 +1052,9 @@ class PostgresQueueManager:
                         updated_at = %s
                     WHERE status = 'processing'
                     AND stage <> ALL(%s)
+                    AND (%s::timestamptz IS NULL OR started_at < %s)
                     """,
-                    (now, now, skip_fail_values),
+                    (now, now, skip_fail_values, started_before, started_before),
                 )
             else:
                 cursor = conn.execute(
@@ -893,8 +1066,9 @@ class PostgresQueueManager:
                         completed_at = %s,
                         updated_at = %s
                     WHERE status = 'processing'
+                    AND (%s::timestamptz IS NULL OR started_at < %s)
                     """,
-                    (now, now),
+                    (now, now, started_before, started_before),
                 )
             failed = cursor.rowcount
 
@@ -1213,7 +1387,9 @@ class PostgresQueueManager:
                 return None
 
         logger.info("Task moved from DLQ back to pending", task_id=task_id)
-        return self.get_task(task_id)
+        task = self.get_task(task_id)
+        self.wakeup.notify(task.stage if task else None)
+        return task
 
     def retry_dead_tasks(self, task_ids: Sequence[str]) -> List[str]:
         """Bulk variant of :meth:`retry_dead_task` — requeue many DLQ rows in a
@@ -1257,6 +1433,8 @@ class PostgresQueueManager:
             requeued = [as_str(row["id"]) for row in cursor.fetchall()]
 
         logger.info("Bulk-requeued DLQ tasks", requested=len(ids), requeued=len(requeued))
+        if requeued:
+            self.wakeup.notify()
         return requeued
 
     def find_healable_tasks(
@@ -1366,6 +1544,7 @@ class PostgresQueueManager:
             stage=healed.stage.value if healed else None,
             heal_attempts=healed.heal_attempts if healed else None,
         )
+        self.wakeup.notify(healed.stage if healed else None)
         return healed
 
     def cancel_retry(self, task_id: str) -> Optional[Task]:
@@ -0,0 +1,288 @@
+# Copyright 2025-2026 Thestill
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Cross-process transport for task progress.
+
+:class:`~thestill.core.progress_store.ProgressStore` keeps progress and its
+SSE subscribers in memory, which only works while the ``TaskWorker`` runs
+inside the web process. A :class:`ProgressBus` carries each published
+update to the stores of *other* processes:
+
+- :class:`InMemoryProgressBus` — nothing leaves the process (the historical
+  behaviour, and the default).
+- :class:`SqliteProgressBus` — an append-only ``task_progress_events`` table
+  in a side file next to the podcast database (progress writes never queue
+  behind the task-claim writer). Each process runs one poller that tails
+  the table by ``seq``.
+- :class:`PostgresProgressBus` — latest progress per task in the UNLOGGED
+  ``task_progress`` table, live updates over ``LISTEN``/``NOTIFY``.
+
+Each process subscribes exactly once (:meth:`ProgressBus.start`); the store
+then fans the update out to however many SSE clients are watching. Updates
+carry the publishing store's ``origin`` so a process never re-delivers its
+own progress.
+
+Selected with ``PROGRESS_BUS`` (``memory`` | ``database``); ``database``
+follows the repository backend (``DATABASE_URL`` set → Postgres).
+"""
+
+from __future__ import annotations
+
+import itertools
+import json
+import threading
+import time
+from abc import ABC, abstractmethod
+from pathlib import Path
+from typing import TYPE_CHECKING, Callable, Optional, Union
+
+from structlog import get_logger
+
+from ..utils.sqlite_ext import connect
+from .progress_store import TaskProgress
+
+if TYPE_CHECKING:
+    from ..utils.config import Config
+
+logger = get_logger(__name__)
+
+# Receives (task_id, progress) for updates published by another process.
+DeliverFn = Callable[[str, TaskProgress], None]
+
+PROGRESS_CHANNEL = "thestill_task_progress"
+
+_SQLITE_SCHEMA = """
+CREATE TABLE IF NOT EXISTS task_progress_events (
+    seq INTEGER PRIMARY KEY AUTOINCREMENT,
+    task_id TEXT NOT NULL,
+    origin TEXT NOT NULL,
+    payload TEXT NOT NULL,
+    created_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_task_progress_events_task ON task_progress_events(task_id, seq);
+"""
+
+
+class ProgressBus(ABC):
+    """Publish/subscribe transport behind a :class:`ProgressStore`."""
+
+    @abstractmethod
+    def publish(self, task_id: str, progress: TaskProgress, origin: str) -> None:
+        """Make ``progress`` visible to every other process's store."""
+
+    @abstractmethod
+    def latest(self, task_id: str) -> Optional[TaskProgress]:
+        """Most recent progress published for ``task_id`` by any process."""
+
+    @abstractmethod
+    def clear(self, task_id: str) -> None:
+        """Forget ``task_id`` once its final update has been delivered."""
+
+    def start(self, deliver: DeliverFn, origin: str) -> None:
+        """Begin delivering other processes' updates to ``deliver``."""
+
+    def stop(self) -> None:
+        """Stop the listener started by :meth:`start`."""
+
+
+class InMemoryProgressBus(ProgressBus):
+    """Single-process bus: the store's own memory is the only subscriber."""
+
+    def publish(self, task_id: str, progress: TaskProgress, origin: str) -> None:
+        pass
+
+    def latest(self, task_id: str) -> Optional[TaskProgress]:
+        return None
+
+    def clear(self, task_id: str) -> None:
+        pass
+
+
+class _ListenerThread(ABC):
+    """Daemon-thread lifecycle shared by the database-backed buses."""
+
+    name = "ProgressBusListener"
+
+    def __init__(self) -> None:
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self, deliver: DeliverFn, origin: str) -> None:
+        if self._thread and self._thread.is_alive():
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, args=(deliver, origin), daemon=True, name=self.name)
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._stop.set()
+        if self._thread:
+            self._thread.join(timeout=5)
+            self._thread = None
+
+    @abstractmethod
+    def _run(self, deliver: DeliverFn, origin: str) -> None:
+        """Thread body: deliver other processes' events until ``_stop`` is set."""
+
+
+class SqliteProgressBus(_ListenerThread, ProgressBus):
+    """Progress events in a SQLite table, tailed by one poller per process.
+
+    Events older than ``retention_sec`` are pruned as new ones are written,
+    so the table stays a short rolling window.
+    """
+
+    name = "SqliteProgressBus"
+
+    def __init__(
+        self, db_path: Union[str, Path], *, poll_interval_sec: float = 0.25, retention_sec: float = 3600.0
+    ) -> None:
+        super().__init__()
+        self.db_path = Path(db_path)
+        self.poll_interval_sec = poll_interval_sec
+        self.retention_sec = retention_sec
+        # ``next`` on a count is atomic; ``+= 1`` from request threads is not.
+        self._publishes = itertools.count(1)
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        with connect(self.db_path) as conn:
+            conn.executescript(_SQLITE_SCHEMA)
+
+    def publish(self, task_id: str, progress: TaskProgress, origin: str) -> None:
+        now = time.time()
+        with connect(self.db_path) as conn:
+            conn.execute(
+                "INSERT INTO task_progress_events (task_id, origin, payload, created_at) VALUES (?, ?, ?, ?)",
+                (task_id, origin, json.dumps(progress.to_dict()), now),
+            )
+            if next(self._publishes) % 100 == 0:
+                conn.execute("DELETE FROM task_progress_events WHERE created_at < ?", (now - self.retention_sec,))
+
+    def latest(self, task_id: str) -> Optional[TaskProgress]:
+        with connect(self.db_path) as conn:
+            row = conn.execute(
+                "SELECT payload FROM task_progress_events WHERE task_id = ? ORDER BY seq DESC LIMIT 1", (task_id,)
+            ).fetchone()
+        return TaskProgress.from_dict(json.loads(row["payload"])) if row else None
+
+    def clear(self, task_id: str) -> None:
+        with connect(self.db_path) as conn:
+            conn.execute("DELETE FROM task_progress_events WHERE task_id = ?", (task_id,))
+
+    def _run(self, deliver: DeliverFn, origin: str) -> None:
+        # Start at the current tail: history is served by ``latest``.
+        with connect(self.db_path) as conn:
+            cursor = conn.execute("SELECT COALESCE(MAX(seq), 0) FROM task_progress_events").fetchone()[0]
+        while not self._stop.wait(self.poll_interval_sec):
+            try:
+                with connect(self.db_path) as conn:
+                    rows = conn.execute(
+                        "SELECT seq, task_id, origin, payload FROM task_progress_events WHERE seq > ? ORDER BY seq",
+                        (cursor,),
+                    ).fetchall()
+            except Exception as e:
+                logger.warning("progress_bus_poll_failed", error=str(e))
+                continue
+            for row in rows:
+                cursor = row["seq"]
+                if row["origin"] == origin:
+                    continue
+                try:
+                    deliver(row["task_id"], TaskProgress.from_dict(json.loads(row["payload"])))
+                except Exception as e:
+                    # One bad event or subscriber must not stop the poller
+                    # for every listener in the process.
+                    logger.warning("progress_bus_deliver_failed", task_id=row["task_id"], error=str(e))
+
+
+class PostgresProgressBus(_ListenerThread, ProgressBus):
+    """Latest progress in ``task_progress``; live updates over ``NOTIFY``.
+
+    The upsert and the ``pg_notify`` share a transaction, so a listener
+    never hears about progress that ``latest`` cannot yet see. The table is
+    owned by ``repositories/postgres_schema.py``.
+    """
+
+    name = "PostgresProgressBus"
+
+    def __init__(self, dsn: str, *, reconnect_delay_sec: float = 2.0) -> None:
+        super().__init__()
+        self.dsn = dsn
+        self.reconnect_delay_sec = reconnect_delay_sec
+
+    def publish(self, task_id: str, progress: TaskProgress, origin: str) -> None:
+        from psycopg.types.json import Jsonb
+
+        from ..utils.postgres_ext import connect as pg_connect
+
+        payload = progress.to_dict()
+        with pg_connect(self.dsn) as conn:
+            conn.execute(
+                "INSERT INTO task_progress (task_id, origin, payload, updated_at) VALUES (%s, %s, %s, now()) "
+                "ON CONFLICT (task_id) DO UPDATE SET origin = EXCLUDED.origin, payload = EXCLUDED.payload, "
+                "updated_at = EXCLUDED.updated_at",
+                (task_id, origin, Jsonb(payload)),
+            )
+            conn.execute(
+                "SELECT pg_notify(%s, %s)",
+                (PROGRESS_CHANNEL, json.dumps({"task_id": task_id, "origin": origin, "progress": payload})),
+            )
+
+    def latest(self, task_id: str) -> Optional[TaskProgress]:
+        from ..utils.postgres_ext import connect as pg_connect
+
+        with pg_connect(self.dsn) as conn:
+            row = conn.execute("SELECT payload FROM task_progress WHERE task_id = %s", (task_id,)).fetchone()
+        return TaskProgress.from_dict(row["payload"]) if row else None
+
+    def clear(self, task_id: str) -> None:
+        from ..utils.postgres_ext import connect as pg_connect
+
+        with pg_connect(self.dsn) as conn:
+            conn.execute("DELETE FROM task_progress WHERE task_id = %s", (task_id,))
+
+    def _run(self, deliver: DeliverFn, origin: str) -> None:
+        import psycopg
+
+        while not self._stop.is_set():
+            try:
+                with psycopg.connect(self.dsn, autocommit=True) as conn:
+                    conn.execute(f"LISTEN {PROGRESS_CHANNEL}")
+                    logger.info("progress_bus_listening", channel=PROGRESS_CHANNEL)
+                    while not self._stop.is_set():
+                        # The timeout bounds how long stop() waits on an idle channel.
+                        for notify in conn.notifies(timeout=1.0):
+                            try:
+                                message = json.loads(notify.payload)
+                                if message["origin"] != origin:
+                                    deliver(message["task_id"], TaskProgress.from_dict(message["progress"]))
+                            except Exception as e:
+                                # Keep listening: dropping the connection over
+                                # one event would lose the ones behind it.
+                                logger.warning("progress_bus_deliver_failed", error=str(e))
+            except Exception as e:
+                logger.warning("progress_bus_listen_failed", error=str(e))
+                self._stop.wait(self.reconnect_delay_sec)
+
+
+def progress_bus_from_config(config: "Config") -> ProgressBus:
+    """Build the bus selected by ``PROGRESS_BUS`` for this deployment."""
+    if config.progress_bus != "database":
+        return InMemoryProgressBus()
+
+    from ..repositories.factory import uses_postgres
+
+    if uses_postgres(config):
+        return PostgresProgressBus(config.database_url)
+    return SqliteProgressBus(Path(config.database_path).parent / "task_progress.db")
@@ -16,21 +16,31 @@
 In-memory progress store with pub/sub support.
 
 This module provides a thread-safe store for task progress with
-async subscription support for SSE streaming.
+async subscription support for SSE streaming. Updates published by
+workers in other processes arrive through a pluggable
+:class:`~thestill.core.progress_bus.ProgressBus`.
 """
 
 import asyncio
 import threading
+import time
+import uuid
 from collections import defaultdict
-from dataclasses import dataclass, field
-from typing import Dict, List, Optional
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Dict, List, Optional, Tuple
 
 from structlog import get_logger
 
 from .progress import ProgressUpdate, TranscriptionStage
 
+if TYPE_CHECKING:
+    from .progress_bus import ProgressBus
+
 logger = get_logger(__name__)
 
+# Stages that end a task's progress stream; never held back by the throttle.
+TERMINAL_STAGES = (TranscriptionStage.COMPLETED.value, TranscriptionStage.FAILED.value)
+
 
 @dataclass
 class TaskProgress:
@@ -55,6 +65,16 @@ class TaskProgress:
             "estimated_remaining_seconds": self.estimated_remaining_seconds,
         }
 
+    @classmethod
+    def from_dict(cls, data: dict) -> "TaskProgress":
+        """Inverse of :meth:`to_dict` (progress bus payloads)."""
+        return cls(
+            stage=data.get("stage", TranscriptionStage.PENDING.value),
+            progress_pct=int(data.get("progress_pct") or 0),
+            message=data.get("message") or "",
+            estimated_remaining_seconds=data.get("estimated_remaining_seconds"),
+        )
+
 
 class ProgressStore:
     """
@@ -64,6 +84,18 @@ class ProgressStore:
     to update progress, while async SSE handlers can subscribe to
     receive real-time updates.
 
+    Publishing is throttled per task: an update is passed on immediately
+    when its stage changes, when it is terminal, or when
+    ``min_interval_sec`` has passed since the last one; otherwise it
+    replaces any held update and a timer flushes the newest one at the end
+    of the interval. Fast transcription callbacks therefore reach
+    subscribers (and the bus) at most a few times a second, and the final
+    value of every stage is never lost.
+
+    With a database-backed ``bus`` the store also receives progress
+    published by workers in other processes: one listener per process,
+    fanned out to every subscribed SSE queue.
+
     Usage:
         store = ProgressStore()
 
@@ -80,33 +112,113 @@ class ProgressStore:
             store.unsubscribe("task-123", queue)
     """
 
-    def __init__(self):
-        """Initialize the progress store."""
+    def __init__(self, bus: Optional["ProgressBus"] = None, *, min_interval_sec: float = 0.0):
+        """Initialize the progress store.
+
+        Args:
+            bus: Cross-process transport (default: in-memory only)
+            min_interval_sec: Per-task publish throttle; 0 passes every update
+        """
+        from .progress_bus import InMemoryProgressBus
+
+        self._bus = bus or InMemoryProgressBus()
+        self._origin = uuid.uuid4().hex
+        self.min_interval_sec = max(0.0, min_interval_sec)
         self._progress: Dict[str, TaskProgress] = {}
         self._subscribers: Dict[str, List[asyncio.Queue]] = defaultdict(list)
         self._lock = threading.Lock()
         self._loop: Optional[asyncio.AbstractEventLoop] = None
+        # Throttle state: (stage, monotonic time) of the last publish, the
+        # newest held-back update, and its pending flush timer.
+        self._published: Dict[str, Tuple[str, float]] = {}
+        self._held: Dict[str, TaskProgress] = {}
+        self._flush_timers: Dict[str, threading.Timer] = {}
 
     def set_event_loop(self, loop: asyncio.AbstractEventLoop) -> None:
         """
         Set the event loop for cross-thread async queue operations.
 
         This should be called from the main async context (e.g., app startup).
+        It also starts the bus listener, since this is the process serving
+        subscribers.
         """
         self._loop = loop
+        self._bus.start(self._deliver_remote, self._origin)
+
+    def close(self) -> None:
+        """Stop the bus listener and drop pending flush timers."""
+        with self._lock:
+            timers = list(self._flush_timers.values())
+            self._flush_timers.clear()
+        for timer in timers:
+            timer.cancel()
+        self._bus.stop()
 
     def update(self, task_id: str, progress: TaskProgress) -> None:
         """
         Update progress for a task and notify subscribers.
 
         This method is thread-safe and can be called from the worker thread.
+        Updates inside the throttle interval are coalesced (see class docs).
 
         Args:
             task_id: ID of the task
             progress: Current progress state
         """
+        now = time.monotonic()
+        with self._lock:
+            last = self._published.get(task_id)
+            due = (
+                last is None
+                or last[0] != progress.stage
+                or progress.stage in TERMINAL_STAGES
+                or now - last[1] >= self.min_interval_sec
+            )
+            if not due:
+                self._held[task_id] = progress
+                if task_id not in self._flush_timers:
+                    timer = threading.Timer(last[1] + self.min_interval_sec - now, self._flush, args=(task_id,))
+                    timer.daemon = True
+                    self._flush_timers[task_id] = timer
+                    timer.start()
+                return
+            self._held.pop(task_id, None)
+            timer = self._flush_timers.pop(task_id, None)
+            self._published[task_id] = (progress.stage, now)
+        if timer:
+            timer.cancel()
+        self._publish(task_id, progress)
+
+    def _flush(self, task_id: str) -> None:
+        """Publish the newest held-back update once its interval has passed."""
+        with self._lock:
+            self._flush_timers.pop(task_id, None)
+            progress = self._held.pop(task_id, None)
+            if progress is None:
+                return
+            self._published[task_id] = (progress.stage, time.monotonic())
+        self._publish(task_id, progress)
+
+    def _publish(self, task_id: str, progress: TaskProgress) -> None:
+        self._deliver(task_id, progress)
+        try:
+            self._bus.publish(task_id, progress, self._origin)
+        except Exception as e:
+            logger.warning("progress_bus_publish_failed", task_id=task_id, error=str(e))
+
+    def _deliver_remote(self, task_id: str, progress: TaskProgress) -> None:
+        """Bus listener callback: fan another process's update out locally.
+
+        Not remembered in ``_progress`` — that map only tracks this
+        process's tasks; :meth:`get` reads remote state from the bus.
+        """
+        self._deliver(task_id, progress, remember=False)
+
+    def _deliver(self, task_id: str, progress: TaskProgress, remember: bool = True) -> None:
+        """Record ``progress`` and push it to this process's subscribers."""
         with self._lock:
-            self._progress[task_id] = progress
+            if remember:
+                self._progress[task_id] = progress
             subscribers = list(self._subscribers.get(task_id, []))
 
         # Log at INFO level during diarizing stage for debugging, DEBUG for others
@@ -170,7 +282,15 @@ class ProgressStore:
             Current progress or None if not found
         """
         with self._lock:
-            return self._progress.get(task_id)
+            progress = self._progress.get(task_id)
+        return progress if progress is not None else self._bus_latest(task_id)
+
+    def _bus_latest(self, task_id: str) -> Optional[TaskProgress]:
+        try:
+            return self._bus.latest(task_id)
+        except Exception as e:
+            logger.warning("progress_bus_read_failed", task_id=task_id, error=str(e))
+            return None
 
     def subscribe(self, task_id: str) -> asyncio.Queue:
         """
@@ -188,14 +308,17 @@ class ProgressStore:
         queue: asyncio.Queue = asyncio.Queue(maxsize=50)
         with self._lock:
             self._subscribers[task_id].append(queue)
-
-            # Send current progress immediately if available
             current = self._progress.get(task_id)
-            if current:
-                try:
-                    queue.put_nowait(current)
-                except asyncio.QueueFull:
-                    pass
+
+        # Send current progress immediately if available (from the bus when
+        # the task runs in another process)
+        if current is None:
+            current = self._bus_latest(task_id)
+        if current:
+            try:
+                queue.put_nowait(current)
+            except asyncio.QueueFull:
+                pass
 
         logger.debug(f"Subscriber added for task {task_id}")
         return queue
@@ -226,6 +349,15 @@ class ProgressStore:
         with self._lock:
             self._progress.pop(task_id, None)
             self._subscribers.pop(task_id, None)
+            self._published.pop(task_id, None)
+            self._held.pop(task_id, None)
+            timer = self._flush_timers.pop(task_id, None)
+        if timer:
+            timer.cancel()
+        try:
+            self._bus.clear(task_id)
+        except Exception as e:
+            logger.warning("progress_bus_clear_failed", task_id=task_id, error=str(e))
         logger.debug(f"Cleaned up progress for task {task_id}")
 
     def get_all_active(self) -> Dict[str, TaskProgress]:
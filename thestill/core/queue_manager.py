@@ -40,6 +40,7 @@ Usage:
 import json
 import random
 import sqlite3
+import threading
 import time
 import uuid
 from contextlib import contextmanager
@@ -426,11 +427,84 @@ def calculate_backoff(retry_count: int) -> timedelta:
     return timedelta(seconds=delay * jitter)
 
 
+class QueueWakeup:
+    """In-process fan-out of "a task just became claimable" signals.
+
+    The worker's stage pollers used to discover new work only on their next
+    ``poll_interval`` tick, so every hop of the pipeline (download → downsample
+    → … → summarize) paid up to a full interval of dead time. Enqueue paths now
+    call :meth:`notify` with the stage they made runnable and every subscriber
+    (in practice one ``TaskWorker`` per process) wakes that stage's poller
+    immediately. Polling stays as the fallback for work this process cannot
+    see being enqueued — other processes, and ``retry_scheduled`` rows whose
+    backoff simply elapses.
+
+    Listeners are invoked synchronously on the notifying thread and must be
+    cheap and non-blocking (the worker's listener is a
+    ``loop.call_soon_threadsafe``). A raising listener is logged and skipped
+    so a broken subscriber can never fail an enqueue.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._listeners: List[Callable[[Optional[TaskStage]], None]] = []
+
+    def subscribe(self, listener: Callable[[Optional[TaskStage]], None]) -> Callable[[], None]:
+        """Register ``listener`` and return a callable that unsubscribes it.
+
+        The listener receives the stage that became claimable, or ``None``
+        when the notifier cannot name one (wake every stage).
+        """
+        with self._lock:
+            self._listeners.append(listener)
+
+        def _unsubscribe() -> None:
+            with self._lock:
+                try:
+                    self._listeners.remove(listener)
+                except ValueError:
+                    pass
+
+        return _unsubscribe
+
+    def notify(self, stage: Optional[TaskStage] = None) -> None:
+        """Tell every subscriber that ``stage`` (or any stage) has new work."""
+        with self._lock:
+            listeners = list(self._listeners)
+        for listener in listeners:
+            try:
+                listener(stage)
+            except Exception as e:
+                logger.warning("queue_wakeup_listener_error", stage=stage.value if stage else None, error=str(e))
+
+
+_WAKEUPS: Dict[str, QueueWakeup] = {}
+_WAKEUPS_LOCK = threading.Lock()
+
+
+def get_queue_wakeup(key: str) -> QueueWakeup:
+    """Return the process-wide :class:`QueueWakeup` for one queue database.
+
+    Keyed by database identity (resolved SQLite path or Postgres DSN) rather
+    than by manager instance: the web layer, services and the worker each
+    construct their own ``QueueManager`` against the same database, and an
+    enqueue through any of them must wake the worker's pollers.
+    """
+    with _WAKEUPS_LOCK:
+        wakeup = _WAKEUPS.get(key)
+        if wakeup is None:
+            wakeup = QueueWakeup()
+            _WAKEUPS[key] = wakeup
+        return wakeup
+
+
 class QueueManager:
     """
     SQLite-based task queue with abstracted interface.
 
-    Thread-safety: Uses per-operation connections with atomic transactions.
+    Thread-safety: Uses pooled per-thread connections (plus one serialized
+    writer connection for ``BEGIN IMMEDIATE`` sections) with atomic
+    transactions.
     Designed for easy migration to Redis/SQS by maintaining same interface.
     """
 
@@ -445,6 +519,7 @@ class QueueManager:
             db_path: Path to SQLite database file (shared with podcast repository)
         """
         self.db_path = Path(db_path)
+        self.wakeup = get_queue_wakeup(str(self.db_path.resolve()))
         self._ensure_table()
         logger.info(f"QueueManager initialized: {self.db_path}")
 
@@ -490,9 +565,23 @@ class QueueManager:
           workers competing for the next task this is the difference
           between "graceful serialisation" and "spurious crashes".
         """
-        from ..utils.sqlite_ext import connect
+        from ..utils.sqlite_ext import pooled_connect
+
+        with pooled_connect(self.db_path, load_vec="soft") as conn:
+            yield conn
+
+    @contextmanager
+    def _get_write_connection(self):
+        """The process-wide serialized writer connection for this database.
+
+        Used for the explicit ``BEGIN IMMEDIATE`` sections (claim, feed-task
+        uniqueness guard): threads of this process queue on the pool's writer
+        lock instead of each spinning in SQLite's busy handler, while other
+        processes still serialise at the database lock via ``busy_timeout``.
+        """
+        from ..utils.sqlite_ext import pooled_writer
 
-        with connect(self.db_path, load_vec="soft") as conn:
+        with pooled_writer(self.db_path, load_vec="soft") as conn:
             yield conn
 
     # Spec #28 §0.5 — the canonical CHECK clause for ``tasks.stage``.
@@ -824,6 +913,7 @@ class QueueManager:
                 )
 
         self._exec_with_lock_retry("add_task", _write)
+        self.wakeup.notify(stage)
 
         logger.info(f"Task queued: {task_id} - {stage.value} for episode {episode_id}")
 
@@ -992,7 +1082,7 @@ class QueueManager:
         created: list[bool] = [False]
 
         def _write() -> None:
-            with self._get_connection() as conn:
+            with self._get_write_connection() as conn:
                 conn.execute("BEGIN IMMEDIATE")
                 try:
                     # Uniqueness guard inside the write txn so two schedulers
@@ -1036,6 +1126,7 @@ class QueueManager:
         if not created[0]:
             logger.debug("feed_task_coalesced", podcast_id=podcast_id, stage=stage.value)
             return None
+        self.wakeup.notify(stage)
 
         logger.info(f"Feed task queued: {task_id} - {stage.value} for podcast {podcast_id}")
         return Task(
@@ -1077,6 +1168,8 @@ class QueueManager:
         - Tasks with status='pending'
         - Tasks with status='retry_scheduled' where next_retry_at <= now
 
+        Single-row convenience wrapper over :meth:`claim_batch`.
+
         Args:
             stage: Optionally filter to a specific stage
             exclude_episode_ids: Episode IDs to skip (already being processed)
@@ -1086,95 +1179,154 @@ class QueueManager:
         Returns:
             Task if one is available, None otherwise
         """
+        claimed = self.claim_batch(
+            stage,
+            1,
+            exclude_episode_ids=exclude_episode_ids,
+            exclude_podcast_ids=exclude_podcast_ids,
+        )
+        return claimed[0] if claimed else None
+
+    def claim_batch(
+        self,
+        stage: Optional[TaskStage],
+        n: int,
+        exclude_episode_ids: Optional[set[str]] = None,
+        exclude_podcast_ids: Optional[set[str]] = None,
+    ) -> List[Task]:
+        """
+        Claim up to ``n`` runnable tasks in ONE write transaction.
+
+        The worker used to call :meth:`get_next_task` once per free slot, and
+        every call took ``BEGIN IMMEDIATE`` — the database-wide writer lock —
+        even when the queue was empty. With ten stage pollers ticking every
+        ``poll_interval`` that idle churn contended with the real writers
+        (reindex, cooccurrence rebuilds, bookkeeping). Two changes here:
+
+        - **Read probe first.** A plain WAL read (no writer lock) checks for a
+          claimable row; an empty queue returns ``[]`` without ever taking
+          ``BEGIN IMMEDIATE``. Idle polling is therefore write-free.
+        - **Batch claim.** When there is work, one transaction selects and
+          marks up to ``n`` rows, instead of ``n`` separate transactions.
+
+        At most one task per target is returned: two rows for the same episode
+        (or the same podcast, for feed-scoped stages) are never claimed in one
+        batch, preserving the worker's one-task-per-target invariant. Extra
+        rows for a target are left pending for a later poll.
+
+        Args:
+            stage: Optionally filter to a specific stage (``None`` = any)
+            n: Maximum number of tasks to claim; ``n <= 0`` claims nothing
+            exclude_episode_ids: Episode IDs to skip (already being processed)
+            exclude_podcast_ids: Podcast IDs to skip — the per-podcast mutex for
+                feed-scoped (REFRESH_FEED) tasks (spec #48)
+
+        Returns:
+            The claimed tasks (status ``processing``), highest priority first.
+        """
+        if n <= 0:
+            return []
+
+        now = now_utc().isoformat()
+
+        # Build query with optional filters
+        conditions = ["(status = 'pending' OR (status = 'retry_scheduled' AND next_retry_at <= ?))"]
+        params: list = [now]
+
+        if stage:
+            conditions.append("stage = ?")
+            params.append(stage.value)
+
+        if exclude_episode_ids:
+            placeholders = ",".join("?" for _ in exclude_episode_ids)
+            # Spec #48 — guard the NULL: a feed task has episode_id NULL,
+            # and ``NULL NOT IN (…)`` is NULL (not TRUE) in SQLite, which
+            # would wrongly filter every REFRESH_FEED row out whenever any
+            # episode task is active. The ``IS NULL`` arm keeps feed tasks
+            # claimable through the episode-exclusion filter.
+            conditions.append(f"(episode_id IS NULL OR episode_id NOT IN ({placeholders}))")
+            params.extend(exclude_episode_ids)
+
+        if exclude_podcast_ids:
+            placeholders = ",".join("?" for _ in exclude_podcast_ids)
+            conditions.append(f"(podcast_id IS NULL OR podcast_id NOT IN ({placeholders}))")
+            params.extend(exclude_podcast_ids)
+
+        where = " AND ".join(conditions)
+
         with self._get_connection() as conn:
-            now = now_utc().isoformat()
+            # Cheap lock-free probe. A row that appears between this read and
+            # the write transaction below is picked up on the next poll (or
+            # sooner, via the enqueue wakeup) — never lost.
+            if conn.execute(f"SELECT 1 FROM tasks WHERE {where} LIMIT 1", params).fetchone() is None:
+                return []
 
+        with self._get_write_connection() as conn:
             # SQLite doesn't have UPDATE...RETURNING, so we use a transaction
             # with immediate locking to prevent race conditions
             conn.execute("BEGIN IMMEDIATE")
 
             try:
-                # Build query with optional filters
-                conditions = ["(status = 'pending' OR (status = 'retry_scheduled' AND next_retry_at <= ?))"]
-                params: list = [now]
-
-                if stage:
-                    conditions.append("stage = ?")
-                    params.append(stage.value)
-
-                if exclude_episode_ids:
-                    placeholders = ",".join("?" for _ in exclude_episode_ids)
-                    # Spec #48 — guard the NULL: a feed task has episode_id NULL,
-                    # and ``NULL NOT IN (…)`` is NULL (not TRUE) in SQLite, which
-                    # would wrongly filter every REFRESH_FEED row out whenever any
-                    # episode task is active. The ``IS NULL`` arm keeps feed tasks
-                    # claimable through the episode-exclusion filter.
-                    conditions.append(f"(episode_id IS NULL OR episode_id NOT IN ({placeholders}))")
-                    params.extend(exclude_episode_ids)
-
-                if exclude_podcast_ids:
-                    placeholders = ",".join("?" for _ in exclude_podcast_ids)
-                    conditions.append(f"(podcast_id IS NULL OR podcast_id NOT IN ({placeholders}))")
-                    params.extend(exclude_podcast_ids)
-
-                where = " AND ".join(conditions)
                 cursor = conn.execute(
                     f"""
                     SELECT * FROM tasks
                     WHERE {where}
                     ORDER BY priority DESC, created_at ASC
-                    LIMIT 1
                     """,
                     params,
                 )
 
-                row = cursor.fetchone()
-                if not row:
-                    conn.rollback()
-                    return None
-
-                task_id = row["id"]
-
-                # Spec #25 item 3.6 — defence-in-depth conditional UPDATE.
-                # ``BEGIN IMMEDIATE`` already serialises writers, but the
-                # ``status IN (...)`` predicate makes a double-claim
-                # structurally impossible: any second writer that somehow
-                # got past the SELECT (e.g. WAL read snapshots predating
-                # the first writer's commit) sees ``rowcount == 0`` and
-                # rolls back instead of stomping on the in-flight task.
-                cursor = conn.execute(
-                    """
-                    UPDATE tasks
-                    SET status = 'processing', started_at = ?, updated_at = ?
-                    WHERE id = ?
-                      AND status IN ('pending', 'retry_scheduled')
-                    """,
-                    (now, now, task_id),
-                )
+                # One row per target. Iterating the cursor lazily stops the
+                # scan as soon as the batch is full.
+                picked: List[sqlite3.Row] = []
+                seen_targets: set[str] = set()
+                for row in cursor:
+                    target = row["episode_id"] or f"podcast:{row['podcast_id']}"
+                    if target in seen_targets:
+                        continue
+                    seen_targets.add(target)
+                    picked.append(row)
+                    if len(picked) >= n:
+                        break
+
+                claimed: List[Task] = []
+                for row in picked:
+                    # Spec #25 item 3.6 — defence-in-depth conditional UPDATE.
+                    # ``BEGIN IMMEDIATE`` already serialises writers, but the
+                    # ``status IN (...)`` predicate makes a double-claim
+                    # structurally impossible: any second writer that somehow
+                    # got past the SELECT (e.g. WAL read snapshots predating
+                    # the first writer's commit) sees ``rowcount == 0`` and
+                    # skips the row instead of stomping on the in-flight task.
+                    updated = conn.execute(
+                        """
+                        UPDATE tasks
+                        SET status = 'processing', started_at = ?, updated_at = ?
+                        WHERE id = ?
+                          AND status IN ('pending', 'retry_scheduled')
+                        """,
+                        (now, now, row["id"]),
+                    )
+                    if updated.rowcount == 0:
+                        logger.debug("task_claim_lost_race", task_id=row["id"])
+                        continue
 
-                if cursor.rowcount == 0:
-                    # Another worker raced ahead and claimed the same row
-                    # between our SELECT and UPDATE. Drop our intended
-                    # claim and let the caller poll again.
-                    conn.rollback()
-                    logger.debug("task_claim_lost_race", task_id=task_id)
-                    return None
+                    task = self._row_to_task(row)
+                    task.status = TaskStatus.PROCESSING
+                    task.started_at = datetime.fromisoformat(now)
+                    task.updated_at = datetime.fromisoformat(now)
+                    claimed.append(task)
 
                 conn.commit()
 
-                # Return the task with updated status
-                task = self._row_to_task(row)
-                task.status = TaskStatus.PROCESSING
-                task.started_at = datetime.fromisoformat(now)
-                task.updated_at = datetime.fromisoformat(now)
-
-                logger.info(f"Task claimed: {task_id} - {task.stage.value} (retry #{task.retry_count})")
-                return task
-
             except Exception:
                 conn.rollback()
                 raise
 
+        for task in claimed:
+            logger.info(f"Task claimed: {task.id} - {task.stage.value} (retry #{task.retry_count})")
+        return claimed
+
     def complete_task(self, task_id: str, claim_started_at: Optional[str] = None) -> bool:
         """
         Mark a task as completed.
@@ -1504,7 +1656,11 @@ class QueueManager:
 
             return reset
 
-    def recover_interrupted_tasks(self, excluded_stages: Optional[List[TaskStage]] = None) -> int:
+    def recover_interrupted_tasks(
+        self,
+        excluded_stages: Optional[List[TaskStage]] = None,
+        started_before: Optional[datetime] = None,
+    ) -> int:
         """
         Recover tasks left in 'processing' status by a server restart or crash.
 
@@ -1525,9 +1681,14 @@ class QueueManager:
           transcribe whose remote job may still be running); excluding a stage
           overrides its idempotent auto-resume.
 
+        With ``started_before`` only tasks claimed before that instant count
+        as interrupted. A worker starting next to live peers passes the stale
+        cutoff so it never resets (or fails) tasks a peer is still running.
+
         Args:
             excluded_stages: Stages to NOT recover at all — left in
                 ``processing`` (cloud tasks that may still be running remotely).
+            started_before: Only recover tasks whose ``started_at`` is older.
 
         Returns:
             Total interrupted tasks recovered (resumed + failed).
@@ -1541,6 +1702,9 @@ class QueueManager:
         # Stages we must NOT mark failed: the ones we just resumed + the
         # explicitly excluded. Everything else still in 'processing' is failed.
         skip_fail_values = resume_values + [s.value for s in excluded]
+        # julianday() for the same reason as ``reset_stale_tasks``.
+        age_clause = " AND julianday(started_at) < julianday(?)" if started_before else ""
+        age_params = (started_before.isoformat(),) if started_before else ()
 
         with self._get_connection() as conn:
             resumed = 0
@@ -1550,9 +1714,9 @@ class QueueManager:
                     f"""
                     UPDATE tasks
                     SET status = 'pending', started_at = NULL, updated_at = ?
-                    WHERE status = 'processing' AND stage IN ({placeholders})
+                    WHERE status = 'processing' AND stage IN ({placeholders}){age_clause}
                     """,
-                    (now, *resume_values),
+                    (now, *resume_values, *age_params),
                 )
                 resumed = cursor.rowcount
 
@@ -1569,22 +1733,22 @@ class QueueManager:
                         completed_at = ?,
                         updated_at = ?
                     WHERE status = 'processing'
-                    AND stage NOT IN ({placeholders})
+                    AND stage NOT IN ({placeholders}){age_clause}
                 """,
-                    (now, now, *skip_fail_values),
+                    (now, now, *skip_fail_values, *age_params),
                 )
             else:
                 cursor = conn.execute(
-                    """
+                    f"""
                     UPDATE tasks
                     SET status = 'failed',
                         error_message = 'Task interrupted by server restart',
                         error_class = 'infra',
                         completed_at = ?,
                         updated_at = ?
-                    WHERE status = 'processing'
+                    WHERE status = 'processing'{age_clause}
                 """,
-                    (now, now),
+                    (now, now, *age_params),
                 )
             failed = cursor.rowcount
 
@@ -1916,7 +2080,9 @@ class QueueManager:
             return None
 
         logger.info("Task moved from DLQ back to pending", task_id=task_id)
-        return self.get_task(task_id)
+        task = self.get_task(task_id)
+        self.wakeup.notify(task.stage if task else None)
+        return task
 
     def retry_dead_tasks(self, task_ids: Sequence[str]) -> List[str]:
         """Bulk variant of :meth:`retry_dead_task` — requeue many DLQ rows in a
@@ -1974,6 +2140,8 @@ class QueueManager:
             requeued.extend(self._exec_with_lock_retry("retry_dead_tasks", _write))
 
         logger.info("Bulk-requeued DLQ tasks", requested=len(ids), requeued=len(requeued))
+        if requeued:
+            self.wakeup.notify()
         return requeued
 
     def find_healable_tasks(
@@ -2085,6 +2253,7 @@ class QueueManager:
             stage=healed.stage.value if healed else None,
             heal_attempts=healed.heal_attempts if healed else None,
         )
+        self.wakeup.notify(healed.stage if healed else None)
         return healed
 
     def cancel_retry(self, task_id: str) -> Optional[Task]:
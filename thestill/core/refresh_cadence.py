@@ -0,0 +1,176 @@
+# Copyright 2025-2026 Thestill
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Adaptive per-feed refresh cadence.
+
+Decides how long to wait before polling a feed again after a successful
+refresh. Pure, like :mod:`refresh_failure`: both repository backends read
+the feed's state, call :func:`plan_refresh`, and persist the result as
+``refresh_interval_seconds`` / ``next_refresh_at``. The scheduler's due
+query stays a range scan over the ``next_refresh_at`` index.
+
+Three signals set the interval:
+
+- **Publish rhythm.** The median gap between the feed's recent releases.
+  A feed is polled ``polls_per_publish_gap`` times per gap, so a daily
+  show is checked every few hours and a monthly one about once a day.
+- **Unchanged refreshes.** Each refresh that brings nothing new (a 304,
+  or a 200 with no new GUIDs) extends a streak. Once the streak outlasts
+  one publish gap the interval grows ×1.5 per refresh. A feed that has
+  been silent for ``DORMANT_GAPS`` gaps drops straight to the max.
+- **Feed hints.** ``<ttl>`` and ``sy:updatePeriod``/``sy:updateFrequency``
+  set a floor: the publisher asked not to be polled more often.
+
+Feeds with too little history fall back to the previous AIMD rule
+(halve on new episodes, ×1.5 otherwise). Every result is clamped to the
+operator's min/max. The due time then gets ±``jitter_percent`` of random
+spread so feeds that were seeded together don't stay in lockstep.
+"""
+
+from __future__ import annotations
+
+import random
+import statistics
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from typing import Optional, Sequence
+
+# Recent releases the publish rhythm is learned from.
+HISTORY_SIZE = 10
+# Releases closer together than this are one drop (a season uploaded at
+# once), not a rhythm.
+BATCH_GAP_SECONDS = 3600
+# Quiet for this many publish gaps: the feed is dormant, poll at the max.
+DORMANT_GAPS = 10
+BACKOFF_FACTOR = 1.5
+
+_UPDATE_PERIOD_SECONDS = {
+    "hourly": 3600,
+    "daily": 86400,
+    "weekly": 7 * 86400,
+    "monthly": 30 * 86400,
+    "yearly": 365 * 86400,
+}
+
+
+@dataclass(frozen=True)
+class RefreshCadenceSettings:
+    """Cadence knobs passed INTO the repository (same contract as
+    ``RefreshPolicySettings``: repo code never reads global config)."""
+
+    polls_per_publish_gap: int = 4
+    jitter_percent: int = 10
+
+    @classmethod
+    def from_config(cls) -> "RefreshCadenceSettings":
+        from ..utils.config import get_refresh_jitter_percent, get_refresh_polls_per_publish_gap
+
+        return cls(
+            polls_per_publish_gap=get_refresh_polls_per_publish_gap(),
+            jitter_percent=get_refresh_jitter_percent(),
+        )
+
+
+@dataclass(frozen=True)
+class RefreshPlan:
+    """Outcome of :func:`plan_refresh`.
+
+    ``interval_seconds`` is persisted as the feed's cadence; ``next_refresh_at``
+    is ``now`` plus the jittered interval.
+    """
+
+    interval_seconds: int
+    next_refresh_at: datetime
+    unchanged_streak: int
+
+
+def feed_hint_seconds(
+    ttl: Optional[str],
+    update_period: Optional[str],
+    update_frequency: Optional[str],
+) -> Optional[int]:
+    """Shortest poll interval the feed itself asks for, or ``None``.
+
+    ``<ttl>`` is in minutes. ``sy:updatePeriod`` names a period that
+    ``sy:updateFrequency`` (default 1) divides. When both are present the
+    longer one wins. Malformed values are ignored.
+    """
+    hints = []
+    try:
+        minutes = int((ttl or "").strip())
+        if minutes > 0:
+            hints.append(minutes * 60)
+    except ValueError:
+        pass
+    period = _UPDATE_PERIOD_SECONDS.get((update_period or "").strip().lower())
+    if period is not None:
+        try:
+            frequency = int((update_frequency or "").strip() or 1)
+        except ValueError:
+            frequency = 1
+        hints.append(period // max(1, frequency))
+    return max(hints) if hints else None
+
+
+def publish_gap_seconds(pub_dates: Sequence[datetime]) -> Optional[float]:
+    """Median gap between the feed's recent releases, in seconds.
+
+    ``pub_dates`` is any order; only the newest ``HISTORY_SIZE`` count.
+    Gaps under ``BATCH_GAP_SECONDS`` are one batch release and are skipped.
+    Returns ``None`` with fewer than two usable gaps.
+    """
+    recent = sorted(pub_dates, reverse=True)[:HISTORY_SIZE]
+    gaps = [(newer - older).total_seconds() for newer, older in zip(recent, recent[1:])]
+    gaps = [gap for gap in gaps if gap >= BATCH_GAP_SECONDS]
+    if len(gaps) < 2:
+        return None
+    return statistics.median(gaps)
+
+
+def plan_refresh(
+    *,
+    current_interval: int,
+    found_new: bool,
+    prior_unchanged_streak: int,
+    pub_dates: Sequence[datetime],
+    hint_seconds: Optional[int],
+    min_interval: int,
+    max_interval: int,
+    settings: RefreshCadenceSettings,
+    now: datetime,
+    rng: Optional[random.Random] = None,
+) -> RefreshPlan:
+    """Next interval and due time for a feed that just refreshed successfully."""
+    streak = 0 if found_new else prior_unchanged_streak + 1
+    gap = publish_gap_seconds(pub_dates)
+    if gap is None:
+        interval = current_interval // 2 if found_new else current_interval * BACKOFF_FACTOR
+    elif pub_dates and (now - max(pub_dates)).total_seconds() > DORMANT_GAPS * gap:
+        interval = max_interval
+    else:
+        polls = max(1, settings.polls_per_publish_gap)
+        overdue = max(0, streak - polls)
+        # Capped exponent: the clamp below takes over long before this does.
+        interval = gap / polls * BACKOFF_FACTOR ** min(overdue, 32)
+    if hint_seconds:
+        interval = max(interval, hint_seconds)
+    interval = max(min_interval, min(max_interval, int(interval)))
+
+    spread = interval * max(0, settings.jitter_percent) / 100
+    delay = interval + (rng or random).uniform(-spread, spread) if spread else interval
+    return RefreshPlan(
+        interval_seconds=interval,
+        next_refresh_at=now + timedelta(seconds=max(1, int(delay))),
+        unchanged_streak=streak,
+    )
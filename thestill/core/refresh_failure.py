@@ -40,7 +40,7 @@ from dataclasses import dataclass, field
 from datetime import datetime, timedelta
 from email.utils import parsedate_to_datetime
 from enum import Enum
-from typing import TYPE_CHECKING, Any, List, Optional, Tuple
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple
 
 import requests
 
@@ -114,6 +114,12 @@ class RefreshAttemptResult:
     # Spec #62 — (podcast_id, external_id, AlternateEnclosure) observation
     # rows for the whole feed window (new + already-tracked episodes).
     alt_enclosure_rows: List[Tuple[str, str, Any]] = field(default_factory=list)
+    # external_id -> [TranscriptLink] for the new-episode window, taken from
+    # the feed scan so saving them never re-reads the RSS body from disk.
+    transcript_links: Dict[str, List[Any]] = field(default_factory=dict)
+    # Poll interval the feed's <ttl> / sy:updatePeriod ask for; None when the
+    # feed states none or no body was read (304).
+    refresh_hint_seconds: Optional[int] = None
     source: Optional[Any] = None
     failure: Optional[RefreshFailure] = None
 
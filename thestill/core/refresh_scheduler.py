@@ -17,7 +17,10 @@
 A lightweight daemon-thread loop that, on each tick, enqueues a ``REFRESH_FEED``
 task for every **due** feed (``next_refresh_at <= now``) instead of refreshing
 all feeds in one burst. The tick interval is the scheduling *granularity*; the
-per-feed cadence (set adaptively by the handler) is independent.
+per-feed cadence is independent. The handler plans it after every successful
+refresh from the feed's publish rhythm, its unchanged/304 streak and its
+``<ttl>`` hint (:mod:`refresh_cadence`), so a daily show and a feed silent
+for years are polled at very different rates.
 
 The loop is cheap: the due-query is a single indexed range scan, and the
 per-feed coalescing guard (``add_feed_task`` / ``has_pending_feed_task``) keeps
@@ -38,9 +38,24 @@ across every call for an episode; providers that honour the hint
 that auto-cache (OpenAI / Gemini) do so transparently, and
 providers without caching (Ollama / Mistral) have their batch budget
 widened to amortise the repeated prefix.
+
+Batches run serially by default because ``previous_cleaned`` is taken
+from the output of the batch before. With ``batch_concurrency > 1`` the
+cleaner switches to a pipelined mode: the previous-context window comes
+from the raw (speaker-mapped) source instead, so every batch is known up
+front and up to ``batch_concurrency`` calls are in flight at once. The
+in-flight cap is shared by every cleaner talking to the same provider
+model, so concurrent CLEAN tasks cannot multiply it. Patches are still
+applied strictly in batch order and the per-batch prohibited-content
+fallback is unchanged.
 """
 
-from typing import Dict, List, Literal, Optional
+import contextvars
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Dict, List, Literal, Optional, Tuple
 
 from pydantic import BaseModel, Field, field_validator
 from structlog import get_logger
@@ -54,6 +69,42 @@ from thestill.utils.text_sanitizer import sanitize_text
 
 logger = get_logger(__name__)
 
+# Per-(provider, model) in-flight cap for pipelined batches. Keyed on the
+# limit too, so a cleaner configured with a different cap does not borrow
+# a semaphore sized for another.
+_provider_slots: Dict[Tuple[str, str, int], threading.BoundedSemaphore] = {}
+_provider_slots_lock = threading.Lock()
+
+
+def _slots_for(provider: LLMProvider, limit: int) -> threading.BoundedSemaphore:
+    key = (type(provider).__name__, provider.get_model_name(), limit)
+    with _provider_slots_lock:
+        slots = _provider_slots.get(key)
+        if slots is None:
+            slots = _provider_slots[key] = threading.BoundedSemaphore(limit)
+        return slots
+
+
+@dataclass
+class SegmentedCleanupStats:
+    """Per-episode counters from the last :meth:`SegmentedTranscriptCleaner.clean` call.
+
+    ``coverage`` (patches per segment) is the number the evals harness
+    compares between serial and pipelined runs: under the omit-unchanged
+    contract a drop signals the model skipping segments it should fix.
+    """
+
+    segments: int
+    batches: int
+    patches_emitted: int
+    prohibited_batches: int
+    batch_concurrency: int
+    wall_seconds: float
+
+    @property
+    def coverage(self) -> float:
+        return self.patches_emitted / self.segments if self.segments else 0.0
+
 
 class CleanupPatch(BaseModel):
     """One LLM-produced patch for a target segment.
@@ -137,6 +188,7 @@ class SegmentedTranscriptCleaner:
         batch_char_budget: int = 4000,
         temperature: float = 0.0,
         omit_unchanged: bool = True,
+        batch_concurrency: int = 1,
     ) -> None:
         """
         Args:
@@ -159,6 +211,11 @@ class SegmentedTranscriptCleaner:
                 and pass through unchanged. Cuts output tokens roughly in
                 half on typical episodes. False restores the legacy
                 one-patch-per-segment contract (A/B control and rollback).
+            batch_concurrency: Maximum LLM batches in flight for one
+                provider model. 1 (default) keeps the serial loop whose
+                previous context is the already-cleaned output; above 1
+                the previous context comes from the raw source so batches
+                can be pipelined.
 
         Raises:
             ValueError: When any argument is outside its valid range.
@@ -169,12 +226,16 @@ class SegmentedTranscriptCleaner:
             raise ValueError(f"k_next must be >= 0, got {k_next}")
         if batch_char_budget < 1:
             raise ValueError(f"batch_char_budget must be >= 1, got {batch_char_budget}")
+        if batch_concurrency < 1:
+            raise ValueError(f"batch_concurrency must be >= 1, got {batch_concurrency}")
 
         self.provider = provider
         self.k_prev = k_prev
         self.k_next = k_next
         self.temperature = temperature
         self.omit_unchanged = omit_unchanged
+        self.batch_concurrency = batch_concurrency
+        self.last_clean_stats: Optional[SegmentedCleanupStats] = None
 
         # Widen the batch budget for providers without caching so the
         # repeated prefix gets amortised across fewer calls. The 3x
@@ -209,74 +270,22 @@ class SegmentedTranscriptCleaner:
             episode_facts=episode_facts,
         )
 
-        cleaned: List[AnnotatedSegment] = []
-        total = len(source)
-        total_patches_emitted = 0
-        index = 0
-        while index < total:
-            batch_end = self._pick_batch_end(source, start=index)
-            target = source[index:batch_end]
-            prev_context = cleaned[-self.k_prev :] if self.k_prev else []
-            next_context = source[batch_end : batch_end + self.k_next]
-
-            user_prompt = self._build_user_prompt(
-                prev_context=prev_context,
-                target=target,
-                next_context=next_context,
-            )
-
-            logger.debug(
-                "segmented_cleanup_batch",
-                episode_id=annotated.episode_id,
-                start=index,
-                end=batch_end,
-                prev_context=len(prev_context),
-                next_context=len(next_context),
-                target_chars=sum(len(s.text) for s in target),
-            )
+        started = time.perf_counter()
+        if self.batch_concurrency > 1:
+            cleaned, batch_results = self._clean_pipelined(source, system_prompt, annotated.episode_id)
+        else:
+            cleaned, batch_results = self._clean_serial(source, system_prompt, annotated.episode_id)
 
-            try:
-                patch_batch = self.provider.generate_structured_cached(
-                    messages=[
-                        {"role": "system", "content": system_prompt},
-                        {"role": "user", "content": user_prompt},
-                    ],
-                    response_model=CleanupPatchBatch,
-                    cache_system_message=True,
-                    temperature=self.temperature,
-                )
-                patched = self._apply_patches(target, patch_batch.patches)
-                total_patches_emitted += len(patch_batch.patches)
-                logger.debug(
-                    "segmented_cleanup_batch_coverage",
-                    episode_id=annotated.episode_id,
-                    batch_start=index,
-                    batch_end=batch_end,
-                    target_count=len(target),
-                    patches_emitted=len(patch_batch.patches),
-                )
-            except ProhibitedContentError as e:
-                # Provider refused this batch on content grounds (e.g. Gemini
-                # PROHIBITED_CONTENT). Retrying the same provider can't help.
-                # Fall back to source-as-is for this batch so one tripped
-                # batch doesn't doom the whole episode (spec #41 option B).
-                # Spec #41 option A — per-batch model fallback to Claude/etc
-                # — is the eventual fix; until then the batch keeps its raw
-                # ASR text, no speaker mapping, no ad tagging.
-                logger.warning(
-                    "segmented_cleanup_prohibited_content",
-                    episode_id=annotated.episode_id,
-                    batch_start=index,
-                    batch_end=batch_end,
-                    target_count=len(target),
-                    target_chars=sum(len(s.text) for s in target),
-                    provider=e.context.get("provider"),
-                    model=e.context.get("model"),
-                    finish_reason=e.context.get("finish_reason"),
-                )
-                patched = list(target)
-            cleaned.extend(patched)
-            index = batch_end
+        total = len(source)
+        total_patches_emitted = sum(emitted for emitted in batch_results if emitted is not None)
+        self.last_clean_stats = SegmentedCleanupStats(
+            segments=total,
+            batches=len(batch_results),
+            patches_emitted=total_patches_emitted,
+            prohibited_batches=sum(1 for emitted in batch_results if emitted is None),
+            batch_concurrency=self.batch_concurrency,
+            wall_seconds=time.perf_counter() - started,
+        )
 
         # Under the omit-unchanged contract, a collapse in this ratio is
         # the observable symptom of model laziness (skipping segments it
@@ -287,6 +296,9 @@ class SegmentedTranscriptCleaner:
             segments=total,
             patches_emitted=total_patches_emitted,
             omit_unchanged=self.omit_unchanged,
+            batches=self.last_clean_stats.batches,
+            batch_concurrency=self.batch_concurrency,
+            wall_seconds=round(self.last_clean_stats.wall_seconds, 2),
         )
 
         # Reassign positional ids so the returned transcript remains
@@ -308,6 +320,169 @@ class SegmentedTranscriptCleaner:
     # focused on orchestration.
     # ------------------------------------------------------------------
 
+    def _clean_serial(
+        self,
+        source: List[AnnotatedSegment],
+        system_prompt: str,
+        episode_id: str,
+    ) -> Tuple[List[AnnotatedSegment], List[Optional[int]]]:
+        """Clean batch after batch, feeding each one the cleaned tail so far.
+
+        Returns the cleaned segments and, per batch, the number of patches
+        emitted (``None`` for a batch that fell back on prohibited content).
+        """
+        cleaned: List[AnnotatedSegment] = []
+        batch_results: List[Optional[int]] = []
+        index = 0
+        while index < len(source):
+            batch_end = self._pick_batch_end(source, start=index)
+            prev_context = cleaned[-self.k_prev :] if self.k_prev else []
+            patched, emitted = self._clean_batch(
+                source,
+                system_prompt,
+                episode_id,
+                start=index,
+                end=batch_end,
+                prev_context=prev_context,
+            )
+            cleaned.extend(patched)
+            batch_results.append(emitted)
+            index = batch_end
+        return cleaned, batch_results
+
+    def _clean_pipelined(
+        self,
+        source: List[AnnotatedSegment],
+        system_prompt: str,
+        episode_id: str,
+    ) -> Tuple[List[AnnotatedSegment], List[Optional[int]]]:
+        """Clean up to ``batch_concurrency`` batches at once.
+
+        Batch boundaries depend only on the source, so they are planned up
+        front; each batch's previous context is the raw source window just
+        before it. Results are collected in batch order, so the output is
+        identical in shape to the serial path. A non-prohibited failure in
+        any batch cancels the batches not yet started and propagates.
+        """
+        spans: List[Tuple[int, int]] = []
+        index = 0
+        while index < len(source):
+            batch_end = self._pick_batch_end(source, start=index)
+            spans.append((index, batch_end))
+            index = batch_end
+
+        slots = _slots_for(self.provider, self.batch_concurrency)
+
+        def run(start: int, end: int) -> Tuple[List[AnnotatedSegment], Optional[int]]:
+            with slots:
+                return self._clean_batch(
+                    source,
+                    system_prompt,
+                    episode_id,
+                    start=start,
+                    end=end,
+                    prev_context=source[max(0, start - self.k_prev) : start] if self.k_prev else [],
+                )
+
+        pool = ThreadPoolExecutor(
+            max_workers=min(self.batch_concurrency, len(spans)) or 1,
+            thread_name_prefix="segmented-cleanup",
+        )
+        try:
+            # copy_context so structlog contextvars (task/episode ids)
+            # follow each batch onto the pool threads.
+            futures: List[Future] = [
+                pool.submit(contextvars.copy_context().run, run, start, end) for start, end in spans
+            ]
+            cleaned: List[AnnotatedSegment] = []
+            batch_results: List[Optional[int]] = []
+            for future in futures:
+                patched, emitted = future.result()
+                cleaned.extend(patched)
+                batch_results.append(emitted)
+        except BaseException:
+            pool.shutdown(wait=True, cancel_futures=True)
+            raise
+        pool.shutdown(wait=True)
+        return cleaned, batch_results
+
+    def _clean_batch(
+        self,
+        source: List[AnnotatedSegment],
+        system_prompt: str,
+        episode_id: str,
+        *,
+        start: int,
+        end: int,
+        prev_context: List[AnnotatedSegment],
+    ) -> Tuple[List[AnnotatedSegment], Optional[int]]:
+        """Send one batch to the provider and apply its patches.
+
+        Returns the patched target segments and the number of patches the
+        provider emitted, or ``None`` when the batch fell back to its
+        source text after a :class:`ProhibitedContentError`.
+        """
+        target = source[start:end]
+        next_context = source[end : end + self.k_next]
+
+        user_prompt = self._build_user_prompt(
+            prev_context=prev_context,
+            target=target,
+            next_context=next_context,
+        )
+
+        logger.debug(
+            "segmented_cleanup_batch",
+            episode_id=episode_id,
+            start=start,
+            end=end,
+            prev_context=len(prev_context),
+            next_context=len(next_context),
+            target_chars=sum(len(s.text) for s in target),
+        )
+
+        try:
+            patch_batch = self.provider.generate_structured_cached(
+                messages=[
+                    {"role": "system", "content": system_prompt},
+                    {"role": "user", "content": user_prompt},
+                ],
+                response_model=CleanupPatchBatch,
+                cache_system_message=True,
+                temperature=self.temperature,
+            )
+        except ProhibitedContentError as e:
+            # Provider refused this batch on content grounds (e.g. Gemini
+            # PROHIBITED_CONTENT). Retrying the same provider can't help.
+            # Fall back to source-as-is for this batch so one tripped
+            # batch doesn't doom the whole episode (spec #41 option B).
+            # Spec #41 option A — per-batch model fallback to Claude/etc
+            # — is the eventual fix; until then the batch keeps its raw
+            # ASR text, no speaker mapping, no ad tagging.
+            logger.warning(
+                "segmented_cleanup_prohibited_content",
+                episode_id=episode_id,
+                batch_start=start,
+                batch_end=end,
+                target_count=len(target),
+                target_chars=sum(len(s.text) for s in target),
+                provider=e.context.get("provider"),
+                model=e.context.get("model"),
+                finish_reason=e.context.get("finish_reason"),
+            )
+            return list(target), None
+
+        patched = self._apply_patches(target, patch_batch.patches)
+        logger.debug(
+            "segmented_cleanup_batch_coverage",
+            episode_id=episode_id,
+            batch_start=start,
+            batch_end=end,
+            target_count=len(target),
+            patches_emitted=len(patch_batch.patches),
+        )
+        return patched, len(patch_batch.patches)
+
     def _pick_batch_end(self, segments: List[AnnotatedSegment], *, start: int) -> int:
         """Return the exclusive end index for the batch starting at ``start``.
 
@@ -424,6 +599,18 @@ class SegmentedTranscriptCleaner:
             target_contract = "the segments you must patch. Output one patch per target segment."
             emission_contract = ""
 
+        if self.batch_concurrency > 1:
+            previous_contract = (
+                "- 'previous_raw': the raw segments just before the target, "
+                "  for tone and speaker continuity. They are cleaned in a "
+                "  separate call. Do NOT output patches for these.\n"
+            )
+        else:
+            previous_contract = (
+                "- 'previous_cleaned': already-cleaned segments for tone and "
+                "  speaker continuity. Do NOT output patches for these.\n"
+            )
+
         return (
             "You are an expert podcast transcript editor. You receive batches "
             "of diarised transcript segments as structured JSON and return "
@@ -434,8 +621,7 @@ class SegmentedTranscriptCleaner:
             f"Keep all cleaned_text in {lang_name}.\n\n"
             "INPUT SHAPE:\n"
             "You will receive a JSON object with three keys:\n"
-            "- 'previous_cleaned': already-cleaned segments for tone and "
-            "  speaker continuity. Do NOT output patches for these.\n"
+            f"{previous_contract}"
             f"- 'target': {target_contract}\n"
             "- 'next_raw': upcoming raw segments for forward context. Do NOT "
             "  output patches for these.\n\n"
@@ -523,14 +709,15 @@ class SegmentedTranscriptCleaner:
     ) -> str:
         """Serialise the three buckets as a compact JSON payload.
 
-        ``previous_cleaned`` and ``next_raw`` are context only; the LLM
-        must not produce patches for their ids. ``target`` is the set to
-        patch.
+        ``previous_cleaned`` (``previous_raw`` in pipelined mode) and
+        ``next_raw`` are context only; the LLM must not produce patches for
+        their ids. ``target`` is the set to patch.
         """
         import json as _json
 
+        previous_key = "previous_raw" if self.batch_concurrency > 1 else "previous_cleaned"
         payload = {
-            "previous_cleaned": [_segment_to_prompt_dict(s) for s in prev_context],
+            previous_key: [_segment_to_prompt_dict(s) for s in prev_context],
             "target": [_segment_to_prompt_dict(s) for s in target],
             "next_raw": [_segment_to_prompt_dict(s) for s in next_context],
         }
@@ -29,7 +29,6 @@ Usage:
 import json
 import tempfile
 import threading
-import time
 from contextlib import contextmanager, nullcontext
 from pathlib import Path
 from typing import TYPE_CHECKING, Callable, Dict, Generator, Optional, Tuple
@@ -220,9 +219,14 @@ def handle_download(task: Task, state: "AppState") -> None:
         from ..utils.duration import get_audio_duration
 
         with tempfile.TemporaryDirectory(prefix="thestill_download_") as work_dir:
+            # Partials live outside the tempdir so a failed attempt's bytes
+            # survive for the task retry to resume with Range requests.
             downloader = AudioDownloader(
                 work_dir,
                 max_bytes=state.config.max_audio_bytes,
+                parallel_ranges=state.config.download_parallel_ranges,
+                parallel_min_bytes=state.config.download_parallel_min_bytes,
+                partial_dir=str(state.path_manager.partial_downloads_dir()),
             )
             # download_episode returns a path relative to ``work_dir`` shaped
             # like "podcast-slug/episode.mp3"; that same shape is the
@@ -282,7 +286,7 @@ def handle_downsample(task: Task, state: "AppState") -> None:
         relative_path = f"{podcast_subdir}/{downsampled_filename}"
 
         # Skip if already downsampled — ``exists()`` is one HeadObject on S3
-        # which is much cheaper than running the pydub conversion twice.
+        # which is much cheaper than running the ffmpeg conversion twice.
         if state.config.file_storage.exists(downsampled_key):
             logger.info(f"Downsampled audio already exists, skipping: {relative_path}")
             from ..utils.duration import get_audio_duration
@@ -294,7 +298,7 @@ def handle_downsample(task: Task, state: "AppState") -> None:
             )
             return
 
-        # Materialise the input audio for pydub (real filesystem path required)
+        # Materialise the input audio for ffmpeg (real filesystem path required)
         # and write the output to a tempdir; the FileStorage upload below moves
         # it to the configured backend.
         preprocessor = AudioPreprocessor(logger=logger)
@@ -541,16 +545,17 @@ def handle_clean(task: Task, state: "AppState") -> None:
             raise FatalError(f"Transcript file not found: {transcript_path}")
         transcript_data = json.loads(transcript_payload)
 
-        # Create LLM provider
-        from .llm_provider import create_llm_provider_from_config
+        # Shared, rate-limited provider (one SDK client per config)
+        from .llm_pool import get_shared_llm_provider
         from .transcript_cleaning_processor import TranscriptCleaningProcessor
 
-        llm_provider = create_llm_provider_from_config(config)
+        llm_provider = get_shared_llm_provider(config)
 
         # Use quiet console to avoid broken pipe errors in web worker context
         cleaning_processor = TranscriptCleaningProcessor(
             llm_provider,
             console=ConsoleOutput(quiet=True),
+            batch_concurrency=config.clean_batch_concurrency,
         )
 
         # Generate output path
@@ -672,11 +677,11 @@ def handle_summarize(task: Task, state: "AppState") -> None:
         except FileNotFoundError:
             raise FatalError(f"Clean transcript file not found: {clean_path}")
 
-        # Create LLM provider and summarizer
-        from .llm_provider import create_llm_provider_from_config
+        # Shared, rate-limited provider and summarizer
+        from .llm_pool import get_shared_llm_provider
         from .post_processor import EpisodeMetadata, TranscriptSummarizer
 
-        llm_provider = create_llm_provider_from_config(config)
+        llm_provider = get_shared_llm_provider(config)
 
         # Use quiet console to avoid broken pipe errors in web worker context
         summarizer = TranscriptSummarizer(llm_provider, console=ConsoleOutput(quiet=True))
@@ -802,8 +807,8 @@ def handle_reindex(task: Task, state: "AppState") -> None:
     status, NOT ``failed_at_stage`` — because the user-visible pipeline
     is already done by this point.
     """
-    from ..models.annotated_transcript import AnnotatedTranscript
     from ..repositories.factory import make_chunk_writer
+    from .transcript_stream import load_segments
 
     podcast, episode = _get_episode_or_fail(task, state)
     if not episode.clean_transcript_json_path:
@@ -819,7 +824,9 @@ def handle_reindex(task: Task, state: "AppState") -> None:
         raise FatalError(f"AnnotatedTranscript sidecar not found: {sidecar} (episode {episode.id})")
 
     with _handler_error_context(f"chunking {episode.title}"):
-        transcript = AnnotatedTranscript.model_validate_json(sidecar.read_text(encoding="utf-8"))
+        # Segment text/speaker/timing is all the writer reads; stream it
+        # instead of building the full AnnotatedTranscript.
+        transcript = load_segments(sidecar, default_kind="content")
         # Spec #44 — backend-resolved: sqlite-vec locally, pgvector on Postgres.
         writer = make_chunk_writer(state.config, state.embedding_model)
         inserted = writer.write_episode(episode.id, transcript)
@@ -844,15 +851,16 @@ def handle_rebuild_cooccurrences(task: Task, state: "AppState") -> None:
     Splitting the rebuild into its own stage lets resolve workers commit
     their short transactions and move on; this handler then coalesces
     sibling pending rows via ``claim_pending_for_coalescing`` and
-    issues one scoped rebuild over the union of episode_ids. Because
-    the table is a corpus-wide aggregate (``episode_count`` distinct
-    across episodes), a single rebuild covering the union is correctness-
-    equivalent to N per-episode rebuilds.
-
-    Held under ``_cooccurrence_rebuild_lock`` so two parallel workers
-    in this stage don't both run the heavy SELECT against the same
-    state — the second would block on the WAL writer for seconds and
-    burn ``busy_timeout``.
+    applies incremental per-episode deltas for the union of episode_ids
+    (``update_cooccurrences``). Each episode costs O(its entities²) —
+    no corpus-wide recount — and the deltas commute, so coalescing is
+    correctness-equivalent to N separate runs. The full recount survives
+    only as the ``thestill rebuild-cooccurrences --full`` repair.
+
+    Held under ``_cooccurrence_rebuild_lock`` so parallel workers in
+    this stage queue in-process instead of contending on the SQLite
+    writer; the repository's per-episode transaction is what keeps
+    cross-process updaters correct.
     """
     repo = state.entity_repository
 
@@ -863,12 +871,12 @@ def handle_rebuild_cooccurrences(task: Task, state: "AppState") -> None:
             # current episode between this task's claim-as-processing and
             # the coalescing UPDATE.
             episode_ids = sorted({task.episode_id, *coalesced})
-            inserted = repo.rebuild_cooccurrences(episode_ids=episode_ids)
+            adjusted = repo.update_cooccurrences(episode_ids)
         logger.info(
             "cooccurrences_rebuild_completed",
             episode_id=task.episode_id,
             coalesced_episode_count=len(coalesced),
-            rows=inserted,
+            pairs_adjusted=adjusted,
         )
 
 
@@ -919,10 +927,12 @@ def handle_enrich_entities(task: Task, state: "AppState") -> None:
     Terminal entity-branch stage, modelled on ``handle_compute_related``:
     coalesces sibling pending rows under ``_enrichment_lock`` and resolves the
     union of episode_ids to the entities that need (re)enriching via the
-    repo's scoped ``entity_ids_needing_enrichment`` query. Each entity is then
-    enriched sequentially — the network fetch happens OUTSIDE any DB
-    transaction and each ``upsert_enrichment`` is its own short write, so the
-    SQLite writer lock is never held across a 5s Wikimedia timeout.
+    repo's scoped ``entity_ids_needing_enrichment`` query. The batch is then
+    enriched with ``EntityEnricher.enrich_many`` (``enrichment_concurrency``
+    fetch threads, one label lookup for the whole batch) — the network fetch
+    happens OUTSIDE any DB transaction and each ``upsert_enrichment`` is its
+    own short write on this thread, so the SQLite writer lock is never held
+    across a 5s Wikimedia timeout.
 
     Why a stage at all (vs. inlining into resolve): enrichment is the only
     network-bound step in the branch and is pure display data. Running it LAST
@@ -971,17 +981,18 @@ def handle_enrich_entities(task: Task, state: "AppState") -> None:
             capped = ordered[: cfg.enrichment_max_per_task]
 
             enricher = _get_or_create_entity_enricher(state)
+            entities = [e for e in (repo.get_entity(eid) for eid in capped) if e is not None and e.wikidata_qid]
             enriched = empty = failed = errored = 0
-            for entity_id in capped:
-                entity = repo.get_entity(entity_id)
-                if entity is None or not entity.wikidata_qid:
-                    continue
+            # Politeness pacing lives in the shared transport (a global
+            # request spacing that cache hits skip), not in a per-entity sleep.
+            for entity, enrichment, error in enricher.enrich_many(entities, max_workers=cfg.enrichment_concurrency):
                 try:
-                    enrichment = enricher.enrich(entity)
+                    if error is not None:
+                        raise error
                     repo.upsert_enrichment(enrichment)
                 except Exception as exc:  # noqa: BLE001 — FM-1: one entity must not abort the batch
                     errored += 1
-                    logger.warning("enrich_entity_failed", entity_id=entity_id, error=str(exc))
+                    logger.warning("enrich_entity_failed", entity_id=entity.id, error=str(exc))
                     continue
                 if EnrichmentStatus.FAILED in (enrichment.wikidata_status, enrichment.wikipedia_status):
                     failed += 1
@@ -989,8 +1000,6 @@ def handle_enrich_entities(task: Task, state: "AppState") -> None:
                     enriched += 1
                 else:
                     empty += 1
-                if cfg.enrichment_request_delay_sec > 0:
-                    time.sleep(cfg.enrichment_request_delay_sec)
 
         logger.info(
             "entity_enrichment_completed",
@@ -1146,9 +1155,9 @@ _related_compute_lock = threading.Lock()
 
 # Spec #47 — serialises the coalescing claim AND the Wikimedia request
 # loop for the ENRICH_ENTITIES stage. Unlike the corpus locks above this
-# is held mainly for politeness: it guarantees only one worker hits
-# Wikidata/Wikipedia at a time, so the per-request delay actually paces
-# total outbound traffic instead of N workers bursting in parallel.
+# is held mainly for politeness: it guarantees only one batch hits
+# Wikidata/Wikipedia at a time, so ``enrichment_concurrency`` bounds total
+# outbound fan-out instead of N workers each bursting in parallel.
 _enrichment_lock = threading.Lock()
 
 
@@ -1211,8 +1220,14 @@ def handle_resolve_entities(task: Task, state: "AppState") -> None:
             forced_results, remaining = _apply_overrides(repo, pending)
 
             # The resolver consults the blacklist for every QID candidate
-            # before accepting it (see ``EntityResolver.resolve``).
-            resolver_results = resolver.resolve(remaining, is_blacklisted=repo.is_blacklisted)
+            # before accepting it (see ``EntityResolver.resolve``), and the
+            # persisted surface-form cache so recurring hosts and guests
+            # skip ReFinED once they have grounded consistently.
+            resolver_results = resolver.resolve(
+                remaining,
+                is_blacklisted=repo.is_blacklisted,
+                surface_cache=repo,
+            )
 
             results = forced_results + resolver_results
 
@@ -1403,29 +1418,35 @@ def _get_or_create_entity_resolver(state: "AppState"):
         if state.entity_resolver is None:
             from .entity_resolver import EntityResolver
             from .wikidata_client import WikidataClient
+            from .wikimedia_http import wikimedia_http_from_config
 
-            state.entity_resolver = EntityResolver(wikidata_client=WikidataClient())
+            state.entity_resolver = EntityResolver(
+                wikidata_client=WikidataClient(http=wikimedia_http_from_config(state.config))
+            )
     return state.entity_resolver
 
 
 def _get_or_create_entity_enricher(state: "AppState"):
     """Lazy-init the process-scope ``EntityEnricher``.
 
-    Unlike the resolver, the enricher is cheap to build (two HTTP clients +
-    in-process LRU/label caches). We still cache it on ``AppState`` so the
-    label cache survives across coalesced ENRICH_ENTITIES tasks rather than
-    being thrown away each run. Built under ``_enrichment_lock`` (already
-    held by the only caller) so two workers can't double-init.
+    Unlike the resolver, the enricher is cheap to build (two HTTP clients
+    over one pooled, disk-cached transport + in-process LRU/label caches).
+    We still cache it on ``AppState`` so the session pool and label cache
+    survive across coalesced ENRICH_ENTITIES tasks rather than being thrown
+    away each run. Built under ``_enrichment_lock`` (already held by the
+    only caller) so two workers can't double-init.
     """
     if state.entity_enricher is None:
         from .entity_enricher import EntityEnricher
         from .wikidata_client import WikidataClient
+        from .wikimedia_http import wikimedia_http_from_config
         from .wikipedia_client import WikipediaClient
 
         cfg = state.config
+        http = wikimedia_http_from_config(cfg, min_interval_sec=cfg.enrichment_request_delay_sec)
         state.entity_enricher = EntityEnricher(
-            wikidata_client=WikidataClient(user_agent=cfg.enrichment_user_agent),
-            wikipedia_client=WikipediaClient(user_agent=cfg.enrichment_user_agent),
+            wikidata_client=WikidataClient(user_agent=cfg.enrichment_user_agent, http=http),
+            wikipedia_client=WikipediaClient(user_agent=cfg.enrichment_user_agent, http=http),
             find_entity_by_qid=state.entity_repository.find_entity_by_qid,
             language=cfg.enrichment_wikipedia_lang,
         )
@@ -1453,7 +1474,7 @@ def handle_refresh_feed(task: Task, state: "AppState") -> None:
         get_refresh_max_interval_seconds,
         get_refresh_min_interval_seconds,
     )
-    from .media_source import RSSMediaSource
+    from .refresh_cadence import RefreshCadenceSettings
     from .refresh_failure import RefreshPolicySettings, error_class_for_failure
 
     podcast_id = task.podcast_id
@@ -1475,7 +1496,6 @@ def handle_refresh_feed(task: Task, state: "AppState") -> None:
     podcast = result.podcast
     new_eps = result.new_episodes
     hit = result.conditional_hit
-    source = result.source
     headers_rotated = result.headers_rotated
     image_rows = result.image_rows
     audio_rows = result.audio_rows
@@ -1535,20 +1555,25 @@ def handle_refresh_feed(task: Task, state: "AppState") -> None:
         initiated_by="refresh-feed",
     )
 
-    # 5. Best-effort transcript-link extraction (outside the txn, unchanged).
-    if new_eps and isinstance(source, RSSMediaSource):
+    # 5. Best-effort transcript-link save (outside the txn). The links come
+    #    off the refresh's feed scan, not a re-read of the RSS body.
+    if new_eps and result.transcript_links:
         try:
-            fm._save_transcript_links_for_episodes(podcast, new_eps, source)
+            fm._save_transcript_links_for_episodes(podcast, new_eps, result.transcript_links)
         except Exception:
             logger.warning("transcript_link_extraction_failed", podcast_id=podcast_id, exc_info=True)
 
-    # 6. Record success + recompute adaptive (AIMD) cadence.
+    # 6. Record success + plan the next poll from the feed's publish rhythm,
+    #    its unchanged streak (a 304 counts) and its <ttl>/sy: hint.
     repo.record_refresh_success(
         podcast_id,
         found_new=bool(new_eps),
         min_interval=get_refresh_min_interval_seconds(),
         max_interval=get_refresh_max_interval_seconds(),
         default_interval=get_default_refresh_interval_seconds(),
+        not_modified=hit,
+        feed_hint_seconds=result.refresh_hint_seconds,
+        cadence=RefreshCadenceSettings.from_config(),
     )
     logger.info(
         "refresh_feed_complete",
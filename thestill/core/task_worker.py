@@ -47,17 +47,22 @@ import asyncio
 import concurrent.futures
 import threading
 import time
-from typing import TYPE_CHECKING, Callable, Dict, Optional
+from typing import TYPE_CHECKING, Callable, Dict, Iterable, Optional
 
 import structlog
 
 from thestill.utils.exceptions import FatalError, TransientError
+from thestill.utils.file_storage.local_cache import file_cache_stats
 
 from .circuit_breaker import CircuitState, StageCircuitBreaker
 from .error_classifier import classify_error_class
+from .llm_cache import llm_cache_stats
+from .llm_pool import llm_pool_stats
+from .model_pool import model_pool_stats
 from .progress import ProgressCallback, ProgressUpdate
 from .queue_manager import (
     QueueManager,
+    QueueWakeup,
     Task,
     TaskStage,
     get_next_stages,
@@ -88,6 +93,9 @@ class TaskWorker:
 
     # Default configuration
     DEFAULT_POLL_INTERVAL = 2.0  # Seconds between queue checks
+    # Idle poll while the queue pushes cross-process wakeups (Postgres
+    # LISTEN/NOTIFY): polling then only has to catch elapsed retry backoffs.
+    LISTENING_POLL_INTERVAL = 15.0
     DEFAULT_STALE_TIMEOUT = 30  # Minutes before considering a task stale
 
     def __init__(
@@ -109,6 +117,7 @@ class TaskWorker:
         circuit_window_seconds: float = 120.0,
         circuit_cooldown_seconds: float = 60.0,
         watchdog_timeout_per_stage: Optional[Dict[TaskStage, Optional[float]]] = None,
+        stages: Optional[Iterable[TaskStage]] = None,
     ):
         """
         Initialize task worker.
@@ -124,15 +133,22 @@ class TaskWorker:
                 explicit entry in ``parallel_jobs_per_stage``.
             parallel_jobs_per_stage: Per-stage capacity overrides. Any stage
                 omitted from this dict falls back to ``parallel_jobs``.
+            stages: Stages this worker claims (default: all). A ``thestill
+                worker --stages`` process polls only these; the rest of the
+                pipeline is left to other processes sharing the queue.
         """
         self.queue_manager = queue_manager
         self.task_handlers = task_handlers
         self.poll_interval = poll_interval
+        self._idle_poll_interval = poll_interval
         self.stale_timeout_minutes = stale_timeout_minutes
         self.progress_store = progress_store
         self.repository = repository
         self.parallel_jobs = max(1, parallel_jobs)
 
+        selected = set(stages) if stages is not None else set(TaskStage)
+        self.stages = tuple(stage for stage in TaskStage if stage in selected)
+
         overrides = parallel_jobs_per_stage or {}
         self.parallel_jobs_per_stage: Dict[TaskStage, int] = {
             stage: max(1, overrides.get(stage, self.parallel_jobs)) for stage in TaskStage
@@ -188,6 +204,10 @@ class TaskWorker:
         # Per-stage active tasks: stage -> {episode_id: Task}
         self._active_by_stage: Dict[TaskStage, Dict[str, Task]] = {stage: {} for stage in TaskStage}
         self._active_lock = threading.Lock()
+        # Per-stage wakeup events, created on the worker's loop. Set from any
+        # thread via ``_on_queue_wakeup`` when a task for the stage is
+        # enqueued, and by a finishing task to free its slot for the next claim.
+        self._wakeup_events: Dict[TaskStage, asyncio.Event] = {}
 
     def start(self) -> None:
         """
@@ -204,7 +224,7 @@ class TaskWorker:
         self._thread.start()
         logger.info(
             "task_worker_started",
-            parallel_jobs_per_stage={s.value: c for s, c in self.parallel_jobs_per_stage.items()},
+            parallel_jobs_per_stage={s.value: self.parallel_jobs_per_stage[s] for s in self.stages},
         )
 
     def stop(self, timeout: float = 10.0) -> None:
@@ -259,7 +279,7 @@ class TaskWorker:
     @staticmethod
     def _claim_token(task: Task) -> Optional[str]:
         """Lease token for a claimed task: its ``started_at`` (set atomically at
-        claim time by ``get_next_task``). complete/retry/dead writes carry this
+        claim time by ``claim_batch``). complete/retry/dead writes carry this
         so a handler the watchdog abandoned can't act on a row that a different
         worker has since reclaimed under a fresh ``started_at``."""
         return task.started_at.isoformat() if task.started_at is not None else None
@@ -274,7 +294,7 @@ class TaskWorker:
         PLUS ``abandoned_thread_budget`` — see that attribute for why a fixed
         headroom alone is not a fix.
         """
-        return sum(self.parallel_jobs_per_stage.values()) + 4 + self.abandoned_thread_budget
+        return sum(self.parallel_jobs_per_stage[s] for s in self.stages) + 4 + self.abandoned_thread_budget
 
     def is_degraded(self) -> bool:
         """True once leaked handler threads have eaten the pool's slack.
@@ -330,6 +350,7 @@ class TaskWorker:
             "running": self.is_running(),
             "parallel_jobs": self.parallel_jobs,
             "parallel_jobs_per_stage": {s.value: c for s, c in self.parallel_jobs_per_stage.items()},
+            "stages_served": [s.value for s in self.stages],
             "active_episodes": active_count,
             "stages": stages,
             # Watchdog-abandoned handler threads (still alive, leaking an
@@ -341,6 +362,16 @@ class TaskWorker:
             # Spec #49 L1 — non-closed breakers only (empty when all healthy),
             # so the queue monitor can show which stages are paused on an outage.
             "circuit_breakers": (self._breaker.snapshot() if self._breaker is not None else {}),
+            # Resident local-transcription models (empty until a local
+            # transcriber has leased one in this process).
+            "model_pool": model_pool_stats(),
+            # Shared LLM clients: per provider/model concurrency, queue
+            # depth and admission waits (empty until a task used one).
+            "llm_pool": llm_pool_stats(),
+            # LLM response cache hit/miss counters (empty unless LLM_CACHE_ENABLED).
+            "llm_cache": llm_cache_stats(),
+            # S3 read-through disk cache hit/miss counters (empty unless S3_CACHE_ENABLED).
+            "file_cache": file_cache_stats(),
         }
 
     def _run_loop(self) -> None:
@@ -363,7 +394,7 @@ class TaskWorker:
         """Spawn one poll loop per TaskStage and wait for them."""
         logger.info(
             "task_worker_loop_started",
-            parallel_jobs_per_stage={s.value: c for s, c in self.parallel_jobs_per_stage.items()},
+            parallel_jobs_per_stage={s.value: self.parallel_jobs_per_stage[s] for s in self.stages},
         )
 
         # Reset any stale tasks from previous runs on startup
@@ -395,10 +426,12 @@ class TaskWorker:
         logger.info("task_worker_executor_sized", max_workers=pool_size)
 
         semaphores: Dict[TaskStage, asyncio.Semaphore] = {
-            stage: asyncio.Semaphore(self.parallel_jobs_per_stage[stage]) for stage in TaskStage
+            stage: asyncio.Semaphore(self.parallel_jobs_per_stage[stage]) for stage in self.stages
         }
+        self._wakeup_events = {stage: asyncio.Event() for stage in TaskStage}
+        unsubscribe_wakeup = self._subscribe_queue_wakeup()
         pollers = [
-            asyncio.create_task(self._supervised_stage_poll_loop(stage, semaphores[stage])) for stage in TaskStage
+            asyncio.create_task(self._supervised_stage_poll_loop(stage, semaphores[stage])) for stage in self.stages
         ]
         # Long-running watchdog that catches tasks left in ``processing`` by
         # crashes or by the lock-race bookkeeping failure that motivated
@@ -416,9 +449,43 @@ class TaskWorker:
             await asyncio.gather(*pollers, return_exceptions=True)
         except asyncio.CancelledError:
             pass
+        finally:
+            if unsubscribe_wakeup is not None:
+                unsubscribe_wakeup()
 
         logger.info("task_worker_loop_ended")
 
+    def _subscribe_queue_wakeup(self) -> Optional[Callable[[], None]]:
+        """Subscribe to the queue's enqueue notifications, if it publishes any.
+
+        Returns the unsubscribe callable, or ``None`` for a queue without a
+        ``QueueWakeup`` (the pollers then fall back to pure interval polling).
+        A queue that can also hear other processes' enqueues
+        (``listen_for_wakeups``, the Postgres queue) is asked to, and the
+        idle poll relaxes to ``LISTENING_POLL_INTERVAL`` while it does.
+        """
+        wakeup = getattr(self.queue_manager, "wakeup", None)
+        if not isinstance(wakeup, QueueWakeup):
+            return None
+        unsubscribe = wakeup.subscribe(self._on_queue_wakeup)
+
+        listen = getattr(self.queue_manager, "listen_for_wakeups", None)
+        if listen is None:
+            return unsubscribe
+        try:
+            stop_listening = listen()
+        except Exception as e:
+            logger.warning("queue_wakeup_listen_failed", error=str(e))
+            return unsubscribe
+        self._idle_poll_interval = max(self.poll_interval, self.LISTENING_POLL_INTERVAL)
+
+        def _unsubscribe() -> None:
+            stop_listening()
+            unsubscribe()
+            self._idle_poll_interval = self.poll_interval
+
+        return _unsubscribe
+
     async def _sleep_unless_stopped(self, seconds: float) -> None:
         """Sleep up to ``seconds``, waking within ~2s of ``stop()``.
 
@@ -576,35 +643,42 @@ class TaskWorker:
                     slots = 0
 
                 if slots > 0:
+                    # Spec #49 L1 — gate on the breaker. When OPEN the call
+                    # returns False and the stage pauses; when it promotes to
+                    # HALF_OPEN it reserves a single probe slot that we MUST
+                    # release (cancel_dispatch) if the queue can't fill it.
+                    # Reserve every slot we intend to claim up front so the
+                    # whole batch goes out in one queue transaction.
+                    reserved = 0
                     for _ in range(slots):
-                        # Spec #49 L1 — gate on the breaker. When OPEN the call
-                        # returns False and the stage pauses; when it promotes
-                        # to HALF_OPEN it reserves a single probe slot that we
-                        # MUST release (cancel_dispatch) if the queue is empty.
                         if self._breaker is not None and not self._breaker.allow_dispatch(stage):
                             break
+                        reserved += 1
 
+                    tasks: list = []
+                    if reserved > 0:
                         try:
-                            task = self.queue_manager.get_next_task(
-                                stage=stage,
+                            tasks = self.queue_manager.claim_batch(
+                                stage,
+                                reserved,
                                 exclude_episode_ids=exclude_eps,
                                 exclude_podcast_ids=exclude_pods,
                             )
                         except Exception:
                             # A poll error here (e.g. the DB going down mid
-                            # half-open probe) skips both the empty-queue and
-                            # dispatch paths, so the reservation taken by
-                            # allow_dispatch above would leak and wedge the
-                            # stage until a restart. Release it, then let the
-                            # loop's handler deal with the error.
-                            if self._breaker is not None:
-                                self._breaker.cancel_dispatch(stage)
+                            # half-open probe) skips the dispatch path, so the
+                            # reservations taken by allow_dispatch above would
+                            # leak and wedge the stage until a restart. Release
+                            # them, then let the loop's handler deal with the
+                            # error.
+                            self._cancel_reservations(stage, reserved)
                             raise
-                        if task is None:
-                            if self._breaker is not None:
-                                self._breaker.cancel_dispatch(stage)
-                            break
 
+                    # Reservations the queue could not fill (empty or short
+                    # batch) are released so a half-open probe isn't leaked.
+                    self._cancel_reservations(stage, reserved - len(tasks))
+
+                    for task in tasks:
                         key = self._task_key(task)
                         with self._active_lock:
                             # Recheck under lock: another stage may have claimed this
@@ -615,16 +689,13 @@ class TaskWorker:
                                 # Another stage claimed this target; release the
                                 # probe slot we may have reserved so it isn't
                                 # leaked, then move on.
-                                if self._breaker is not None:
-                                    self._breaker.cancel_dispatch(stage)
+                                self._cancel_reservations(stage, 1)
                                 continue
                             active[key] = task
-                            exclude_eps = self._all_active_episode_ids_locked() or None
-                            exclude_pods = self._all_active_podcast_ids_locked() or None
 
                         asyncio.create_task(self._process_task_async(task, sem, stage))
 
-                await asyncio.sleep(self.poll_interval)
+                await self._wait_for_wakeup(stage)
 
             except Exception as e:
                 logger.exception(
@@ -637,6 +708,51 @@ class TaskWorker:
 
         logger.info("stage_poll_loop_ended", stage=stage.value)
 
+    def _cancel_reservations(self, stage: TaskStage, count: int) -> None:
+        """Release ``count`` breaker dispatch reservations for ``stage``."""
+        if self._breaker is None:
+            return
+        for _ in range(max(0, count)):
+            self._breaker.cancel_dispatch(stage)
+
+    def _on_queue_wakeup(self, stage: Optional[TaskStage]) -> None:
+        """``QueueWakeup`` listener: wake ``stage``'s poller (or every poller).
+
+        Runs on whichever thread enqueued the task (a web request, a handler
+        thread fanning out the next stage), so it only hands the event flip to
+        the worker's loop — asyncio events are not thread-safe.
+        """
+        loop = self._loop
+        if loop is None or loop.is_closed():
+            return
+        events = self._wakeup_events
+        targets = [events[stage]] if stage is not None and stage in events else list(events.values())
+        for event in targets:
+            try:
+                loop.call_soon_threadsafe(event.set)
+            except RuntimeError:
+                # Loop closed between the check and the call (shutdown race).
+                return
+
+    async def _wait_for_wakeup(self, stage: TaskStage) -> None:
+        """Sleep until ``stage`` is woken by an enqueue or a freed slot, or
+        the idle poll interval elapses — whichever comes first.
+
+        The timeout keeps the poll as a fallback for work this process is not
+        told about: tasks enqueued by another process (unless the queue relays
+        them, see :meth:`_subscribe_queue_wakeup`) and ``retry_scheduled``
+        rows whose backoff has elapsed.
+        """
+        event = self._wakeup_events.get(stage)
+        if event is None:
+            await asyncio.sleep(self.poll_interval)
+            return
+        try:
+            await asyncio.wait_for(event.wait(), timeout=self._idle_poll_interval)
+        except (asyncio.TimeoutError, TimeoutError):
+            pass
+        event.clear()
+
     async def _process_task_async(self, task: Task, sem: asyncio.Semaphore, stage: TaskStage) -> None:
         """Process a task in a thread, bounded by the stage's semaphore.
 
@@ -690,6 +806,11 @@ class TaskWorker:
             finally:
                 with self._active_lock:
                     self._active_by_stage[stage].pop(self._task_key(task), None)
+                # A slot just freed up: let the poller claim the next task now
+                # rather than on its next interval tick.
+                event = self._wakeup_events.get(stage)
+                if event is not None:
+                    event.set()
 
     def _process_task(self, task: Task) -> None:
         """
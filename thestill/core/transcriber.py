@@ -90,6 +90,38 @@ class Transcriber(ABC):
             console = getattr(self, "console", None) or ConsoleOutput()
             console.error(f"Error saving transcript: {e}")
 
+    def _transcribe_silence_chunked(
+        self, provider: str, audio_path: str, output_path: Optional[str], options: TranscribeOptions
+    ) -> Optional[Transcript]:
+        """Run the silence-chunked multi-process path when it applies.
+
+        Local CPU engines set ``model_name``, ``chunk_workers`` and
+        ``chunk_seconds``; anything else (GPU devices, one worker, short or
+        non-WAV audio, a failed chunk) returns ``None`` and the caller
+        transcribes single-stream. Per-chunk ``ProgressUpdate``s go to the
+        transcriber's own ``progress_callback``, the one the pipeline wires
+        to SSE, not to ``options.progress_callback``.
+        """
+        workers = getattr(self, "chunk_workers", 1)
+        model_name = getattr(self, "model_name", None)
+        if workers <= 1 or model_name is None or getattr(self, "device", "cpu") != "cpu":
+            return None
+        from .chunked_transcription import transcribe_in_chunks  # pylint: disable=import-outside-toplevel
+
+        transcript = transcribe_in_chunks(
+            audio_path,
+            provider=provider,
+            model_name=model_name,
+            device="cpu",
+            workers=workers,
+            chunk_seconds=getattr(self, "chunk_seconds", 300),
+            language=options.language,
+            progress_callback=getattr(self, "progress_callback", None),
+        )
+        if transcript is not None and output_path:
+            self._save_transcript(transcript, output_path)
+        return transcript
+
     def _get_audio_duration_minutes(self, audio_path: str) -> float:
         """Get audio duration in minutes using ffprobe."""
         return get_audio_duration_minutes(audio_path)
@@ -21,6 +21,7 @@ once, not three times. Entry points layer their own UX (CLI echoes,
 webhook-server lifecycle, MCP JSON responses) on top of this factory.
 """
 
+import time
 from typing import TYPE_CHECKING, Optional
 
 from structlog import get_logger
@@ -28,6 +29,7 @@ from structlog import get_logger
 from thestill.utils.exceptions import ThestillError
 
 from ..utils.console import ConsoleOutput
+from .model_pool import get_model_pool
 from .progress import ProgressCallback
 from .transcriber import Transcriber
 
@@ -36,6 +38,10 @@ if TYPE_CHECKING:
 
 logger = get_logger(__name__)
 
+# Providers that run inference in-process (and so lease from the model pool).
+# Empty string is create_transcriber's Whisper fallback.
+LOCAL_TRANSCRIPTION_PROVIDERS = ("whisper", "whisperx", "parakeet", "")
+
 
 def validate_transcription_provider(config) -> None:
     """
@@ -149,7 +155,8 @@ def create_transcriber(
             operations (Dalston, ElevenLabs, Google chunked mode).
             Falls back to config.path_manager when available.
         progress_callback: Optional callback for stage-level progress.
-            Only WhisperX currently forwards this.
+            WhisperX forwards this, and local Whisper / Parakeet report
+            per-chunk progress through it on the chunked path.
         console: ConsoleOutput instance. Defaults to quiet (suitable
             for web workers and MCP, whose stdout is reserved for
             JSON-RPC or structured logs).
@@ -227,7 +234,14 @@ def create_transcriber(
     if provider == "parakeet":
         from .parakeet_transcriber import ParakeetTranscriber
 
-        return ParakeetTranscriber(config.whisper_device, console=effective_console)
+        return ParakeetTranscriber(
+            config.whisper_device,
+            console=effective_console,
+            model_pool=get_model_pool(),
+            chunk_workers=config.transcribe_chunk_workers,
+            chunk_seconds=config.transcribe_chunk_seconds,
+            progress_callback=progress_callback,
+        )
 
     # Local Whisper / WhisperX (also the empty-string fallback).
     if config.enable_diarization:
@@ -243,6 +257,7 @@ def create_transcriber(
             diarization_model=config.diarization_model,
             progress_callback=progress_callback,
             console=effective_console,
+            model_pool=get_model_pool(),
         )
 
     from .whisper_transcriber import WhisperTranscriber
@@ -251,4 +266,36 @@ def create_transcriber(
         config.whisper_model,
         config.whisper_device,
         console=effective_console,
+        model_pool=get_model_pool(),
+        chunk_workers=config.transcribe_chunk_workers,
+        chunk_seconds=config.transcribe_chunk_seconds,
+        progress_callback=progress_callback,
     )
+
+
+def warm_transcription_models(config) -> bool:
+    """Preload the configured local provider's models into the model pool.
+
+    Cloud providers have nothing to warm. Returns True when a load ran.
+    Used by the web worker at start-up (``MODEL_POOL_WARMUP``); failures are
+    logged and left for the first TRANSCRIBE task to surface.
+    """
+    if config.transcription_provider.lower() not in LOCAL_TRANSCRIPTION_PROVIDERS:
+        return False
+    try:
+        transcriber = create_transcriber(config)
+        warm_up = getattr(transcriber, "warm_up", None)
+        if warm_up is None:
+            return False
+        started = time.perf_counter()
+        warm_up()
+        logger.info(
+            "transcription_models_warmed",
+            provider=config.transcription_provider,
+            seconds=round(time.perf_counter() - started, 1),
+            pool=get_model_pool().stats(),
+        )
+        return True
+    except Exception as exc:
+        logger.warning("transcription_model_warmup_failed", provider=config.transcription_provider, error=str(exc))
+        return False
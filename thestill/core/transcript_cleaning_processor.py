@@ -47,6 +47,7 @@ from .llm_provider import LLMProvider
 from .segmented_transcript_cleaner import SegmentedTranscriptCleaner
 from .transcript_formatter import TranscriptFormatter
 from .transcript_segmenter import TranscriptSegmenter
+from .word_index import build_word_index, word_index_path, write_word_index
 
 logger = get_logger(__name__)
 
@@ -84,6 +85,7 @@ class TranscriptCleaningProcessor:
         provider: LLMProvider,
         chunk_size: Optional[int] = None,
         console: Optional[ConsoleOutput] = None,
+        batch_concurrency: int = 1,
     ):
         """
         Initialize transcript cleaning processor with an LLM provider.
@@ -97,8 +99,11 @@ class TranscriptCleaningProcessor:
                        - GPT-4/GPT-4o: 100K chars (~25K tokens from 128K context)
                        - Ollama/Other: 30K chars (conservative default)
             console: ConsoleOutput instance for user-facing messages (optional)
+            batch_concurrency: LLM batches the segmented cleaner keeps in
+                flight (``CLEAN_BATCH_CONCURRENCY``); 1 keeps it serial
         """
         self.provider = provider
+        self.batch_concurrency = batch_concurrency
         self.formatter = TranscriptFormatter(console=console)
 
         # Auto-set chunk_size based on provider if not specified
@@ -297,7 +302,7 @@ class TranscriptCleaningProcessor:
         # Markdown is derived from it for the summariser.
         segmenter = TranscriptSegmenter()
         annotated = segmenter.repair(transcript_model)
-        cleaner = SegmentedTranscriptCleaner(self.provider)
+        cleaner = SegmentedTranscriptCleaner(self.provider, batch_concurrency=self.batch_concurrency)
         cleaned_annotated = cleaner.clean(
             annotated=annotated,
             podcast_facts=podcast_facts,
@@ -327,6 +332,7 @@ class TranscriptCleaningProcessor:
             json_sidecar.write_text(cleaned_annotated.model_dump_json(indent=2), encoding="utf-8")
             cleaned_json_path = str(json_sidecar)
             logger.info(f"Saved annotated transcript JSON: {json_sidecar}")
+            self._save_word_index(json_sidecar, cleaned_annotated, transcript_model)
 
         processing_time = time.time() - start_time
         logger.info(f"Transcript cleaning completed in {processing_time:.1f} seconds")
@@ -339,6 +345,23 @@ class TranscriptCleaningProcessor:
             "processing_time": processing_time,
         }
 
+    @staticmethod
+    def _save_word_index(json_sidecar: Path, annotated, transcript) -> None:
+        """Write the karaoke word index next to the JSON sidecar.
+
+        Best-effort: the web endpoint rebuilds a missing index on first
+        request, so a failure here is logged rather than failing the clean.
+        """
+        index_path = word_index_path(json_sidecar)
+        try:
+            index = build_word_index(annotated, transcript)
+            write_word_index(index_path, index)
+        except Exception as exc:  # pylint: disable=broad-except
+            index_path.unlink(missing_ok=True)  # never leave a stale index behind
+            logger.warning("word_index_write_failed", path=str(index_path), error=str(exc))
+            return
+        logger.info("word_index_saved", path=str(index_path), segments=len(index), words=index.word_count)
+
     def _save_phase_output(self, output_path: str, phase: str, data, episode_id: str = ""):
         """
         Save output from a specific phase immediately after completion.
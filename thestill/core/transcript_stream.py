@@ -0,0 +1,295 @@
+# Copyright 2025-2026 Thestill
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Streaming, segment-at-a-time reader for transcript JSON.
+
+``Transcript.model_validate_json`` on a three-hour raw transcript builds a
+Pydantic object per word (~30k of them) on top of the decoded text, and
+the whole tree stays alive until the caller is done; the
+``AnnotatedTranscript`` sidecar is smaller but is loaded in full by
+reindex, the chunk backfill and narration just to read each segment's
+text, speaker and timing. :class:`TranscriptStreamReader` walks either
+file shape one segment at a time instead.
+
+- **Pull parser.** The file is read in chunks; the top-level object and
+  the ``segments`` array are walked by hand, and each value under them
+  (one segment, one header field) is decoded on its own with
+  ``json.JSONDecoder.raw_decode``. Peak memory is one chunk plus one
+  segment, not the document.
+- **Words.** ``words="skip"`` (default) drops each segment's word dicts as
+  soon as the segment is decoded, so no per-word objects outlive it;
+  ``words="arrays"`` keeps them as a :class:`WordArrays` (a list of
+  strings and two float arrays) instead of ``Word`` models.
+- **Header.** Top-level fields other than ``segments`` (``episode_id``,
+  ``playback_time_offset_seconds``, ``language``, ...) are collected in
+  ``reader.header``; it is complete once iteration finishes, since the
+  key order is whatever the writer used.
+- **Shape-agnostic.** A :class:`SegmentView` carries the fields both
+  models share (``id``, ``start``, ``end``, ``text``, ``speaker``) plus
+  ``kind`` for annotated segments; anything else lands in ``extra``.
+  ``AnnotatedSegment.kind`` defaults to ``"content"`` and is omitted by
+  some writers, so callers reading a sidecar pass
+  ``default_kind="content"`` to get the same value the model would.
+  There is no schema validation — callers that need the full models
+  (CLEAN, the segmenter) keep using Pydantic.
+"""
+
+from __future__ import annotations
+
+import io
+import json
+import re
+from array import array
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import IO, Any, Dict, Iterator, List, Literal, Optional, Union
+
+WordsMode = Literal["skip", "arrays"]
+
+DEFAULT_CHUNK_SIZE = 64 * 1024
+
+_decoder = json.JSONDecoder()
+_WS = re.compile(r"[ \t\n\r]*")
+_COMMON_FIELDS = ("id", "start", "end", "text", "speaker", "kind")
+
+
+class TranscriptStreamError(ValueError):
+    """The input is not a transcript JSON document (or is truncated)."""
+
+
+@dataclass
+class WordArrays:
+    """One segment's words as parallel columns.
+
+    Missing ``start`` / ``end`` timestamps are stored as NaN so the columns
+    stay aligned with ``words``.
+    """
+
+    words: List[str] = field(default_factory=list)
+    starts: array = field(default_factory=lambda: array("d"))
+    ends: array = field(default_factory=lambda: array("d"))
+
+    def __len__(self) -> int:
+        return len(self.words)
+
+
+@dataclass(slots=True)
+class SegmentView:
+    """Lightweight stand-in for a ``Segment`` / ``AnnotatedSegment``."""
+
+    id: int
+    start: float
+    end: float
+    text: str = ""
+    speaker: Optional[str] = None
+    kind: Optional[str] = None
+    words: Optional[WordArrays] = None
+    extra: Dict[str, Any] = field(default_factory=dict)
+
+
+@dataclass
+class StreamedTranscript:
+    """``segments`` plus top-level ``header`` fields, as loaded by :func:`load_segments`."""
+
+    segments: List[SegmentView]
+    header: Dict[str, Any]
+
+
+class TranscriptStreamReader:
+    """Iterate the ``segments`` of a transcript JSON document lazily.
+
+    ``source`` is a text file object, a path, or an already-read string.
+    Segments without a ``kind`` get ``default_kind``. The reader is
+    single-use: iterate it once.
+    """
+
+    def __init__(
+        self,
+        source: Union[str, Path, IO[str]],
+        *,
+        words: WordsMode = "skip",
+        default_kind: Optional[str] = None,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+    ) -> None:
+        if words not in ("skip", "arrays"):
+            raise ValueError(f"words must be 'skip' or 'arrays', got {words!r}")
+        self.words_mode = words
+        self.default_kind = default_kind
+        self.header: Dict[str, Any] = {}
+        self._owned: Optional[IO[str]] = None
+        if isinstance(source, Path):
+            self._owned = source.open("r", encoding="utf-8")
+            self._fp: IO[str] = self._owned
+        elif isinstance(source, str):
+            self._fp = io.StringIO(source)
+        else:
+            self._fp = source
+        self._chunk_size = max(1024, chunk_size)
+        self._buf = ""
+        self._pos = 0
+        self._eof = False
+
+    def __iter__(self) -> Iterator[SegmentView]:
+        try:
+            self._expect("{")
+            for key in self._object_keys():
+                if key == "segments":
+                    yield from self._segments()
+                else:
+                    self.header[key] = self._value()
+            self._skip_ws()
+            if self._pos < len(self._buf):
+                raise TranscriptStreamError(f"trailing data at offset {self._pos}")
+        finally:
+            if self._owned is not None:
+                self._owned.close()
+
+    # -- segments ---------------------------------------------------------
+
+    def _segments(self) -> Iterator[SegmentView]:
+        if self._peek() == "n":  # "segments": null
+            self._value()
+            return
+        self._expect("[")
+        for _ in self._array_items():
+            yield self._segment()
+
+    def _segment(self) -> SegmentView:
+        # One segment is decoded in C and converted; its word dicts die with it.
+        raw = self._value()
+        if not isinstance(raw, dict):
+            raise TranscriptStreamError(f"expected a segment object before offset {self._pos}")
+        word_list = raw.pop("words", None)
+        fields = {key: raw.pop(key) for key in _COMMON_FIELDS if key in raw}
+        fields.setdefault("kind", self.default_kind)
+        words = self._word_arrays(word_list) if self.words_mode == "arrays" else None
+        try:
+            return SegmentView(words=words, extra=raw, **fields)
+        except TypeError as exc:  # missing id / start / end
+            raise TranscriptStreamError(f"segment is missing a required field: {exc}") from exc
+
+    @staticmethod
+    def _word_arrays(word_list: Optional[List[Dict[str, Any]]]) -> WordArrays:
+        out = WordArrays()
+        if not word_list:
+            return out
+        nan = float("nan")
+        out.words = [w.get("word", "") for w in word_list]
+        out.starts = array("d", [nan if (v := w.get("start")) is None else v for w in word_list])
+        out.ends = array("d", [nan if (v := w.get("end")) is None else v for w in word_list])
+        return out
+
+    # -- tokenizer --------------------------------------------------------
+
+    def _more(self) -> int:
+        """Append a chunk, dropping consumed input. Returns how far indices shifted."""
+        if self._eof:
+            raise TranscriptStreamError("unexpected end of transcript JSON")
+        shift = self._pos
+        # Grow with the pending tail so one large value is not re-scanned per chunk.
+        chunk = self._fp.read(max(self._chunk_size, len(self._buf) - self._pos))
+        if not chunk:
+            self._eof = True
+        self._buf = self._buf[self._pos :] + chunk
+        self._pos = 0
+        return shift
+
+    def _skip_ws(self) -> None:
+        while True:
+            self._pos = _WS.match(self._buf, self._pos).end()
+            if self._pos < len(self._buf) or self._eof:
+                return
+            self._more()
+
+    def _peek(self) -> str:
+        self._skip_ws()
+        if self._pos >= len(self._buf):
+            raise TranscriptStreamError("unexpected end of transcript JSON")
+        return self._buf[self._pos]
+
+    def _expect(self, char: str) -> None:
+        found = self._peek()
+        if found != char:
+            raise TranscriptStreamError(f"expected {char!r} at offset {self._pos}, found {found!r}")
+        self._pos += 1
+
+    def _object_keys(self) -> Iterator[str]:
+        """Yield each key of the object whose ``{`` was just consumed; the
+        caller must consume the value before asking for the next key."""
+        if self._peek() == "}":
+            self._pos += 1
+            return
+        while True:
+            key = self._value()
+            if not isinstance(key, str):
+                raise TranscriptStreamError(f"expected an object key at offset {self._pos}")
+            self._expect(":")
+            yield key
+            sep = self._peek()
+            self._pos += 1
+            if sep == "}":
+                return
+            if sep != ",":
+                raise TranscriptStreamError(f"expected ',' or '}}' at offset {self._pos - 1}")
+
+    def _array_items(self) -> Iterator[None]:
+        """Yield once per element of the array whose ``[`` was just consumed."""
+        if self._peek() == "]":
+            self._pos += 1
+            return
+        while True:
+            yield
+            sep = self._peek()
+            self._pos += 1
+            if sep == "]":
+                return
+            if sep != ",":
+                raise TranscriptStreamError(f"expected ',' or ']' at offset {self._pos - 1}")
+
+    def _value(self) -> Any:
+        self._skip_ws()
+        while True:
+            try:
+                value, end = _decoder.raw_decode(self._buf, self._pos)
+            except json.JSONDecodeError:
+                if self._eof:
+                    raise TranscriptStreamError(f"invalid JSON value at offset {self._pos}") from None
+                self._more()
+                continue
+            # A number or literal that ends exactly at the buffer edge may continue in the next chunk.
+            if end == len(self._buf) and not self._eof:
+                self._more()
+                continue
+            self._pos = end
+            return value
+
+
+def iter_segments(
+    source: Union[str, Path, IO[str]], *, words: WordsMode = "skip", default_kind: Optional[str] = None
+) -> Iterator[SegmentView]:
+    """Lazily yield each segment of a transcript JSON document."""
+    return iter(TranscriptStreamReader(source, words=words, default_kind=default_kind))
+
+
+def load_segments(
+    source: Union[str, Path, IO[str]], *, words: WordsMode = "skip", default_kind: Optional[str] = None
+) -> StreamedTranscript:
+    """Read every segment into a list of :class:`SegmentView`.
+
+    The result has a ``segments`` attribute like the Pydantic models, so
+    code that only walks segment text, speaker and timing takes either.
+    """
+    reader = TranscriptStreamReader(source, words=words, default_kind=default_kind)
+    segments = list(reader)
+    return StreamedTranscript(segments=segments, header=reader.header)
@@ -22,6 +22,7 @@ WhisperXTranscriber: Enhanced Whisper with speaker diarization via pyannote.audi
 import shutil
 import threading
 import time
+from contextlib import nullcontext
 from pathlib import Path
 from typing import Dict, List, Optional
 
@@ -35,6 +36,7 @@ from thestill.utils.device import resolve_hybrid_devices
 from thestill.utils.duration import get_audio_duration_float
 from thestill.utils.stdout_capture import WHISPERX_PROGRESS_PATTERN, StdoutProgressCapture
 
+from .model_pool import ModelKey, ModelPool
 from .progress import ProgressCallback, ProgressUpdate, TranscriptionStage
 from .transcriber import Transcriber
 
@@ -210,37 +212,71 @@ class WhisperTranscriber(Transcriber):
     - Optional LLM-based transcript cleaning
     """
 
-    def __init__(self, model_name: str = "base", device: str = "auto", console: Optional[ConsoleOutput] = None):
+    def __init__(
+        self,
+        model_name: str = "base",
+        device: str = "auto",
+        console: Optional[ConsoleOutput] = None,
+        model_pool: Optional[ModelPool] = None,
+        chunk_workers: int = 1,
+        chunk_seconds: int = 300,
+        progress_callback: Optional[ProgressCallback] = None,
+    ):
         self.model_name = model_name
         self.device = self._resolve_device(device)
         self._model = None
         self.console = console or ConsoleOutput()
+        # CPU only: >1 splits long WAVs at pauses across worker processes
+        # (see core/chunked_transcription.py).
+        self.chunk_workers = chunk_workers
+        self.chunk_seconds = chunk_seconds
+        # Receives per-chunk updates on the chunked path.
+        self.progress_callback = progress_callback
+        # When set, the model is leased from this process-wide pool and stays
+        # resident across instances instead of living on ``self._model``.
+        self.model_pool = model_pool
+        self._pool_key = ModelKey("whisper", self.model_name, self.device)
 
     def load_model(self) -> None:
         """Lazy load the Whisper model"""
         if self._model is not None:
             return
+        self._model = self._load_whisper_model()
+
+    def warm_up(self) -> None:
+        """Load the model into the pool ahead of the first transcription."""
+        if self.model_pool is not None:
+            self.model_pool.warm(self._pool_key, self._load_whisper_model)
 
+    def _lease_model(self):
+        """Context manager yielding the model — pooled when a pool is set."""
+        if self.model_pool is not None:
+            return self.model_pool.lease(self._pool_key, self._load_whisper_model)
+        self.load_model()
+        return nullcontext(self._model)
+
+    def _load_whisper_model(self):
         import whisper  # pylint: disable=import-outside-toplevel
 
         self.console.info(f"Loading Whisper model: {self.model_name}")
         try:
-            self._model = whisper.load_model(self.model_name, device=self.device)
+            model = whisper.load_model(self.model_name, device=self.device)
             self.console.success("Model loaded successfully")
         except Exception as e:
             self.console.error(f"Error loading model: {e}")
             if "don't know how to restore data location" in str(e):
                 self.console.info("Model cache corruption detected, clearing cache and retrying...")
                 self._clear_model_cache()
-                self._model = whisper.load_model(self.model_name, device=self.device)
+                model = whisper.load_model(self.model_name, device=self.device)
                 self.console.success("Model loaded successfully after cache clear")
             elif "SparseMPS" in str(e) or "_sparse_coo_tensor_with_dims_and_tensors" in str(e):
                 self.console.warning("MPS sparse tensor issue detected, falling back to CPU...")
                 self.device = "cpu"
-                self._model = whisper.load_model(self.model_name, device="cpu")
+                model = whisper.load_model(self.model_name, device="cpu")
                 self.console.success("Model loaded successfully on CPU")
             else:
                 raise
+        return model
 
     def _clear_model_cache(self) -> None:
         """Clear Whisper model cache to fix compatibility issues"""
@@ -265,27 +301,30 @@ class WhisperTranscriber(Transcriber):
             options: Transcription options including language and progress callback.
         """
         try:
-            self.load_model()
-
-            self.console.info(f"Starting transcription of: {Path(audio_path).name}")
-            start_time = time.time()
-
-            audio_duration = self._get_audio_duration_minutes(audio_path)
-            self.console.info(f"Audio duration: {audio_duration:.1f} minutes")
-
-            transcribe_options = {
-                "language": options.language,
-                "task": "transcribe",
-                "verbose": True,
-                "word_timestamps": True,
-                "temperature": 0.0,
-                "no_speech_threshold": 0.6,
-                "logprob_threshold": -1.0,
-                "compression_ratio_threshold": 2.4,
-                "condition_on_previous_text": False,
-            }
-
-            result = self._model.transcribe(audio_path, **transcribe_options)
+            chunked = self._transcribe_silence_chunked("whisper", audio_path, output_path, options)
+            if chunked is not None:
+                return chunked
+
+            with self._lease_model() as model:
+                self.console.info(f"Starting transcription of: {Path(audio_path).name}")
+                start_time = time.time()
+
+                audio_duration = self._get_audio_duration_minutes(audio_path)
+                self.console.info(f"Audio duration: {audio_duration:.1f} minutes")
+
+                transcribe_options = {
+                    "language": options.language,
+                    "task": "transcribe",
+                    "verbose": True,
+                    "word_timestamps": True,
+                    "temperature": 0.0,
+                    "no_speech_threshold": 0.6,
+                    "logprob_threshold": -1.0,
+                    "compression_ratio_threshold": 2.4,
+                    "condition_on_previous_text": False,
+                }
+
+                result = model.transcribe(audio_path, **transcribe_options)
 
             processing_time = time.time() - start_time
             self.console.success(f"Transcription completed in {processing_time:.1f} seconds")
@@ -566,9 +605,13 @@ class WhisperXTranscriber(Transcriber):
         diarization_model: str = "pyannote/speaker-diarization-3.1",
         progress_callback: Optional[ProgressCallback] = None,
         console: Optional[ConsoleOutput] = None,
+        model_pool: Optional[ModelPool] = None,
     ):
         self.model_name = model_name
         self.console = console or ConsoleOutput()
+        # ASR, alignment and diarization models are each leased from this
+        # pool when set (resident across tasks), else loaded per instance.
+        self.model_pool = model_pool
         # Resolve devices for each stage (hybrid approach for Mac)
         self.transcription_device, self.alignment_device, self.diarization_device = self._resolve_hybrid_devices(device)
         # Keep self.device for backward compatibility (used by fallback and progress monitor)
@@ -606,24 +649,74 @@ class WhisperXTranscriber(Transcriber):
         if self._model is not None or not WHISPERX_AVAILABLE:
             return
 
-        self.console.info(f"Loading WhisperX model: {self.model_name} (device: {self.transcription_device})")
         try:
-            self._model = whisperx.load_model(
-                self.model_name,
-                device=self.transcription_device,
-                compute_type="float16" if self.transcription_device == "cuda" else "int8",
-            )
-            self.console.success("WhisperX model loaded successfully")
+            self._model = self._load_whisperx_model()
         except Exception as e:
             self.console.error(f"Error loading WhisperX model: {e}")
             self.console.info("Falling back to standard Whisper")
             self._load_whisper_fallback()
 
+    def warm_up(self) -> None:
+        """Load the ASR (and diarization) models into the pool ahead of use.
+
+        The alignment model is per-language and is left to the first task.
+        """
+        if self.model_pool is None or not WHISPERX_AVAILABLE:
+            return
+        self.model_pool.warm(self._asr_key(), self._load_whisperx_model)
+        if self.enable_diarization and PYANNOTE_AVAILABLE:
+            self.model_pool.warm(self._diarization_key(), self._load_diarization_pipeline)
+
+    def _asr_key(self) -> ModelKey:
+        return ModelKey("whisperx", self.model_name, self.transcription_device)
+
+    def _diarization_key(self) -> ModelKey:
+        return ModelKey("pyannote", self.diarization_model, self.diarization_device)
+
+    def _lease_asr_model(self):
+        """Context manager yielding the WhisperX model, or None if unavailable.
+
+        Without a pool a failed load falls back to Whisper (``None``); with
+        one, a load error surfaces on entry and takes the same fallback via
+        ``transcribe_audio``'s handler.
+        """
+        if not WHISPERX_AVAILABLE:
+            return None
+        if self.model_pool is not None:
+            return self.model_pool.lease(self._asr_key(), self._load_whisperx_model)
+        self.load_model()
+        return nullcontext(self._model) if self._model is not None else None
+
+    def _lease(self, key: ModelKey, loader):
+        """Lease ``key`` from the pool, or load it for this call only."""
+        if self.model_pool is not None:
+            return self.model_pool.lease(key, loader)
+        return nullcontext(loader())
+
+    def _load_whisperx_model(self):
+        self.console.info(f"Loading WhisperX model: {self.model_name} (device: {self.transcription_device})")
+        model = whisperx.load_model(
+            self.model_name,
+            device=self.transcription_device,
+            compute_type="float16" if self.transcription_device == "cuda" else "int8",
+        )
+        self.console.success("WhisperX model loaded successfully")
+        return model
+
+    def _load_diarization_pipeline(self):
+        import torch  # pylint: disable=import-outside-toplevel
+
+        self.console.info(f"  - Loading diarization model ({self.diarization_model}) on {self.diarization_device}...")
+        diarize_model = Pipeline.from_pretrained(self.diarization_model, use_auth_token=self.hf_token)
+        if self.diarization_device != "cpu":
+            diarize_model.to(torch.device(self.diarization_device))
+        return diarize_model
+
     def _load_whisper_fallback(self) -> None:
         """Load standard Whisper as fallback"""
         if self._whisper_fallback is None:
             self._whisper_fallback = WhisperTranscriber(
-                model_name=self.model_name, device=self.device, console=self.console
+                model_name=self.model_name, device=self.device, console=self.console, model_pool=self.model_pool
             )
 
     def _report_progress(
@@ -686,9 +779,9 @@ class WhisperXTranscriber(Transcriber):
                 "Loading WhisperX model...",
             )
 
-            self.load_model()
+            asr_lease = self._lease_asr_model()
 
-            if self._model is None:
+            if asr_lease is None:
                 self._load_whisper_fallback()
                 return self._whisper_fallback.transcribe_audio(
                     audio_path,
@@ -720,12 +813,15 @@ class WhisperXTranscriber(Transcriber):
 
             # Disable stdout passthrough when console is quiet to avoid broken pipe
             # errors in web worker context where stdout may not be connected
-            with StdoutProgressCapture(
-                WHISPERX_PROGRESS_PATTERN,
-                on_transcribe_progress,
-                passthrough=not self.console.quiet,
+            with (
+                asr_lease as asr_model,
+                StdoutProgressCapture(
+                    WHISPERX_PROGRESS_PATTERN,
+                    on_transcribe_progress,
+                    passthrough=not self.console.quiet,
+                ),
             ):
-                result = self._model.transcribe(
+                result = asr_model.transcribe(
                     processed_audio_path,
                     batch_size=16,
                     language=options.language,
@@ -742,18 +838,20 @@ class WhisperXTranscriber(Transcriber):
             self.console.info(
                 f"  - Loading alignment model for {result['language']} (device: {self.alignment_device})..."
             )
-            model_a, metadata = whisperx.load_align_model(
-                language_code=result["language"], device=self.alignment_device
-            )
-            self.console.info(f"  - Running alignment on {len(result.get('segments', []))} segments...")
-            result = whisperx.align(
-                result["segments"],
-                model_a,
-                metadata,
-                processed_audio_path,
-                self.alignment_device,
-                return_char_alignments=False,
-            )
+            align_language = result["language"]
+            with self._lease(
+                ModelKey("whisperx-align", align_language, self.alignment_device),
+                lambda: whisperx.load_align_model(language_code=align_language, device=self.alignment_device),
+            ) as (model_a, metadata):
+                self.console.info(f"  - Running alignment on {len(result.get('segments', []))} segments...")
+                result = whisperx.align(
+                    result["segments"],
+                    model_a,
+                    metadata,
+                    processed_audio_path,
+                    self.alignment_device,
+                    return_char_alignments=False,
+                )
             self.console.success("Alignment complete")
 
             # Step 3: Speaker diarization
@@ -827,20 +925,10 @@ class WhisperXTranscriber(Transcriber):
         """
         try:
             self.console.info("Step 3: Performing speaker diarization...")
-            self.console.info(
-                f"  - Loading diarization model ({self.diarization_model}) on {self.diarization_device}..."
-            )
 
             if not PYANNOTE_AVAILABLE:
                 raise ImportError("pyannote.audio is required for speaker diarization")
 
-            import torch  # pylint: disable=import-outside-toplevel
-
-            diarize_model = Pipeline.from_pretrained(self.diarization_model, use_auth_token=self.hf_token)
-
-            if self.diarization_device != "cpu":
-                diarize_model.to(torch.device(self.diarization_device))
-
             self.console.info("  - Analyzing audio for speaker patterns...")
             if self.min_speakers or self.max_speakers:
                 constraint_msg = f"min={self.min_speakers or 'auto'}, max={self.max_speakers or 'auto'}"
@@ -856,16 +944,16 @@ class WhisperXTranscriber(Transcriber):
                 progress_range_pct=progress_range_pct,
                 console=self.console,
             )
-            progress_monitor.start()
-
-            try:
-                diarize_segments = diarize_model(
-                    audio_path,
-                    min_speakers=self.min_speakers,
-                    max_speakers=self.max_speakers,
-                )
-            finally:
-                progress_monitor.stop()
+            with self._lease(self._diarization_key(), self._load_diarization_pipeline) as diarize_model:
+                progress_monitor.start()
+                try:
+                    diarize_segments = diarize_model(
+                        audio_path,
+                        min_speakers=self.min_speakers,
+                        max_speakers=self.max_speakers,
+                    )
+                finally:
+                    progress_monitor.stop()
 
             self.console.info("  - Assigning speakers to transcript segments...")
 
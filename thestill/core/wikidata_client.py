@@ -19,10 +19,11 @@ touching the Wikidata SPARQL endpoint, and is far cheaper than running
 a full Wikidata mirror locally. Failures are silent — a missing P31
 means "fall back to whatever the resolver guessed".
 
-Caching is the caller's responsibility (the entity row's
-``wikidata_instance_of`` column persists results across runs). This
-class only adds an in-process LRU on top so a single resolve batch
-doesn't hammer Wikidata for the same QID twice.
+Caching is layered: the entity row's ``wikidata_instance_of`` column
+persists P31 results, an optional on-disk response cache in the shared
+:class:`~thestill.core.wikimedia_http.WikimediaHttp` transport survives
+restarts (with ETag revalidation), and an in-process LRU on top keeps a
+single resolve batch from asking for the same QID twice.
 """
 
 from __future__ import annotations
@@ -35,6 +36,7 @@ import requests
 from structlog import get_logger
 
 from ..models.enrichment import EnrichmentUnavailable
+from .wikimedia_http import WikimediaHttp
 
 logger = get_logger(__name__)
 
@@ -66,9 +68,13 @@ class WikidataClient:
         timeout_sec: float = DEFAULT_TIMEOUT_SEC,
         user_agent: str = DEFAULT_USER_AGENT,
         cache_size: int = 4096,
+        http: Optional[WikimediaHttp] = None,
     ):
         self.timeout_sec = timeout_sec
         self.user_agent = user_agent
+        # Pooled session (+ optional disk cache), shared with the Wikipedia
+        # client when the caller builds both from one transport.
+        self._http = http or WikimediaHttp()
         # Wrap _fetch_p31_uncached with an instance-level LRU so the
         # cache is per-client (tests can construct a fresh client to
         # bypass it).
@@ -96,7 +102,7 @@ class WikidataClient:
     def _fetch_p31_uncached(self, qid: str) -> List[str]:
         url = WIKIDATA_ENTITY_URL.format(qid=qid)
         try:
-            resp = requests.get(
+            resp = self._http.get(
                 url,
                 timeout=self.timeout_sec,
                 headers={"User-Agent": self.user_agent, "Accept": "application/json"},
@@ -133,7 +139,7 @@ class WikidataClient:
     def _fetch_facts_uncached(self, qid: str, language: str) -> Optional["WikidataEntity"]:
         url = WIKIDATA_ENTITY_URL.format(qid=qid)
         try:
-            resp = requests.get(
+            resp = self._http.get(
                 url,
                 timeout=self.timeout_sec,
                 headers={"User-Agent": self.user_agent, "Accept": "application/json"},
@@ -168,6 +174,8 @@ class WikidataClient:
                 out[qid] = cached
             else:
                 missing.append(qid)
+        # Sorted so a repeat of the same set maps onto the same cached request.
+        missing.sort()
         for start in range(0, len(missing), _LABEL_BATCH_SIZE):
             batch = missing[start : start + _LABEL_BATCH_SIZE]
             fetched = self._fetch_labels_batch(batch, language)
@@ -187,7 +195,7 @@ class WikidataClient:
             "format": "json",
         }
         try:
-            resp = requests.get(
+            resp = self._http.get(
                 WIKIDATA_API_URL,
                 params=params,
                 timeout=self.timeout_sec,
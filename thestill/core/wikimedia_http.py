@@ -0,0 +1,300 @@
+# Copyright 2025-2026 Thestill
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Pooled, disk-cached HTTP transport shared by the Wikimedia clients.
+
+:class:`~thestill.core.wikidata_client.WikidataClient` and
+:class:`~thestill.core.wikipedia_client.WikipediaClient` used to call
+``requests.get`` per lookup (a fresh TCP + TLS handshake each time) and
+cached only in process-lifetime LRUs, so every worker restart or
+``enrich-entities`` run re-downloaded the same ``EntityData`` payloads.
+:class:`WikimediaHttp` gives them:
+
+- **One pooled session.** Keep-alive connections sized for the
+  enrichment fan-out (``pool_size``), safe to share across threads.
+- **A persistent response cache** (:class:`HttpResponseCache`, SQLite).
+  200 and 404 responses are kept for ``ttl_sec``; once stale they are
+  revalidated with ``If-None-Match`` / ``If-Modified-Since`` and a 304
+  just extends the entry. If revalidation hits a network error or a
+  5xx, the stale body is served instead — an outage degrades to "slightly
+  old display data", never to ``FAILED``. Because ``fetch_p31`` and
+  ``fetch_facts`` read the same ``Special:EntityData`` URL, the resolver's
+  P31 gate is answered from whatever enrichment already fetched (and vice
+  versa).
+- **A politeness throttle.** ``min_interval_sec`` spaces outbound requests
+  across all threads; cache hits skip it.
+
+The cache file is independent of the podcast database
+(``WIKIMEDIA_CACHE_PATH``, default ``<STORAGE_PATH>/wikimedia_cache.db``)
+and safe to delete at any time.
+"""
+
+from __future__ import annotations
+
+import json
+import threading
+import time
+import zlib
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Dict, Mapping, Optional, Union
+from urllib.parse import urlencode
+
+import requests
+from requests.adapters import HTTPAdapter
+from structlog import get_logger
+
+from ..utils.sqlite_ext import connect
+
+logger = get_logger(__name__)
+
+# Statuses worth remembering: a body, or a genuine "no such page".
+CACHEABLE_STATUSES = (200, 404)
+# Eviction trims to this share of ``max_bytes`` so it does not run per put.
+_EVICT_TO = 0.9
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS http_responses (
+    key TEXT PRIMARY KEY,
+    status INTEGER NOT NULL,
+    body BLOB NOT NULL,
+    etag TEXT,
+    last_modified TEXT,
+    size_bytes INTEGER NOT NULL,
+    fetched_at REAL NOT NULL,
+    expires_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_http_responses_fetched ON http_responses(fetched_at);
+"""
+
+
+@dataclass(frozen=True)
+class CachedResponse:
+    """The slice of ``requests.Response`` the Wikimedia clients read."""
+
+    status_code: int
+    text: str
+    etag: Optional[str] = None
+    last_modified: Optional[str] = None
+    expires_at: float = 0.0
+
+    def json(self) -> Any:
+        return json.loads(self.text)
+
+    @property
+    def fresh(self) -> bool:
+        return time.time() < self.expires_at
+
+
+def cache_key(url: str, params: Optional[Mapping[str, Any]] = None) -> str:
+    """``url`` plus its query parameters in a stable order."""
+    if not params:
+        return url
+    return f"{url}?{urlencode(sorted((str(k), str(v)) for k, v in params.items()))}"
+
+
+class HttpResponseCache:
+    """SQLite store of response bodies by URL, bounded to ``max_bytes``."""
+
+    def __init__(
+        self, db_path: Union[str, Path], *, ttl_sec: float = 7 * 24 * 3600, max_bytes: int = 256 * 1024 * 1024
+    ) -> None:
+        self.db_path = Path(db_path)
+        self.ttl_sec = ttl_sec
+        self.max_bytes = max(0, max_bytes)
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        with connect(self.db_path) as conn:
+            conn.executescript(_SCHEMA)
+            size = conn.execute("SELECT COALESCE(SUM(size_bytes), 0) FROM http_responses").fetchone()[0]
+        self._lock = threading.Lock()
+        # Running total so ``put`` only rescans the table when it may be over.
+        self._size_bytes = size
+
+    def get(self, key: str) -> Optional[CachedResponse]:
+        with connect(self.db_path) as conn:
+            row = conn.execute(
+                "SELECT status, body, etag, last_modified, expires_at FROM http_responses WHERE key = ?", (key,)
+            ).fetchone()
+        if row is None:
+            return None
+        return CachedResponse(
+            status_code=row["status"],
+            text=zlib.decompress(row["body"]).decode("utf-8"),
+            etag=row["etag"],
+            last_modified=row["last_modified"],
+            expires_at=row["expires_at"],
+        )
+
+    def put(self, key: str, status: int, text: str, *, etag: Optional[str], last_modified: Optional[str]) -> None:
+        body = zlib.compress(text.encode("utf-8"))
+        now = time.time()
+        with connect(self.db_path) as conn:
+            row = conn.execute("SELECT size_bytes FROM http_responses WHERE key = ?", (key,)).fetchone()
+            conn.execute(
+                "INSERT OR REPLACE INTO http_responses "
+                "(key, status, body, etag, last_modified, size_bytes, fetched_at, expires_at) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                (key, status, body, etag, last_modified, len(body), now, now + self.ttl_sec),
+            )
+            with self._lock:
+                self._size_bytes += len(body) - (row["size_bytes"] if row is not None else 0)
+                over = self.max_bytes and self._size_bytes > self.max_bytes
+            if over:
+                self._evict(conn)
+
+    def refresh(self, key: str) -> None:
+        """Mark an entry fresh again after a 304."""
+        now = time.time()
+        with connect(self.db_path) as conn:
+            conn.execute(
+                "UPDATE http_responses SET fetched_at = ?, expires_at = ? WHERE key = ?",
+                (now, now + self.ttl_sec, key),
+            )
+
+    def _evict(self, conn) -> None:
+        """Delete the oldest-fetched entries until the cache is under 90%.
+
+        Re-sums the table rather than trusting the running total: other
+        processes sharing the file write and evict too.
+        """
+        total = conn.execute("SELECT COALESCE(SUM(size_bytes), 0) FROM http_responses").fetchone()[0]
+        if total <= self.max_bytes:
+            with self._lock:
+                self._size_bytes = total
+            return
+        target = int(self.max_bytes * _EVICT_TO)
+        doomed = []
+        for row in conn.execute("SELECT key, size_bytes FROM http_responses ORDER BY fetched_at ASC"):
+            if total <= target:
+                break
+            doomed.append((row["key"],))
+            total -= row["size_bytes"]
+        conn.executemany("DELETE FROM http_responses WHERE key = ?", doomed)
+        with self._lock:
+            self._size_bytes = total
+        logger.info("wikimedia_cache_evicted", entries=len(doomed), size_bytes=total, max_bytes=self.max_bytes)
+
+
+class WikimediaHttp:
+    """``requests``-shaped ``get`` over a pooled session and an optional cache.
+
+    Returns the live ``requests.Response`` on a network fetch and a
+    :class:`CachedResponse` when the cache answers; both expose
+    ``status_code`` and ``json()``, which is all the clients use.
+    """
+
+    def __init__(
+        self,
+        *,
+        cache: Optional[HttpResponseCache] = None,
+        pool_size: int = 8,
+        min_interval_sec: float = 0.0,
+    ) -> None:
+        self.cache = cache
+        self.min_interval_sec = max(0.0, min_interval_sec)
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=4, pool_maxsize=max(1, pool_size))
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+        self._throttle_lock = threading.Lock()
+        self._next_request_at = 0.0
+        self._stats_lock = threading.Lock()
+        self.stats: Dict[str, int] = {"hits": 0, "revalidated": 0, "stale_served": 0, "fetched": 0}
+
+    def get(
+        self,
+        url: str,
+        *,
+        params: Optional[Mapping[str, Any]] = None,
+        timeout: float,
+        headers: Optional[Mapping[str, str]] = None,
+    ) -> Union[requests.Response, CachedResponse]:
+        if self.cache is None:
+            return self._send(url, params, timeout, headers)
+
+        key = cache_key(url, params)
+        cached = self.cache.get(key)
+        if cached is not None and cached.fresh:
+            self._count("hits")
+            return cached
+
+        request_headers = dict(headers or {})
+        if cached is not None:
+            if cached.etag:
+                request_headers["If-None-Match"] = cached.etag
+            if cached.last_modified:
+                request_headers["If-Modified-Since"] = cached.last_modified
+        try:
+            resp = self._send(url, params, timeout, request_headers)
+        except requests.RequestException as exc:
+            if cached is None:
+                raise
+            logger.warning("wikimedia_cache_stale_served", url=key, error=str(exc))
+            self._count("stale_served")
+            return cached
+
+        if resp.status_code == 304 and cached is not None:
+            self.cache.refresh(key)
+            self._count("revalidated")
+            return cached
+        if resp.status_code >= 500 and cached is not None:
+            logger.warning("wikimedia_cache_stale_served", url=key, status=resp.status_code)
+            self._count("stale_served")
+            return cached
+        if resp.status_code in CACHEABLE_STATUSES:
+            self.cache.put(
+                key,
+                resp.status_code,
+                resp.text,
+                etag=resp.headers.get("ETag"),
+                last_modified=resp.headers.get("Last-Modified"),
+            )
+        return resp
+
+    def _send(
+        self, url: str, params: Optional[Mapping[str, Any]], timeout: float, headers: Optional[Mapping[str, str]]
+    ) -> requests.Response:
+        self._wait_turn()
+        self._count("fetched")
+        return self.session.get(url, params=params, timeout=timeout, headers=headers)
+
+    def _wait_turn(self) -> None:
+        if not self.min_interval_sec:
+            return
+        with self._throttle_lock:
+            now = time.monotonic()
+            start = max(now, self._next_request_at)
+            self._next_request_at = start + self.min_interval_sec
+        if start > now:
+            time.sleep(start - now)
+
+    def _count(self, name: str) -> None:
+        with self._stats_lock:
+            self.stats[name] += 1
+
+
+def wikimedia_http_from_config(config, *, min_interval_sec: float = 0.0) -> WikimediaHttp:
+    """Build the shared transport from ``Config`` (cache off when the TTL is 0)."""
+    cache = None
+    if config.wikimedia_cache_ttl_hours > 0:
+        cache = HttpResponseCache(
+            config.wikimedia_cache_path,
+            ttl_sec=config.wikimedia_cache_ttl_hours * 3600,
+            max_bytes=config.wikimedia_cache_max_mb * 1024 * 1024,
+        )
+    return WikimediaHttp(
+        cache=cache,
+        pool_size=max(1, config.enrichment_concurrency) * 2,
+        min_interval_sec=min_interval_sec,
+    )
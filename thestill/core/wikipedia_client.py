@@ -39,6 +39,7 @@ import requests
 from structlog import get_logger
 
 from ..models.enrichment import EnrichmentUnavailable
+from .wikimedia_http import WikimediaHttp
 
 logger = get_logger(__name__)
 
@@ -62,7 +63,9 @@ class WikipediaClient:
 
     Constructed once and reused; an instance-level LRU keeps recently
     fetched titles in memory so a backfill over many entities doesn't
-    re-request the same page.
+    re-request the same page. Requests go through ``http`` (a pooled
+    :class:`~thestill.core.wikimedia_http.WikimediaHttp`, optionally
+    disk-cached), normally shared with the Wikidata client.
     """
 
     def __init__(
@@ -71,9 +74,11 @@ class WikipediaClient:
         timeout_sec: float = DEFAULT_TIMEOUT_SEC,
         user_agent: str = DEFAULT_USER_AGENT,
         cache_size: int = 4096,
+        http: Optional[WikimediaHttp] = None,
     ):
         self.timeout_sec = timeout_sec
         self.user_agent = user_agent
+        self._http = http or WikimediaHttp()
         self._cached = lru_cache(maxsize=cache_size)(self._fetch_summary_uncached)
 
     def fetch_summary(self, title: str, *, language: str = "en") -> Optional[WikipediaSummary]:
@@ -90,7 +95,7 @@ class WikipediaClient:
         # ``quote`` with an empty safe set so slashes in titles are encoded.
         url = WIKIPEDIA_SUMMARY_URL.format(lang=language, title=quote(title.replace(" ", "_"), safe=""))
         try:
-            resp = requests.get(
+            resp = self._http.get(
                 url,
                 timeout=self.timeout_sec,
                 headers={"User-Agent": self.user_agent, "Accept": "application/json"},
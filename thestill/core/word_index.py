@@ -0,0 +1,262 @@
+# Copyright 2025-2026 Thestill
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Compact, write-once word-timestamp index for the karaoke wipe (spec #38).
+
+The ``/transcript/words`` endpoint used to parse both the raw ``Transcript``
+and the ``AnnotatedTranscript`` JSON on every request, walk every
+``source_word_span`` and build a Pydantic object per word (~20k for a
+two-hour episode) — and then hash the result for the ETag, so even a 304
+paid for all of it. Both inputs are write-once after CLEAN, so the answer
+is too: CLEAN now writes it down once as ``*_cleaned.words.idx`` next to the
+JSON sidecar.
+
+- **Columnar.** Segment ids plus per-segment word offsets, then parallel
+  float32 ``start`` / ``end`` arrays and a ``uint32`` reference per word
+  into a de-duplicated UTF-8 string table. About 12 bytes per word, and
+  loading is a handful of ``array.frombytes`` calls, no JSON.
+- **Stored ETag.** A SHA-1 over the body is computed at build time and kept
+  in the header, so revalidation never re-hashes the payload.
+- **Same semantics.** Words without timestamps are dropped and segments
+  with no timed words are omitted, exactly as before; an index with no
+  segments records "no word data" so the 404 is cheap too. A span pointing
+  at a missing raw segment or word still raises ``KeyError`` /
+  ``IndexError`` at build time.
+
+float32 keeps sub-millisecond precision for the first ~4.6 hours of audio;
+values are rounded to milliseconds on the way out so the wire shows
+``0.6`` rather than ``0.6000000238418579``.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import os
+import struct
+import sys
+from array import array
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Dict, Iterable, List, Sequence, Tuple
+
+if TYPE_CHECKING:
+    from ..models.annotated_transcript import AnnotatedTranscript, WordSpan
+    from ..models.transcript import Segment, Transcript, Word
+
+MAGIC = b"TSWI"
+FORMAT_VERSION = 1
+# magic, version, sha1 hex digest, segments, words, strings, string-table bytes
+_HEADER = struct.Struct("<4sI40sIIII")
+_SWAP = sys.byteorder != "little"
+
+
+class WordIndexFormatError(ValueError):
+    """The bytes are not a word index this version can read."""
+
+
+def word_index_path(clean_json_path: Path) -> Path:
+    """Index file that sits next to a ``*_cleaned.json`` sidecar."""
+    return clean_json_path.with_suffix(".words.idx")
+
+
+def collect_words_in_span(span: "WordSpan", raw_by_id: Dict[int, "Segment"]) -> List["Word"]:
+    """Walk a ``WordSpan`` and collect the raw ``Word`` objects it points to.
+
+    A span is inclusive on both endpoints and may cross multiple raw
+    segments. Words without ``start``/``end`` timestamps are skipped — they
+    can't drive a karaoke wipe even though they're part of the span.
+
+    Mismatched indices (segment id not present, word index out of range)
+    raise ``KeyError`` / ``IndexError`` — corrupted data should fail loudly
+    rather than silently produce a malformed response.
+    """
+    words: List["Word"] = []
+    for seg_id in range(span.start_segment_id, span.end_segment_id + 1):
+        raw_seg = raw_by_id[seg_id]
+        start_idx = span.start_word_index if seg_id == span.start_segment_id else 0
+        end_idx = span.end_word_index if seg_id == span.end_segment_id else len(raw_seg.words) - 1
+        for i in range(start_idx, end_idx + 1):
+            w = raw_seg.words[i]
+            if w.start is not None and w.end is not None:
+                words.append(w)
+    return words
+
+
+class WordIndex:
+    """Per-segment word timings in parallel arrays; see the module docstring."""
+
+    __slots__ = ("etag", "segment_ids", "offsets", "starts", "ends", "word_refs", "strings")
+
+    def __init__(
+        self,
+        etag: str,
+        segment_ids: array,
+        offsets: array,
+        starts: array,
+        ends: array,
+        word_refs: array,
+        strings: List[str],
+    ) -> None:
+        self.etag = etag
+        self.segment_ids = segment_ids
+        self.offsets = offsets
+        self.starts = starts
+        self.ends = ends
+        self.word_refs = word_refs
+        self.strings = strings
+
+    @classmethod
+    def build(cls, segments: Iterable[Tuple[int, Sequence[Tuple[str, float, float]]]]) -> "WordIndex":
+        """Index ``(segment_id, [(word, start, end), ...])`` pairs in order.
+
+        Segments with no words are left out, matching the endpoint's
+        "omit, don't empty-array" contract.
+        """
+        segment_ids = array("i")
+        offsets = array("I", [0])
+        starts = array("f")
+        ends = array("f")
+        word_refs = array("I")
+        strings: List[str] = []
+        string_ids: Dict[str, int] = {}
+        for segment_id, words in segments:
+            if not words:
+                continue
+            segment_ids.append(segment_id)
+            for text, start, end in words:
+                ref = string_ids.get(text)
+                if ref is None:
+                    ref = string_ids[text] = len(strings)
+                    strings.append(text)
+                word_refs.append(ref)
+                starts.append(start)
+                ends.append(end)
+            offsets.append(len(starts))
+        index = cls("", segment_ids, offsets, starts, ends, word_refs, strings)
+        index.etag = hashlib.sha1(index._body()).hexdigest()  # noqa: S324 — cache validator, not crypto
+        return index
+
+    @property
+    def word_count(self) -> int:
+        return len(self.starts)
+
+    def __len__(self) -> int:
+        return len(self.segment_ids)
+
+    def segments_payload(self) -> List[Dict[str, Any]]:
+        """The endpoint's ``segments`` list: ``{"segment_id", "words": [{"w", "s", "e"}]}``."""
+        strings, refs, starts, ends, offsets = self.strings, self.word_refs, self.starts, self.ends, self.offsets
+        payload = []
+        for n, segment_id in enumerate(self.segment_ids):
+            payload.append(
+                {
+                    "segment_id": segment_id,
+                    "words": [
+                        {"w": strings[refs[i]], "s": round(starts[i], 3), "e": round(ends[i], 3)}
+                        for i in range(offsets[n], offsets[n + 1])
+                    ],
+                }
+            )
+        return payload
+
+    def _string_table(self) -> Tuple[array, bytes]:
+        encoded = [s.encode("utf-8") for s in self.strings]
+        string_offsets = array("I", [0])
+        for chunk in encoded:
+            string_offsets.append(string_offsets[-1] + len(chunk))
+        return string_offsets, b"".join(encoded)
+
+    def _body(self) -> bytes:
+        string_offsets, blob = self._string_table()
+        parts = [self.segment_ids, self.offsets, self.starts, self.ends, self.word_refs, string_offsets]
+        return b"".join(_le_bytes(a) for a in parts) + blob
+
+    def to_bytes(self) -> bytes:
+        body = self._body()
+        string_bytes = len(body) - self._fixed_width()
+        header = _HEADER.pack(
+            MAGIC,
+            FORMAT_VERSION,
+            self.etag.encode("ascii"),
+            len(self.segment_ids),
+            len(self.starts),
+            len(self.strings),
+            string_bytes,
+        )
+        return header + body
+
+    def _fixed_width(self) -> int:
+        # Every column except the UTF-8 blob: int32/uint32/float32 are 4 bytes each.
+        return 4 * (len(self.segment_ids) + len(self.offsets) + 3 * len(self.starts) + len(self.strings) + 1)
+
+    @classmethod
+    def from_bytes(cls, data: bytes) -> "WordIndex":
+        if len(data) < _HEADER.size:
+            raise WordIndexFormatError("truncated header")
+        magic, version, etag, n_segments, n_words, n_strings, string_bytes = _HEADER.unpack_from(data)
+        if magic != MAGIC or version != FORMAT_VERSION:
+            raise WordIndexFormatError(f"unsupported word index (magic={magic!r}, version={version})")
+        view = memoryview(data)
+        pos = _HEADER.size
+        columns = []
+        for typecode, count in (
+            ("i", n_segments),
+            ("I", n_segments + 1),
+            ("f", n_words),
+            ("f", n_words),
+            ("I", n_words),
+            ("I", n_strings + 1),
+        ):
+            column = array(typecode)
+            end = pos + 4 * count
+            if end > len(data):
+                raise WordIndexFormatError("truncated body")
+            column.frombytes(view[pos:end])
+            if _SWAP:
+                column.byteswap()
+            columns.append(column)
+            pos = end
+        if pos + string_bytes != len(data):
+            raise WordIndexFormatError("string table length mismatch")
+        segment_ids, offsets, starts, ends, word_refs, string_offsets = columns
+        blob = bytes(view[pos:])
+        strings = [blob[string_offsets[i] : string_offsets[i + 1]].decode("utf-8") for i in range(n_strings)]
+        return cls(etag.decode("ascii"), segment_ids, offsets, starts, ends, word_refs, strings)
+
+
+def _le_bytes(column: array) -> bytes:
+    if not _SWAP:
+        return column.tobytes()
+    swapped = array(column.typecode, column)
+    swapped.byteswap()
+    return swapped.tobytes()
+
+
+def build_word_index(annotated: "AnnotatedTranscript", raw: "Transcript") -> WordIndex:
+    """Index the raw words each annotated segment's ``source_word_span`` covers."""
+    raw_by_id = {seg.id: seg for seg in raw.segments}
+    pairs = []
+    for segment in annotated.segments:
+        span = segment.source_word_span
+        if span is None:
+            continue
+        words = collect_words_in_span(span, raw_by_id)
+        pairs.append((segment.id, [(w.word, w.start, w.end) for w in words]))
+    return WordIndex.build(pairs)
+
+
+def write_word_index(path: Path, index: WordIndex) -> None:
+    """Write ``index`` to ``path`` atomically (readers never see half a file)."""
+    tmp = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+    tmp.write_bytes(index.to_bytes())
+    os.replace(tmp, path)
@@ -41,6 +41,7 @@ import structlog
 from pydantic import ValidationError
 
 from thestill.core.feed_manager import PodcastFeedManager
+from thestill.core.llm_cache import llm_cache_variant, wrap_with_response_cache
 from thestill.core.llm_provider import (
     LLMProvider,
     create_llm_provider,
@@ -136,7 +137,9 @@ def resolve_judge(
     provider_kwargs = provider_kwargs_from_config(config)
     if model_name:
         provider_kwargs[f"{provider_name}_model"] = model_name
-    provider = create_llm_provider(provider_type=provider_name, **provider_kwargs)
+    provider = wrap_with_response_cache(
+        create_llm_provider(provider_type=provider_name, **provider_kwargs), config, provider_type=provider_name
+    )
     info = JudgeInfo(
         provider=provider_name,
         model=provider.get_model_name(),
@@ -254,11 +257,19 @@ class EvalRunner:
             messages=messages, temperature=temperature, response_format={"type": "json_object"}
         )
 
-    def _judge_once(self, rubric: Rubric, judge: JudgeResolution, messages: List[Dict[str, str]]) -> dict:
-        """One judgement: sanitize -> parse -> validate, retrying once (FM-7)."""
+    def _judge_once(
+        self, rubric: Rubric, judge: JudgeResolution, messages: List[Dict[str, str]], sample: int = 0
+    ) -> dict:
+        """One judgement: sanitize -> parse -> validate, retrying once (FM-7).
+
+        Each (sample, attempt) is its own response-cache variant, so samples
+        stay independent and the retry is not answered with the report it
+        is retrying; a re-run replays the same sequence from the cache.
+        """
         last_error: Optional[Exception] = None
         for attempt in (1, 2):
-            raw = self._chat(judge, messages)
+            with llm_cache_variant(f"eval-sample-{sample}-attempt-{attempt}"):
+                raw = self._chat(judge, messages)
             clean, removed = sanitize_text(raw)
             if removed:
                 logger.warning("eval_judge_control_chars_stripped", removed=removed, attempt=attempt)
@@ -299,7 +310,7 @@ class EvalRunner:
             {"role": "system", "content": rubric.system_prompt},
             {"role": "user", "content": rubric.render_user_message(bounded)},
         ]
-        reports = [self._judge_once(rubric, judge, messages) for _ in range(samples)]
+        reports = [self._judge_once(rubric, judge, messages, sample=i) for i in range(samples)]
         return reports, truncated
 
     # -- run orchestration ---------------------------------------------------
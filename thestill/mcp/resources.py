@@ -127,9 +127,7 @@ def setup_resources(server: Server, storage_path: str):
                 logger.warning(f"Podcast not found: {podcast_id}")
                 raise ValueError(f"Podcast not found: {podcast_id}")
 
-            # Get podcast index
-            podcasts = podcast_service.get_podcasts()
-            podcast_index = next((p.index for p in podcasts if str(p.rss_url) == str(podcast.rss_url)), 0)
+            podcast_index = podcast_service.get_podcast_index(podcast)
 
             # Build response
             result = {
@@ -152,12 +150,11 @@ def setup_resources(server: Server, storage_path: str):
                 raise ValueError(f"Episode not found: {podcast_id}/{episode_id}")
 
             # Get indices
-            podcasts = podcast_service.get_podcasts()
             podcast = podcast_service.get_podcast(podcast_id)
             if not podcast:
                 raise ValueError(f"Podcast not found: {podcast_id}")
 
-            podcast_index = next((p.index for p in podcasts if str(p.rss_url) == str(podcast.rss_url)), 0)
+            podcast_index = podcast_service.get_podcast_index(podcast)
 
             # Get episode index (latest = 1, second latest = 2, etc.)
             sorted_episodes = sorted(podcast.episodes, key=lambda ep: ep.pub_date or "", reverse=True)
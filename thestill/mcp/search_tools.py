@@ -18,6 +18,7 @@ from typing import Any, List, Optional
 from mcp.types import TextContent, Tool
 
 from ..search.base import SearchBackend, SearchFilters, SearchMode
+from ..search.hybrid import capture_search_timings
 
 SEARCH_TOOL_NAMES = frozenset({"search_corpus"})
 
@@ -108,12 +109,14 @@ def _handle_search_corpus(
     limit = int(args.get("limit") or 10)
     filters = _parse_filters(args.get("filters"))
 
-    hits = search_backend.search(query, mode=mode, limit=limit, filters=filters)
+    with capture_search_timings() as timings:
+        hits = search_backend.search(query, mode=mode, limit=limit, filters=filters)
     payload = {
         "query": query,
         "mode": mode.value,
         "results": [h.as_citation() for h in hits],
         "total": len(hits),
+        "timings": timings.as_dict(),
     }
     return [TextContent(type="text", text=json.dumps(payload))]
 
@@ -119,6 +119,8 @@ def setup_tools(server: Server, storage_path: str):
     audio_downloader = AudioDownloader(
         str(path_manager.original_audio_dir()),
         max_bytes=config.max_audio_bytes,
+        parallel_ranges=config.download_parallel_ranges,
+        parallel_min_bytes=config.download_parallel_min_bytes,
     )
     audio_preprocessor = AudioPreprocessor(logger=logger)
     user_repository = repos.user
@@ -408,9 +410,7 @@ def setup_tools(server: Server, storage_path: str):
 
                 podcast = add_podcast_and_auto_follow(podcast_service, follower_service, auth_service, config, url)
                 if podcast:
-                    # Get the podcast index
-                    podcasts = podcast_service.get_podcasts()
-                    podcast_index = next((p.index for p in podcasts if str(p.rss_url) == str(podcast.rss_url)), 0)
+                    podcast_index = podcast_service.get_podcast_index(podcast)
 
                     result = {
                         "success": True,
@@ -1567,7 +1567,7 @@ def _get_cleaning_processor(config):
             mistral_api_key=config.mistral_api_key,
             mistral_model=config.mistral_model,
         )
-        return TranscriptCleaningProcessor(llm_provider)
+        return TranscriptCleaningProcessor(llm_provider, batch_concurrency=config.clean_batch_concurrency)
     except Exception as e:
         logger.error(f"Failed to initialize cleaning processor: {e}")
         return None
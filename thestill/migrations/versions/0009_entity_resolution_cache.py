@@ -0,0 +1,63 @@
+# Copyright 2025-2026 Thestill
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Surface-form resolution cache.
+
+RESOLVE_ENTITIES ran a ReFinED forward pass for every pending mention,
+including the same hosts and guests in every episode. The resolver now
+remembers surface-form → QID decisions in ``entity_resolution_cache`` and
+skips inference for surfaces that have grounded consistently.
+
+Starts empty — the cache fills as episodes resolve.
+
+Same convergence contract as earlier migrations: the DDL also lives in
+``postgres_schema.SCHEMA_SQL``.
+
+Revision ID: 0009
+Revises: 0008
+Create Date: 2026-10-16
+"""
+
+from __future__ import annotations
+
+from alembic import op
+
+revision = "0009"
+down_revision = "0008"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.execute(
+        """
+        CREATE TABLE IF NOT EXISTS entity_resolution_cache (
+            surface_key text NOT NULL,
+            surface_label text NOT NULL DEFAULT '',
+            wikidata_qid text NOT NULL,
+            canonical_name text NOT NULL,
+            entity_type text NOT NULL,
+            description text NULL,
+            wikidata_instance_of jsonb NOT NULL DEFAULT '[]'::jsonb,
+            observations bigint NOT NULL DEFAULT 1,
+            conflicting boolean NOT NULL DEFAULT false,
+            updated_at timestamptz NOT NULL DEFAULT now(),
+            PRIMARY KEY (surface_key, surface_label)
+        )
+        """
+    )
+
+
+def downgrade() -> None:
+    op.execute("DROP TABLE IF EXISTS entity_resolution_cache")
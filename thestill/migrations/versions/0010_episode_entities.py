@@ -0,0 +1,79 @@
+# Copyright 2025-2026 Thestill
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""``episode_entities`` projection for incremental co-occurrences.
+
+REBUILD_COOCCURRENCES used to recount every pair touching any entity in
+the episode corpus-wide. It now applies per-episode ±1 deltas against
+``episode_entities`` — the distinct resolved (episode, entity) set the
+pair table currently reflects.
+
+Data step: the projection is backfilled from ``entity_mentions`` and
+``entity_cooccurrences`` is rebuilt from it in the same transaction, so
+the first incremental update starts from a consistent pair table.
+
+Same convergence contract as earlier migrations: the DDL also lives in
+``postgres_schema.SCHEMA_SQL``.
+
+Revision ID: 0010
+Revises: 0009
+Create Date: 2026-10-16
+"""
+
+from __future__ import annotations
+
+from alembic import op
+
+revision = "0010"
+down_revision = "0009"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.execute(
+        """
+        CREATE TABLE IF NOT EXISTS episode_entities (
+            episode_id uuid NOT NULL REFERENCES episodes(id) ON DELETE CASCADE,
+            entity_id text NOT NULL REFERENCES entities(id) ON DELETE CASCADE,
+            last_seen_at timestamptz NOT NULL,
+            PRIMARY KEY (episode_id, entity_id)
+        )
+        """
+    )
+    op.execute("CREATE INDEX IF NOT EXISTS idx_episode_entities_entity ON episode_entities(entity_id)")
+    op.execute(
+        """
+        INSERT INTO episode_entities (episode_id, entity_id, last_seen_at)
+        SELECT episode_id, entity_id, MAX(COALESCE(resolved_at, created_at))
+        FROM entity_mentions
+        WHERE entity_id IS NOT NULL AND resolution_status = 'resolved'
+        GROUP BY episode_id, entity_id
+        ON CONFLICT (episode_id, entity_id) DO NOTHING
+        """
+    )
+    op.execute("DELETE FROM entity_cooccurrences")
+    op.execute(
+        """
+        INSERT INTO entity_cooccurrences (entity_a_id, entity_b_id, episode_count, last_seen_at)
+        SELECT a.entity_id, b.entity_id, COUNT(*), MAX(a.last_seen_at)
+        FROM episode_entities a
+        JOIN episode_entities b ON a.episode_id = b.episode_id AND a.entity_id < b.entity_id
+        GROUP BY a.entity_id, b.entity_id
+        """
+    )
+
+
+def downgrade() -> None:
+    op.execute("DROP TABLE IF EXISTS episode_entities")
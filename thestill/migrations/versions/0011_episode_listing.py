@@ -0,0 +1,86 @@
+# Copyright 2025-2026 Thestill
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Keyset indexes and a write-generation sequence for the episode listing.
+
+``get_all_episodes`` now pages by ``(sort column, id)`` cursors and caches
+its total per filter set:
+
+- ``idx_episodes_pub_date_id`` / ``idx_episodes_updated_at_id`` /
+  ``idx_episodes_title_id`` serve the three sorts with the id tiebreak,
+  in both directions.
+- ``episodes_write_seq`` is bumped by a deferred constraint trigger on
+  every episode insert/update/delete; cached totals are tagged with its
+  value and dropped when it moves.
+
+Title search keeps ``ILIKE`` on the existing ``idx_episodes_title_trgm``.
+
+Same convergence contract as earlier migrations: the DDL also lives in
+``postgres_schema.SCHEMA_SQL``.
+
+Revision ID: 0011
+Revises: 0010
+Create Date: 2026-10-16
+"""
+
+from __future__ import annotations
+
+from alembic import op
+
+revision = "0011"
+down_revision = "0010"
+branch_labels = None
+depends_on = None
+
+_DDL = """
+CREATE INDEX IF NOT EXISTS idx_episodes_pub_date_id ON episodes(pub_date DESC NULLS LAST, id DESC);
+CREATE INDEX IF NOT EXISTS idx_episodes_updated_at_id ON episodes(updated_at DESC, id DESC);
+CREATE INDEX IF NOT EXISTS idx_episodes_title_id ON episodes(title, id);
+CREATE SEQUENCE IF NOT EXISTS episodes_write_seq;
+CREATE OR REPLACE FUNCTION bump_episodes_write_seq() RETURNS trigger LANGUAGE plpgsql AS $$
+BEGIN
+    PERFORM nextval('episodes_write_seq');
+    RETURN NULL;
+END;
+$$;
+DO $$
+BEGIN
+    IF NOT EXISTS (
+        SELECT 1 FROM pg_trigger WHERE tgname = 'trg_episodes_write_seq' AND tgrelid = 'episodes'::regclass
+    ) THEN
+        CREATE CONSTRAINT TRIGGER trg_episodes_write_seq
+            AFTER INSERT OR UPDATE OR DELETE ON episodes
+            DEFERRABLE INITIALLY DEFERRED
+            FOR EACH ROW EXECUTE FUNCTION bump_episodes_write_seq();
+    END IF;
+END;
+$$;
+"""
+
+_DOWN_DDL = """
+DROP TRIGGER IF EXISTS trg_episodes_write_seq ON episodes;
+DROP FUNCTION IF EXISTS bump_episodes_write_seq();
+DROP SEQUENCE IF EXISTS episodes_write_seq;
+DROP INDEX IF EXISTS idx_episodes_title_id;
+DROP INDEX IF EXISTS idx_episodes_updated_at_id;
+DROP INDEX IF EXISTS idx_episodes_pub_date_id;
+"""
+
+
+def upgrade() -> None:
+    op.execute(_DDL)
+
+
+def downgrade() -> None:
+    op.execute(_DOWN_DDL)
@@ -0,0 +1,44 @@
+# Copyright 2025-2026 Thestill
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Index the podcast listing order for index <-> id rank lookups.
+
+``get_podcast_index`` / ``get_podcast_id_at_index`` resolve the CLI/MCP
+1-based podcast index without hydrating the corpus; both walk
+``(created_at DESC, id)``, the listing order with its id tiebreak.
+
+Same convergence contract as earlier migrations: the DDL also lives in
+``postgres_schema.SCHEMA_SQL``.
+
+Revision ID: 0012
+Revises: 0011
+Create Date: 2026-10-16
+"""
+
+from __future__ import annotations
+
+from alembic import op
+
+revision = "0012"
+down_revision = "0011"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.execute("CREATE INDEX IF NOT EXISTS idx_podcasts_created_at_id ON podcasts(created_at DESC, id)")
+
+
+def downgrade() -> None:
+    op.execute("DROP INDEX IF EXISTS idx_podcasts_created_at_id")
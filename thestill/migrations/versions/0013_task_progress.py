@@ -0,0 +1,53 @@
+# Copyright 2025-2026 Thestill
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Latest-progress table for the cross-process progress bus.
+
+``PostgresProgressBus`` upserts each task's latest progress into the
+UNLOGGED ``task_progress`` table (read by ``/progress/current`` and by new
+SSE subscribers) and fans live updates out with ``pg_notify``.
+
+Same convergence contract as earlier migrations: the DDL also lives in
+``postgres_schema.SCHEMA_SQL``.
+
+Revision ID: 0013
+Revises: 0012
+Create Date: 2026-10-16
+"""
+
+from __future__ import annotations
+
+from alembic import op
+
+revision = "0013"
+down_revision = "0012"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.execute(
+        """
+        CREATE UNLOGGED TABLE IF NOT EXISTS task_progress (
+            task_id text PRIMARY KEY,
+            origin text NOT NULL,
+            payload jsonb NOT NULL,
+            updated_at timestamptz NOT NULL DEFAULT now()
+        )
+        """
+    )
+
+
+def downgrade() -> None:
+    op.execute("DROP TABLE IF EXISTS task_progress")
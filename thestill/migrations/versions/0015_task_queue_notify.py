@@ -0,0 +1,72 @@
+# Copyright 2025-2026 Thestill
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""NOTIFY workers when a task becomes claimable.
+
+``trg_tasks_notify_pending`` sends the task's stage on the
+``thestill_task_queue`` channel whenever a row is inserted as, or moved
+back to, ``pending``. ``PostgresQueueManager.listen_for_wakeups`` relays
+it to the worker's stage pollers, so a task enqueued by another process is
+claimed immediately rather than on the next poll.
+
+Same convergence contract as earlier migrations: the DDL also lives in
+``postgres_schema.SCHEMA_SQL``.
+
+Revision ID: 0015
+Revises: 0014
+Create Date: 2026-10-16
+"""
+
+from __future__ import annotations
+
+from alembic import op
+
+revision = "0015"
+down_revision = "0014"
+branch_labels = None
+depends_on = None
+
+_DDL = """
+CREATE OR REPLACE FUNCTION notify_task_pending() RETURNS trigger LANGUAGE plpgsql AS $$
+BEGIN
+    PERFORM pg_notify('thestill_task_queue', NEW.stage);
+    RETURN NULL;
+END;
+$$;
+DO $$
+BEGIN
+    IF NOT EXISTS (
+        SELECT 1 FROM pg_trigger WHERE tgname = 'trg_tasks_notify_pending' AND tgrelid = 'tasks'::regclass
+    ) THEN
+        CREATE TRIGGER trg_tasks_notify_pending
+            AFTER INSERT OR UPDATE OF status ON tasks
+            FOR EACH ROW WHEN (NEW.status = 'pending')
+            EXECUTE FUNCTION notify_task_pending();
+    END IF;
+END;
+$$;
+"""
+
+_DOWN_DDL = """
+DROP TRIGGER IF EXISTS trg_tasks_notify_pending ON tasks;
+DROP FUNCTION IF EXISTS notify_task_pending();
+"""
+
+
+def upgrade() -> None:
+    op.execute(_DDL)
+
+
+def downgrade() -> None:
+    op.execute(_DOWN_DDL)
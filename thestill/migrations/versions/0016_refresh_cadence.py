@@ -0,0 +1,58 @@
+# Copyright 2025-2026 Thestill
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Adaptive refresh cadence state on ``podcasts``.
+
+``refresh_unchanged_streak`` counts refreshes in a row that found nothing
+new. ``refresh_hint_seconds`` is the poll interval the feed's ``<ttl>`` /
+``sy:updatePeriod`` asks for. ``record_refresh_success`` feeds both to
+``core.refresh_cadence.plan_refresh``. Zero/NULL means "no streak, no
+hint", so existing rows need no backfill.
+
+Same convergence contract as earlier migrations: the DDL also lives in
+``postgres_schema.SCHEMA_SQL``.
+
+Revision ID: 0016
+Revises: 0015
+Create Date: 2026-10-16
+"""
+
+from __future__ import annotations
+
+from alembic import op
+
+revision = "0016"
+down_revision = "0015"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.execute(
+        """
+        ALTER TABLE podcasts
+            ADD COLUMN IF NOT EXISTS refresh_unchanged_streak integer NOT NULL DEFAULT 0,
+            ADD COLUMN IF NOT EXISTS refresh_hint_seconds bigint NULL
+        """
+    )
+
+
+def downgrade() -> None:
+    op.execute(
+        """
+        ALTER TABLE podcasts
+            DROP COLUMN IF EXISTS refresh_hint_seconds,
+            DROP COLUMN IF EXISTS refresh_unchanged_streak
+        """
+    )
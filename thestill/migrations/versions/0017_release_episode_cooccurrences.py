@@ -0,0 +1,85 @@
+# Copyright 2025-2026 Thestill
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Release an episode's co-occurrence pairs when the episode is deleted.
+
+``episode_entities`` cascades away with its episode, so the pairs that
+episode contributed to ``entity_cooccurrences`` were never decremented.
+``trg_episodes_release_cooccurrences`` runs before each episode delete
+(direct or cascaded from ``podcasts``): it decrements every pair in the
+episode's projection, drops pairs reaching zero, and removes the
+projection itself.
+
+Counts already inflated by earlier deletes are repaired by
+``thestill rebuild-cooccurrences --full``.
+
+Same convergence contract as earlier migrations: the DDL also lives in
+``postgres_schema.SCHEMA_SQL``.
+
+Revision ID: 0017
+Revises: 0016
+Create Date: 2026-10-17
+"""
+
+from __future__ import annotations
+
+from alembic import op
+
+revision = "0017"
+down_revision = "0016"
+branch_labels = None
+depends_on = None
+
+_DDL = """
+CREATE OR REPLACE FUNCTION release_episode_cooccurrences() RETURNS trigger LANGUAGE plpgsql AS $$
+BEGIN
+    UPDATE entity_cooccurrences c SET episode_count = c.episode_count - 1
+    FROM episode_entities a
+    JOIN episode_entities b ON b.episode_id = a.episode_id AND a.entity_id < b.entity_id
+    WHERE a.episode_id = OLD.id AND c.entity_a_id = a.entity_id AND c.entity_b_id = b.entity_id;
+    DELETE FROM entity_cooccurrences c
+    USING episode_entities a
+    JOIN episode_entities b ON b.episode_id = a.episode_id AND a.entity_id < b.entity_id
+    WHERE a.episode_id = OLD.id AND c.entity_a_id = a.entity_id AND c.entity_b_id = b.entity_id
+      AND c.episode_count <= 0;
+    DELETE FROM episode_entities WHERE episode_id = OLD.id;
+    RETURN OLD;
+END;
+$$;
+DO $$
+BEGIN
+    IF NOT EXISTS (
+        SELECT 1 FROM pg_trigger
+        WHERE tgname = 'trg_episodes_release_cooccurrences' AND tgrelid = 'episodes'::regclass
+    ) THEN
+        CREATE TRIGGER trg_episodes_release_cooccurrences
+            BEFORE DELETE ON episodes
+            FOR EACH ROW EXECUTE FUNCTION release_episode_cooccurrences();
+    END IF;
+END;
+$$;
+"""
+
+_DOWN_DDL = """
+DROP TRIGGER IF EXISTS trg_episodes_release_cooccurrences ON episodes;
+DROP FUNCTION IF EXISTS release_episode_cooccurrences();
+"""
+
+
+def upgrade() -> None:
+    op.execute(_DDL)
+
+
+def downgrade() -> None:
+    op.execute(_DOWN_DDL)
@@ -20,13 +20,16 @@ behind the same seam. The two lightweight projection dataclasses the
 query methods return (``EntityHit``, ``MentionContext``) live here —
 they are part of the contract, not of any one dialect. They are
 re-exported from ``sqlite_entity_repository`` for backwards
-compatibility with existing call sites.
+compatibility with existing call sites. ``episode_pair_deltas`` — the
+dialect-free half of incremental co-occurrence maintenance — lives here
+for the same reason.
 """
 
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
 from datetime import datetime
-from typing import Iterable, List, Optional, Tuple
+from itertools import combinations
+from typing import Any, Dict, Iterable, List, Optional, Tuple
 
 from ..models.enrichment import EntityEnrichment
 from ..models.entities import EntityMention, EntityRecord
@@ -82,10 +85,48 @@ class MentionContext:
     episode_duration: Optional[str] = None
 
 
+@dataclass(frozen=True)
+class PairDelta:
+    """One ``entity_cooccurrences`` adjustment from ``episode_pair_deltas``.
+
+    ``delta`` is ``+1`` (pair newly present in the episode), ``-1`` (pair
+    gone) or ``0`` (still present, ``last_seen_at`` moved forward).
+    """
+
+    entity_a_id: str
+    entity_b_id: str
+    delta: int
+    last_seen_at: Any = None
+
+
+def episode_pair_deltas(previous: Dict[str, Any], current: Dict[str, Any]) -> List[PairDelta]:
+    """Pair-count changes when one episode's resolved entity set moves
+    from ``previous`` to ``current`` (``{entity_id: last_seen_at}``).
+
+    ``previous`` is the episode's ``episode_entities`` projection — what
+    ``entity_cooccurrences`` currently reflects — and ``current`` the
+    distinct resolved set read from ``entity_mentions``. Cost is
+    O(entities in the episode²); nothing outside the episode is read.
+    Pairs are canonically ordered (``a < b``) to match the table CHECK,
+    and a pair's ``last_seen_at`` is its ``a`` side's, as in the full
+    rebuild.
+    """
+    before = set(combinations(sorted(previous), 2))
+    after = set(combinations(sorted(current), 2))
+    deltas = [PairDelta(a, b, -1) for a, b in sorted(before - after)]
+    for a, b in sorted(after):
+        if (a, b) not in before:
+            deltas.append(PairDelta(a, b, 1, current[a]))
+        elif current[a] != previous[a]:
+            deltas.append(PairDelta(a, b, 0, current[a]))
+    return deltas
+
+
 class EntityRepository(ABC):
     """Abstract contract for ``entities`` / ``entity_mentions`` /
     ``entity_cooccurrences`` / ``entity_enrichment`` /
-    ``mention_overrides`` / ``resolution_blacklist`` persistence.
+    ``episode_entities`` / ``mention_overrides`` /
+    ``resolution_blacklist`` / ``entity_resolution_cache`` persistence.
 
     Implementations must be thread-safe (connection-per-operation) and
     must NOT own the DDL — schema bootstrap lives with the podcast
@@ -144,7 +185,9 @@ class EntityRepository(ABC):
     def repoint_mentions(self, *, from_entity_id: str, to_entity_id: str) -> int:
         """Bulk re-point every mention of one entity at another; return
         the number of mentions updated. Used by alias-merge before
-        deleting the loser of a duplicate pair.
+        deleting the loser of a duplicate pair. Applies the co-occurrence
+        deltas for the touched episodes so the keeper inherits the
+        loser's pairs.
         """
 
     # ------------------------------------------------------------------
@@ -361,12 +404,27 @@ class EntityRepository(ABC):
     # Co-occurrences
     # ------------------------------------------------------------------
 
+    @abstractmethod
+    def update_cooccurrences(self, episode_ids: Iterable[str]) -> int:
+        """Incrementally bring ``entity_cooccurrences`` up to date with
+        each episode's current resolved entity set.
+
+        Diffs the distinct resolved ``(episode, entity)`` set against the
+        episode's ``episode_entities`` projection and applies ±1 pair
+        deltas (``episode_pair_deltas``), then stores the new projection.
+        Per-episode atomic. Returns the number of pair rows adjusted.
+        """
+
     @abstractmethod
     def rebuild_cooccurrences(self, *, episode_ids: Optional[List[str]] = None) -> int:
-        """Recompute ``entity_cooccurrences`` (corpus-wide per-pair
-        distinct-episode counts) for pairs touched by the given
-        episodes; ``None`` is a full wipe-and-rebuild. Returns the
-        number of pair rows materialised.
+        """Repair path: recompute ``entity_cooccurrences`` (corpus-wide
+        per-pair distinct-episode counts) from ``entity_mentions``.
+
+        Scoped to pairs touched by the given episodes, whose
+        ``episode_entities`` projection is resynced too; ``None`` is a
+        full wipe-and-rebuild of both tables. Returns the number of pair
+        rows materialised. Routine maintenance uses
+        ``update_cooccurrences``.
         """
 
     # ------------------------------------------------------------------
@@ -477,6 +535,31 @@ class EntityRepository(ABC):
     def list_blacklist(self, *, limit: int = 200) -> List[dict]:
         """Most recent blacklist entries, newest first."""
 
+    # ------------------------------------------------------------------
+    # Surface-form resolution cache (``entity_resolution_cache``)
+    # ------------------------------------------------------------------
+
+    @abstractmethod
+    def lookup_surface_resolutions(self, keys: Iterable[Tuple[str, str]]) -> Dict[Tuple[str, str], dict]:
+        """Cache rows for ``(surface_key, surface_label)`` keys.
+
+        Keys are pre-normalised by ``entity_resolver.surface_cache_key``
+        and matched exactly. Each row dict carries ``wikidata_qid,
+        canonical_name, entity_type, description, wikidata_instance_of``
+        (decoded list), ``observations`` and ``conflicting`` (bool);
+        missing keys are absent. The trust rule lives in the resolver.
+        """
+
+    @abstractmethod
+    def record_surface_resolutions(self, observations: List[dict]) -> None:
+        """Fold model-resolved observations into the cache.
+
+        A new key is inserted with ``observations=1``. A repeat with the
+        same QID bumps the count and refreshes the payload; a different
+        QID marks the row ``conflicting`` permanently (the first QID is
+        kept for inspection, the row is never trusted again).
+        """
+
     # ------------------------------------------------------------------
     # Detection queue / alias merging (spec §1.6)
     # ------------------------------------------------------------------
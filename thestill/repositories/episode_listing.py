@@ -0,0 +1,141 @@
+# Copyright 2025-2026 Thestill
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Backend-neutral pieces of the cross-podcast episode listing.
+
+``get_all_episodes`` (``/api/episodes``) used to pay a full ``COUNT(*)``
+over ``episodes ⋈ podcasts`` on every page and ``LIMIT/OFFSET`` to reach
+deep pages. Both backends now share:
+
+- **Keyset cursors.** A cursor is an opaque token naming the last episode
+  of the previous page plus the sort it was issued for. The repository
+  re-reads that episode's sort value and seeks past ``(sort_value, id)``,
+  so page N costs the same as page 1. The id tiebreak makes the order
+  total — offset pages use it too.
+- **A cached total.** Counts are memoised per filter set and tagged with
+  the episode-write generation the backend maintains (a trigger-bumped
+  counter), so any episode write invalidates them. Backends whose
+  generation is not transactional also pass a TTL as a backstop.
+"""
+
+from __future__ import annotations
+
+import base64
+import binascii
+import json
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Hashable, List, Optional, Tuple
+
+# Whitelisted sort keys → episode column. Anything else falls back to pub_date.
+EPISODE_SORT_COLUMNS = {"pub_date": "e.pub_date", "title": "e.title", "updated_at": "e.updated_at"}
+
+
+class InvalidCursorError(ValueError):
+    """Cursor is malformed, was issued for another sort, or names a deleted episode."""
+
+
+def normalize_episode_sort(sort_by: str, sort_order: str) -> Tuple[str, bool]:
+    """Return ``(sort_by, descending)`` with unknown keys mapped to the default."""
+    return (sort_by if sort_by in EPISODE_SORT_COLUMNS else "pub_date"), sort_order.lower() != "asc"
+
+
+def encode_episode_cursor(episode_id: str, sort_by: str, sort_order: str) -> str:
+    """Opaque keyset cursor positioned after ``episode_id`` in the given sort."""
+    sort_key, descending = normalize_episode_sort(sort_by, sort_order)
+    payload = json.dumps([episode_id, sort_key, "desc" if descending else "asc"], separators=(",", ":"))
+    return base64.urlsafe_b64encode(payload.encode("utf-8")).decode("ascii").rstrip("=")
+
+
+def decode_episode_cursor(cursor: str, sort_by: str, sort_order: str) -> str:
+    """Return the anchor episode id, checking the cursor matches the sort.
+
+    Raises:
+        InvalidCursorError: When the token does not decode or was issued
+            for a different sort key / direction.
+    """
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        episode_id, sort_key, direction = json.loads(base64.urlsafe_b64decode(padded.encode("ascii")))
+    except (binascii.Error, UnicodeError, ValueError, TypeError) as exc:
+        raise InvalidCursorError(f"Malformed cursor: {cursor!r}") from exc
+    expected_key, descending = normalize_episode_sort(sort_by, sort_order)
+    if (sort_key, direction) != (expected_key, "desc" if descending else "asc") or not isinstance(episode_id, str):
+        raise InvalidCursorError("Cursor was issued for a different sort order")
+    return episode_id
+
+
+def keyset_predicate(
+    sort_column: str,
+    descending: bool,
+    anchor_value: Any,
+    anchor_id: str,
+    *,
+    placeholder: str = "?",
+) -> Tuple[str, List[Any]]:
+    """SQL predicate selecting rows strictly after ``(anchor_value, anchor_id)``.
+
+    Matches the listing's null placement on both backends: NULL sort
+    values come last on DESC and first on ASC. Only ``pub_date`` is
+    nullable; the other sort columns always take the row-value branch.
+    """
+    op = "<" if descending else ">"
+    p = placeholder
+    if anchor_value is None:
+        if descending:
+            return f"({sort_column} IS NULL AND e.id {op} {p})", [anchor_id]
+        return f"(({sort_column} IS NULL AND e.id {op} {p}) OR {sort_column} IS NOT NULL)", [anchor_id]
+    predicate = f"({sort_column}, e.id) {op} ({p}, {p})"
+    if descending:
+        predicate = f"({predicate} OR {sort_column} IS NULL)"
+    return predicate, [anchor_value, anchor_id]
+
+
+class EpisodeCountCache:
+    """Small thread-safe LRU of listing totals keyed by filter set.
+
+    An entry is only served while the backend's write generation still
+    matches the one it was computed under (and, when ``ttl_seconds`` is
+    set, while it is younger than that).
+    """
+
+    def __init__(self, max_entries: int = 256, ttl_seconds: Optional[float] = None) -> None:
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self._entries: "OrderedDict[Hashable, Tuple[int, int, float]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key: Hashable, generation: int) -> Optional[int]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                cached_generation, total, stored_at = entry
+                fresh = self.ttl_seconds is None or time.monotonic() - stored_at < self.ttl_seconds
+                if cached_generation == generation and fresh:
+                    self._entries.move_to_end(key)
+                    self.hits += 1
+                    return total
+                del self._entries[key]
+            self.misses += 1
+            return None
+
+    def put(self, key: Hashable, generation: int, total: int) -> None:
+        with self._lock:
+            self._entries[key] = (generation, total, time.monotonic())
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
@@ -14,6 +14,7 @@ from ..models.podcast import AlternateEnclosure, Episode, Podcast, TranscriptLin
 if TYPE_CHECKING:
     # Pure dataclasses from the core layer, imported type-only to keep the
     # repository layer free of runtime core dependencies.
+    from ..core.refresh_cadence import RefreshCadenceSettings
     from ..core.refresh_failure import RefreshDecision, RefreshFailure, RefreshPolicySettings
 
 
@@ -30,7 +31,7 @@ class PodcastRepository(ABC):
         Get all podcasts.
 
         Returns:
-            List of all podcasts, ordered by creation date (newest first)
+            List of all podcasts, ordered by creation date (newest first, then id)
         """
         pass
 
@@ -375,8 +376,14 @@ class PodcastRepository(ABC):
         max_interval: int,
         default_interval: int,
         now: Optional[datetime] = None,
+        *,
+        not_modified: bool = False,
+        feed_hint_seconds: Optional[int] = None,
+        cadence: Optional["RefreshCadenceSettings"] = None,
     ) -> str:
-        """Record a successful refresh: recompute the AIMD interval and clear
+        """Record a successful refresh: plan the next poll with
+        ``core.refresh_cadence.plan_refresh`` (publish rhythm, unchanged
+        streak, feed hint; ``not_modified`` keeps the stored hint) and clear
         ALL failure state (error, kind, streak, quarantine reason,
         retry-after). Returns the new ``next_refresh_at`` ISO string."""
         pass
@@ -410,9 +417,12 @@ class PodcastRepository(ABC):
         pass
 
     @abstractmethod
-    def get_refresh_health_counts(self, now: Optional[datetime] = None) -> Dict[str, object]:
+    def get_refresh_health_counts(
+        self, now: Optional[datetime] = None, baseline_interval_seconds: int = 3600
+    ) -> Dict[str, object]:
         """Aggregate counts for status surfacing: active / due_now /
-        backing_off / parked_total / parked_by_reason."""
+        backing_off / parked_total / parked_by_reason, plus fetches_per_day
+        and fetches_avoided_per_day against ``baseline_interval_seconds``."""
         pass
 
     # ------------------------------------------------------------------
@@ -539,6 +549,37 @@ class PodcastRepository(ABC):
         podcast = self.get_by_slug(slug)
         return self._podcast_row_from_model(podcast) if podcast else None
 
+    def list_podcast_summaries(self) -> List[Dict]:
+        """Every podcast as a :meth:`list_podcast_rows` row plus its 1-based
+        ``index`` (the CLI/MCP list position), in listing order.
+
+        The whole-corpus form of :meth:`list_podcast_rows` for callers that
+        only need counts and indices (``PodcastService.get_podcasts``). SQL
+        backends aggregate the counts in one grouped pass over ``episodes``.
+        """
+        rows, _ = self.list_podcast_rows()
+        return [dict(row, index=idx) for idx, row in enumerate(rows, start=1)]
+
+    def get_podcast_index(self, podcast_id: str) -> Optional[int]:
+        """1-based listing position of ``podcast_id``, or ``None`` if unknown.
+
+        Listing order is ``created_at`` DESC with ``id`` as the tiebreak;
+        SQL backends answer from ``idx_podcasts_created_at_id`` without
+        reading the other podcasts' rows.
+        """
+        for idx, podcast in enumerate(self.get_all(), start=1):
+            if str(podcast.id) == str(podcast_id):
+                return idx
+        return None
+
+    def get_podcast_id_at_index(self, index: int) -> Optional[str]:
+        """Inverse of :meth:`get_podcast_index` — the podcast id listed at
+        1-based ``index``, or ``None`` when out of range."""
+        podcasts = self.get_all()
+        if 1 <= index <= len(podcasts):
+            return str(podcasts[index - 1].id)
+        return None
+
     @staticmethod
     def _podcast_row_from_model(podcast: Podcast) -> Dict:
         """Shared row shape for the fallback implementations above."""
@@ -712,6 +753,7 @@ class EpisodeRepository(ABC):
         updated_from: Optional[datetime] = None,
         sort_by: str = "pub_date",
         sort_order: str = "desc",
+        cursor: Optional[str] = None,
     ) -> Tuple[List[Tuple[Podcast, Episode]], int]:
         """
         Get episodes across all podcasts with filtering and pagination.
@@ -727,12 +769,19 @@ class EpisodeRepository(ABC):
             updated_from: Only include episodes updated on/after this date (optional)
             sort_by: Sort field - 'pub_date', 'title', or 'updated_at' (default 'pub_date')
             sort_order: Sort direction - 'asc' or 'desc' (default 'desc')
+            cursor: Keyset cursor from ``encode_episode_cursor`` for the same
+                sort; when set, ``offset`` is ignored and the page starts
+                after the cursor's episode (optional)
 
         Returns:
             Tuple of:
                 - List of (Podcast, Episode) tuples matching criteria
                 - Total count of matching episodes (for pagination)
 
+        Raises:
+            InvalidCursorError: ``cursor`` is malformed, was issued for a
+                different sort, or names an episode that no longer exists.
+
         Example:
             # Get first page of transcribed episodes
             episodes, total = repository.get_all_episodes(
@@ -46,7 +46,7 @@ from structlog import get_logger
 from ..models.enrichment import EnrichmentStatus, EntityAffiliation, EntityEnrichment, EntityFact
 from ..models.entities import EntityMention, EntityRecord, EntityType, MentionRole, ResolutionMethod, ResolutionStatus
 from ..utils.postgres_ext import as_str, connect
-from .entity_repository import EntityHit, EntityRepository, MentionContext
+from .entity_repository import EntityHit, EntityRepository, MentionContext, episode_pair_deltas
 
 logger = get_logger(__name__)
 
@@ -197,14 +197,24 @@ class PostgresEntityRepository(EntityRepository):
 
     def repoint_mentions(self, *, from_entity_id: str, to_entity_id: str) -> int:
         """Bulk-UPDATE every mention pointing at ``from_entity_id`` to
-        point at ``to_entity_id``. Returns rowcount.
+        point at ``to_entity_id``. Returns rowcount. The touched
+        episodes' co-occurrence deltas are applied afterwards.
         """
         with connect(self.dsn) as conn:
+            episode_ids = [
+                as_str(r["episode_id"])
+                for r in conn.execute(
+                    "SELECT DISTINCT episode_id FROM entity_mentions WHERE entity_id = %s",
+                    (from_entity_id,),
+                ).fetchall()
+            ]
             cursor = conn.execute(
                 "UPDATE entity_mentions SET entity_id = %s WHERE entity_id = %s",
                 (to_entity_id, from_entity_id),
             )
-            return cursor.rowcount
+            moved = cursor.rowcount
+        self.update_cooccurrences(episode_ids)
+        return moved
 
     # ------------------------------------------------------------------
     # Mentions
@@ -979,12 +989,99 @@ class PostgresEntityRepository(EntityRepository):
     # Co-occurrences
     # ------------------------------------------------------------------
 
+    def update_cooccurrences(self, episode_ids: Iterable[str]) -> int:
+        """Apply per-episode co-occurrence deltas.
+
+        Same algorithm as the SQLite version (``episode_pair_deltas``
+        over the ``episode_entities`` projection vs the distinct resolved
+        set). Each episode is one transaction serialised by a
+        transaction-scoped advisory lock on the episode id — the
+        Postgres stand-in for SQLite's ``BEGIN IMMEDIATE`` — so two
+        updaters never diff against the same projection.
+        """
+        adjusted = 0
+        episodes = 0
+        for episode_id in dict.fromkeys(episode_ids):
+            with connect(self.dsn) as conn:
+                conn.execute(
+                    "SELECT pg_advisory_xact_lock(hashtextextended(%s, 0))",
+                    (f"episode_entities:{episode_id}",),
+                )
+                previous = {
+                    r["entity_id"]: r["last_seen_at"]
+                    for r in conn.execute(
+                        "SELECT entity_id, last_seen_at FROM episode_entities WHERE episode_id = %s",
+                        (episode_id,),
+                    ).fetchall()
+                }
+                current = {
+                    r["entity_id"]: r["last_seen_at"]
+                    for r in conn.execute(
+                        """
+                        SELECT entity_id, MAX(COALESCE(resolved_at, created_at)) AS last_seen_at
+                        FROM entity_mentions
+                        WHERE episode_id = %s
+                          AND entity_id IS NOT NULL
+                          AND resolution_status = 'resolved'
+                        GROUP BY entity_id
+                        """,
+                        (episode_id,),
+                    ).fetchall()
+                }
+                if current == previous:
+                    continue
+                deltas = episode_pair_deltas(previous, current)
+                removed_pairs = [(d.entity_a_id, d.entity_b_id) for d in deltas if d.delta < 0]
+                with conn.cursor() as cur:
+                    cur.executemany(
+                        """
+                        INSERT INTO entity_cooccurrences (entity_a_id, entity_b_id, episode_count, last_seen_at)
+                        VALUES (%s, %s, 1, %s)
+                        ON CONFLICT (entity_a_id, entity_b_id) DO UPDATE SET
+                            episode_count = entity_cooccurrences.episode_count + 1,
+                            last_seen_at = GREATEST(entity_cooccurrences.last_seen_at, EXCLUDED.last_seen_at)
+                        """,
+                        [(d.entity_a_id, d.entity_b_id, d.last_seen_at) for d in deltas if d.delta > 0],
+                    )
+                    cur.executemany(
+                        """
+                        UPDATE entity_cooccurrences SET last_seen_at = GREATEST(last_seen_at, %s)
+                        WHERE entity_a_id = %s AND entity_b_id = %s
+                        """,
+                        [(d.last_seen_at, d.entity_a_id, d.entity_b_id) for d in deltas if d.delta == 0],
+                    )
+                    cur.executemany(
+                        """
+                        UPDATE entity_cooccurrences SET episode_count = episode_count - 1
+                        WHERE entity_a_id = %s AND entity_b_id = %s
+                        """,
+                        removed_pairs,
+                    )
+                    cur.executemany(
+                        """
+                        DELETE FROM entity_cooccurrences
+                        WHERE entity_a_id = %s AND entity_b_id = %s AND episode_count <= 0
+                        """,
+                        removed_pairs,
+                    )
+                    cur.execute("DELETE FROM episode_entities WHERE episode_id = %s", (episode_id,))
+                    cur.executemany(
+                        "INSERT INTO episode_entities (episode_id, entity_id, last_seen_at) VALUES (%s, %s, %s)",
+                        [(episode_id, entity_id, last_seen) for entity_id, last_seen in current.items()],
+                    )
+                adjusted += sum(1 for d in deltas if d.delta != 0)
+                episodes += 1
+        logger.info("cooccurrences_updated", episodes_changed=episodes, pairs_adjusted=adjusted)
+        return adjusted
+
     def rebuild_cooccurrences(self, *, episode_ids: Optional[List[str]] = None) -> int:
-        """Rebuild ``entity_cooccurrences`` for the given episodes.
+        """Repair ``entity_cooccurrences`` from ``entity_mentions``.
 
-        Same two-phase shape as the SQLite version: phase 1 computes the
-        corpus-wide aggregate as a plain read; phase 2 is a short write
-        transaction (DELETE + bulk INSERT) so readers never see a
+        Same two-phase shape and scoping rules as the SQLite version:
+        phase 1 computes the corpus-wide aggregate over the distinct
+        ``(episode, entity)`` projection as a plain read; phase 2 is a
+        short write transaction (DELETE + bulk INSERT of pairs and the
+        scoped ``episode_entities`` rows) so readers never see a
         half-rebuilt scope. ``episode_ids=None`` is a full rebuild.
         Canonical pair ordering (``a < b``) matches the table CHECK.
         """
@@ -993,39 +1090,69 @@ class PostgresEntityRepository(EntityRepository):
         with connect(self.dsn) as conn:
             if episode_ids is None:
                 affected_ids = None
+                scope_predicate = ""
                 affected_predicate = ""
+                projection_predicate = ""
+                projection_params: list = []
                 select_params: list = []
             else:
                 if not episode_ids:
                     return 0
                 affected_rows = conn.execute(
                     """
-                    SELECT DISTINCT entity_id FROM entity_mentions
+                    SELECT entity_id FROM entity_mentions
                     WHERE entity_id IS NOT NULL
                       AND resolution_status = 'resolved'
                       AND episode_id = ANY(%s)
+                    UNION
+                    SELECT entity_id FROM episode_entities
+                    WHERE episode_id = ANY(%s)
                     """,
-                    (list(episode_ids),),
+                    (list(episode_ids), list(episode_ids)),
                 ).fetchall()
                 affected_ids = [r["entity_id"] for r in affected_rows]
                 if not affected_ids:
                     return 0
+                scope_predicate = (
+                    " AND episode_id IN (SELECT episode_id FROM entity_mentions WHERE entity_id = ANY(%s))"
+                )
                 affected_predicate = " AND (a.entity_id = ANY(%s) OR b.entity_id = ANY(%s))"
-                select_params = [affected_ids, affected_ids]
+                projection_predicate = " AND episode_id = ANY(%s)"
+                projection_params = [list(episode_ids)]
+                select_params = [affected_ids, affected_ids, affected_ids]
+
+            projection_rows = conn.execute(
+                f"""
+                SELECT episode_id, entity_id, MAX(COALESCE(resolved_at, created_at)) AS last_seen_at
+                FROM entity_mentions
+                WHERE entity_id IS NOT NULL
+                  AND resolution_status = 'resolved'
+                  {projection_predicate}
+                GROUP BY episode_id, entity_id
+                """,
+                projection_params,
+            ).fetchall()
 
             pair_rows = conn.execute(
                 f"""
+                WITH ee AS (
+                    SELECT episode_id, entity_id, MAX(COALESCE(resolved_at, created_at)) AS last_seen_at
+                    FROM entity_mentions
+                    WHERE entity_id IS NOT NULL
+                      AND resolution_status = 'resolved'
+                      {scope_predicate}
+                    GROUP BY episode_id, entity_id
+                )
                 SELECT
                     a.entity_id AS entity_a_id,
                     b.entity_id AS entity_b_id,
-                    COUNT(DISTINCT a.episode_id) AS episode_count,
-                    MAX(COALESCE(a.resolved_at, a.created_at)) AS last_seen_at
-                FROM entity_mentions a
-                JOIN entity_mentions b
+                    COUNT(*) AS episode_count,
+                    MAX(a.last_seen_at) AS last_seen_at
+                FROM ee a
+                JOIN ee b
                     ON a.episode_id = b.episode_id
                    AND a.entity_id < b.entity_id
-                WHERE a.resolution_status = 'resolved'
-                  AND b.resolution_status = 'resolved'
+                WHERE TRUE
                   {affected_predicate}
                 GROUP BY a.entity_id, b.entity_id
                 """,
@@ -1033,18 +1160,21 @@ class PostgresEntityRepository(EntityRepository):
             ).fetchall()
 
         insert_values = [(r["entity_a_id"], r["entity_b_id"], r["episode_count"], r["last_seen_at"]) for r in pair_rows]
+        projection_values = [(r["episode_id"], r["entity_id"], r["last_seen_at"]) for r in projection_rows]
 
         # ---- Phase 2: short write transaction (DELETE + bulk INSERT) ----
         with connect(self.dsn) as conn:
             if affected_ids is None:
                 conn.execute("DELETE FROM entity_cooccurrences")
+                conn.execute("DELETE FROM episode_entities")
             else:
                 conn.execute(
                     "DELETE FROM entity_cooccurrences WHERE entity_a_id = ANY(%s) OR entity_b_id = ANY(%s)",
                     (affected_ids, affected_ids),
                 )
-            if insert_values:
-                with conn.cursor() as cur:
+                conn.execute("DELETE FROM episode_entities WHERE episode_id = ANY(%s)", (list(episode_ids),))
+            with conn.cursor() as cur:
+                if insert_values:
                     cur.executemany(
                         """
                         INSERT INTO entity_cooccurrences (
@@ -1053,6 +1183,11 @@ class PostgresEntityRepository(EntityRepository):
                         """,
                         insert_values,
                     )
+                if projection_values:
+                    cur.executemany(
+                        "INSERT INTO episode_entities (episode_id, entity_id, last_seen_at) VALUES (%s, %s, %s)",
+                        projection_values,
+                    )
         inserted = len(insert_values)
         logger.info(
             "cooccurrences_rebuilt",
@@ -1280,6 +1415,10 @@ class PostgresEntityRepository(EntityRepository):
                 """,
                 (surface_form, wrong_qid, reason),
             ).fetchone()
+            conn.execute(
+                "DELETE FROM entity_resolution_cache WHERE surface_key = %s AND wikidata_qid = %s",
+                (" ".join(surface_form.split()).casefold(), wrong_qid),
+            )
             return int(row["id"]) if row else 0
 
     def is_blacklisted(self, surface_form: str, wrong_qid: str) -> bool:
@@ -1302,6 +1441,69 @@ class PostgresEntityRepository(EntityRepository):
             ).fetchall()
         return [dict(r) for r in rows]
 
+    # ------------------------------------------------------------------
+    # Surface-form resolution cache
+    # ------------------------------------------------------------------
+
+    def lookup_surface_resolutions(self, keys: Iterable[Tuple[str, str]]) -> Dict[Tuple[str, str], dict]:
+        keys = list(keys)
+        if not keys:
+            return {}
+        with connect(self.dsn) as conn:
+            rows = conn.execute(
+                """
+                SELECT c.* FROM entity_resolution_cache c
+                JOIN unnest(%s::text[], %s::text[]) AS k(surface_key, surface_label)
+                  ON c.surface_key = k.surface_key AND c.surface_label = k.surface_label
+                """,
+                ([k[0] for k in keys], [k[1] for k in keys]),
+            ).fetchall()
+        return {(row["surface_key"], row["surface_label"]): _row_to_surface_resolution(row) for row in rows}
+
+    def record_surface_resolutions(self, observations: List[dict]) -> None:
+        if not observations:
+            return
+        with connect(self.dsn) as conn:
+            # Row-at-a-time: a single multi-row INSERT ... ON CONFLICT
+            # cannot touch the same key twice, and one batch may carry the
+            # same surface from several excerpts.
+            with conn.cursor() as cur:
+                cur.executemany(
+                    """
+                    INSERT INTO entity_resolution_cache
+                        (surface_key, surface_label, wikidata_qid, canonical_name,
+                         entity_type, description, wikidata_instance_of)
+                    VALUES (%s, %s, %s, %s, %s, %s, %s)
+                    ON CONFLICT (surface_key, surface_label) DO UPDATE SET
+                        observations = CASE WHEN entity_resolution_cache.wikidata_qid = EXCLUDED.wikidata_qid
+                            THEN entity_resolution_cache.observations + 1
+                            ELSE entity_resolution_cache.observations END,
+                        conflicting = entity_resolution_cache.conflicting
+                            OR entity_resolution_cache.wikidata_qid <> EXCLUDED.wikidata_qid,
+                        canonical_name = CASE WHEN entity_resolution_cache.wikidata_qid = EXCLUDED.wikidata_qid
+                            THEN EXCLUDED.canonical_name ELSE entity_resolution_cache.canonical_name END,
+                        entity_type = CASE WHEN entity_resolution_cache.wikidata_qid = EXCLUDED.wikidata_qid
+                            THEN EXCLUDED.entity_type ELSE entity_resolution_cache.entity_type END,
+                        description = CASE WHEN entity_resolution_cache.wikidata_qid = EXCLUDED.wikidata_qid
+                            THEN EXCLUDED.description ELSE entity_resolution_cache.description END,
+                        wikidata_instance_of = CASE WHEN entity_resolution_cache.wikidata_qid = EXCLUDED.wikidata_qid
+                            THEN EXCLUDED.wikidata_instance_of ELSE entity_resolution_cache.wikidata_instance_of END,
+                        updated_at = now()
+                    """,
+                    [
+                        (
+                            o["surface_key"],
+                            o["surface_label"],
+                            o["wikidata_qid"],
+                            o["canonical_name"],
+                            o["entity_type"],
+                            o.get("description"),
+                            Jsonb(o.get("wikidata_instance_of") or []),
+                        )
+                        for o in observations
+                    ],
+                )
+
     # ------------------------------------------------------------------
     # Detection queue — review of likely-wrong resolutions
     # ------------------------------------------------------------------
@@ -1470,6 +1672,18 @@ def _row_to_mention(row: dict) -> EntityMention:
     )
 
 
+def _row_to_surface_resolution(row: dict) -> dict:
+    return {
+        "wikidata_qid": row["wikidata_qid"],
+        "canonical_name": row["canonical_name"],
+        "entity_type": row["entity_type"],
+        "description": row["description"],
+        "wikidata_instance_of": row["wikidata_instance_of"] or [],
+        "observations": row["observations"],
+        "conflicting": bool(row["conflicting"]),
+    }
+
+
 def _row_to_mention_context(row: dict) -> MentionContext:
     return MentionContext(
         mention=_row_to_mention(row),
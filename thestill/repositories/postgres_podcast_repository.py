@@ -27,6 +27,7 @@ from __future__ import annotations
 
 from structlog import get_logger
 
+from .episode_listing import EpisodeCountCache
 from .podcast_repository import EpisodeRepository, PodcastRepository
 from .postgres_podcast_repository_episodes import EpisodesMixin
 from .postgres_podcast_repository_podcasts import PodcastsMixin
@@ -39,6 +40,9 @@ class PostgresPodcastRepository(PodcastsMixin, EpisodesMixin, PodcastRepository,
 
     def __init__(self, dsn: str):
         self.dsn = dsn
+        # Listing totals; the TTL backstops the non-transactional
+        # episodes_write_seq generation.
+        self._episode_count_cache = EpisodeCountCache(ttl_seconds=30)
         # Discover chart regions from data/top_podcasts_<region>.json, same as
         # the SQLite repo (spec #57). Fail-open — never blocks startup.
         self._seed_top_podcasts()
@@ -35,7 +35,8 @@ Postgres, following the port conventions in ``utils/postgres_ext.py``:
   search → ``ILIKE``.
 
 The mixin has NO ``__init__``: it expects the composing class to set
-``self.dsn``. Schema DDL lives exclusively in ``postgres_schema.py``.
+``self.dsn`` and ``self._episode_count_cache`` (an ``EpisodeCountCache``).
+Schema DDL lives exclusively in ``postgres_schema.py``.
 
 NOTE (cleanup): ``_normalize_artwork_url`` and the minimal Podcast row mapping
 are duplicated from the podcast-side port (developed in parallel in
@@ -59,6 +60,13 @@ from ..utils.datetime_utils import now_utc
 from ..utils.podcast_categories import normalize_category_name
 from ..utils.postgres_ext import as_str, connect
 from ..utils.slug import generate_slug
+from .episode_listing import (
+    EPISODE_SORT_COLUMNS,
+    InvalidCursorError,
+    decode_episode_cursor,
+    keyset_predicate,
+    normalize_episode_sort,
+)
 from .postgres_category_cache import CategoryCacheMixin
 
 logger = get_logger(__name__)
@@ -1235,14 +1243,25 @@ class EpisodesMixin(CategoryCacheMixin):
         updated_from: Optional[datetime] = None,
         sort_by: str = "pub_date",
         sort_order: str = "desc",
+        cursor: Optional[str] = None,
     ) -> Tuple[List[Tuple[Podcast, Episode]], int]:
         """
         Get episodes across all podcasts with filtering and pagination.
 
         ``search`` uses ILIKE (user-facing fuzzy search — SQLite LIKE is
-        ASCII-case-insensitive, ILIKE is the Postgres equivalent).
+        ASCII-case-insensitive, ILIKE is the Postgres equivalent), served
+        by the ``idx_episodes_title_trgm`` GIN index.
+
+        ``cursor`` (from ``encode_episode_cursor``) switches to keyset
+        paging: ``offset`` is ignored and the page starts after that
+        episode. The total is cached per filter set and tagged with
+        ``episodes_write_seq``; see ``_count_listed_episodes``.
 
         Returns (episodes_with_podcasts, total_count).
+
+        Raises:
+            InvalidCursorError: ``cursor`` is malformed, belongs to another
+                sort, or names an episode that no longer exists.
         """
         # Build WHERE conditions
         conditions = []
@@ -1319,37 +1338,72 @@ class EpisodesMixin(CategoryCacheMixin):
         # Validate and build ORDER BY clause. Null placement is pinned to
         # SQLite's semantics (NULLs last on DESC, first on ASC) — Postgres
         # defaults to the opposite, which would float undated episodes to
-        # the top of the default newest-first listing.
-        valid_sort_fields = {"pub_date": "e.pub_date", "title": "e.title", "updated_at": "e.updated_at"}
-        sort_field = valid_sort_fields.get(sort_by, "e.pub_date")
-        order_direction = "ASC NULLS FIRST" if sort_order.lower() == "asc" else "DESC NULLS LAST"
+        # the top of the default newest-first listing. ``e.id`` breaks ties
+        # so the order is total (stable offset pages, well-defined seeks).
+        sort_key, descending = normalize_episode_sort(sort_by, sort_order)
+        sort_field = EPISODE_SORT_COLUMNS[sort_key]
+        order_direction = "DESC NULLS LAST" if descending else "ASC NULLS FIRST"
+        id_direction = "DESC" if descending else "ASC"
 
         with connect(self.dsn) as conn:
-            # Get total count
-            count_query = f"""
-                SELECT COUNT(*) AS total
-                FROM episodes e
-                JOIN podcasts p ON e.podcast_id = p.id
-                WHERE {where_clause}
-            """
-            total = conn.execute(count_query, params).fetchone()["total"]
+            total = self._count_listed_episodes(conn, where_clause, params)
+
+            page_clause = where_clause
+            page_params = list(params)
+            if cursor:
+                anchor_id = decode_episode_cursor(cursor, sort_by, sort_order)
+                anchor = conn.execute(
+                    f"SELECT {sort_field} AS v FROM episodes e WHERE e.id = %s", (anchor_id,)
+                ).fetchone()
+                if anchor is None:
+                    raise InvalidCursorError("Cursor episode no longer exists")
+                predicate, predicate_params = keyset_predicate(
+                    sort_field, descending, anchor["v"], anchor_id, placeholder="%s"
+                )
+                page_clause = f"{where_clause} AND {predicate}"
+                page_params.extend(predicate_params)
+                offset = 0
 
             # Get paginated results
             query = f"""
                 SELECT {_PODCAST_TUPLE_COLS}
                 FROM episodes e
                 JOIN podcasts p ON e.podcast_id = p.id
-                WHERE {where_clause}
-                ORDER BY {sort_field} {order_direction}
+                WHERE {page_clause}
+                ORDER BY {sort_field} {order_direction}, e.id {id_direction}
                 LIMIT %s OFFSET %s
             """
-            rows = conn.execute(query, params + [limit, offset]).fetchall()
+            rows = conn.execute(query, page_params + [limit, offset]).fetchall()
 
             _, id_to_pair = self._category_maps(conn)
             results = [(self._podcast_from_row_minimal(row, id_to_pair), self._row_to_episode(row)) for row in rows]
 
             return results, total
 
+    def _count_listed_episodes(self, conn: psycopg.Connection, where_clause: str, params: List[Any]) -> int:
+        """``COUNT(*)`` for a listing filter, memoised per write generation.
+
+        ``episodes_write_seq`` is bumped at commit by a deferred trigger and
+        read before counting, so a racing write can only make the cached
+        entry look stale. Sequences ignore rollbacks (a spurious recount,
+        harmless); the cache's TTL bounds anything else that slips past.
+        """
+        generation = conn.execute("SELECT last_value FROM episodes_write_seq").fetchone()["last_value"]
+        key = (where_clause, tuple(params))
+        total = self._episode_count_cache.get(key, generation)
+        if total is None:
+            total = conn.execute(
+                f"""
+                SELECT COUNT(*) AS total
+                FROM episodes e
+                JOIN podcasts p ON e.podcast_id = p.id
+                WHERE {where_clause}
+                """,
+                params,
+            ).fetchone()["total"]
+            self._episode_count_cache.put(key, generation, total)
+        return total
+
     # ============================================================================
     # Helper Methods
     # ============================================================================
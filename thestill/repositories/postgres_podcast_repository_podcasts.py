@@ -56,6 +56,7 @@ from typing import Any, Dict, Iterator, List, Optional, Sequence, Set, Tuple
 import psycopg
 from structlog import get_logger
 
+from ..core.refresh_cadence import HISTORY_SIZE, RefreshCadenceSettings, plan_refresh
 from ..core.refresh_failure import (
     RefreshAction,
     RefreshDecision,
@@ -691,7 +692,7 @@ class PodcastsMixin(CategoryCacheMixin):
     def get_all(self) -> List[Podcast]:
         """Retrieve all podcasts with their episodes."""
         with self._get_connection() as conn:
-            rows = conn.execute(f"SELECT {_PODCAST_COLS} FROM podcasts ORDER BY created_at DESC").fetchall()
+            rows = conn.execute(f"SELECT {_PODCAST_COLS} FROM podcasts ORDER BY created_at DESC, id").fetchall()
             return [self._row_to_podcast(row, conn) for row in rows]
 
     def get(self, podcast_id: str) -> Optional[Podcast]:
@@ -1104,7 +1105,9 @@ class PodcastsMixin(CategoryCacheMixin):
             ).fetchall()
             return [as_str(row["id"]) for row in rows]
 
-    def get_refresh_health_counts(self, now: Optional[datetime] = None) -> Dict[str, Any]:
+    def get_refresh_health_counts(
+        self, now: Optional[datetime] = None, baseline_interval_seconds: int = 3600
+    ) -> Dict[str, Any]:
         """Spec #60 — one cheap aggregate for status surfacing (port of the
         SQLite implementation; see there for field semantics)."""
         now_dt = now or now_utc()
@@ -1119,9 +1122,18 @@ class PodcastsMixin(CategoryCacheMixin):
                 GROUP BY reason
                 """).fetchall()
             parked_by_reason = {row["reason"]: row["n"] for row in reason_rows}
-            active = conn.execute(
-                f"SELECT COUNT(*) AS n FROM podcasts WHERE next_refresh_at IS NOT NULL AND {active_filter}"
-            ).fetchone()["n"]
+            # Scheduled polls per day at each feed's current interval, against
+            # polling every active feed at the fixed baseline interval.
+            cadence = conn.execute(
+                f"""
+                SELECT COUNT(*) AS n,
+                       COALESCE(SUM(86400.0 / COALESCE(NULLIF(refresh_interval_seconds, 0), %s)), 0) AS per_day
+                FROM podcasts WHERE next_refresh_at IS NOT NULL AND {active_filter}
+                """,
+                (baseline_interval_seconds,),
+            ).fetchone()
+            active = cadence["n"]
+            fetches_per_day = float(cadence["per_day"])
             due_now = conn.execute(
                 f"""
                 SELECT COUNT(*) AS n FROM podcasts
@@ -1140,6 +1152,8 @@ class PodcastsMixin(CategoryCacheMixin):
             "backing_off": backing_off,
             "parked_total": sum(parked_by_reason.values()),
             "parked_by_reason": parked_by_reason,
+            "fetches_per_day": round(fetches_per_day, 1),
+            "fetches_avoided_per_day": round(active * 86400 / max(1, baseline_interval_seconds) - fetches_per_day, 1),
         }
 
     def seed_unscheduled_feeds(self, default_interval_seconds: int, now: Optional[datetime] = None) -> int:
@@ -1198,31 +1212,52 @@ class PodcastsMixin(CategoryCacheMixin):
         max_interval: int,
         default_interval: int,
         now: Optional[datetime] = None,
+        *,
+        not_modified: bool = False,
+        feed_hint_seconds: Optional[int] = None,
+        cadence: Optional[RefreshCadenceSettings] = None,
     ) -> str:
-        """Record a successful refresh and recompute the adaptive (AIMD)
-        interval. New episodes → shorten (÷2, decrease); none → lengthen
-        (×1.5, increase). Clears ``last_refresh_error``. Returns the new
-        ``next_refresh_at`` ISO string.
+        """Record a successful refresh and plan the feed's next poll (port
+        of the SQLite implementation; see there for the inputs). Clears
+        ``last_refresh_error``. Returns the new ``next_refresh_at`` ISO string.
         """
         now_dt = now or now_utc()
         with self._get_connection() as conn:
             row = conn.execute(
-                "SELECT refresh_interval_seconds FROM podcasts WHERE id = %s",
+                "SELECT refresh_interval_seconds, refresh_unchanged_streak, refresh_hint_seconds "
+                "FROM podcasts WHERE id = %s",
                 (podcast_id,),
             ).fetchone()
             current = row["refresh_interval_seconds"] if row and row["refresh_interval_seconds"] else default_interval
-            if found_new:
-                new_interval = max(min_interval, current // 2)
-            else:
-                new_interval = min(max_interval, int(current * 1.5))
-            new_interval = max(min_interval, min(max_interval, new_interval))
-            next_at_dt = now_dt + timedelta(seconds=new_interval)
+            hint = (row["refresh_hint_seconds"] if row else None) if not_modified else feed_hint_seconds
+            pub_rows = conn.execute(
+                """
+                SELECT pub_date FROM episodes
+                WHERE podcast_id = %s AND pub_date IS NOT NULL
+                ORDER BY pub_date DESC
+                LIMIT %s
+                """,
+                (podcast_id, HISTORY_SIZE),
+            ).fetchall()
+            plan = plan_refresh(
+                current_interval=current,
+                found_new=found_new,
+                prior_unchanged_streak=(row["refresh_unchanged_streak"] or 0) if row else 0,
+                pub_dates=[ensure_utc(r["pub_date"]) for r in pub_rows],
+                hint_seconds=hint,
+                min_interval=min_interval,
+                max_interval=max_interval,
+                settings=cadence or RefreshCadenceSettings(),
+                now=now_dt,
+            )
             conn.execute(
                 """
                 UPDATE podcasts
                 SET refresh_interval_seconds = %s,
                     next_refresh_at = %s,
                     last_refresh_at = %s,
+                    refresh_unchanged_streak = %s,
+                    refresh_hint_seconds = %s,
                     last_refresh_error = NULL,
                     last_refresh_failure_kind = NULL,
                     last_refresh_status_code = NULL,
@@ -1233,9 +1268,17 @@ class PodcastsMixin(CategoryCacheMixin):
                     updated_at = %s
                 WHERE id = %s
                 """,
-                (new_interval, next_at_dt, now_dt, now_dt, podcast_id),
+                (
+                    plan.interval_seconds,
+                    plan.next_refresh_at,
+                    now_dt,
+                    plan.unchanged_streak,
+                    hint,
+                    now_dt,
+                    podcast_id,
+                ),
             )
-            return next_at_dt.isoformat()
+            return plan.next_refresh_at.isoformat()
 
     def record_refresh_failure(
         self,
@@ -1655,6 +1698,21 @@ class PodcastsMixin(CategoryCacheMixin):
         ) ec ON true
     """
 
+    # Whole-corpus variant for ``list_podcast_summaries``: every podcast is
+    # selected, so one grouped pass over episodes beats a LATERAL per row.
+    _EPISODE_COUNTS_GROUPED = """
+        LEFT JOIN (
+            SELECT podcast_id,
+                   COUNT(*) AS episodes_count,
+                   COUNT(*) FILTER (
+                       WHERE failed_at_stage IS NULL
+                         AND (summary_path IS NOT NULL OR clean_transcript_path IS NOT NULL)
+                   ) AS episodes_processed
+              FROM episodes
+             GROUP BY podcast_id
+        ) ec ON ec.podcast_id = p.id
+    """
+
     def count_podcasts(self) -> int:
         with self._get_connection() as conn:
             return int(conn.execute("SELECT COUNT(*) AS n FROM podcasts").fetchone()["n"])
@@ -1806,7 +1864,7 @@ class PodcastsMixin(CategoryCacheMixin):
                   FROM podcasts p
                   {self._EPISODE_COUNTS_JOIN}
                   {where}
-                 ORDER BY p.created_at DESC
+                 ORDER BY p.created_at DESC, p.id
                  {page}
                 """,
                 page_params,
@@ -1828,3 +1886,34 @@ class PodcastsMixin(CategoryCacheMixin):
                 (slug,),
             ).fetchone()
             return self._podcast_row_from_db(row) if row else None
+
+    def list_podcast_summaries(self) -> List[Dict]:
+        with self._get_connection() as conn:
+            self._ensure_category_cache(conn)
+            rows = conn.execute(f"""
+                SELECT {_PODCAST_COLS_P}, ec.episodes_count, ec.episodes_processed
+                  FROM podcasts p
+                  {self._EPISODE_COUNTS_GROUPED}
+                 ORDER BY p.created_at DESC, p.id
+                """).fetchall()
+        return [dict(self._podcast_row_from_db(row), index=idx) for idx, row in enumerate(rows, start=1)]
+
+    def get_podcast_index(self, podcast_id: str) -> Optional[int]:
+        with self._get_connection() as conn:
+            anchor = conn.execute("SELECT created_at, id FROM podcasts WHERE id = %s", (str(podcast_id),)).fetchone()
+            if anchor is None:
+                return None
+            ahead = conn.execute(
+                "SELECT COUNT(*) AS n FROM podcasts WHERE created_at > %s OR (created_at = %s AND id < %s)",
+                (anchor["created_at"], anchor["created_at"], anchor["id"]),
+            ).fetchone()["n"]
+            return int(ahead) + 1
+
+    def get_podcast_id_at_index(self, index: int) -> Optional[str]:
+        if index < 1:
+            return None
+        with self._get_connection() as conn:
+            row = conn.execute(
+                "SELECT id FROM podcasts ORDER BY created_at DESC, id LIMIT 1 OFFSET %s", (index - 1,)
+            ).fetchone()
+            return as_str(row["id"]) if row else None
@@ -123,9 +123,14 @@ CREATE TABLE IF NOT EXISTS podcasts (
     consecutive_refresh_failures integer NOT NULL DEFAULT 0,
     refresh_failure_streak_started_at timestamptz NULL,
     refresh_disabled_reason text NULL,
-    refresh_retry_after_at timestamptz NULL
+    refresh_retry_after_at timestamptz NULL,
+    -- Adaptive cadence (core.refresh_cadence): refreshes in a row that found
+    -- nothing new, and the poll interval the feed's <ttl>/sy:updatePeriod asks for.
+    refresh_unchanged_streak integer NOT NULL DEFAULT 0,
+    refresh_hint_seconds bigint NULL
 );
 CREATE INDEX IF NOT EXISTS idx_podcasts_slug ON podcasts(slug) WHERE slug != '';
+CREATE INDEX IF NOT EXISTS idx_podcasts_created_at_id ON podcasts(created_at DESC, id);
 CREATE INDEX IF NOT EXISTS idx_podcasts_next_refresh ON podcasts(next_refresh_at) WHERE next_refresh_at IS NOT NULL;
 -- Spec #60 — converge databases bootstrapped before failure classification
 -- landed (CREATE TABLE IF NOT EXISTS skips existing tables, so the new
@@ -137,6 +142,10 @@ ALTER TABLE podcasts
     ADD COLUMN IF NOT EXISTS refresh_failure_streak_started_at timestamptz NULL,
     ADD COLUMN IF NOT EXISTS refresh_disabled_reason text NULL,
     ADD COLUMN IF NOT EXISTS refresh_retry_after_at timestamptz NULL;
+-- Adaptive refresh cadence (alembic 0016).
+ALTER TABLE podcasts
+    ADD COLUMN IF NOT EXISTS refresh_unchanged_streak integer NOT NULL DEFAULT 0,
+    ADD COLUMN IF NOT EXISTS refresh_hint_seconds bigint NULL;
 CREATE INDEX IF NOT EXISTS idx_podcasts_quarantine ON podcasts(refresh_disabled_reason, last_refresh_at) WHERE refresh_disabled_reason IS NOT NULL;
 
 CREATE TABLE IF NOT EXISTS episodes (
@@ -198,6 +207,33 @@ CREATE INDEX IF NOT EXISTS idx_episodes_updated_at ON episodes(updated_at DESC);
 CREATE INDEX IF NOT EXISTS idx_episodes_title_trgm ON episodes USING gin (title gin_trgm_ops);
 -- jsonb_path_ops: only @> containment is queried (entity guest-episode lookups).
 CREATE INDEX IF NOT EXISTS idx_episodes_guest_entities ON episodes USING gin (guest_entity_ids jsonb_path_ops);
+-- Episode listing (get_all_episodes): keyset indexes carrying the id
+-- tiebreak, and a write-generation sequence the cached listing totals are
+-- tagged with. The trigger is deferred so the bump lands at commit, right
+-- before the write becomes visible; sequences are non-transactional, so no
+-- row lock is taken and concurrent episode writers never serialize on it.
+CREATE INDEX IF NOT EXISTS idx_episodes_pub_date_id ON episodes(pub_date DESC NULLS LAST, id DESC);
+CREATE INDEX IF NOT EXISTS idx_episodes_updated_at_id ON episodes(updated_at DESC, id DESC);
+CREATE INDEX IF NOT EXISTS idx_episodes_title_id ON episodes(title, id);
+CREATE SEQUENCE IF NOT EXISTS episodes_write_seq;
+CREATE OR REPLACE FUNCTION bump_episodes_write_seq() RETURNS trigger LANGUAGE plpgsql AS $$
+BEGIN
+    PERFORM nextval('episodes_write_seq');
+    RETURN NULL;
+END;
+$$;
+DO $$
+BEGIN
+    IF NOT EXISTS (
+        SELECT 1 FROM pg_trigger WHERE tgname = 'trg_episodes_write_seq' AND tgrelid = 'episodes'::regclass
+    ) THEN
+        CREATE CONSTRAINT TRIGGER trg_episodes_write_seq
+            AFTER INSERT OR UPDATE OR DELETE ON episodes
+            DEFERRABLE INITIALLY DEFERRED
+            FOR EACH ROW EXECUTE FUNCTION bump_episodes_write_seq();
+    END IF;
+END;
+$$;
 
 CREATE TABLE IF NOT EXISTS episode_alternate_enclosures (
     id bigint GENERATED ALWAYS AS IDENTITY PRIMARY KEY,
@@ -347,6 +383,44 @@ CREATE INDEX IF NOT EXISTS idx_tasks_episode ON tasks(episode_id) WHERE episode_
 -- otherwise-unindexed FK for podcast cascade checks.
 CREATE INDEX IF NOT EXISTS idx_tasks_podcast_stage ON tasks(podcast_id, stage) WHERE podcast_id IS NOT NULL;
 CREATE INDEX IF NOT EXISTS idx_tasks_status ON tasks(status);
+-- Cross-process queue wakeup: every row that becomes claimable NOTIFYs its
+-- stage; PostgresQueueManager.listen_for_wakeups relays it to the worker's
+-- stage pollers. NOTIFY is delivered at commit and deduplicated per
+-- transaction, so a bulk requeue sends one message per stage.
+CREATE OR REPLACE FUNCTION notify_task_pending() RETURNS trigger LANGUAGE plpgsql AS $$
+BEGIN
+    PERFORM pg_notify('thestill_task_queue', NEW.stage);
+    RETURN NULL;
+END;
+$$;
+DO $$
+BEGIN
+    IF NOT EXISTS (
+        SELECT 1 FROM pg_trigger WHERE tgname = 'trg_tasks_notify_pending' AND tgrelid = 'tasks'::regclass
+    ) THEN
+        CREATE TRIGGER trg_tasks_notify_pending
+            AFTER INSERT OR UPDATE OF status ON tasks
+            FOR EACH ROW WHEN (NEW.status = 'pending')
+            EXECUTE FUNCTION notify_task_pending();
+    END IF;
+END;
+$$;
+-- Latest progress per task for the cross-process progress bus
+-- (core/progress_bus.py). Ephemeral by design, hence UNLOGGED: a crash
+-- loses only in-flight progress bars. Live updates ride pg_notify.
+CREATE UNLOGGED TABLE IF NOT EXISTS task_progress (
+    task_id text PRIMARY KEY,
+    origin text NOT NULL,
+    payload jsonb NOT NULL,
+    updated_at timestamptz NOT NULL DEFAULT now()
+);
+-- Named leases for cross-process leader election (core/leader_election.py);
+-- the scheduler lease keeps refresh/briefing schedulers single-instance.
+CREATE TABLE IF NOT EXISTS leader_leases (
+    name text PRIMARY KEY,
+    holder text NOT NULL,
+    expires_at timestamptz NOT NULL
+);
 
 -- ===== pending transcription ops =========================================
 CREATE TABLE IF NOT EXISTS pending_transcription_operations (
@@ -416,6 +490,45 @@ CREATE TABLE IF NOT EXISTS entity_cooccurrences (
 -- the ON DELETE CASCADE from entities need the b-side covered too.
 CREATE INDEX IF NOT EXISTS idx_cooccur_entity_b ON entity_cooccurrences(entity_b_id);
 
+-- Distinct resolved (episode, entity) set that entity_cooccurrences currently
+-- reflects; update_cooccurrences diffs against it (see migration 0010).
+CREATE TABLE IF NOT EXISTS episode_entities (
+    episode_id uuid NOT NULL REFERENCES episodes(id) ON DELETE CASCADE,
+    entity_id text NOT NULL REFERENCES entities(id) ON DELETE CASCADE,
+    last_seen_at timestamptz NOT NULL,
+    PRIMARY KEY (episode_id, entity_id)
+);
+CREATE INDEX IF NOT EXISTS idx_episode_entities_entity ON episode_entities(entity_id);
+-- Deleting an episode releases its pairs before the projection cascades
+-- away (migration 0017); covers podcast cascades too.
+CREATE OR REPLACE FUNCTION release_episode_cooccurrences() RETURNS trigger LANGUAGE plpgsql AS $$
+BEGIN
+    UPDATE entity_cooccurrences c SET episode_count = c.episode_count - 1
+    FROM episode_entities a
+    JOIN episode_entities b ON b.episode_id = a.episode_id AND a.entity_id < b.entity_id
+    WHERE a.episode_id = OLD.id AND c.entity_a_id = a.entity_id AND c.entity_b_id = b.entity_id;
+    DELETE FROM entity_cooccurrences c
+    USING episode_entities a
+    JOIN episode_entities b ON b.episode_id = a.episode_id AND a.entity_id < b.entity_id
+    WHERE a.episode_id = OLD.id AND c.entity_a_id = a.entity_id AND c.entity_b_id = b.entity_id
+      AND c.episode_count <= 0;
+    DELETE FROM episode_entities WHERE episode_id = OLD.id;
+    RETURN OLD;
+END;
+$$;
+DO $$
+BEGIN
+    IF NOT EXISTS (
+        SELECT 1 FROM pg_trigger
+        WHERE tgname = 'trg_episodes_release_cooccurrences' AND tgrelid = 'episodes'::regclass
+    ) THEN
+        CREATE TRIGGER trg_episodes_release_cooccurrences
+            BEFORE DELETE ON episodes
+            FOR EACH ROW EXECUTE FUNCTION release_episode_cooccurrences();
+    END IF;
+END;
+$$;
+
 CREATE TABLE IF NOT EXISTS entity_enrichment (
     entity_id text PRIMARY KEY REFERENCES entities(id) ON DELETE CASCADE,
     image_url text NULL,
@@ -463,6 +576,22 @@ CREATE TABLE IF NOT EXISTS resolution_blacklist (
 -- cannot serve.
 CREATE INDEX IF NOT EXISTS idx_blacklist_surface_lower ON resolution_blacklist(LOWER(surface_form));
 
+-- Surface-form -> QID memo for the resolver. surface_key is normalised in
+-- Python (whitespace-collapsed, casefolded); see migration 0009.
+CREATE TABLE IF NOT EXISTS entity_resolution_cache (
+    surface_key text NOT NULL,
+    surface_label text NOT NULL DEFAULT '',
+    wikidata_qid text NOT NULL,
+    canonical_name text NOT NULL,
+    entity_type text NOT NULL,
+    description text NULL,
+    wikidata_instance_of jsonb NOT NULL DEFAULT '[]'::jsonb,
+    observations bigint NOT NULL DEFAULT 1,
+    conflicting boolean NOT NULL DEFAULT false,
+    updated_at timestamptz NOT NULL DEFAULT now(),
+    PRIMARY KEY (surface_key, surface_label)
+);
+
 -- ===== search: chunks + vectors (pgvector replaces sqlite-vec/FTS5) ======
 CREATE TABLE IF NOT EXISTS chunks (
     id bigint GENERATED ALWAYS AS IDENTITY PRIMARY KEY,
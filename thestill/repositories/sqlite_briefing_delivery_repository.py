@@ -24,7 +24,7 @@ from typing import Iterator, List, Optional
 from structlog import get_logger
 
 from ..models.briefing_delivery import BriefingDelivery
-from ..utils.sqlite_ext import connect
+from ..utils.sqlite_ext import pooled_connect
 from .briefing_delivery_repository import BriefingDeliveryRepository
 
 logger = get_logger(__name__)
@@ -46,8 +46,8 @@ class SqliteBriefingDeliveryRepository(BriefingDeliveryRepository):
 
     @contextmanager
     def _get_connection(self) -> Iterator[sqlite3.Connection]:
-        """Tuned SQLite connection. See ``thestill.utils.sqlite_ext.connect``."""
-        with connect(self.db_path) as conn:
+        """Tuned SQLite connection. See ``thestill.utils.sqlite_ext.pooled_connect``."""
+        with pooled_connect(self.db_path) as conn:
             yield conn
 
     def ensure_pending(self, briefing_id: str, channel: str, *, now: datetime) -> bool:
@@ -24,7 +24,7 @@ from structlog import get_logger
 
 from ..core.queue_manager import USER_CHAIN_STAGE_VALUES
 from ..models.briefing import Briefing
-from ..utils.sqlite_ext import connect
+from ..utils.sqlite_ext import pooled_connect
 from .briefing_repository import BriefingRepository
 
 logger = get_logger(__name__)
@@ -44,8 +44,8 @@ class SqliteBriefingRepository(BriefingRepository):
 
     @contextmanager
     def _get_connection(self) -> Iterator[sqlite3.Connection]:
-        """Tuned SQLite connection. See ``thestill.utils.sqlite_ext.connect``."""
-        with connect(self.db_path) as conn:
+        """Tuned SQLite connection. See ``thestill.utils.sqlite_ext.pooled_connect``."""
+        with pooled_connect(self.db_path) as conn:
             yield conn
 
     def insert(self, briefing: Briefing) -> Briefing:
@@ -40,7 +40,7 @@ from ..models.entities import EntityMention, EntityRecord, EntityType, MentionRo
 # ``EntityHit`` / ``MentionContext`` moved to the shared ABC module with
 # spec #44; re-exported here so existing call sites keep importing them
 # from this module.
-from .entity_repository import EntityHit, EntityRepository, MentionContext
+from .entity_repository import EntityHit, EntityRepository, MentionContext, episode_pair_deltas
 
 __all__ = ["SqliteEntityRepository", "EntityHit", "MentionContext"]
 
@@ -71,14 +71,14 @@ class SqliteEntityRepository(EntityRepository):
 
     @contextmanager
     def _get_connection(self):
-        """Tuned SQLite connection. See ``thestill.utils.sqlite_ext.connect``.
+        """Tuned SQLite connection. See ``thestill.utils.sqlite_ext.pooled_connect``.
 
         Soft-loads sqlite-vec when available so cascade DELETEs from
         ``episodes`` don't crash on the ``chunks_ad`` trigger.
         """
-        from ..utils.sqlite_ext import connect
+        from ..utils.sqlite_ext import pooled_connect
 
-        with connect(self.db_path, load_vec="soft") as conn:
+        with pooled_connect(self.db_path, load_vec="soft") as conn:
             yield conn
 
     # ------------------------------------------------------------------
@@ -209,14 +209,25 @@ class SqliteEntityRepository(EntityRepository):
         """Bulk-UPDATE every mention pointing at ``from_entity_id`` to
         point at ``to_entity_id``. Returns rowcount. Used by alias-merge
         before deleting the loser of a duplicate pair so cascade
-        doesn't take the mentions with it.
+        doesn't take the mentions with it. The touched episodes'
+        co-occurrence deltas are applied afterwards, so the keeper picks
+        up the loser's pairs before the delete cascades them away.
         """
         with self._get_connection() as conn:
+            episode_ids = [
+                r["episode_id"]
+                for r in conn.execute(
+                    "SELECT DISTINCT episode_id FROM entity_mentions WHERE entity_id = ?",
+                    (from_entity_id,),
+                ).fetchall()
+            ]
             cursor = conn.execute(
                 "UPDATE entity_mentions SET entity_id = ? WHERE entity_id = ?",
                 (to_entity_id, from_entity_id),
             )
-            return cursor.rowcount
+            moved = cursor.rowcount
+        self.update_cooccurrences(episode_ids)
+        return moved
 
     # ------------------------------------------------------------------
     # Mentions
@@ -1136,12 +1147,110 @@ class SqliteEntityRepository(EntityRepository):
     # Co-occurrences
     # ------------------------------------------------------------------
 
+    def update_cooccurrences(self, episode_ids: Iterable[str]) -> int:
+        """Apply per-episode co-occurrence deltas (the REBUILD_COOCCURRENCES
+        stage and the alias-merge repoint).
+
+        For each episode: read its ``episode_entities`` projection (the
+        entity set ``entity_cooccurrences`` currently reflects) and its
+        distinct resolved set from ``entity_mentions`` — both index-only
+        lookups on ``episode_id`` — then apply ``episode_pair_deltas``:
+        ``+1`` for pairs the episode gained, ``-1`` for pairs it lost
+        (rows reaching zero are deleted), a ``last_seen_at`` bump for
+        pairs it kept. Cost is O(entities in the episode²) regardless of
+        how popular those entities are corpus-wide — a host entity in
+        every episode no longer drags the whole corpus into each run.
+
+        Each episode is one ``BEGIN IMMEDIATE`` transaction on the pooled
+        writer, so concurrent updaters (parallel workers, another
+        process) serialise on the diff-then-write and never apply the
+        same delta twice. The transaction is short: a handful of indexed
+        reads and O(pairs) row writes.
+
+        ``last_seen_at`` only moves forward; a ``-1`` leaves it as is
+        (the next full rebuild recomputes the exact maximum).
+        """
+        from ..utils.sqlite_ext import pooled_writer
+
+        adjusted = 0
+        episodes = 0
+        for episode_id in dict.fromkeys(episode_ids):
+            with pooled_writer(self.db_path, load_vec="soft") as conn:
+                conn.execute("BEGIN IMMEDIATE")
+                previous = {
+                    r["entity_id"]: r["last_seen_at"]
+                    for r in conn.execute(
+                        "SELECT entity_id, last_seen_at FROM episode_entities WHERE episode_id = ?",
+                        (episode_id,),
+                    ).fetchall()
+                }
+                current = {
+                    r["entity_id"]: r["last_seen_at"]
+                    for r in conn.execute(
+                        """
+                        SELECT entity_id, MAX(COALESCE(resolved_at, created_at)) AS last_seen_at
+                        FROM entity_mentions
+                        WHERE episode_id = ?
+                          AND entity_id IS NOT NULL
+                          AND resolution_status = 'resolved'
+                        GROUP BY entity_id
+                        """,
+                        (episode_id,),
+                    ).fetchall()
+                }
+                if current == previous:
+                    continue
+                deltas = episode_pair_deltas(previous, current)
+                conn.executemany(
+                    """
+                    INSERT INTO entity_cooccurrences (entity_a_id, entity_b_id, episode_count, last_seen_at)
+                    VALUES (?, ?, 1, ?)
+                    ON CONFLICT(entity_a_id, entity_b_id) DO UPDATE SET
+                        episode_count = entity_cooccurrences.episode_count + 1,
+                        last_seen_at = MAX(entity_cooccurrences.last_seen_at, excluded.last_seen_at)
+                    """,
+                    [(d.entity_a_id, d.entity_b_id, d.last_seen_at) for d in deltas if d.delta > 0],
+                )
+                conn.executemany(
+                    """
+                    UPDATE entity_cooccurrences SET last_seen_at = MAX(last_seen_at, ?)
+                    WHERE entity_a_id = ? AND entity_b_id = ?
+                    """,
+                    [(d.last_seen_at, d.entity_a_id, d.entity_b_id) for d in deltas if d.delta == 0],
+                )
+                removed_pairs = [(d.entity_a_id, d.entity_b_id) for d in deltas if d.delta < 0]
+                conn.executemany(
+                    """
+                    UPDATE entity_cooccurrences SET episode_count = episode_count - 1
+                    WHERE entity_a_id = ? AND entity_b_id = ?
+                    """,
+                    removed_pairs,
+                )
+                conn.executemany(
+                    """
+                    DELETE FROM entity_cooccurrences
+                    WHERE entity_a_id = ? AND entity_b_id = ? AND episode_count <= 0
+                    """,
+                    removed_pairs,
+                )
+                conn.execute("DELETE FROM episode_entities WHERE episode_id = ?", (episode_id,))
+                conn.executemany(
+                    "INSERT INTO episode_entities (episode_id, entity_id, last_seen_at) VALUES (?, ?, ?)",
+                    [(episode_id, entity_id, last_seen) for entity_id, last_seen in current.items()],
+                )
+                adjusted += sum(1 for d in deltas if d.delta != 0)
+                episodes += 1
+        logger.info("cooccurrences_updated", episodes_changed=episodes, pairs_adjusted=adjusted)
+        return adjusted
+
     def rebuild_cooccurrences(self, *, episode_ids: Optional[List[str]] = None) -> int:
-        """Rebuild ``entity_cooccurrences`` for the given episodes.
+        """Repair ``entity_cooccurrences`` from ``entity_mentions``.
 
-        Called automatically at the end of ``resolve-entities`` for
-        affected episodes, and via ``thestill rebuild-cooccurrences``
-        for full rebuilds.
+        Routine maintenance is ``update_cooccurrences``; this is the
+        repair behind ``thestill rebuild-cooccurrences --full`` (and the
+        scoped variant), for when the incremental counts are suspected to
+        have drifted — e.g. after episodes were deleted, which cascades
+        their projection rows away without decrementing pair counts.
 
         ``episode_count`` is "distinct episodes containing the pair
         across the whole corpus" — NOT a running counter. So even when
@@ -1149,15 +1258,22 @@ class SqliteEntityRepository(EntityRepository):
         recomputed corpus-wide for any pair touched by the scope. We
         achieve this by:
         1. Collecting the entity-set that appears in the scoped
-           episodes (any pair touching one of these entities is
-           potentially stale).
+           episodes — from their mentions *and* their current
+           ``episode_entities`` projection, so an entity that dropped
+           out of an episode has its pairs recounted too.
         2. Deleting all rows in ``entity_cooccurrences`` that touch any
            of those entities (DELETE WHERE a_id IN ... OR b_id IN ...).
         3. INSERT … SELECT the corpus-wide aggregate for pairs where at
-           least one entity is in the affected set.
-        4. Returns the number of cooccurrence rows materialised.
+           least one entity is in the affected set, self-joining the
+           distinct ``(episode, entity)`` projection rather than raw
+           mention rows (an entity mentioned 40 times in an episode is
+           one row, not 40).
+        4. Replacing the scoped episodes' ``episode_entities`` rows so
+           later incremental updates diff against the repaired state.
+        5. Returns the number of cooccurrence rows materialised.
 
-        ``episode_ids=None`` is a full rebuild — wipe-and-replace.
+        ``episode_ids=None`` is a full rebuild — wipe-and-replace of both
+        tables.
 
         Concurrency: the corpus-wide self-join + ``GROUP BY`` is the
         expensive part and used to run *inside* the write transaction,
@@ -1171,14 +1287,16 @@ class SqliteEntityRepository(EntityRepository):
         materialised rows. The ``DELETE``/``INSERT`` stay in one
         transaction so readers never see a half-rebuilt scope; the
         aggregate reflecting phase-1 state (not phase-2) is fine — any
-        mention written in the gap re-triggers a rebuild for its episode.
+        mention written in the gap re-triggers an update for its episode.
         """
         # ---- Phase 1: read-only aggregate (no writer lock held) ----
         affected_ids: Optional[List[str]]
         with self._get_connection() as conn:
             if episode_ids is None:
                 affected_ids = None
+                scope_predicate = ""
                 affected_predicate = ""
+                projection_params: list = []
                 select_params: list = []
             else:
                 if not episode_ids:
@@ -1188,40 +1306,69 @@ class SqliteEntityRepository(EntityRepository):
                 placeholders = ",".join("?" * len(episode_ids))
                 affected_rows = conn.execute(
                     f"""
-                    SELECT DISTINCT entity_id FROM entity_mentions
+                    SELECT entity_id FROM entity_mentions
                     WHERE entity_id IS NOT NULL
                       AND resolution_status = 'resolved'
                       AND episode_id IN ({placeholders})
+                    UNION
+                    SELECT entity_id FROM episode_entities
+                    WHERE episode_id IN ({placeholders})
                     """,
-                    list(episode_ids),
+                    list(episode_ids) + list(episode_ids),
                 ).fetchall()
                 affected_ids = [r["entity_id"] for r in affected_rows]
                 if not affected_ids:
                     return 0
                 aff_placeholders = ",".join("?" * len(affected_ids))
+                # Only episodes containing an affected entity can
+                # contribute to an affected pair.
+                scope_predicate = (
+                    " AND episode_id IN (SELECT episode_id FROM entity_mentions "
+                    f"WHERE entity_id IN ({aff_placeholders}))"
+                )
                 affected_predicate = (
                     f" AND (a.entity_id IN ({aff_placeholders}) " f"     OR b.entity_id IN ({aff_placeholders}))"
                 )
-                select_params = affected_ids + affected_ids
+                projection_params = list(episode_ids)
+                select_params = affected_ids + affected_ids + affected_ids
+
+            projection_rows = conn.execute(
+                f"""
+                SELECT episode_id, entity_id, MAX(COALESCE(resolved_at, created_at)) AS last_seen_at
+                FROM entity_mentions
+                WHERE entity_id IS NOT NULL
+                  AND resolution_status = 'resolved'
+                  {"" if episode_ids is None else f"AND episode_id IN ({placeholders})"}
+                GROUP BY episode_id, entity_id
+                """,
+                projection_params,
+            ).fetchall()
 
-            # Self-join scoped to resolved mentions; canonical pair
-            # ordering via the ``a.entity_id < b.entity_id`` predicate
-            # in the JOIN clause matches the ``CHECK (a < b)`` on the
-            # target table. Materialised into memory so the writer lock
+            # Self-join over the distinct (episode, entity) projection;
+            # canonical pair ordering via the ``a.entity_id < b.entity_id``
+            # predicate in the JOIN clause matches the ``CHECK (a < b)`` on
+            # the target table. Materialised into memory so the writer lock
             # below covers only row insertion, not the aggregate.
             pair_rows = conn.execute(
                 f"""
+                WITH ee AS (
+                    SELECT episode_id, entity_id, MAX(COALESCE(resolved_at, created_at)) AS last_seen_at
+                    FROM entity_mentions
+                    WHERE entity_id IS NOT NULL
+                      AND resolution_status = 'resolved'
+                      {scope_predicate}
+                    GROUP BY episode_id, entity_id
+                )
                 SELECT
                     a.entity_id AS entity_a_id,
                     b.entity_id AS entity_b_id,
-                    COUNT(DISTINCT a.episode_id) AS episode_count,
-                    MAX(COALESCE(a.resolved_at, a.created_at)) AS last_seen_at
-                FROM entity_mentions a
-                JOIN entity_mentions b
+                    COUNT(*) AS episode_count,
+                    MAX(a.last_seen_at) AS last_seen_at
+                FROM ee a
+                JOIN ee b
                     ON a.episode_id = b.episode_id
                    AND a.entity_id < b.entity_id
-                WHERE a.resolution_status = 'resolved'
-                  AND b.resolution_status = 'resolved'
+                WHERE 1 = 1
                   {affected_predicate}
                 GROUP BY a.entity_id, b.entity_id
                 """,
@@ -1229,11 +1376,13 @@ class SqliteEntityRepository(EntityRepository):
             ).fetchall()
 
         insert_values = [(r["entity_a_id"], r["entity_b_id"], r["episode_count"], r["last_seen_at"]) for r in pair_rows]
+        projection_values = [(r["episode_id"], r["entity_id"], r["last_seen_at"]) for r in projection_rows]
 
         # ---- Phase 2: short write transaction (DELETE + bulk INSERT) ----
         with self._get_connection() as conn:
             if affected_ids is None:
                 conn.execute("DELETE FROM entity_cooccurrences")
+                conn.execute("DELETE FROM episode_entities")
             else:
                 aff_placeholders = ",".join("?" * len(affected_ids))
                 conn.execute(
@@ -1244,6 +1393,10 @@ class SqliteEntityRepository(EntityRepository):
                     """,
                     affected_ids + affected_ids,
                 )
+                conn.execute(
+                    f"DELETE FROM episode_entities WHERE episode_id IN ({placeholders})",
+                    list(episode_ids),
+                )
             if insert_values:
                 conn.executemany(
                     """
@@ -1253,6 +1406,11 @@ class SqliteEntityRepository(EntityRepository):
                     """,
                     insert_values,
                 )
+            if projection_values:
+                conn.executemany(
+                    "INSERT INTO episode_entities (episode_id, entity_id, last_seen_at) VALUES (?, ?, ?)",
+                    projection_values,
+                )
         inserted = len(insert_values)
         logger.info(
             "cooccurrences_rebuilt",
@@ -1466,7 +1624,11 @@ class SqliteEntityRepository(EntityRepository):
         wrong_qid: str,
         reason: Optional[str] = None,
     ) -> int:
-        """Negative cache: refuse to ground ``surface_form → wrong_qid``."""
+        """Negative cache: refuse to ground ``surface_form → wrong_qid``.
+
+        Also drops the matching ``entity_resolution_cache`` row so the
+        surface goes back through the model on its next sighting.
+        """
         with self._get_connection() as conn:
             cursor = conn.execute(
                 """
@@ -1476,6 +1638,10 @@ class SqliteEntityRepository(EntityRepository):
                 """,
                 (surface_form, wrong_qid, reason),
             )
+            conn.execute(
+                "DELETE FROM entity_resolution_cache WHERE surface_key = ? AND wikidata_qid = ?",
+                (" ".join(surface_form.split()).casefold(), wrong_qid),
+            )
             return int(cursor.lastrowid or 0)
 
     def is_blacklisted(self, surface_form: str, wrong_qid: str) -> bool:
@@ -1498,6 +1664,72 @@ class SqliteEntityRepository(EntityRepository):
             ).fetchall()
         return [dict(r) for r in rows]
 
+    # ------------------------------------------------------------------
+    # Surface-form resolution cache
+    # ------------------------------------------------------------------
+
+    def lookup_surface_resolutions(self, keys: Iterable[Tuple[str, str]]) -> Dict[Tuple[str, str], dict]:
+        keys = list(keys)
+        found: Dict[Tuple[str, str], dict] = {}
+        # Chunked to stay under SQLite's bound-parameter limit (two per key).
+        for offset in range(0, len(keys), 400):
+            chunk = keys[offset : offset + 400]
+            placeholders = ", ".join("(?, ?)" for _ in chunk)
+            params = [value for key in chunk for value in key]
+            with self._get_connection() as conn:
+                rows = conn.execute(
+                    f"""
+                    SELECT * FROM entity_resolution_cache
+                    WHERE (surface_key, surface_label) IN (VALUES {placeholders})
+                    """,
+                    params,
+                ).fetchall()
+            for row in rows:
+                found[(row["surface_key"], row["surface_label"])] = _row_to_surface_resolution(row)
+        return found
+
+    def record_surface_resolutions(self, observations: List[dict]) -> None:
+        if not observations:
+            return
+        now_iso = datetime.now(timezone.utc).isoformat()
+        with self._get_connection() as conn:
+            conn.executemany(
+                """
+                INSERT INTO entity_resolution_cache
+                    (surface_key, surface_label, wikidata_qid, canonical_name,
+                     entity_type, description, wikidata_instance_of, updated_at)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+                ON CONFLICT(surface_key, surface_label) DO UPDATE SET
+                    observations = CASE WHEN entity_resolution_cache.wikidata_qid = excluded.wikidata_qid
+                        THEN entity_resolution_cache.observations + 1
+                        ELSE entity_resolution_cache.observations END,
+                    conflicting = CASE WHEN entity_resolution_cache.wikidata_qid = excluded.wikidata_qid
+                        THEN entity_resolution_cache.conflicting ELSE 1 END,
+                    canonical_name = CASE WHEN entity_resolution_cache.wikidata_qid = excluded.wikidata_qid
+                        THEN excluded.canonical_name ELSE entity_resolution_cache.canonical_name END,
+                    entity_type = CASE WHEN entity_resolution_cache.wikidata_qid = excluded.wikidata_qid
+                        THEN excluded.entity_type ELSE entity_resolution_cache.entity_type END,
+                    description = CASE WHEN entity_resolution_cache.wikidata_qid = excluded.wikidata_qid
+                        THEN excluded.description ELSE entity_resolution_cache.description END,
+                    wikidata_instance_of = CASE WHEN entity_resolution_cache.wikidata_qid = excluded.wikidata_qid
+                        THEN excluded.wikidata_instance_of ELSE entity_resolution_cache.wikidata_instance_of END,
+                    updated_at = excluded.updated_at
+                """,
+                [
+                    (
+                        o["surface_key"],
+                        o["surface_label"],
+                        o["wikidata_qid"],
+                        o["canonical_name"],
+                        o["entity_type"],
+                        o.get("description"),
+                        json.dumps(o.get("wikidata_instance_of") or []),
+                        now_iso,
+                    )
+                    for o in observations
+                ],
+            )
+
     # ------------------------------------------------------------------
     # Detection queue — review of likely-wrong resolutions
     # ------------------------------------------------------------------
@@ -1736,6 +1968,18 @@ def _row_to_mention_context(row: sqlite3.Row) -> MentionContext:
     )
 
 
+def _row_to_surface_resolution(row: sqlite3.Row) -> dict:
+    return {
+        "wikidata_qid": row["wikidata_qid"],
+        "canonical_name": row["canonical_name"],
+        "entity_type": row["entity_type"],
+        "description": row["description"],
+        "wikidata_instance_of": json.loads(row["wikidata_instance_of"] or "[]"),
+        "observations": row["observations"],
+        "conflicting": bool(row["conflicting"]),
+    }
+
+
 def _row_to_mention(row: sqlite3.Row) -> EntityMention:
     keys = set(row.keys())
     method_str = row["resolution_method"] if "resolution_method" in keys else None
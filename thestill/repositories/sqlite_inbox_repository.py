@@ -30,7 +30,7 @@ from typing import Any, Iterable, Iterator, List, Optional, Tuple
 from structlog import get_logger
 
 from ..models.inbox import INBOX_STATES_ELIGIBLE_FOR_BRIEFING, InboxEntry, InboxItem, InboxState, PodcastInboxSummary
-from ..utils.sqlite_ext import connect
+from ..utils.sqlite_ext import pooled_connect
 from .inbox_repository import InboxRepository
 from .sqlite_podcast_repository import episode_from_row
 
@@ -84,8 +84,8 @@ class SqliteInboxRepository(InboxRepository):
 
     @contextmanager
     def _get_connection(self) -> Iterator[sqlite3.Connection]:
-        """Tuned SQLite connection. See ``thestill.utils.sqlite_ext.connect``."""
-        with connect(self.db_path) as conn:
+        """Tuned SQLite connection. See ``thestill.utils.sqlite_ext.pooled_connect``."""
+        with pooled_connect(self.db_path) as conn:
             yield conn
 
     # ------------------------------------------------------------------
@@ -18,7 +18,7 @@
 claim/discard blocks until this transaction commits or rolls back, then
 re-reads and finds the local row gone (winner committed) or intact
 (winner rolled back — safe retry). All statements run on one connection;
-``utils.sqlite_ext.connect`` commits on success and rolls back on error.
+``utils.sqlite_ext.pooled_connect`` commits on success and rolls back on error.
 """
 
 import sqlite3
@@ -28,7 +28,7 @@ from typing import Dict, Iterator, Optional
 
 from structlog import get_logger
 
-from ..utils.sqlite_ext import connect
+from ..utils.sqlite_ext import pooled_connect
 from .legacy_claim_repository import LegacyClaimRepository, LegacyClaimResult
 
 logger = get_logger(__name__)
@@ -42,7 +42,7 @@ class SqliteLegacyClaimRepository(LegacyClaimRepository):
 
     @contextmanager
     def _locked_connection(self) -> Iterator[sqlite3.Connection]:
-        with connect(self.db_path) as conn:
+        with pooled_connect(self.db_path) as conn:
             # Writer lock up front: serializes concurrent claim attempts.
             conn.execute("BEGIN IMMEDIATE")
             yield conn
@@ -34,7 +34,7 @@ from typing import Iterator, List, Optional
 from structlog import get_logger
 
 from ..models.pending_operation import PendingOperation
-from ..utils.sqlite_ext import connect
+from ..utils.sqlite_ext import pooled_connect
 from .pending_operations_repository import PendingOperationsRepository
 
 logger = get_logger(__name__)
@@ -76,14 +76,14 @@ class SqlitePendingOperationsRepository(PendingOperationsRepository):
 
     @contextmanager
     def _get_connection(self) -> Iterator[sqlite3.Connection]:
-        """Tuned SQLite connection. See ``thestill.utils.sqlite_ext.connect``.
+        """Tuned SQLite connection. See ``thestill.utils.sqlite_ext.pooled_connect``.
 
         Parallel transcription chunk workers (and the web server) all write
         pending-operation rows concurrently; the shared helper's WAL +
         ``busy_timeout`` make the loser of a write race wait its turn instead
         of fail-fast with ``database is locked``.
         """
-        with connect(self.db_path) as conn:
+        with pooled_connect(self.db_path) as conn:
             yield conn
 
     # --- Mutations -----------------------------------------------------------
@@ -30,7 +30,7 @@ from typing import Iterator, List
 from structlog import get_logger
 
 from ..models.user import PodcastFollower
-from ..utils.sqlite_ext import connect
+from ..utils.sqlite_ext import pooled_connect
 from .podcast_follower_repository import PodcastFollowerRepository
 
 logger = get_logger(__name__)
@@ -55,8 +55,8 @@ class SqlitePodcastFollowerRepository(PodcastFollowerRepository):
 
     @contextmanager
     def _get_connection(self) -> Iterator[sqlite3.Connection]:
-        """Tuned SQLite connection. See ``thestill.utils.sqlite_ext.connect``."""
-        with connect(self.db_path) as conn:
+        """Tuned SQLite connection. See ``thestill.utils.sqlite_ext.pooled_connect``."""
+        with pooled_connect(self.db_path) as conn:
             yield conn
 
     def add(self, follower: PodcastFollower) -> PodcastFollower:
@@ -34,6 +34,7 @@ from typing import Any, Dict, List, Optional, Sequence, Set, Tuple
 
 from structlog import get_logger
 
+from ..core.refresh_cadence import HISTORY_SIZE, RefreshCadenceSettings, plan_refresh
 from ..core.refresh_failure import (
     RefreshAction,
     RefreshDecision,
@@ -47,6 +48,14 @@ from ..models.podcast import AlternateEnclosure, Episode, EpisodeState, FailureT
 from ..utils.datetime_utils import ensure_utc, now_utc
 from ..utils.podcast_categories import APPLE_GENRE_IDS, APPLE_PODCAST_TAXONOMY, normalize_category_name
 from ..utils.slug import generate_slug
+from .episode_listing import (
+    EPISODE_SORT_COLUMNS,
+    EpisodeCountCache,
+    InvalidCursorError,
+    decode_episode_cursor,
+    keyset_predicate,
+    normalize_episode_sort,
+)
 from .podcast_repository import EpisodeRepository, PodcastRepository
 
 logger = get_logger(__name__)
@@ -60,6 +69,14 @@ _MTIME_EPSILON = 1e-6
 # in a handful of statements instead of one oversized — or rejected — one.
 _SQL_PARAM_CHUNK = 900
 
+# FTS5's trigram tokenizer (episode title search) shipped in SQLite 3.34.0.
+_TRIGRAM_MIN_SQLITE = (3, 34, 0)
+# Episode ids whose title matches a ``LIKE`` pattern, via the trigram index.
+_TITLE_FTS_MATCH = (
+    "SELECT k.episode_id FROM episodes_title_fts f "
+    "JOIN episodes_title_fts_keys k ON k.key = f.rowid WHERE f.title LIKE ?"
+)
+
 # Deterministic UUID5 so the synthetic-audio-imports parent has a stable id
 # across runs and machines without persisting it as configuration.
 SYNTHETIC_AUDIO_IMPORTS_RSS = "synthetic://audio-imports"
@@ -191,6 +208,11 @@ class SqlitePodcastRepository(PodcastRepository, EpisodeRepository):
         # under ``(top_norm, sub_norm)`` — a single dict covers both lookups.
         self._cat_id_to_pair: Dict[int, Tuple[Optional[str], Optional[str]]] = {}
         self._cat_pair_to_id: Dict[Tuple[str, Optional[str]], int] = {}
+        # ``get_all_episodes`` totals, invalidated by the trigger-maintained
+        # ``episode_write_generation`` counter (exact across processes).
+        self._episode_count_cache = EpisodeCountCache()
+        # Whether listing search can use the trigram title index (SQLite 3.34+).
+        self._title_fts = False
         self._ensure_database_exists()
         logger.info(f"Initialized SQLite repository: {self.db_path}")
 
@@ -836,6 +858,91 @@ class SqlitePodcastRepository(PodcastRepository, EpisodeRepository):
                 """)
             logger.info("Migration complete: resolution_blacklist created")
 
+        # Surface-form → QID memo for EntityResolver. ``surface_key`` is
+        # normalised in Python (whitespace-collapsed, casefolded) because
+        # SQLite's LOWER only folds ASCII; the resolver decides when a row
+        # is trustworthy (observations / conflicting).
+        cursor = conn.execute("SELECT name FROM sqlite_master WHERE type='table' AND name='entity_resolution_cache'")
+        if cursor.fetchone() is None:
+            logger.info("Migrating database: creating entity_resolution_cache table")
+            conn.executescript("""
+                CREATE TABLE entity_resolution_cache (
+                    surface_key          TEXT NOT NULL,
+                    surface_label        TEXT NOT NULL DEFAULT '',
+                    wikidata_qid         TEXT NOT NULL,
+                    canonical_name       TEXT NOT NULL,
+                    entity_type          TEXT NOT NULL,
+                    description          TEXT NULL,
+                    wikidata_instance_of TEXT NOT NULL DEFAULT '[]',
+                    observations         INTEGER NOT NULL DEFAULT 1,
+                    conflicting          INTEGER NOT NULL DEFAULT 0,
+                    updated_at           TIMESTAMP NOT NULL
+                                         DEFAULT (strftime('%Y-%m-%dT%H:%M:%f+00:00','now')),
+                    PRIMARY KEY (surface_key, surface_label)
+                );
+                """)
+            logger.info("Migration complete: entity_resolution_cache created")
+
+        # Incremental co-occurrences: ``episode_entities`` is the distinct
+        # resolved (episode, entity) set that ``entity_cooccurrences``
+        # currently reflects. ``update_cooccurrences`` diffs an episode's
+        # mentions against it and applies ±1 pair deltas. Backfilled from
+        # the mentions and the pair table rebuilt from it in the same
+        # step, so the two start out consistent (a stale pair table would
+        # otherwise have the first deltas applied on top of its drift).
+        cursor = conn.execute("SELECT name FROM sqlite_master WHERE type='table' AND name='episode_entities'")
+        if cursor.fetchone() is None:
+            logger.info("Migrating database: creating episode_entities projection")
+            conn.executescript("""
+                CREATE TABLE episode_entities (
+                    episode_id   TEXT NOT NULL REFERENCES episodes(id) ON DELETE CASCADE,
+                    entity_id    TEXT NOT NULL REFERENCES entities(id) ON DELETE CASCADE,
+                    last_seen_at TIMESTAMP NOT NULL,
+                    PRIMARY KEY (episode_id, entity_id)
+                );
+                CREATE INDEX idx_episode_entities_entity ON episode_entities(entity_id);
+
+                INSERT INTO episode_entities (episode_id, entity_id, last_seen_at)
+                SELECT episode_id, entity_id, MAX(COALESCE(resolved_at, created_at))
+                FROM entity_mentions
+                WHERE entity_id IS NOT NULL AND resolution_status = 'resolved'
+                GROUP BY episode_id, entity_id;
+
+                DELETE FROM entity_cooccurrences;
+                INSERT INTO entity_cooccurrences (entity_a_id, entity_b_id, episode_count, last_seen_at)
+                SELECT a.entity_id, b.entity_id, COUNT(*), MAX(a.last_seen_at)
+                FROM episode_entities a
+                JOIN episode_entities b
+                    ON a.episode_id = b.episode_id AND a.entity_id < b.entity_id
+                GROUP BY a.entity_id, b.entity_id;
+                """)
+            logger.info("Migration complete: episode_entities created and co-occurrences resynced")
+
+        # Deleting an episode cascades its ``episode_entities`` rows away,
+        # so its pairs must be released first or they stay counted forever.
+        # A trigger covers every path (``delete``, ``save``'s episode
+        # rewrite, podcast cascades). Pairs are read from the projection,
+        # the same set ``update_cooccurrences`` applied.
+        conn.executescript("""
+            CREATE TRIGGER IF NOT EXISTS trg_episodes_release_cooccurrences BEFORE DELETE ON episodes BEGIN
+                UPDATE entity_cooccurrences SET episode_count = episode_count - 1
+                WHERE (entity_a_id, entity_b_id) IN (
+                    SELECT a.entity_id, b.entity_id
+                    FROM episode_entities a
+                    JOIN episode_entities b ON b.episode_id = a.episode_id AND a.entity_id < b.entity_id
+                    WHERE a.episode_id = old.id
+                );
+                DELETE FROM entity_cooccurrences
+                WHERE episode_count <= 0 AND (entity_a_id, entity_b_id) IN (
+                    SELECT a.entity_id, b.entity_id
+                    FROM episode_entities a
+                    JOIN episode_entities b ON b.episode_id = a.episode_id AND a.entity_id < b.entity_id
+                    WHERE a.episode_id = old.id
+                );
+                DELETE FROM episode_entities WHERE episode_id = old.id;
+            END;
+            """)
+
         # spec #45 — entity_enrichment: Tier-0 display data (photo/logo,
         # vital stats, Wikipedia lead, cross-links) fetched from Wikidata
         # + Wikipedia, keyed 1:1 by entity_id. Kept in its own table (not
@@ -1606,6 +1713,13 @@ class SqlitePodcastRepository(PodcastRepository, EpisodeRepository):
             "WHERE refresh_disabled_reason IS NOT NULL"
         )
 
+        # Adaptive refresh cadence (core.refresh_cadence). Zero/NULL is
+        # "no streak, no hint", so existing feeds need no backfill.
+        if "refresh_unchanged_streak" not in podcast_columns_now:
+            conn.execute("ALTER TABLE podcasts ADD COLUMN refresh_unchanged_streak INTEGER NOT NULL DEFAULT 0")
+        if "refresh_hint_seconds" not in podcast_columns_now:
+            conn.execute("ALTER TABLE podcasts ADD COLUMN refresh_hint_seconds INTEGER NULL")
+
         # spec #69 Phase 1 — performance indices (SQLite parity with
         # migration 0007 where the syntax ports; the pg_trgm / jsonb-GIN
         # indices are Postgres-only, and SQLite's DESC ordering already
@@ -1644,6 +1758,117 @@ class SqlitePodcastRepository(PodcastRepository, EpisodeRepository):
                 ON entities(LOWER(canonical_name));
             """)
 
+        # Episode listing (``get_all_episodes``): keyset indexes with the id
+        # tiebreak, a trigram FTS5 mirror of titles so ``LIKE '%term%'``
+        # searches are index-backed (see ``_migrate_episode_title_fts``),
+        # and a write-generation counter the cached listing totals are
+        # tagged with.
+        conn.executescript("""
+            CREATE INDEX IF NOT EXISTS idx_episodes_pub_date_id ON episodes(pub_date DESC, id DESC);
+            CREATE INDEX IF NOT EXISTS idx_episodes_updated_at_id ON episodes(updated_at DESC, id DESC);
+            CREATE INDEX IF NOT EXISTS idx_episodes_title_id ON episodes(title, id);
+            -- Podcast listing order, for the index <-> id rank lookups.
+            CREATE INDEX IF NOT EXISTS idx_podcasts_created_at_id ON podcasts(created_at DESC, id);
+
+            CREATE TABLE IF NOT EXISTS episode_write_generation (
+                id INTEGER PRIMARY KEY CHECK (id = 1),
+                generation INTEGER NOT NULL
+            );
+            INSERT OR IGNORE INTO episode_write_generation (id, generation) VALUES (1, 0);
+
+            CREATE TRIGGER IF NOT EXISTS trg_episodes_generation_insert AFTER INSERT ON episodes BEGIN
+                UPDATE episode_write_generation SET generation = generation + 1 WHERE id = 1;
+            END;
+            CREATE TRIGGER IF NOT EXISTS trg_episodes_generation_update AFTER UPDATE ON episodes BEGIN
+                UPDATE episode_write_generation SET generation = generation + 1 WHERE id = 1;
+            END;
+            CREATE TRIGGER IF NOT EXISTS trg_episodes_generation_delete AFTER DELETE ON episodes BEGIN
+                UPDATE episode_write_generation SET generation = generation + 1 WHERE id = 1;
+            END;
+            """)
+        self._migrate_episode_title_fts(conn)
+
+    def _migrate_episode_title_fts(self, conn: sqlite3.Connection) -> None:
+        """Create (or upgrade) the trigram title index behind listing search.
+
+        ``episodes`` has a TEXT primary key, so its implicit rowid is not
+        stable: VACUUM or a dump/restore may renumber it. The index is
+        therefore keyed on ``episodes_title_fts_keys.key``, an INTEGER
+        PRIMARY KEY assigned once per episode id, and stores its own copy
+        of each title. The first layout (external-content on the episodes
+        rowid) is dropped and rebuilt.
+
+        The trigram tokenizer needs SQLite 3.34; on older builds (or
+        without FTS5) no index is created and search falls back to a plain
+        ``LIKE`` scan.
+        """
+        names = {
+            row["name"]
+            for row in conn.execute(
+                "SELECT name FROM sqlite_master WHERE name IN ('episodes_title_fts', 'episodes_title_fts_keys')"
+            )
+        }
+        supported = sqlite3.sqlite_version_info >= _TRIGRAM_MIN_SQLITE
+        if "episodes_title_fts" in names and ("episodes_title_fts_keys" not in names or not supported):
+            logger.info("Migrating database: dropping episodes_title_fts index", sqlite_version=sqlite3.sqlite_version)
+            conn.executescript("""
+                DROP TRIGGER IF EXISTS trg_episodes_title_fts_insert;
+                DROP TRIGGER IF EXISTS trg_episodes_title_fts_delete;
+                DROP TRIGGER IF EXISTS trg_episodes_title_fts_update;
+                DROP TABLE IF EXISTS episodes_title_fts_keys;
+                """)
+            try:
+                conn.execute("DROP TABLE episodes_title_fts")
+            except sqlite3.OperationalError as exc:  # tokenizer unknown to this build
+                logger.warning("episodes_title_fts_drop_failed", error=str(exc))
+            names = set()
+
+        if not supported:
+            logger.warning(
+                "episode_title_search_unindexed",
+                sqlite_version=sqlite3.sqlite_version,
+                note="trigram FTS5 needs SQLite 3.34+; title search scans episodes",
+            )
+            self._title_fts = False
+            return
+        if "episodes_title_fts_keys" in names:
+            self._title_fts = True
+            return
+
+        logger.info("Migrating database: creating episodes_title_fts index")
+        try:
+            conn.execute("CREATE VIRTUAL TABLE episodes_title_fts USING fts5(title, tokenize='trigram')")
+        except sqlite3.OperationalError as exc:  # built without FTS5
+            logger.warning("episode_title_search_unindexed", error=str(exc))
+            self._title_fts = False
+            return
+        conn.executescript("""
+            CREATE TABLE episodes_title_fts_keys (
+                key INTEGER PRIMARY KEY,
+                episode_id TEXT NOT NULL UNIQUE
+            );
+            CREATE TRIGGER trg_episodes_title_fts_insert AFTER INSERT ON episodes BEGIN
+                INSERT INTO episodes_title_fts_keys (episode_id) VALUES (new.id);
+                INSERT INTO episodes_title_fts (rowid, title)
+                VALUES ((SELECT key FROM episodes_title_fts_keys WHERE episode_id = new.id), new.title);
+            END;
+            CREATE TRIGGER trg_episodes_title_fts_delete AFTER DELETE ON episodes BEGIN
+                DELETE FROM episodes_title_fts
+                WHERE rowid = (SELECT key FROM episodes_title_fts_keys WHERE episode_id = old.id);
+                DELETE FROM episodes_title_fts_keys WHERE episode_id = old.id;
+            END;
+            CREATE TRIGGER trg_episodes_title_fts_update AFTER UPDATE OF id, title ON episodes BEGIN
+                UPDATE episodes_title_fts_keys SET episode_id = new.id WHERE episode_id = old.id;
+                UPDATE episodes_title_fts SET title = new.title
+                WHERE rowid = (SELECT key FROM episodes_title_fts_keys WHERE episode_id = new.id);
+            END;
+            INSERT INTO episodes_title_fts_keys (episode_id) SELECT id FROM episodes;
+            INSERT INTO episodes_title_fts (rowid, title)
+                SELECT k.key, e.title FROM episodes_title_fts_keys k JOIN episodes e ON e.id = k.episode_id;
+            """)
+        self._title_fts = True
+        logger.info("Migration complete: episodes_title_fts created")
+
     # ------------------------------------------------------------------
     # Spec #40 — file → DB backfill
     # ------------------------------------------------------------------
@@ -2114,6 +2339,11 @@ class SqlitePodcastRepository(PodcastRepository, EpisodeRepository):
                 refresh_failure_streak_started_at TIMESTAMP NULL,
                 refresh_disabled_reason TEXT NULL,
                 refresh_retry_after_at TIMESTAMP NULL,
+                -- Adaptive cadence: refreshes in a row that found nothing
+                -- new, and the poll interval the feed's <ttl> /
+                -- sy:updatePeriod asks for (core.refresh_cadence).
+                refresh_unchanged_streak INTEGER NOT NULL DEFAULT 0,
+                refresh_hint_seconds INTEGER NULL,
                 -- Synthetic fallback parent (e.g. bare-audio imports);
                 -- excluded from refresh, browse, and follow flows.
                 synthetic INTEGER NOT NULL DEFAULT 0,
@@ -2355,9 +2585,9 @@ class SqlitePodcastRepository(PodcastRepository, EpisodeRepository):
           that touches the ``chunks_vec`` virtual table without
           ``no such module: vec0``
         """
-        from ..utils.sqlite_ext import connect
+        from ..utils.sqlite_ext import pooled_connect
 
-        with connect(self.db_path, load_vec="soft") as conn:
+        with pooled_connect(self.db_path, load_vec="soft") as conn:
             yield conn
 
     @contextmanager
@@ -2599,7 +2829,7 @@ class SqlitePodcastRepository(PodcastRepository, EpisodeRepository):
                        author, explicit, show_type, website_url, is_complete, copyright,
                        last_processed, last_processed_at, etag, last_modified, updated_at
                 FROM podcasts
-                ORDER BY created_at DESC
+                ORDER BY created_at DESC, id
             """)
 
             podcasts = []
@@ -3271,8 +3501,9 @@ class SqlitePodcastRepository(PodcastRepository, EpisodeRepository):
             for episode_id, image_url in updates
         ]
         with self._get_connection() as conn:
-            before = conn.total_changes
-            conn.executemany(
+            # ``rowcount`` sums the per-statement changes; ``total_changes``
+            # would also count the episode-listing triggers' writes.
+            cursor = conn.executemany(
                 """
                 UPDATE episodes
                 SET image_url = ?, updated_at = ?
@@ -3280,7 +3511,7 @@ class SqlitePodcastRepository(PodcastRepository, EpisodeRepository):
                 """,
                 params,
             )
-            return conn.total_changes - before
+            return cursor.rowcount
 
     # ------------------------------------------------------------------
     # Spec #48 — background refresh scheduling (cadence + failure state)
@@ -3359,7 +3590,9 @@ class SqlitePodcastRepository(PodcastRepository, EpisodeRepository):
             ).fetchall()
             return [row["id"] for row in rows]
 
-    def get_refresh_health_counts(self, now: Optional[datetime] = None) -> Dict[str, Any]:
+    def get_refresh_health_counts(
+        self, now: Optional[datetime] = None, baseline_interval_seconds: int = 3600
+    ) -> Dict[str, Any]:
         """Spec #60 — one cheap aggregate for status surfacing.
 
         Returns ``{"active": n, "due_now": n, "backing_off": n,
@@ -3367,6 +3600,12 @@ class SqlitePodcastRepository(PodcastRepository, EpisodeRepository):
         without a ``refresh_disabled_reason`` (legacy generic parks from
         before spec #60) count under reason ``"unknown"`` — the visible
         signal that unclassified parks still exist.
+
+        ``fetches_per_day`` is what the scheduled feeds' current intervals
+        add up to; ``fetches_avoided_per_day`` compares it with polling every
+        active feed at ``baseline_interval_seconds`` (the caller passes
+        ``REFRESH_DEFAULT_INTERVAL_SECONDS``). Negative means the adaptive
+        cadence polls more often than the baseline would.
         """
         now_iso = (now or now_utc()).isoformat()
         active_filter = self._active_feed_sql()
@@ -3380,9 +3619,18 @@ class SqlitePodcastRepository(PodcastRepository, EpisodeRepository):
                 GROUP BY reason
                 """).fetchall()
             parked_by_reason = {row["reason"]: row["n"] for row in reason_rows}
-            active = conn.execute(
-                f"SELECT COUNT(*) AS n FROM podcasts WHERE next_refresh_at IS NOT NULL AND {active_filter}"
-            ).fetchone()["n"]
+            # Scheduled polls per day at each feed's current interval, against
+            # polling every active feed at the fixed baseline interval.
+            cadence = conn.execute(
+                f"""
+                SELECT COUNT(*) AS n,
+                       COALESCE(SUM(86400.0 / COALESCE(NULLIF(refresh_interval_seconds, 0), ?)), 0) AS per_day
+                FROM podcasts WHERE next_refresh_at IS NOT NULL AND {active_filter}
+                """,
+                (baseline_interval_seconds,),
+            ).fetchone()
+            active = cadence["n"]
+            fetches_per_day = float(cadence["per_day"])
             due_now = conn.execute(
                 f"""
                 SELECT COUNT(*) AS n FROM podcasts
@@ -3401,6 +3649,8 @@ class SqlitePodcastRepository(PodcastRepository, EpisodeRepository):
             "backing_off": backing_off,
             "parked_total": sum(parked_by_reason.values()),
             "parked_by_reason": parked_by_reason,
+            "fetches_per_day": round(fetches_per_day, 1),
+            "fetches_avoided_per_day": round(active * 86400 / max(1, baseline_interval_seconds) - fetches_per_day, 1),
         }
 
     def get_discovered_unqueued_episodes(
@@ -3646,31 +3896,59 @@ class SqlitePodcastRepository(PodcastRepository, EpisodeRepository):
         max_interval: int,
         default_interval: int,
         now: Optional[datetime] = None,
+        *,
+        not_modified: bool = False,
+        feed_hint_seconds: Optional[int] = None,
+        cadence: Optional[RefreshCadenceSettings] = None,
     ) -> str:
-        """Record a successful refresh and recompute the adaptive (AIMD)
-        interval. New episodes → shorten (÷2, decrease); none → lengthen
-        (×1.5, increase). Clears ``last_refresh_error``. Returns the new
-        ``next_refresh_at`` ISO string.
+        """Record a successful refresh and plan the feed's next poll.
+
+        The interval comes from :func:`plan_refresh`: the feed's publish
+        rhythm (its newest ``HISTORY_SIZE`` episode dates), its streak of
+        unchanged refreshes, and its ``<ttl>``/``sy:updatePeriod`` hint, with
+        the old AIMD rule (÷2 on new episodes, ×1.5 otherwise) for feeds
+        without enough history. A 304 carries no body, so the stored hint is
+        kept; a 200 replaces it. Clears ``last_refresh_error``. Returns the
+        new ``next_refresh_at`` ISO string.
         """
         now_dt = now or now_utc()
         with self._get_connection() as conn:
             row = conn.execute(
-                "SELECT refresh_interval_seconds FROM podcasts WHERE id = ?",
+                "SELECT refresh_interval_seconds, refresh_unchanged_streak, refresh_hint_seconds "
+                "FROM podcasts WHERE id = ?",
                 (podcast_id,),
             ).fetchone()
             current = row["refresh_interval_seconds"] if row and row["refresh_interval_seconds"] else default_interval
-            if found_new:
-                new_interval = max(min_interval, current // 2)
-            else:
-                new_interval = min(max_interval, int(current * 1.5))
-            new_interval = max(min_interval, min(max_interval, new_interval))
-            next_at = (now_dt + timedelta(seconds=new_interval)).isoformat()
+            hint = (row["refresh_hint_seconds"] if row else None) if not_modified else feed_hint_seconds
+            pub_rows = conn.execute(
+                """
+                SELECT pub_date FROM episodes
+                WHERE podcast_id = ? AND pub_date IS NOT NULL
+                ORDER BY pub_date DESC
+                LIMIT ?
+                """,
+                (podcast_id, HISTORY_SIZE),
+            ).fetchall()
+            plan = plan_refresh(
+                current_interval=current,
+                found_new=found_new,
+                prior_unchanged_streak=(row["refresh_unchanged_streak"] or 0) if row else 0,
+                pub_dates=[ensure_utc(datetime.fromisoformat(r["pub_date"])) for r in pub_rows],
+                hint_seconds=hint,
+                min_interval=min_interval,
+                max_interval=max_interval,
+                settings=cadence or RefreshCadenceSettings(),
+                now=now_dt,
+            )
+            next_at = plan.next_refresh_at.isoformat()
             conn.execute(
                 """
                 UPDATE podcasts
                 SET refresh_interval_seconds = ?,
                     next_refresh_at = ?,
                     last_refresh_at = ?,
+                    refresh_unchanged_streak = ?,
+                    refresh_hint_seconds = ?,
                     last_refresh_error = NULL,
                     last_refresh_failure_kind = NULL,
                     last_refresh_status_code = NULL,
@@ -3681,7 +3959,15 @@ class SqlitePodcastRepository(PodcastRepository, EpisodeRepository):
                     updated_at = ?
                 WHERE id = ?
                 """,
-                (new_interval, next_at, now_dt.isoformat(), now_dt.isoformat(), podcast_id),
+                (
+                    plan.interval_seconds,
+                    next_at,
+                    now_dt.isoformat(),
+                    plan.unchanged_streak,
+                    hint,
+                    now_dt.isoformat(),
+                    podcast_id,
+                ),
             )
             return next_at
 
@@ -4575,6 +4861,7 @@ class SqlitePodcastRepository(PodcastRepository, EpisodeRepository):
         updated_from: Optional[datetime] = None,
         sort_by: str = "pub_date",
         sort_order: str = "desc",
+        cursor: Optional[str] = None,
     ) -> Tuple[List[Tuple[Podcast, Episode]], int]:
         """
         Get episodes across all podcasts with filtering and pagination.
@@ -4583,15 +4870,30 @@ class SqlitePodcastRepository(PodcastRepository, EpisodeRepository):
             date_from: Filter by publication date (pub_date >= date_from)
             date_to: Filter by publication date (pub_date <= date_to)
             updated_from: Filter by last modified date (updated_at >= updated_from)
+            cursor: Keyset cursor from ``encode_episode_cursor``; when set,
+                ``offset`` is ignored and the page starts after that episode.
+
+        ``search`` goes through the trigram ``episodes_title_fts`` index
+        where SQLite supports it (same ``LIKE`` semantics, no full scan);
+        ``e.title LIKE`` is kept as the authoritative re-check. The total is served from a cache that
+        any episode write invalidates.
 
         Returns (episodes_with_podcasts, total_count).
+
+        Raises:
+            InvalidCursorError: ``cursor`` is malformed, belongs to another
+                sort, or names an episode that no longer exists.
         """
         # Build WHERE conditions
         conditions = []
         params: List[Any] = []
 
         if search:
-            conditions.append("e.title LIKE ?")
+            if self._title_fts:
+                conditions.append(f"e.id IN ({_TITLE_FTS_MATCH}) AND e.title LIKE ?")
+                params.append(f"%{search}%")
+            else:
+                conditions.append("e.title LIKE ?")
             params.append(f"%{search}%")
 
         if podcast_id:
@@ -4658,21 +4960,28 @@ class SqlitePodcastRepository(PodcastRepository, EpisodeRepository):
         # Build WHERE clause
         where_clause = " AND ".join(conditions) if conditions else "1=1"
 
-        # Validate and build ORDER BY clause
-        valid_sort_fields = {"pub_date": "e.pub_date", "title": "e.title", "updated_at": "e.updated_at"}
-        sort_field = valid_sort_fields.get(sort_by, "e.pub_date")
-        order_direction = "ASC" if sort_order.lower() == "asc" else "DESC"
+        # Validate and build ORDER BY clause. ``e.id`` breaks ties so the
+        # order is total (stable offset pages, well-defined keyset seeks).
+        sort_key, descending = normalize_episode_sort(sort_by, sort_order)
+        sort_field = EPISODE_SORT_COLUMNS[sort_key]
+        order_direction = "DESC" if descending else "ASC"
 
         with self._get_connection() as conn:
-            # Get total count
-            count_query = f"""
-                SELECT COUNT(*) as total
-                FROM episodes e
-                JOIN podcasts p ON e.podcast_id = p.id
-                WHERE {where_clause}
-            """
-            cursor = conn.execute(count_query, params)
-            total = cursor.fetchone()["total"]
+            total = self._count_listed_episodes(conn, where_clause, params)
+
+            page_clause = where_clause
+            page_params = list(params)
+            if cursor:
+                anchor_id = decode_episode_cursor(cursor, sort_by, sort_order)
+                anchor = conn.execute(
+                    f"SELECT {sort_field} AS v FROM episodes e WHERE e.id = ?", (anchor_id,)
+                ).fetchone()
+                if anchor is None:
+                    raise InvalidCursorError("Cursor episode no longer exists")
+                predicate, predicate_params = keyset_predicate(sort_field, descending, anchor["v"], anchor_id)
+                page_clause = f"{where_clause} AND {predicate}"
+                page_params.extend(predicate_params)
+                offset = 0
 
             # Get paginated results
             query = f"""
@@ -4686,20 +4995,43 @@ class SqlitePodcastRepository(PodcastRepository, EpisodeRepository):
                        p.last_processed, p.last_processed_at, p.updated_at as p_updated_at, e.*
                 FROM episodes e
                 JOIN podcasts p ON e.podcast_id = p.id
-                WHERE {where_clause}
-                ORDER BY {sort_field} {order_direction}
+                WHERE {page_clause}
+                ORDER BY {sort_field} {order_direction}, e.id {order_direction}
                 LIMIT ? OFFSET ?
             """
-            cursor = conn.execute(query, params + [limit, offset])
+            rows = conn.execute(query, page_params + [limit, offset]).fetchall()
 
             results = []
-            for row in cursor.fetchall():
+            for row in rows:
                 podcast = self._row_to_podcast_minimal(row)
                 episode = self._row_to_episode(row)
                 results.append((podcast, episode))
 
             return results, total
 
+    def _count_listed_episodes(self, conn: sqlite3.Connection, where_clause: str, params: List[Any]) -> int:
+        """``COUNT(*)`` for a listing filter, memoised per write generation.
+
+        The generation is read before counting, so a write racing the
+        count can only make the cached entry look stale (recounted next
+        time), never serve a stale total.
+        """
+        generation = conn.execute("SELECT generation FROM episode_write_generation WHERE id = 1").fetchone()[0]
+        key = (where_clause, tuple(params))
+        total = self._episode_count_cache.get(key, generation)
+        if total is None:
+            total = conn.execute(
+                f"""
+                SELECT COUNT(*) AS total
+                FROM episodes e
+                JOIN podcasts p ON e.podcast_id = p.id
+                WHERE {where_clause}
+                """,
+                params,
+            ).fetchone()["total"]
+            self._episode_count_cache.put(key, generation, total)
+        return total
+
     # ============================================================================
     # Helper Methods
     # ============================================================================
@@ -5461,6 +5793,20 @@ class SqlitePodcastRepository(PodcastRepository, EpisodeRepository):
         ) AS episodes_processed
     """
 
+    # Whole-corpus variant for ``list_podcast_summaries``: one grouped pass
+    # over episodes instead of two correlated subqueries per podcast.
+    _EPISODE_COUNTS_GROUPED = """
+        LEFT JOIN (
+            SELECT podcast_id,
+                   COUNT(*) AS episodes_count,
+                   SUM(CASE WHEN failed_at_stage IS NULL
+                             AND (summary_path IS NOT NULL OR clean_transcript_path IS NOT NULL)
+                            THEN 1 ELSE 0 END) AS episodes_processed
+              FROM episodes
+             GROUP BY podcast_id
+        ) ec ON ec.podcast_id = p.id
+    """
+
     _EPISODE_STATE_CASE = """
         CASE WHEN e.failed_at_stage IS NOT NULL THEN 'failed'
              WHEN e.summary_path IS NOT NULL THEN 'summarized'
@@ -5600,7 +5946,7 @@ class SqlitePodcastRepository(PodcastRepository, EpisodeRepository):
                        {self._EPISODE_COUNTS_SELECT}
                   FROM podcasts p
                   {where}
-                 ORDER BY p.created_at DESC
+                 ORDER BY p.created_at DESC, p.id
                  {page}
                 """,
                 page_params,
@@ -5621,3 +5967,34 @@ class SqlitePodcastRepository(PodcastRepository, EpisodeRepository):
                 (slug,),
             ).fetchone()
             return self._podcast_row_from_db(row) if row else None
+
+    def list_podcast_summaries(self) -> List[Dict]:
+        with self._get_connection() as conn:
+            rows = conn.execute(f"""
+                SELECT {self._PODCAST_ROW_COLS},
+                       ec.episodes_count, ec.episodes_processed
+                  FROM podcasts p
+                  {self._EPISODE_COUNTS_GROUPED}
+                 ORDER BY p.created_at DESC, p.id
+                """).fetchall()
+        return [dict(self._podcast_row_from_db(row), index=idx) for idx, row in enumerate(rows, start=1)]
+
+    def get_podcast_index(self, podcast_id: str) -> Optional[int]:
+        with self._get_connection() as conn:
+            anchor = conn.execute("SELECT created_at FROM podcasts WHERE id = ?", (str(podcast_id),)).fetchone()
+            if anchor is None:
+                return None
+            ahead = conn.execute(
+                "SELECT COUNT(*) AS n FROM podcasts WHERE created_at > ? OR (created_at = ? AND id < ?)",
+                (anchor["created_at"], anchor["created_at"], str(podcast_id)),
+            ).fetchone()["n"]
+            return int(ahead) + 1
+
+    def get_podcast_id_at_index(self, index: int) -> Optional[str]:
+        if index < 1:
+            return None
+        with self._get_connection() as conn:
+            row = conn.execute(
+                "SELECT id FROM podcasts ORDER BY created_at DESC, id LIMIT 1 OFFSET ?", (index - 1,)
+            ).fetchone()
+            return row["id"] if row else None
@@ -30,7 +30,7 @@ from typing import Iterator, Optional
 from structlog import get_logger
 
 from ..models.user import User
-from ..utils.sqlite_ext import connect
+from ..utils.sqlite_ext import pooled_connect
 from .user_repository import UserRepository
 
 logger = get_logger(__name__)
@@ -55,8 +55,8 @@ class SqliteUserRepository(UserRepository):
 
     @contextmanager
     def _get_connection(self) -> Iterator[sqlite3.Connection]:
-        """Tuned SQLite connection. See ``thestill.utils.sqlite_ext.connect``."""
-        with connect(self.db_path) as conn:
+        """Tuned SQLite connection. See ``thestill.utils.sqlite_ext.pooled_connect``."""
+        with pooled_connect(self.db_path) as conn:
             yield conn
 
     def get_by_id(self, user_id: str) -> Optional[User]:
@@ -0,0 +1,153 @@
+# Copyright 2025-2026 Thestill
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Concurrent hybrid-search legs and per-leg timings.
+
+Hybrid search has three independent-ish pieces of work: embedding the
+query, the lexical (FTS) leg and the semantic (kNN) leg. Only the kNN leg
+depends on the embedding, so ``run_hybrid_legs`` starts the embedding and
+the lexical leg on a small shared pool, runs kNN on the calling thread as
+soon as the vector is ready, then joins the lexical leg. Latency becomes
+``max(lexical, embed + semantic)`` instead of the sum.
+
+Both ``SqliteVecBackend`` and ``PgVectorBackend`` use it; each leg opens its
+own connection already, so the legs share no state. The pool is bounded
+(``_HYBRID_MAX_WORKERS``) so a burst of hybrid searches queues rather than
+spawning threads per request.
+
+Timings are collected per call into a ``SearchTimings``. A caller that wants
+them (the REST route, the MCP tool) wraps ``backend.search`` in
+``capture_search_timings()``; backends record into it through a contextvar,
+so the ``SearchBackend.search`` signature is unchanged.
+"""
+
+from __future__ import annotations
+
+import contextvars
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from dataclasses import dataclass, fields
+from typing import Callable, Dict, Iterator, List, Optional, Tuple, TypeVar
+
+from structlog import get_logger
+
+logger = get_logger(__name__)
+
+T = TypeVar("T")
+
+# Two tasks per hybrid search (embed + lexical); 4 workers lets two
+# searches overlap fully before later ones queue.
+_HYBRID_MAX_WORKERS = 4
+
+_pool: Optional[ThreadPoolExecutor] = None
+_pool_lock = threading.Lock()
+
+
+@dataclass
+class SearchTimings:
+    """Wall-clock milliseconds per search leg (``None`` = leg did not run)."""
+
+    embed_ms: Optional[float] = None
+    lexical_ms: Optional[float] = None
+    semantic_ms: Optional[float] = None
+    total_ms: Optional[float] = None
+
+    def as_dict(self) -> Dict[str, float]:
+        return {f.name: round(value, 1) for f in fields(self) if (value := getattr(self, f.name)) is not None}
+
+
+_current_timings: contextvars.ContextVar[Optional[SearchTimings]] = contextvars.ContextVar(
+    "search_timings", default=None
+)
+
+
+@contextmanager
+def capture_search_timings() -> Iterator[SearchTimings]:
+    """Collect the leg timings of every search run inside the block."""
+    timings = SearchTimings()
+    token = _current_timings.set(timings)
+    try:
+        yield timings
+    finally:
+        _current_timings.reset(token)
+
+
+def record_search_timings(timings: SearchTimings) -> None:
+    """Copy ``timings`` into the active capture, if the caller opened one."""
+    target = _current_timings.get()
+    if target is None:
+        return
+    for f in fields(timings):
+        value = getattr(timings, f.name)
+        if value is not None:
+            setattr(target, f.name, value)
+
+
+def timed(fn: Callable[[], T]) -> Tuple[T, float]:
+    """Run ``fn`` and return ``(result, elapsed_ms)``."""
+    started = time.perf_counter()
+    result = fn()
+    return result, (time.perf_counter() - started) * 1000.0
+
+
+def _get_pool() -> ThreadPoolExecutor:
+    global _pool
+    if _pool is None:
+        with _pool_lock:
+            if _pool is None:
+                _pool = ThreadPoolExecutor(max_workers=_HYBRID_MAX_WORKERS, thread_name_prefix="search-hybrid")
+    return _pool
+
+
+def run_hybrid_legs(
+    *,
+    embed: Callable[[], bytes],
+    lexical: Optional[Callable[[], List[T]]],
+    semantic: Callable[[bytes], List[T]],
+    backend: str,
+) -> Tuple[List[T], List[T]]:
+    """Run the three hybrid legs overlapped; return ``(lex_rows, sem_rows)``.
+
+    ``lexical`` is ``None`` when the query has no FTS expression (operator-
+    or speaker-only input). Exceptions from any leg propagate unchanged —
+    the REST route relies on the embedding leg's ``ModuleNotFoundError`` to
+    fall back to lexical mode.
+    """
+    started = time.perf_counter()
+    pool = _get_pool()
+    timings = SearchTimings()
+
+    # copy_context so structlog contextvars (request id etc.) follow the
+    # work onto the pool threads.
+    embed_future = pool.submit(contextvars.copy_context().run, timed, embed)
+    lex_future = pool.submit(contextvars.copy_context().run, timed, lexical) if lexical is not None else None
+
+    query_embedding, timings.embed_ms = embed_future.result()
+    sem_rows, timings.semantic_ms = timed(lambda: semantic(query_embedding))
+    lex_rows: List[T] = []
+    if lex_future is not None:
+        lex_rows, timings.lexical_ms = lex_future.result()
+    timings.total_ms = (time.perf_counter() - started) * 1000.0
+
+    record_search_timings(timings)
+    logger.info(
+        "search_hybrid_timings",
+        backend=backend,
+        lexical_rows=len(lex_rows),
+        semantic_rows=len(sem_rows),
+        **timings.as_dict(),
+    )
+    return lex_rows, sem_rows
@@ -17,16 +17,18 @@
 Port of ``search.related_builder`` (the behavioural reference — keep in
 lockstep, FM-6). All scoring math — the TF-IDF/vector/entity blend, min-max
 normalisation, floors, weights, and TF-IDF configuration — is IMPORTED from
-the SQLite module, so the two backends cannot drift numerically. Only the
-storage access differs:
+the SQLite module, and the full build runs in the shared
+``search.related_engine``, so the two backends cannot drift numerically.
+Only the storage access differs:
 
 - episode centroids live in ``episode_vectors.centroid vector({dim})``
   (pgvector); with ``connect(dsn, vector=True)`` they read back as numpy
   float32 arrays directly — no ``np.frombuffer``;
-- the dense candidate leg is a pgvector ``<=>`` k-NN over the HNSW index
-  (replaces the sqlite-vec ``episode_vec`` virtual table; episode ids come
-  straight off the rows, no rowid map);
-- the lexical candidate leg ranks chunks with ``ts_rank_cd`` over the
+- the full build streams chunk text through a server-side cursor;
+- the incremental dense candidate leg is a pgvector ``<=>`` k-NN over the
+  HNSW index (replaces the sqlite-vec ``episode_vec`` virtual table;
+  episode ids come straight off the rows, no rowid map);
+- the incremental lexical leg ranks chunks with ``ts_rank_cd`` over the
   generated ``text_tsv`` column via ``websearch_to_tsquery`` (replaces
   FTS5/BM25 — websearch agrees with FTS5 on quoted phrases and ``OR``,
   which is all the term query uses);
@@ -38,24 +40,21 @@ storage access differs:
 from __future__ import annotations
 
 from collections import defaultdict
-from typing import Dict, List, Tuple
+from itertools import groupby
+from typing import Dict, Iterator, List, Optional, Tuple
 
 from structlog import get_logger
 
 from ..utils.postgres_ext import as_str, connect
 from .base import embedding_dim_for
 from .related_builder import (  # shared behaviour — one concept, one number (FM-6)
-    _TFIDF_KWARGS,
     DEFAULT_CANDIDATE_CAP,
     DEFAULT_LEXICAL_TERMS,
     DEFAULT_TFIDF_FLOOR,
     DEFAULT_W_ENTITY,
     DEFAULT_W_TFIDF,
     DEFAULT_W_VECTOR,
-    _make_doc_transform,
-    _rerank,
     _rerank_incremental,
-    _top_terms,
 )
 
 logger = get_logger(__name__)
@@ -71,6 +70,7 @@ def build_related_episodes(
     w_vector: float = DEFAULT_W_VECTOR,
     w_entity: float = DEFAULT_W_ENTITY,
     candidate_cap: int = DEFAULT_CANDIDATE_CAP,
+    workers: Optional[int] = None,
 ) -> Dict[str, int]:
     """Recompute the whole ``episode_related`` table from the corpus.
 
@@ -78,73 +78,43 @@ def build_related_episodes(
     ``{"episodes": n, "pairs": m}`` and rebuilds the table transactionally.
     """
     import numpy as np  # local: heavy, only needed for the batch build
-    from sklearn.feature_extraction.text import TfidfVectorizer
+
+    from .related_engine import BlendParams, build_related
 
     dim = embedding_dim_for(embedding_model_name)
     # Spec #46 Tier 0 — make sure every chunked episode has a materialised
     # centroid (PostgresChunkWriter writes them going forward; this backfills
     # any pre-existing episodes), then read centroids from episode_vectors.
     _ensure_episode_vectors(dsn, embedding_model_name, dim, np)
-    docs, centroids, eids = _load_corpus(dsn, embedding_model_name, dim, np)
-    if len(eids) < 2:
+    build = build_related(
+        _load_centroids(dsn, embedding_model_name, np),
+        lambda: _stream_docs(dsn, embedding_model_name),
+        _load_entity_sets(dsn),
+        BlendParams(top_n, tfidf_floor, w_tfidf, w_vector, w_entity, candidate_cap),
+        workers=workers,
+    )
+    if build.idf is None:
         _write_pairs(dsn, [])  # clear stale rows on a now-tiny corpus
-        logger.info("related_build_skipped_small_corpus", episodes=len(eids))
+        logger.info("related_build_skipped_small_corpus", episodes=len(build.eids))
         return {"episodes": 0, "pairs": 0}
 
-    vectorizer = TfidfVectorizer(**_TFIDF_KWARGS)
-    tfidf = vectorizer.fit_transform([docs[e] for e in eids])
-    feature_names = vectorizer.get_feature_names_out()
-    _persist_idf(dsn, vectorizer)
-
-    entity_sets = _load_entity_sets(dsn)
-    idx = {e: i for i, e in enumerate(eids)}
-
-    # Effective pool per leg: the whole corpus until it exceeds the cap
-    # (exact build), bounded above it (sub-quadratic, approximate tail).
-    k = min(len(eids), candidate_cap)
-    rows: List[Tuple[str, str, int, float]] = []
-    episodes_with_related = 0
-    with connect(dsn, vector=True) as conn:
-        for i, src in enumerate(eids):
-            cand_ids = _candidate_ids(
-                conn, embedding_model_name, src, centroids[i], tfidf[i], feature_names, np, k_vec=k, k_lex=k
-            )
-            ranked = _rerank(
-                src,
-                i,
-                cand_ids,
-                idx,
-                tfidf,
-                centroids,
-                entity_sets,
-                eids,
-                top_n,
-                tfidf_floor,
-                w_tfidf,
-                w_vector,
-                w_entity,
-                np,
-            )
-            if ranked:
-                episodes_with_related += 1
-            for rank, (rel_id, score) in enumerate(ranked):
-                rows.append((src, rel_id, rank, score))
-
+    _persist_idf(dsn, build.idf)
+    rows = build.rows()
     _write_pairs(dsn, rows)
     logger.info(
         "related_build_complete",
-        episodes_total=len(eids),
-        episodes_with_related=episodes_with_related,
+        episodes_total=len(build.eids),
+        episodes_with_related=build.episodes_with_related,
         pairs=len(rows),
     )
-    return {"episodes": episodes_with_related, "pairs": len(rows)}
+    return {"episodes": build.episodes_with_related, "pairs": len(rows)}
 
 
-def _candidate_ids(conn, embedding_model_name, src, centroid, tfidf_row, feature_names, np, *, k_vec, k_lex) -> set:
+def _candidate_ids(conn, embedding_model_name, src, centroid, terms, np, *, k_vec, k_lex) -> set:
     """Union of dense (pgvector k-NN) and lexical (tsquery) candidates, minus self."""
     cands: set = set()
     cands.update(_vector_candidates(conn, embedding_model_name, centroid, k_vec, np))
-    cands.update(_lexical_candidates(conn, src, tfidf_row, feature_names, k_lex))
+    cands.update(_lexical_candidates(conn, src, terms, k_lex))
     cands.discard(src)
     return cands
 
@@ -164,20 +134,17 @@ def _vector_candidates(conn, embedding_model_name, centroid, k, np) -> List[str]
     return [as_str(r["episode_id"]) for r in rows]
 
 
-def _lexical_candidates(conn, src, tfidf_row, feature_names, k) -> List[str]:
+def _lexical_candidates(conn, src, terms, k) -> List[str]:
     """Episodes whose chunks best match the source's most distinctive terms.
 
-    Term selection uses the *fitted IDF* (the source's top TF-IDF terms) —
+    ``terms`` are the source's top TF-IDF terms under the *fitted IDF* —
     same recall leg as the SQLite BM25 version, ranked with ``ts_rank_cd``
     over the generated ``text_tsv`` column. Phrase-quoting each term matches
     FTS5 semantics: bigrams ("internal rotation") match as phrases and the
-    terms (TfidfVectorizer tokens, [a-z0-9 ]) can't inject query operators.
+    terms (vectorizer tokens, [a-z0-9 ]) can't inject query operators.
     """
-    if tfidf_row is None:
-        return []  # episode has a centroid but no text (no chunks) — nothing to match on
-    terms = _top_terms(tfidf_row, feature_names, DEFAULT_LEXICAL_TERMS)
     if not terms:
-        return []
+        return []  # no text, or nothing the model weights
     query = " OR ".join(f'"{t}"' for t in terms)
     rows = conn.execute(
         """
@@ -191,14 +158,12 @@ def _lexical_candidates(conn, src, tfidf_row, feature_names, k) -> List[str]:
     return [as_str(r["eid"]) for r in rows]
 
 
-def _persist_idf(dsn: str, vectorizer) -> None:
-    """Replace ``related_idf`` with the fitted vocabulary + idf weights (Tier 3 reuse)."""
-    terms = vectorizer.get_feature_names_out().tolist()
-    idfs = vectorizer.idf_.tolist()
+def _persist_idf(dsn: str, model) -> None:
+    """Replace ``related_idf`` with the fitted hash buckets + idf weights (Tier 3 reuse)."""
     with connect(dsn) as conn:
         conn.execute("DELETE FROM related_idf")
         with conn.cursor() as cur:
-            cur.executemany("INSERT INTO related_idf (term, idf) VALUES (%s, %s)", list(zip(terms, idfs)))
+            cur.executemany("INSERT INTO related_idf (term, idf) VALUES (%s, %s)", model.to_rows())
 
 
 # ---------------------------------------------------------------------------
@@ -223,11 +188,11 @@ def update_related_for_episodes(
     Same contract as the SQLite version: reuses the persisted IDF model
     (``related_idf``), updates the forward rails for ``episode_ids`` plus the
     reverse rails of their candidate pools, and falls back to a full build if
-    no IDF model exists yet (first run).
+    no IDF model exists yet (first run, or one written before the hashed model).
     """
     import numpy as np
 
-    model = _load_idf_model(dsn, np)
+    model = _load_idf_model(dsn)
     if model is None:
         return build_related_episodes(
             dsn,
@@ -239,8 +204,6 @@ def update_related_for_episodes(
             w_entity=w_entity,
             candidate_cap=candidate_cap,
         )
-    vocab, idf, feature_names = model
-    transform = _make_doc_transform(vocab, idf, np)
     dim = embedding_dim_for(embedding_model_name)
     _ensure_episode_vectors(dsn, embedding_model_name, dim, np)
 
@@ -249,7 +212,7 @@ def update_related_for_episodes(
             "SELECT COUNT(*) AS n FROM episode_vectors WHERE embedding_model = %s", (embedding_model_name,)
         ).fetchone()["n"]
         k = min(n_corpus, candidate_cap)
-        cache = _EpisodeCache(conn, embedding_model_name, transform)
+        cache = _EpisodeCache(conn, embedding_model_name, model)
 
         seed = [e for e in dict.fromkeys(episode_ids) if cache.has(e)]
         # Forward pools + reverse expansion: every candidate of a seed
@@ -258,7 +221,7 @@ def update_related_for_episodes(
         affected: set = set(seed)
         for a in seed:
             pool = _candidate_ids(
-                conn, embedding_model_name, a, cache.centroid(a), cache.tfidf(a), feature_names, np, k_vec=k, k_lex=k
+                conn, embedding_model_name, a, cache.centroid(a), cache.terms(a), np, k_vec=k, k_lex=k
             )
             pools[a] = pool
             affected |= pool
@@ -275,8 +238,7 @@ def update_related_for_episodes(
                     embedding_model_name,
                     a,
                     cache.centroid(a),
-                    cache.tfidf(a),
-                    feature_names,
+                    cache.terms(a),
                     np,
                     k_vec=k,
                     k_lex=k,
@@ -305,11 +267,12 @@ class _EpisodeCache:
     directly, so no dtype/frombuffer handling is needed.
     """
 
-    def __init__(self, conn, embedding_model_name, transform):
+    def __init__(self, conn, embedding_model_name, idf_model):
         self._conn = conn
         self._model = embedding_model_name
-        self._transform = transform
+        self._idf = idf_model
         self._cent: Dict[str, object] = {}
+        self._doc: Dict[str, str] = {}
         self._tfidf: Dict[str, object] = {}
 
     def has(self, eid) -> bool:
@@ -324,8 +287,8 @@ class _EpisodeCache:
             self._cent[eid] = row["centroid"] if row else None
         return self._cent[eid]
 
-    def tfidf(self, eid):
-        if eid not in self._tfidf:
+    def doc(self, eid) -> str:
+        if eid not in self._doc:
             row = self._conn.execute(
                 """
                 SELECT string_agg(text, ' ' ORDER BY segment_id) AS doc
@@ -333,20 +296,27 @@ class _EpisodeCache:
                 """,
                 (eid, self._model),
             ).fetchone()
-            self._tfidf[eid] = self._transform([row["doc"] or ""]) if row and row["doc"] else None
+            self._doc[eid] = (row["doc"] or "") if row else ""
+        return self._doc[eid]
+
+    def tfidf(self, eid):
+        if eid not in self._tfidf:
+            doc = self.doc(eid)
+            self._tfidf[eid] = self._idf.transform([doc]) if doc else None
         return self._tfidf[eid]
 
+    def terms(self, eid) -> List[str]:
+        """The episode's top TF-IDF terms, for the lexical candidate leg."""
+        return self._idf.top_terms(self.doc(eid), self.tfidf(eid), DEFAULT_LEXICAL_TERMS)
+
+
+def _load_idf_model(dsn: str):
+    """Load the persisted ``HashedIdf`` or ``None`` if unbuilt (or pre-hashing)."""
+    from .related_engine import HashedIdf
 
-def _load_idf_model(dsn: str, np):
-    """Load persisted IDF as ``(vocab, idf, feature_names)`` or ``None`` if unbuilt."""
     with connect(dsn) as conn:
-        rows = conn.execute("SELECT term, idf FROM related_idf ORDER BY term").fetchall()
-    if not rows:
-        return None
-    terms = [r["term"] for r in rows]
-    vocab = {t: i for i, t in enumerate(terms)}
-    idf = np.array([r["idf"] for r in rows], dtype=np.float64)
-    return vocab, idf, np.array(terms, dtype=object)
+        rows = conn.execute("SELECT term, idf FROM related_idf").fetchall()
+    return HashedIdf.from_rows((r["term"], r["idf"]) for r in rows)
 
 
 def _write_pairs_scoped(dsn: str, out: Dict[str, List[Tuple[str, float]]]) -> int:
@@ -419,37 +389,33 @@ def _ensure_episode_vectors(dsn: str, embedding_model_name: str, dim: int, np) -
     return recomputed
 
 
-def _load_corpus(dsn: str, embedding_model_name: str, dim: int, np):
-    """Return ``(docs, centroids, eids)`` for episodes with a materialised centroid.
-
-    Same shape as the SQLite loader: centroids come from ``episode_vectors``
-    (one numpy row per episode); ``docs`` is the concatenated chunk text
-    (``string_agg`` ordered by segment for a deterministic bigram stream).
-    """
+def _load_centroids(dsn: str, embedding_model_name: str, np) -> Dict[str, object]:
+    """episode_id → materialised centroid (numpy float32 via pgvector)."""
     with connect(dsn, vector=True) as conn:
-        vec_rows = conn.execute(
+        rows = conn.execute(
             "SELECT episode_id, centroid FROM episode_vectors WHERE embedding_model = %s",
             (embedding_model_name,),
         ).fetchall()
-        doc_rows = conn.execute(
-            """
-            SELECT episode_id AS eid, string_agg(text, ' ' ORDER BY segment_id) AS doc
-            FROM chunks WHERE embedding_model = %s GROUP BY episode_id
-            """,
-            (embedding_model_name,),
-        ).fetchall()
-    docs_by_id = {as_str(r["eid"]): (r["doc"] or "") for r in doc_rows}
-    eids: List[str] = []
-    centroid_list = []
-    for row in vec_rows:
-        eid = as_str(row["episode_id"])
-        if eid not in docs_by_id:
-            continue  # centroid without chunks (shouldn't happen) — skip
-        eids.append(eid)
-        centroid_list.append(np.asarray(row["centroid"], dtype=np.float32))
-    docs = {e: docs_by_id[e] for e in eids}
-    centroids = np.array(centroid_list, dtype=np.float32) if centroid_list else np.zeros((0, dim), dtype=np.float32)
-    return docs, centroids, eids
+    return {as_str(r["episode_id"]): np.asarray(r["centroid"], dtype=np.float32) for r in rows}
+
+
+def _stream_docs(dsn: str, embedding_model_name: str) -> Iterator[Tuple[str, str]]:
+    """Yield ``(episode_id, text)`` one episode at a time, chunks in segment order.
+
+    A server-side cursor keeps only one fetch batch of chunk rows client-side
+    (no corpus-wide ``string_agg``).
+    """
+    with connect(dsn) as conn:
+        with conn.cursor(name="related_docs") as cur:
+            cur.execute(
+                """
+                SELECT episode_id, text FROM chunks
+                WHERE embedding_model = %s ORDER BY episode_id, segment_id
+                """,
+                (embedding_model_name,),
+            )
+            for eid, group in groupby(cur, key=lambda r: r["episode_id"]):
+                yield as_str(eid), " ".join(r["text"] for r in group)
 
 
 def _load_entity_sets(dsn: str, episode_ids=None) -> Dict[str, frozenset]:
@@ -25,7 +25,7 @@ spec #42 FM-6):
   pgvector cosine operator ``<=>`` and the HNSW index. Replaces sqlite-vec
   ``vec0``.
 - ``HYBRID``   — identical reciprocal-rank-fusion of the two legs (pure
-  Python, shared constants).
+  Python, shared constants), with the same overlapped leg execution.
 
 Filters push into the WHERE clause exactly as in the SQLite backend. The
 query translator emits FTS5 ``MATCH`` syntax; ``_fts5_to_websearch`` maps it
@@ -45,6 +45,7 @@ from structlog import get_logger
 from ..models.entities import MatchType
 from ..utils.postgres_ext import as_str, connect
 from .base import ResolvedHit, SearchFilters, SearchMode
+from .hybrid import SearchTimings, record_search_timings, run_hybrid_legs, timed
 from .query_translator import translate_lexical_query
 
 if False:  # TYPE_CHECKING
@@ -115,6 +116,7 @@ class PgVectorBackend:
     def __init__(self, *, dsn: str, embedding_model: "EmbeddingModel"):
         self.dsn = dsn
         self.embedding_model = embedding_model
+        self._iterative_scan: Optional[bool] = None
 
     @property
     def embedding_model_name(self) -> str:
@@ -140,17 +142,22 @@ class PgVectorBackend:
         if mode == SearchMode.LEXICAL:
             if not translated.fts_match:
                 return []
-            rows = self._lexical(translated.fts_match, limit=limit, filters=effective_filters)
+            rows, lexical_ms = timed(
+                lambda: self._lexical(translated.fts_match, limit=limit, filters=effective_filters)
+            )
+            record_search_timings(SearchTimings(lexical_ms=lexical_ms, total_ms=lexical_ms))
             return [self._row_to_hit(r, MatchType.LEXICAL) for r in rows]
         if mode == SearchMode.SEMANTIC:
-            query_embedding = self.embedding_model.encode_one(translated.embedding_text)
-            rows = self._semantic(query_embedding, limit=limit, filters=effective_filters)
+            query_embedding, embed_ms = timed(lambda: self.embedding_model.encode_one(translated.embedding_text))
+            rows, semantic_ms = timed(lambda: self._semantic(query_embedding, limit=limit, filters=effective_filters))
+            record_search_timings(
+                SearchTimings(embed_ms=embed_ms, semantic_ms=semantic_ms, total_ms=embed_ms + semantic_ms)
+            )
             return [self._row_to_hit(r, MatchType.SEMANTIC) for r in rows][:limit]
         if mode == SearchMode.HYBRID:
-            query_embedding = self.embedding_model.encode_one(translated.embedding_text)
             return self._hybrid(
                 translated.fts_match,
-                query_embedding,
+                translated.embedding_text,
                 limit=limit,
                 filters=effective_filters,
             )
@@ -232,22 +239,45 @@ class PgVectorBackend:
         qvec = _to_vec(query_embedding)
         params = [qvec, self.embedding_model_name, *filter_params, qvec, knn_k]
         with connect(self.dsn, vector=True) as conn:
-            # Scoped to this transaction; no-op setting on pgvector < 0.8.
-            conn.execute("SET LOCAL hnsw.iterative_scan = 'relaxed_order'")
+            if self._supports_iterative_scan(conn):
+                # Scoped to this transaction.
+                conn.execute("SET LOCAL hnsw.iterative_scan = 'relaxed_order'")
             rows = conn.execute(sql, params).fetchall()
         # Same noise cutoff as the SQLite backend (cosine distance).
         return [r for r in rows if r["score"] <= _SEMANTIC_MAX_DISTANCE]
 
+    def _supports_iterative_scan(self, conn) -> bool:
+        """pgvector >= 0.8 (``hnsw.iterative_scan``), checked once per client.
+
+        Older pgvector rejects the setting once its library is loaded in the
+        backend, which a pooled connection that already ran a vector query
+        has done.
+        """
+        if self._iterative_scan is None:
+            row = conn.execute("SELECT extversion FROM pg_extension WHERE extname = 'vector'").fetchone()
+            version = tuple(int(part) for part in row["extversion"].split(".")[:2]) if row else (0, 0)
+            self._iterative_scan = version >= (0, 8)
+        return self._iterative_scan
+
     def _hybrid(
         self,
         query: str,
-        query_embedding: bytes,
+        embedding_text: str,
         *,
         limit: int,
         filters: Optional[SearchFilters],
     ) -> List[ResolvedHit]:
-        lex_rows = self._lexical(query, limit=_HYBRID_FETCH, filters=filters) if query else []
-        sem_rows = self._semantic(query_embedding, limit=_HYBRID_FETCH, filters=filters)
+        # Embedding, lexical and kNN legs overlap (see search.hybrid); the
+        # query is embedded here rather than in ``search`` so the FTS leg
+        # runs while the model computes. Operator-only or speaker-only
+        # inputs leave the FTS expression empty — semantic still has the
+        # cleaned text to work with.
+        lex_rows, sem_rows = run_hybrid_legs(
+            embed=lambda: self.embedding_model.encode_one(embedding_text),
+            lexical=(lambda: self._lexical(query, limit=_HYBRID_FETCH, filters=filters)) if query else None,
+            semantic=lambda query_embedding: self._semantic(query_embedding, limit=_HYBRID_FETCH, filters=filters),
+            backend="pgvector",
+        )
 
         scores: dict[int, float] = {}
         rows_by_id: dict[int, dict] = {}
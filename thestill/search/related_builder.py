@@ -40,6 +40,10 @@ than ``top_n`` rows — by design.
 This is a corpus-global computation (every episode vs every other), too
 expensive for the request path, so it's run as a batch step after
 reindex/backfill and the results land in the ``episode_related`` table.
+The full build's scoring runs in ``related_engine`` (streamed hashed
+TF-IDF, blocked matrix scoring, process pool), shared with the Postgres
+port; this module supplies the SQLite reads/writes and the incremental
+update.
 """
 
 from __future__ import annotations
@@ -47,7 +51,9 @@ from __future__ import annotations
 import sqlite3
 from collections import defaultdict
 from contextlib import contextmanager
-from typing import Dict, List, Tuple
+from itertools import groupby
+from operator import itemgetter
+from typing import Dict, Iterator, List, Optional, Tuple
 
 from structlog import get_logger
 
@@ -88,12 +94,6 @@ DEFAULT_W_ENTITY = 0.15
 DEFAULT_CANDIDATE_CAP = 2000
 DEFAULT_LEXICAL_TERMS = 25
 
-# TF-IDF configuration — module-level so the full build and any
-# incremental transform agree on vocabulary and normalisation. ``min_df=2``
-# drops corpus-singleton terms (a term in one episode can't link two), which
-# also keeps the vocabulary — and the persisted IDF table — from ballooning.
-_TFIDF_KWARGS = dict(stop_words="english", max_features=50_000, ngram_range=(1, 2), sublinear_tf=True, min_df=2)
-
 
 def build_related_episodes(
     db_path: str,
@@ -105,6 +105,7 @@ def build_related_episodes(
     w_vector: float = DEFAULT_W_VECTOR,
     w_entity: float = DEFAULT_W_ENTITY,
     candidate_cap: int = DEFAULT_CANDIDATE_CAP,
+    workers: Optional[int] = None,
 ) -> Dict[str, int]:
     """Recompute the whole ``episode_related`` table from the corpus.
 
@@ -112,9 +113,12 @@ def build_related_episodes(
     ``episodes`` is how many source episodes got at least one related
     row and ``pairs`` is the total rows written. The table is rebuilt
     transactionally — readers see the old contents until commit.
+    ``workers`` sizes the scoring process pool (``None``: one per core,
+    up to 8; small corpora always score in-process).
     """
     import numpy as np  # local: heavy, only needed for the batch build
-    from sklearn.feature_extraction.text import TfidfVectorizer
+
+    from .related_engine import BlendParams, build_related
 
     dim = embedding_dim_for(embedding_model_name)
     # Spec #46 Tier 0 — make sure every chunked episode has a materialised
@@ -122,64 +126,30 @@ def build_related_episodes(
     # pre-existing episodes), then read centroids from episode_vectors
     # instead of reloading every chunk embedding.
     _ensure_episode_vectors(db_path, embedding_model_name, dim, np)
-    docs, centroids, eids = _load_corpus(db_path, embedding_model_name, dim, np)
-    if len(eids) < 2:
+    build = build_related(
+        _load_centroids(db_path, embedding_model_name, dim, np),
+        lambda: _stream_docs(db_path, embedding_model_name),
+        _load_entity_sets(db_path),
+        BlendParams(top_n, tfidf_floor, w_tfidf, w_vector, w_entity, candidate_cap),
+        workers=workers,
+    )
+    if build.idf is None:
         _write_pairs(db_path, [])  # clear stale rows on a now-tiny corpus
-        logger.info("related_build_skipped_small_corpus", episodes=len(eids))
+        logger.info("related_build_skipped_small_corpus", episodes=len(build.eids))
         return {"episodes": 0, "pairs": 0}
 
-    # Fit the TF-IDF topical model over the whole corpus once and persist
-    # it (Tier 2) so incremental updates can transform new text without
-    # refitting. ``tfidf`` is a sparse N×V matrix — we never densify it to
-    # N×N; per-source similarities are computed against a candidate subset.
-    vectorizer = TfidfVectorizer(**_TFIDF_KWARGS)
-    tfidf = vectorizer.fit_transform([docs[e] for e in eids])
-    feature_names = vectorizer.get_feature_names_out()
-    _persist_idf(db_path, vectorizer)
-
-    entity_sets = _load_entity_sets(db_path)
-    idx = {e: i for i, e in enumerate(eids)}
-
-    # Effective pool per leg: the whole corpus until it exceeds the cap
-    # (exact build), bounded above it (sub-quadratic, approximate tail).
-    k = min(len(eids), candidate_cap)
-    rows: List[Tuple[str, str, int, float]] = []
-    episodes_with_related = 0
-    with _candidate_conn(db_path) as conn:
-        rowid_to_eid = _episode_vec_rowmap(conn, embedding_model_name)
-        for i, src in enumerate(eids):
-            cand_ids = _candidate_ids(
-                conn, src, centroids[i], tfidf[i], feature_names, rowid_to_eid, np, k_vec=k, k_lex=k
-            )
-            ranked = _rerank(
-                src,
-                i,
-                cand_ids,
-                idx,
-                tfidf,
-                centroids,
-                entity_sets,
-                eids,
-                top_n,
-                tfidf_floor,
-                w_tfidf,
-                w_vector,
-                w_entity,
-                np,
-            )
-            if ranked:
-                episodes_with_related += 1
-            for rank, (rel_id, score) in enumerate(ranked):
-                rows.append((src, rel_id, rank, score))
-
+    # Persist the fitted model (Tier 2) so incremental updates can
+    # transform new text without refitting.
+    _persist_idf(db_path, build.idf)
+    rows = build.rows()
     _write_pairs(db_path, rows)
     logger.info(
         "related_build_complete",
-        episodes_total=len(eids),
-        episodes_with_related=episodes_with_related,
+        episodes_total=len(build.eids),
+        episodes_with_related=build.episodes_with_related,
         pairs=len(rows),
     )
-    return {"episodes": episodes_with_related, "pairs": len(rows)}
+    return {"episodes": build.episodes_with_related, "pairs": len(rows)}
 
 
 @contextmanager
@@ -200,11 +170,11 @@ def _episode_vec_rowmap(conn, embedding_model_name) -> Dict[int, str]:
     }
 
 
-def _candidate_ids(conn, src, centroid, tfidf_row, feature_names, rowid_to_eid, np, *, k_vec, k_lex) -> set:
+def _candidate_ids(conn, src, centroid, terms, rowid_to_eid, np, *, k_vec, k_lex) -> set:
     """Union of dense (ANN) and lexical (BM25) candidate episode ids, minus self."""
     cands: set = set()
     cands.update(_vector_candidates(conn, centroid, rowid_to_eid, k_vec, np))
-    cands.update(_lexical_candidates(conn, src, tfidf_row, feature_names, k_lex))
+    cands.update(_lexical_candidates(conn, src, terms, k_lex))
     cands.discard(src)
     return cands
 
@@ -222,18 +192,16 @@ def _vector_candidates(conn, centroid, rowid_to_eid, k, np) -> List[str]:
     return [rowid_to_eid[r["rowid"]] for r in rows if r["rowid"] in rowid_to_eid]
 
 
-def _lexical_candidates(conn, src, tfidf_row, feature_names, k) -> List[str]:
+def _lexical_candidates(conn, src, terms, k) -> List[str]:
     """Episodes whose chunks best BM25-match the source's most distinctive terms.
 
-    Term selection uses the *fitted IDF* (the source's top TF-IDF terms),
-    so it picks "biceps, hypertrophy" not "the key thing" — the recall
-    leg that surfaces topical neighbours the dense vector ranks low.
+    ``terms`` are the source's top TF-IDF terms under the *fitted IDF*
+    (``_EpisodeCache.terms``), so they are "biceps, hypertrophy" not "the
+    key thing" — the recall leg that surfaces topical neighbours the dense
+    vector ranks low.
     """
-    if tfidf_row is None:
-        return []  # episode has a centroid but no text (no chunks) — nothing to match on
-    terms = _top_terms(tfidf_row, feature_names, DEFAULT_LEXICAL_TERMS)
     if not terms:
-        return []
+        return []  # no text, or nothing the model weights
     # Phrase-quote each term: neutralises FTS operators and matches bigrams
     # ("internal rotation") as phrases. TfidfVectorizer tokens are [a-z0-9 ],
     # so double-quote wrapping is safe.
@@ -253,51 +221,14 @@ def _lexical_candidates(conn, src, tfidf_row, feature_names, k) -> List[str]:
     return [r["eid"] for r in rows]
 
 
-def _top_terms(tfidf_row, feature_names, n) -> List[str]:
-    """The n highest-weighted terms of a sparse TF-IDF row."""
-    row = tfidf_row.tocoo()
-    if row.nnz == 0:
-        return []
-    order = row.data.argsort()[::-1][:n]
-    return [feature_names[row.col[k]] for k in order]
-
-
-def _rerank(
-    src, i, cand_ids, idx, tfidf, centroids, entity_sets, eids, top_n, floor, w_tfidf, w_vector, w_entity, np
-) -> List[Tuple[str, float]]:
-    """Blend the three signals over the candidate pool → ranked (id, score).
-
-    Same blend as the all-pairs build (TF-IDF gate + min-max-normalised
-    weighted sum), but tfidf/vector similarities are computed only against
-    the candidate subset, so there's no N×N matrix.
-    """
-    cand_idx = [idx[e] for e in cand_ids if e in idx]
-    if not cand_idx:
-        return []
-    tfidf_sim = np.asarray((tfidf[i] @ tfidf[cand_idx].T).todense()).ravel()
-    keep = [p for p in range(len(cand_idx)) if tfidf_sim[p] >= floor]
-    if not keep:
-        return []
-    sub = [cand_idx[p] for p in keep]
-    t = tfidf_sim[keep]
-    v = centroids[i] @ centroids[sub].T
-    src_entities = entity_sets.get(src, frozenset())
-    ent = np.array([_jaccard(src_entities, entity_sets.get(eids[j], frozenset())) for j in sub])
-    score = w_tfidf * _minmax(t, np) + w_vector * _minmax(v, np) + w_entity * _minmax(ent, np)
-    order = np.argsort(-score)[:top_n]
-    return [(eids[sub[p]], round(float(score[p]), 6)) for p in order]
-
-
-def _persist_idf(db_path, vectorizer) -> None:
-    """Replace ``related_idf`` with the fitted vocabulary + idf weights (Tier 3 reuse)."""
-    terms = vectorizer.get_feature_names_out().tolist()
-    idfs = vectorizer.idf_.tolist()
+def _persist_idf(db_path, model) -> None:
+    """Replace ``related_idf`` with the fitted hash buckets + idf weights (Tier 3 reuse)."""
     # Shared helper supplies WAL + busy_timeout so this corpus-wide rewrite
     # serializes against concurrent writers instead of fail-fast crashing.
     with connect(db_path, row_factory=False) as conn:
         conn.execute("BEGIN")
         conn.execute("DELETE FROM related_idf")
-        conn.executemany("INSERT INTO related_idf (term, idf) VALUES (?, ?)", zip(terms, idfs))
+        conn.executemany("INSERT INTO related_idf (term, idf) VALUES (?, ?)", model.to_rows())
 
 
 # ---------------------------------------------------------------------------
@@ -327,11 +258,12 @@ def update_related_for_episodes(
     - **reverse:** the episodes near each input (its candidate pool) get
       *their* rails recomputed too, so the newcomer surfaces in them.
 
-    Falls back to a full build if no IDF model exists yet (first run).
+    Falls back to a full build if no IDF model exists yet (first run, or a
+    ``related_idf`` written before the hashed model).
     """
     import numpy as np
 
-    model = _load_idf_model(db_path, np)
+    model = _load_idf_model(db_path)
     if model is None:
         return build_related_episodes(
             db_path,
@@ -343,8 +275,6 @@ def update_related_for_episodes(
             w_entity=w_entity,
             candidate_cap=candidate_cap,
         )
-    vocab, idf, feature_names = model
-    transform = _make_doc_transform(vocab, idf, np)
     dim = embedding_dim_for(embedding_model_name)
     _ensure_episode_vectors(db_path, embedding_model_name, dim, np)
 
@@ -354,7 +284,7 @@ def update_related_for_episodes(
         ).fetchone()[0]
         k = min(n_corpus, candidate_cap)
         rowid_to_eid = _episode_vec_rowmap(conn, embedding_model_name)
-        cache = _EpisodeCache(conn, embedding_model_name, dim, transform, np)
+        cache = _EpisodeCache(conn, embedding_model_name, dim, model, np)
 
         seed = [e for e in dict.fromkeys(episode_ids) if cache.has(e)]
         # Forward pools + reverse expansion: every candidate of a seed
@@ -362,9 +292,7 @@ def update_related_for_episodes(
         pools: Dict[str, set] = {}
         affected: set = set(seed)
         for a in seed:
-            pool = _candidate_ids(
-                conn, a, cache.centroid(a), cache.tfidf(a), feature_names, rowid_to_eid, np, k_vec=k, k_lex=k
-            )
+            pool = _candidate_ids(conn, a, cache.centroid(a), cache.terms(a), rowid_to_eid, np, k_vec=k, k_lex=k)
             pools[a] = pool
             affected |= pool
 
@@ -375,9 +303,7 @@ def update_related_for_episodes(
                 continue
             pool = pools.get(a)
             if pool is None:
-                pool = _candidate_ids(
-                    conn, a, cache.centroid(a), cache.tfidf(a), feature_names, rowid_to_eid, np, k_vec=k, k_lex=k
-                )
+                pool = _candidate_ids(conn, a, cache.centroid(a), cache.terms(a), rowid_to_eid, np, k_vec=k, k_lex=k)
             out[a] = _rerank_incremental(
                 a, pool, cache, entity_sets, top_n, tfidf_floor, w_tfidf, w_vector, w_entity, np
             )
@@ -395,15 +321,16 @@ def update_related_for_episodes(
 
 
 class _EpisodeCache:
-    """Lazily fetch + cache an episode's centroid and TF-IDF vector."""
+    """Lazily fetch + cache an episode's centroid, text and TF-IDF vector."""
 
-    def __init__(self, conn, embedding_model_name, dim, transform, np):
+    def __init__(self, conn, embedding_model_name, dim, idf_model, np):
         self._conn = conn
         self._model = embedding_model_name
         self._dim = dim
-        self._transform = transform
+        self._idf = idf_model
         self._np = np
         self._cent: Dict[str, object] = {}
+        self._doc: Dict[str, str] = {}
         self._tfidf: Dict[str, object] = {}
 
     def has(self, eid) -> bool:
@@ -420,15 +347,25 @@ class _EpisodeCache:
             )
         return self._cent[eid]
 
+    def doc(self, eid) -> str:
+        if eid not in self._doc:
+            rows = self._conn.execute(
+                "SELECT text FROM chunks WHERE episode_id = ? AND embedding_model = ? ORDER BY segment_id",
+                (eid, self._model),
+            )
+            self._doc[eid] = " ".join(r["text"] for r in rows)
+        return self._doc[eid]
+
     def tfidf(self, eid):
         if eid not in self._tfidf:
-            row = self._conn.execute(
-                "SELECT group_concat(text, ' ') AS doc FROM chunks WHERE episode_id = ? AND embedding_model = ?",
-                (eid, self._model),
-            ).fetchone()
-            self._tfidf[eid] = self._transform([row["doc"] or ""]) if row and row["doc"] else None
+            doc = self.doc(eid)
+            self._tfidf[eid] = self._idf.transform([doc]) if doc else None
         return self._tfidf[eid]
 
+    def terms(self, eid) -> List[str]:
+        """The episode's top TF-IDF terms, for the lexical candidate leg."""
+        return self._idf.top_terms(self.doc(eid), self.tfidf(eid), DEFAULT_LEXICAL_TERMS)
+
 
 def _rerank_incremental(src, pool, cache, entity_sets, top_n, floor, w_tfidf, w_vector, w_entity, np):
     """Blend over a candidate pool using per-episode vectors (no corpus matrix)."""
@@ -455,42 +392,18 @@ def _rerank_incremental(src, pool, cache, entity_sets, top_n, floor, w_tfidf, w_
     return [(kept[p], round(float(score[p]), 6)) for p in order]
 
 
-def _load_idf_model(db_path, np):
-    """Load persisted IDF as ``(vocab, idf, feature_names)`` or ``None`` if unbuilt."""
+def _load_idf_model(db_path):
+    """Load the persisted ``HashedIdf`` or ``None`` if unbuilt (or pre-hashing)."""
+    from .related_engine import HashedIdf
+
     conn = sqlite3.connect(db_path)
     try:
-        rows = conn.execute("SELECT term, idf FROM related_idf ORDER BY term").fetchall()
+        rows = conn.execute("SELECT term, idf FROM related_idf").fetchall()
     except sqlite3.OperationalError:
         return None
     finally:
         conn.close()
-    if not rows:
-        return None
-    terms = [r[0] for r in rows]
-    vocab = {t: i for i, t in enumerate(terms)}
-    idf = np.array([r[1] for r in rows], dtype=np.float64)
-    return vocab, idf, np.array(terms, dtype=object)
-
-
-def _make_doc_transform(vocab, idf, np):
-    """A callable ``docs -> L2-normalised TF-IDF matrix`` using a fixed vocab+IDF.
-
-    Replicates ``TfidfVectorizer(sublinear_tf=True, norm='l2', ngram_range=(1,2),
-    stop_words='english')`` transform without refitting, so incremental updates
-    place a new doc in the same vector space as the last full build.
-    """
-    from sklearn.feature_extraction.text import CountVectorizer
-    from sklearn.preprocessing import normalize
-
-    cv = CountVectorizer(vocabulary=vocab, ngram_range=(1, 2), stop_words="english")
-
-    def transform(docs):
-        counts = cv.transform(docs).astype(np.float64)
-        counts.data = 1.0 + np.log(counts.data)  # sublinear tf
-        scaled = counts.multiply(idf).tocsr()  # column-scale by idf
-        return normalize(scaled, norm="l2", axis=1)
-
-    return transform
+    return HashedIdf.from_rows(rows)
 
 
 def _write_pairs_scoped(db_path: str, out: Dict[str, List[Tuple[str, float]]]) -> int:
@@ -585,42 +498,38 @@ def _ensure_episode_vectors(db_path, embedding_model_name, dim, np) -> int:
     return recomputed
 
 
-def _load_corpus(db_path, embedding_model_name, dim, np):
-    """Return ``(docs, centroids, eids)`` for episodes with a materialised centroid.
+def _load_centroids(db_path, embedding_model_name, dim, np) -> Dict[str, object]:
+    """episode_id → materialised centroid (spec #46 Tier 0: one row per
+    episode, not a re-sum of every chunk embedding)."""
+    conn = sqlite3.connect(db_path)
+    try:
+        return {
+            eid: np.frombuffer(blob, dtype=np.float32, count=dim)
+            for eid, blob in conn.execute(
+                "SELECT episode_id, centroid FROM episode_vectors WHERE embedding_model = ?",
+                (embedding_model_name,),
+            )
+        }
+    finally:
+        conn.close()
+
 
-    Spec #46 Tier 0: centroids come from ``episode_vectors`` (one row per
-    episode) rather than re-summing every chunk embedding; ``docs`` (the
-    concatenated chunk text TF-IDF needs) is read with ``group_concat`` so
-    the per-chunk vectors are never loaded into memory.
+def _stream_docs(db_path, embedding_model_name) -> Iterator[Tuple[str, str]]:
+    """Yield ``(episode_id, text)`` one episode at a time, chunks in segment order.
+
+    Walks the ``(episode_id, segment_id, embedding_model)`` unique index, so
+    only one episode's text is ever in memory (no corpus-wide ``group_concat``).
     """
     conn = sqlite3.connect(db_path)
-    conn.row_factory = sqlite3.Row
     try:
-        vec_rows = conn.execute(
-            "SELECT episode_id, centroid FROM episode_vectors WHERE embedding_model = ?",
-            (embedding_model_name,),
-        ).fetchall()
-        doc_rows = conn.execute(
-            """
-            SELECT episode_id AS eid, group_concat(text, ' ') AS doc
-            FROM chunks WHERE embedding_model = ? GROUP BY episode_id
-            """,
+        rows = conn.execute(
+            "SELECT episode_id, text FROM chunks WHERE embedding_model = ? ORDER BY episode_id, segment_id",
             (embedding_model_name,),
-        ).fetchall()
+        )
+        for eid, group in groupby(rows, key=itemgetter(0)):
+            yield eid, " ".join(text for _, text in group)
     finally:
         conn.close()
-    docs_by_id = {r["eid"]: (r["doc"] or "") for r in doc_rows}
-    eids: List[str] = []
-    centroid_list = []
-    for row in vec_rows:
-        eid = row["episode_id"]
-        if eid not in docs_by_id:
-            continue  # centroid without chunks (shouldn't happen) — skip
-        eids.append(eid)
-        centroid_list.append(np.frombuffer(row["centroid"], dtype=np.float32, count=dim))
-    docs = {e: docs_by_id[e] for e in eids}
-    centroids = np.array(centroid_list, dtype=np.float32) if centroid_list else np.zeros((0, dim), dtype=np.float32)
-    return docs, centroids, eids
 
 
 def _load_entity_sets(db_path: str, episode_ids=None) -> Dict[str, frozenset]:
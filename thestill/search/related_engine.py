@@ -0,0 +1,475 @@
+# Copyright 2025-2026 Thestill
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Spec #46 — backend-agnostic full-build engine for the related-episodes rail.
+
+``related_builder`` (SQLite) and ``pg_related_builder`` (Postgres) only
+differ in how they read centroids / chunk text and write rows; everything
+corpus-wide happens here, in matrix form rather than one ANN query, one
+lexical query and one rerank per source episode:
+
+- **Streaming TF-IDF.** Episode text is fed through a stateless
+  ``HashingVectorizer`` in two passes. Pass one counts document and term
+  frequency per hash bucket; pass two emits the pruned, IDF-weighted,
+  L2-normalised rows. Neither pass holds more than one batch of text, and
+  there is no vocabulary dict (at 100k episodes the unigram+bigram vocab
+  alone is tens of millions of entries). ``min_df`` / ``max_features`` /
+  ``sublinear_tf`` / smoothed IDF follow ``TfidfVectorizer`` per bucket.
+- **Blocked scoring.** Sources are scored a block of rows at a time: the
+  dense leg is ``centroids[block] @ centroids.T``, the TF-IDF leg a sparse
+  ``tfidf[block] @ tfidf.T``, entity Jaccard a product of the sparse
+  episode×entity incidence matrix. The candidate pool is the top
+  ``candidate_cap`` of each leg — the lexical leg is now exact TF-IDF
+  cosine instead of BM25 over the source's top terms — and the gate +
+  min-max blend is the same as ``related_builder._rerank_incremental``.
+- **Process pool.** With ``workers > 1`` on a corpus of at least
+  :data:`POOL_MIN_EPISODES`, both text passes and the scoring blocks fan
+  out over a spawn pool. The scoring matrices are handed over as ``.npy``
+  files the workers memory-map, so the page cache is shared rather than
+  pickled into every worker.
+
+The fitted model is persisted to ``related_idf`` as ``("#<bucket>", idf)``
+rows. A table written by the older vocabulary-based builder has plain
+terms; :meth:`HashedIdf.from_rows` treats it as absent, so the next
+incremental update falls back to one full build.
+"""
+
+from __future__ import annotations
+
+import multiprocessing
+import os
+import tempfile
+from collections import deque
+from concurrent.futures import Executor, ProcessPoolExecutor
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from functools import lru_cache
+from itertools import islice
+from pathlib import Path
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
+
+import numpy as np
+from scipy import sparse
+from structlog import get_logger
+
+from .related_builder import _minmax
+
+logger = get_logger(__name__)
+
+# Hash space. Collisions only merge rare n-grams (the kept buckets are the
+# ``MAX_FEATURES`` most frequent), and CSR cost doesn't depend on width.
+HASH_FEATURES = 1 << 22
+MIN_DF = 2
+MAX_FEATURES = 50_000
+
+DOC_BATCH = 256
+# Cells per dense block matrix (rows × corpus); ~64 MB of float32 each.
+BLOCK_CELLS = 1 << 24
+# Below this the pool's spawn cost outweighs the work.
+POOL_MIN_EPISODES = 2_000
+
+_IDF_PREFIX = "#"
+
+Rail = List[Tuple[str, float]]
+
+
+@lru_cache(maxsize=1)
+def _hasher():
+    from sklearn.feature_extraction.text import HashingVectorizer
+
+    # Same analyzer as the TfidfVectorizer it replaces (english stop words,
+    # unigrams + bigrams); raw counts so the IDF/sublinear/norm steps are ours.
+    return HashingVectorizer(
+        n_features=HASH_FEATURES,
+        stop_words="english",
+        ngram_range=(1, 2),
+        alternate_sign=False,
+        norm=None,
+    )
+
+
+@lru_cache(maxsize=1)
+def _term_hasher():
+    from sklearn.feature_extraction import FeatureHasher
+
+    # HashingVectorizer hashes analyzer output with exactly this.
+    return FeatureHasher(n_features=HASH_FEATURES, input_type="string", alternate_sign=False)
+
+
+def term_bucket(term: str) -> int:
+    """Hash bucket an (already analyzed) term or bigram lands in."""
+    return int(_term_hasher().transform([[term]]).indices[0])
+
+
+def _batch_stats(docs: Sequence[str]) -> Tuple[np.ndarray, np.ndarray, np.ndarray, int]:
+    """Pass one, per batch: ``(buckets, doc_freq, term_freq, n_docs)`` for the non-empty buckets."""
+    counts = _hasher().transform(docs)
+    buckets, inverse = np.unique(counts.indices, return_inverse=True)
+    df = np.bincount(inverse, minlength=len(buckets))
+    tf = np.bincount(inverse, weights=counts.data, minlength=len(buckets))
+    return buckets, df, tf, len(docs)
+
+
+@dataclass(frozen=True)
+class HashedIdf:
+    """Kept hash buckets (sorted) and their IDF weights — the fitted TF-IDF model."""
+
+    buckets: np.ndarray
+    idf: np.ndarray
+
+    @classmethod
+    def from_stats(cls, stats: Iterable[Tuple[np.ndarray, np.ndarray, np.ndarray, int]]) -> Tuple["HashedIdf", int]:
+        """Merge :func:`_batch_stats` results → ``(model, n_docs)``."""
+        df = np.zeros(HASH_FEATURES, dtype=np.int64)
+        tf = np.zeros(HASH_FEATURES, dtype=np.float64)
+        n_docs = 0
+        for buckets, batch_df, batch_tf, batch_docs in stats:
+            df[buckets] += batch_df
+            tf[buckets] += batch_tf
+            n_docs += batch_docs
+        keep = np.flatnonzero(df >= MIN_DF)
+        if len(keep) > MAX_FEATURES:
+            keep = np.sort(keep[np.argsort(-tf[keep], kind="stable")[:MAX_FEATURES]])
+        idf = np.log((1.0 + n_docs) / (1.0 + df[keep])) + 1.0  # TfidfVectorizer(smooth_idf=True)
+        return cls(buckets=keep.astype(np.int64), idf=idf), n_docs
+
+    @classmethod
+    def from_rows(cls, rows: Iterable[Tuple[str, float]]) -> Optional["HashedIdf"]:
+        """Rebuild from ``related_idf`` rows; ``None`` if empty or not hashed."""
+        pairs = []
+        for term, idf in rows:
+            if not term.startswith(_IDF_PREFIX):
+                return None  # written by the vocabulary-based builder
+            pairs.append((int(term[len(_IDF_PREFIX) :]), float(idf)))
+        if not pairs:
+            return None
+        pairs.sort()
+        return cls(
+            buckets=np.array([b for b, _ in pairs], dtype=np.int64),
+            idf=np.array([w for _, w in pairs], dtype=np.float64),
+        )
+
+    def to_rows(self) -> List[Tuple[str, float]]:
+        return [(f"{_IDF_PREFIX}{b}", float(w)) for b, w in zip(self.buckets.tolist(), self.idf.tolist())]
+
+    def _columns(self, hashed: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """Map hash buckets to model columns → ``(columns, hit_mask)``."""
+        if len(self.buckets) == 0:
+            return np.zeros(len(hashed), dtype=np.int64), np.zeros(len(hashed), dtype=bool)
+        cols = np.minimum(np.searchsorted(self.buckets, hashed), len(self.buckets) - 1)
+        return cols, self.buckets[cols] == hashed
+
+    def transform(self, docs: Sequence[str]) -> sparse.csr_matrix:
+        """Docs → L2-normalised TF-IDF rows (float32, one column per kept bucket)."""
+        from sklearn.preprocessing import normalize
+
+        counts = _hasher().transform(docs)
+        cols, hit = self._columns(counts.indices)
+        row_of = np.repeat(np.arange(len(docs)), np.diff(counts.indptr))
+        indptr = np.concatenate(([0], np.cumsum(np.bincount(row_of[hit], minlength=len(docs)))))
+        data = (1.0 + np.log(counts.data[hit])) * self.idf[cols[hit]]  # sublinear tf × idf
+        out = sparse.csr_matrix((data, cols[hit], indptr), shape=(len(docs), len(self.buckets)))
+        return normalize(out, norm="l2", axis=1).astype(np.float32)
+
+    def top_terms(self, doc: str, row, n: int) -> List[str]:
+        """The ``n`` highest-weighted terms of ``doc``, given its transformed ``row``.
+
+        Hashing is one-way, so the terms come from re-analyzing the one
+        document rather than from a persisted vocabulary.
+        """
+        if row is None or row.nnz == 0:
+            return []
+        grams = list(dict.fromkeys(_hasher().build_analyzer()(doc)))
+        if not grams:
+            return []
+        cols, hit = self._columns(_term_hasher().transform([[g] for g in grams]).indices)
+        weights = np.where(hit, row.toarray().ravel()[cols], 0.0)
+        order = np.argsort(-weights, kind="stable")[:n]
+        return [grams[i] for i in order if weights[i] > 0]
+
+
+@dataclass(frozen=True)
+class BlendParams:
+    top_n: int
+    tfidf_floor: float
+    w_tfidf: float
+    w_vector: float
+    w_entity: float
+    candidate_cap: int
+
+
+@dataclass
+class RelatedBuild:
+    """Outcome of :func:`build_related`: the fitted model and one rail per scored episode."""
+
+    idf: Optional[HashedIdf]
+    eids: List[str]
+    rails: Dict[str, Rail] = field(default_factory=dict)
+
+    def rows(self) -> List[Tuple[str, str, int, float]]:
+        return [(src, rel, rank, score) for src, rail in self.rails.items() for rank, (rel, score) in enumerate(rail)]
+
+    @property
+    def episodes_with_related(self) -> int:
+        return sum(1 for rail in self.rails.values() if rail)
+
+
+@dataclass
+class _Matrices:
+    centroids: np.ndarray  # N × dim float32, L2-normalised
+    tfidf: sparse.csr_matrix  # N × V
+    tfidf_t: sparse.csr_matrix  # V × N (CSR of the transpose, so block @ it needs no conversion)
+    entities: sparse.csr_matrix  # N × M incidence
+    entities_t: sparse.csr_matrix
+    entity_sizes: np.ndarray  # N
+
+
+def _entity_matrix(eids: Sequence[str], entity_sets: Dict[str, frozenset]) -> sparse.csr_matrix:
+    ids: Dict[str, int] = {}
+    rows: List[int] = []
+    cols: List[int] = []
+    for i, eid in enumerate(eids):
+        for entity_id in entity_sets.get(eid, ()):
+            rows.append(i)
+            cols.append(ids.setdefault(entity_id, len(ids)))
+    data = np.ones(len(rows), dtype=np.float32)
+    return sparse.csr_matrix((data, (rows, cols)), shape=(len(eids), len(ids)))
+
+
+def _matrices(centroids: np.ndarray, tfidf: sparse.csr_matrix, entities: sparse.csr_matrix) -> _Matrices:
+    return _Matrices(
+        centroids=centroids,
+        tfidf=tfidf,
+        tfidf_t=tfidf.T.tocsr(),
+        entities=entities,
+        entities_t=entities.T.tocsr(),
+        entity_sizes=np.asarray(entities.sum(axis=1), dtype=np.float32).ravel(),
+    )
+
+
+def block_size_for(n: int) -> int:
+    return max(16, min(512, BLOCK_CELLS // max(1, n)))
+
+
+def _score_block(m: _Matrices, params: BlendParams, start: int, stop: int) -> List[Tuple[int, List[Tuple[int, float]]]]:
+    """Rails for sources ``start:stop`` as ``(source, [(target, score), ...])`` corpus indices."""
+    n = m.centroids.shape[0]
+    rows = stop - start
+    vec = m.centroids[start:stop] @ m.centroids.T
+    tfidf = (m.tfidf[start:stop] @ m.tfidf_t).toarray()
+    inter = (m.entities[start:stop] @ m.entities_t).toarray()
+    union = m.entity_sizes[start:stop, None] + m.entity_sizes[None, :] - inter
+    ent = np.divide(inter, union, out=np.zeros_like(inter), where=union > 0)
+
+    # Effective pool per leg: the whole corpus until it exceeds the cap
+    # (exact build), the top ``k`` of each leg above it. ``k + 1`` because
+    # the source is its own nearest neighbour.
+    k = min(n, params.candidate_cap)
+    if k + 1 < n:
+        pool = np.zeros((rows, n), dtype=bool)
+        r = np.arange(rows)[:, None]
+        pool[r, np.argpartition(-vec, k, axis=1)[:, : k + 1]] = True
+        pool[r, np.argpartition(-tfidf, k, axis=1)[:, : k + 1]] = True
+    else:
+        pool = np.ones((rows, n), dtype=bool)
+    pool[np.arange(rows), np.arange(start, stop)] = False
+    eligible = pool & (tfidf >= params.tfidf_floor)
+
+    out: List[Tuple[int, List[Tuple[int, float]]]] = []
+    for p in range(rows):
+        cand = np.flatnonzero(eligible[p])
+        if cand.size == 0:
+            out.append((start + p, []))
+            continue
+        score = (
+            params.w_tfidf * _minmax(tfidf[p, cand], np)
+            + params.w_vector * _minmax(vec[p, cand], np)
+            + params.w_entity * _minmax(ent[p, cand], np)
+        )
+        order = np.argsort(-score, kind="stable")[: params.top_n]
+        out.append((start + p, [(int(cand[q]), round(float(score[q]), 6)) for q in order]))
+    return out
+
+
+# -- worker process side -----------------------------------------------------
+
+_worker_matrices: Dict[str, _Matrices] = {}
+
+
+def _init_worker(threads: int) -> None:
+    from threadpoolctl import threadpool_limits
+
+    threadpool_limits(limits=threads)  # BLAS threads split across the workers
+
+
+def _load_matrices(directory: str) -> _Matrices:
+    """Memory-map the arrays :func:`_dump_matrices` wrote (cached per worker)."""
+    m = _worker_matrices.get(directory)
+    if m is None:
+        d = Path(directory)
+
+        def arr(name):
+            return np.load(d / f"{name}.npy", mmap_mode="r")
+
+        def csr(name):
+            shape = tuple(arr(f"{name}_shape"))
+            return sparse.csr_matrix(
+                (arr(f"{name}_data"), arr(f"{name}_indices"), arr(f"{name}_indptr")), shape=shape, copy=False
+            )
+
+        m = _Matrices(
+            centroids=arr("centroids"),
+            tfidf=csr("tfidf"),
+            tfidf_t=csr("tfidf_t"),
+            entities=csr("entities"),
+            entities_t=csr("entities_t"),
+            entity_sizes=arr("entity_sizes"),
+        )
+        _worker_matrices.clear()
+        _worker_matrices[directory] = m
+    return m
+
+
+def _score_block_in_worker(directory: str, params: BlendParams, start: int, stop: int):
+    return _score_block(_load_matrices(directory), params, start, stop)
+
+
+def _dump_matrices(m: _Matrices, directory: str) -> None:
+    d = Path(directory)
+    np.save(d / "centroids.npy", np.ascontiguousarray(m.centroids))
+    np.save(d / "entity_sizes.npy", m.entity_sizes)
+    for name in ("tfidf", "tfidf_t", "entities", "entities_t"):
+        mat = getattr(m, name)
+        np.save(d / f"{name}_data.npy", mat.data)
+        np.save(d / f"{name}_indices.npy", mat.indices)
+        np.save(d / f"{name}_indptr.npy", mat.indptr)
+        np.save(d / f"{name}_shape.npy", np.array(mat.shape, dtype=np.int64))
+
+
+# -- driver ------------------------------------------------------------------
+
+
+def _batched(items: Iterable, size: int) -> Iterator[list]:
+    it = iter(items)
+    while batch := list(islice(it, size)):
+        yield batch
+
+
+def _ordered_map(fn: Callable, args: Iterable[tuple], executor: Optional[Executor], window: int) -> Iterator:
+    """``map(fn, *args)`` in input order, with at most ``window`` tasks in flight."""
+    if executor is None:
+        for a in args:
+            yield fn(*a)
+        return
+    pending: deque = deque()
+    for a in args:
+        pending.append(executor.submit(fn, *a))
+        if len(pending) >= window:
+            yield pending.popleft().result()
+    while pending:
+        yield pending.popleft().result()
+
+
+@contextmanager
+def _pool(workers: int):
+    if workers <= 1:
+        yield None
+        return
+    threads = max(1, (os.cpu_count() or 1) // workers)
+    with ProcessPoolExecutor(
+        max_workers=workers,
+        mp_context=multiprocessing.get_context("spawn"),
+        initializer=_init_worker,
+        initargs=(threads,),
+    ) as executor:
+        yield executor
+
+
+def default_workers() -> int:
+    return max(1, min(8, os.cpu_count() or 1))
+
+
+def score_corpus(
+    centroids: np.ndarray,
+    tfidf: sparse.csr_matrix,
+    entities: sparse.csr_matrix,
+    params: BlendParams,
+    *,
+    executor: Optional[Executor] = None,
+    window: int = 2,
+    block_size: Optional[int] = None,
+) -> Iterator[Tuple[int, List[Tuple[int, float]]]]:
+    """Yield ``(source, rail)`` in corpus-index order, block by block."""
+    m = _matrices(centroids, tfidf, entities)
+    n = centroids.shape[0]
+    step = block_size or block_size_for(n)
+    blocks = [(s, min(s + step, n)) for s in range(0, n, step)]
+    if executor is None:
+        for start, stop in blocks:
+            yield from _score_block(m, params, start, stop)
+        return
+    with tempfile.TemporaryDirectory(prefix="thestill-related-") as tmp:
+        _dump_matrices(m, tmp)
+        for result in _ordered_map(_score_block_in_worker, ((tmp, params, s, e) for s, e in blocks), executor, window):
+            yield from result
+
+
+def build_related(
+    centroids: Dict[str, np.ndarray],
+    stream_docs: Callable[[], Iterable[Tuple[str, str]]],
+    entity_sets: Dict[str, frozenset],
+    params: BlendParams,
+    *,
+    workers: Optional[int] = None,
+) -> RelatedBuild:
+    """Fit the TF-IDF model and score every episode that has a centroid and text.
+
+    ``stream_docs`` is called twice (one per text pass) and yields
+    ``(episode_id, text)`` per episode; episodes without a centroid are
+    skipped. The episode set is the one seen by the second pass.
+    """
+    workers = default_workers() if workers is None else workers
+    if len(centroids) < POOL_MIN_EPISODES:
+        workers = 1
+    window = 2 * workers
+
+    def texts():
+        return (doc for eid, doc in stream_docs() if eid in centroids)
+
+    with _pool(workers) as executor:
+        batches = ((batch,) for batch in _batched(texts(), DOC_BATCH))
+        idf, n_docs = HashedIdf.from_stats(_ordered_map(_batch_stats, batches, executor, window))
+        if n_docs < 2:
+            return RelatedBuild(idf=None, eids=[])
+
+        eids: List[str] = []
+
+        def docs_with_ids():
+            for batch in _batched(((e, d) for e, d in stream_docs() if e in centroids), DOC_BATCH):
+                eids.extend(e for e, _ in batch)
+                yield ([d for _, d in batch],)
+
+        parts = list(_ordered_map(idf.transform, docs_with_ids(), executor, window))
+        if len(eids) < 2:  # corpus shrank between the passes
+            return RelatedBuild(idf=None, eids=eids)
+        tfidf = sparse.vstack(parts, format="csr")
+
+        matrix = np.stack([np.asarray(centroids[e], dtype=np.float32) for e in eids])
+        build = RelatedBuild(idf=idf, eids=eids)
+        for src, rail in score_corpus(
+            matrix, tfidf, _entity_matrix(eids, entity_sets), params, executor=executor, window=window
+        ):
+            build.rails[eids[src]] = [(eids[j], score) for j, score in rail]
+    logger.info("related_engine_scored", episodes=len(eids), workers=workers, features=len(idf.buckets))
+    return build
@@ -19,7 +19,8 @@ Implements the ``SearchBackend`` Protocol with three modes:
 - ``LEXICAL`` — FTS5 BM25 over ``chunks_fts``.
 - ``SEMANTIC`` — k-NN over ``chunks_vec`` via ``vec_distance_cosine``.
 - ``HYBRID`` — reciprocal-rank-fusion of the two top-K lists, K=50,
-  weighted 0.5/0.5.
+  weighted 0.5/0.5. The query embedding, the FTS leg and the kNN leg
+  run overlapped (``search.hybrid.run_hybrid_legs``).
 
 All three push the same ``SearchFilters`` (podcast_id, date_range,
 has_entity[]) into the WHERE clause; no fetch-then-filter in Python.
@@ -42,6 +43,7 @@ from structlog import get_logger
 from ..models.entities import MatchType
 from ..utils.sqlite_ext import load_vec_extension
 from .base import ResolvedHit, SearchFilters, SearchMode
+from .hybrid import SearchTimings, record_search_timings, run_hybrid_legs, timed
 from .query_translator import translate_lexical_query
 
 if False:  # TYPE_CHECKING
@@ -127,17 +129,22 @@ class SqliteVecBackend:
         if mode == SearchMode.LEXICAL:
             if not translated.fts_match:
                 return []
-            rows = self._lexical(translated.fts_match, limit=limit, filters=effective_filters)
+            rows, lexical_ms = timed(
+                lambda: self._lexical(translated.fts_match, limit=limit, filters=effective_filters)
+            )
+            record_search_timings(SearchTimings(lexical_ms=lexical_ms, total_ms=lexical_ms))
             return [self._row_to_hit(r, MatchType.LEXICAL) for r in rows]
         if mode == SearchMode.SEMANTIC:
-            query_embedding = self.embedding_model.encode_one(translated.embedding_text)
-            rows = self._semantic(query_embedding, limit=limit, filters=effective_filters)
+            query_embedding, embed_ms = timed(lambda: self.embedding_model.encode_one(translated.embedding_text))
+            rows, semantic_ms = timed(lambda: self._semantic(query_embedding, limit=limit, filters=effective_filters))
+            record_search_timings(
+                SearchTimings(embed_ms=embed_ms, semantic_ms=semantic_ms, total_ms=embed_ms + semantic_ms)
+            )
             return [self._row_to_hit(r, MatchType.SEMANTIC) for r in rows][:limit]
         if mode == SearchMode.HYBRID:
-            query_embedding = self.embedding_model.encode_one(translated.embedding_text)
             return self._hybrid(
                 translated.fts_match,
-                query_embedding,
+                translated.embedding_text,
                 limit=limit,
                 filters=effective_filters,
             )
@@ -267,15 +274,22 @@ class SqliteVecBackend:
     def _hybrid(
         self,
         query: str,
-        query_embedding: bytes,
+        embedding_text: str,
         *,
         limit: int,
         filters: Optional[SearchFilters],
     ) -> List[ResolvedHit]:
-        # Operator-only or speaker-only inputs leave the FTS expression
-        # empty — semantic still has the cleaned text to work with.
-        lex_rows = self._lexical(query, limit=_HYBRID_FETCH, filters=filters) if query else []
-        sem_rows = self._semantic(query_embedding, limit=_HYBRID_FETCH, filters=filters)
+        # Embedding, lexical and kNN legs overlap (see search.hybrid); the
+        # query is embedded here rather than in ``search`` so the FTS leg
+        # runs while the model computes. Operator-only or speaker-only
+        # inputs leave the FTS expression empty — semantic still has the
+        # cleaned text to work with.
+        lex_rows, sem_rows = run_hybrid_legs(
+            embed=lambda: self.embedding_model.encode_one(embedding_text),
+            lexical=(lambda: self._lexical(query, limit=_HYBRID_FETCH, filters=filters)) if query else None,
+            semantic=lambda query_embedding: self._semantic(query_embedding, limit=_HYBRID_FETCH, filters=filters),
+            backend="sqlite",
+        )
 
         scores: dict[int, float] = {}
         rows_by_id: dict[int, sqlite3.Row] = {}
@@ -30,7 +30,7 @@ from typing import Dict, List, Optional, Tuple
 from structlog import get_logger
 
 from ...core.facts_manager import FactsManager
-from ...models.annotated_transcript import AnnotatedTranscript
+from ...core.transcript_stream import StreamedTranscript, load_segments
 from ...models.facts import EpisodeFacts, strip_role_annotation
 from ...models.podcast import Episode, Podcast
 from ...utils.path_manager import PathManager
@@ -193,11 +193,11 @@ class TranscriptTurnLoader:
         return path
 
     @staticmethod
-    def _load_sidecar(path: Path, episode: Episode) -> Optional[AnnotatedTranscript]:
+    def _load_sidecar(path: Path, episode: Episode) -> Optional[StreamedTranscript]:
+        # Only kind / speaker / text / timing are read below, so stream the
+        # segments rather than validating the whole AnnotatedTranscript.
         try:
-            return AnnotatedTranscript.model_validate_json(
-                path.read_text(encoding="utf-8")
-            )
+            return load_segments(path, default_kind="content")
         except Exception as exc:  # noqa: BLE001 — write-once disk artefact, log + continue
             logger.warning(
                 "narration: failed to load clean transcript json",
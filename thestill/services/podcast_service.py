@@ -18,6 +18,7 @@ Podcast service - Business logic for podcast and episode management
 
 import re
 import threading
+from collections import OrderedDict
 from datetime import datetime, timedelta, timezone
 from pathlib import Path, PurePosixPath
 from typing import TYPE_CHECKING, List, Literal, NamedTuple, Optional, Union
@@ -33,10 +34,9 @@ from ..core.summary_artifacts import (
     write_translation_metadata,
 )
 from ..core.summary_citations import load_valid_citations_for_api
-from ..models.annotated_transcript import AnnotatedTranscript, WordSpan
+from ..core.word_index import WordIndex, WordIndexFormatError, build_word_index, word_index_path
+from ..models.annotated_transcript import AnnotatedTranscript
 from ..models.podcast import Episode, Podcast
-from ..models.transcript import Segment as RawSegment
-from ..models.transcript import Word
 from ..repositories.podcast_repository import PodcastRepository
 from ..utils.duration import format_duration
 from ..utils.file_storage import FileStorage
@@ -51,6 +51,9 @@ if TYPE_CHECKING:
 # Type alias for transcript type
 TranscriptType = Literal["cleaned", "raw"]
 
+# Parsed word indexes kept per service; each is ~12 bytes per word.
+_WORD_INDEX_CACHE_SIZE = 64
+
 
 def extract_summary_preview(content: str, max_length: int = 200) -> Optional[str]:
     """Extract a preview from the numbered first section of a summary.
@@ -121,54 +124,18 @@ class SegmentedTranscriptResult(NamedTuple):
     annotated: AnnotatedTranscript
 
 
-class SegmentWordsResult(NamedTuple):
-    """One ``AnnotatedSegment`` worth of raw word-level timestamps.
-
-    ``segment_id`` matches ``AnnotatedSegment.id`` so the client can join
-    against the segmented transcript it already holds. ``words`` carries
-    the raw ``Word`` objects (with ``start``/``end`` in raw audio seconds);
-    the client adds the response's ``playback_time_offset_seconds`` before
-    comparing to ``audio.currentTime``.
-    """
-
-    segment_id: int
-    words: List[Word]
-
-
 class TranscriptWordsResult(NamedTuple):
     """Per-segment word-level timestamps for the karaoke wipe (spec #38).
 
-    Segments with no resolvable word data (no ``source_word_span``, or a
-    span pointing at raw words that have no timestamps) are omitted, not
-    empty-array'd, so the client can cheaply fall back to segment-level
-    highlighting on a per-segment basis.
+    ``index`` is the episode's write-once ``WordIndex``; segments with no
+    resolvable word data are already omitted from it, so the client can
+    fall back to segment-level highlighting per segment.
+    ``playback_time_offset_seconds`` comes from the DB row, not the index,
+    since it can change after CLEAN.
     """
 
     playback_time_offset_seconds: float
-    segments: List[SegmentWordsResult]
-
-
-def _collect_words_in_span(span: WordSpan, raw_by_id: dict[int, RawSegment]) -> List[Word]:
-    """Walk a ``WordSpan`` and collect the raw ``Word`` objects it points to.
-
-    A span is inclusive on both endpoints and may cross multiple raw
-    segments. Words without ``start``/``end`` timestamps are skipped — they
-    can't drive a karaoke wipe even though they're part of the span.
-
-    Mismatched indices (segment id not present, word index out of range)
-    raise ``KeyError`` / ``IndexError`` — corrupted data should fail loudly
-    rather than silently produce a malformed response.
-    """
-    words: List[Word] = []
-    for seg_id in range(span.start_segment_id, span.end_segment_id + 1):
-        raw_seg = raw_by_id[seg_id]
-        start_idx = span.start_word_index if seg_id == span.start_segment_id else 0
-        end_idx = span.end_word_index if seg_id == span.end_segment_id else len(raw_seg.words) - 1
-        for i in range(start_idx, end_idx + 1):
-            w = raw_seg.words[i]
-            if w.start is not None and w.end is not None:
-                words.append(w)
-    return words
+    index: WordIndex
 
 
 class PodcastWithIndex(BaseModel):
@@ -285,6 +252,9 @@ class PodcastService:
         self.file_storage: FileStorage = file_storage
         self._summary_translation_locks: dict[str, threading.Lock] = {}
         self._summary_translation_locks_guard = threading.Lock()
+        # index key -> ((size, mtime), WordIndex); see get_transcript_words_for_episode.
+        self._word_indexes: "OrderedDict[str, tuple]" = OrderedDict()
+        self._word_index_lock = threading.Lock()
 
         self.feed_manager: PodcastFeedManager = PodcastFeedManager(
             podcast_repository=podcast_repository, path_manager=path_manager
@@ -351,49 +321,19 @@ class PodcastService:
         """
         Get all tracked podcasts with index numbers.
 
+        Counts come from the repository's grouped aggregate
+        (``list_podcast_summaries``); no episode is hydrated.
+
         Returns:
             List of podcasts with human-friendly indices
         """
-        podcasts = self.feed_manager.list_podcasts()
-        logger.debug(f"Listing {len(podcasts)} podcasts")
-
-        from ..models.podcast import EpisodeState
-
-        result = []
-        for idx, podcast in enumerate(podcasts, start=1):
-            # Count episodes that have completed the cleaning pipeline (CLEANED or SUMMARIZED)
-            episodes_processed = sum(
-                1 for ep in podcast.episodes if ep.state in (EpisodeState.CLEANED, EpisodeState.SUMMARIZED)
-            )
-            result.append(
-                PodcastWithIndex(
-                    id=podcast.id,
-                    index=idx,
-                    title=podcast.title,
-                    description=podcast.description,
-                    rss_url=str(podcast.rss_url),
-                    slug=podcast.slug,
-                    image_url=podcast.image_url,
-                    language=podcast.language,
-                    primary_category=podcast.primary_category,
-                    primary_subcategory=podcast.primary_subcategory,
-                    secondary_category=podcast.secondary_category,
-                    secondary_subcategory=podcast.secondary_subcategory,
-                    last_processed=podcast.last_processed,
-                    last_processed_at=podcast.last_processed_at,
-                    episodes_count=len(podcast.episodes),
-                    episodes_processed=episodes_processed,
-                    # THES-146: New metadata fields
-                    author=podcast.author,
-                    explicit=podcast.explicit,
-                    show_type=podcast.show_type,
-                    website_url=podcast.website_url,
-                    is_complete=podcast.is_complete,
-                    copyright=podcast.copyright,
-                )
-            )
+        rows = self.repository.list_podcast_summaries()
+        logger.debug(f"Listing {len(rows)} podcasts")
+        return [PodcastWithIndex(**row) for row in rows]
 
-        return result
+    def get_podcast_index(self, podcast: Podcast) -> int:
+        """1-based listing index of ``podcast`` (0 if it is no longer tracked)."""
+        return self.repository.get_podcast_index(str(podcast.id)) or 0
 
     def get_podcast(self, podcast_id: Union[str, int]) -> Optional[Podcast]:
         """
@@ -407,15 +347,16 @@ class PodcastService:
         """
         # Spec #69 Phase 4 — route each identifier shape to its indexed
         # repository lookup instead of hydrating the whole corpus and
-        # linear-scanning it. Only the legacy 1-based CLI index still needs
-        # the ordered full list.
+        # linear-scanning it. The legacy 1-based CLI index is a rank lookup
+        # on the listing order.
 
         # If integer, treat as index (1-based)
         if isinstance(podcast_id, int):
-            podcasts = self.feed_manager.list_podcasts()
-            if 1 <= podcast_id <= len(podcasts):
+            uuid = self.repository.get_podcast_id_at_index(podcast_id)
+            podcast = self.repository.get(uuid) if uuid else None
+            if podcast:
                 logger.debug(f"Retrieved podcast by index: {podcast_id}")
-                return podcasts[podcast_id - 1]
+                return podcast
             logger.warning(f"Podcast index out of range: {podcast_id}")
             return None
 
@@ -546,8 +487,7 @@ class PodcastService:
             return None
 
         # Get podcast index for response
-        podcasts = self.get_podcasts()
-        podcast_index = next((p.index for p in podcasts if str(p.rss_url) == str(podcast.rss_url)), 0)
+        podcast_index = self.get_podcast_index(podcast)
 
         # Sort episodes by pub_date descending (latest first)
         sorted_episodes = sorted(
@@ -761,9 +701,12 @@ class PodcastService:
     def get_transcript_words_for_episode(self, episode: Episode) -> Optional[TranscriptWordsResult]:
         """Load per-segment word-level timestamps for the karaoke wipe (spec #38).
 
-        Reads two sidecars: the segmented JSON (for ``AnnotatedSegment.id`` →
-        ``source_word_span`` mapping) and the raw transcript JSON (for the
-        actual ``Word`` objects with their start/end seconds).
+        Serves the ``*_cleaned.words.idx`` index CLEAN writes next to the
+        segmented JSON (see ``core.word_index``). A repeat request costs
+        one ``get_metadata`` call: the parsed index is memoised per
+        ``(size, mtime)``. Episodes cleaned before the index existed get
+        one built from the two JSON sidecars on first request, and it is
+        written back so later requests take the fast path.
 
         Returns ``None`` — which the route translates to 404 — when:
           - the segmented JSON sidecar is missing (episode wasn't cleaned
@@ -781,14 +724,55 @@ class PodcastService:
             return None
 
         annotated_path = self.path_manager.clean_transcript_file(episode.clean_transcript_json_path)
+        index_key = self.path_manager.to_relative(word_index_path(annotated_path))
+
+        index = self._load_word_index(index_key)
+        if index is None:
+            index = self._build_word_index(episode, annotated_path, index_key)
+        if not index:
+            return None
+
+        return TranscriptWordsResult(
+            playback_time_offset_seconds=episode.playback_time_offset_seconds,
+            index=index,
+        )
+
+    def _load_word_index(self, index_key: str) -> Optional[WordIndex]:
+        """The stored index at ``index_key``, or ``None`` when absent or unreadable."""
+        try:
+            meta = self.file_storage.get_metadata(index_key)
+        except FileNotFoundError:
+            return None
+        stamp = (meta.size, meta.modified_timestamp)
+        with self._word_index_lock:
+            cached = self._word_indexes.get(index_key)
+            if cached is not None and cached[0] == stamp:
+                self._word_indexes.move_to_end(index_key)
+                return cached[1]
+        try:
+            index = WordIndex.from_bytes(self.file_storage.read_bytes(index_key))
+        except FileNotFoundError:
+            return None
+        except WordIndexFormatError as error:
+            logger.warning("transcript_words.index_unreadable", index=index_key, error=str(error))
+            return None
+        self._remember_word_index(index_key, stamp, index)
+        return index
+
+    def _build_word_index(self, episode: Episode, annotated_path: Path, index_key: str) -> WordIndex:
+        """Build the index from the JSON sidecars and store it for next time.
+
+        Returns an empty index when either sidecar is missing; that is not
+        written, so the index appears once the files do.
+        """
+        from ..models.transcript import Transcript
+
         raw_path = self.path_manager.raw_transcript_file(episode.raw_transcript_path)
 
         # Spec #35 — collapse the prior exists+read into a single read,
         # treating FileNotFoundError on either file as the same "missing"
         # signal. The structured log line keeps the same shape so any
         # alerting rules on it continue to work.
-        from ..models.transcript import Transcript
-
         try:
             annotated_payload = self._read_relative(annotated_path)
         except FileNotFoundError:
@@ -798,7 +782,7 @@ class PodcastService:
                 annotated_present=False,
                 raw_present=None,
             )
-            return None
+            return WordIndex.build([])
         try:
             raw_payload = self._read_relative(raw_path)
         except FileNotFoundError:
@@ -808,30 +792,29 @@ class PodcastService:
                 annotated_present=True,
                 raw_present=False,
             )
-            return None
-
-        annotated = AnnotatedTranscript.model_validate_json(annotated_payload)
-        raw = Transcript.model_validate_json(raw_payload)
-
-        raw_by_id: dict[int, RawSegment] = {seg.id: seg for seg in raw.segments}
-
-        segments_out: List[SegmentWordsResult] = []
-        for ann_seg in annotated.segments:
-            span = ann_seg.source_word_span
-            if span is None:
-                continue
-            words = _collect_words_in_span(span, raw_by_id)
-            if not words:
-                continue
-            segments_out.append(SegmentWordsResult(segment_id=ann_seg.id, words=words))
+            return WordIndex.build([])
 
-        if not segments_out:
-            return None
-
-        return TranscriptWordsResult(
-            playback_time_offset_seconds=episode.playback_time_offset_seconds,
-            segments=segments_out,
+        index = build_word_index(
+            AnnotatedTranscript.model_validate_json(annotated_payload),
+            Transcript.model_validate_json(raw_payload),
         )
+        try:
+            self.file_storage.write_bytes(index_key, index.to_bytes())
+            meta = self.file_storage.get_metadata(index_key)
+        except Exception as error:  # pylint: disable=broad-except
+            # Read-only or flaky storage: serve what we built, try again next time.
+            logger.warning("transcript_words.index_write_failed", index=index_key, error=str(error))
+            return index
+        logger.info("transcript_words.index_built", episode_id=episode.id, segments=len(index), words=index.word_count)
+        self._remember_word_index(index_key, (meta.size, meta.modified_timestamp), index)
+        return index
+
+    def _remember_word_index(self, index_key: str, stamp: tuple, index: WordIndex) -> None:
+        with self._word_index_lock:
+            self._word_indexes[index_key] = (stamp, index)
+            self._word_indexes.move_to_end(index_key)
+            while len(self._word_indexes) > _WORD_INDEX_CACHE_SIZE:
+                self._word_indexes.popitem(last=False)
 
     def _summary_path_for_language(
         self,
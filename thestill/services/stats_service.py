@@ -78,6 +78,11 @@ class SystemStats(BaseModel):
     refresh_backing_off: int = 0
     refresh_parked_total: int = 0
     refresh_parked_by_reason: dict = {}
+    # Adaptive cadence: polls per day the current per-feed intervals add up
+    # to, and how many fewer that is than polling every feed at
+    # REFRESH_DEFAULT_INTERVAL_SECONDS.
+    refresh_fetches_per_day: float = 0.0
+    refresh_fetches_avoided_per_day: float = 0.0
     storage_path: str
     last_updated: datetime
 
@@ -171,6 +176,8 @@ class StatsService:
             refresh_backing_off=refresh_health.get("backing_off", 0),
             refresh_parked_total=refresh_health.get("parked_total", 0),
             refresh_parked_by_reason=refresh_health.get("parked_by_reason", {}),
+            refresh_fetches_per_day=refresh_health.get("fetches_per_day", 0.0),
+            refresh_fetches_avoided_per_day=refresh_health.get("fetches_avoided_per_day", 0.0),
             storage_path=str(self.storage_path),
             last_updated=now_utc(),
         )
@@ -212,8 +219,10 @@ class StatsService:
         getter = getattr(self.repository, "get_refresh_health_counts", None)
         if getter is None:
             return {}
+        from ..utils.config import get_default_refresh_interval_seconds
+
         try:
-            return getter()
+            return getter(baseline_interval_seconds=get_default_refresh_interval_seconds())
         except Exception:
             logger.warning("refresh_health_counts_failed", exc_info=True)
             return {}
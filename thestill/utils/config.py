@@ -68,6 +68,18 @@ def get_refresh_max_interval_seconds() -> int:
     return _env_int("REFRESH_MAX_INTERVAL_SECONDS", 86400)
 
 
+def get_refresh_polls_per_publish_gap() -> int:
+    """How many times to poll a feed per learned gap between its releases
+    (default 4: a daily show is checked about every 6h)."""
+    return max(1, _env_int("REFRESH_POLLS_PER_PUBLISH_GAP", 4))
+
+
+def get_refresh_jitter_percent() -> int:
+    """Random spread applied to each feed's next due time, as a percentage of
+    its interval (default 10), so feeds seeded together drift apart."""
+    return min(50, max(0, _env_int("REFRESH_JITTER_PERCENT", 10)))
+
+
 def is_refresh_via_queue_enabled() -> bool:
     """When true, ``thestill refresh`` and the scheduler enqueue REFRESH_FEED
     tasks instead of running the inline batch (spec #48). Default: off."""
@@ -93,6 +105,19 @@ def get_quarantine_probe_interval_seconds() -> int:
     return _env_int("REFRESH_QUARANTINE_PROBE_INTERVAL_SECONDS", 7 * 86400)
 
 
+def get_rss_early_stop_known_run() -> int:
+    """Run of already-stored GUIDs (newest-first, dates non-increasing) after
+    which a refresh stops handing feed items to feedparser (default 3). 0
+    always parses the whole feed."""
+    return max(0, _env_int("RSS_EARLY_STOP_KNOWN_RUN", 3))
+
+
+def is_rss_debug_dump_enabled() -> bool:
+    """When true, every fetched feed body is written to
+    ``debug_feeds/<slug>.xml`` for troubleshooting. Default: off."""
+    return _env_bool("RSS_DEBUG_DUMP_ENABLED", False)
+
+
 # ---------------------------------------------------------------------------
 # Spec #50 — scheduled briefings knobs. Same standalone-getter pattern as the
 # #48 refresh scheduler; ships dark and flips per deployment via env.
@@ -115,6 +140,13 @@ def get_briefing_scheduler_max_per_tick() -> int:
     return _env_int("BRIEFING_SCHEDULER_MAX_PER_TICK", 50)
 
 
+def get_scheduler_lease_seconds() -> int:
+    """TTL of the lease that elects the one process running the refresh and
+    briefing schedulers (default 30s). A crashed leader is replaced within
+    roughly this long."""
+    return _env_int("SCHEDULER_LEASE_SECONDS", 30)
+
+
 # ---------------------------------------------------------------------------
 # Spec #66 — AWS deployment knobs. Same standalone-getter pattern; ships dark.
 # ---------------------------------------------------------------------------
@@ -127,6 +159,38 @@ def is_migrate_on_startup_enabled() -> bool:
     return _env_bool("MIGRATE_ON_STARTUP", False)
 
 
+# ---------------------------------------------------------------------------
+# Postgres connection pool (utils/postgres_ext.py): one bounded pool per DSN
+# per process, fronting every repository and queue connection.
+# ---------------------------------------------------------------------------
+def is_postgres_pool_enabled() -> bool:
+    """When false, every Postgres operation opens (and closes) its own
+    connection, the pre-pool behaviour. Default: on."""
+    return _env_bool("POSTGRES_POOL_ENABLED", True)
+
+
+def get_postgres_pool_max_size() -> int:
+    """Most connections one process holds per database. ``0`` (default)
+    sizes each pool from the threads that may use it at once (web
+    threadpool, worker executor; at least 10). Callers beyond the limit
+    wait for a connection to be returned."""
+    return _env_int("POSTGRES_POOL_MAX_SIZE", 0)
+
+
+def get_postgres_pool_max_lifetime_seconds() -> int:
+    """Pooled connections are replaced after this long (default 30m), so
+    server-side memory growth and failovers do not pin a stale backend."""
+    return _env_int("POSTGRES_POOL_MAX_LIFETIME_SECONDS", 1800)
+
+
+def get_postgres_statement_timeout_ms() -> int:
+    """Server-side ``statement_timeout`` for every connection, pooled or
+    not (default ``0``: the server's own setting). Set it to cancel a
+    runaway query instead of letting it hold a pool slot indefinitely;
+    it applies to migrations and backfills too."""
+    return _env_int("POSTGRES_STATEMENT_TIMEOUT_MS", 0)
+
+
 # ---------------------------------------------------------------------------
 # Spec #49 — queue auto-healing. The worker auto-requeues infra-class
 # ``failed`` tasks (DNS / model-runtime / provider outages) once their
@@ -178,6 +242,57 @@ def get_circuit_cooldown_seconds() -> int:
     return _env_int("QUEUE_CIRCUIT_COOLDOWN_SECONDS", 60)
 
 
+# ---------------------------------------------------------------------------
+# Resident model pool for local transcribers (Whisper / WhisperX / Parakeet).
+# Models stay loaded across TRANSCRIBE tasks instead of being reloaded per
+# episode; these bound how much the pool may keep. See core/model_pool.py.
+# ---------------------------------------------------------------------------
+
+
+def get_model_pool_max_models() -> int:
+    """Models kept resident at once (default 4; 0 = reload every task)."""
+    return max(0, _env_int("MODEL_POOL_MAX_MODELS", 4))
+
+
+def get_model_pool_max_memory_mb() -> int:
+    """Estimated resident-weight budget in MB (default 0 = no byte limit)."""
+    return max(0, _env_int("MODEL_POOL_MAX_MEMORY_MB", 0))
+
+
+def get_model_pool_idle_seconds() -> int:
+    """Evict a model unused for this long (default 1800s; 0 = never)."""
+    return max(0, _env_int("MODEL_POOL_IDLE_SECONDS", 1800))
+
+
+def is_model_pool_warmup_enabled() -> bool:
+    """Load the configured local transcription models when the web worker
+    starts, so the first TRANSCRIBE task does not pay the load. Default: off."""
+    return _env_bool("MODEL_POOL_WARMUP", False)
+
+
+# ---------------------------------------------------------------------------
+# Shared LLM client pool. CLEAN / SUMMARIZE / narration reuse one provider
+# (SDK client + connection pool) per configuration, and every call passes
+# a per-model admission gate fed by ModelLimits and rate-limit response
+# headers. See core/llm_pool.py.
+# ---------------------------------------------------------------------------
+
+
+def is_llm_client_pool_enabled() -> bool:
+    """Reuse pooled, rate-limited LLM providers in the task worker. Default: on."""
+    return _env_bool("LLM_CLIENT_POOL", True)
+
+
+def get_llm_max_concurrency() -> int:
+    """In-flight requests allowed per provider/model (default 8; 0 = unlimited)."""
+    return max(0, _env_int("LLM_MAX_CONCURRENCY", 8))
+
+
+def get_llm_admission_timeout_seconds() -> int:
+    """Longest a call may queue for admission before failing (default 900s)."""
+    return max(1, _env_int("LLM_ADMISSION_TIMEOUT_SECONDS", 900))
+
+
 # ---------------------------------------------------------------------------
 # Spec #49 follow-up — per-stage handler watchdog. A handler that blocks past
 # its stage's timeout is presumed wedged: the classic trigger is a network
@@ -293,6 +408,12 @@ class Config(BaseModel):
     s3_prefix: str = ""  # optional, lets one bucket host multiple deployments
     s3_endpoint_url: str = ""  # leave empty for real AWS; set for LocalStack / MinIO in tests
     s3_kms_key_id: str = ""  # empty = SSE-S3 (AES256); set to switch to SSE-KMS with this CMK
+    # Opt-in read-through disk cache for the S3 backend
+    # (file_storage/local_cache.py): objects keyed by key + ETag, LRU-bounded.
+    # Path defaults to storage_path/s3_cache.
+    s3_cache_enabled: bool = False
+    s3_cache_path: str = ""
+    s3_cache_max_mb: int = 10240
 
     # Path Manager (initialized after model creation)
     # All path operations should use path_manager methods instead of direct path attributes
@@ -322,6 +443,23 @@ class Config(BaseModel):
     # never starve the heavy stages (transcribe/clean). Defaults to 2 rather
     # than falling back to ``parallel_jobs``.
     refresh_feed_parallel_jobs: Optional[int] = 2
+    # Task progress transport (core/progress_bus.py). ``memory`` only reaches
+    # SSE clients when the worker runs inside the web process; ``database``
+    # carries progress between processes over the repository backend
+    # (SQLite side table, or Postgres LISTEN/NOTIFY).
+    progress_bus: str = "memory"  # memory | database
+    # Per-task publish throttle for progress callbacks; 0 passes every update.
+    progress_publish_interval_ms: int = 250
+    # LLM batches one CLEAN task may keep in flight (shared per provider
+    # model). 1 keeps the serial cleaner whose previous context is the
+    # already-cleaned output; >1 pipelines batches with raw previous context.
+    clean_batch_concurrency: int = 1
+    # Opt-in content-addressed LLM response cache (core/llm_cache.py):
+    # identical requests (re-runs, --force, eval sweeps) are answered from a
+    # local SQLite file. Path defaults to storage_path/llm_cache.db.
+    llm_cache_enabled: bool = False
+    llm_cache_path: str = ""
+    llm_cache_max_mb: int = 512
     # Spec #28 §2.10 — sentence-transformers model used to embed
     # transcript segments into the ``chunks`` table for hybrid corpus
     # search. Must be a key in ``thestill.search.base.EMBEDDING_MODEL_DIMS``;
@@ -343,6 +481,10 @@ class Config(BaseModel):
     transcription_provider: str = "whisper"  # whisper, parakeet, google, or elevenlabs
     whisper_model: str = "base"
     whisper_device: str = "auto"
+    # Local Whisper/Parakeet on CPU: split long WAVs at silences and run the
+    # chunks across this many worker processes (1 = single-stream).
+    transcribe_chunk_workers: int = 1
+    transcribe_chunk_seconds: int = 300
 
     # Speaker Diarization Configuration
     enable_diarization: bool = False
@@ -471,11 +613,18 @@ class Config(BaseModel):
     # Hard cap on any user-triggered audio download. Attackers controlling an
     # RSS feed can otherwise point us at a 100 GB file. Default 2 GiB.
     max_audio_bytes: int = 2 * 1024 * 1024 * 1024
+    # Concurrent HTTP Range requests per audio download (1 = single stream)
+    # and the minimum file size worth splitting. Only used when the server
+    # advertises ``Accept-Ranges: bytes``.
+    download_parallel_ranges: int = 1
+    download_parallel_min_bytes: int = 64 * 1024 * 1024
     # Request body cap for the webhook endpoint (bytes). Default 1 MiB.
     max_webhook_body_bytes: int = 1 * 1024 * 1024
 
     # Entity enrichment (spec #45 Tier 0) — Wikidata + Wikipedia fetching.
-    enrichment_request_delay_sec: float = 0.5  # politeness delay between Wikimedia requests
+    # Politeness spacing between outbound Wikimedia requests, across all
+    # enrichment threads (cache hits are free).
+    enrichment_request_delay_sec: float = 0.5
     enrichment_wikipedia_lang: str = "en"  # language edition for sitelinks + summaries
     enrichment_max_age_days: int = 30  # re-check enrichment older than this
     enrichment_user_agent: str = "thestill-podcast-pipeline/0.1 (https://github.com/sasasarunic/thestill)"
@@ -483,6 +632,15 @@ class Config(BaseModel):
     # coalesced batch can't burst thousands of Wikimedia requests inline.
     # Overflow is picked up by the scheduled ``enrich-entities`` sweep.
     enrichment_max_per_task: int = 200
+    # Entities fetched concurrently per enrichment batch (core/entity_enricher.py).
+    enrichment_concurrency: int = 4
+    # Persistent Wikimedia response cache (core/wikimedia_http.py), shared by
+    # enrichment and the resolver's P31 lookups. Entries older than the TTL
+    # are revalidated with ETag / Last-Modified; a TTL of 0 disables the
+    # cache. Path defaults to storage_path/wikimedia_cache.db.
+    wikimedia_cache_path: str = ""
+    wikimedia_cache_ttl_hours: float = 7 * 24
+    wikimedia_cache_max_mb: int = 256
 
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
@@ -492,6 +650,12 @@ class Config(BaseModel):
         # Set default database path if not provided
         if not self.database_path:
             self.database_path = str(self.storage_path / "podcasts.db")
+        if not self.llm_cache_path:
+            self.llm_cache_path = str(self.storage_path / "llm_cache.db")
+        if not self.s3_cache_path:
+            self.s3_cache_path = str(self.storage_path / "s3_cache")
+        if not self.wikimedia_cache_path:
+            self.wikimedia_cache_path = str(self.storage_path / "wikimedia_cache.db")
 
         self._ensure_directories()
 
@@ -688,6 +852,9 @@ def load_config(env_file: Optional[str] = None) -> Config:
         "s3_prefix": os.getenv("S3_PREFIX", ""),
         "s3_endpoint_url": os.getenv("S3_ENDPOINT_URL", ""),
         "s3_kms_key_id": os.getenv("S3_KMS_KEY_ID", ""),
+        "s3_cache_enabled": os.getenv("S3_CACHE_ENABLED", "false").lower() == "true",
+        "s3_cache_path": os.getenv("S3_CACHE_PATH", ""),
+        "s3_cache_max_mb": max(0, int(os.getenv("S3_CACHE_MAX_MB", "10240"))),
         "max_workers": int(os.getenv("MAX_WORKERS", "3")),
         "parallel_jobs": int(os.getenv("PARALLEL_JOBS", "1")),
         **{
@@ -711,10 +878,16 @@ def load_config(env_file: Optional[str] = None) -> Config:
             )
             if os.getenv(f"{stage.replace('-', '_').upper()}_PARALLEL_JOBS")
         },
+        "progress_bus": os.getenv("PROGRESS_BUS", "memory").lower(),
+        "progress_publish_interval_ms": max(0, int(os.getenv("PROGRESS_PUBLISH_INTERVAL_MS", "250"))),
         "embedding_model": os.getenv(
             "EMBEDDING_MODEL",
             "sentence-transformers/paraphrase-multilingual-MiniLM-L12-v2",
         ),
+        "clean_batch_concurrency": max(1, int(os.getenv("CLEAN_BATCH_CONCURRENCY", "1"))),
+        "llm_cache_enabled": os.getenv("LLM_CACHE_ENABLED", "false").lower() == "true",
+        "llm_cache_path": os.getenv("LLM_CACHE_PATH", ""),
+        "llm_cache_max_mb": max(0, int(os.getenv("LLM_CACHE_MAX_MB", "512"))),
         "chunk_duration_minutes": int(os.getenv("CHUNK_DURATION_MINUTES", "30")),
         "max_episodes_per_podcast": (
             int(os.getenv("MAX_EPISODES_PER_PODCAST")) if os.getenv("MAX_EPISODES_PER_PODCAST") else None
@@ -724,6 +897,8 @@ def load_config(env_file: Optional[str] = None) -> Config:
         "transcription_provider": os.getenv("TRANSCRIPTION_PROVIDER", "whisper"),
         "whisper_model": os.getenv("WHISPER_MODEL", "base"),
         "whisper_device": os.getenv("WHISPER_DEVICE", "auto"),
+        "transcribe_chunk_workers": max(1, int(os.getenv("TRANSCRIBE_CHUNK_WORKERS", "1"))),
+        "transcribe_chunk_seconds": max(30, int(os.getenv("TRANSCRIBE_CHUNK_SECONDS", "300"))),
         "enable_diarization": os.getenv("ENABLE_DIARIZATION", "false").lower() == "true",
         "diarization_model": os.getenv("DIARIZATION_MODEL", "pyannote/speaker-diarization-3.1"),
         "huggingface_token": os.getenv("HUGGINGFACE_TOKEN", ""),
@@ -785,6 +960,8 @@ def load_config(env_file: Optional[str] = None) -> Config:
         "public_base_url": os.getenv("PUBLIC_BASE_URL", "").rstrip("/"),
         "enable_docs": os.getenv("ENABLE_DOCS", "false").lower() == "true",
         "max_audio_bytes": int(os.getenv("MAX_AUDIO_BYTES", str(2 * 1024 * 1024 * 1024))),
+        "download_parallel_ranges": int(os.getenv("DOWNLOAD_PARALLEL_RANGES", "1")),
+        "download_parallel_min_bytes": int(os.getenv("DOWNLOAD_PARALLEL_MIN_BYTES", str(64 * 1024 * 1024))),
         "max_webhook_body_bytes": int(os.getenv("MAX_WEBHOOK_BODY_BYTES", str(1 * 1024 * 1024))),
         # Entity enrichment (spec #45 Tier 0)
         "enrichment_request_delay_sec": float(os.getenv("ENRICHMENT_REQUEST_DELAY_SEC", "0.5")),
@@ -795,6 +972,10 @@ def load_config(env_file: Optional[str] = None) -> Config:
             "thestill-podcast-pipeline/0.1 (https://github.com/sasasarunic/thestill)",
         ),
         "enrichment_max_per_task": int(os.getenv("ENRICHMENT_MAX_PER_TASK", "200")),
+        "enrichment_concurrency": max(1, int(os.getenv("ENRICHMENT_CONCURRENCY", "4"))),
+        "wikimedia_cache_path": os.getenv("WIKIMEDIA_CACHE_PATH", ""),
+        "wikimedia_cache_ttl_hours": max(0.0, float(os.getenv("WIKIMEDIA_CACHE_TTL_HOURS", str(7 * 24)))),
+        "wikimedia_cache_max_mb": max(0, int(os.getenv("WIKIMEDIA_CACHE_MAX_MB", "256"))),
     }
 
     # Production must not emit
@@ -250,6 +250,14 @@ _PROMOTIONS: list[tuple[str, str]] = [
         FROM {m}.entity_cooccurrences
         """,
     ),
+    (
+        "episode_entities",
+        """
+        INSERT INTO episode_entities (episode_id, entity_id, last_seen_at)
+        SELECT episode_id::uuid, entity_id, NULLIF(last_seen_at,'')::timestamptz
+        FROM {m}.episode_entities
+        """,
+    ),
     (
         "entity_enrichment",
         """
@@ -286,6 +294,18 @@ _PROMOTIONS: list[tuple[str, str]] = [
         FROM {m}.resolution_blacklist
         """,
     ),
+    (
+        "entity_resolution_cache",
+        """
+        INSERT INTO entity_resolution_cache (surface_key, surface_label, wikidata_qid, canonical_name,
+            entity_type, description, wikidata_instance_of, observations, conflicting, updated_at)
+        SELECT surface_key, surface_label, wikidata_qid, canonical_name, entity_type, description,
+               COALESCE(NULLIF(wikidata_instance_of,''),'[]')::jsonb, observations::bigint,
+               COALESCE(NULLIF(conflicting,'')::int::boolean,false),
+               COALESCE(NULLIF(updated_at,'')::timestamptz, now())
+        FROM {m}.entity_resolution_cache
+        """,
+    ),
     (
         "episode_related",
         """
@@ -57,6 +57,8 @@ def make_storage(config: "Config") -> FileStorage:
         # without boto3 for local-backend deployments.
         from .s3 import S3FileStorage  # noqa: WPS433
 
+        cache_enabled = getattr(config, "s3_cache_enabled", False) is True
+
         logger.info(
             "file_storage_backend",
             backend="s3",
@@ -65,13 +67,20 @@ def make_storage(config: "Config") -> FileStorage:
             prefix=config.s3_prefix or "(root)",
             endpoint_url=config.s3_endpoint_url or "(aws)",
             kms="kms" if config.s3_kms_key_id else "sse-s3",
+            cache=config.s3_cache_path if cache_enabled else "(off)",
         )
+        cache = None
+        if cache_enabled:
+            from .local_cache import get_local_file_cache
+
+            cache = get_local_file_cache(config.s3_cache_path, config.s3_cache_max_mb * 1024 * 1024)
         return S3FileStorage(
             bucket=config.s3_bucket,
             region=config.s3_region,
             prefix=config.s3_prefix,
             endpoint_url=config.s3_endpoint_url or None,
             kms_key_id=config.s3_kms_key_id or None,
+            cache=cache,
         )
 
     raise ValueError(f"unknown STORAGE_BACKEND={backend!r}; must be one of: local, s3")
@@ -0,0 +1,319 @@
+# Copyright 2025-2026 Thestill
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Read-through local disk cache for cloud ``FileStorage`` backends.
+
+Without it every ``get_local_path`` / ``local_copy`` on S3 downloads the
+whole object again: downsample, transcribe and cleaning each pull the same
+multi-hundred-MB audio, and the transcript-words endpoint re-reads the same
+JSON. ``LocalFileCache`` keeps one copy per object version on local disk.
+
+- **Content-addressed.** An entry is named by SHA-256 over the backend's
+  object identity (bucket + key) and its ETag. A rewritten object has a new
+  ETag and so a new entry; the stale one is never served and ages out.
+- **Bounded.** Hits bump the entry's mtime; past ``max_bytes`` the least
+  recently used entries are deleted down to 90%.
+- **One downloader.** Concurrent misses for the same entry take a per-entry
+  lock (a thread lock, plus ``flock`` on a lock file where available so
+  worker processes sharing the directory coordinate too). The first caller
+  fills, the rest wait and then hit.
+- **Private handles.** Callers never get the entry itself: ``fetch`` hands
+  out a hard link (a copy where links aren't supported) under ``tmp/``, so
+  eviction can't pull a file out from under ffmpeg, and a caller unlinking
+  its path can't corrupt the cache.
+
+The directory (``S3_CACHE_PATH``, default ``<STORAGE_PATH>/s3_cache``) is
+safe to delete while nothing is running.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import os
+import shutil
+import threading
+import time
+import uuid
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple, Union
+
+import structlog
+
+try:  # POSIX only; elsewhere fills coordinate within one process.
+    import fcntl
+except ImportError:  # pragma: no cover - Windows
+    fcntl = None  # type: ignore[assignment]
+
+logger = structlog.get_logger(__name__)
+
+# Eviction trims to this share of ``max_bytes`` so it does not run per fill.
+_EVICT_TO = 0.9
+# Handles under ``tmp/`` older than this at startup were leaked by a crashed
+# caller of ``get_local_path``.
+_STALE_HANDLE_SECONDS = 24 * 3600
+
+
+class LocalFileCache:
+    """Directory of object copies keyed by identity + ETag, bounded to ``max_bytes``."""
+
+    def __init__(self, root: Union[str, Path], max_bytes: int = 10 * 1024**3) -> None:
+        self.root = Path(root)
+        self.max_bytes = max(0, max_bytes)
+        self._objects = self.root / "objects"
+        self._tmp = self.root / "tmp"
+        self._locks_dir = self.root / "locks"
+        for directory in (self._objects, self._tmp, self._locks_dir):
+            directory.mkdir(parents=True, exist_ok=True)
+        self._sweep_stale_handles()
+
+        self._lock = threading.Lock()
+        self._fill_locks: Dict[str, Tuple[threading.Lock, int]] = {}
+        self._size_bytes = sum(size for _, size, _ in self._scan())
+        self.hits = 0
+        self.misses = 0
+        self.waits = 0
+        self.fills = 0
+        self.write_throughs = 0
+        self.evictions = 0
+
+    # --- Public surface -------------------------------------------------------
+
+    def fetch(self, identity: str, etag: str, suffix: str, fill: Callable[[Path], None]) -> Path:
+        """A private path holding the object, filling the entry on a miss.
+
+        ``fill(dest)`` downloads the object version tagged ``etag`` to
+        ``dest``. The returned path belongs to the caller, who unlinks it.
+        Exceptions from ``fill`` propagate and leave no entry behind.
+        """
+        name = self._entry_name(identity, etag, suffix)
+        handle = self._checkout(name, suffix)
+        if handle is not None:
+            self._count(hits=1)
+            return handle
+        with self._fill_lock(name):
+            # Another thread or process may have filled it while we waited.
+            handle = self._checkout(name, suffix)
+            if handle is not None:
+                self._count(hits=1, waits=1)
+                return handle
+            self._count(misses=1)
+            self._fill(name, fill)
+            self._count(fills=1)
+            handle = self._checkout(name, suffix)
+        if handle is None:  # pragma: no cover - entry larger than the whole cache
+            raise FileNotFoundError(identity)
+        return handle
+
+    def store_file(self, identity: str, etag: str, suffix: str, source: Union[str, Path]) -> None:
+        """Write-through: seed the entry from a local file just uploaded.
+
+        Copied, not linked: the caller may go on to rewrite ``source``.
+        """
+        name = self._entry_name(identity, etag, suffix)
+        with self._fill_lock(name):
+            self._fill(name, lambda dest: shutil.copyfile(source, dest))
+        self._count(write_throughs=1)
+
+    def store_bytes(self, identity: str, etag: str, suffix: str, content: bytes) -> None:
+        """Write-through: seed the entry from bytes just uploaded."""
+        name = self._entry_name(identity, etag, suffix)
+        with self._fill_lock(name):
+            self._fill(name, lambda dest: dest.write_bytes(content))
+        self._count(write_throughs=1)
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "path": str(self.root),
+                "size_bytes": self._size_bytes,
+                "max_bytes": self.max_bytes,
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_ratio": round(self.hits / lookups, 3) if lookups else None,
+                "waits": self.waits,
+                "fills": self.fills,
+                "write_throughs": self.write_throughs,
+                "evictions": self.evictions,
+            }
+
+    # --- Internals ------------------------------------------------------------
+
+    @staticmethod
+    def _entry_name(identity: str, etag: str, suffix: str) -> str:
+        # S3 returns ETags quoted; listings and HEAD agree, but strip anyway.
+        version = etag.strip('"')
+        digest = hashlib.sha256(f"{identity}\0{version}".encode("utf-8")).hexdigest()
+        return f"{digest}{suffix}"
+
+    def _entry_path(self, name: str) -> Path:
+        return self._objects / name[:2] / name
+
+    def _checkout(self, name: str, suffix: str) -> Optional[Path]:
+        """Private handle on entry ``name``, or ``None`` if it isn't cached."""
+        entry = self._entry_path(name)
+        handle = self._tmp / f"thestill_s3_{uuid.uuid4().hex}{suffix}"
+        try:
+            _link_or_copy(entry, handle)
+        except FileNotFoundError:
+            return None
+        try:
+            os.utime(entry)
+        except OSError:  # evicted after the link; the handle is still good
+            pass
+        return handle
+
+    def _fill(self, name: str, fill: Callable[[Path], None]) -> None:
+        entry = self._entry_path(name)
+        if entry.exists():
+            return
+        partial = self._tmp / f"fill_{uuid.uuid4().hex}"
+        try:
+            fill(partial)
+            entry.parent.mkdir(parents=True, exist_ok=True)
+            size = partial.stat().st_size
+            os.replace(partial, entry)
+        finally:
+            partial.unlink(missing_ok=True)
+        with self._lock:
+            self._size_bytes += size
+            over = self.max_bytes and self._size_bytes > self.max_bytes
+        if over:
+            self._evict(keep=entry)
+
+    def _evict(self, keep: Path) -> None:
+        """Delete least recently used entries until the cache is under 90%.
+
+        Rescans the directory rather than trusting the in-memory total:
+        other processes sharing it fill and evict too. Each entry's lock
+        file goes with it; a process still waiting on the old file at worst
+        fills the entry twice, and ``os.replace`` keeps that harmless.
+        """
+        entries = sorted(self._scan(), key=lambda e: e[2])
+        total = sum(size for _, size, _ in entries)
+        target = int(self.max_bytes * _EVICT_TO)
+        evicted = 0
+        for path, size, _ in entries:
+            if total <= target:
+                break
+            if path == keep:
+                continue
+            try:
+                path.unlink()
+            except FileNotFoundError:
+                pass
+            self._lock_path(path.name).unlink(missing_ok=True)
+            total -= size
+            evicted += 1
+        with self._lock:
+            self._size_bytes = total
+            self.evictions += evicted
+        logger.info("file_cache_evicted", entries=evicted, size_bytes=total, max_bytes=self.max_bytes)
+
+    def _scan(self) -> List[Tuple[Path, int, float]]:
+        found = []
+        for path in self._objects.glob("*/*"):
+            try:
+                stat = path.stat()
+            except FileNotFoundError:
+                continue
+            found.append((path, stat.st_size, stat.st_mtime))
+        return found
+
+    def _lock_path(self, name: str) -> Path:
+        return self._locks_dir / f"{name}.lock"
+
+    def _sweep_stale_handles(self) -> None:
+        cutoff = time.time() - _STALE_HANDLE_SECONDS
+        for path in self._tmp.iterdir():
+            try:
+                if path.stat().st_mtime < cutoff:
+                    path.unlink()
+            except OSError:
+                continue
+        # Locks whose entry is gone: failed fills, or evicted by a process
+        # that died before removing the lock.
+        for path in self._locks_dir.glob("*.lock"):
+            if not self._entry_path(path.stem).exists():
+                try:
+                    if path.stat().st_mtime < cutoff:
+                        path.unlink()
+                except OSError:
+                    continue
+
+    @contextmanager
+    def _fill_lock(self, name: str) -> Iterator[None]:
+        with self._lock:
+            lock, users = self._fill_locks.get(name, (threading.Lock(), 0))
+            self._fill_locks[name] = (lock, users + 1)
+        try:
+            with lock:
+                if fcntl is None:
+                    yield
+                    return
+                with open(self._lock_path(name), "a") as handle:
+                    fcntl.flock(handle, fcntl.LOCK_EX)
+                    try:
+                        yield
+                    finally:
+                        fcntl.flock(handle, fcntl.LOCK_UN)
+        finally:
+            with self._lock:
+                lock, users = self._fill_locks[name]
+                if users == 1:
+                    del self._fill_locks[name]
+                else:
+                    self._fill_locks[name] = (lock, users - 1)
+
+    def _count(self, **increments: int) -> None:
+        with self._lock:
+            for counter, value in increments.items():
+                setattr(self, counter, getattr(self, counter) + value)
+
+
+def _link_or_copy(source: Path, dest: Path) -> None:
+    """Hard-link ``source`` to ``dest``, copying where links aren't possible."""
+    try:
+        os.link(source, dest)
+    except FileNotFoundError:
+        raise
+    except OSError:  # cross-device, or a filesystem without hard links
+        shutil.copyfile(source, dest)
+
+
+_caches: Dict[str, LocalFileCache] = {}
+_caches_lock = threading.Lock()
+
+
+def get_local_file_cache(root: Union[str, Path], max_bytes: int) -> LocalFileCache:
+    """The process-wide cache for ``root`` (opened on first use)."""
+    key = str(Path(root).resolve())
+    with _caches_lock:
+        cache = _caches.get(key)
+        if cache is None:
+            cache = LocalFileCache(root, max_bytes=max_bytes)
+            _caches[key] = cache
+        else:
+            cache.max_bytes = max(0, max_bytes)
+        return cache
+
+
+def file_cache_stats() -> Dict[str, Any]:
+    """Stats of every cache opened in this process, ``{}`` if none."""
+    with _caches_lock:
+        caches = list(_caches.values())
+    if not caches:
+        return {}
+    return caches[0].stats() if len(caches) == 1 else {"caches": [c.stats() for c in caches]}
@@ -23,22 +23,31 @@ Credentials follow the boto3 chain. In AWS production rely on EC2 instance
 profile / ECS task role / IRSA — never bake explicit keys into images.
 ``endpoint_url`` enables LocalStack / MinIO / DigitalOcean Spaces for tests
 or self-hosted S3-compatible deployments.
+
+An optional :class:`~.local_cache.LocalFileCache` makes reads read-through:
+``read_bytes`` / ``get_local_path`` / ``local_copy`` / ``download_file``
+HEAD the object and serve the version with that ETag from local disk,
+downloading only on a miss. Writes go through to the cache as well.
 """
 
 from __future__ import annotations
 
 import fnmatch
 import os
+import shutil
 import tempfile
 from contextlib import contextmanager
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Any, Iterable, Iterator, Optional
+from typing import TYPE_CHECKING, Any, Iterable, Iterator, Optional
 
 import structlog
 
 from .base import FileMetadata, FileStorage, StorageError, _normalize_key
 
+if TYPE_CHECKING:
+    from .local_cache import LocalFileCache
+
 logger = structlog.get_logger(__name__)
 
 
@@ -62,6 +71,10 @@ class S3FileStorage(FileStorage):
     SSE-S3 (AES256, the bucket default) to SSE-KMS with the given customer
     managed key. Required only when compliance demands customer-managed
     keys; SSE-S3 is fine for the default case.
+
+    Optional ``cache`` keeps downloaded objects on local disk keyed by
+    key + ETag, so repeated reads of the same audio or transcript cost a
+    HEAD instead of a full download.
     """
 
     def __init__(
@@ -73,6 +86,7 @@ class S3FileStorage(FileStorage):
         kms_key_id: Optional[str] = None,
         access_key_id: Optional[str] = None,
         secret_access_key: Optional[str] = None,
+        cache: Optional["LocalFileCache"] = None,
     ):
         # Lazy import — ``boto3`` is in the ``[s3]`` extra, not in base deps.
         # The hint mentions the extra by name so the error is actionable.
@@ -93,6 +107,7 @@ class S3FileStorage(FileStorage):
         self.prefix = prefix.strip("/")
         self.endpoint_url = endpoint_url
         self.kms_key_id = kms_key_id
+        self.cache = cache
 
         client_kwargs: dict[str, Any] = {"region_name": region}
         if endpoint_url:
@@ -176,9 +191,76 @@ class S3FileStorage(FileStorage):
         code = err.get("Code", "")
         return code in {"NoSuchKey", "404", "NotFound"}
 
+    def _head(self, path: str) -> tuple[str, dict[str, Any]]:
+        """``(key, HeadObject response)``; not-found maps to ``FileNotFoundError``."""
+        key = self._key(path)
+        try:
+            return key, self._client.head_object(Bucket=self.bucket, Key=key)
+        except self._wrapped_errors as exc:
+            if self._is_not_found(exc):
+                raise FileNotFoundError(path) from None
+            raise StorageError(f"s3 head_object failed for {key!r}: {exc}") from exc
+
+    def _download(self, key: str, path: str, dest: Path | str) -> None:
+        try:
+            self._client.download_file(
+                Bucket=self.bucket,
+                Key=key,
+                Filename=str(dest),
+                Config=self._transfer_config,
+            )
+        except self._wrapped_errors as exc:
+            if self._is_not_found(exc):
+                raise FileNotFoundError(path) from None
+            raise StorageError(f"s3 download_file failed for {key!r}: {exc}") from exc
+
+    def _cached_copy(self, path: str) -> Path:
+        """Private local copy of ``path`` served through ``self.cache``.
+
+        The caller owns (and unlinks) the returned file.
+        """
+        key, head = self._head(path)
+        etag = head["ETag"]
+
+        def fill(dest: Path) -> None:
+            self._download(key, path, dest)
+            # The transfer manager can't pin a download to an ETag, so
+            # re-check: an object rewritten mid-download must not be cached
+            # under the old version. Transient — the retry sees the new one.
+            if self._head(path)[1]["ETag"] != etag:
+                raise StorageError(f"s3 object {key!r} changed during download")
+
+        return self.cache.fetch(f"{self.bucket}/{key}", etag, Path(path).suffix, fill)
+
+    def _write_through(
+        self,
+        path: str,
+        key: str,
+        etag: Optional[str],
+        *,
+        content: Optional[bytes] = None,
+        source: Path | str | None = None,
+    ) -> None:
+        """Seed the cache with an object just written. Never fails the write."""
+        if not etag:
+            return
+        try:
+            if content is not None:
+                self.cache.store_bytes(f"{self.bucket}/{key}", etag, Path(path).suffix, content)
+            else:
+                self.cache.store_file(f"{self.bucket}/{key}", etag, Path(path).suffix, source)
+        except OSError as exc:
+            logger.warning("s3_cache_write_through_failed", key=key, error=str(exc))
+
     # --- FileStorage surface -------------------------------------------------
 
     def read_bytes(self, path: str) -> bytes:
+        if self.cache is not None:
+            handle = self._cached_copy(path)
+            try:
+                return handle.read_bytes()
+            finally:
+                handle.unlink(missing_ok=True)
         key = self._key(path)
         try:
             response = self._client.get_object(Bucket=self.bucket, Key=key)
@@ -194,9 +276,11 @@ class S3FileStorage(FileStorage):
     def write_bytes(self, path: str, content: bytes) -> None:
         key = self._key(path)
         try:
-            self._client.put_object(Bucket=self.bucket, Key=key, Body=content, **self._put_kwargs())
+            response = self._client.put_object(Bucket=self.bucket, Key=key, Body=content, **self._put_kwargs())
         except self._wrapped_errors as exc:
             raise StorageError(f"s3 put_object failed for {key!r}: {exc}") from exc
+        if self.cache is not None:
+            self._write_through(path, key, response.get("ETag"), content=content)
 
     def write_text(self, path: str, content: str, *, encoding: str = "utf-8") -> None:
         self.write_bytes(path, content.encode(encoding))
@@ -246,13 +330,7 @@ class S3FileStorage(FileStorage):
         return total_deleted
 
     def get_metadata(self, path: str) -> FileMetadata:
-        key = self._key(path)
-        try:
-            head = self._client.head_object(Bucket=self.bucket, Key=key)
-        except self._wrapped_errors as exc:
-            if self._is_not_found(exc):
-                raise FileNotFoundError(path) from None
-            raise StorageError(f"s3 head_object failed for {key!r}: {exc}") from exc
+        key, head = self._head(path)
 
         last_modified = head["LastModified"]
         # boto3 returns tz-aware datetimes already; normalise to UTC
@@ -325,7 +403,10 @@ class S3FileStorage(FileStorage):
 
     def get_local_path(self, path: str) -> Path:
         # Download to a tempfile. **Caller is responsible for cleanup** —
-        # prefer ``local_copy`` (auto-cleanup) where possible.
+        # prefer ``local_copy`` (auto-cleanup) where possible. With a cache
+        # the tempfile is a private link to the cached copy instead.
+        if self.cache is not None:
+            return self._cached_copy(path)
         key = self._key(path)
         # Suffix preserved so tools that pick decoder based on extension
         # (pydub/ffmpeg/whisper) see ``.mp3`` / ``.wav`` etc.
@@ -333,23 +414,14 @@ class S3FileStorage(FileStorage):
         tmp = tempfile.NamedTemporaryFile(delete=False, suffix=suffix, prefix="thestill_s3_")
         tmp.close()
         try:
-            self._client.download_file(
-                Bucket=self.bucket,
-                Key=key,
-                Filename=tmp.name,
-                Config=self._transfer_config,
-            )
-        except self._wrapped_errors as exc:
+            self._download(key, path, tmp.name)
+        except (FileNotFoundError, StorageError):
             # Cleanup in ``except`` rather than ``finally`` so the file
-            # stays on disk on success. ``self._wrapped_errors`` now covers
-            # both ``ClientError`` (server-side responses) and
-            # ``BotoCoreError`` (network/endpoint/timeout), so the broad
-            # ``except Exception`` clause that used to follow is no longer
-            # needed for cleanup correctness.
+            # stays on disk on success. ``_download`` maps both
+            # ``ClientError`` (server-side responses) and ``BotoCoreError``
+            # (network/endpoint/timeout) to these two.
             os.unlink(tmp.name)
-            if self._is_not_found(exc):
-                raise FileNotFoundError(path) from None
-            raise StorageError(f"s3 download_file failed for {key!r}: {exc}") from exc
+            raise
         return Path(tmp.name)
 
     @contextmanager
@@ -385,6 +457,16 @@ class S3FileStorage(FileStorage):
             )
         except self._wrapped_errors as exc:
             raise StorageError(f"s3 upload_file failed for {key!r}: {exc}") from exc
+        if self.cache is not None:
+            # ``upload_file`` returns nothing; the ETag (multipart-shaped for
+            # large files) is only known from a HEAD. The upload already
+            # succeeded, so a failed HEAD only skips the write-through.
+            try:
+                _, head = self._head(remote_path)
+            except (FileNotFoundError, StorageError) as exc:
+                logger.warning("s3_cache_write_through_failed", key=key, error=str(exc))
+                return
+            self._write_through(remote_path, key, head.get("ETag"), source=local_path)
 
     def download_file(self, remote_path: str, local_path: Path | str) -> None:
         """High-level multipart-aware download to an explicit local path.
@@ -392,15 +474,13 @@ class S3FileStorage(FileStorage):
         Mirror of ``upload_file``. Use this when the caller already has a
         destination path in mind (vs. ``get_local_path`` which mints a tempfile).
         """
-        key = self._key(remote_path)
-        try:
-            self._client.download_file(
-                Bucket=self.bucket,
-                Key=key,
-                Filename=str(local_path),
-                Config=self._transfer_config,
-            )
-        except self._wrapped_errors as exc:
-            if self._is_not_found(exc):
-                raise FileNotFoundError(remote_path) from None
-            raise StorageError(f"s3 download_file failed for {key!r}: {exc}") from exc
+        if self.cache is not None:
+            # Copied, not moved: the handle is a hard link to the cache
+            # entry, and the caller may go on to rewrite ``local_path``.
+            handle = self._cached_copy(remote_path)
+            try:
+                shutil.copyfile(handle, local_path)
+            finally:
+                handle.unlink(missing_ok=True)
+            return
+        self._download(self._key(remote_path), remote_path, local_path)
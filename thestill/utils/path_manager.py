@@ -136,6 +136,7 @@ class PathManager:
 
         # Define all subdirectories
         self._original_audio = "original_audio"
+        self._partial_downloads = "partial_downloads"
         self._downsampled_audio = "downsampled_audio"
         self._raw_transcripts = "raw_transcripts"
         self._clean_transcripts = "clean_transcripts"
@@ -187,6 +188,10 @@ class PathManager:
         """Get path to original audio directory"""
         return self.storage_path / self._original_audio
 
+    def partial_downloads_dir(self) -> Path:
+        """Get path to in-progress audio downloads (``.part`` files + resume manifests)"""
+        return self.storage_path / self._partial_downloads
+
     def downsampled_audio_dir(self) -> Path:
         """Get path to downsampled audio directory"""
         return self.storage_path / self._downsampled_audio
@@ -531,7 +536,8 @@ class PathManager:
         """
         Get full path to a debug RSS feed file.
 
-        Stores the last downloaded RSS XML for debugging purposes.
+        Stores the last downloaded RSS XML for debugging purposes when
+        ``RSS_DEBUG_DUMP_ENABLED`` is set.
         Overwrites previous version on each refresh.
 
         Args:
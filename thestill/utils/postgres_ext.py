@@ -25,25 +25,149 @@ repository code reads almost identically to the SQLite version —
   manager commits on a clean exit, rolls back on exception, and closes the
   connection, matching the SQLite ``with connect(path) as conn:`` semantics.
 
-Connection-per-operation keeps the port mechanical and the tests hermetic. The
-production wiring will front this with ``psycopg_pool.ConnectionPool`` (spec
-#44 Target Design) — a drop-in behind the same ``with`` block — but that
-lifecycle is deliberately out of this first slice.
+Connections come from a process-wide ``psycopg_pool.ConnectionPool`` per
+(DSN, vector) pair (spec #44 Target Design) — a drop-in behind the same
+``with`` block, whose exit commits or rolls back and hands the connection
+back instead of closing it. Repository and queue calls run dozens of times a
+second under the worker's stage pollers, so a TCP + auth handshake per call
+was most of their cost. Pools health-check connections on checkout, retire
+them after ``POSTGRES_POOL_MAX_LIFETIME_SECONDS``, and optionally set a
+server-side ``statement_timeout``. ``POSTGRES_POOL_ENABLED=false`` restores
+a fresh connection per operation.
+
+Pools are bounded. A checkout beyond the bound waits (30s, then
+``PoolTimeout``), so the bound must cover every thread that can hold a
+connection at once: the web threadpool and the worker's handler executor
+call :func:`reserve_connections` with their sizes, and with
+``POSTGRES_POOL_MAX_SIZE`` unset each pool grows to match. An explicit
+``POSTGRES_POOL_MAX_SIZE`` is a hard cap (e.g. to fit the server's
+``max_connections``).
 """
 
 from __future__ import annotations
 
-from typing import Optional
+import atexit
+import os
+import threading
+from typing import TYPE_CHECKING, ContextManager, Dict, Optional, Tuple
 
 import psycopg
 from psycopg.rows import dict_row
 
+if TYPE_CHECKING:
+    from psycopg_pool import ConnectionPool
 
-def connect(dsn: str, *, vector: bool = False) -> psycopg.Connection:
-    """Open a psycopg connection with dict rows.
+_POOLS: Dict[Tuple[str, bool], "ConnectionPool"] = {}
+_POOLS_LOCK = threading.Lock()
+_POOLS_PID = os.getpid()
+# Threads in this process that may hold a connection at once (see
+# ``reserve_connections``); sizes the pools unless POSTGRES_POOL_MAX_SIZE is set.
+_RESERVED = 0
+_MIN_POOL_SIZE = 10
 
-    Returns the connection object itself so callers use it as a context
-    manager: ``with connect(dsn) as conn: conn.execute(...)``.
+
+def _connection_kwargs() -> dict:
+    from .config import get_postgres_statement_timeout_ms
+
+    kwargs: dict = {"row_factory": dict_row}
+    timeout_ms = get_postgres_statement_timeout_ms()
+    if timeout_ms > 0:
+        kwargs["options"] = f"-c statement_timeout={timeout_ms}"
+    return kwargs
+
+
+def _register_vector(conn: psycopg.Connection) -> None:
+    from pgvector.psycopg import register_vector
+
+    register_vector(conn)
+
+
+def _configure_vector(conn: psycopg.Connection) -> None:
+    # Pool ``configure`` callbacks must hand the connection back idle;
+    # the adapter registration reads pg_type inside a transaction.
+    _register_vector(conn)
+    conn.commit()
+
+
+def _pool_max_size() -> int:
+    from .config import get_postgres_pool_max_size
+
+    configured = get_postgres_pool_max_size()
+    if configured > 0:
+        return configured
+    return max(_MIN_POOL_SIZE, _RESERVED)
+
+
+def reserve_connections(count: int) -> None:
+    """Declare ``count`` more threads that may each hold a connection at once.
+
+    Called by whatever sizes a thread pool that talks to Postgres. Pools
+    already open are resized; an explicit ``POSTGRES_POOL_MAX_SIZE`` wins.
+    """
+    global _RESERVED
+
+    with _POOLS_LOCK:
+        _RESERVED += max(0, count)
+        pools = list(_POOLS.values()) if _POOLS_PID == os.getpid() else []
+        max_size = _pool_max_size()
+    for pool in pools:
+        if pool.max_size != max_size:
+            pool.resize(min_size=pool.min_size, max_size=max_size)
+
+
+def get_pool(dsn: str, *, vector: bool = False) -> "ConnectionPool":
+    """Return this process's pool for ``dsn`` (opened on first use).
+
+    ``vector`` pools register the pgvector adapter once per connection
+    rather than on every checkout. A forked child never reuses its
+    parent's pools — their sockets belong to the parent.
+    """
+    global _POOLS_PID
+
+    with _POOLS_LOCK:
+        if _POOLS_PID != os.getpid():
+            _POOLS.clear()
+            _POOLS_PID = os.getpid()
+        pool = _POOLS.get((dsn, vector))
+        if pool is None:
+            from psycopg_pool import ConnectionPool
+
+            from .config import get_postgres_pool_max_lifetime_seconds
+
+            max_size = _pool_max_size()
+            pool = ConnectionPool(
+                dsn,
+                kwargs=_connection_kwargs(),
+                min_size=1,
+                max_size=max_size,
+                max_lifetime=max(60, get_postgres_pool_max_lifetime_seconds()),
+                configure=_configure_vector if vector else None,
+                check=ConnectionPool.check_connection,
+                name="thestill-vector" if vector else "thestill",
+                open=True,
+            )
+            _POOLS[(dsn, vector)] = pool
+        return pool
+
+
+def close_pools() -> None:
+    """Close every pool this process opened (idempotent; runs at exit)."""
+    with _POOLS_LOCK:
+        pools = list(_POOLS.values()) if _POOLS_PID == os.getpid() else []
+        _POOLS.clear()
+    for pool in pools:
+        pool.close()
+
+
+atexit.register(close_pools)
+
+
+def connect(dsn: str, *, vector: bool = False) -> ContextManager[psycopg.Connection]:
+    """Check out a psycopg connection with dict rows.
+
+    Use as a context manager: ``with connect(dsn) as conn: conn.execute(...)``.
+    The block commits on a clean exit and rolls back on exception, then
+    returns the connection to the pool (or closes it when pooling is off).
 
     Args:
         dsn: connection string.
@@ -51,11 +175,13 @@ def connect(dsn: str, *, vector: bool = False) -> psycopg.Connection:
             numpy arrays / lists bind to ``vector`` columns and reads
             come back as numpy arrays. Only search/chunk code needs it.
     """
-    conn = psycopg.connect(dsn, row_factory=dict_row)
-    if vector:
-        from pgvector.psycopg import register_vector
+    from .config import is_postgres_pool_enabled
 
-        register_vector(conn)
+    if is_postgres_pool_enabled():
+        return get_pool(dsn, vector=vector).connection()
+    conn = psycopg.connect(dsn, **_connection_kwargs())
+    if vector:
+        _register_vector(conn)
     return conn
 
 
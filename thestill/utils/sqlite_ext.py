@@ -19,14 +19,23 @@ Spec #28 §2.10 — the ``sqlite-vec`` extension is required for the
 the ``[entities]`` optional extra; deployments that don't install
 that extra have no chunk index and search code paths surface a typed
 error to the caller.
+
+It also owns connection setup for every SQLite repository: :func:`connect`
+opens a tuned per-call connection, and :func:`pooled_connect` /
+:func:`pooled_writer` hand out long-lived prepared connections from the
+process-wide :class:`SqliteConnectionPool`.
 """
 
 from __future__ import annotations
 
+import os
 import sqlite3
+import threading
+from collections import OrderedDict
 from contextlib import contextmanager
+from dataclasses import dataclass
 from pathlib import Path
-from typing import Iterator, Union
+from typing import Dict, Iterator, Optional, Tuple, Union
 
 
 class SqliteVecNotInstalledError(RuntimeError):
@@ -92,6 +101,49 @@ def maybe_load_vec_extension(conn: sqlite3.Connection) -> bool:
 BUSY_TIMEOUT_MS = 5000
 
 
+def _open_connection(
+    db_path: Union[str, Path],
+    *,
+    load_vec: str,
+    row_factory: bool,
+    check_same_thread: bool = True,
+) -> sqlite3.Connection:
+    """Open and prepare a connection: extension policy + the shared PRAGMAs.
+
+    See :func:`connect` for what each PRAGMA buys. Split out so the pool
+    below prepares its long-lived connections exactly like the per-call path.
+    """
+    if load_vec not in ("none", "soft", "require"):
+        raise ValueError(f"load_vec must be 'none', 'soft', or 'require', got {load_vec!r}")
+    conn = sqlite3.connect(str(db_path), check_same_thread=check_same_thread)
+    try:
+        if row_factory:
+            conn.row_factory = sqlite3.Row
+        if load_vec == "require":
+            load_vec_extension(conn)
+        elif load_vec == "soft":
+            maybe_load_vec_extension(conn)
+        conn.execute("PRAGMA foreign_keys = ON")
+        conn.execute("PRAGMA journal_mode = WAL")
+        conn.execute(f"PRAGMA busy_timeout = {BUSY_TIMEOUT_MS}")
+        conn.execute("PRAGMA synchronous = NORMAL")
+    except Exception:
+        conn.close()
+        raise
+    return conn
+
+
+@contextmanager
+def _transaction_scope(conn: sqlite3.Connection) -> Iterator[sqlite3.Connection]:
+    """Commit on success, rollback on error — the ``connect`` contract."""
+    try:
+        yield conn
+        conn.commit()
+    except Exception:
+        conn.rollback()
+        raise
+
+
 @contextmanager
 def connect(
     db_path: Union[str, Path],
@@ -127,24 +179,289 @@ def connect(
             if missing (writers that cannot function without vec0).
         row_factory: Use ``sqlite3.Row`` for dict-like column access.
     """
-    conn = sqlite3.connect(str(db_path))
-    if row_factory:
-        conn.row_factory = sqlite3.Row
-    if load_vec == "require":
-        load_vec_extension(conn)
-    elif load_vec == "soft":
-        maybe_load_vec_extension(conn)
-    elif load_vec != "none":
-        raise ValueError(f"load_vec must be 'none', 'soft', or 'require', got {load_vec!r}")
-    conn.execute("PRAGMA foreign_keys = ON")
-    conn.execute("PRAGMA journal_mode = WAL")
-    conn.execute(f"PRAGMA busy_timeout = {BUSY_TIMEOUT_MS}")
-    conn.execute("PRAGMA synchronous = NORMAL")
+    conn = _open_connection(db_path, load_vec=load_vec, row_factory=row_factory)
     try:
-        yield conn
-        conn.commit()
-    except Exception:
-        conn.rollback()
-        raise
+        with _transaction_scope(conn):
+            yield conn
     finally:
         conn.close()
+
+
+# Per-thread cap on distinct (database, policy) connections kept open. Real
+# deployments touch one database; the cap exists so a process that walks many
+# databases (the test suite, migration tooling) can't accumulate descriptors.
+POOL_MAX_PER_THREAD = 8
+
+
+@dataclass
+class _PooledConnection:
+    conn: sqlite3.Connection
+    # (st_dev, st_ino) of the database file when the connection was opened.
+    # A database deleted and recreated at the same path gets a new inode; the
+    # old connection would keep reading the unlinked file, so it is replaced.
+    file_id: Optional[Tuple[int, int]]
+    in_use: bool = False
+
+
+@dataclass
+class PoolStats:
+    """Counters for :class:`SqliteConnectionPool` (process lifetime)."""
+
+    opened: int = 0
+    reused: int = 0
+    overflow: int = 0
+    evicted: int = 0
+    writer_waits: int = 0
+
+
+def _file_id(db_path: Union[str, Path]) -> Optional[Tuple[int, int]]:
+    try:
+        st = os.stat(db_path)
+    except OSError:
+        return None
+    return (st.st_dev, st.st_ino)
+
+
+class SqliteConnectionPool:
+    """Thread-aware pool of prepared SQLite connections.
+
+    :func:`connect` opens a brand-new connection per call and re-runs the
+    PRAGMAs (and, for ``"soft"``/``"require"``, the sqlite-vec load) every
+    time. Repositories call it once per method, so a dashboard render or a
+    refresh batch paid that setup dozens of times. The pool keeps connections
+    prepared once and hands them back out:
+
+    - :meth:`connection` — one connection per thread per database (SQLite
+      connections must not be shared across threads without serialisation).
+      Under WAL, these run reads concurrently and writes contend at the
+      database's writer lock exactly as before (``busy_timeout`` applies).
+    - :meth:`writer` — a single connection per database shared by every
+      thread, serialised by a process lock. Explicit ``BEGIN IMMEDIATE``
+      sections (the queue claim) go through it, so in-process writers queue
+      on a lock instead of spinning in SQLite's busy handler.
+
+    Both keep :func:`connect`'s contract: commit on clean exit, rollback on
+    error. Re-entrant use on one thread (a method that opens a connection
+    while an outer scope still holds the thread's pooled one) falls back to
+    a fresh, unpooled connection, so a nested commit can never end an outer
+    transaction early. ``":memory:"`` databases are never pooled — each call
+    must keep getting its own private database.
+    """
+
+    def __init__(self, max_per_thread: int = POOL_MAX_PER_THREAD):
+        self.max_per_thread = max(1, max_per_thread)
+        self.stats = PoolStats()
+        self._stats_lock = threading.Lock()
+        self._reset()
+
+    def _reset(self) -> None:
+        # Connections must never cross a fork: a child re-initialises the pool
+        # (without closing the parent's handles, which it does not own).
+        self._pid = os.getpid()
+        self._local = threading.local()
+        self._writers: Dict[Tuple[str, str, bool], _PooledConnection] = {}
+        self._writer_locks: Dict[Tuple[str, str, bool], threading.RLock] = {}
+        self._writers_lock = threading.Lock()
+
+    def _check_pid(self) -> None:
+        if self._pid != os.getpid():
+            self._reset()
+
+    def _count(self, field_name: str) -> None:
+        with self._stats_lock:
+            setattr(self.stats, field_name, getattr(self.stats, field_name) + 1)
+
+    def _thread_slots(self) -> "OrderedDict[Tuple[str, str, bool], _PooledConnection]":
+        slots = getattr(self._local, "slots", None)
+        if slots is None:
+            slots = OrderedDict()
+            self._local.slots = slots
+        return slots
+
+    def _prepare(self, slot: _PooledConnection, db_path: Union[str, Path], row_factory: bool) -> bool:
+        """Make a pooled connection safe to hand out; False if it must be replaced."""
+        if slot.file_id is not None and _file_id(db_path) != slot.file_id:
+            return False
+        conn = slot.conn
+        try:
+            if conn.in_transaction:
+                # A previous holder left a transaction open — never leak its
+                # writes (or its lock) into the next caller.
+                conn.rollback()
+            conn.row_factory = sqlite3.Row if row_factory else None
+            # Re-asserted because migrations toggle it (and it is free when
+            # unchanged); the other PRAGMAs are never changed by callers.
+            conn.execute("PRAGMA foreign_keys = ON")
+        except sqlite3.ProgrammingError:
+            # The caller closed it.
+            return False
+        return True
+
+    def _new_slot(self, db_path: Union[str, Path], load_vec: str, row_factory: bool, shared: bool) -> _PooledConnection:
+        conn = _open_connection(db_path, load_vec=load_vec, row_factory=row_factory, check_same_thread=not shared)
+        self._count("opened")
+        return _PooledConnection(conn=conn, file_id=_file_id(db_path))
+
+    @contextmanager
+    def connection(
+        self,
+        db_path: Union[str, Path],
+        *,
+        load_vec: str = "none",
+        row_factory: bool = True,
+    ) -> Iterator[sqlite3.Connection]:
+        """This thread's pooled connection to ``db_path`` (see class docstring)."""
+        if str(db_path) == ":memory:":
+            with connect(db_path, load_vec=load_vec, row_factory=row_factory) as conn:
+                yield conn
+            return
+
+        self._check_pid()
+        key = (str(db_path), load_vec, row_factory)
+        slots = self._thread_slots()
+        slot = slots.get(key)
+
+        if slot is not None and slot.in_use:
+            self._count("overflow")
+            with connect(db_path, load_vec=load_vec, row_factory=row_factory) as conn:
+                yield conn
+            return
+
+        if slot is not None and self._prepare(slot, db_path, row_factory):
+            self._count("reused")
+            slots.move_to_end(key)
+        else:
+            if slot is not None:
+                slots.pop(key, None)
+                _close_quietly(slot.conn)
+            slot = self._new_slot(db_path, load_vec, row_factory, shared=False)
+            slots[key] = slot
+            self._evict_idle(slots)
+
+        slot.in_use = True
+        try:
+            with _transaction_scope(slot.conn) as conn:
+                yield conn
+        finally:
+            slot.in_use = False
+
+    def _evict_idle(self, slots: "OrderedDict[Tuple[str, str, bool], _PooledConnection]") -> None:
+        while len(slots) > self.max_per_thread:
+            victim_key = next((k for k, v in slots.items() if not v.in_use), None)
+            if victim_key is None:
+                return
+            _close_quietly(slots.pop(victim_key).conn)
+            self._count("evicted")
+
+    @contextmanager
+    def writer(
+        self,
+        db_path: Union[str, Path],
+        *,
+        load_vec: str = "none",
+        row_factory: bool = True,
+    ) -> Iterator[sqlite3.Connection]:
+        """The process-wide writer connection to ``db_path``, held exclusively.
+
+        Serialised by a per-database lock for the whole ``with`` block, so the
+        caller may ``BEGIN IMMEDIATE`` without racing other threads of this
+        process. Nested use on the thread already holding it falls back to a
+        fresh connection (same reasoning as :meth:`connection`).
+        """
+        if str(db_path) == ":memory:":
+            with connect(db_path, load_vec=load_vec, row_factory=row_factory) as conn:
+                yield conn
+            return
+
+        self._check_pid()
+        key = (str(db_path), load_vec, row_factory)
+        with self._writers_lock:
+            lock = self._writer_locks.setdefault(key, threading.RLock())
+
+        if not lock.acquire(blocking=False):
+            self._count("writer_waits")
+            lock.acquire()
+        try:
+            slot = self._writers.get(key)
+            if slot is not None and slot.in_use:
+                # Re-entered on the owning thread (RLock): don't share the
+                # outer scope's transaction.
+                self._count("overflow")
+                with connect(db_path, load_vec=load_vec, row_factory=row_factory) as conn:
+                    yield conn
+                return
+            if slot is None or not self._prepare(slot, db_path, row_factory):
+                if slot is not None:
+                    _close_quietly(slot.conn)
+                slot = self._new_slot(db_path, load_vec, row_factory, shared=True)
+                self._writers[key] = slot
+            else:
+                self._count("reused")
+            slot.in_use = True
+            try:
+                with _transaction_scope(slot.conn) as conn:
+                    yield conn
+            finally:
+                slot.in_use = False
+        finally:
+            lock.release()
+
+    def close_thread_connections(self) -> None:
+        """Close this thread's idle pooled connections."""
+        slots = self._thread_slots()
+        for key in [k for k, v in slots.items() if not v.in_use]:
+            _close_quietly(slots.pop(key).conn)
+
+    def close_all(self) -> None:
+        """Close this thread's connections and every idle writer connection.
+
+        Other threads' connections close when those threads exit.
+        """
+        self.close_thread_connections()
+        with self._writers_lock:
+            for key in [k for k, v in self._writers.items() if not v.in_use]:
+                _close_quietly(self._writers.pop(key).conn)
+
+
+def _close_quietly(conn: sqlite3.Connection) -> None:
+    try:
+        conn.close()
+    except sqlite3.Error:
+        pass
+
+
+_POOL = SqliteConnectionPool()
+
+
+def get_connection_pool() -> SqliteConnectionPool:
+    """Return the process-wide :class:`SqliteConnectionPool`."""
+    return _POOL
+
+
+@contextmanager
+def pooled_connect(
+    db_path: Union[str, Path],
+    *,
+    load_vec: str = "none",
+    row_factory: bool = True,
+) -> Iterator[sqlite3.Connection]:
+    """Drop-in for :func:`connect` backed by the process-wide pool.
+
+    Same PRAGMAs, extension policy and commit/rollback contract; the
+    connection is prepared once per thread and reused instead of being
+    opened and closed on every call.
+    """
+    with _POOL.connection(db_path, load_vec=load_vec, row_factory=row_factory) as conn:
+        yield conn
+
+
+@contextmanager
+def pooled_writer(
+    db_path: Union[str, Path],
+    *,
+    load_vec: str = "none",
+    row_factory: bool = True,
+) -> Iterator[sqlite3.Connection]:
+    """The process-wide serialized writer connection (see :meth:`SqliteConnectionPool.writer`)."""
+    with _POOL.writer(db_path, load_vec=load_vec, row_factory=row_factory) as conn:
+        yield conn
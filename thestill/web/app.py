@@ -28,7 +28,7 @@ Usage:
 
 from contextlib import asynccontextmanager
 from pathlib import Path
-from typing import Optional
+from typing import Dict, Iterable, Optional
 
 import structlog
 from fastapi import Depends, FastAPI, Request
@@ -39,8 +39,9 @@ from starlette.responses import Response
 from starlette.types import Scope
 
 from ..core.feed_manager import PodcastFeedManager
+from ..core.progress_bus import progress_bus_from_config
 from ..core.progress_store import ProgressStore
-from ..core.queue_manager import QueueManager
+from ..core.queue_manager import QueueManager, TaskStage
 from ..core.task_handlers import create_task_handlers
 from ..core.task_worker import TaskWorker
 from ..repositories.briefing_repository import BriefingRepository
@@ -56,6 +57,7 @@ from ..services.inbox_service import InboxService
 from ..services.narration import NarrationGenerator, NarrationRunner
 from ..utils.config import Config, load_config
 from ..utils.path_manager import PathManager
+from .background import SERVER_ROLES, BackgroundServices
 from .dependencies import AppState, require_admin, require_auth
 from .middleware import BodySizeLimitMiddleware, LoggingMiddleware, SecurityHeadersMiddleware
 from .routes import (
@@ -117,10 +119,10 @@ def _build_narration_runner(
     """
     if not config.narration_enabled:
         return None
-    from ..core.llm_provider import create_llm_provider_from_config
+    from ..core.llm_pool import get_shared_llm_provider
 
     try:
-        llm_provider = create_llm_provider_from_config(config)
+        llm_provider = get_shared_llm_provider(config)
     except Exception as exc:  # noqa: BLE001 — surface the gate, don't crash the server
         logger.warning("narration.runner_disabled", reason=str(exc))
         return None
@@ -137,23 +139,27 @@ def _build_narration_runner(
     )
 
 
-def create_app(config: Optional[Config] = None) -> FastAPI:
+def build_app_state(
+    config: Config,
+    *,
+    worker_stages: Optional[Iterable[TaskStage]] = None,
+    parallel_jobs_per_stage: Optional[Dict[TaskStage, int]] = None,
+) -> AppState:
     """
-    Create and configure the FastAPI application.
+    Wire every service for one process, including an unstarted TaskWorker.
 
-    This factory function initializes all services and registers routes.
-    It follows the same dependency injection pattern as the CLI.
+    Shared by :func:`create_app` and the ``thestill worker`` command, so a
+    standalone worker runs its handlers against exactly the services the
+    web process would give them.
 
     Args:
-        config: Optional Config object. If not provided, loads from environment.
+        config: Loaded configuration
+        worker_stages: Stages the TaskWorker claims (default: all)
+        parallel_jobs_per_stage: Per-stage capacity (default: from config)
 
     Returns:
-        Configured FastAPI application instance.
+        The populated AppState
     """
-    # Load configuration if not provided
-    if config is None:
-        config = load_config()
-
     # Spec #66 — opt-in self-migration before anything touches the schema.
     # Runs ahead of make_repositories so ensure_schema's IF NOT EXISTS DDL
     # becomes a no-op against an already-at-head database. Synchronous and
@@ -190,7 +196,9 @@ def create_app(config: Optional[Config] = None) -> FastAPI:
     refresh_service = RefreshService(feed_manager, podcast_service, queue_manager=queue_manager, config=config)
 
     # Initialize progress store for real-time progress updates
-    progress_store = ProgressStore()
+    progress_store = ProgressStore(
+        progress_bus_from_config(config), min_interval_sec=config.progress_publish_interval_ms / 1000
+    )
 
     # Initialize authentication services
     user_repository = repos.user
@@ -343,7 +351,7 @@ def create_app(config: Optional[Config] = None) -> FastAPI:
         progress_store=progress_store,
         repository=repository,
         parallel_jobs=config.parallel_jobs,
-        parallel_jobs_per_stage=config.get_parallel_jobs_per_stage(),
+        parallel_jobs_per_stage=parallel_jobs_per_stage or config.get_parallel_jobs_per_stage(),
         auto_heal_enabled=is_queue_auto_heal_enabled(),
         heal_interval_s=get_queue_heal_interval_seconds(),
         heal_cooldown_minutes=get_queue_heal_cooldown_minutes(),
@@ -353,60 +361,64 @@ def create_app(config: Optional[Config] = None) -> FastAPI:
         circuit_window_seconds=get_circuit_window_seconds(),
         circuit_cooldown_seconds=get_circuit_cooldown_seconds(),
         watchdog_timeout_per_stage=get_stage_watchdog_seconds(),
+        stages=worker_stages,
     )
     app_state.task_worker = task_worker
+    return app_state
+
+
+def create_app(config: Optional[Config] = None, *, role: str = "all") -> FastAPI:
+    """
+    Create and configure the FastAPI application.
+
+    This factory function initializes all services and registers routes.
+    It follows the same dependency injection pattern as the CLI.
+
+    Args:
+        config: Optional Config object. If not provided, loads from environment.
+        role: ``"all"`` runs the task worker and contends for the scheduler
+            lease in this process; ``"web"`` serves HTTP only, for
+            deployments that run ``thestill worker`` processes alongside.
+
+    Returns:
+        Configured FastAPI application instance.
+    """
+    # Load configuration if not provided
+    if config is None:
+        config = load_config()
+    if role not in SERVER_ROLES:
+        raise ValueError(f"Unknown server role {role!r}; expected one of {', '.join(SERVER_ROLES)}")
+
+    app_state = build_app_state(config)
+    background = BackgroundServices(app_state, run_worker=role == "all", run_schedulers=role == "all")
 
     @asynccontextmanager
     async def lifespan(app: FastAPI):
         """Application lifespan manager for startup/shutdown."""
         import asyncio
 
-        logger.info("starting_web_server")
+        logger.info("starting_web_server", role=role)
         logger.info(
             "server_configuration",
             storage_path=str(config.storage_path),
             database=str(config.database_path),
         )
 
-        # Fail fast on misconfigured transcription provider. In slim Docker
-        # deployments this catches the .env.example default
-        # (TRANSCRIPTION_PROVIDER=whisper) before any episode is processed.
-        from ..core.transcriber_factory import validate_transcription_provider
-
-        validate_transcription_provider(config)
-
-        # Recover any tasks that were interrupted by a previous server restart
-        # Exclude transcribe tasks if using cloud providers (they may still be running)
-        from ..core.queue_manager import TaskStage
-
-        excluded_stages = []
-        if config.transcription_provider.lower() in ("google", "elevenlabs"):
-            excluded_stages.append(TaskStage.TRANSCRIBE)
-            logger.info(
-                "cloud_transcription_provider",
-                provider=config.transcription_provider,
-                note="transcribe_tasks_not_auto_recovered",
-            )
-
-        recovered = queue_manager.recover_interrupted_tasks(excluded_stages=excluded_stages)
-        if recovered > 0:
-            logger.info("recovered_interrupted_tasks", count=recovered)
-
         # Store state in app for access in routes
         app.state.app_state = app_state
 
         # In single-user mode, ensure the default user follows all existing podcasts
         # This handles the case where podcasts were added before follower support
         if not config.multi_user:
-            default_user = auth_service.get_or_create_default_user()
-            all_podcasts = repository.get_all()
-            followed_ids = set(follower_repository.get_followed_podcast_ids(default_user.id))
+            default_user = app_state.auth_service.get_or_create_default_user()
+            all_podcasts = app_state.repository.get_all()
+            followed_ids = set(app_state.follower_repository.get_followed_podcast_ids(default_user.id))
 
             podcasts_to_follow = [p for p in all_podcasts if p.id not in followed_ids]
             if podcasts_to_follow:
                 for podcast in podcasts_to_follow:
                     try:
-                        follower_service.follow(default_user.id, podcast.id)
+                        app_state.follower_service.follow(default_user.id, podcast.id)
                         logger.info(
                             "auto_followed_podcast",
                             podcast_title=podcast.title,
@@ -420,89 +432,22 @@ def create_app(config: Optional[Config] = None) -> FastAPI:
                         )
                 logger.info("single_user_auto_follow_complete", count=len(podcasts_to_follow))
 
-        # Set event loop in progress store for cross-thread async operations
-        progress_store.set_event_loop(asyncio.get_event_loop())
-
-        # Start background task worker
-        task_worker.start()
-        logger.info("task_worker_started")
-
-        # Spec #48 — start the background refresh scheduler when enabled. It
-        # enqueues REFRESH_FEED tasks for due feeds on a tick; the worker's
-        # reserved REFRESH_FEED lane processes them. Ships dark: both the
-        # scheduler and the queued path are off unless explicitly enabled.
-        from ..utils.config import (
-            get_default_refresh_interval_seconds,
-            get_quarantine_probe_interval_seconds,
-            get_refresh_scheduler_tick_seconds,
-            is_refresh_scheduler_enabled,
-            is_refresh_via_queue_enabled,
-        )
+        # Sync routes run on AnyIO's threadpool; each thread may hold a
+        # pooled Postgres connection at once.
+        if config.database_url:
+            import anyio.to_thread
 
-        refresh_scheduler = None
-        if is_refresh_scheduler_enabled():
-            from ..core.refresh_scheduler import RefreshScheduler
+            from ..utils.postgres_ext import reserve_connections
 
-            refresh_scheduler = RefreshScheduler(
-                repository=repository,
-                queue_manager=queue_manager,
-                tick_seconds=get_refresh_scheduler_tick_seconds(),
-                default_interval_seconds=get_default_refresh_interval_seconds(),
-                quarantine_probe_interval_seconds=get_quarantine_probe_interval_seconds(),
-            )
-            refresh_scheduler.start()
-            app_state.refresh_scheduler = refresh_scheduler
-            logger.info("refresh_scheduler_enabled", via_queue=is_refresh_via_queue_enabled())
-        else:
-            logger.info("refresh_scheduler_disabled")
-
-        # Spec #50 — start the briefing scheduler when enabled. It generates
-        # each user's briefing at their scheduled hour via the same
-        # BriefingService the lazy /api/briefings/latest path uses; the
-        # min-interval throttle keeps the two triggers from double-running.
-        # Scheduled runs chain narration (#33) when it's enabled, so the
-        # readout — not just the script — is ready by the scheduled hour.
-        # Ships dark, mirroring the refresh scheduler.
-        from ..utils.config import (
-            get_briefing_scheduler_max_per_tick,
-            get_briefing_scheduler_tick_seconds,
-            is_briefing_scheduler_enabled,
-        )
+            reserve_connections(int(anyio.to_thread.current_default_thread_limiter().total_tokens))
 
-        briefing_scheduler = None
-        if is_briefing_scheduler_enabled():
-            from ..core.briefing_scheduler import BriefingScheduler
-
-            briefing_scheduler = BriefingScheduler(
-                schedule_repository=briefing_schedule_repository,
-                briefing_service=briefing_service,
-                tick_seconds=get_briefing_scheduler_tick_seconds(),
-                max_per_tick=get_briefing_scheduler_max_per_tick(),
-                narration_runner=app_state.narration_runner,
-                narration_target_seconds=config.narration_default_duration_seconds,
-                delivery_service=briefing_delivery_service,
-            )
-            briefing_scheduler.start()
-            app_state.briefing_scheduler = briefing_scheduler
-            logger.info(
-                "briefing_scheduler_enabled",
-                narration_chained=app_state.narration_runner is not None,
-                email_delivery=briefing_delivery_service is not None,
-            )
-        else:
-            logger.info("briefing_scheduler_disabled")
-            if briefing_delivery_service is not None:
-                # The delivery pass only runs from the scheduler tick, so
-                # a configured provider without the scheduler can never
-                # send anything. The capability flag keys off
-                # ``briefing_scheduler`` too, so the UI hides the checkbox
-                # rather than accepting opt-ins that would silently never
-                # deliver (FM: silent degradation).
-                logger.warning(
-                    "briefing_email_delivery_inert",
-                    reason="EMAIL_PROVIDER is configured but BRIEFING_SCHEDULER_ENABLED=false; "
-                    "briefing emails will not be sent",
-                )
+        # Set event loop in progress store for cross-thread async operations
+        app_state.progress_store.set_event_loop(asyncio.get_event_loop())
+
+        # Task worker (with startup recovery) and the lease-held schedulers.
+        # ``role="web"`` serves HTTP only; ``thestill worker`` processes
+        # sharing the database do the processing.
+        background.start()
 
         # Warm the embedding model in the background. The first
         # semantic/hybrid search request would otherwise pay a 5-30s
@@ -514,27 +459,18 @@ def create_app(config: Optional[Config] = None) -> FastAPI:
         import threading as _threading
 
         _threading.Thread(
-            target=embedding_model.warmup,
+            target=app_state.embedding_model.warmup,
             name="embedding-model-warmup",
             daemon=True,
         ).start()
-        logger.info("embedding_model_warmup_scheduled", model=embedding_model.model_name)
+        logger.info("embedding_model_warmup_scheduled", model=app_state.embedding_model.model_name)
 
         yield
 
         # Cleanup on shutdown
         logger.info("shutting_down_web_server")
-
-        # Stop the schedulers (if running) before the worker.
-        if briefing_scheduler is not None:
-            briefing_scheduler.stop()
-        if refresh_scheduler is not None:
-            refresh_scheduler.stop()
-            logger.info("refresh_scheduler_stopped")
-
-        # Stop task worker gracefully
-        task_worker.stop()
-        logger.info("task_worker_stopped")
+        background.stop()
+        app_state.progress_store.close()
 
     # /docs and /redoc are off by default in production.
     # Flip ENABLE_DOCS=true (or ENVIRONMENT=development) to re-enable them.
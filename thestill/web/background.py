@@ -0,0 +1,322 @@
+# Copyright 2025-2026 Thestill
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Background services a process runs next to, or instead of, the HTTP app.
+
+One :class:`BackgroundServices` per process owns:
+
+- the ``TaskWorker`` (started after startup recovery scoped to the stages
+  it claims) and local transcription-model warmup. While it runs the
+  process holds a ``worker:<holder>`` presence lease; when other workers'
+  leases are live, recovery only touches tasks older than the stale
+  timeout, so a joining worker never resets a peer's in-flight tasks;
+- the refresh (spec #48) and briefing (spec #50) schedulers. They are
+  built whenever enabled — the briefing capability flags read
+  ``app_state.briefing_scheduler`` — but only *run* in the process holding
+  the scheduler lease (``core.leader_election``), so any number of
+  ``thestill server`` / ``thestill worker`` processes can share a database
+  without multiplying scheduler ticks.
+
+``thestill server`` builds one from its lifespan (``role="web"`` starts
+neither part); ``thestill worker`` runs one with no HTTP app at all.
+"""
+
+from __future__ import annotations
+
+import threading
+from datetime import datetime, timedelta
+from typing import TYPE_CHECKING, Dict, Iterable, List, Optional
+
+from structlog import get_logger
+
+from ..core.leader_election import (
+    SCHEDULER_LEASE,
+    WORKER_LEASE_PREFIX,
+    LeaderElector,
+    default_holder_id,
+    lease_store_from_config,
+)
+from ..core.queue_manager import TaskStage
+from ..utils.datetime_utils import now_utc
+
+if TYPE_CHECKING:
+    from ..utils.config import Config
+    from .dependencies import AppState
+
+logger = get_logger(__name__)
+
+# ``thestill server --role``: "all" also processes tasks; "web" serves HTTP only.
+SERVER_ROLES = ("all", "web")
+
+
+def parse_stages(text: str) -> List[TaskStage]:
+    """``"transcribe,clean"`` → stages; empty means every stage.
+
+    Accepts the queue spelling (``extract-entities``) or underscores.
+    """
+    names = [name.strip().lower().replace("_", "-") for name in text.split(",") if name.strip()]
+    if not names:
+        return list(TaskStage)
+    valid = {stage.value: stage for stage in TaskStage}
+    unknown = [name for name in names if name not in valid]
+    if unknown:
+        raise ValueError(f"Unknown stage(s): {', '.join(unknown)}. Valid: {', '.join(valid)}")
+    return [valid[name] for name in names]
+
+
+def parse_stage_jobs(values: Iterable[str], base: Dict[TaskStage, int]) -> Dict[TaskStage, int]:
+    """Apply ``STAGE=N`` overrides on top of the configured per-stage capacity."""
+    jobs = dict(base)
+    for value in values:
+        name, sep, count = value.partition("=")
+        if not sep or not count.strip().isdigit() or int(count) < 1:
+            raise ValueError(f"Expected STAGE=N with N >= 1, got {value!r}")
+        (stage,) = parse_stages(name)
+        jobs[stage] = int(count)
+    return jobs
+
+
+def recover_interrupted_tasks(
+    config: "Config",
+    queue_manager,
+    stages: Iterable[TaskStage],
+    started_before: Optional[datetime] = None,
+) -> int:
+    """Startup recovery for the stages this process claims.
+
+    Other stages are excluded so a transcribe-only worker never resets the
+    in-flight tasks of an LLM-stage worker sharing the queue. Cloud
+    transcribe tasks are excluded too (their remote job may still be
+    running). ``started_before`` limits recovery to tasks claimed before
+    it (set when peer workers are alive).
+    """
+    served = set(stages)
+    excluded = [stage for stage in TaskStage if stage not in served]
+    if TaskStage.TRANSCRIBE in served and config.transcription_provider.lower() in ("google", "elevenlabs"):
+        excluded.append(TaskStage.TRANSCRIBE)
+        logger.info(
+            "cloud_transcription_provider",
+            provider=config.transcription_provider,
+            note="transcribe_tasks_not_auto_recovered",
+        )
+
+    recovered = queue_manager.recover_interrupted_tasks(excluded_stages=excluded, started_before=started_before)
+    if recovered > 0:
+        logger.info("recovered_interrupted_tasks", count=recovered)
+    return recovered
+
+
+class BackgroundServices:
+    """Task worker + lease-held schedulers for one process."""
+
+    def __init__(
+        self,
+        app_state: "AppState",
+        *,
+        run_worker: bool = True,
+        run_schedulers: bool = True,
+        recover: bool = True,
+    ):
+        self.app_state = app_state
+        self.config = app_state.config
+        self.run_worker = run_worker
+        self.run_schedulers = run_schedulers
+        self.recover = recover
+        self.elector: Optional[LeaderElector] = None
+        self.presence: Optional[LeaderElector] = None
+
+    def start(self) -> None:
+        if self.run_worker:
+            self._start_worker()
+        self._build_schedulers()
+        if self.run_schedulers and (self.app_state.refresh_scheduler or self.app_state.briefing_scheduler):
+            from ..utils.config import get_scheduler_lease_seconds
+
+            self.elector = LeaderElector(
+                lease_store_from_config(self.config),
+                SCHEDULER_LEASE,
+                on_elected=self._start_schedulers,
+                on_demoted=self._stop_schedulers,
+                ttl_sec=get_scheduler_lease_seconds(),
+            )
+            self.elector.start()
+
+    def stop(self) -> None:
+        # Schedulers before the worker; stopping the elector releases the
+        # lease so a surviving process takes over without waiting for expiry.
+        if self.elector is not None:
+            self.elector.stop()
+            self.elector = None
+        if self.run_worker:
+            self.app_state.task_worker.stop()
+            logger.info("task_worker_stopped")
+        # Released only once in-flight tasks are done: until then a peer
+        # starting up must still treat them as live.
+        if self.presence is not None:
+            self.presence.stop()
+            self.presence = None
+
+    def _start_worker(self) -> None:
+        # Fail fast on misconfigured transcription provider. In slim Docker
+        # deployments this catches the .env.example default
+        # (TRANSCRIPTION_PROVIDER=whisper) before any episode is processed.
+        from ..core.transcriber_factory import validate_transcription_provider
+
+        task_worker = self.app_state.task_worker
+        if TaskStage.TRANSCRIBE in task_worker.stages:
+            validate_transcription_provider(self.config)
+
+        # Every handler thread may hold a pooled connection at once.
+        if self.config.database_url:
+            from ..utils.postgres_ext import reserve_connections
+
+            reserve_connections(task_worker.executor_max_workers())
+
+        peers = self._announce_worker()
+
+        # Recover any tasks that were interrupted by a previous restart. With
+        # live peers a ``processing`` row may be theirs, so only rows past the
+        # stale timeout are orphaned.
+        if self.recover:
+            started_before = None
+            if peers:
+                started_before = now_utc() - timedelta(minutes=task_worker.stale_timeout_minutes)
+                logger.info("peer_workers_alive", peers=len(peers), recover_started_before=started_before.isoformat())
+            recover_interrupted_tasks(
+                self.config, self.app_state.queue_manager, task_worker.stages, started_before=started_before
+            )
+
+        task_worker.start()
+        logger.info("task_worker_started", stages=[s.value for s in task_worker.stages])
+
+        # Preload local transcription models into the resident pool off the
+        # main thread, so the first TRANSCRIBE task does not pay the load.
+        from ..utils.config import is_model_pool_warmup_enabled
+
+        if TaskStage.TRANSCRIBE in task_worker.stages and is_model_pool_warmup_enabled():
+            from ..core.transcriber_factory import warm_transcription_models
+
+            threading.Thread(
+                target=warm_transcription_models, args=(self.config,), daemon=True, name="ModelPoolWarmup"
+            ).start()
+
+    def _announce_worker(self) -> List[str]:
+        """Take this process's presence lease; return the live peers' holders.
+
+        The lease is held (first poll is synchronous) before recovery runs and
+        before the worker claims anything, so a peer starting later always
+        sees it. If peers can't be listed, assume there are some: limited
+        recovery is the safe side.
+        """
+        from ..utils.config import get_scheduler_lease_seconds
+
+        store = lease_store_from_config(self.config)
+        holder = default_holder_id()
+        self.presence = LeaderElector(
+            store,
+            f"{WORKER_LEASE_PREFIX}{holder}",
+            on_elected=lambda: None,
+            on_demoted=lambda: None,
+            ttl_sec=get_scheduler_lease_seconds(),
+            holder=holder,
+        )
+        self.presence.poll()
+        self.presence.start()
+        try:
+            return [peer for peer in store.live_holders(WORKER_LEASE_PREFIX) if peer != holder]
+        except Exception as e:
+            logger.warning("peer_workers_unknown", error=str(e))
+            return ["unknown"]
+
+    def _build_schedulers(self) -> None:
+        app_state = self.app_state
+        # Spec #48 — the refresh scheduler enqueues REFRESH_FEED tasks for
+        # due feeds on a tick; the worker's reserved REFRESH_FEED lane
+        # processes them. Ships dark: both the scheduler and the queued path
+        # are off unless explicitly enabled.
+        from ..utils.config import (
+            get_briefing_scheduler_max_per_tick,
+            get_briefing_scheduler_tick_seconds,
+            get_default_refresh_interval_seconds,
+            get_quarantine_probe_interval_seconds,
+            get_refresh_scheduler_tick_seconds,
+            is_briefing_scheduler_enabled,
+            is_refresh_scheduler_enabled,
+            is_refresh_via_queue_enabled,
+        )
+
+        if is_refresh_scheduler_enabled():
+            from ..core.refresh_scheduler import RefreshScheduler
+
+            app_state.refresh_scheduler = RefreshScheduler(
+                repository=app_state.repository,
+                queue_manager=app_state.queue_manager,
+                tick_seconds=get_refresh_scheduler_tick_seconds(),
+                default_interval_seconds=get_default_refresh_interval_seconds(),
+                quarantine_probe_interval_seconds=get_quarantine_probe_interval_seconds(),
+            )
+            logger.info("refresh_scheduler_enabled", via_queue=is_refresh_via_queue_enabled())
+        else:
+            logger.info("refresh_scheduler_disabled")
+
+        # Spec #50 — the briefing scheduler generates each user's briefing
+        # at their scheduled hour via the same BriefingService the lazy
+        # /api/briefings/latest path uses; the min-interval throttle keeps
+        # the two triggers from double-running. Scheduled runs chain
+        # narration (#33) when it's enabled, so the readout — not just the
+        # script — is ready by the scheduled hour. Ships dark, mirroring the
+        # refresh scheduler.
+        delivery_service = app_state.briefing_delivery_service
+        if is_briefing_scheduler_enabled():
+            from ..core.briefing_scheduler import BriefingScheduler
+
+            app_state.briefing_scheduler = BriefingScheduler(
+                schedule_repository=app_state.briefing_schedule_repository,
+                briefing_service=app_state.briefing_service,
+                tick_seconds=get_briefing_scheduler_tick_seconds(),
+                max_per_tick=get_briefing_scheduler_max_per_tick(),
+                narration_runner=app_state.narration_runner,
+                narration_target_seconds=self.config.narration_default_duration_seconds,
+                delivery_service=delivery_service,
+            )
+            logger.info(
+                "briefing_scheduler_enabled",
+                narration_chained=app_state.narration_runner is not None,
+                email_delivery=delivery_service is not None,
+            )
+        else:
+            logger.info("briefing_scheduler_disabled")
+            if delivery_service is not None:
+                # The delivery pass only runs from the scheduler tick, so
+                # a configured provider without the scheduler can never
+                # send anything. The capability flag keys off
+                # ``briefing_scheduler`` too, so the UI hides the checkbox
+                # rather than accepting opt-ins that would silently never
+                # deliver (FM: silent degradation).
+                logger.warning(
+                    "briefing_email_delivery_inert",
+                    reason="EMAIL_PROVIDER is configured but BRIEFING_SCHEDULER_ENABLED=false; "
+                    "briefing emails will not be sent",
+                )
+
+    def _start_schedulers(self) -> None:
+        for scheduler in (self.app_state.refresh_scheduler, self.app_state.briefing_scheduler):
+            if scheduler is not None:
+                scheduler.start()
+
+    def _stop_schedulers(self) -> None:
+        for scheduler in (self.app_state.briefing_scheduler, self.app_state.refresh_scheduler):
+            if scheduler is not None:
+                scheduler.stop()
@@ -929,6 +929,8 @@ export interface SearchResponse {
   mode: SearchMode
   total: number
   results: SearchResult[]
+  // Per-leg wall-clock ms (embed_ms, lexical_ms, semantic_ms, total_ms).
+  timings?: Record<string, number>
 }
 
 export interface CorpusSearchOptions {
@@ -20,7 +20,7 @@ across all endpoints, reducing code duplication (DRY principle).
 """
 
 from datetime import datetime, timezone
-from typing import Any, Dict, List, NoReturn, Optional
+from typing import Any, Callable, Dict, List, NoReturn, Optional
 
 from fastapi import HTTPException
 
@@ -196,14 +196,32 @@ def etag_json_response(request: "Request", data: Dict[str, Any], status: str = "
     import hashlib
     import json as _json
 
-    from fastapi import Request, Response  # noqa: F401  (Request used in signature)
     from fastapi.encoders import jsonable_encoder
-    from fastapi.responses import JSONResponse
 
     encoded = jsonable_encoder(data)
     digest = hashlib.sha1(  # noqa: S324 — cache validator, not crypto
         _json.dumps(encoded, sort_keys=True, separators=(",", ":")).encode()
     ).hexdigest()
+    return stored_etag_json_response(request, digest, lambda: encoded, status=status)
+
+
+def stored_etag_json_response(
+    request: "Request",
+    digest: str,
+    build: Callable[[], Dict[str, Any]],
+    status: str = "ok",
+) -> "Response":
+    """``etag_json_response`` for a resource whose validator is already known.
+
+    ``digest`` must change whenever the payload ``build`` would return does
+    (e.g. a hash stored alongside a write-once artefact). ``If-None-Match``
+    is checked first and ``build`` only runs when the client's copy is
+    stale, so a 304 costs no payload work at all. ``build`` must return
+    JSON-ready data; it is not passed through ``jsonable_encoder``.
+    """
+    from fastapi import Request, Response  # noqa: F401  (Request used in signature)
+    from fastapi.responses import JSONResponse
+
     etag = f'W/"{digest}"'
     headers = {"ETag": etag, "Cache-Control": "private, no-cache"}
 
@@ -218,4 +236,4 @@ def etag_json_response(request: "Request", data: Dict[str, Any], status: str = "
     if "*" in candidates or _opaque(etag) in candidates:
         return Response(status_code=304, headers=headers)
 
-    return JSONResponse(content=api_response(encoded, status=status), headers=headers)
+    return JSONResponse(content=api_response(build(), status=status), headers=headers)
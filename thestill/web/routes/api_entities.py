@@ -37,6 +37,7 @@ from structlog import get_logger
 
 from ...core.entity_review import CorrectionError, apply_correction, scan_entities_for_review
 from ...core.wikidata_client import WikidataClient
+from ...core.wikimedia_http import wikimedia_http_from_config
 from ...models.enrichment import EnrichmentUnavailable, EntityAffiliation, EntityFact
 from ...models.user import User
 from ..dependencies import AppState, get_app_state, require_admin
@@ -659,7 +660,7 @@ def post_correction(
         result = apply_correction(
             repo=state.entity_repository,
             queue_manager=state.queue_manager,
-            wikidata_client=WikidataClient(),
+            wikidata_client=WikidataClient(http=wikimedia_http_from_config(state.config)),
             action=request.action,
             surface_form=request.surface_form,
             episode_id=request.episode_id,
@@ -27,6 +27,7 @@ from structlog import get_logger
 from ...core.queue_manager import TaskStage
 from ...models.podcast import EpisodeState
 from ...models.user import User
+from ...repositories.episode_listing import InvalidCursorError, encode_episode_cursor
 from ...services.playback import build_playback_manifest
 from ...services.podcast_service import extract_summary_preview
 from ...utils.duration import format_duration
@@ -78,6 +79,7 @@ def get_all_episodes(
     date_to: Optional[str] = None,
     sort_by: str = "pub_date",
     sort_order: str = "desc",
+    cursor: Optional[str] = None,
     app_state: AppState = Depends(get_app_state),
 ) -> dict:
     """
@@ -93,9 +95,12 @@ def get_all_episodes(
         date_to: Only include episodes published on/before this date (ISO format)
         sort_by: Sort field - 'pub_date', 'title', or 'updated_at' (default 'pub_date')
         sort_order: Sort direction - 'asc' or 'desc' (default 'desc')
+        cursor: Keyset cursor from a previous response's ``next_cursor``;
+            replaces ``offset`` and keeps deep pages as cheap as the first
 
     Returns:
         List of episodes with their metadata, processing status, and pagination info.
+        ``next_cursor`` is set whenever another page may follow.
     """
     # Resolve podcast_slug to podcast_id if provided (id-only lookup — no
     # episode hydration, spec #69 Phase 4)
@@ -110,17 +115,21 @@ def get_all_episodes(
     parsed_date_to = parse_iso_datetime(date_to, field_name="date_to")
 
     # Query repository
-    episodes_with_podcasts, total = app_state.repository.get_all_episodes(
-        limit=limit,
-        offset=offset,
-        search=search,
-        podcast_id=podcast_id,
-        state=state,
-        date_from=parsed_date_from,
-        date_to=parsed_date_to,
-        sort_by=sort_by,
-        sort_order=sort_order,
-    )
+    try:
+        episodes_with_podcasts, total = app_state.repository.get_all_episodes(
+            limit=limit,
+            offset=offset,
+            search=search,
+            podcast_id=podcast_id,
+            state=state,
+            date_from=parsed_date_from,
+            date_to=parsed_date_to,
+            sort_by=sort_by,
+            sort_order=sort_order,
+            cursor=cursor,
+        )
+    except InvalidCursorError as exc:
+        bad_request(str(exc))
 
     # Format response
     # Spec #62 — one batched lookup (not per-episode) so the list endpoint
@@ -181,13 +190,23 @@ def get_all_episodes(
             }
         )
 
-    return paginated_response(
+    response = paginated_response(
         items=episodes,
         total=total,
-        offset=offset,
+        offset=0 if cursor else offset,
         limit=limit,
         items_key="episodes",
     )
+    # A cursor page has no absolute position, so a full page is the only
+    # signal that more may follow (at worst one extra, empty request).
+    has_more = len(episodes) == limit if cursor else response["has_more"]
+    response["next_cursor"] = (
+        encode_episode_cursor(episodes[-1]["id"], sort_by, sort_order) if has_more and episodes else None
+    )
+    if cursor:
+        response["has_more"] = response["next_cursor"] is not None
+        response["next_offset"] = None
+    return response
 
 
 @router.post("/bulk/process")
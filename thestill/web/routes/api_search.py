@@ -17,13 +17,14 @@ from __future__ import annotations
 
 import sqlite3
 import time
-from typing import List, Literal, Optional
+from typing import Dict, List, Literal, Optional
 
 from fastapi import APIRouter, Depends, HTTPException, Query
 from pydantic import BaseModel
 from structlog import get_logger
 
 from ...search.base import SearchFilters, SearchMode
+from ...search.hybrid import capture_search_timings
 from ..dependencies import AppState, get_app_state
 
 logger = get_logger(__name__)
@@ -103,6 +104,9 @@ class SearchResponse(BaseModel):
     mode: str
     total: int
     results: List[SearchResult]
+    # Per-leg wall-clock ms (embed_ms / lexical_ms / semantic_ms / total_ms);
+    # only the legs the effective mode ran are present.
+    timings: Dict[str, float] = {}
 
 
 class RelatedEpisode(BaseModel):
@@ -219,7 +223,8 @@ def search_corpus(
     requested_mode = SearchMode(mode)
     effective_mode = requested_mode
     try:
-        hits = backend.search(q, mode=requested_mode, limit=limit, filters=filters)
+        with capture_search_timings() as timings:
+            hits = backend.search(q, mode=requested_mode, limit=limit, filters=filters)
     except ModuleNotFoundError as exc:
         # ``sentence-transformers`` is an optional dep — semantic and
         # hybrid both require it. Fall back to lexical so the page
@@ -233,7 +238,8 @@ def search_corpus(
             error=str(exc),
         )
         effective_mode = SearchMode.LEXICAL
-        hits = backend.search(q, mode=effective_mode, limit=limit, filters=filters)
+        with capture_search_timings() as timings:
+            hits = backend.search(q, mode=effective_mode, limit=limit, filters=filters)
     # Resolve slugs so the React client can build /podcasts/<p>/episodes/<e>
     # routes directly. The citation's web_url is /episodes/<id> — kept on
     # the wire for MCP/desktop callers but the web doesn't have that route.
@@ -257,6 +263,7 @@ def search_corpus(
         mode=effective_mode.value,
         total=len(results),
         results=results,
+        timings=timings.as_dict(),
     )
 
 
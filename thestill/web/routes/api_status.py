@@ -74,6 +74,8 @@ def get_status(state: AppState = Depends(get_app_state)):
                 "backing_off": stats.refresh_backing_off,
                 "parked_total": stats.refresh_parked_total,
                 "parked_by_reason": stats.refresh_parked_by_reason,
+                "fetches_per_day": stats.refresh_fetches_per_day,
+                "fetches_avoided_per_day": stats.refresh_fetches_avoided_per_day,
             },
         }
     )
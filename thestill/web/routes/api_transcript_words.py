@@ -24,50 +24,33 @@ word episode's payload around 100–150 KB gzipped; long names would push it
 over 200 KB and the response is fetched only when a user opts into the
 karaoke chip, so payload weight directly affects time-to-paint when the
 feature is engaged.
+
+Shape: ``{"episode_id", "playback_time_offset_seconds", "segments": [
+{"segment_id", "words": [{"w", "s", "e"}]}]}``. ``segment_id`` matches
+``AnnotatedSegment.id`` from the segmented transcript the client already
+holds, so the join on the frontend is a single ``Map`` lookup per
+active-segment transition. ``s`` / ``e`` are raw-audio seconds: the client
+adds ``playback_time_offset_seconds`` before comparing to the audio
+element's ``currentTime`` — the offset is response metadata, not applied
+server-side, so a single shared value isn't repeated on every word.
+
+The payload is served from the episode's precomputed word index
+(``core.word_index``) rather than re-derived from the transcript JSON.
 """
 
-from typing import List
+import hashlib
 
 from fastapi import APIRouter, Depends, HTTPException, Request
-from pydantic import BaseModel
 from structlog import get_logger
 
 from ..dependencies import AppState, get_app_state
-from ..responses import api_response, etag_json_response, not_found
+from ..responses import not_found, stored_etag_json_response
 
 logger = get_logger(__name__)
 
 router = APIRouter()
 
 
-class WordTimestamp(BaseModel):
-    """One word with its raw-audio start/end seconds.
-
-    Short field names: ``w`` (word text), ``s`` (start seconds), ``e``
-    (end seconds). The client adds ``playback_time_offset_seconds`` from
-    the response envelope before comparing to the audio element's
-    ``currentTime`` — the offset is response metadata, not applied
-    server-side, so a single shared offset value doesn't have to be
-    repeated on every word.
-    """
-
-    w: str
-    s: float
-    e: float
-
-
-class SegmentWords(BaseModel):
-    """One ``AnnotatedSegment`` worth of words, keyed by its ``id``.
-
-    ``segment_id`` matches ``AnnotatedSegment.id`` from the segmented
-    transcript the client already holds, so the join on the frontend is
-    a single ``Map`` lookup per active-segment transition.
-    """
-
-    segment_id: int
-    words: List[WordTimestamp]
-
-
 @router.get("/{podcast_slug}/episodes/{episode_slug}/transcript/words")
 def get_episode_transcript_words(
     podcast_slug: str,
@@ -111,31 +94,20 @@ def get_episode_transcript_words(
     if words_result is None:
         not_found("Word timestamps", f"{podcast_slug}/{episode_slug}")
 
-    segments_payload = []
-    for sw in words_result.segments:
-        words_dto: List[WordTimestamp] = []
-        for raw_w in sw.words:
-            # Belt-and-braces: ``_collect_words_in_span`` is the single
-            # source of "skip words without timestamps", but the API
-            # surface contract is stricter ("never emit a word with an
-            # undefined position"), so we keep a boundary check that
-            # holds even if a future service change quietly weakens the
-            # service-side guarantee. The local copy also narrows
-            # Optional[float] → float for the DTO call below.
-            start_s, end_s = raw_w.start, raw_w.end
-            if start_s is None or end_s is None:
-                continue
-            words_dto.append(WordTimestamp(w=raw_w.word, s=start_s, e=end_s))
-        segments_payload.append(SegmentWords(segment_id=sw.segment_id, words=words_dto).model_dump())
-
+    index = words_result.index
+    offset = words_result.playback_time_offset_seconds
     # Write-once resource, and the largest payload in the API (~1 MB raw
-    # for a 2-hour episode): content-hash ETag + revalidation means repeat
-    # opens cost a 304 (spec #69 Phase 6.2; gzip handles first-load size).
-    return etag_json_response(
+    # for a 2-hour episode). The index carries a content hash computed at
+    # CLEAN time; folding in the episode id and the DB-owned offset gives
+    # the validator, so a repeat open answers 304 without building the
+    # payload at all (spec #69 Phase 6.2; gzip handles first-load size).
+    digest = hashlib.sha1(f"{index.etag}:{episode.id}:{offset!r}".encode()).hexdigest()  # noqa: S324
+    return stored_etag_json_response(
         request,
-        {
+        digest,
+        lambda: {
             "episode_id": episode.id,
-            "playback_time_offset_seconds": words_result.playback_time_offset_seconds,
-            "segments": segments_payload,
+            "playback_time_offset_seconds": offset,
+            "segments": index.segments_payload(),
         },
     )